@@ -0,0 +1,235 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import os, re, json, time, random, tempfile
+
+#############################################################################
+# Code_Image_Cache : last image written to the code memory behind a port
+#
+# Remarks:
+#    After a good upload, the segments written are kept in a file per port.
+#  For the next upload, plan() first reads SAMPLE_WORDS words of the code
+#  memory back (the OCD reads one word per round trip, so there is no
+#  cheaper whole image check) and compares them with the cache. When they
+#  all match, only the blocks (1024 bytes with ext frames, 128 otherwise)
+#  where the new image differs from the cache are written.
+#    Anything in doubt gives a full write: no cache, a cache file that does
+#  not parse, a sample that differs or can not be read, or a change to most
+#  of the blocks anyway. The cache file is removed before writing and only
+#  saved again after the write went through, so an upload cut short is
+#  followed by a full one. The other tools that write code memory (config
+#  firmware upload, M10_Console) remove the cache file of the port.
+#############################################################################
+
+class Code_Image_Cache:
+
+    SAMPLE_WORDS = 16
+
+    # share of changed blocks above which the whole image is written
+    FULL_WRITE_RATIO = 0.75
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    port      : the cache is per port
+    #    cache_dir : where the cache files go, a directory under the temp
+    #                directory if None
+    #========================================================================
+    def __init__ (self, port, cache_dir=None):
+        if (cache_dir is None):
+            cache_dir = os.path.join (tempfile.gettempdir(), "M10_FP51_cache")
+
+        self.file_name = os.path.join (cache_dir, "code_" + re.sub ("[^A-Za-z0-9]", "_", port) + ".json")
+
+        # why the last plan() came back with a full write
+        self.reason = ""
+
+        self._bytes_total = 0
+        self._bytes_planned = 0
+
+    #========================================================================
+    #  load
+    #------------------------------------------------------------------------
+    # Return: cached segments as [(address, data_list)], None if there is
+    #         no usable cache
+    #========================================================================
+    def load (self):
+        try:
+            with open (self.file_name, 'r') as f:
+                cache = json.load (f)
+
+            return [(address, list (bytes.fromhex (data))) for (address, data) in cache['segments']]
+        except (IOError, ValueError, KeyError, TypeError):
+            return None
+
+    #========================================================================
+    #  save
+    #========================================================================
+    def save (self, segments):
+        cache = {
+            'time'     : time.strftime ("%Y-%m-%d %H:%M:%S"),
+            'segments' : [(address, bytes (data).hex()) for (address, data) in segments]
+        }
+
+        try:
+            os.makedirs (os.path.dirname (self.file_name), exist_ok=True)
+            with open (self.file_name, 'w') as f:
+                json.dump (cache, f)
+        except (IOError, OSError):
+            print ("Fail to open: ", self.file_name)
+
+    #========================================================================
+    #  invalidate
+    #========================================================================
+    def invalidate (self):
+        try:
+            os.remove (self.file_name)
+        except OSError:
+            pass
+
+    #========================================================================
+    #  _flatten
+    #------------------------------------------------------------------------
+    # Return: (data, mask) as bytearrays from address 0, mask 1 where the
+    #         segments have a byte
+    #========================================================================
+    def _flatten (self, segments, size):
+        data = bytearray (size)
+        mask = bytearray (size)
+
+        for (address, data_list) in segments:
+            data [address : address + len (data_list)] = bytes (data_list)
+            mask [address : address + len (data_list)] = b'\x01' * len (data_list)
+
+        return (data, mask)
+
+    #========================================================================
+    #  verify
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ocd : OCD_8051 with the CPU paused
+    # Return: True if the sampled words of the target match the cache
+    #========================================================================
+    def verify (self, ocd, old_data, old_mask):
+        words = [i // 4 for i in range (0, len (old_mask), 4) if any (old_mask [i : i + 4])]
+        if (len (words) == 0):
+            return False
+
+        # first and last word always, the rest spread at random
+        samples = set ([words[0], words[-1]])
+        samples.update (random.sample (words, min ([len (words), Code_Image_Cache.SAMPLE_WORDS - 2])))
+
+        for word_index in sorted (samples):
+            target = ocd.code_mem_read_32bit (word_index * 4)
+
+            for i in range (4):
+                address = word_index * 4 + i
+                if ((address < len (old_mask)) and old_mask[address] and (target[i] != old_data[address])):
+                    return False
+
+        return True
+
+    #========================================================================
+    #  plan
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ocd      : OCD_8051 with the CPU paused, for the sampled readback
+    #    segments : the whole new image, [(address, data_list)]
+    # Return: segments to write, only the changed blocks; None for a full
+    #         write, with the reason in self.reason
+    #========================================================================
+    def plan (self, ocd, segments):
+        self._bytes_total = sum ([len (data_list) for (address, data_list) in segments])
+        self._bytes_planned = self._bytes_total
+
+        old_segments = self.load()
+        if (old_segments is None):
+            self.reason = "no image cached for the port"
+            return None
+
+        size = max ([address + len (data_list) for (address, data_list) in segments + old_segments] + [0])
+
+        (old_data, old_mask) = self._flatten (old_segments, size)
+        (new_data, new_mask) = self._flatten (segments, size)
+
+        try:
+            if (not self.verify (ocd, old_data, old_mask)):
+                self.reason = "target differs from the cached image"
+                return None
+        except Exception:
+            self.reason = "target readback failed"
+            return None
+
+        block_size = max (ocd.code_mem_frame_sizes())
+
+        changed = []
+        blocks = 0
+        for start in range (0, size, block_size):
+            end = min ([start + block_size, size])
+
+            if (not any (new_mask [start : end])):
+                continue
+
+            blocks = blocks + 1
+
+            if ((new_data [start : end] == old_data [start : end]) and (new_mask [start : end] == old_mask [start : end])):
+                continue
+
+            for i in range (start, end):
+                if (new_mask[i] and ((not old_mask[i]) or (new_data[i] != old_data[i]))):
+                    changed.append (start)
+                    break
+
+        if (len (changed) > (blocks * Code_Image_Cache.FULL_WRITE_RATIO)):
+            self.reason = "{0} of {1} blocks changed".format (len (changed), blocks)
+            return None
+
+        # the new segments cut to the changed blocks, neighbours joined
+        to_write = []
+        for start in changed:
+            end = start + block_size
+
+            for (address, data_list) in sorted (segments):
+                low = max ([address, start])
+                high = min ([address + len (data_list), end])
+
+                if (low >= high):
+                    continue
+
+                piece = data_list [low - address : high - address]
+                if (len (to_write) and ((to_write[-1][0] + len (to_write[-1][1])) == low)):
+                    to_write[-1] = (to_write[-1][0], to_write[-1][1] + piece)
+                else:
+                    to_write.append ((low, piece))
+
+        self._bytes_planned = sum ([len (data_list) for (address, data_list) in to_write])
+        self.reason = ""
+
+        return to_write
+
+    #========================================================================
+    #  print_stats
+    #------------------------------------------------------------------------
+    # Remarks: nothing after a full write, plan() gave the reason already
+    #========================================================================
+    def print_stats (self):
+        if (self.reason):
+            return
+
+        print ("Incremental: {0} of {1} bytes written".format (self._bytes_planned, self._bytes_total))
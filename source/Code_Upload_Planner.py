@@ -0,0 +1,317 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+
+#############################################################################
+# Code_Upload_Planner : split a code memory segment into OCD write frames
+#
+# Remarks:
+#    The OCD accepts 1024 byte (ext), 128 byte and 4 byte write frames on
+#  word aligned addresses. Anything that is not word aligned has to go
+#  through the single byte path. OCD_8051 combines the bytes of a word and
+#  does one read-modify-write for it, so a partial word costs 2 round trips.
+#    Since every frame size is a multiple of the next smaller one, taking
+#  the largest frame that still fits at each step gives the minimal number
+#  of round trips for a segment.
+#    Sparse images (interrupt vectors at 0x0B, 0x13, 0x1B etc.) produce
+#  many small unaligned segments. coalesce() merges neighbours across a gap
+#  whenever filling the gap is cheaper than writing them separately.
+#############################################################################
+
+class Code_Upload_Planner:
+
+    FRAME_SIZE_EXT  = 1024
+    FRAME_SIZE_128  = 128
+    FRAME_SIZE_WORD = 4
+    FRAME_SIZE_BYTE = 1
+
+    FRAME_SIZES_ALL = (FRAME_SIZE_EXT, FRAME_SIZE_128, FRAME_SIZE_WORD)
+    
+    # bytes that can go out on the wire in the time of one round trip
+    BYTES_PER_ROUND_TRIP = 256
+    
+    MAX_MERGE_SPAN = 4096
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    frame_sizes          : word aligned frame sizes accepted by the
+    #                           target, such as (1024, 128, 4)
+    #    bytes_per_round_trip : weight of payload bytes against round trips
+    #                           when costing a plan
+    #========================================================================
+    def __init__ (self, frame_sizes=FRAME_SIZES_ALL, bytes_per_round_trip=BYTES_PER_ROUND_TRIP):
+        self.frame_sizes = frame_sizes
+        self.bytes_per_round_trip = bytes_per_round_trip
+        self.stats = {}
+
+    @property
+    def frame_sizes(self):
+        return self._frame_sizes
+
+    @frame_sizes.setter
+    def frame_sizes(self, frame_sizes):
+        self._frame_sizes = tuple (sorted (frame_sizes, reverse=True))
+
+    #========================================================================
+    #  plan_segment
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    addr   : start address of the segment
+    #    length : length of the segment in bytes
+    #
+    # Return:
+    #    list of (offset, size), where offset is relative to addr
+    #========================================================================
+    def plan_segment (self, addr, length):
+        plan = []
+        offset = 0
+
+        if (addr % 4):
+            for i in range (min([(4 - (addr % 4)), length])):
+                plan.append ((offset, Code_Upload_Planner.FRAME_SIZE_BYTE))
+                offset = offset + 1
+
+        for size in self._frame_sizes:
+            while ((length - offset) >= size):
+                plan.append ((offset, size))
+                offset = offset + size
+
+        while (offset < length):
+            plan.append ((offset, Code_Upload_Planner.FRAME_SIZE_BYTE))
+            offset = offset + 1
+
+        return plan
+
+    #========================================================================
+    #  plan_round_trips
+    #------------------------------------------------------------------------
+    # Remarks: one per frame, two (read + write) per partially written word
+    #========================================================================
+    def plan_round_trips (self, addr, plan):
+        frames = 0
+        partial_words = set()
+        
+        for (offset, size) in plan:
+            if (size == Code_Upload_Planner.FRAME_SIZE_BYTE):
+                partial_words.add ((addr + offset) // 4)
+            else:
+                frames = frames + 1
+        
+        return frames + len (partial_words) * 2
+
+    #========================================================================
+    #  segment_cost
+    #------------------------------------------------------------------------
+    # Remarks: round trips plus wire time (in round trip units)
+    #========================================================================
+    def segment_cost (self, addr, length):
+        plan = self.plan_segment (addr, length)
+        return self.plan_round_trips (addr, plan) + length / self.bytes_per_round_trip
+
+    #========================================================================
+    #  segments_from_records
+    #------------------------------------------------------------------------
+    # Remarks: merge back-to-back data records of a ROM_Hex_Format file
+    #          into (addr, data_list) segments
+    #========================================================================
+    def segments_from_records (self, data_record_list):
+        segments = []
+        
+        for record in data_record_list:
+            if (len (record.data_list) == 0):
+                continue
+            
+            if (len (segments) and ((segments[-1][0] + len (segments[-1][1])) == record.address)):
+                segments[-1][1].extend (record.data_list)
+            else:
+                segments.append ((record.address, list (record.data_list)))
+        
+        return segments
+
+    #========================================================================
+    #  _group_span
+    #------------------------------------------------------------------------
+    # Remarks: address range to write for segments[i..j] merged together.
+    #          With don't-care padding the edges are pushed out to word
+    #          boundaries, as long as that does not reach into a neighbour.
+    #========================================================================
+    def _group_span (self, segments, i, j, pad):
+        start = segments[i][0]
+        end   = segments[j][0] + len (segments[j][1])
+        
+        if (pad):
+            if (i == 0):
+                low_limit = 0
+            else:
+                low_limit = segments[i - 1][0] + len (segments[i - 1][1])
+                
+            if (j == (len (segments) - 1)):
+                high_limit = end + 4
+            else:
+                high_limit = segments[j + 1][0]
+            
+            if (((start // 4) * 4) >= low_limit):
+                start = (start // 4) * 4
+            
+            if ((((end + 3) // 4) * 4) <= high_limit):
+                end = ((end + 3) // 4) * 4
+        
+        return (start, end)
+    
+    #========================================================================
+    #  _gap_words
+    #------------------------------------------------------------------------
+    # Remarks: word addresses that have to be read back to fill the gaps
+    #          inside segments[i..j]
+    #========================================================================
+    def _gap_words (self, segments, i, j):
+        words = []
+        
+        for k in range (i, j):
+            gap_start = segments[k][0] + len (segments[k][1])
+            gap_end   = segments[k + 1][0]
+            
+            if (gap_end > gap_start):
+                for word in range (gap_start // 4, (gap_end - 1) // 4 + 1):
+                    if ((len (words) == 0) or (words[-1] != word)):
+                        words.append (word)
+        
+        return words
+    
+    #========================================================================
+    #  coalesce
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    segments  : list of (addr, data_list)
+    #    pad_byte  : if not None, gaps are don't-care and filled with it
+    #    read_word : callable (addr) -> 4 bytes of current code memory,
+    #                used to fill gaps that have to be preserved
+    #
+    # Return:
+    #    the merged list of (addr, data_list). Frame counts before and after
+    #    are left in self.stats
+    #
+    # Remarks:
+    #    best[j] is the cheapest way to write segments[0..j]; the last group
+    #    is segments[i..j] merged. Groups wider than MAX_MERGE_SPAN are not
+    #    looked at, no gain is possible there once ext frames are in use.
+    #========================================================================
+    def coalesce (self, segments, pad_byte=None, read_word=None):
+        segments = sorted (segments, key=lambda segment: segment[0])
+        
+        pad = (pad_byte is not None)
+        
+        best = []
+        for j in range (len (segments)):
+            choice = None
+            for i in range (j, -1, -1):
+                if (i < j):
+                    if ((not pad) and (read_word is None)):
+                        break
+                    if ((segments[i][0] + len (segments[i][1])) > segments[i + 1][0]):
+                        break
+                    if ((segments[j][0] + len (segments[j][1]) - segments[i][0]) > Code_Upload_Planner.MAX_MERGE_SPAN):
+                        break
+                        
+                (start, end) = self._group_span (segments, i, j, pad)
+                cost = self.segment_cost (start, end - start)
+                
+                if (not pad):
+                    cost = cost + len (self._gap_words (segments, i, j))
+                
+                if (i):
+                    cost = cost + best[i - 1][0]
+                
+                if ((choice is None) or (cost < choice[0])):
+                    choice = (cost, i)
+                    
+            best.append (choice)
+        
+        groups = []
+        j = len (segments) - 1
+        while (j >= 0):
+            i = best[j][1]
+            groups.insert (0, (i, j))
+            j = i - 1
+        
+        merged = []
+        reads = 0
+        for (i, j) in groups:
+            (start, end) = self._group_span (segments, i, j, pad)
+            
+            if (pad):
+                data = [pad_byte] * (end - start)
+            elif (i < j):
+                data = [0] * (end - start)
+                for word in self._gap_words (segments, i, j):
+                    memory = list (read_word (word * 4))
+                    reads = reads + 1
+                    for k in range (4):
+                        if (((word * 4 + k) >= start) and ((word * 4 + k) < end)):
+                            data [word * 4 + k - start] = memory [k]
+            else:
+                data = []
+                
+            if (len (data)):
+                for k in range (i, j + 1):
+                    (addr, segment_data) = segments[k]
+                    data [addr - start : addr - start + len (segment_data)] = segment_data
+            else:
+                data = list (segments[i][1])
+            
+            merged.append ((start, data))
+        
+        frames_before = sum ([self.plan_round_trips (addr, self.plan_segment (addr, len (data))) for (addr, data) in segments])
+        frames_after  = sum ([self.plan_round_trips (addr, self.plan_segment (addr, len (data))) for (addr, data) in merged]) + reads
+        
+        self.stats = {
+            'segments_before' : len (segments),
+            'segments_after'  : len (merged),
+            'frames_before'   : frames_before,
+            'frames_after'    : frames_after
+        }
+        
+        return merged
+
+    #========================================================================
+    #  print_stats
+    #========================================================================
+    def print_stats (self):
+        if (len (self.stats)):
+            print ("Segments: {0} -> {1}, Frames: {2} -> {3}".format ( \
+                self.stats['segments_before'], self.stats['segments_after'], \
+                self.stats['frames_before'], self.stats['frames_after']))
+
+
+def main():
+
+    planner = Code_Upload_Planner ()
+
+    for (addr, length) in [(0, 4), (0x0B, 1), (0x39, 48), (0x100, 3000)]:
+        plan = planner.plan_segment (addr, length)
+        print ("addr =", hex(addr), "length =", length, "round trips =", planner.plan_round_trips (addr, plan))
+        print ("   ", [size for (offset, size) in plan])
+    
+    segments = [(0, [0x02, 0x00, 0x69]), (0x0B, [0x32]), (0x13, [0x32]), (0x1B, [0x32]), (0x39, [0] * 48)]
+    planner.coalesce (segments, pad_byte=0)
+    planner.print_stats ()
+
+if __name__ == "__main__":
+    main()
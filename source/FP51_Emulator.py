@@ -0,0 +1,952 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, getopt, time
+from collections import deque
+
+from OCD_8051 import OCD_8051
+from ROM_Hex_Format import Intel_Hex
+
+#############################################################################
+# FP51_Emulator : 8051 instruction set on the host
+#
+# Remarks:
+#    Decoding is driven by OCD_8051.INSTRUCTIONS: the size and operand list
+#  of each opcode are turned into operand fetchers once, and the mnemonic
+#  picks the handler (_op_MOV, _op_ADD, ...).
+#    Cycles follow the FP51 1T core: one cycle per instruction byte, plus
+#  _EXTRA_CYCLES for the mnemonic and one more for a branch taken.
+#    The standard UART (SBUF / SCON RI, TI, with uart_rx / uart_tx as the
+#  wire), timer 0 / 1 in mode 0, 1, 2 and their interrupts (one priority
+#  level) are modeled. Other peripherals are not, such as the flash
+#  controller the config firmware polls in XDATA 0xFF00 and up, so it
+#  decodes frames but can not answer them; sfr_read_hooks / sfr_write_hooks
+#  and xdata_read_hooks / xdata_write_hooks take callables by address for
+#  a board model to fill in.
+#    Breakpoints, stall (pause), step and the debug / timer counters are
+#  those of the OCD, so M10_Board_Simulator can put the emulator behind
+#  the OCD frames.
+#############################################################################
+
+class FP51_Emulator:
+
+    CODE_MEM_SIZE = 65536
+    XDATA_SIZE    = 65536
+
+    _ACC  = OCD_8051.ADDR_MAP['ACC']
+    _B    = OCD_8051.ADDR_MAP['B']
+    _PSW  = OCD_8051.ADDR_MAP['PSW']
+    _SP   = OCD_8051.ADDR_MAP['SP']
+    _DPL  = OCD_8051.ADDR_MAP['DPL']
+    _DPH  = OCD_8051.ADDR_MAP['DPH']
+    _P2   = OCD_8051.ADDR_MAP['P2']
+    _SBUF = OCD_8051.ADDR_MAP['SBUF']
+    _SCON = OCD_8051.ADDR_MAP['SCON']
+    _TCON = OCD_8051.ADDR_MAP['TCON']
+    _TMOD = OCD_8051.ADDR_MAP['TMOD']
+    _IE   = OCD_8051.ADDR_MAP['IE']
+
+    # (TLx, THx, TRx bit, TFx bit, TMOD shift, vector) of timer 0 / 1
+    _TIMERS = (
+        (OCD_8051.ADDR_MAP['TL0'], OCD_8051.ADDR_MAP['TH0'], 0x10, 0x20, 0, 0x0B),
+        (OCD_8051.ADDR_MAP['TL1'], OCD_8051.ADDR_MAP['TH1'], 0x40, 0x80, 4, 0x1B)
+    )
+
+    # (vector, IE enable bit), in the order they are served
+    _INTERRUPT_ENABLE = [(0x0B, 0x02), (0x1B, 0x08), (0x23, 0x10)]
+
+    # timer clock, in CPU cycles per count
+    TIMER_PRESCALE = 1
+
+    _IE_EA = 0x80
+
+    _PSW_CY = 0x80
+    _PSW_AC = 0x40
+    _PSW_OV = 0x04
+    _PSW_P  = 0x01
+
+    _SCON_TI = 0x02
+    _SCON_RI = 0x01
+
+    _EXTRA_CYCLES = {
+        'MOVC'  : 2,
+        'MOVX'  : 1,
+        'MUL'   : 1,
+        'DIV'   : 3,
+        'ACALL' : 1,
+        'LCALL' : 1,
+        'RET'   : 2,
+        'RETI'  : 2
+    }
+
+    _BRANCH_TAKEN_CYCLES = 1
+
+    # OCD counters are 16 bit, the debug counter keeps 15
+    _TIMER_COUNTER_MASK = 0xFFFF
+    _DEBUG_COUNTER_MASK = 0x7FFF
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    code_mem : bytearray to use as code memory, so the caller can share
+    #               it (such as the code memory of M10_Board_Simulator)
+    #========================================================================
+    def __init__ (self, code_mem=None):
+        if (code_mem is None):
+            code_mem = bytearray (FP51_Emulator.CODE_MEM_SIZE)
+
+        self.code = code_mem
+        self.iram = bytearray (256)
+        self.sfr = bytearray (256)
+        self.xram = bytearray (FP51_Emulator.XDATA_SIZE)
+
+        self.uart_rx = deque()
+        self.uart_tx = bytearray()
+
+        self.sfr_read_hooks = {}
+        self.sfr_write_hooks = {}
+        self.xdata_read_hooks = {}
+        self.xdata_write_hooks = {}
+
+        self.breakpoints = set()
+
+        self.cycles = 0
+        self.instructions = 0
+        self.debug_counter = 0
+        self.timer_counter = 0
+        self.debug_counter_enable = 1
+        self.timer_counter_enable = 1
+
+        self._decoders = [self._build_decoder (op_code) for op_code in range (256)]
+
+        self.reset()
+
+    #========================================================================
+    #  reset
+    #------------------------------------------------------------------------
+    # Remarks: registers to their reset values, memories are kept
+    #========================================================================
+    def reset (self):
+        self.pc = 0
+        self.sfr [0x80 : 0x100] = bytes (0x80)
+
+        for port in ('P0', 'P1', 'P2', 'P3'):
+            self.sfr [OCD_8051.ADDR_MAP[port]] = 0xFF
+
+        self.sfr [FP51_Emulator._SP] = 0x07
+        self.in_interrupt = False
+        self._pending_interrupts = set()
+        self._sbuf_read = True
+        self._step_over_break = False
+        self._timer_remainder = 0
+
+        # THx / TLx as last written by the software
+        self._timer_reload = {}
+        for (tl, th, tr_bit, tf_bit, shift, vector) in FP51_Emulator._TIMERS:
+            self._timer_reload [tl] = 0
+            self._timer_reload [th] = 0
+
+        self.stalled = False
+        self.stop_reason = None
+
+    #========================================================================
+    #  load_hex
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    intel_hex : Intel_Hex, from a file or from a hex list such as
+    #                dummy_console._FP51_CONFIG_FIRMWARE
+    #========================================================================
+    def load_hex (self, intel_hex):
+        length = 0
+
+        for record in intel_hex.data_record_list:
+            self.code [record.address : record.address + len (record.data_list)] = bytes (record.data_list)
+            length = max ([length, record.address + len (record.data_list)])
+
+        return length
+
+    #========================================================================
+    #  _build_decoder
+    #------------------------------------------------------------------------
+    # Return:
+    #    (mnemonic, size, operand kinds, handler) for the opcode
+    #========================================================================
+    def _build_decoder (self, op_code):
+        (mnemonic, size, operands) = OCD_8051.INSTRUCTIONS [op_code]
+        kinds = operands.replace (",", " ").split()
+
+        # MOV data data takes the source address first
+        if (op_code == 0x85):
+            kinds = ['data_src', 'data_dst']
+
+        handler = getattr (self, "_op_" + mnemonic, self._op_INVALID)
+
+        return (mnemonic, size, kinds, handler)
+
+    #========================================================================
+    #  _decode_operands
+    #------------------------------------------------------------------------
+    # Remarks: operands become (kind, value) pairs:
+    #          A, C, AB, DPTR                 : no value
+    #          R / I                          : iram address, direct / @Ri
+    #          D                              : direct address (SFR >= 0x80)
+    #          X                              : xdata address
+    #          #                              : immediate
+    #          B / B/                         : bit address, plain / negated
+    #          J                              : jump target
+    #========================================================================
+    def _decode_operands (self, mnemonic, kinds, next_pc):
+        operands = []
+        offset = self.pc + 1
+        bank = self.sfr [FP51_Emulator._PSW] & 0x18
+
+        data_src = None
+
+        for kind in kinds:
+            if (kind == 'A') or (kind == 'C') or (kind == 'AB') or (kind == 'DPTR'):
+                operands.append ((kind, None))
+            elif (kind in ('R0', 'R1', 'R2', 'R3', 'R4', 'R5', 'R6', 'R7')):
+                operands.append (('R', bank + int (kind[1])))
+            elif (kind in ('@R0', '@R1')):
+                ri = self.iram [bank + int (kind[2])]
+                if (mnemonic == 'MOVX'):
+                    operands.append (('X', (self._direct_read (FP51_Emulator._P2) << 8) + ri))
+                else:
+                    operands.append (('I', ri))
+            elif (kind == '@DPTR'):
+                operands.append (('X', self._dptr ()))
+            elif (kind in ('@A+DPTR', '@A+PC')):
+                operands.append ((kind, None))
+            elif (kind == 'data') or (kind == 'data_dst'):
+                operands.append (('D', self.code [offset & 0xFFFF]))
+                offset = offset + 1
+            elif (kind == 'data_src'):
+                data_src = ('D', self.code [offset & 0xFFFF])
+                offset = offset + 1
+            elif (kind == 'immediate'):
+                operands.append (('#', self.code [offset & 0xFFFF]))
+                offset = offset + 1
+            elif (kind == 'immediate16'):
+                operands.append (('#', (self.code [offset & 0xFFFF] << 8) + self.code [(offset + 1) & 0xFFFF]))
+                offset = offset + 2
+            elif (kind == 'bit'):
+                operands.append (('B', self.code [offset & 0xFFFF]))
+                offset = offset + 1
+            elif (kind == 'bit/'):
+                operands.append (('B/', self.code [offset & 0xFFFF]))
+                offset = offset + 1
+            elif (kind == 'code16'):
+                operands.append (('J', (self.code [offset & 0xFFFF] << 8) + self.code [(offset + 1) & 0xFFFF]))
+                offset = offset + 2
+            elif (kind == 'code'):
+                if (mnemonic in ('AJMP', 'ACALL')):
+                    page = (self.code [self.pc] >> 5) << 8
+                    operands.append (('J', (next_pc & 0xF800) + page + self.code [offset & 0xFFFF]))
+                else:
+                    rel = self.code [offset & 0xFFFF]
+                    if (rel >= 0x80):
+                        rel = rel - 256
+                    operands.append (('J', (next_pc + rel) & 0xFFFF))
+                offset = offset + 1
+            else:
+                operands.append ((kind, None))
+
+        if (data_src is not None):
+            operands.append (data_src)
+
+        return operands
+
+    #========================================================================
+    #  memory access
+    #========================================================================
+    def _dptr (self):
+        return (self.sfr [FP51_Emulator._DPH] << 8) + self.sfr [FP51_Emulator._DPL]
+
+    def _set_dptr (self, value):
+        self.sfr [FP51_Emulator._DPH] = (value >> 8) & 0xFF
+        self.sfr [FP51_Emulator._DPL] = value & 0xFF
+
+    def _direct_read (self, addr):
+        if (addr < 0x80):
+            return self.iram [addr]
+
+        if (addr in self.sfr_read_hooks):
+            return self.sfr_read_hooks [addr] (addr) & 0xFF
+
+        if (addr == FP51_Emulator._SBUF):
+            self._sbuf_read = True
+        elif (addr == FP51_Emulator._PSW):
+            self._update_parity ()
+
+        return self.sfr [addr]
+
+    def _direct_write (self, addr, value):
+        value = value & 0xFF
+
+        if (addr < 0x80):
+            self.iram [addr] = value
+            return
+
+        if (addr in self.sfr_write_hooks):
+            self.sfr_write_hooks [addr] (addr, value)
+            return
+
+        if (addr in self._timer_reload):
+            self._timer_reload [addr] = value
+
+        if (addr == FP51_Emulator._SBUF):
+            self.uart_tx.append (value)
+            self.sfr [FP51_Emulator._SCON] = self.sfr [FP51_Emulator._SCON] | FP51_Emulator._SCON_TI
+            self._pending_interrupts.add (0x23)
+            return
+
+        self.sfr [addr] = value
+
+    def _update_parity (self):
+        a = self.sfr [FP51_Emulator._ACC]
+        a = a ^ (a >> 4)
+        a = a ^ (a >> 2)
+        a = a ^ (a >> 1)
+        self.sfr [FP51_Emulator._PSW] = (self.sfr [FP51_Emulator._PSW] & 0xFE) | (a & 1)
+
+    def _bit_addr (self, bit):
+        if (bit < 0x80):
+            return (0x20 + (bit >> 3), bit & 7)
+        else:
+            return (bit & 0xF8, bit & 7)
+
+    def _bit_read (self, bit):
+        (addr, index) = self._bit_addr (bit)
+        return (self._direct_read (addr) >> index) & 1
+
+    def _bit_write (self, bit, value):
+        (addr, index) = self._bit_addr (bit)
+        if (addr >= 0x80):
+            byte = self.sfr [addr]
+        else:
+            byte = self.iram [addr]
+
+        if (value):
+            byte = byte | (1 << index)
+        else:
+            byte = byte & ~(1 << index)
+
+        self._direct_write (addr, byte)
+
+    def _carry (self):
+        return (self.sfr [FP51_Emulator._PSW] >> 7) & 1
+
+    def _set_carry (self, value):
+        if (value):
+            self.sfr [FP51_Emulator._PSW] = self.sfr [FP51_Emulator._PSW] | FP51_Emulator._PSW_CY
+        else:
+            self.sfr [FP51_Emulator._PSW] = self.sfr [FP51_Emulator._PSW] & ~FP51_Emulator._PSW_CY & 0xFF
+
+    def _get (self, operand):
+        (kind, value) = operand
+
+        if (kind == 'A'):
+            return self.sfr [FP51_Emulator._ACC]
+        elif (kind == 'R') or (kind == 'I'):
+            return self.iram [value]
+        elif (kind == 'D'):
+            return self._direct_read (value)
+        elif (kind == '#'):
+            return value
+        elif (kind == 'C'):
+            return self._carry ()
+        elif (kind == 'B'):
+            return self._bit_read (value)
+        elif (kind == 'B/'):
+            return 1 - self._bit_read (value)
+        elif (kind == 'X'):
+            if (value in self.xdata_read_hooks):
+                return self.xdata_read_hooks [value] (value) & 0xFF
+            return self.xram [value]
+        elif (kind == 'DPTR'):
+            return self._dptr ()
+
+        return 0
+
+    def _set (self, operand, data):
+        (kind, value) = operand
+
+        if (kind == 'A'):
+            self.sfr [FP51_Emulator._ACC] = data & 0xFF
+        elif (kind == 'R') or (kind == 'I'):
+            self.iram [value] = data & 0xFF
+        elif (kind == 'D'):
+            self._direct_write (value, data)
+        elif (kind == 'C'):
+            self._set_carry (data)
+        elif (kind == 'B'):
+            self._bit_write (value, data)
+        elif (kind == 'X'):
+            if (value in self.xdata_write_hooks):
+                self.xdata_write_hooks [value] (value, data & 0xFF)
+            else:
+                self.xram [value] = data & 0xFF
+        elif (kind == 'DPTR'):
+            self._set_dptr (data)
+
+    def _push (self, value):
+        sp = (self.sfr [FP51_Emulator._SP] + 1) & 0xFF
+        self.sfr [FP51_Emulator._SP] = sp
+        self.iram [sp] = value & 0xFF
+
+    def _pop (self):
+        sp = self.sfr [FP51_Emulator._SP]
+        self.sfr [FP51_Emulator._SP] = (sp - 1) & 0xFF
+        return self.iram [sp]
+
+    #========================================================================
+    #  step
+    #------------------------------------------------------------------------
+    # Remarks: one instruction, returns the cycles it took
+    #========================================================================
+    def step (self):
+        op_code = self.code [self.pc]
+        (mnemonic, size, kinds, handler) = self._decoders [op_code]
+
+        next_pc = (self.pc + size) & 0xFFFF
+        operands = self._decode_operands (mnemonic, kinds, next_pc)
+
+        target = handler (op_code, operands, next_pc)
+
+        cycles = size + FP51_Emulator._EXTRA_CYCLES.get (mnemonic, 0)
+
+        if (target is None):
+            self.pc = next_pc
+        else:
+            if (target != next_pc):
+                cycles = cycles + FP51_Emulator._BRANCH_TAKEN_CYCLES
+            self.pc = target & 0xFFFF
+
+        self.cycles = self.cycles + cycles
+        self.instructions = self.instructions + 1
+
+        self._timer_tick (cycles)
+        self._uart_receive ()
+        self._interrupt ()
+
+        if (self.timer_counter_enable):
+            self.timer_counter = (self.timer_counter + cycles) & FP51_Emulator._TIMER_COUNTER_MASK
+
+        if (self.debug_counter_enable):
+            self.debug_counter = (self.debug_counter + 1) & FP51_Emulator._DEBUG_COUNTER_MASK
+
+        return cycles
+
+    #========================================================================
+    #  _timer_tick
+    #------------------------------------------------------------------------
+    # Remarks: timer 0 / 1, mode 0 (13 bit), 1 (16 bit), 2 (8 bit reload).
+    #          Mode 0 / 1 reload on overflow the value last written to
+    #          THx / TLx: the config firmware loads timer 1 once and counts
+    #          its overflows as the time base of delay().
+    #          Mode 3 and the counter (C/T) / gate inputs are not modeled
+    #========================================================================
+    def _timer_tick (self, cycles):
+        tcon = self.sfr [FP51_Emulator._TCON]
+
+        if ((tcon & 0x50) == 0):
+            return
+
+        counts = (self._timer_remainder + cycles) // FP51_Emulator.TIMER_PRESCALE
+        self._timer_remainder = (self._timer_remainder + cycles) % FP51_Emulator.TIMER_PRESCALE
+
+        tmod = self.sfr [FP51_Emulator._TMOD]
+
+        for (tl, th, tr_bit, tf_bit, shift, vector) in FP51_Emulator._TIMERS:
+            if ((tcon & tr_bit) == 0):
+                continue
+
+            mode = (tmod >> shift) & 3
+
+            if (mode == 2):
+                value = self.sfr [tl] + counts
+                if (value > 0xFF):
+                    tcon = tcon | tf_bit
+                    self._pending_interrupts.add (vector)
+                    reload = self.sfr [th]
+                    value = reload + (value - 0x100) % (0x100 - reload)
+                self.sfr [tl] = value & 0xFF
+            else:
+                if (mode == 0):
+                    width = 13
+                    value = (self.sfr [th] << 5) + (self.sfr [tl] & 0x1F)
+                    reload = (self._timer_reload [th] << 5) + (self._timer_reload [tl] & 0x1F)
+                else:
+                    width = 16
+                    value = (self.sfr [th] << 8) + self.sfr [tl]
+                    reload = (self._timer_reload [th] << 8) + self._timer_reload [tl]
+
+                value = value + counts
+                if (value >> width):
+                    tcon = tcon | tf_bit
+                    self._pending_interrupts.add (vector)
+                    value = reload + (value - (1 << width)) % ((1 << width) - reload)
+
+                if (mode == 0):
+                    self.sfr [th] = value >> 5
+                    self.sfr [tl] = (self.sfr [tl] & 0xE0) | (value & 0x1F)
+                else:
+                    self.sfr [th] = value >> 8
+                    self.sfr [tl] = value & 0xFF
+
+        self.sfr [FP51_Emulator._TCON] = tcon
+
+    #========================================================================
+    #  _uart_receive
+    #------------------------------------------------------------------------
+    # Remarks: next byte of uart_rx into SBUF once the last one was read
+    #          and RI is cleared. There is no baud rate timing, the wire is
+    #          as fast as the CPU reads
+    #========================================================================
+    def _uart_receive (self):
+        if (len (self.uart_rx) and self._sbuf_read and ((self.sfr [FP51_Emulator._SCON] & FP51_Emulator._SCON_RI) == 0)):
+            self._sbuf_read = False
+            self.sfr [FP51_Emulator._SBUF] = self.uart_rx.popleft()
+            self.sfr [FP51_Emulator._SCON] = self.sfr [FP51_Emulator._SCON] | FP51_Emulator._SCON_RI
+            self._pending_interrupts.add (0x23)
+
+    #========================================================================
+    #  _interrupt
+    #------------------------------------------------------------------------
+    # Remarks: timer 0, timer 1 and UART. A flag raises the interrupt when
+    #          it gets set, and the flag is left for the software to clear:
+    #          the config firmware polls TF1 with ET1 on, and its timer 1
+    #          ISR does not touch TF1
+    #========================================================================
+    def _interrupt (self):
+        if ((len (self._pending_interrupts) == 0) or self.in_interrupt):
+            return
+
+        ie = self.sfr [FP51_Emulator._IE]
+
+        if ((ie & FP51_Emulator._IE_EA) == 0):
+            return
+
+        for (vector, enable_bit) in FP51_Emulator._INTERRUPT_ENABLE:
+            if (vector in self._pending_interrupts):
+                self._pending_interrupts.discard (vector)
+                if (ie & enable_bit):
+                    self._push (self.pc & 0xFF)
+                    self._push (self.pc >> 8)
+                    self.pc = vector
+                    self.in_interrupt = True
+                    return
+
+    #========================================================================
+    #  run
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    max_instructions : stop after this many, None for no limit
+    #    max_cycles       : stop after this many cycles, None for no limit
+    #
+    # Return:
+    #    why it stopped: "break", "invalid", "stalled", "instructions",
+    #    "cycles". The CPU stalls on a breakpoint (before executing the
+    #    instruction there) and on an invalid opcode. Once resumed, it
+    #    steps over the breakpoint it stopped on
+    #========================================================================
+    def run (self, max_instructions=None, max_cycles=None):
+        count = 0
+        cycles_end = None
+
+        if (max_cycles is not None):
+            cycles_end = self.cycles + max_cycles
+
+        if (self.stalled):
+            return "stalled"
+
+        while (True):
+            if ((self.pc in self.breakpoints) and (not self._step_over_break)):
+                self.stalled = True
+                self.stop_reason = "break"
+                return self.stop_reason
+
+            self._step_over_break = False
+
+            self.step ()
+            count = count + 1
+
+            if (self.stalled):
+                return self.stop_reason
+
+            if ((max_instructions is not None) and (count >= max_instructions)):
+                return "instructions"
+
+            if ((cycles_end is not None) and (self.cycles >= cycles_end)):
+                return "cycles"
+
+    #========================================================================
+    #  OCD side
+    #------------------------------------------------------------------------
+    # Remarks: what the OCD frames do to the CPU
+    #========================================================================
+    def pause (self, on_off):
+        if (on_off):
+            self.stalled = True
+            self.stop_reason = "paused"
+        elif (self.stalled):
+            self.stalled = False
+            self._step_over_break = True
+
+    def run_pulse (self):
+        # with breakpoints, go on to the next one (run() gets there),
+        # otherwise single step
+        if (len (self.breakpoints)):
+            self.stalled = False
+            self._step_over_break = True
+            return "running"
+
+        self._step_over_break = False
+        self.step ()
+        self.stalled = True
+        self.stop_reason = "step"
+        return self.stop_reason
+
+    def set_breakpoint (self, break_addr_A, break_addr_B):
+        self.breakpoints = set ([break_addr_A, break_addr_B])
+
+    def breakpoint_off (self):
+        self.breakpoints = set()
+
+    def counter_config (self, debug_counter_reset, debug_counter_enable, timer_counter_reset, timer_counter_enable):
+        if (debug_counter_reset):
+            self.debug_counter = 0
+        if (timer_counter_reset):
+            self.timer_counter = 0
+        self.debug_counter_enable = debug_counter_enable
+        self.timer_counter_enable = timer_counter_enable
+
+    def data_mem_read_byte (self, addr, indirect1_direct0):
+        if (indirect1_direct0):
+            return self.iram [addr & 0xFF]
+
+        if (addr == FP51_Emulator._PSW):
+            self._update_parity ()
+
+        if ((addr & 0xFF) < 0x80):
+            return self.iram [addr & 0xFF]
+
+        # no side effects (SBUF) from the debugger
+        return self.sfr [addr & 0xFF]
+
+    def data_mem_write_byte (self, addr, data_byte, indirect1_direct0):
+        if (indirect1_direct0 or ((addr & 0xFF) < 0x80)):
+            self.iram [addr & 0xFF] = data_byte & 0xFF
+        else:
+            self.sfr [addr & 0xFF] = data_byte & 0xFF
+
+#############################################################################
+# instruction handlers. Each returns the jump target, or None for next_pc
+#############################################################################
+
+    def _op_INVALID (self, op_code, operands, next_pc):
+        self.stalled = True
+        self.stop_reason = "invalid"
+        return self.pc
+
+    def _op_NOP (self, op_code, operands, next_pc):
+        return None
+
+    def _op_AJMP (self, op_code, operands, next_pc):
+        return operands[0][1]
+
+    _op_LJMP = _op_AJMP
+    _op_SJMP = _op_AJMP
+
+    def _op_JMP (self, op_code, operands, next_pc):
+        return (self.sfr [FP51_Emulator._ACC] + self._dptr ()) & 0xFFFF
+
+    def _op_ACALL (self, op_code, operands, next_pc):
+        self._push (next_pc & 0xFF)
+        self._push (next_pc >> 8)
+        return operands[0][1]
+
+    _op_LCALL = _op_ACALL
+
+    def _op_RET (self, op_code, operands, next_pc):
+        high = self._pop ()
+        low = self._pop ()
+        return (high << 8) + low
+
+    def _op_RETI (self, op_code, operands, next_pc):
+        self.in_interrupt = False
+        return self._op_RET (op_code, operands, next_pc)
+
+    def _op_RR (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = ((a >> 1) | (a << 7)) & 0xFF
+
+    def _op_RL (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = ((a << 1) | (a >> 7)) & 0xFF
+
+    def _op_RRC (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = (a >> 1) | (self._carry () << 7)
+        self._set_carry (a & 1)
+
+    def _op_RLC (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = ((a << 1) | self._carry ()) & 0xFF
+        self._set_carry (a >> 7)
+
+    def _op_SWAP (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = ((a << 4) | (a >> 4)) & 0xFF
+
+    def _op_INC (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[0]) + 1)
+
+    def _op_DEC (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[0]) - 1)
+
+    def _add (self, value, carry_in):
+        a = self.sfr [FP51_Emulator._ACC]
+        result = a + value + carry_in
+
+        psw = self.sfr [FP51_Emulator._PSW] & ~(FP51_Emulator._PSW_CY | FP51_Emulator._PSW_AC | FP51_Emulator._PSW_OV) & 0xFF
+        if (result > 0xFF):
+            psw = psw | FP51_Emulator._PSW_CY
+        if (((a & 0xF) + (value & 0xF) + carry_in) > 0xF):
+            psw = psw | FP51_Emulator._PSW_AC
+        if ((~(a ^ value) & (a ^ result)) & 0x80):
+            psw = psw | FP51_Emulator._PSW_OV
+
+        self.sfr [FP51_Emulator._PSW] = psw
+        self.sfr [FP51_Emulator._ACC] = result & 0xFF
+
+    def _op_ADD (self, op_code, operands, next_pc):
+        self._add (self._get (operands[1]), 0)
+
+    def _op_ADDC (self, op_code, operands, next_pc):
+        self._add (self._get (operands[1]), self._carry ())
+
+    def _op_SUBB (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        value = self._get (operands[1])
+        carry_in = self._carry ()
+        result = a - value - carry_in
+
+        psw = self.sfr [FP51_Emulator._PSW] & ~(FP51_Emulator._PSW_CY | FP51_Emulator._PSW_AC | FP51_Emulator._PSW_OV) & 0xFF
+        if (result < 0):
+            psw = psw | FP51_Emulator._PSW_CY
+        if (((a & 0xF) - (value & 0xF) - carry_in) < 0):
+            psw = psw | FP51_Emulator._PSW_AC
+        if (((a ^ value) & (a ^ result)) & 0x80):
+            psw = psw | FP51_Emulator._PSW_OV
+
+        self.sfr [FP51_Emulator._PSW] = psw
+        self.sfr [FP51_Emulator._ACC] = result & 0xFF
+
+    def _op_DA (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        psw = self.sfr [FP51_Emulator._PSW]
+
+        if (((a & 0xF) > 9) or (psw & FP51_Emulator._PSW_AC)):
+            a = a + 0x06
+        if (((a & 0x1F0) > 0x90) or (psw & FP51_Emulator._PSW_CY)):
+            a = a + 0x60
+
+        if (a > 0xFF):
+            self._set_carry (1)
+        self.sfr [FP51_Emulator._ACC] = a & 0xFF
+
+    def _op_MUL (self, op_code, operands, next_pc):
+        product = self.sfr [FP51_Emulator._ACC] * self.sfr [FP51_Emulator._B]
+        self.sfr [FP51_Emulator._ACC] = product & 0xFF
+        self.sfr [FP51_Emulator._B] = product >> 8
+
+        psw = self.sfr [FP51_Emulator._PSW] & ~(FP51_Emulator._PSW_CY | FP51_Emulator._PSW_OV) & 0xFF
+        if (product > 0xFF):
+            psw = psw | FP51_Emulator._PSW_OV
+        self.sfr [FP51_Emulator._PSW] = psw
+
+    def _op_DIV (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        b = self.sfr [FP51_Emulator._B]
+
+        psw = self.sfr [FP51_Emulator._PSW] & ~(FP51_Emulator._PSW_CY | FP51_Emulator._PSW_OV) & 0xFF
+        if (b == 0):
+            psw = psw | FP51_Emulator._PSW_OV
+        else:
+            self.sfr [FP51_Emulator._ACC] = a // b
+            self.sfr [FP51_Emulator._B] = a % b
+        self.sfr [FP51_Emulator._PSW] = psw
+
+    def _op_ORL (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[0]) | self._get (operands[1]))
+
+    def _op_ANL (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[0]) & self._get (operands[1]))
+
+    def _op_XRL (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[0]) ^ self._get (operands[1]))
+
+    def _op_MOV (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[1]))
+
+    def _op_MOVC (self, op_code, operands, next_pc):
+        if (operands[1][0] == '@A+PC'):
+            base = next_pc
+        else:
+            base = self._dptr ()
+        self.sfr [FP51_Emulator._ACC] = self.code [(base + self.sfr [FP51_Emulator._ACC]) & 0xFFFF]
+
+    def _op_MOVX (self, op_code, operands, next_pc):
+        self._set (operands[0], self._get (operands[1]))
+
+    def _op_XCH (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        self.sfr [FP51_Emulator._ACC] = self._get (operands[1])
+        self._set (operands[1], a)
+
+    def _op_XCHD (self, op_code, operands, next_pc):
+        a = self.sfr [FP51_Emulator._ACC]
+        value = self._get (operands[1])
+        self.sfr [FP51_Emulator._ACC] = (a & 0xF0) | (value & 0x0F)
+        self._set (operands[1], (value & 0xF0) | (a & 0x0F))
+
+    def _op_PUSH (self, op_code, operands, next_pc):
+        self._push (self._get (operands[0]))
+
+    def _op_POP (self, op_code, operands, next_pc):
+        self._set (operands[0], self._pop ())
+
+    def _op_CLR (self, op_code, operands, next_pc):
+        self._set (operands[0], 0)
+
+    def _op_SETB (self, op_code, operands, next_pc):
+        self._set (operands[0], 1)
+
+    def _op_CPL (self, op_code, operands, next_pc):
+        if (operands[0][0] == 'A'):
+            self.sfr [FP51_Emulator._ACC] = self.sfr [FP51_Emulator._ACC] ^ 0xFF
+        else:
+            self._set (operands[0], 1 - self._get (operands[0]))
+
+    def _op_JC (self, op_code, operands, next_pc):
+        if (self._carry ()):
+            return operands[0][1]
+
+    def _op_JNC (self, op_code, operands, next_pc):
+        if (not self._carry ()):
+            return operands[0][1]
+
+    def _op_JZ (self, op_code, operands, next_pc):
+        if (self.sfr [FP51_Emulator._ACC] == 0):
+            return operands[0][1]
+
+    def _op_JNZ (self, op_code, operands, next_pc):
+        if (self.sfr [FP51_Emulator._ACC] != 0):
+            return operands[0][1]
+
+    def _op_JB (self, op_code, operands, next_pc):
+        if (self._get (operands[0])):
+            return operands[1][1]
+
+    def _op_JNB (self, op_code, operands, next_pc):
+        if (not self._get (operands[0])):
+            return operands[1][1]
+
+    def _op_JBC (self, op_code, operands, next_pc):
+        if (self._get (operands[0])):
+            self._set (operands[0], 0)
+            return operands[1][1]
+
+    def _op_CJNE (self, op_code, operands, next_pc):
+        left = self._get (operands[0])
+        right = self._get (operands[1])
+        self._set_carry (left < right)
+        if (left != right):
+            return operands[2][1]
+
+    def _op_DJNZ (self, op_code, operands, next_pc):
+        value = (self._get (operands[0]) - 1) & 0xFF
+        self._set (operands[0], value)
+        if (value):
+            return operands[1][1]
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    image_file = ""
+    breakpoints = []
+    max_cycles = 10000000
+    uart_input = ""
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hU:B:c:i:", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-U'):
+            image_file = arg
+        elif opt in ('-B'):
+            breakpoints.append (int (arg, 0))
+        elif opt in ('-c'):
+            max_cycles = int (arg)
+        elif opt in ('-i'):
+            uart_input = arg
+        else:
+            print ("Usage:\n  py FP51_Emulator.py [-U hex_file] [-B break_addr] [-c max_cycles] [-i uart_input]")
+            print ("  Options: \n    -U: image to run, the built-in config firmware if not given")
+            print ("    -B: breakpoint address, can be given more than once")
+            print ("    -c: cycles to run at most (default 10000000)")
+            print ("    -i: text fed to the UART\n    -h print usage")
+            sys.exit(1)
+
+    emulator = FP51_Emulator ()
+
+    if (image_file):
+        intel_hex = Intel_Hex (image_file)
+    else:
+        from M10_high_speed_config_console import dummy_console
+        intel_hex = Intel_Hex ("", 0, dummy_console._FP51_CONFIG_FIRMWARE)
+
+    length = emulator.load_hex (intel_hex)
+    print ("Loaded ", length, " Byte(s)")
+
+    emulator.uart_rx.extend (uart_input.encode())
+    emulator.breakpoints = set (breakpoints)
+
+    start_time = time.perf_counter()
+    reason = emulator.run (max_cycles=max_cycles)
+    delta_time = time.perf_counter() - start_time
+
+    print ("stopped      : ", reason, " at PC = 0x{0:04X}".format (emulator.pc))
+    print ("instructions : ", emulator.instructions)
+    print ("cycles       : ", emulator.cycles)
+    print ("host speed   : {0:0.2f} M instructions/s".format (emulator.instructions / delta_time / 1e6))
+
+    if (len (emulator.uart_tx)):
+        print ("UART out     : ", bytes (emulator.uart_tx))
+
+if __name__ == "__main__":
+    main()
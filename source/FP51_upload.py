@@ -22,6 +22,10 @@ import math, time
 
 from OCD_8051 import OCD_8051
 from ROM_Hex_Format import *
+from Code_Upload_Planner import Code_Upload_Planner
+from Run_Profiler import Run_Profiler
+from Code_Image_Cache import Code_Image_Cache
+from Image_Watch import Image_Watch
 from time import sleep
 
 print ("===============================================================================")
@@ -29,7 +33,7 @@ print ("# Copyright (c) 2016, PulseRain Technology LLC ")
 print ("# FP51 Code Upload Utility, Version 1.0")
 
 try:
-      opts, args = getopt.getopt(sys.argv[1:],"vDp:c:P:C:I:o:b:U:",[])
+      opts, args = getopt.getopt(sys.argv[1:],"vDp:c:P:C:I:o:b:U:",["profile=", "full", "cache-dir=", "watch"])
 except getopt.GetoptError as err:
       print (str(err))
       sys.exit(2)
@@ -38,6 +42,10 @@ except getopt.GetoptError as err:
 baud_rate = 115200
 com_port = "COM4"
 image_file = "sketch.eep"
+profile_file = None
+full_write = 0
+cache_dir = None
+watch = 0
 
 for opt, args in opts:
     if opt in ('-b'): 
@@ -46,6 +54,14 @@ for opt, args in opts:
         com_port = args
     elif opt in ('-U'):
         image_file = args
+    elif opt in ('--profile'):
+        profile_file = args
+    elif opt in ('--full'):
+        full_write = 1
+    elif opt in ('--cache-dir'):
+        cache_dir = args
+    elif opt in ('--watch'):
+        watch = 1
         
 print ("===============================================================================")
 print ("baud_rate  = ", baud_rate)
@@ -73,6 +89,8 @@ class dummy_console:
     _TIME_COUNTER_INDEX_RESET  = 3
     _TIME_COUNTER_INDEX_SET    = 4  
     
+    _CODE_PAD_BYTE = 0x00 # NOP
+    
     def _string_to_data (self, data_string):
         if (data_string.startswith('0x')):
             data = int(data_string[2:], 16)
@@ -98,36 +116,8 @@ class dummy_console:
     
     
     def _write_code (self, addr, data):
-        offset = 0
-        length = len (data)
-        addr_end = addr + length
-        
-        if (addr % 4):
-            for i in range (min([(4 - (addr % 4)), length])):
-                self._ocd.code_mem_write_byte (addr + offset, data[i])
-                offset = offset + 1
-        
-        total_words = (addr_end - addr - offset) // 4
-        total_128byte_frame = total_words //32
-        
-        for i in range (total_128byte_frame):
-            self._ocd.code_mem_write_128byte (addr + offset, data[offset : offset + 128])
-            offset = offset + 128
-            
-        
-        for i in range (total_words - total_128byte_frame * 32):
-            data_int = (data[offset] << 24) + \
-                       (data[offset + 1] << 16) + \
-                       (data[offset + 2] << 8) + \
-                       (data[offset + 3])
-            
-            ##print ("write32bit addr = ", addr + offset, "data_int=", hex(data_int))            
-            self._ocd.code_mem_write_32bit(addr + offset, data_int)
-            offset = offset + 4
-        
-        for i in range (length - offset):
-            self._ocd.code_mem_write_byte (addr + offset, data [offset])
-            offset = offset + 1
+        # 1024 byte frames if the OCD takes them, then 128 / 4 / 1 byte
+        self._ocd.code_mem_write (addr, data)
 
 
     
@@ -152,70 +142,52 @@ class dummy_console:
         print ("Loading...", self._args[1])
         
         last_addr = intel_hex_file.data_record_list[-2].address + len(intel_hex_file.data_record_list[-1].data_list)
-        len_completed = 0
         
-        address = 0
-        merge_data_list = []
+        start_time = time.time()
+        
+        # gaps in the image are don't-care, the CPU is reset after loading
+        planner = Code_Upload_Planner (self._ocd.code_mem_frame_sizes())
+        segments = planner.segments_from_records (intel_hex_file.data_record_list)
+        segments = planner.coalesce (segments, pad_byte=dummy_console._CODE_PAD_BYTE)
+        
+        # only the blocks changed since the last upload, if that can be trusted
+        segments_to_write = segments
+        if (self.image_cache is not None):
+            segments_to_write = self.image_cache.plan (self._ocd, segments)
+            if (segments_to_write is None):
+                print ("Full write: " + self.image_cache.reason)
+                segments_to_write = segments
+            self.image_cache.invalidate()
         
-        start_time = time.clock()
-        print_cnt = 0
         print ("Writing | ", end="")
-        for record in intel_hex_file.data_record_list:
-            #print ("xxxxaddr=", record.address, "data=", record.data_list)
+        for (address, merge_data_list) in segments_to_write:
             
-            if ((print_cnt % 64) == 0):
-                print("#", end="")
-                sys.stdout.flush()
-                
-            print_cnt = print_cnt + 1
-                
-            if (len(merge_data_list) == 0):
-                address = record.address
-                merge_data_list = record.data_list
-                #print ("YY addr = ", address, " ", len (merge_data_list))
-            elif ((address + len (merge_data_list)) == record.address):
-                merge_data_list = merge_data_list + record.data_list
-                
-                #print ("WW addr = ", address, " ", len (merge_data_list))
-                #print (merge_data_list)
-                
-                
-            else:
-                #print ("XXXXXXXXXXXXXXX ", address, " ", len(merge_data_list))
-                self._write_code (address, merge_data_list)
-                #print ("YYYYYYYYYYYYYYYY")
-                
-                len_completed = len_completed + len(merge_data_list)
-                
-                load_progress = math.ceil(len_completed * 100 / last_addr);
-                if (load_progress > 100):
-                    load_progress = 100
-                
-                #print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
-                #print ("%d%% completed" % load_progress, end="")
-                
-                    
-                print("####", end="")
-                sys.stdout.flush()
+            self._write_code (address, merge_data_list)
+            
+            print("####", end="")
+            sys.stdout.flush()
+            
+            if (len(self._args) > 2):
+                f.write('addr %d\n' % (address))
                 
-                if (len(self._args) > 2):
-                    f.write('addr %d\n' % (address))
-                    
-                    for item in merge_data_list:
-                        f.write('%d\n' % (item))
-                        
-                address = record.address
-                merge_data_list = record.data_list
-
-
-
+                for item in merge_data_list:
+                    f.write('%d\n' % (item))
                 
+        self._ocd.code_mem_flush()
+        
         if (len(self._args) > 2):
             f.close()
         
-        end_time = time.clock()
+        end_time = time.time()
         delta_time = end_time - start_time
         print (" | 100% {0:0.2f}s".format(delta_time))        
+        if (segments_to_write is segments):
+            # the coalesce stats are of the whole image, of no use when
+            # only the changed blocks went out
+            planner.print_stats()
+        if (self.image_cache is not None):
+            self.image_cache.save (segments)
+            self.image_cache.print_stats()
         self._do_resume_cpu()
         print ("\nCPU reset ...")
         self._do_reset_cpu()        
@@ -233,9 +205,8 @@ class dummy_console:
         self._do_uart_select()
         
         self._ocd._serial.write ([ord('\r')])
-        sleep(0.5)
-        if (self._ocd._serial.in_waiting):
-            r = self._ocd._serial.read (self._ocd._serial.in_waiting)  
+        r = self._ocd.drain_input()
+        if (len (r)):
             prt_out = ""
             for i in r:
                 if (i < 128):
@@ -271,20 +242,85 @@ class dummy_console:
         
         self._do_pause_cpu()
         print ("CPU paused");
-        sleep(0.5)
+        if (not self._ocd.wait_ready()):
+            raise IOError ("OCD not ready after CPU pause")
         print ("CPU reset ...")
         self._do_reset_cpu()        
-        sleep(0.5)
+        if (not self._ocd.wait_ready()):
+            raise IOError ("OCD not ready after CPU reset")
         
         self.uart_raw_mode_enable = 0
         self._do_uart_select()
         
+        # Code_Image_Cache of the port for incremental uploads, or None
+        self.image_cache = None
+        
         
-console = dummy_console(ocd)
+try:
+    console = dummy_console(ocd)
+except IOError:
+    print ("OCD not ready")
+    sys.exit(1)
+
+console.image_cache = Code_Image_Cache (com_port, cache_dir)
+if (full_write):
+    # nothing cached, so written in full and cached again
+    console.image_cache.invalidate()
+
+if (profile_file):
+    profiler = Run_Profiler (ocd._serial)
+    profiler.start()
 
 console._args = ("load_hex_and_switch " + image_file).split()
 console._do_load_hex_and_switch ()
 
+if (profile_file):
+    profiler.finish (profile_file)
+
+#=============================================================================
+# --watch: UART of the target on the terminal, image uploaded again every
+# time the build writes a new one
+#=============================================================================
+
+_WATCH_READ_TIME_OUT = 0.05
+
+if (watch):
+    image_watch = Image_Watch (image_file)
+    print ("Watching", image_file, "(Ctrl-C to stop)")
+    print ("===============================================================================")
+    
+    try:
+        while True:
+            # the read time out is the poll interval of the image
+            ocd._serial.timeout = _WATCH_READ_TIME_OUT
+            r = ocd._serial.read (max ([ocd._serial.in_waiting, 1]))
+            if (len (r)):
+                sys.stdout.write (bytes ([i for i in r if i < 128]).decode ('ascii'))
+                sys.stdout.flush()
+            
+            if (image_watch.poll ()):
+                detect_time = time.time()
+                ocd._serial.timeout = OCD_8051._OCD_SERIAL_TIME_OUT
+                
+                print ("\n===============================================================================")
+                try:
+                    image_cache = console.image_cache
+                    console = dummy_console(ocd)
+                    console.image_cache = image_cache
+                    console._args = ("load_hex_and_switch " + image_file).split()
+                    console._do_load_hex_and_switch ()
+                except Exception as err:
+                    # the next build gets its chance, the cache makes it a full write
+                    print ("Upload failed: ", repr (err))
+                    continue
+                
+                running_time = time.time()
+                print ("Edit to running: {0:0.2f}s (seen {1:0.2f}s, upload {2:0.2f}s)".format ( \
+                    running_time - image_watch.mtime, detect_time - image_watch.mtime, running_time - detect_time))
+                print ("===============================================================================")
+    except KeyboardInterrupt:
+        print ("")
+
 #for k in sys.argv[1:]:
 #    if k.startswith("-U"):
 #        U = k[2:].split(':')
@@ -0,0 +1,293 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, getopt, time
+
+from CRC16_CCITT import CRC16_CCITT
+from Frame_Trace import Frame_Trace
+
+#############################################################################
+# Frame_Replay : offline look at a Frame_Trace dump
+#
+# Remarks:
+#    decode_tx / decode_rx split the raw bytes of a record back into OCD /
+#  config frames and check their CRC. bench_decode times that decoding
+#  over the whole capture, without the wire.
+#############################################################################
+
+class Frame_Replay:
+
+    _SYNC = [0x5A, 0xA5, 0x01]
+
+    _HEADER_LEN = 12
+
+    # frame type (type byte // 2), OCD and config firmware
+    FRAME_TYPES = {
+        0x5C : "write_4",
+        0x5B : "write_128",
+        0x57 : "write_ext",
+        0x6D : "read_4",
+        0x4B : "cpu_reset",
+        0x2D : "pause_on",
+        0x3D : "pause_off",
+        0x2F : "status",
+        0x6B : "counter_config",
+        0x7D : "break_on",
+        0x1D : "break_off",
+        0x49 : "run_pulse",
+        0x6F : "read_data",
+        0x2B : "write_data",
+        0x2A : "uart_sel",
+        0x36 : "flash_erase",
+        0x39 : "erase_status",
+        0x31 : "flash_protect",
+        0x33 : "flash_read",
+        0x5E : "buf_fill",
+        0x45 : "chip_id_lsw",
+        0x47 : "chip_id_msw",
+        0x42 : "write_1"
+    }
+
+    # total length of frames carrying more than the 4 header data bytes
+    _FRAME_LEN = {
+        0x5B : 12 + 124 + 2,
+        0x57 : 12 + 1020 + 2
+    }
+
+    _crc16_ccitt = CRC16_CCITT()
+
+    #========================================================================
+    #  _crc_ok
+    #========================================================================
+    def _crc_ok (self, data_list):
+        if (len (data_list) < 3):
+            return False
+
+        return (Frame_Replay._crc16_ccitt.get_crc (data_list [0 : len (data_list) - 2]) == data_list [len (data_list) - 2 :])
+
+    #========================================================================
+    #  frame_name
+    #========================================================================
+    def frame_name (self, type_byte):
+        frame_type = type_byte >> 1
+
+        if (frame_type in Frame_Replay.FRAME_TYPES):
+            return Frame_Replay.FRAME_TYPES[frame_type]
+        elif ((frame_type & 0x7E) in Frame_Replay.FRAME_TYPES):
+            return Frame_Replay.FRAME_TYPES[frame_type & 0x7E]
+
+        return "type_" + hex (type_byte)
+
+    #========================================================================
+    #  decode_tx
+    #------------------------------------------------------------------------
+    # Return:
+    #    list of dict (name, addr, length, crc_ok). One write can hold
+    #    several frames (pipelined) or zero fill bytes between frames
+    #========================================================================
+    def decode_tx (self, data):
+        data_list = list (data)
+        frames = []
+        offset = 0
+
+        while (offset < len (data_list)):
+            if (data_list [offset : offset + 3] != Frame_Replay._SYNC):
+                start = offset
+                while ((offset < len (data_list)) and (data_list [offset : offset + 3] != Frame_Replay._SYNC)):
+                    offset = offset + 1
+                frames.append ({'name' : "fill", 'addr' : None, 'length' : offset - start, 'crc_ok' : True})
+                continue
+
+            if ((offset + Frame_Replay._HEADER_LEN) > len (data_list)):
+                frames.append ({'name' : "short", 'addr' : None, 'length' : len (data_list) - offset, 'crc_ok' : False})
+                break
+
+            type_byte = data_list [offset + 3]
+            frame_len = Frame_Replay._FRAME_LEN.get (type_byte >> 1, Frame_Replay._HEADER_LEN)
+            frame = data_list [offset : offset + frame_len]
+
+            crc_ok = self._crc_ok (frame [0 : Frame_Replay._HEADER_LEN])
+            if (frame_len > Frame_Replay._HEADER_LEN):
+                crc_ok = crc_ok and self._crc_ok (frame [Frame_Replay._HEADER_LEN :])
+
+            frames.append ({
+                'name'   : self.frame_name (type_byte),
+                'addr'   : (frame[4] << 8) + frame[5],
+                'length' : len (frame),
+                'crc_ok' : crc_ok
+            })
+
+            offset = offset + frame_len
+
+        return frames
+
+    #========================================================================
+    #  decode_rx
+    #------------------------------------------------------------------------
+    # Remarks: replies are read one at a time, so a record is one reply:
+    #          12 bytes, or sync + data + CRC for flash reads. Anything
+    #          else is raw UART output of the CPU
+    #========================================================================
+    def decode_rx (self, data):
+        data_list = list (data)
+
+        if (data_list [0:3] != Frame_Replay._SYNC):
+            return {'name' : "raw", 'length' : len (data_list), 'crc_ok' : True}
+
+        if (len (data_list) == Frame_Replay._HEADER_LEN):
+            name = "reply"
+        else:
+            name = "data_reply"
+
+        return {'name' : name, 'length' : len (data_list), 'crc_ok' : self._crc_ok (data_list)}
+
+    #========================================================================
+    #  print_listing
+    #========================================================================
+    def print_listing (self, records):
+        if (len (records) == 0):
+            return
+
+        first_time = records[0][1]
+        last_tx_time = first_time
+
+        for (direction, time_ns, data) in records:
+            t = (time_ns - first_time) / 1e6
+
+            if (direction == Frame_Trace.TX):
+                last_tx_time = time_ns
+                for frame in self.decode_tx (data):
+                    line = "{0:12.3f} ms  TX  {1:<16}".format (t, frame['name'])
+                    if (frame['addr'] is not None):
+                        line = line + " addr=0x{0:04x}".format (frame['addr'])
+                    line = line + " len={0}".format (frame['length'])
+                    if (not frame['crc_ok']):
+                        line = line + " CRC BAD"
+                    print (line)
+            else:
+                reply = self.decode_rx (data)
+                line = "{0:12.3f} ms  RX  {1:<16} len={2} rtt={3:0.3f}ms".format (t, reply['name'], reply['length'], (time_ns - last_tx_time) / 1e6)
+                if (not reply['crc_ok']):
+                    line = line + " CRC BAD"
+                print (line)
+
+    #========================================================================
+    #  summary
+    #========================================================================
+    def summary (self, records):
+        counts = {}
+        bad_tx = 0
+        bad_rx = 0
+        rtt_list = []
+        last_tx_time = None
+
+        for (direction, time_ns, data) in records:
+            if (direction == Frame_Trace.TX):
+                last_tx_time = time_ns
+                for frame in self.decode_tx (data):
+                    counts[frame['name']] = counts.get (frame['name'], 0) + 1
+                    if (not frame['crc_ok']):
+                        bad_tx = bad_tx + 1
+            else:
+                reply = self.decode_rx (data)
+                if (not reply['crc_ok']):
+                    bad_rx = bad_rx + 1
+                if (last_tx_time is not None):
+                    rtt_list.append ((time_ns - last_tx_time) / 1e6)
+                    last_tx_time = None
+
+        rtt_list.sort()
+
+        return {
+            'records'     : len (records),
+            'frames'      : counts,
+            'bad_tx'      : bad_tx,
+            'bad_rx'      : bad_rx,
+            'rtt_p50_ms'  : rtt_list[len (rtt_list) // 2] if len (rtt_list) else None,
+            'rtt_max_ms'  : rtt_list[-1] if len (rtt_list) else None
+        }
+
+    #========================================================================
+    #  bench_decode
+    #------------------------------------------------------------------------
+    # Remarks: host cost of decoding the capture, in frames and bytes per s
+    #========================================================================
+    def bench_decode (self, records, loops=10):
+        total_bytes = sum ([len (data) for (direction, time_ns, data) in records])
+        frames = 0
+
+        start_time = time.perf_counter()
+        for i in range (loops):
+            for (direction, time_ns, data) in records:
+                if (direction == Frame_Trace.TX):
+                    frames = frames + len (self.decode_tx (data))
+                else:
+                    self.decode_rx (data)
+                    frames = frames + 1
+        delta_time = time.perf_counter() - start_time
+
+        return (frames / delta_time, total_bytes * loops / delta_time)
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    summary_only = 0
+    bench = 0
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hsb", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-s'):
+            summary_only = 1
+        elif opt in ('-b'):
+            bench = 1
+        else:
+            args = []
+
+    if (len (args) != 1):
+        print ("Usage:\n  py Frame_Replay.py [-s | -b] trace_file")
+        print ("  Options: \n    -s: summary only\n    -b: measure host decode speed\n    -h print usage")
+        sys.exit(1)
+
+    try:
+        records = Frame_Trace.load (args[0])
+    except (IOError, ValueError) as err:
+        print (str(err))
+        sys.exit(1)
+
+    replay = Frame_Replay()
+
+    if (bench):
+        (frames_per_s, bytes_per_s) = replay.bench_decode (records)
+        print ("decode: {0:0.0f} frames/s, {1:0.1f} KB/s".format (frames_per_s, bytes_per_s / 1024))
+    elif (summary_only):
+        for key, value in replay.summary (records).items():
+            print ("{0:<12}: {1}".format (key, value))
+    else:
+        replay.print_listing (records)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import time, struct
+from collections import deque
+
+#############################################################################
+# Frame_Trace : ring buffer of every write to / read from the port
+#
+# Remarks:
+#    Unlike verbose=1, nothing is formatted while the link is busy. Each
+#  record is (direction, monotonic time in ns, raw bytes), and only the
+#  last RING_SIZE records are kept, so tracing can stay on in production
+#  and be dumped when something goes wrong.
+#    Dump file: MAGIC, then for each record the header
+#  struct.pack ("<BQI", direction, time_ns, length) followed by the bytes.
+#  Frame_Replay.py reads it back.
+#############################################################################
+
+class Frame_Trace:
+
+    TX = 0
+    RX = 1
+
+    RING_SIZE = 65536
+
+    MAGIC = b"M10TRACE\x01"
+
+    _RECORD_HEADER = struct.Struct ("<BQI")
+
+    #========================================================================
+    #  __init__
+    #========================================================================
+    def __init__ (self, ring_size=RING_SIZE):
+        self._ring = deque (maxlen=ring_size)
+
+    #========================================================================
+    #  record
+    #========================================================================
+    def record (self, direction, data):
+        self._ring.append ((direction, time.monotonic_ns(), bytes (data)))
+
+    #========================================================================
+    #  clear / records
+    #========================================================================
+    def clear (self):
+        self._ring.clear()
+
+    def records (self):
+        return list (self._ring)
+
+    #========================================================================
+    #  dump
+    #------------------------------------------------------------------------
+    # Return: number of records written, or -1 if the file can not be opened
+    #========================================================================
+    def dump (self, file_name):
+        records = self.records()
+
+        try:
+            with open (file_name, 'wb') as f:
+                f.write (Frame_Trace.MAGIC)
+
+                for (direction, time_ns, data) in records:
+                    f.write (Frame_Trace._RECORD_HEADER.pack (direction, time_ns, len (data)))
+                    f.write (data)
+        except IOError:
+            print ("Fail to open: ", file_name)
+            return -1
+
+        return len (records)
+
+    #========================================================================
+    #  load
+    #------------------------------------------------------------------------
+    # Remarks: list of (direction, time_ns, bytes) from a dump file
+    #========================================================================
+    @staticmethod
+    def load (file_name):
+        records = []
+
+        with open (file_name, 'rb') as f:
+            content = f.read()
+
+        if (not content.startswith (Frame_Trace.MAGIC)):
+            raise ValueError ("not a frame trace: " + file_name)
+
+        offset = len (Frame_Trace.MAGIC)
+        header_size = Frame_Trace._RECORD_HEADER.size
+
+        while ((offset + header_size) <= len (content)):
+            (direction, time_ns, length) = Frame_Trace._RECORD_HEADER.unpack_from (content, offset)
+            offset = offset + header_size
+            records.append ((direction, time_ns, content [offset : offset + length]))
+            offset = offset + length
+
+        return records
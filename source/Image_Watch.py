@@ -0,0 +1,106 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import os, time
+
+#############################################################################
+# Image_Watch : tells when a new, complete Intel hex image has been written
+#
+# Remarks:
+#    poll() is cheap (one stat) and meant to be called from a loop that
+#  does something else in between, such as showing the UART of the
+#  target. A new image is one whose mtime / size differ from the last one
+#  reported, have stayed the same for SETTLE_TIME, and whose last record is
+#  the end of file record; a build still writing it is waited for.
+#############################################################################
+
+class Image_Watch:
+
+    SETTLE_TIME = 0.05
+
+    _HEX_END_OF_FILE = b":00000001FF"
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Remarks: the image as it is now counts as seen
+    #========================================================================
+    def __init__ (self, file_name):
+        self.file_name = file_name
+
+        # mtime of the image poll() last reported, the time of the edit
+        self.mtime = 0
+
+        self._seen = self._signature()
+        self._pending = None
+        self._pending_since = 0
+
+    #========================================================================
+    #  _signature
+    #========================================================================
+    def _signature (self):
+        try:
+            st = os.stat (self.file_name)
+        except OSError:
+            return None
+
+        return (st.st_mtime_ns, st.st_size)
+
+    #========================================================================
+    #  _complete
+    #========================================================================
+    def _complete (self):
+        try:
+            with open (self.file_name, 'rb') as f:
+                f.seek (0, os.SEEK_END)
+                f.seek (max ([f.tell() - 64, 0]))
+                tail = f.read()
+        except OSError:
+            return False
+
+        return tail.strip().upper().endswith (Image_Watch._HEX_END_OF_FILE)
+
+    #========================================================================
+    #  poll
+    #------------------------------------------------------------------------
+    # Return: True once for every new complete image
+    #========================================================================
+    def poll (self):
+        signature = self._signature()
+        now = time.time()
+
+        if ((signature is None) or (signature == self._seen)):
+            self._pending = None
+            return False
+
+        if (signature != self._pending):
+            self._pending = signature
+            self._pending_since = now
+            return False
+
+        if ((now - self._pending_since) < Image_Watch.SETTLE_TIME):
+            return False
+
+        if (not self._complete()):
+            return False
+
+        self._seen = signature
+        self._pending = None
+        self.mtime = signature[0] / 1e9
+
+        return True
@@ -0,0 +1,379 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, json, time, datetime
+
+from OCD_8051 import OCD_8051
+from CRC16_CCITT import CRC16_CCITT
+from Code_Upload_Planner import Code_Upload_Planner
+
+#############################################################################
+# Link_Bench : round trip latency and throughput of the serial link
+#
+# Remarks:
+#    Frames are built here and written straight to the port, so that
+#  several of them can be in flight at once (pipeline depth). Depth 1 is
+#  what OCD_8051 / M10_high_speed_config_console do today: one frame, then
+#  wait for its reply.
+#    A reply that is short or fails CRC counts as a retry, and the frame is
+#  sent again (at most MAX_RETRY times). A frame type the target does not
+#  answer at all (such as 1024 byte frames on older OCD builds) is given up
+#  after the first frame.
+#############################################################################
+
+class Link_Bench:
+
+    DEFAULT_COUNT   = 64
+    PIPELINE_DEPTHS = (1, 2, 4, 8)
+    MAX_RETRY       = 3
+    TIME_OUT        = 0.5
+
+    # upper bound of each histogram bucket in ms, the last bucket is open
+    LATENCY_BUCKETS_MS = (0.5, 1, 2, 4, 8, 16, 32, 64)
+
+    _OCD_SYNC           = [0x5A, 0xA5, 0x01]
+    _OCD_TYPE_STATUS    = 0x2F
+    _OCD_TYPE_WRITE_4   = 0x5D
+    _OCD_TYPE_WRITE_128 = 0x5B
+    _OCD_TYPE_WRITE_EXT = 0x57
+    _OCD_TYPE_READ_4    = 0x6D
+    _OCD_REPLY_LEN      = 12
+
+    _CONFIG_TYPE_FLASH_READ = 0x33
+
+    _crc16_ccitt = CRC16_CCITT()
+
+    _config_toggle = 0
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    serial_port : open port, with the UART on the OCD for OCD frames
+    #    count       : frames per test
+    #    depths      : pipeline depths to measure throughput at
+    #========================================================================
+    def __init__ (self, serial_port, count=DEFAULT_COUNT, depths=PIPELINE_DEPTHS):
+        self._serial = serial_port
+        self.count = count
+        self.depths = depths
+        self.results = []
+
+    #========================================================================
+    #  frame encoders
+    #========================================================================
+    def _ocd_frame (self, frame_type, addr, data_list):
+        frame_type_byte = frame_type * 2 + OCD_8051._toggle
+        OCD_8051._toggle = 1 - OCD_8051._toggle
+
+        frame = Link_Bench._OCD_SYNC + [frame_type_byte] + [(addr >> 8) & 0xFF, addr & 0xFF]
+        frame = frame + list (data_list [0:4])
+        frame = frame + Link_Bench._crc16_ccitt.get_crc (frame)
+
+        if (len (data_list) > 4):
+            frame = frame + list (data_list [4:]) + Link_Bench._crc16_ccitt.get_crc (list (data_list [4:]))
+
+        return frame
+
+    def ocd_status_frame (self):
+        return self._ocd_frame (Link_Bench._OCD_TYPE_STATUS, 0x1234, [0xab, 0xcd, 0xab, 0xcd])
+
+    def ocd_read_frame (self, addr):
+        return self._ocd_frame (Link_Bench._OCD_TYPE_READ_4, addr, [0x00, 0xFF, 0x00, 0xFF])
+
+    def ocd_write_frame (self, addr, data_list):
+        if (len (data_list) == 4):
+            frame_type = Link_Bench._OCD_TYPE_WRITE_4
+        elif (len (data_list) == 128):
+            frame_type = Link_Bench._OCD_TYPE_WRITE_128
+        else:
+            frame_type = Link_Bench._OCD_TYPE_WRITE_EXT
+
+        return self._ocd_frame (frame_type, addr, data_list)
+
+    def config_flash_read_frame (self, addr, length):
+        frame_type_byte = Link_Bench._CONFIG_TYPE_FLASH_READ * 2 + Link_Bench._config_toggle
+        Link_Bench._config_toggle = 1 - Link_Bench._config_toggle
+
+        frame = Link_Bench._OCD_SYNC + [frame_type_byte, (length >> 8) & 0xFF, length & 0xFF]
+        frame = frame + [(addr >> 24) & 0xFF, (addr >> 16) & 0xFF, (addr >> 8) & 0xFF, addr & 0xFF]
+        frame = frame + Link_Bench._crc16_ccitt.get_crc (frame)
+
+        return frame
+
+    #========================================================================
+    #  _reply_ok
+    #========================================================================
+    def _reply_ok (self, reply, reply_len):
+        if (len (reply) != reply_len):
+            return False
+
+        data_list = [i for i in reply]
+        return (Link_Bench._crc16_ccitt.get_crc (data_list [0 : reply_len - 2]) == data_list [reply_len - 2 : reply_len])
+
+    #========================================================================
+    #  _drain
+    #------------------------------------------------------------------------
+    # Remarks: after a bad reply, the replies still in flight are read and
+    #          dropped until the line goes quiet, so that the next frame
+    #          does not take one of them for its own
+    #========================================================================
+    def _drain (self, time_out):
+        timeout_save = self._serial.timeout
+        self._serial.timeout = OCD_8051._OCD_QUIET_TIME
+        deadline = time.perf_counter () + time_out
+
+        try:
+            while (time.perf_counter () < deadline):
+                if (len (self._serial.read (max ([1, self._serial.in_waiting]))) == 0):
+                    break
+        finally:
+            self._serial.timeout = timeout_save
+
+        self._serial.reset_input_buffer ()
+
+    #========================================================================
+    #  read_code
+    #------------------------------------------------------------------------
+    # Remarks: code memory content, so the write tests can put back what
+    #          was there. None if it could not be read
+    #========================================================================
+    def read_code (self, addr, length):
+        data = []
+
+        for word_addr in range (addr, addr + length, 4):
+            for i in range (Link_Bench.MAX_RETRY + 1):
+                self._serial.write (self.ocd_read_frame (word_addr))
+                reply = self._serial.read (Link_Bench._OCD_REPLY_LEN)
+                if (self._reply_ok (reply, Link_Bench._OCD_REPLY_LEN)):
+                    break
+                self._serial.reset_input_buffer ()
+            else:
+                return None
+
+            data = data + [i for i in reply [Link_Bench._OCD_REPLY_LEN - 6 : Link_Bench._OCD_REPLY_LEN - 2]]
+
+        return data
+
+    #========================================================================
+    #  _histogram
+    #========================================================================
+    def _histogram (self, latency_list):
+        histogram = []
+        low = 0
+
+        for high in Link_Bench.LATENCY_BUCKETS_MS:
+            histogram.append (("<{0}".format (high), len ([t for t in latency_list if (low <= t < high)])))
+            low = high
+
+        histogram.append ((">={0}".format (low), len ([t for t in latency_list if (t >= low)])))
+
+        return histogram
+
+    #========================================================================
+    #  run_test
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    name        : test name in the table
+    #    make_frame  : callable (i) -> frame, for the i-th frame of the test
+    #    reply_len   : bytes in each reply
+    #    payload_len : data bytes moved by each frame
+    #========================================================================
+    def run_test (self, name, make_frame, reply_len, payload_len):
+        timeout_save = self._serial.timeout
+        self._serial.timeout = Link_Bench.TIME_OUT
+
+        try:
+            result = self._run_test (name, make_frame, reply_len, payload_len)
+        finally:
+            self._serial.timeout = timeout_save
+
+        self.results.append (result)
+        return result
+
+    def _run_test (self, name, make_frame, reply_len, payload_len):
+        retries = 0
+        failures = 0
+        latency_list = []
+
+        # latency, one frame at a time
+        for i in range (self.count):
+            for attempt in range (Link_Bench.MAX_RETRY + 1):
+                frame = make_frame (i)
+                start_time = time.perf_counter ()
+                self._serial.write (frame)
+                reply = self._serial.read (reply_len)
+                end_time = time.perf_counter ()
+
+                if (self._reply_ok (reply, reply_len)):
+                    latency_list.append ((end_time - start_time) * 1000)
+                    break
+
+                retries = retries + 1
+                self._drain (Link_Bench.TIME_OUT)
+            else:
+                failures = failures + 1
+                if (len (latency_list) == 0):
+                    break
+
+        # throughput, depth frames in flight
+        throughput = []
+        for depth in self.depths:
+            if (len (latency_list) == 0):
+                break
+
+            frames_done = 0
+            start_time = time.perf_counter ()
+
+            for batch in range (max ([1, self.count // depth])):
+                frames = [make_frame (batch * depth + k) for k in range (depth)]
+                self._serial.write ([byte for frame in frames for byte in frame])
+
+                for k in range (depth):
+                    reply = self._serial.read (reply_len)
+                    if (self._reply_ok (reply, reply_len)):
+                        frames_done = frames_done + 1
+                    else:
+                        # the other depth - k - 1 replies are still coming
+                        retries = retries + 1
+                        self._drain (Link_Bench.TIME_OUT * (depth - k))
+                        break
+
+            delta_time = time.perf_counter () - start_time
+
+            throughput.append ({
+                'depth'         : depth,
+                'frames_per_s'  : frames_done / delta_time,
+                'bytes_per_s'   : frames_done * payload_len / delta_time
+            })
+
+        latency_list.sort ()
+
+        if (len (latency_list)):
+            latency = {
+                'min' : latency_list[0],
+                'avg' : sum (latency_list) / len (latency_list),
+                'p50' : latency_list[len (latency_list) // 2],
+                'p95' : latency_list[min ([len (latency_list) - 1, (len (latency_list) * 95) // 100])],
+                'max' : latency_list[-1]
+            }
+        else:
+            latency = None
+
+        result = {
+            'frame'      : name,
+            'count'      : self.count,
+            'payload'    : payload_len,
+            'latency_ms' : latency,
+            'histogram'  : self._histogram (latency_list),
+            'throughput' : throughput,
+            'retries'    : retries,
+            'failures'   : failures
+        }
+
+        return result
+
+    #========================================================================
+    #  run_ocd_tests
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    addr        : code memory for the write tests, the CPU must not
+    #                  run code there (paused, or scratch space)
+    #    frame_sizes : code_mem_frame_sizes() of the OCD, the 1024 byte
+    #                  test is skipped without FRAME_SIZE_EXT: an older OCD
+    #                  would take its payload for frames
+    # Remarks: status, 4 / 128 / 1024 byte writes at addr. The code memory
+    #          there is read first and written back unchanged, the write
+    #          tests are skipped if it can not be read
+    #========================================================================
+    def run_ocd_tests (self, addr, frame_sizes=Code_Upload_Planner.FRAME_SIZES_ALL):
+        self.run_test ("status", lambda i: self.ocd_status_frame (), Link_Bench._OCD_REPLY_LEN, 0)
+        self.run_test ("read_4", lambda i: self.ocd_read_frame (addr + (i % 256) * 4), Link_Bench._OCD_REPLY_LEN, 4)
+
+        data = self.read_code (addr, 1024)
+        if (data is None):
+            print ("Fail to read code memory, write tests skipped")
+            return
+
+        self.run_test ("write_4", lambda i: self.ocd_write_frame (addr + (i % 256) * 4, data [(i % 256) * 4 : (i % 256) * 4 + 4]), Link_Bench._OCD_REPLY_LEN, 4)
+        self.run_test ("write_128", lambda i: self.ocd_write_frame (addr + (i % 8) * 128, data [(i % 8) * 128 : (i % 8) * 128 + 128]), Link_Bench._OCD_REPLY_LEN, 128)
+
+        if (Code_Upload_Planner.FRAME_SIZE_EXT in frame_sizes):
+            self.run_test ("write_1024", lambda i: self.ocd_write_frame (addr, data), Link_Bench._OCD_REPLY_LEN, 1024)
+        else:
+            print ("No 1024 byte frames on this OCD, write_1024 skipped")
+
+    #========================================================================
+    #  run_flash_read_test
+    #------------------------------------------------------------------------
+    # Remarks: config firmware flash reads, with the UART on the CPU
+    #========================================================================
+    def run_flash_read_test (self, addr, length=128):
+        self.run_test ("flash_read_%d" % length, lambda i: self.config_flash_read_frame (addr + (i % 64) * length, length), \
+                       length + len (Link_Bench._OCD_SYNC) + 2, length)
+
+    #========================================================================
+    #  print_table
+    #========================================================================
+    def print_table (self):
+        print ("baud rate:", self._serial.baudrate, " frames per test:", self.count)
+        print ("{0:<16}{1:>9}{2:>9}{3:>9}{4:>9}{5:>9}".format ("frame", "min ms", "avg ms", "p95 ms", "max ms", "retries") + \
+               "".join (["{0:>12}".format ("KB/s @%d" % depth) for depth in self.depths]))
+
+        for result in self.results:
+            line = "{0:<16}".format (result['frame'])
+
+            if (result['latency_ms'] is None):
+                line = line + "{0:>36}".format ("no reply")
+            else:
+                line = line + "{0:>9.2f}{1:>9.2f}{2:>9.2f}{3:>9.2f}".format (result['latency_ms']['min'], \
+                    result['latency_ms']['avg'], result['latency_ms']['p95'], result['latency_ms']['max'])
+
+            line = line + "{0:>9d}".format (result['retries'])
+
+            for item in result['throughput']:
+                if (result['payload']):
+                    line = line + "{0:>12.1f}".format (item['bytes_per_s'] / 1024)
+                else:
+                    line = line + "{0:>12}".format ("%d f/s" % item['frames_per_s'])
+
+            print (line)
+
+        print ("latency histogram (ms):")
+        for result in self.results:
+            print ("  {0:<16}".format (result['frame']), " ".join (["%s:%d" % (label, n) for (label, n) in result['histogram']]))
+
+    #========================================================================
+    #  save_json
+    #========================================================================
+    def save_json (self, file_name):
+        record = {
+            'time'      : datetime.datetime.now().isoformat(),
+            'port'      : self._serial.port,
+            'baud_rate' : self._serial.baudrate,
+            'results'   : self.results
+        }
+
+        try:
+            with open (file_name, 'w') as f:
+                json.dump (record, f, indent=2)
+        except IOError:
+            print ("Fail to open: ", file_name)
+            return
+
+        print ("Saved to", file_name)
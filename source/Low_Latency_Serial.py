@@ -0,0 +1,423 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import os, sys, getopt, time
+import serial
+
+from Frame_Trace import Frame_Trace
+
+if sys.platform.startswith ('linux'):
+    import array, fcntl, termios
+
+#############################################################################
+# Low_Latency_Serial : serial port tuned for request / reply traffic
+#
+# Remarks:
+#    The FT232R on the board is driven by ftdi_sio on Linux, which holds
+#  received bytes for latency_timer ms (16 by default) before handing them
+#  to the host. Every OCD / config frame waits for its reply, so that is
+#  the floor of each round trip.
+#    On open, latency_timer is set to 1ms through sysfs and ASYNC_LOW_LATENCY
+#  is set through TIOCSSERIAL. Both are put back on close. Either step is
+#  skipped quietly if not permitted (no udev rule, not an FTDI port, not
+#  Linux).
+#    calibrate() looks for the fastest baud rate the board keeps up with.
+#  The board locks onto the baud rate of the frame sync, so the host side
+#  can change rate between frames. While loading, the callers report CRC
+#  retries through crc_retry(); too many of them within a window of frames
+#  drop the link to the next lower rate.
+#############################################################################
+
+class Low_Latency_Serial (serial.Serial):
+
+    SYSFS_ROOT       = "/sys"
+    LATENCY_TIMER_MS = 1
+
+    # FT232R rates, fastest first
+    BAUD_RATES = (3000000, 2000000, 1500000, 1000000, 921600, 460800, 230400, 115200)
+
+    CALIBRATION_BURST          = 64
+    CALIBRATION_MAX_ERROR_RATE = 0.02
+
+    FALLBACK_WINDOW  = 256
+    FALLBACK_RETRIES = 8
+
+    _ASYNC_LOW_LATENCY = 0x2000
+    _TIOCGSERIAL       = 0x541E
+    _TIOCSSERIAL       = 0x541F
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    sysfs_root  : where to look for bus/usb-serial, for a fake tree
+    #    low_latency : 0 to open the port untouched
+    #    fallback    : 0 to keep the baud rate no matter how many retries
+    #    the rest is passed to serial.Serial
+    #========================================================================
+    def __init__ (self, *args, sysfs_root=None, low_latency=1, fallback=1, **kwargs):
+        if (sysfs_root is None):
+            sysfs_root = Low_Latency_Serial.SYSFS_ROOT
+
+        self._sysfs_root = sysfs_root
+        self._low_latency = low_latency
+
+        self._saved_latency_timer = None
+        self._saved_serial_flags  = None
+
+        self.fallback = fallback
+        self._window_frames  = 0
+        self._window_retries = 0
+        self.total_retries   = 0
+
+        # running totals, see counters()
+        self.bytes_sent     = 0
+        self.bytes_received = 0
+        self.frames_sent    = 0
+        self.read_wait_time = 0
+
+        # Frame_Trace to record into, None for no tracing
+        self.trace = None
+
+        super().__init__ (*args, **kwargs)
+
+    #========================================================================
+    #  write
+    #------------------------------------------------------------------------
+    # Remarks: every write is one frame, counted for the retry window
+    #========================================================================
+    def write (self, data):
+        self._window_frames = self._window_frames + 1
+
+        if (self._window_frames > Low_Latency_Serial.FALLBACK_WINDOW):
+            self._window_frames  = 1
+            self._window_retries = 0
+
+        self.frames_sent = self.frames_sent + 1
+        self.bytes_sent = self.bytes_sent + len (data)
+
+        if (self.trace is not None):
+            self.trace.record (Frame_Trace.TX, data)
+
+        return super().write (data)
+
+    #========================================================================
+    #  read
+    #------------------------------------------------------------------------
+    # Remarks: time blocked in here is time spent waiting on the device
+    #========================================================================
+    def read (self, size=1):
+        start_time = time.perf_counter ()
+        data = super().read (size)
+
+        self.read_wait_time = self.read_wait_time + time.perf_counter () - start_time
+        self.bytes_received = self.bytes_received + len (data)
+
+        if ((self.trace is not None) and len (data)):
+            self.trace.record (Frame_Trace.RX, data)
+
+        return data
+
+    #========================================================================
+    #  counters
+    #========================================================================
+    def counters (self):
+        return {
+            'bytes_sent'     : self.bytes_sent,
+            'bytes_received' : self.bytes_received,
+            'frames'         : self.frames_sent,
+            'crc_retries'    : self.total_retries,
+            'device_wait'    : self.read_wait_time
+        }
+
+    #========================================================================
+    #  open / close
+    #========================================================================
+    def open (self):
+        super().open ()
+
+        if (self._low_latency):
+            self.set_low_latency (1)
+
+    def close (self):
+        if (self.is_open):
+            self.set_low_latency (0)
+
+        super().close ()
+
+    #========================================================================
+    #  latency_timer_path
+    #========================================================================
+    def latency_timer_path (self):
+        tty = os.path.basename (os.path.realpath (self.port))
+        return os.path.join (self._sysfs_root, "bus", "usb-serial", "devices", tty, "latency_timer")
+
+    #========================================================================
+    #  _set_latency_timer
+    #------------------------------------------------------------------------
+    # Remarks: returns the value found before, or None if not possible
+    #========================================================================
+    def _set_latency_timer (self, value):
+        path = self.latency_timer_path ()
+
+        try:
+            with open (path, "r") as f:
+                old_value = int (f.read().strip())
+
+            if (old_value != value):
+                with open (path, "w") as f:
+                    f.write ("%d\n" % value)
+        except (OSError, ValueError):
+            return None
+
+        return old_value
+
+    #========================================================================
+    #  _set_serial_flags
+    #------------------------------------------------------------------------
+    # Remarks: serial_struct.flags, returns the flags found before, or None
+    #          if the driver does not take TIOCGSERIAL / TIOCSSERIAL
+    #========================================================================
+    def _set_serial_flags (self, set_mask, clear_mask):
+        if (not sys.platform.startswith ('linux')):
+            return None
+
+        buf = array.array ('i', [0] * 32)
+
+        try:
+            fcntl.ioctl (self.fd, getattr (termios, 'TIOCGSERIAL', Low_Latency_Serial._TIOCGSERIAL), buf)
+            old_flags = buf[4]
+            buf[4] = (old_flags | set_mask) & ~clear_mask
+
+            if (buf[4] != old_flags):
+                fcntl.ioctl (self.fd, getattr (termios, 'TIOCSSERIAL', Low_Latency_Serial._TIOCSSERIAL), buf)
+        except (OSError, IOError):
+            return None
+
+        return old_flags
+
+    #========================================================================
+    #  set_low_latency
+    #------------------------------------------------------------------------
+    # Remarks: 1 to tune, 0 to put back what was there before
+    #========================================================================
+    def set_low_latency (self, enable):
+        if (enable):
+            if (self._saved_latency_timer is None):
+                self._saved_latency_timer = self._set_latency_timer (Low_Latency_Serial.LATENCY_TIMER_MS)
+
+            if (self._saved_serial_flags is None):
+                self._saved_serial_flags = self._set_serial_flags (Low_Latency_Serial._ASYNC_LOW_LATENCY, 0)
+        else:
+            if (self._saved_latency_timer is not None):
+                self._set_latency_timer (self._saved_latency_timer)
+                self._saved_latency_timer = None
+
+            if (self._saved_serial_flags is not None):
+                if (self._saved_serial_flags & Low_Latency_Serial._ASYNC_LOW_LATENCY):
+                    self._set_serial_flags (Low_Latency_Serial._ASYNC_LOW_LATENCY, 0)
+                else:
+                    self._set_serial_flags (0, Low_Latency_Serial._ASYNC_LOW_LATENCY)
+                self._saved_serial_flags = None
+
+    #========================================================================
+    #  tuning_status
+    #========================================================================
+    def tuning_status (self):
+        return {
+            'latency_timer'     : (self._saved_latency_timer is not None),
+            'async_low_latency' : (self._saved_serial_flags is not None)
+        }
+
+    #========================================================================
+    #  measure_round_trip
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ping  : callable sending one frame and waiting for its reply,
+    #            such as OCD_8051.ping
+    #    count : number of round trips to average
+    #
+    # Return:
+    #    average round trip time in seconds, None if nothing came back
+    #========================================================================
+    def measure_round_trip (self, ping, count=20):
+        total = 0
+        good = 0
+
+        for i in range (count):
+            start_time = time.perf_counter ()
+            if (ping ()):
+                total = total + time.perf_counter () - start_time
+                good = good + 1
+
+        if (good == 0):
+            return None
+
+        return total / good
+
+    #========================================================================
+    #  report_round_trip
+    #------------------------------------------------------------------------
+    # Remarks: measure with the tuning taken off and put on again
+    #========================================================================
+    def report_round_trip (self, ping, count=20):
+        self.set_low_latency (0)
+        before = self.measure_round_trip (ping, count)
+        self.set_low_latency (1)
+        after = self.measure_round_trip (ping, count)
+
+        print ("latency_timer     :", "set" if self.tuning_status()['latency_timer'] else "not changed")
+        print ("ASYNC_LOW_LATENCY :", "set" if self.tuning_status()['async_low_latency'] else "not changed")
+
+        if ((before is None) or (after is None)):
+            print ("Round Trip        : no reply")
+        else:
+            print ("Round Trip        : {0:0.2f}ms -> {1:0.2f}ms".format (before * 1000, after * 1000))
+
+        return (before, after)
+
+
+    #========================================================================
+    #  crc_retry
+    #------------------------------------------------------------------------
+    # Remarks: called by OCD_8051 / M10_high_speed_config_console when a
+    #          reply fails CRC and the frame is sent again
+    #========================================================================
+    def crc_retry (self):
+        self._window_retries = self._window_retries + 1
+        self.total_retries = self.total_retries + 1
+
+        if (self.fallback and (self._window_retries >= Low_Latency_Serial.FALLBACK_RETRIES)):
+            self._window_frames  = 0
+            self._window_retries = 0
+            self.fall_back ()
+
+    #========================================================================
+    #  fall_back
+    #------------------------------------------------------------------------
+    # Remarks: next lower rate in BAUD_RATES. Returns False if there is none
+    #========================================================================
+    def fall_back (self):
+        lower_rates = [rate for rate in Low_Latency_Serial.BAUD_RATES if rate < self.baudrate]
+
+        if (len (lower_rates) == 0):
+            return False
+
+        print ("\nToo many CRC retries, baud rate", self.baudrate, "->", lower_rates[0])
+
+        self.baudrate = lower_rates[0]
+        self.reset_input_buffer ()
+        return True
+
+    #========================================================================
+    #  error_rate
+    #------------------------------------------------------------------------
+    # Remarks: run up to burst pings at the current rate. Gives up early
+    #          once the error rate can no longer stay below max_error_rate
+    #========================================================================
+    def error_rate (self, ping, burst=CALIBRATION_BURST, max_error_rate=CALIBRATION_MAX_ERROR_RATE):
+        errors = 0
+
+        for i in range (burst):
+            if (not ping ()):
+                errors = errors + 1
+                if (errors > (burst * max_error_rate)):
+                    return errors / (i + 1)
+
+        return errors / burst
+
+    #========================================================================
+    #  calibrate
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ping           : callable sending one CRC checked frame and
+    #                     returning True on a good reply, such as
+    #                     OCD_8051.ping
+    #    rates          : candidate baud rates
+    #    burst          : frames sent at each rate
+    #    max_error_rate : highest acceptable share of failed frames
+    #
+    # Return:
+    #    the fastest rate that passed (the port is left at it), or None
+    #    with the port back at the rate it had before
+    #========================================================================
+    def calibrate (self, ping, rates=BAUD_RATES, burst=CALIBRATION_BURST, max_error_rate=CALIBRATION_MAX_ERROR_RATE):
+        baud_rate_save = self.baudrate
+
+        for rate in sorted (rates, reverse=True):
+            # let frames already written (such as a UART select) go out at
+            # the old rate, instead of dropping them
+            self.flush ()
+            self.baudrate = rate
+            self.reset_input_buffer ()
+
+            error_rate = self.error_rate (ping, burst, max_error_rate)
+            print ("{0:>8d} bps : error rate {1:0.3f}".format (rate, error_rate))
+
+            if (error_rate <= max_error_rate):
+                self._window_frames  = 0
+                self._window_retries = 0
+                return rate
+
+        self.baudrate = baud_rate_save
+        return None
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    from OCD_8051 import OCD_8051
+
+    baud_rate = 921600
+    com_port  = "/dev/ttyUSB0"
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hP:b:", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, args in opts:
+        if opt in ('-b'):
+            baud_rate = int (args)
+        elif opt in ('-P'):
+            com_port = args
+        else:
+            print ("Usage:\n  py Low_Latency_Serial.py -P comport [-b baud_rate]")
+            print ("  Measure OCD round trip time before and after low latency tuning,")
+            print ("  then look for the fastest baud rate the board keeps up with")
+            sys.exit(1)
+
+    try:
+        ocd = OCD_8051 (com_port, baud_rate, verbose=0)
+    except:
+        print ("Failed to open COM port")
+        sys.exit(1)
+
+    ocd._serial.report_round_trip (ocd.ping)
+
+    rate = ocd._serial.calibrate (ocd.ping)
+    print ("Fastest baud rate :", rate)
+
+    ocd._serial.close ()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, time, getopt, threading
+
+import serial.tools.list_ports
+
+from OCD_8051 import OCD_8051
+from M10_high_speed_config_console import M10_high_speed_config_console
+
+#############################################################################
+# M10_Board_Discovery : which serial ports have an M10 board
+#
+# Remarks:
+#    Every candidate port is probed on a thread of its own: an OCD status
+#  frame first, then, if the OCD answered, the chip ID frame of the config
+#  firmware. The UART is handed back to the CPU after the OCD frame, which
+#  is where a running sketch or the config firmware has it. Ports still busy at
+#  the deadline are reported as not answering, so the whole scan takes
+#  about DEFAULT_DEADLINE however many USB-serial adapters are plugged in.
+#    Each port gives a dict of port, ocd (the OCD answered), firmware (the
+#  config firmware answered), chip_id and firmware_version (hex strings,
+#  None without the firmware), seconds and error.
+#############################################################################
+
+class M10_Board_Discovery:
+
+    DEFAULT_BAUD_RATE = 921600
+    DEFAULT_DEADLINE = 1.0
+
+    # each read of a probe frame
+    PROBE_TIME_OUT = 0.2
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ports    : ports to probe, all serial ports of the machine if None
+    #    deadline : seconds for the whole scan
+    #========================================================================
+    def __init__ (self, ports=None, baud_rate=DEFAULT_BAUD_RATE, deadline=DEFAULT_DEADLINE):
+        if (ports is None):
+            ports = [port.device for port in serial.tools.list_ports.comports()]
+
+        self.ports = ports
+        self.baud_rate = baud_rate
+        self.deadline = deadline
+        self.results = []
+
+    #========================================================================
+    #  _result
+    #========================================================================
+    def _result (self, port):
+        return {
+            'port'             : port,
+            'ocd'              : False,
+            'firmware'         : False,
+            'chip_id'          : None,
+            'firmware_version' : None,
+            'seconds'          : 0,
+            'error'            : ""
+        }
+
+    #========================================================================
+    #  probe
+    #------------------------------------------------------------------------
+    # Return: the result dict of one port
+    #========================================================================
+    def probe (self, port):
+        result = self._result (port)
+        start_time = time.time()
+        ocd = None
+
+        try:
+            ocd = OCD_8051 (port, self.baud_rate, verbose=0)
+            ocd._serial.reset_input_buffer()
+
+            # the OCD only answers with the UART on its side
+            ocd.uart_select (1)
+            result['ocd'] = ocd.ping (M10_Board_Discovery.PROBE_TIME_OUT)
+            ocd.uart_select (0)
+
+            if (result['ocd']):
+                config = M10_high_speed_config_console (port, self.baud_rate, verbose=0, serial_link=ocd._serial)
+                config._serial.timeout = M10_Board_Discovery.PROBE_TIME_OUT
+
+                if (config.ping (M10_Board_Discovery.PROBE_TIME_OUT)):
+                    (chip_id_msw, chip_id_lsw, mcu_version, firmware_version) = config.flash_read_chip_id()
+                    result['firmware'] = True
+                    result['chip_id'] = bytes (chip_id_msw + chip_id_lsw).hex().upper()
+                    result['firmware_version'] = bytes (firmware_version).hex().upper()
+        except Exception as err:
+            result['error'] = repr (err)
+        finally:
+            if (ocd is not None):
+                try:
+                    ocd._serial.close()
+                except:
+                    pass
+
+        result['seconds'] = time.time() - start_time
+        return result
+
+    #========================================================================
+    #  scan
+    #------------------------------------------------------------------------
+    # Return: result dicts in the order of the ports
+    #========================================================================
+    def scan (self):
+        results = {}
+        lock = threading.Lock()
+
+        def probe_thread (port):
+            result = self.probe (port)
+            with lock:
+                results[port] = result
+
+        threads = [threading.Thread (target=probe_thread, args=(port,), daemon=True) for port in self.ports]
+        for thread in threads:
+            thread.start()
+
+        end_time = time.time() + self.deadline
+        for thread in threads:
+            thread.join (max ([end_time - time.time(), 0]))
+
+        self.results = []
+        with lock:
+            for port in self.ports:
+                if (port in results):
+                    self.results.append (results[port])
+                else:
+                    result = self._result (port)
+                    result['seconds'] = self.deadline
+                    result['error'] = "no answer before the deadline"
+                    self.results.append (result)
+
+        return self.results
+
+    #========================================================================
+    #  boards
+    #------------------------------------------------------------------------
+    # Return: ports where the OCD answered, from the last scan
+    #========================================================================
+    def boards (self):
+        return [result['port'] for result in self.results if result['ocd']]
+
+    #========================================================================
+    #  print_table
+    #========================================================================
+    def print_table (self):
+        print ("{0:<16} {1:<5} {2:<9} {3:<20} {4:<9} {5}".format ("port", "ocd", "firmware", "chip id", "seconds", "error"))
+
+        for result in self.results:
+            print ("{0:<16} {1:<5} {2:<9} {3:<20} {4:<9.2f} {5}".format (result['port'], \
+                "yes" if result['ocd'] else "-", result['firmware_version'] or "-", \
+                result['chip_id'] or "-", result['seconds'], result['error']))
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    baud_rate = M10_Board_Discovery.DEFAULT_BAUD_RATE
+    deadline = M10_Board_Discovery.DEFAULT_DEADLINE
+    ports = None
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hb:t:P:", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-b'):
+            baud_rate = int (arg)
+        elif opt in ('-t'):
+            deadline = float (arg)
+        elif opt in ('-P'):
+            if (ports is None):
+                ports = []
+            ports.append (arg)
+        else:
+            print ("Usage:\n  py M10_Board_Discovery.py [-P comport]... [-b baud_rate] [-t seconds]")
+            print ("  Options: \n    -P: port to probe, repeat for more (default: every serial port)")
+            print ("    -b: baud rate in bps (default " + str (M10_Board_Discovery.DEFAULT_BAUD_RATE) + ")")
+            print ("    -t: seconds for the whole scan (default " + str (M10_Board_Discovery.DEFAULT_DEADLINE) + ")")
+            print ("    -h print usage")
+            print ("\n  Exits with 1 when no board answered")
+            sys.exit(1)
+
+    discovery = M10_Board_Discovery (ports, baud_rate, deadline)
+    discovery.scan()
+    discovery.print_table()
+
+    if (len (discovery.boards()) == 0):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,865 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import os, sys, getopt, time, select, random, threading
+
+from CRC16_CCITT import CRC16_CCITT
+from FP51_Emulator import FP51_Emulator
+from ROM_Hex_Format import Intel_Hex
+from M10_high_speed_config_console import dummy_console
+
+if sys.platform.startswith ('linux'):
+    import tty, termios
+
+#############################################################################
+# M10_Board_Simulator : the M10 board at frame level, on a pseudo-terminal
+#
+# Remarks:
+#    The UART goes either to the OCD or to the CPU. The OCD side takes the
+#  frames of OCD_8051 (code memory read / write, status, pause, reset,
+#  counters, breakpoints, data memory). Once the config firmware has been
+#  loaded and the CPU runs, the CPU side takes the frames of the config
+#  firmware used by M10_high_speed_config_console (erase, erase status,
+#  flash read / write, buffer fill, chip id, protect); with a user sketch
+#  in code memory they go unanswered, as on a board. UART select frames
+#  are taken by both.
+#    Flash is modeled by sector: erase sets a sector to 0xFF and stays busy
+#  for SECTOR_ERASE_TIME, writes can only clear bits. Buffer fill goes
+#  through the ping-pong buffers in code memory at 32768: a full 2048 byte
+#  segment turns its buffer busy while it is programmed, as reported in the
+#  OCD status.
+#    Replies are held back by the wire time of the frame and reply at the
+#  baud rate set on the port, plus a fixed latency. A port set faster than
+#  max_baud_rate gets corrupted replies, as a real board would.
+#    With an FP51_Emulator, the code memory is executed: the OCD pause,
+#  reset, status, breakpoint, run pulse, counter and data memory frames go
+#  to the emulator, and while the UART is on the CPU side the bytes from
+#  the host feed its UART and its UART output goes back to the host. The
+#  config frames are still answered here, standing in for the flash
+#  controller the emulator does not have.
+#############################################################################
+
+class M10_Board_Simulator:
+
+    _SYNC = [0x5A, 0xA5, 0x01]
+
+    _HEADER_LEN = 12
+    _REPLY_LEN  = 12
+
+    # OCD frame types
+    _OCD_TYPE_WRITE_4_BYTES_WITHOUT_ACK = 0x5C
+    _OCD_TYPE_WRITE_4_BYTES_WITH_ACK    = 0x5C | 1
+    _OCD_TYPE_WRITE_128_BYTES_WITH_ACK  = 0x5B
+    _OCD_TYPE_WRITE_EXT_BYTES_WITH_ACK  = 0x57
+    _OCD_TYPE_READ_4_BYTES              = 0x6D
+    _OCD_TYPE_CPU_RESET_WITH_ACK        = 0x4B
+    _OCD_TYPE_PAUSE_ON_WITH_ACK         = 0x2D
+    _OCD_TYPE_PAUSE_OFF_WITH_ACK        = 0x3D
+    _OCD_TYPE_READ_CPU_STATUS           = 0x2F
+    _OCD_TYPE_COUNTER_CONFIG            = 0x6B
+    _OCD_TYPE_BREAK_ON_WITH_ACK         = 0x7D
+    _OCD_TYPE_BREAK_OFF_WITH_ACK        = 0x1D
+    _OCD_TYPE_RUN_PULSE_WITH_ACK        = 0x49
+    _OCD_TYPE_READ_DATA_MEM             = 0x6F
+    _OCD_TYPE_WRITE_DATA_MEM            = 0x2B
+    _TYPE_UART_SEL                      = 0x2A
+
+    # config firmware frame types
+    _CONFIG_TYPE_ACK                          = 0x34
+    _CONFIG_TYPE_FLASH_ERASE_WITHOUT_ACK      = 0x36
+    _CONFIG_TYPE_FLASH_ERASE_WITH_ACK         = 0x36 | 1
+    _CONFIG_TYPE_FLASH_ERASE_STATUS           = 0x38 | 1
+    _CONFIG_TYPE_FLASH_WRITE_PROTECT          = 0x30 | 1
+    _CONFIG_TYPE_FLASH_READ_WITH_ACK          = 0x32 | 1
+    _CONFIG_TYPE_WRITE_4_BYTES_WITHOUT_ACK    = 0x5C
+    _CONFIG_TYPE_WRITE_4_BYTES_WITH_ACK       = 0x5C | 1
+    _CONFIG_TYPE_WRITE_128_BYTES_WITH_ACK     = 0x5B
+    _CONFIG_TYPE_BUF_FILL_WITH_ACK            = 0x5E
+    _CONFIG_TYPE_READ_CHIP_ID_LSW             = 0x45
+    _CONFIG_TYPE_READ_CHIP_ID_MSW             = 0x47
+    _CONFIG_TYPE_WRITE_1_BYTE_WITHOUT_ACK     = 0x42
+    _CONFIG_TYPE_WRITE_1_BYTE_WITH_ACK        = 0x42 | 1
+
+    # flash index : (start address, size)
+    FLASH_SECTORS = {
+        1 : (0x00000, 16384),
+        2 : (0x04000, 16384),
+        3 : (0x08000, 83968),
+        4 : (0x1C800, 59392)
+    }
+
+    FLASH_SIZE    = 0x2B000
+    CODE_MEM_SIZE = 65536
+
+    # instructions run between two looks at the port
+    EMULATOR_SLICE = 2000
+
+    BUF_FILL_BUF_START_ADDR = 32768
+    BUF_FILL_SEGMENT_SIZE   = 2048
+
+    SECTOR_ERASE_TIME     = 0.35
+    FLASH_WORD_WRITE_TIME = 0.0003
+
+    CHIP_ID          = [0x01, 0x23, 0x45, 0x67, 0x89, 0xAB, 0xCD, 0xEF]
+    MCU_VERSION      = [0x00, 0x01]
+
+    _crc16_ccitt = CRC16_CCITT()
+
+    # built-in config firmware, see _config_firmware_image
+    _config_firmware_records = None
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    max_baud_rate    : replies are corrupted above this rate, None for
+    #                       any rate
+    #    latency          : seconds added to every reply (USB, firmware)
+    #    time_scale       : multiplies every delay, 0 to run flat out
+    #    ext_frames       : 0 to act as an older OCD without 1024 byte frames
+    #    error_rate       : fraction of replies sent with a bad CRC
+    #    firmware_running : 1 to start with the config firmware running
+    #    emulator         : FP51_Emulator to execute the code memory, None
+    #                       for frames only
+    #========================================================================
+    def __init__ (self, max_baud_rate=None, latency=0.001, time_scale=1.0, ext_frames=1, error_rate=0, firmware_running=0, verbose=0, emulator=None):
+        self.max_baud_rate = max_baud_rate
+        self.latency = latency
+        self.time_scale = time_scale
+        self.ext_frames = ext_frames
+        self.error_rate = error_rate
+        self.verbose = verbose
+
+        self.emulator = emulator
+
+        if (emulator is not None):
+            self.code_mem = emulator.code
+        else:
+            self.code_mem = bytearray (M10_Board_Simulator.CODE_MEM_SIZE)
+
+        self.code_loaded = firmware_running
+        self._config_firmware = None
+        if (firmware_running):
+            for record in Intel_Hex ("", 0, dummy_console._FP51_CONFIG_FIRMWARE).data_record_list:
+                self.code_mem [record.address : record.address + len (record.data_list)] = bytes (record.data_list)
+        self.paused = False
+        self.pc = 0
+        self.uart_ocd = False
+
+        self.direct_mem = bytearray (256)
+        self.indirect_mem = bytearray (256)
+
+        self.flash = bytearray (b"\xff" * M10_Board_Simulator.FLASH_SIZE)
+        self.protected = True
+        self.erase_busy_until = 0
+
+        self.fill_addr = 0
+        self.fill_segments = 0
+        self.fill_index = 0
+        self.buf_busy_until = [0, 0]
+        self.buf_taken = [False, False]
+
+        self.stats = {
+            'frames'           : 0,
+            'bytes_in'         : 0,
+            'bytes_out'        : 0,
+            'crc_errors'       : 0,
+            'ignored'          : 0,
+            'write_not_erased' : 0,
+            'write_protected'  : 0,
+            'buffer_overrun'   : 0
+        }
+
+        # termios speed constant : baud rate
+        self._speed_map = {}
+        if (sys.platform.startswith ('linux')):
+            for name in dir (termios):
+                if (name.startswith ("B") and name[1:].isdigit ()):
+                    self._speed_map [getattr (termios, name)] = int (name[1:])
+
+        self._rx_buffer = bytearray()
+        self._master = None
+        self._slave = None
+        self._link_name = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    #========================================================================
+    #  _now / _delay
+    #========================================================================
+    def _now (self):
+        return time.monotonic()
+
+    def _delay (self, seconds):
+        return seconds * self.time_scale
+
+    #========================================================================
+    #  _crc_ok
+    #========================================================================
+    def _crc_ok (self, data):
+        return (M10_Board_Simulator._crc16_ccitt.get_crc (list (data [0 : len (data) - 2])) == list (data [len (data) - 2 :]))
+
+    #========================================================================
+    #  cpu_running
+    #------------------------------------------------------------------------
+    # Remarks: the config firmware answers once code is loaded and the CPU
+    #          is not paused
+    #========================================================================
+    def cpu_running (self):
+        if (self.emulator is not None):
+            return (self.code_loaded and (not self.emulator.stalled))
+
+        return (self.code_loaded and (not self.paused))
+
+    #========================================================================
+    #  config_firmware_loaded
+    #------------------------------------------------------------------------
+    # Remarks: True if the code memory holds the built-in config firmware.
+    #          Its version bytes are left out of the compare, so another
+    #          build of it counts too. Worked out again after code writes
+    #========================================================================
+    def config_firmware_loaded (self):
+        if (self._config_firmware is None):
+            addr = dummy_console._FP51_CONFIG_FIRMWARE_VERSION_ADDR
+            code_mem = bytearray (self.code_mem)
+            code_mem [addr : addr + 2] = bytes (2)
+
+            self._config_firmware = True
+            for (address, data) in M10_Board_Simulator._config_firmware_image ():
+                if (code_mem [address : address + len (data)] != data):
+                    self._config_firmware = False
+                    break
+
+        return self._config_firmware
+
+    #========================================================================
+    #  _config_firmware_image
+    #------------------------------------------------------------------------
+    # Return: records of the built-in config firmware as (address, bytes),
+    #         version bytes zeroed
+    #========================================================================
+    @staticmethod
+    def _config_firmware_image ():
+        if (M10_Board_Simulator._config_firmware_records is None):
+            image = bytearray (M10_Board_Simulator.CODE_MEM_SIZE)
+            records = []
+            for record in Intel_Hex ("", 0, dummy_console._FP51_CONFIG_FIRMWARE).data_record_list:
+                image [record.address : record.address + len (record.data_list)] = bytes (record.data_list)
+                records.append ((record.address, len (record.data_list)))
+
+            addr = dummy_console._FP51_CONFIG_FIRMWARE_VERSION_ADDR
+            image [addr : addr + 2] = bytes (2)
+
+            M10_Board_Simulator._config_firmware_records = [(address, bytes (image [address : address + length])) for (address, length) in records]
+
+        return M10_Board_Simulator._config_firmware_records
+
+    #========================================================================
+    #  config_running
+    #------------------------------------------------------------------------
+    # Remarks: the CPU side answers config frames
+    #========================================================================
+    def config_running (self):
+        return (self.cpu_running () and self.config_firmware_loaded ())
+
+    #========================================================================
+    #  line_baud_rate
+    #------------------------------------------------------------------------
+    # Remarks: rate the host set on the port, None if not known
+    #========================================================================
+    def line_baud_rate (self):
+        if (self._master is None):
+            return None
+
+        try:
+            speed = termios.tcgetattr (self._master)[5]
+        except (OSError, termios.error):
+            return None
+
+        return self._speed_map.get (speed)
+
+    #========================================================================
+    #  _frame_len
+    #------------------------------------------------------------------------
+    # Remarks: the 128 byte frame has the same length on both sides, but
+    #          the config firmware checks one CRC over all of it
+    #========================================================================
+    def _frame_len (self, frame_type):
+        if (self.uart_ocd):
+            if (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_128_BYTES_WITH_ACK):
+                return M10_Board_Simulator._HEADER_LEN + 124 + 2
+            elif ((frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_EXT_BYTES_WITH_ACK) and self.ext_frames):
+                return M10_Board_Simulator._HEADER_LEN + 1020 + 2
+        elif (self.config_running ()):
+            if (frame_type == M10_Board_Simulator._CONFIG_TYPE_WRITE_128_BYTES_WITH_ACK):
+                return 4 + 4 + 128 + 2
+            elif ((frame_type & 0x7E) == M10_Board_Simulator._CONFIG_TYPE_WRITE_4_BYTES_WITHOUT_ACK):
+                return 4 + 4 + 4 + 2
+
+        return M10_Board_Simulator._HEADER_LEN
+
+    #========================================================================
+    #  _frame_crc_ok
+    #========================================================================
+    def _frame_crc_ok (self, frame):
+        if (self.uart_ocd and (len (frame) > M10_Board_Simulator._HEADER_LEN)):
+            return self._crc_ok (frame [0 : M10_Board_Simulator._HEADER_LEN]) and \
+                   self._crc_ok (frame [M10_Board_Simulator._HEADER_LEN :])
+
+        return self._crc_ok (frame)
+
+    #========================================================================
+    #  feed
+    #------------------------------------------------------------------------
+    # Return:
+    #    list of (frame length, reply bytes) for the complete frames in
+    #    data. Bytes outside of frames (zero fill, raw UART text) are
+    #    skipped, a frame with bad CRC is dropped without reply
+    #========================================================================
+    def feed (self, data):
+        self._rx_buffer.extend (data)
+        self.stats['bytes_in'] = self.stats['bytes_in'] + len (data)
+        sync = bytes (M10_Board_Simulator._SYNC)
+        replies = []
+
+        while (True):
+            start = self._rx_buffer.find (sync)
+            if (start < 0):
+                del self._rx_buffer [0 : max ([0, len (self._rx_buffer) - 2])]
+                break
+
+            del self._rx_buffer [0 : start]
+
+            if (len (self._rx_buffer) < 4):
+                break
+
+            frame_len = self._frame_len (self._rx_buffer[3] >> 1)
+            if (len (self._rx_buffer) < frame_len):
+                break
+
+            frame = bytes (self._rx_buffer [0 : frame_len])
+
+            if (not self._frame_crc_ok (frame)):
+                self.stats['crc_errors'] = self.stats['crc_errors'] + 1
+                del self._rx_buffer [0 : len (sync)]
+                continue
+
+            del self._rx_buffer [0 : frame_len]
+            self.stats['frames'] = self.stats['frames'] + 1
+
+            if (self.verbose):
+                print ("frame: ", [hex(i) for i in frame [0 : M10_Board_Simulator._HEADER_LEN]])
+
+            reply = self.handle_frame (frame)
+            if (reply is not None):
+                replies.append ((frame_len, reply))
+
+        return replies
+
+    #========================================================================
+    #  _reply
+    #========================================================================
+    def _reply (self, type_byte, payload):
+        reply = M10_Board_Simulator._SYNC + [type_byte] + list (payload)
+        reply = reply + M10_Board_Simulator._crc16_ccitt.get_crc (reply)
+
+        return self._line_errors (reply)
+
+    #========================================================================
+    #  _line_errors
+    #========================================================================
+    def _line_errors (self, reply):
+        line_baud_rate = self.line_baud_rate ()
+
+        if ((self.max_baud_rate is not None) and (line_baud_rate is not None) and (line_baud_rate > self.max_baud_rate)):
+            reply[len (reply) - 1] = reply[len (reply) - 1] ^ 0x5A
+        elif ((self.error_rate > 0) and (random.random () < self.error_rate)):
+            reply[len (reply) - 1] = reply[len (reply) - 1] ^ 0x5A
+
+        return bytes (reply)
+
+    #========================================================================
+    #  handle_frame
+    #========================================================================
+    def handle_frame (self, frame):
+        frame_type = frame[3] >> 1
+
+        if (frame_type == M10_Board_Simulator._TYPE_UART_SEL):
+            uart_ocd = ((frame[9] & 2) != 0)
+
+            # what follows the frame in the same read is for the CPU
+            if ((self.emulator is not None) and self.uart_ocd and (not uart_ocd)):
+                self.emulator.uart_rx.extend (self._rx_buffer)
+
+            self.uart_ocd = uart_ocd
+            return None
+
+        if (self.uart_ocd):
+            return self._handle_ocd_frame (frame_type, frame)
+        elif (self.config_running ()):
+            return self._handle_config_frame (frame_type, frame)
+
+        self.stats['ignored'] = self.stats['ignored'] + 1
+        return None
+
+    #========================================================================
+    #  _handle_ocd_frame
+    #========================================================================
+    def _handle_ocd_frame (self, frame_type, frame):
+        addr = (frame[4] << 8) + frame[5]
+        payload = [0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC]
+
+        if ((frame_type & 0x7E) == M10_Board_Simulator._OCD_TYPE_WRITE_4_BYTES_WITHOUT_ACK):
+            self._code_mem_write (addr, frame [6 : 10])
+            if (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_4_BYTES_WITHOUT_ACK):
+                return None
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_128_BYTES_WITH_ACK):
+            self._code_mem_write (addr, frame [6 : 10] + frame [12 : len (frame) - 2])
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_EXT_BYTES_WITH_ACK):
+            if (not self.ext_frames):
+                self.stats['ignored'] = self.stats['ignored'] + 1
+                return None
+            self._code_mem_write (addr, frame [6 : 10] + frame [12 : len (frame) - 2])
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_READ_4_BYTES):
+            payload = [0, 0] + list (self.code_mem [addr : addr + 4])
+        elif (self.emulator is not None):
+            return self._handle_emulator_frame (frame_type, frame)
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_CPU_RESET_WITH_ACK):
+            self.pc = 0
+            self.fill_segments = 0
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_PAUSE_ON_WITH_ACK):
+            self.paused = True
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_PAUSE_OFF_WITH_ACK):
+            self.paused = False
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_READ_CPU_STATUS):
+            status = self.cpu_status ()
+            payload = [0, int (self.paused), 0, 0, (status >> 8) & 0xFF, status & 0xFF]
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_READ_DATA_MEM):
+            if (frame[9]):
+                payload = [0, 0, 0, 0, 0, self.indirect_mem[addr & 0xFF]]
+            else:
+                payload = [0, 0, 0, 0, 0, self.direct_mem[addr & 0xFF]]
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_DATA_MEM):
+            if (frame[9]):
+                self.indirect_mem[addr & 0xFF] = frame[6]
+            else:
+                self.direct_mem[addr & 0xFF] = frame[6]
+            payload = [0, 0, 0, 0, 0, frame[6]]
+        elif (frame_type not in (M10_Board_Simulator._OCD_TYPE_COUNTER_CONFIG, \
+                                 M10_Board_Simulator._OCD_TYPE_BREAK_ON_WITH_ACK, \
+                                 M10_Board_Simulator._OCD_TYPE_BREAK_OFF_WITH_ACK, \
+                                 M10_Board_Simulator._OCD_TYPE_RUN_PULSE_WITH_ACK)):
+            self.stats['ignored'] = self.stats['ignored'] + 1
+            return None
+
+        return self._reply (frame[3], payload)
+
+    #========================================================================
+    #  _handle_emulator_frame
+    #------------------------------------------------------------------------
+    # Remarks: OCD debug frames, on the emulator
+    #========================================================================
+    def _handle_emulator_frame (self, frame_type, frame):
+        emulator = self.emulator
+        addr = (frame[4] << 8) + frame[5]
+        payload = [0x12, 0x34, 0x56, 0x78, 0x9A, 0xBC]
+
+        if (frame_type == M10_Board_Simulator._OCD_TYPE_CPU_RESET_WITH_ACK):
+            emulator.reset ()
+            emulator.stalled = self.paused
+            self.fill_segments = 0
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_PAUSE_ON_WITH_ACK):
+            self.paused = True
+            emulator.pause (1)
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_PAUSE_OFF_WITH_ACK):
+            self.paused = False
+            emulator.pause (0)
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_READ_CPU_STATUS):
+            debug = (emulator.debug_counter << 1) + int (emulator.stalled)
+            timer = emulator.timer_counter
+            status = self.cpu_status ()
+            payload = [debug >> 8, debug & 0xFF, timer >> 8, timer & 0xFF, (status >> 8) & 0xFF, status & 0xFF]
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_READ_DATA_MEM):
+            payload = [0, 0, 0, 0, 0, emulator.data_mem_read_byte (addr, frame[9])]
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_WRITE_DATA_MEM):
+            emulator.data_mem_write_byte (addr, frame[6], frame[9])
+            payload = [0, 0, 0, 0, 0, frame[6]]
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_COUNTER_CONFIG):
+            emulator.counter_config ((frame[9] >> 1) & 1, (frame[9] >> 2) & 1, (frame[9] >> 3) & 1, (frame[9] >> 4) & 1)
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_BREAK_ON_WITH_ACK):
+            emulator.set_breakpoint (addr, (frame[8] << 8) + frame[9])
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_BREAK_OFF_WITH_ACK):
+            emulator.breakpoint_off ()
+        elif (frame_type == M10_Board_Simulator._OCD_TYPE_RUN_PULSE_WITH_ACK):
+            emulator.run_pulse ()
+        else:
+            self.stats['ignored'] = self.stats['ignored'] + 1
+            return None
+
+        return self._reply (frame[3], payload)
+
+    #========================================================================
+    #  _code_mem_write
+    #------------------------------------------------------------------------
+    # Remarks: writes into the ping-pong buffers count toward buffer fill
+    #========================================================================
+    def _code_mem_write (self, addr, data):
+        self.code_mem [addr : addr + len (data)] = data
+        self.code_loaded = 1
+        self._config_firmware = None
+
+        buf_start = M10_Board_Simulator.BUF_FILL_BUF_START_ADDR
+        segment_size = M10_Board_Simulator.BUF_FILL_SEGMENT_SIZE
+
+        if ((self.fill_segments == 0) or (addr < buf_start) or (addr >= (buf_start + 2 * segment_size))):
+            return
+
+        buf = (addr - buf_start) // segment_size
+        busy = (self._now () < self.buf_busy_until[buf])
+
+        if (busy):
+            self.stats['buffer_overrun'] = self.stats['buffer_overrun'] + 1
+
+        # the firmware takes the segment once its last byte is written. A
+        # frame sent again after a bad reply does not start another one
+        if (addr == (buf_start + buf * segment_size)):
+            self.buf_taken[buf] = False
+
+        if (((addr + len (data)) >= (buf_start + (buf + 1) * segment_size)) and (not self.buf_taken[buf])):
+            self.buf_taken[buf] = True
+            self._program_segment (buf)
+
+    #========================================================================
+    #  _program_segment
+    #------------------------------------------------------------------------
+    # Remarks: segments are programmed one after the other, a buffer is
+    #          busy until its own segment is in flash
+    #========================================================================
+    def _program_segment (self, buf):
+        if (self.fill_index >= self.fill_segments):
+            return
+
+        segment_size = M10_Board_Simulator.BUF_FILL_SEGMENT_SIZE
+        buf_addr = M10_Board_Simulator.BUF_FILL_BUF_START_ADDR + buf * segment_size
+
+        self._flash_program (self.fill_addr + self.fill_index * segment_size, self.code_mem [buf_addr : buf_addr + segment_size])
+        self.fill_index = self.fill_index + 1
+
+        start = max ([self._now (), self.buf_busy_until[1 - buf]])
+        self.buf_busy_until[buf] = start + self._delay (segment_size // 4 * M10_Board_Simulator.FLASH_WORD_WRITE_TIME)
+
+    #========================================================================
+    #  cpu_status
+    #------------------------------------------------------------------------
+    # Remarks: PC field of the OCD status. During buffer fill the config
+    #          firmware shows bit 3 = filling, bit 1 / bit 0 = ping / pong
+    #          buffer busy
+    #========================================================================
+    def cpu_status (self):
+        if ((self.fill_segments == 0) or (not self.config_running ())):
+            if (self.emulator is not None):
+                return self.emulator.pc
+            return self.pc
+
+        now = self._now ()
+        status = 8
+
+        if (now < self.buf_busy_until[0]):
+            status = status | 2
+
+        if (now < self.buf_busy_until[1]):
+            status = status | 1
+
+        return status
+
+    #========================================================================
+    #  _flash_program
+    #========================================================================
+    def _flash_program (self, addr, data):
+        if (self.protected):
+            self.stats['write_protected'] = self.stats['write_protected'] + 1
+            return
+
+        for i in range (len (data)):
+            if ((addr + i) >= M10_Board_Simulator.FLASH_SIZE):
+                break
+
+            if (self.flash[addr + i] != 0xFF):
+                self.stats['write_not_erased'] = self.stats['write_not_erased'] + 1
+
+            self.flash[addr + i] = self.flash[addr + i] & data[i]
+
+    #========================================================================
+    #  _handle_config_frame
+    #========================================================================
+    def _handle_config_frame (self, frame_type, frame):
+        payload = [0, 0, 0, 0, 0, 0]
+        reply_type = M10_Board_Simulator._CONFIG_TYPE_ACK * 2
+
+        if ((frame_type & 0x7E) == M10_Board_Simulator._CONFIG_TYPE_FLASH_ERASE_WITHOUT_ACK):
+            if (frame[4] in M10_Board_Simulator.FLASH_SECTORS):
+                (start, size) = M10_Board_Simulator.FLASH_SECTORS[frame[4]]
+                self.flash [start : start + size] = b"\xff" * size
+                self.erase_busy_until = self._now () + self._delay (M10_Board_Simulator.SECTOR_ERASE_TIME)
+                self.protected = False
+            if (frame_type == M10_Board_Simulator._CONFIG_TYPE_FLASH_ERASE_WITHOUT_ACK):
+                return None
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_FLASH_ERASE_STATUS):
+            payload[5] = int (self._now () < self.erase_busy_until)
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_FLASH_WRITE_PROTECT):
+            self.protected = True
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_FLASH_READ_WITH_ACK):
+            length = (frame[4] << 8) + frame[5]
+            addr = (frame[6] << 24) + (frame[7] << 16) + (frame[8] << 8) + frame[9]
+            reply = M10_Board_Simulator._SYNC + list (self.flash [addr : addr + length])
+            reply = reply + [0xFF] * (length + len (M10_Board_Simulator._SYNC) - len (reply))
+            return self._line_errors (reply + M10_Board_Simulator._crc16_ccitt.get_crc (reply))
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_BUF_FILL_WITH_ACK):
+            self.fill_segments = (frame[4] << 8) + frame[5]
+            self.fill_addr = (frame[6] << 24) + (frame[7] << 16) + (frame[8] << 8) + frame[9]
+            self.fill_index = 0
+            self.buf_busy_until = [0, 0]
+            self.buf_taken = [False, False]
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_READ_CHIP_ID_LSW):
+            payload = M10_Board_Simulator.MCU_VERSION + M10_Board_Simulator.CHIP_ID [4 : 8]
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_READ_CHIP_ID_MSW):
+            # the version the config firmware in code memory carries
+            addr = dummy_console._FP51_CONFIG_FIRMWARE_VERSION_ADDR
+            payload = list (self.code_mem [addr : addr + 2]) + M10_Board_Simulator.CHIP_ID [0 : 4]
+        elif ((frame_type & 0x7E) == M10_Board_Simulator._CONFIG_TYPE_WRITE_1_BYTE_WITHOUT_ACK):
+            addr = (frame[4] << 24) + (frame[5] << 16) + (frame[6] << 8) + frame[7]
+            self._flash_program (addr, frame [8 : 9])
+            if (frame_type == M10_Board_Simulator._CONFIG_TYPE_WRITE_1_BYTE_WITHOUT_ACK):
+                return None
+        elif ((frame_type & 0x7E) == M10_Board_Simulator._CONFIG_TYPE_WRITE_4_BYTES_WITHOUT_ACK):
+            addr = (frame[4] << 24) + (frame[5] << 16) + (frame[6] << 8) + frame[7]
+            self._flash_program (addr, frame [8 : 12])
+            if (frame_type == M10_Board_Simulator._CONFIG_TYPE_WRITE_4_BYTES_WITHOUT_ACK):
+                return None
+        elif (frame_type == M10_Board_Simulator._CONFIG_TYPE_WRITE_128_BYTES_WITH_ACK):
+            addr = (frame[4] << 24) + (frame[5] << 16) + (frame[6] << 8) + frame[7]
+            self._flash_program (addr, frame [8 : 136])
+        else:
+            self.stats['ignored'] = self.stats['ignored'] + 1
+            return None
+
+        return self._reply (reply_type, payload)
+
+    #========================================================================
+    #  open_pty
+    #------------------------------------------------------------------------
+    # Remarks: returns the name of the port for the host side. The slave
+    #          end is kept open here as well, so the host can close and
+    #          reopen the port without the master seeing a hang-up
+    #========================================================================
+    def open_pty (self, link_name=None):
+        (self._master, self._slave) = os.openpty ()
+        tty.setraw (self._slave)
+
+        port_name = os.ttyname (self._slave)
+
+        if (link_name):
+            if (os.path.lexists (link_name)):
+                os.remove (link_name)
+            os.symlink (port_name, link_name)
+            self._link_name = link_name
+            port_name = link_name
+
+        return port_name
+
+    #========================================================================
+    #  close_pty
+    #========================================================================
+    def close_pty (self):
+        if (self._link_name):
+            try:
+                os.remove (self._link_name)
+            except OSError:
+                pass
+            self._link_name = None
+
+        for fd in (self._master, self._slave):
+            if (fd is not None):
+                os.close (fd)
+
+        self._master = None
+        self._slave = None
+
+    #========================================================================
+    #  run
+    #------------------------------------------------------------------------
+    # Remarks: serve the pty until stop() is called
+    #========================================================================
+    def run (self):
+        while (not self._stop.is_set ()):
+            timeout = 0.1
+            if ((self.emulator is not None) and self.cpu_running ()):
+                self._run_emulator ()
+                timeout = 0
+
+            (readable, writable, errors) = select.select ([self._master], [], [], timeout)
+            if (not readable):
+                continue
+
+            try:
+                data = os.read (self._master, 4096)
+            except OSError:
+                continue
+
+            if ((self.emulator is not None) and (not self.uart_ocd)):
+                self.emulator.uart_rx.extend (data)
+
+            for (frame_len, reply) in self.feed (data):
+                line_baud_rate = self.line_baud_rate ()
+                delay = self.latency
+                if (line_baud_rate):
+                    delay = delay + (frame_len + len (reply)) * 10 / line_baud_rate
+
+                if (self.time_scale > 0):
+                    time.sleep (self._delay (delay))
+
+                os.write (self._master, reply)
+                self.stats['bytes_out'] = self.stats['bytes_out'] + len (reply)
+
+    #========================================================================
+    #  _run_emulator
+    #------------------------------------------------------------------------
+    # Remarks: one slice of EMULATOR_SLICE instructions between two looks
+    #          at the port. UART output reaches the host only while the
+    #          UART is on the CPU side
+    #========================================================================
+    def _run_emulator (self):
+        self.emulator.run (max_instructions=M10_Board_Simulator.EMULATOR_SLICE)
+
+        if (len (self.emulator.uart_tx)):
+            if (not self.uart_ocd):
+                os.write (self._master, bytes (self.emulator.uart_tx))
+                self.stats['bytes_out'] = self.stats['bytes_out'] + len (self.emulator.uart_tx)
+            self.emulator.uart_tx.clear ()
+
+    #========================================================================
+    #  start / stop
+    #------------------------------------------------------------------------
+    # Remarks: serve from a thread, for tools that want a board in-process.
+    #          start() returns the port name
+    #========================================================================
+    def start (self, link_name=None):
+        port_name = self.open_pty (link_name)
+        self._stop.clear ()
+        self._thread = threading.Thread (target=self.run, daemon=True)
+        self._thread.start ()
+
+        return port_name
+
+    def stop (self):
+        self._stop.set ()
+        if (self._thread is not None):
+            self._thread.join ()
+            self._thread = None
+        self.close_pty ()
+
+    #========================================================================
+    #  print_stats
+    #========================================================================
+    def print_stats (self):
+        for key, value in self.stats.items ():
+            print ("{0:<18}: {1}".format (key, value))
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    link_name = None
+    max_baud_rate = None
+    latency = 0.001
+    time_scale = 1.0
+    ext_frames = 1
+    error_rate = 0
+    firmware_running = 0
+    verbose = 0
+    emulator = None
+
+    print ("=================================================================")
+    print ("# Copyright (c) 2017, PulseRain Technology LLC ")
+    print ("# M10 board simulator")
+    print ("=================================================================")
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hL:b:l:s:e:fnxv", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-L'):
+            link_name = arg
+        elif opt in ('-b'):
+            max_baud_rate = int (arg)
+        elif opt in ('-l'):
+            latency = float (arg) / 1000
+        elif opt in ('-s'):
+            time_scale = float (arg)
+        elif opt in ('-e'):
+            error_rate = float (arg)
+        elif opt in ('-f'):
+            firmware_running = 1
+        elif opt in ('-n'):
+            ext_frames = 0
+        elif opt in ('-x'):
+            emulator = FP51_Emulator ()
+        elif opt in ('-v'):
+            verbose = 1
+        else:
+            print ("Usage:\n  py M10_Board_Simulator.py [-L link] [-b max_baud_rate] [-l latency_ms] [-s time_scale] [-e error_rate] [-f] [-n] [-x] [-v]")
+            print ("  Options: \n    -L: symlink to create for the port, such as /tmp/ttyM10")
+            print ("    -b: fastest baud rate the board keeps up with, replies are corrupted above it")
+            print ("    -l: latency added to every reply, in ms (default 1)")
+            print ("    -s: scale for erase / program / wire time, 0 to run flat out")
+            print ("    -e: fraction of replies sent with bad CRC")
+            print ("    -f: config firmware already running")
+            print ("    -n: OCD without 1024 byte frames (FP51 upload only, buffer fill needs them)")
+            print ("    -x: execute the code memory on the FP51 emulator")
+            print ("    -v: print every frame\n    -h print usage")
+            print ("\n  Example: py M10_Board_Simulator.py -L /tmp/ttyM10 -b 921600")
+            print ("           py M10_high_speed_config_console.py -P /tmp/ttyM10 --UFM=image.hex")
+            sys.exit(1)
+
+    if (not sys.platform.startswith ('linux')):
+        print ("The board simulator needs a Linux pty")
+        sys.exit(1)
+
+    simulator = M10_Board_Simulator (max_baud_rate, latency, time_scale, ext_frames, error_rate, firmware_running, verbose, emulator)
+    port_name = simulator.open_pty (link_name)
+
+    print ("Serving on ", port_name, ", Ctrl-C to quit")
+
+    try:
+        simulator.run ()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close_pty ()
+
+    print ("")
+    simulator.print_stats ()
+
+if __name__ == "__main__":
+    main()
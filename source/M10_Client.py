@@ -0,0 +1,187 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+# kept to the standard library on purpose: this runs once per upload, and
+# its start up is what the daemon saves
+import sys, os, json, time, socket, tempfile, subprocess
+
+#############################################################################
+# M10 daemon client
+#
+# Remarks:
+#    py M10_Client.py fp51   [flags of FP51_upload.py]
+#    py M10_Client.py config [flags of M10_high_speed_config_console.py]
+#    py M10_Client.py release [-P port] | status | stop
+#
+#    The job is handed to M10_Daemon.py over a Unix domain socket, and its
+#  output is printed as it comes. A daemon that is not running is started
+#  in the background; where that fails (or there are no Unix domain
+#  sockets, such as Windows) the tool itself is run, same flags.
+#    The socket is M10_DAEMON_SOCKET if set, see socket_path().
+#############################################################################
+
+# tool names of the client and the scripts run without a daemon
+TOOLS = {
+    'fp51'   : "FP51_upload.py",
+    'config' : "M10_high_speed_config_console.py"
+}
+
+COMMANDS = ("release", "status", "stop")
+
+# seconds for a daemon started here to take connections
+DAEMON_START_TIME_OUT = 5.0
+
+#============================================================================
+#  socket_path
+#============================================================================
+def socket_path ():
+    path = os.environ.get ("M10_DAEMON_SOCKET")
+    if (path):
+        return path
+
+    if (hasattr (os, "getuid")):
+        user = str (os.getuid())
+    else:
+        user = "user"
+
+    return os.path.join (tempfile.gettempdir(), "M10_daemon_" + user + ".sock")
+
+#============================================================================
+#  connect
+#----------------------------------------------------------------------------
+# Return: connected socket, or None
+#============================================================================
+def connect (path):
+    if (not hasattr (socket, "AF_UNIX")):
+        return None
+
+    sock = socket.socket (socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect (path)
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+#============================================================================
+#  start_daemon
+#----------------------------------------------------------------------------
+# Return: connected socket, or None if the daemon did not come up in time
+#============================================================================
+def start_daemon (path):
+    if (not hasattr (socket, "AF_UNIX")):
+        return None
+
+    daemon = os.path.join (os.path.dirname (os.path.abspath (__file__)), "M10_Daemon.py")
+
+    try:
+        subprocess.Popen ([sys.executable, daemon, "-S", path], stdin=subprocess.DEVNULL, \
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    except OSError:
+        return None
+
+    end_time = time.time() + DAEMON_START_TIME_OUT
+    while (time.time() < end_time):
+        sock = connect (path)
+        if (sock is not None):
+            return sock
+        time.sleep (0.05)
+
+    return None
+
+#============================================================================
+#  run_tool
+#----------------------------------------------------------------------------
+# Remarks: no daemon, the tool itself with the same flags
+#============================================================================
+def run_tool (tool, argv):
+    script = os.path.join (os.path.dirname (os.path.abspath (__file__)), TOOLS[tool])
+    return subprocess.call ([sys.executable, script] + argv)
+
+#============================================================================
+#  run_job
+#----------------------------------------------------------------------------
+# Remarks: output of the job printed as it comes, until the exit code
+# Return: exit code of the job, None if the daemon handed it back
+#============================================================================
+def run_job (sock, tool, argv):
+    request = {'tool' : tool, 'argv' : argv, 'cwd' : os.getcwd()}
+    sock.sendall ((json.dumps (request) + "\n").encode())
+
+    exit_code = 1
+    with sock.makefile ('r', encoding='utf-8') as replies:
+        for line in replies:
+            reply = json.loads (line)
+
+            if ('out' in reply):
+                sys.stdout.write (reply['out'])
+                sys.stdout.flush()
+            elif ('exit' in reply):
+                exit_code = reply['exit']
+                break
+            elif ('fallback' in reply):
+                exit_code = None
+                break
+
+    sock.close()
+    return exit_code
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+    if ((len (sys.argv) < 2) or ((sys.argv[1] not in TOOLS) and (sys.argv[1] not in COMMANDS))):
+        print ("Usage:\n  py M10_Client.py fp51   [flags of FP51_upload.py]")
+        print ("  py M10_Client.py config [flags of M10_high_speed_config_console.py]")
+        print ("  py M10_Client.py release [-P comport]   close the port(s) held by the daemon")
+        print ("  py M10_Client.py status | stop")
+        print ("\n  Socket: " + socket_path() + " (M10_DAEMON_SOCKET to change)")
+        print ("\n  Example: upload a sketch through the daemon")
+        print ("           py M10_Client.py fp51 -P COM7 -b 115200 -U sketch.eep")
+        sys.exit(1)
+
+    tool = sys.argv[1]
+    argv = sys.argv[2:]
+    path = socket_path()
+
+    sock = connect (path)
+
+    if ((sock is None) and (tool in TOOLS)):
+        sock = start_daemon (path)
+        if (sock is None):
+            sys.exit (run_tool (tool, argv))
+
+    if (sock is None):
+        print ("No daemon on " + path)
+        sys.exit(1)
+
+    try:
+        exit_code = run_job (sock, tool, argv)
+    except KeyboardInterrupt:
+        # the daemon sees the socket closed and cancels the job
+        sock.close()
+        exit_code = 1
+
+    if (exit_code is None):
+        exit_code = run_tool (tool, argv)
+
+    sys.exit (exit_code)
+
+if __name__ == "__main__":
+    main()
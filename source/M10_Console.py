@@ -20,14 +20,18 @@
 
 
 import sys
+import atexit
 import signal
 import traceback
-import msvcrt
 import math
 
 from OCD_8051 import OCD_8051
+from Link_Bench import Link_Bench
+from Run_Profiler import Run_Profiler
+from Code_Image_Cache import Code_Image_Cache
 from ROM_Hex_Format import *
 from OCD_Input import OCD_Input
+from Raw_UART_Bridge import Raw_UART_Bridge
 from time import sleep
 
 #############################################################################
@@ -123,36 +127,10 @@ class M10_Console:
     #  _write_code
     #========================================================================
     def _write_code (self, addr, data):
-        offset = 0
-        length = len (data)
-        addr_end = addr + length
-        
-        if (addr % 4):
-            for i in range (min([(4 - (addr % 4)), length])):
-                self._ocd.code_mem_write_byte (addr + offset, data[i])
-                offset = offset + 1
-        
-        total_words = (addr_end - addr - offset) // 4
-        total_128byte_frame = total_words //32
-        
-        for i in range (total_128byte_frame):
-            self._ocd.code_mem_write_128byte (addr + offset, data[offset : offset + 128])
-            offset = offset + 128
-            
-        
-        for i in range (total_words - total_128byte_frame * 32):
-            data_int = (data[offset] << 24) + \
-                       (data[offset + 1] << 16) + \
-                       (data[offset + 2] << 8) + \
-                       (data[offset + 3])
-            
-            ##print ("write32bit addr = ", addr + offset, "data_int=", hex(data_int))            
-            self._ocd.code_mem_write_32bit(addr + offset, data_int)
-            offset = offset + 4
-        
-        for i in range (length - offset):
-            self._ocd.code_mem_write_byte (addr + offset, data [offset])
-            offset = offset + 1
+        # the image FP51_upload cached for the port no longer holds
+        Code_Image_Cache (self._ocd._serial.port).invalidate()
+        self._ocd.code_mem_write (addr, data)
+        self._ocd.code_mem_flush ()
 
     #========================================================================
     #  _read_code
@@ -566,6 +544,52 @@ class M10_Console:
 # static variables
 #############################################################################
     
+    #========================================================================
+    #  _do_bench
+    #------------------------------------------------------------------------
+    #  Remarks: the write tests put back the code memory content found at
+    #           address 0, with the CPU paused so it does not run the code
+    #           while it is rewritten. Flash reads need the config firmware,
+    #           so code memory reads are measured instead
+    #========================================================================
+    def _do_bench (self):
+        count = Link_Bench.DEFAULT_COUNT
+        file_name = ""
+        
+        if (len(self._args) > 1):
+            try:
+                count = self._string_to_data (self._args[1])
+            except ValueError:
+                file_name = self._args[1]
+                
+        if (len(self._args) > 2):
+            file_name = self._args[2]
+        
+        self._ocd.code_mem_flush()
+        
+        self._ocd.read_cpu_status()
+        paused = self._ocd.debug_stall_flag
+        self._ocd.cpu_pause (1)
+        
+        bench = Link_Bench (self._ocd._serial, count)
+        
+        try:
+            if (self._ocd._ext_frame_support is None):
+                # probed the way an upload does, with what is there already
+                data = bench.read_code (0, 1024)
+                if (data is not None):
+                    self._ocd.code_mem_probe_ext (0, data)
+            
+            bench.run_ocd_tests (0, self._ocd.code_mem_frame_sizes())
+        finally:
+            if (not paused):
+                self._ocd.cpu_pause (0)
+        
+        bench.print_table()
+        
+        if (file_name):
+            bench.save_json (file_name)
+    
     _OCD_CONSOLE_PROMPT = "\n>> "
     
     def _do_help (self):
@@ -617,6 +641,7 @@ class M10_Console:
         'write_indirect_data'  : (_do_write_data_indirect,"addr data_list", "write indirectly mapped data memory"),
         'disassemble'          : (_do_disassemble,        "addr length",    "dis-assemble code memory"),
         'uart_switch'          : (_do_uart_switch,        "uart_switch",    "toggle uart between OCD and CPU core"),
+        'bench'                : (_do_bench,              "[count] [json_file]", "measure link latency, throughput and retries"),
         'exit'                 : (_dummy_exit,            " ", "exit console")
     }
     
@@ -629,8 +654,12 @@ class M10_Console:
 
     #========================================================================
     #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    pty : "" for no pty, None for a pty, or the path of a symlink to it
+    #          (see Raw_UART_Bridge)
     #========================================================================
-    def __init__ (self, ocd):
+    def __init__ (self, ocd, pty=""):
         self._ocd = ocd
         if (ocd._serial.in_waiting):
             r = ocd._serial.read (ocd._serial.in_waiting) # clear the uart receive buffer 
@@ -639,6 +668,11 @@ class M10_Console:
         self._stdin = OCD_Input(">> ", M10_Console._OCD_CONSOLE_CMD.keys())
         self._stdin.uart_raw_mode_enable = 0
         self._do_uart_select()
+        
+        self._bridge = Raw_UART_Bridge (ocd._serial)
+        if (pty != ""):
+            if (self._bridge.open_pty (pty)):
+                print (" Target UART on " + self._bridge.pty_name + " in UART Raw Mode")
 
     #========================================================================
     #  _execute_cmd
@@ -674,41 +708,25 @@ class M10_Console:
     #########################################################################
     def run (self):
         while(1):
+            if (self._stdin.uart_raw_mode_enable):
+                # until ctrl-d, then back to the debug console
+                self._bridge.run()
+                self._line_handle ("uart_switch")
+                self._ocd._serial.reset_input_buffer()
+                continue
+            
             try:
                 line = self._stdin.input()
                 if (line == "exit"):
                     print ("\nGoodbye!!!")
+                    self._bridge.close()
                     return
             except Exception:
-                if (self._stdin.uart_raw_mode_enable == 0):
-                    print ("type \"exit\" to end console session \n", end="");
-
-            if (self._stdin.uart_raw_mode_enable):
-                
-                if (line == "uart_switch"):
-                    self._line_handle (line)
-                    self._ocd._serial.reset_input_buffer()
-                    
-                elif (len(line)):
-                    print (line, end="")
-                    sys.stdout.flush()
-                    serial_out = [ord(i) for i in line]
-                    self._ocd._serial.write(serial_out)
-                
-                # read data out from COM port
-                if (self._ocd._serial.in_waiting):
-                    r = self._ocd._serial.read (self._ocd._serial.in_waiting)  
-                    
-                    prt_out = ""
-                    for i in r:
-                        if (i < 128):
-                            prt_out = prt_out + chr(i) 
-                    print (prt_out, end="")
-                    sys.stdout.flush()
-     
-            else:
-                self._ocd._serial.reset_input_buffer()
-                self._line_handle (line)
+                print ("type \"exit\" to end console session \n", end="");
+                continue
+            
+            self._ocd._serial.reset_input_buffer()
+            self._line_handle (line)
             
 #==============================================================================
 # main            
@@ -717,17 +735,41 @@ class M10_Console:
 def main():
 
     com_port = "COM4"
-    if (len(sys.argv) > 1):
-        com_port = sys.argv[1]
+    bench_file = None
+    profile_file = None
+    pty = ""
+    
+    for arg in sys.argv[1:]:
+        if (arg.startswith ("--bench=")):
+            bench_file = arg[len ("--bench="):]
+        elif (arg.startswith ("--profile=")):
+            profile_file = arg[len ("--profile="):]
+        elif (arg == "--pty"):
+            pty = None
+        elif (arg.startswith ("--pty=")):
+            pty = arg[len ("--pty="):]
+        else:
+            com_port = arg
     
     try:
         ocd = OCD_8051 (com_port, 115200, verbose=0)
     except:
         print ("Failed to open COM port")
         sys.exit(1)
+    
+    if (profile_file is not None):
+        # the console may leave through sys.exit()
+        profiler = Run_Profiler (ocd._serial)
+        atexit.register (profiler.finish, profile_file)
+        profiler.start()
         
-    console = M10_Console(ocd)
-    console.run()
+    console = M10_Console(ocd, pty)
+    
+    if (bench_file is not None):
+        console._args = ["bench", bench_file]
+        console._do_bench()
+    else:
+        console.run()
     
     
 if __name__ == "__main__":
@@ -0,0 +1,588 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, os, json, time, getopt, socket, socketserver, threading
+
+import serial
+
+from OCD_8051 import OCD_8051
+from M10_high_speed_config_console import dummy_console
+from M10_Program_Session import M10_Program_Session
+from Code_Image_Cache import Code_Image_Cache
+from Progress_Bus import Progress_Bus, Terminal_Progress, Json_Progress, Null_Progress
+from M10_Client import socket_path
+
+#############################################################################
+# M10_Daemon : programming daemon, ports kept open between jobs
+#
+# Remarks:
+#    Jobs come from M10_Client.py over a Unix domain socket: one JSON line
+#  {tool, argv, cwd} in, JSON lines {out} with the output of the job and a
+#  last {exit} back. argv takes the flags of FP51_upload.py (tool fp51) or
+#  of M10_high_speed_config_console.py (tool config).
+#    Every port keeps what the last job left open: the OCD_8051 of an FP51
+#  upload, or the M10_Program_Session of a CFM / UFM load with its config
+#  firmware running. The next job on the port skips the port open, and a
+#  config job also the firmware upload and chip ID. A port not used for
+#  KEEP_OPEN seconds is closed, so a serial monitor can have it.
+#    Jobs on one port run one after the other, jobs on different ports at
+#  the same time. A client that goes away cancels its job through the
+#  progress bus. A job the daemon does not serve (interactive console,
+#  --bench and such) is handed back with {fallback}, the client then runs
+#  the tool itself.
+#############################################################################
+
+class M10_Daemon:
+
+    # seconds a port stays open without a job
+    KEEP_OPEN = 300
+
+    CONFIG_VERSION = "2.1"
+
+    #========================================================================
+    #  __init__
+    #========================================================================
+    def __init__ (self, path=None, keep_open=KEEP_OPEN):
+        if (path is None):
+            path = socket_path()
+
+        self.path = path
+        self.keep_open = keep_open
+
+        # port : {lock, ocd, session, baud_rate, last_used, jobs}
+        self._ports = {}
+        self._lock = threading.Lock()
+
+        self._server = None
+        self._stdout = _Thread_Stdout (sys.stdout)
+
+    #========================================================================
+    #  _entry
+    #========================================================================
+    def _entry (self, port):
+        with self._lock:
+            if (port not in self._ports):
+                self._ports[port] = {
+                    'lock'      : threading.Lock(),
+                    'ocd'       : None,
+                    'session'   : None,
+                    'baud_rate' : None,
+                    'last_used' : time.time(),
+                    'jobs'      : 0
+                }
+
+            return self._ports[port]
+
+    #========================================================================
+    #  _close_entry
+    #------------------------------------------------------------------------
+    # Remarks: with the lock of the entry held
+    #========================================================================
+    def _close_entry (self, entry):
+        if (entry['ocd'] is not None):
+            try:
+                entry['ocd']._serial.close()
+            except:
+                pass
+            entry['ocd'] = None
+
+        if (entry['session'] is not None):
+            entry['session'].close()
+            entry['session'] = None
+
+    #========================================================================
+    #  release
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    port : None for every port
+    # Return: ports closed
+    #========================================================================
+    def release (self, port=None):
+        with self._lock:
+            if (port is None):
+                entries = list (self._ports.items())
+            else:
+                entries = [(port, self._ports[port])] if (port in self._ports) else []
+
+        released = []
+        for (name, entry) in entries:
+            with entry['lock']:
+                if ((entry['ocd'] is not None) or (entry['session'] is not None)):
+                    released.append (name)
+                self._close_entry (entry)
+
+        return released
+
+    #========================================================================
+    #  _reaper
+    #------------------------------------------------------------------------
+    # Remarks: closes the ports idle for keep_open seconds
+    #========================================================================
+    def _reaper (self):
+        while True:
+            time.sleep (1)
+
+            with self._lock:
+                entries = list (self._ports.values())
+
+            for entry in entries:
+                if ((time.time() - entry['last_used']) < self.keep_open):
+                    continue
+
+                if (entry['lock'].acquire (blocking=False)):
+                    self._close_entry (entry)
+                    entry['lock'].release()
+
+    #========================================================================
+    #  _progress
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    progress : value of --progress, None for the terminal of the client
+    # Return: Progress_Bus, or None if the file can not be opened
+    #========================================================================
+    def _progress (self, progress):
+        if (progress is None):
+            return Progress_Bus (Terminal_Progress())
+        elif (progress == "none"):
+            return Progress_Bus (Null_Progress())
+
+        try:
+            return Progress_Bus (Json_Progress (progress))
+        except IOError:
+            print ("Fail to open: ", progress)
+            return None
+
+    #========================================================================
+    #  fp51_job
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    argv : flags of FP51_upload.py, paths relative to cwd
+    # Return: exit code, None to hand the job back to the client
+    #========================================================================
+    def fp51_job (self, argv, cwd, output):
+        baud_rate = 115200
+        com_port = "COM4"
+        image_file = "sketch.eep"
+        full_write = 0
+        cache_dir = None
+
+        try:
+            opts, args = getopt.getopt (argv, "vDp:c:P:C:I:o:b:U:", ["profile=", "full", "cache-dir=", "watch"])
+        except getopt.GetoptError as err:
+            print (str(err))
+            return 2
+
+        for opt, arg in opts:
+            if opt in ('-b'):
+                baud_rate = int (arg)
+            elif opt in ('-P'):
+                com_port = arg
+            elif opt in ('-U'):
+                image_file = arg
+            elif opt in ('--profile', '--watch'):
+                # --watch runs until Ctrl-C, it keeps the port to itself
+                return None
+            elif opt in ('--full'):
+                full_write = 1
+            elif opt in ('--cache-dir'):
+                cache_dir = os.path.join (cwd, arg)
+
+        image_file = os.path.join (cwd, image_file)
+
+        print ("===============================================================================")
+        print ("# Copyright (c) 2016, PulseRain Technology LLC ")
+        print ("# FP51 Code Upload Utility, Version 1.0 (daemon)")
+
+        print ("===============================================================================")
+        print ("baud_rate  = ", baud_rate)
+        print ("com_port   = ", com_port)
+        print ("image file = ", image_file)
+        print ("===============================================================================")
+
+        progress = self._progress (None)
+        output.progress = progress
+
+        entry = self._entry (com_port)
+        with entry['lock']:
+            entry['jobs'] = entry['jobs'] + 1
+
+            if (entry['session'] is not None):
+                # the port was left to a config session
+                self._close_entry (entry)
+
+            # a port kept open may be stale (board unplugged), one more try
+            # on a fresh open
+            for attempt in range (2):
+                try:
+                    if (entry['ocd'] is None):
+                        entry['ocd'] = OCD_8051 (com_port, baud_rate, verbose=0)
+                    elif (entry['ocd']._serial.baudrate != baud_rate):
+                        entry['ocd']._serial.baudrate = baud_rate
+                    else:
+                        print ("Port kept open, reused")
+                except (serial.SerialException, OSError):
+                    print ("Failed to open COM port")
+                    return 1
+
+                try:
+                    console = dummy_console (entry['ocd'], progress=progress)
+                    console.image_cache = Code_Image_Cache (com_port, cache_dir)
+                    if (full_write):
+                        console.image_cache.invalidate()
+                    console._args = ["load_hex_and_switch", image_file]
+                    console._do_load_hex_and_switch ()
+                    break
+                except (serial.SerialException, OSError):
+                    self._close_entry (entry)
+                    if (attempt):
+                        raise
+
+            entry['last_used'] = time.time()
+
+        return 0
+
+    #========================================================================
+    #  config_job
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    argv : flags of M10_high_speed_config_console.py, paths relative to
+    #           cwd. Only image loads are served here
+    # Return: exit code, None to hand the job back to the client
+    #========================================================================
+    def config_job (self, argv, cwd, output):
+        baud_rate = "921600"
+        com_port = "COM5"
+        image_file = ""
+        cfm_image = ""
+        ufm_image = ""
+        telemetry_file = None
+        progress_arg = None
+
+        try:
+            opts, args = getopt.getopt (argv, "hP:b:U:a", ["CFM=", "UFM=", "bench=", "telemetry=", \
+                "prometheus=", "trace=", "profile=", "progress="])
+        except getopt.GetoptError as err:
+            print (str(err))
+            return 1
+
+        for opt, arg in opts:
+            if opt in ('-b'):
+                baud_rate = str (int (arg))
+            elif opt in ('-P'):
+                com_port = arg
+            elif opt in ('-U'):
+                image_file = os.path.join (cwd, arg)
+            elif opt in ('-a'):
+                baud_rate = "Auto"
+            elif opt in ('--CFM'):
+                cfm_image = os.path.join (cwd, arg)
+            elif opt in ('--UFM'):
+                ufm_image = os.path.join (cwd, arg)
+            elif opt in ('--telemetry'):
+                telemetry_file = os.path.join (cwd, arg)
+            elif opt in ('--progress'):
+                if (arg == "none"):
+                    progress_arg = arg
+                else:
+                    progress_arg = os.path.join (cwd, arg)
+            else:
+                # -h, the interactive console and the one-off runs
+                return None
+
+        if ((cfm_image == "") and (ufm_image == "")):
+            return None
+
+        print ("===============================================================================")
+        print ("# Copyright (c) 2017, PulseRain Technology LLC ")
+        print ("# M10 high speed Configuration Utility, Version " + M10_Daemon.CONFIG_VERSION + " (daemon)")
+
+        progress = self._progress (progress_arg)
+        if (progress is None):
+            return 1
+        output.progress = progress
+
+        try:
+            entry = self._entry (com_port)
+            with entry['lock']:
+                entry['jobs'] = entry['jobs'] + 1
+
+                if (entry['ocd'] is not None):
+                    # the port was left to an FP51 upload, config firmware is gone
+                    self._close_entry (entry)
+
+                session = entry['session']
+                if (session is None):
+                    session = M10_Program_Session (progress, print, None, M10_Daemon.CONFIG_VERSION)
+                    entry['session'] = session
+                else:
+                    print ("Session kept open, reused")
+
+                session.progress = progress
+                if (session.M10_high_speed_config_console):
+                    session.M10_high_speed_config_console.progress = progress
+
+                if (entry['baud_rate'] != baud_rate):
+                    session.need_reinit = True
+                entry['baud_rate'] = baud_rate
+
+                loaded = True
+                for (flash_type, file_name) in (("CFM", cfm_image), ("UFM", ufm_image)):
+                    if (loaded and file_name):
+                        loaded = session.program (com_port, baud_rate, file_name, flash_type, 0, image_file)
+
+                        if (telemetry_file):
+                            session.telemetry.write_json_line (telemetry_file)
+
+                if (session.need_reinit):
+                    # failed, the port is not kept
+                    self._close_entry (entry)
+
+                entry['last_used'] = time.time()
+
+            if (loaded):
+                return 0
+            else:
+                return 1
+        finally:
+            # a --progress file is opened per job
+            if (hasattr (progress.renderer, "close")):
+                progress.renderer.close()
+
+    #========================================================================
+    #  status_job
+    #========================================================================
+    def status_job (self):
+        print ("{0:<16} {1:<8} {2:<9} {3:<6} {4}".format ("port", "open", "baud", "jobs", "idle"))
+
+        with self._lock:
+            entries = list (self._ports.items())
+
+        for (port, entry) in entries:
+            if (entry['session'] is not None):
+                state = "config"
+            elif (entry['ocd'] is not None):
+                state = "fp51"
+            else:
+                state = "-"
+
+            print ("{0:<16} {1:<8} {2:<9} {3:<6} {4:0.0f}s".format (port, state, str (entry['baud_rate'] or "-"), \
+                entry['jobs'], time.time() - entry['last_used']))
+
+        return 0
+
+    #========================================================================
+    #  handle
+    #------------------------------------------------------------------------
+    # Remarks: one connection, one job. Output of the job thread goes to
+    #          the client through _Thread_Stdout
+    #========================================================================
+    def handle (self, rfile, sock):
+        try:
+            request = json.loads (rfile.readline().decode ('utf-8'))
+        except ValueError:
+            return
+
+        output = _Job_Output (sock)
+        self._stdout.attach (output)
+
+        tool = request.get ('tool')
+        argv = request.get ('argv', [])
+        cwd = request.get ('cwd', os.getcwd())
+
+        start_time = time.time()
+        try:
+            if (tool == 'fp51'):
+                exit_code = self.fp51_job (argv, cwd, output)
+            elif (tool == 'config'):
+                exit_code = self.config_job (argv, cwd, output)
+            elif (tool == 'release'):
+                port = None
+                if ((len (argv) == 2) and (argv[0] == "-P")):
+                    port = argv[1]
+                print ("Released: ", " ".join (self.release (port)))
+                exit_code = 0
+            elif (tool == 'status'):
+                exit_code = self.status_job()
+            elif (tool == 'stop'):
+                print ("Daemon stopped")
+                exit_code = 0
+            else:
+                print ("Unknown tool: ", tool)
+                exit_code = 1
+        except Exception as err:
+            print ("\nFailed: ", repr (err))
+            exit_code = 1
+        finally:
+            self._stdout.detach()
+
+        if (exit_code is None):
+            # not served here, the ports are let go for the tool
+            self.release()
+            output.send ({'fallback' : True})
+        else:
+            output.send ({'exit' : exit_code})
+
+        sys.stdout.write ("{0} {1} {2} {3:0.2f}s\n".format (time.strftime ("%H:%M:%S"), tool, exit_code, \
+            time.time() - start_time))
+        sys.stdout.flush()
+
+        if (tool == 'stop'):
+            threading.Thread (target=self._server.shutdown, daemon=True).start()
+
+    #========================================================================
+    #  serve
+    #========================================================================
+    def serve (self):
+        if (not hasattr (socket, "AF_UNIX")):
+            print ("No Unix domain sockets here, run the tools directly")
+            return False
+
+        if (os.path.exists (self.path)):
+            probe = socket.socket (socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect (self.path)
+                probe.close()
+                print ("Daemon already running on " + self.path)
+                return False
+            except OSError:
+                # left over from a daemon that is gone
+                os.unlink (self.path)
+
+        daemon = self
+
+        class handler (socketserver.StreamRequestHandler):
+            def handle (self):
+                daemon.handle (self.rfile, self.request)
+
+        self._server = socketserver.ThreadingUnixStreamServer (self.path, handler)
+        self._server.daemon_threads = True
+        os.chmod (self.path, 0o600)
+
+        sys.stdout = self._stdout
+        threading.Thread (target=self._reaper, daemon=True).start()
+
+        print ("M10 daemon on " + self.path)
+        sys.stdout.flush()
+
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.release()
+            os.unlink (self.path)
+            sys.stdout = self._stdout.default
+
+        return True
+
+
+#############################################################################
+# _Job_Output : what a job prints, sent to its client as JSON lines
+#
+# Remarks:
+#    A client gone away cancels the progress bus of the job, which stops
+#  it at its next chunk.
+#############################################################################
+
+class _Job_Output:
+
+    def __init__ (self, sock):
+        self._sock = sock
+        self.progress = None
+        self.closed = False
+
+    def send (self, reply):
+        if (self.closed):
+            return
+
+        try:
+            self._sock.sendall ((json.dumps (reply) + "\n").encode ('utf-8'))
+        except OSError:
+            self.closed = True
+            if (self.progress is not None):
+                self.progress.cancel()
+
+    def write (self, text):
+        self.send ({'out' : text})
+        return len (text)
+
+    def flush (self):
+        pass
+
+
+#############################################################################
+# _Thread_Stdout : sys.stdout of the daemon, by thread
+#
+# Remarks:
+#    The job threads print as the tools do; each thread's output goes to
+#  the stream it attached, everything else to the daemon's own stdout.
+#############################################################################
+
+class _Thread_Stdout:
+
+    def __init__ (self, default):
+        self.default = default
+        self._streams = {}
+
+    def attach (self, stream):
+        self._streams[threading.get_ident()] = stream
+
+    def detach (self):
+        self._streams.pop (threading.get_ident(), None)
+
+    def write (self, text):
+        return self._streams.get (threading.get_ident(), self.default).write (text)
+
+    def flush (self):
+        self._streams.get (threading.get_ident(), self.default).flush()
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    path = None
+    keep_open = M10_Daemon.KEEP_OPEN
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hS:k:", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-S'):
+            path = arg
+        elif opt in ('-k'):
+            keep_open = float (arg)
+        else:
+            print ("Usage:\n  py M10_Daemon.py [-S socket] [-k seconds]")
+            print ("  Options: \n    -S: Unix domain socket (default " + socket_path() + ")")
+            print ("    -k: seconds a port stays open without a job (default " + str (M10_Daemon.KEEP_OPEN) + ")")
+            print ("    -h print usage")
+            print ("\n  Jobs are sent with M10_Client.py, which also starts the daemon when needed")
+            sys.exit(1)
+
+    if (not M10_Daemon (path, keep_open).serve()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, os, io, json, time, getopt, queue, contextlib, hashlib
+import multiprocessing
+from multiprocessing import shared_memory
+
+from M10_Board_Discovery import M10_Board_Discovery
+from M10_Program_Session import M10_Program_Session
+from M10_high_speed_config_console import Mustang_Console
+from Program_Telemetry import Program_Telemetry
+from Progress_Bus import Progress_Bus, Null_Progress
+
+#############################################################################
+# M10_Program_Many : program-many, one job on many boards at once
+#
+# Remarks:
+#    The CFM / UFM files are turned into the bytes to write once, in this
+#  process, and handed to the boards through multiprocessing.shared_memory.
+#  Each board then runs in a process of its own (FP51 upload, chip ID,
+#  erase and buffer fill), at most `workers` of them at a time. A board
+#  that does not finish within `timeout` is stopped and marked as such,
+#  the others carry on.
+#    Every board gets a result dict of port, status (pass / fail /
+#  timeout), chip_id, firmware_version, seconds, error and the per phase
+#  numbers of Program_Telemetry.
+#############################################################################
+
+class M10_Program_Many:
+
+    DEFAULT_TIMEOUT = 300
+    DEFAULT_BAUD_RATE = 921600
+
+    # seconds between checks of the board processes
+    _POLL_INTERVAL = 0.2
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    ports      : serial ports, the ports with a board on if empty
+    #    image_file : FP51 image in place of the built-in config firmware
+    #    cfm_file, ufm_file : flash images, either may be empty
+    #    workers    : boards programmed at the same time, 0 for all
+    #    log_dir    : directory for one console log per board, or None
+    #========================================================================
+    def __init__ (self, ports, baud_rate=DEFAULT_BAUD_RATE, image_file="", cfm_file="", ufm_file="", \
+                  workers=0, timeout=DEFAULT_TIMEOUT, log_dir=None):
+        if (len (ports) == 0):
+            ports = self.discover_ports (baud_rate)
+
+        self.ports = ports
+        self.baud_rate = baud_rate
+        self.image_file = image_file
+        self.cfm_file = cfm_file
+        self.ufm_file = ufm_file
+        self.timeout = timeout
+        self.log_dir = log_dir
+
+        if (workers <= 0):
+            workers = max ([len (ports), 1])
+        self.workers = workers
+
+        self.results = []
+        self._shared = []
+
+    #========================================================================
+    #  discover_ports
+    #------------------------------------------------------------------------
+    # Remarks: every serial port is probed at once, see M10_Board_Discovery
+    #========================================================================
+    @staticmethod
+    def discover_ports (baud_rate=DEFAULT_BAUD_RATE):
+        discovery = M10_Board_Discovery (None, baud_rate)
+        discovery.scan()
+        return discovery.boards()
+
+    #========================================================================
+    #  build_images
+    #------------------------------------------------------------------------
+    # Return: False if a file can not be turned into an image
+    #========================================================================
+    def build_images (self):
+        builder = Mustang_Console (None)
+
+        for (flash, file_name) in (("cfm", self.cfm_file), ("ufm", self.ufm_file)):
+            if (not file_name):
+                continue
+
+            # same rules as the GUI: binary files erase ahead
+            if (file_name.endswith (M10_Program_Session.BIN_FILE_EXTENSIONS)):
+                data = builder._build_bin_image (flash, file_name)
+                erase_ahead = 1
+            else:
+                data = builder._build_hex_image (flash, file_name)
+                erase_ahead = 0
+
+            if (data is None):
+                return False
+
+            shm = shared_memory.SharedMemory (create=True, size=len (data))
+            shm.buf[:len (data)] = bytes (data)
+            self._shared.append ((shm, (flash, shm.name, len (data), erase_ahead, file_name)))
+
+        return True
+
+    #========================================================================
+    #  release_images
+    #========================================================================
+    def release_images (self):
+        for (shm, image) in self._shared:
+            shm.close()
+            shm.unlink()
+
+        self._shared = []
+
+    #========================================================================
+    #  image_hash
+    #------------------------------------------------------------------------
+    # Return: sha256 (hex) of the FP51 image name and the flash images, the
+    #         same job on the same files gives the same hash
+    #========================================================================
+    def image_hash (self):
+        digest = hashlib.sha256 (self.image_file.encode())
+
+        for (shm, (flash, shm_name, length, erase_ahead, file_name)) in self._shared:
+            digest.update (flash.encode())
+            digest.update (bytes (shm.buf[:length]))
+
+        return digest.hexdigest()
+
+    #========================================================================
+    #  _start_board
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    skip : "chip_id:image_hash" of boards already done, see program_board
+    #========================================================================
+    def _start_board (self, port, result_queue, running, skip=(), image_hash=""):
+        images = [image for (shm, image) in self._shared]
+
+        process = multiprocessing.Process (target=program_board, \
+            args=(port, self.baud_rate, self.image_file, images, self.log_dir, result_queue, \
+                  list (skip), image_hash), daemon=True)
+        process.start()
+        running[port] = (process, time.time())
+
+    #========================================================================
+    #  _collect
+    #------------------------------------------------------------------------
+    # Remarks: waits up to _POLL_INTERVAL for a board to finish, then stops
+    #          the ones over the timeout
+    # Return: results of the boards finished, each also passed to _finish()
+    #========================================================================
+    def _collect (self, result_queue, running):
+        finished = []
+
+        try:
+            result = result_queue.get (timeout=M10_Program_Many._POLL_INTERVAL)
+            entry = running.pop (result['port'], None)
+            if (entry is not None):
+                (process, start_time) = entry
+                process.join()
+                finished.append (result)
+            # else too late, the board was already reported as timeout / fail
+        except queue.Empty:
+            pass
+
+        now = time.time()
+        for (port, (process, start_time)) in list (running.items()):
+            if ((now - start_time) > self.timeout):
+                process.terminate()
+                process.join()
+                del running[port]
+                finished.append (board_result (port, 'timeout', seconds=now - start_time, \
+                    error="no result after {0}s".format (self.timeout)))
+            elif (not process.is_alive() and result_queue.empty()):
+                # gone without a result, such as a crash of the interpreter
+                del running[port]
+                finished.append (board_result (port, 'fail', seconds=now - start_time, \
+                    error="exit code " + str (process.exitcode)))
+
+        for result in finished:
+            self._finish (result)
+
+        return finished
+
+    #========================================================================
+    #  run
+    #------------------------------------------------------------------------
+    # Return: list of the board results, in the order they finished
+    #========================================================================
+    def run (self):
+        result_queue = multiprocessing.Queue()
+
+        pending = list (self.ports)
+        running = {}
+
+        while (len (pending) or len (running)):
+            while (len (pending) and (len (running) < self.workers)):
+                self._start_board (pending.pop (0), result_queue, running)
+
+            self._collect (result_queue, running)
+
+        return self.results
+
+    #========================================================================
+    #  _finish
+    #========================================================================
+    def _finish (self, result):
+        self.results.append (result)
+
+        print ("{0:<16} {1:<8} {2:<20} {3:7.2f}s  {4}".format (result['port'], result['status'], \
+            result['chip_id'] or "-", result['seconds'], result['error']))
+        sys.stdout.flush()
+
+    #========================================================================
+    #  print_summary
+    #========================================================================
+    def print_summary (self):
+        passed = len ([result for result in self.results if result['status'] == 'pass'])
+        print ("{0} of {1} board(s) passed".format (passed, len (self.results)))
+
+    #========================================================================
+    #  save_json
+    #========================================================================
+    def save_json (self, file_name):
+        try:
+            with open (file_name, 'w') as f:
+                json.dump (self.results, f, indent=2)
+        except IOError:
+            print ("Fail to open: ", file_name)
+
+
+#============================================================================
+#  board_result
+#============================================================================
+def board_result (port, status='fail', chip_id=None, firmware_version=None, seconds=0, error="", phases=[]):
+    return {
+        'port'             : port,
+        'status'           : status,
+        'chip_id'          : chip_id,
+        'firmware_version' : firmware_version,
+        'seconds'          : seconds,
+        'error'            : error,
+        'phases'           : phases
+    }
+
+#============================================================================
+#  program_board
+#----------------------------------------------------------------------------
+# Parameters:
+#    skip, image_hash : a board whose "chip_id:image_hash" is in skip is
+#                       left as it is, with status 'skip'
+# Remarks: runs in the process of one board, the console output goes to
+#          the log of the board. The result is put on result_queue
+#============================================================================
+def program_board (port, baud_rate, image_file, images, log_dir, result_queue, skip=[], image_hash=""):
+    start_time = time.time()
+    result = board_result (port)
+
+    if (log_dir):
+        log = open (os.path.join (log_dir, "M10_" + os.path.basename (port) + ".log"), 'w')
+    else:
+        log = io.StringIO()
+
+    session = M10_Program_Session (Progress_Bus (Null_Progress()))
+    session.telemetry = Program_Telemetry (station=port)
+
+    with contextlib.redirect_stdout (log):
+        try:
+            session.setup (port, str (baud_rate), image_file)
+            result['chip_id'] = session.chip_id.hex().upper()
+            result['firmware_version'] = bytes (session.firmware_version).hex().upper()
+
+            session.Mustang_Console.telemetry = session.telemetry
+
+            skipped = (result['chip_id'] + ":" + image_hash) in skip
+            if (skipped):
+                images = []
+
+            for (flash, shm_name, length, erase_ahead, file_name) in images:
+                shm = shared_memory.SharedMemory (name=shm_name)
+                data_list_to_write = list (shm.buf[:length])
+                shm.close()
+
+                session.Mustang_Console._write_flash_image (flash, data_list_to_write, erase_ahead, file_name)
+
+            if (skipped):
+                result['status'] = 'skip'
+            else:
+                result['status'] = 'pass'
+        except Exception as err:
+            result['error'] = repr (err)
+
+        session.close()
+
+    log.close()
+
+    result['seconds'] = time.time() - start_time
+    result['phases'] = session.telemetry.summary()['phases']
+    result_queue.put (result)
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    ports = []
+    baud_rate = M10_Program_Many.DEFAULT_BAUD_RATE
+    image_file = ""
+    cfm_file = ""
+    ufm_file = ""
+    workers = 0
+    timeout = M10_Program_Many.DEFAULT_TIMEOUT
+    json_file = None
+    log_dir = None
+
+    print ("===============================================================================")
+    print ("# Copyright (c) 2017, PulseRain Technology LLC ")
+    print ("# M10 program-many, Version 1.0")
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hP:b:U:j:t:", ["CFM=", "UFM=", "json=", "log-dir="])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-P'):
+            ports.append (arg)
+        elif opt in ('-b'):
+            baud_rate = int (arg)
+        elif opt in ('-U'):
+            image_file = arg
+        elif opt in ('-j'):
+            workers = int (arg)
+        elif opt in ('-t'):
+            timeout = float (arg)
+        elif opt in ('--CFM'):
+            cfm_file = arg
+        elif opt in ('--UFM'):
+            ufm_file = arg
+        elif opt in ('--json'):
+            json_file = arg
+        elif opt in ('--log-dir'):
+            log_dir = arg
+        else:
+            print ("Usage:\n  py M10_Program_Many.py [-P comport]... [--CFM=file] [--UFM=file] [-U fp51_image] [-b baud_rate]")
+            print ("  Options: \n    -P: port of a board, repeat for more boards (default: every port a board answers on)")
+            print ("    -U: replace default FP51 config image with a new one\n    -b: baud rate in bps")
+            print ("    -j: boards programmed at the same time (default: all)")
+            print ("    -t: seconds before a board is given up (default " + str (M10_Program_Many.DEFAULT_TIMEOUT) + ")")
+            print ("    --CFM=image file for CFM \n    --UFM=image file for UFM")
+            print ("    --json=file to save the result of every board to")
+            print ("    --log-dir=directory for the console log of every board")
+            print ("    -h print usage")
+            print ("\n  Example: program the CFM of the boards on COM7 and COM8")
+            print ("           py M10_Program_Many.py -P COM7 -P COM8 --CFM=cfm.bin")
+            print ("\n  Exits with 1 when a board did not pass")
+            sys.exit(1)
+
+    many = M10_Program_Many (ports, baud_rate, image_file, cfm_file, ufm_file, workers, timeout, log_dir)
+
+    print ("===============================================================================")
+    print ("ports      = ", " ".join (many.ports))
+    print ("baud_rate  = ", baud_rate)
+    print ("===============================================================================")
+
+    if (len (many.ports) == 0):
+        print ("No board found")
+        sys.exit(1)
+
+    if (not many.build_images()):
+        many.release_images()
+        sys.exit(1)
+
+    try:
+        many.run()
+    finally:
+        many.release_images()
+
+    print ("===============================================================================")
+    many.print_summary()
+
+    if (json_file):
+        many.save_json (json_file)
+
+    if (len ([result for result in many.results if result['status'] != 'pass'])):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, time, datetime
+
+from OCD_8051 import OCD_8051
+from M10_high_speed_config_console import dummy_console, M10_high_speed_config_console, Mustang_Console
+from Program_Telemetry import Program_Telemetry
+from Frame_Trace import Frame_Trace
+from Run_Profiler import Run_Profiler
+from Progress_Bus import Progress_Bus
+
+#############################################################################
+# M10_Program_Session : one board, programmed one file at a time
+#
+# Remarks:
+#    The programming flow of the GUI, without Tk: open the port, upload the
+#  config firmware if it is not running yet, read the chip ID, then load
+#  the file. The port stays open between runs, and the board is set up
+#  again only when it stops answering or need_reinit is set (such as when
+#  another port or baud rate is picked).
+#    Output goes to print() and print_func; progress goes to the bus.
+#############################################################################
+
+class M10_Program_Session:
+
+    BIN_FILE_EXTENSIONS = (".bin", ".rpd", ".dat")
+    HEX_FILE_EXTENSIONS = (".hex", ".ihx", ".eep")
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    progress   : Progress_Bus of the runs, Terminal_Progress if None
+    #    print_func : for whole lines, such as the console_print of the GUI
+    #    clear_func : called before the banner of a fresh setup, or None
+    #    version    : shown in the banner
+    #========================================================================
+    def __init__ (self, progress=None, print_func=print, clear_func=None, version=""):
+        if (progress is None):
+            progress = Progress_Bus()
+
+        self.progress = progress
+        self.print_func = print_func
+        self.clear_func = clear_func
+        self.version = version
+
+        self.need_reinit = True
+        self.ocd = None
+        self.M10_high_speed_config_console = None
+        self.Mustang_Console = None
+        self.firmware_version = None
+        self.chip_id = None
+        self.image_file = ""
+
+        self.telemetry = None
+        self.profiler = None
+
+    #========================================================================
+    #  dump_trace
+    #------------------------------------------------------------------------
+    # Remarks: last frames on the link, written next to the tool when a
+    #          programming run fails. Read back with Frame_Replay.py
+    #========================================================================
+    def dump_trace (self, serial_link):
+        if (getattr (serial_link, 'trace', None) is None):
+            return
+
+        file_name = "M10_trace_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".bin"
+        if (serial_link.trace.dump (file_name) >= 0):
+            self.print_func ("Frame trace saved to " + file_name)
+
+    #========================================================================
+    #  finish_profile
+    #------------------------------------------------------------------------
+    # Remarks: collapsed stacks of the run written next to the tool, the
+    #          host versus wire summary goes to print_func
+    #========================================================================
+    def finish_profile (self):
+        if (self.profiler is None):
+            return
+
+        file_name = "M10_profile_" + datetime.datetime.now().strftime("%Y%m%d_%H%M%S") + ".txt"
+        self.profiler.finish (file_name, self.print_func)
+        self.profiler = None
+
+    #========================================================================
+    #  failure_print
+    #------------------------------------------------------------------------
+    # Remarks: a cancel ends the run through the same path as a failure
+    #========================================================================
+    def failure_print (self, message):
+        if (self.progress.cancelled):
+            self.print_func ("Cancelled, flash content is incomplete")
+        else:
+            self.print_func (message)
+
+    #========================================================================
+    #  close
+    #========================================================================
+    def close (self):
+        if (self.M10_high_speed_config_console):
+            try:
+                self.M10_high_speed_config_console._serial.close()
+            except:
+                pass
+
+        self.need_reinit = True
+
+    #========================================================================
+    #  setup
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    image_file : FP51 image to upload instead of the built-in config
+    #                 firmware, which is then always uploaded
+    # Remarks: port open, config firmware upload and chip ID. Exceptions
+    #          are left to the caller
+    #========================================================================
+    def setup (self, com_port, baud_rate, image_file=""):
+        setup_start_time = time.time()
+
+        self.telemetry.start_phase ("port_open")
+        if (baud_rate == "Auto"):
+            self.ocd = OCD_8051 (com_port, 921600, verbose=0)
+        else:
+            self.ocd = OCD_8051 (com_port, int(baud_rate), verbose=0)
+        self.telemetry.attach (self.ocd._serial)
+        self.telemetry.end_phase (0)
+        if (self.profiler):
+            self.profiler.attach (self.ocd._serial)
+        self.ocd._serial.trace = Frame_Trace()
+
+        self.M10_high_speed_config_console = M10_high_speed_config_console (com_port, baud_rate, verbose=0, serial_link=self.ocd._serial)
+        self.M10_high_speed_config_console.progress = self.progress
+
+        firmware_active = (image_file == "") and \
+            self.M10_high_speed_config_console.firmware_active (dummy_console._FP51_CONFIG_FIRMWARE_VERSION)
+
+        if (baud_rate == "Auto"):
+            self.print_func ("Baud rate calibration ...")
+            self.M10_high_speed_config_console.calibrate_baud_rate (self.ocd, firmware_active)
+            self.print_func ("Baud Rate = " + str (self.ocd._serial.baudrate))
+
+        if (firmware_active):
+            print ("Config firmware already running, upload skipped")
+        else:
+            self.telemetry.start_phase ("fp51_upload")
+            console = dummy_console(self.ocd, progress=self.progress)
+            console._args = ("load_hex_and_switch " + image_file).split()
+            console._do_load_hex_and_switch ()
+            self.telemetry.end_phase ()
+
+        self.Mustang_Console = Mustang_Console(self.M10_high_speed_config_console)
+        self.Mustang_Console.ocd = self.ocd
+
+        #=========================================================================
+        # Get chip id
+        #=========================================================================
+        self.print_func("===============================================================================")
+        self.print_func("Initializing...", end="")
+        self.telemetry.start_phase ("chip_id")
+        self.M10_high_speed_config_console._serial.reset_output_buffer()
+        self.M10_high_speed_config_console._serial.reset_input_buffer()
+        self.M10_high_speed_config_console.uart_port_select(0)
+
+        if (not self.M10_high_speed_config_console.wait_ready()):
+            raise IOError ("config firmware not ready")
+
+        (chip_id_msw, chip_id_lsw, mcu_version, firmware_version) = self.M10_high_speed_config_console.flash_read_chip_id()
+        self.telemetry.end_phase ()
+        self.chip_id = bytes (chip_id_msw + chip_id_lsw)
+
+        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\bChip ID         : ", end="")
+
+        count = 0
+        for i in chip_id_msw:
+            print (format(i, '02X'), end="")
+            if (count == 1):
+                print ("-", end="")
+            count = count + 1
+
+        print ("-", end="")
+
+        count = 0
+        for i in chip_id_lsw:
+            print (format(i, '02X'), end="")
+            if (count == 1):
+                print ("-", end="")
+            count = count + 1
+
+        print ("\nMCU Version     : ", end="")
+        for i in mcu_version[1:]:
+            print (format(i, '02X'), end="")
+
+        print ("\nFirmware Version: ", end="")
+        for i in firmware_version:
+            print (format(i, '02X'), end="")
+
+        print ("\nSetup Time      : {0:0.2f}s".format(time.time() - setup_start_time), end="")
+
+        self.firmware_version = firmware_version
+
+        self.print_func("\n===============================================================================\n")
+
+    #========================================================================
+    #  load
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    flash_type : "CFM" or "UFM"
+    #    file_name  : binary (.bin .rpd .dat) or Intel hex (.hex .ihx .eep)
+    #========================================================================
+    def load (self, flash_type, file_name):
+        self.Mustang_Console._args = ["load", flash_type, file_name]
+
+        if (file_name.endswith (M10_Program_Session.BIN_FILE_EXTENSIONS)):
+            self.Mustang_Console._do_load_bin_file()
+        elif (file_name.endswith (M10_Program_Session.HEX_FILE_EXTENSIONS)):
+            self.Mustang_Console._do_load_hex_file()
+
+    #========================================================================
+    #  program
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    com_port, baud_rate : baud_rate is a string, "Auto" to calibrate
+    #    flash_type, file_name : as for load()
+    #    profile   : save the sampled stacks of the run (Run_Profiler)
+    #    image_file : FP51 image in place of the built-in config firmware,
+    #                 the board is set up again when it changes
+    # Return:
+    #    True if the file was loaded
+    #========================================================================
+    def program (self, com_port, baud_rate, file_name, flash_type, profile=0, image_file=""):
+
+        # per phase numbers of this run, kept until the next one
+        self.telemetry = Program_Telemetry (station=com_port)
+
+        if (profile):
+            self.profiler = Run_Profiler()
+            self.profiler.start()
+
+        if (image_file != self.image_file):
+            self.image_file = image_file
+            self.need_reinit = True
+
+        if (self.need_reinit == False):
+            # session kept open from the last run, check the board is still there
+            try:
+                if (not self.M10_high_speed_config_console.firmware_active (self.firmware_version)):
+                    self.need_reinit = True
+            except:
+                self.need_reinit = True
+
+        if (self.need_reinit):
+
+            self.close()
+
+            if (self.clear_func):
+                self.clear_func()
+            self.print_func ("===============================================================================")
+            self.print_func ("# Copyright (c) 2017, PulseRain Technology LLC ")
+            self.print_func ("# M10 high speed Configuration Utility, Version " + self.version)
+            self.print_func ("===============================================================================")
+            self.print_func ("Baud Rate = " + baud_rate)
+            self.print_func ("Com Port  = " + com_port)
+            self.print_func ("===============================================================================")
+
+            self.need_reinit = False
+
+            try:
+                self.setup (com_port, baud_rate, self.image_file)
+            except:
+                self.failure_print ("Failed to initialize " + com_port)
+                self.need_reinit = True
+                if (self.M10_high_speed_config_console):
+                    self.dump_trace (self.M10_high_speed_config_console._serial)
+                self.close()
+                self.finish_profile()
+
+                return False
+
+        start_time = time.time()
+
+        print ("=====> Start Time: ", datetime.datetime.now().strftime("%H:%M:%S"))
+
+        self.telemetry.attach (self.M10_high_speed_config_console._serial)
+        self.Mustang_Console.telemetry = self.telemetry
+        if (self.profiler and (self.profiler.link is None)):
+            self.profiler.attach (self.M10_high_speed_config_console._serial)
+
+        loaded = True
+        try:
+            self.load (flash_type, file_name)
+        except:
+            self.failure_print ("Failed to load " + file_name + " into " + flash_type)
+            self.dump_trace (self.M10_high_speed_config_console._serial)
+            self.close()
+            loaded = False
+
+        end_time = time.time()
+        delta_time = end_time - start_time
+        print ("==================> {0:0.2f}s\n".format(delta_time))
+        self.telemetry.print_summary()
+        self.finish_profile()
+
+        # port stays open, the next run reuses the session
+
+        return loaded
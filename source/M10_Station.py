@@ -0,0 +1,348 @@
+#! python3
+###############################################################################
+# Copyright (c) 2017, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, json, time, getopt
+import multiprocessing
+
+import serial.tools.list_ports
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+from M10_Board_Discovery import M10_Board_Discovery
+from M10_Program_Many import M10_Program_Many
+
+#############################################################################
+# M10_Station : headless programming station, one job on every board that
+#               is plugged in
+#
+# Remarks:
+#    The serial ports are listed again whenever udev reports a tty change
+#  (pyudev, Linux), or every POLL_INTERVAL without it. A port that shows up
+#  is given SETTLE_TIME to finish enumerating, probed (M10_Board_Discovery)
+#  and, if a board answers, handed to a board process of program-many; up
+#  to `workers` boards run at the same time. A board is served once per
+#  plug in: it has to be unplugged before it is programmed again.
+#    Every pass is kept in the history file as chip ID and image hash, and
+#  a board whose chip ID and image hash are there already is only read
+#  (status 'skip'), not written again.
+#############################################################################
+
+class M10_Station (M10_Program_Many):
+
+    DEFAULT_HISTORY_FILE = "M10_station_history.json"
+
+    # seconds between port lists without udev
+    POLL_INTERVAL = 0.5
+
+    # seconds from a port showing up to its probe
+    SETTLE_TIME = 0.5
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    history_file : passes of earlier runs, "" to keep none
+    #    workers      : slots, boards programmed at the same time
+    #    see M10_Program_Many for the others
+    #========================================================================
+    def __init__ (self, baud_rate=M10_Program_Many.DEFAULT_BAUD_RATE, image_file="", cfm_file="", ufm_file="", \
+                  workers=4, timeout=M10_Program_Many.DEFAULT_TIMEOUT, log_dir=None, \
+                  history_file=DEFAULT_HISTORY_FILE):
+        M10_Program_Many.__init__ (self, [], baud_rate, image_file, cfm_file, ufm_file, \
+                                   workers, timeout, log_dir)
+
+        self.history_file = history_file
+        self.history = []
+        self._monitor = None
+
+        self.load_history()
+
+    #========================================================================
+    #  discover_ports
+    #------------------------------------------------------------------------
+    # Remarks: no port list up front, the ports come and go
+    #========================================================================
+    @staticmethod
+    def discover_ports (baud_rate=M10_Program_Many.DEFAULT_BAUD_RATE):
+        return []
+
+    #========================================================================
+    #  load_history / save_history
+    #========================================================================
+    def load_history (self):
+        if (not self.history_file):
+            return
+
+        try:
+            with open (self.history_file, 'r') as f:
+                self.history = json.load (f)
+        except IOError:
+            self.history = []
+        except ValueError:
+            print ("History file not readable, started over: ", self.history_file)
+            self.history = []
+
+    def save_history (self):
+        if (not self.history_file):
+            return
+
+        try:
+            with open (self.history_file, 'w') as f:
+                json.dump (self.history, f, indent=2)
+        except IOError:
+            print ("Fail to open: ", self.history_file)
+
+    #========================================================================
+    #  done_keys
+    #------------------------------------------------------------------------
+    # Return: "chip_id:image_hash" of every pass in the history
+    #========================================================================
+    def done_keys (self):
+        return set ([entry['chip_id'] + ":" + entry['image_hash'] for entry in self.history])
+
+    #========================================================================
+    #  _open_monitor
+    #------------------------------------------------------------------------
+    # Remarks: udev monitor of the tty subsystem, None without pyudev or
+    #          where netlink is not allowed
+    #========================================================================
+    def _open_monitor (self):
+        if (pyudev is None):
+            return None
+
+        try:
+            monitor = pyudev.Monitor.from_netlink (pyudev.Context())
+            monitor.filter_by ('tty')
+            monitor.start()
+            return monitor
+        except Exception:
+            return None
+
+    #========================================================================
+    #  _wait_change
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    time_out : seconds at most, the board processes are checked in
+    #               between anyway
+    #========================================================================
+    def _wait_change (self, time_out):
+        if (self._monitor is None):
+            time.sleep (time_out)
+            return
+
+        device = self._monitor.poll (timeout=time_out)
+
+        # a burst of events for one plug in, take them all
+        while (device is not None):
+            device = self._monitor.poll (timeout=0)
+
+    #========================================================================
+    #  serve
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    count   : stop after this many boards, 0 to run until Ctrl-C
+    #    present : serve the boards already plugged in at the start
+    # Return: list of the board results
+    #========================================================================
+    def serve (self, count=0, present=False):
+        image_hash = self.image_hash()
+        result_queue = multiprocessing.Queue()
+        running = {}
+        served = 0
+
+        # port : time it showed up, probed once it has settled
+        appeared = {}
+
+        if (present):
+            known = set()
+        else:
+            known = set ([port.device for port in serial.tools.list_ports.comports()])
+
+        self._monitor = self._open_monitor()
+        if (self._monitor is None):
+            print ("Waiting for boards, ports listed every {0}s".format (M10_Station.POLL_INTERVAL))
+        else:
+            print ("Waiting for boards, udev events")
+        sys.stdout.flush()
+
+        while ((count == 0) or (served < count) or len (running)):
+
+            if (len (running)):
+                # _collect() does the waiting
+                self._wait_change (0)
+            else:
+                self._wait_change (M10_Station.POLL_INTERVAL)
+
+            now = time.time()
+            ports = set ([port.device for port in serial.tools.list_ports.comports()])
+
+            # unplugged, served again on the next plug in
+            for port in known - ports:
+                known.discard (port)
+                appeared.pop (port, None)
+
+            for port in ports - known:
+                if (port not in appeared):
+                    appeared[port] = now
+
+            settled = [port for port in appeared if ((now - appeared[port]) >= M10_Station.SETTLE_TIME) \
+                                                    and (port not in running)]
+            free = self.workers - len (running)
+
+            if ((count != 0) and ((count - served) < free)):
+                free = count - served
+
+            settled = settled[:max ([free, 0])]
+
+            if (len (settled)):
+                discovery = M10_Board_Discovery (settled, self.baud_rate)
+                discovery.scan()
+
+                skip = self.done_keys()
+                for result in discovery.results:
+                    port = result['port']
+                    known.add (port)
+                    del appeared[port]
+
+                    if (result['ocd']):
+                        print ("{0:<16} {1}".format (port, "started"))
+                        self._start_board (port, result_queue, running, skip, image_hash)
+                        served = served + 1
+                    else:
+                        print ("{0:<16} {1}".format (port, "no board, ignored"))
+                sys.stdout.flush()
+
+            if (len (running)):
+                for result in self._collect (result_queue, running):
+                    if (result['status'] == 'pass'):
+                        self.history.append ({
+                            'chip_id'    : result['chip_id'],
+                            'image_hash' : image_hash,
+                            'port'       : result['port'],
+                            'time'       : time.strftime ("%Y-%m-%d %H:%M:%S")
+                        })
+                        self.save_history()
+
+        return self.results
+
+    #========================================================================
+    #  print_summary
+    #========================================================================
+    def print_summary (self):
+        passed = len ([result for result in self.results if result['status'] == 'pass'])
+        skipped = len ([result for result in self.results if result['status'] == 'skip'])
+        print ("{0} of {1} board(s) passed, {2} skipped".format (passed, len (self.results), skipped))
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    baud_rate = M10_Station.DEFAULT_BAUD_RATE
+    image_file = ""
+    cfm_file = ""
+    ufm_file = ""
+    workers = 4
+    timeout = M10_Station.DEFAULT_TIMEOUT
+    json_file = None
+    log_dir = None
+    history_file = M10_Station.DEFAULT_HISTORY_FILE
+    count = 0
+    present = False
+
+    print ("===============================================================================")
+    print ("# Copyright (c) 2017, PulseRain Technology LLC ")
+    print ("# M10 programming station, Version 1.0")
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hb:U:j:t:n:", \
+            ["CFM=", "UFM=", "json=", "log-dir=", "history=", "present"])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-b'):
+            baud_rate = int (arg)
+        elif opt in ('-U'):
+            image_file = arg
+        elif opt in ('-j'):
+            workers = int (arg)
+        elif opt in ('-t'):
+            timeout = float (arg)
+        elif opt in ('-n'):
+            count = int (arg)
+        elif opt in ('--CFM'):
+            cfm_file = arg
+        elif opt in ('--UFM'):
+            ufm_file = arg
+        elif opt in ('--json'):
+            json_file = arg
+        elif opt in ('--log-dir'):
+            log_dir = arg
+        elif opt in ('--history'):
+            history_file = arg
+        elif opt in ('--present'):
+            present = True
+        else:
+            print ("Usage:\n  py M10_Station.py [--CFM=file] [--UFM=file] [-U fp51_image] [-b baud_rate] [-j slots]")
+            print ("  Options: \n    -U: replace default FP51 config image with a new one\n    -b: baud rate in bps")
+            print ("    -j: boards programmed at the same time (default 4)")
+            print ("    -t: seconds before a board is given up (default " + str (M10_Station.DEFAULT_TIMEOUT) + ")")
+            print ("    -n: stop after this many boards (default: run until Ctrl-C)")
+            print ("    --CFM=image file for CFM \n    --UFM=image file for UFM")
+            print ("    --history=file of the boards done, skipped next time (default " + M10_Station.DEFAULT_HISTORY_FILE + ")")
+            print ("    --present also serve the boards plugged in before the start")
+            print ("    --json=file to save the result of every board to")
+            print ("    --log-dir=directory for the console log of every board")
+            print ("    -h print usage")
+            print ("\n  Example: program the CFM of every board plugged in")
+            print ("           py M10_Station.py --CFM=cfm.bin")
+            sys.exit(1)
+
+    station = M10_Station (baud_rate, image_file, cfm_file, ufm_file, workers, timeout, log_dir, history_file)
+
+    print ("===============================================================================")
+    print ("baud_rate  = ", baud_rate)
+    print ("slots      = ", station.workers)
+    print ("===============================================================================")
+
+    if (not station.build_images()):
+        station.release_images()
+        sys.exit(1)
+
+    try:
+        station.serve (count, present)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        station.release_images()
+
+    print ("===============================================================================")
+    station.print_summary()
+
+    if (json_file):
+        station.save_json (json_file)
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,11 @@
 #
 ###############################################################################
 
+import time
+
+# import of this module to first window, see --startup-bench
+_start_time = time.perf_counter()
+
 from tkinter import *
 from tkinter import filedialog
 import base64
@@ -25,6934 +30,172 @@ from tkinter import font
 import sys, string, os
 import serial.tools.list_ports
 import webbrowser
-import time
-import datetime
+import threading
+import queue
+import collections
+import zipfile
 
-from M10_high_speed_config_console import *
-from OCD_8051 import *
+# the programming engine, imports no Tk
+from M10_Program_Session import M10_Program_Session
+from M10_Board_Discovery import M10_Board_Discovery
+from Progress_Bus import Progress_Bus, Terminal_Progress
 
-class stdout_redirect(object):
-    def __init__(self, text_area):
-        self.text_area = text_area
-
-    def console_backspace(self):
-        txt = self.text_area.message_console.get()
-        new_txt = txt[:-2]
-        #self.console_print(new_txt)
-        if (len(txt) > 1):
-            if (txt[-2] != '\n'):
-                self.text_area.message_console.clear()
-                self.text_area.message_console.settext(new_txt)
-                        
+#############################################################################
+# console_sink : the message console, as sys.stdout for any thread
+#
+# Remarks:
+#    write() only updates a model of the text under a lock: finished lines
+#  go into a ring buffer of MAX_LINES, the unfinished last line is kept
+#  apart so '\r' and '\b' rewrite it in place. flush() runs on the Tk
+#  tick; it appends the lines finished since the last flush, redraws the
+#  last line after the 'partial' mark and drops the oldest lines from the
+#  widget, without reading the widget back.
+#############################################################################
+class console_sink(object):
+    
+    MAX_LINES = 5000
+    
+    def __init__(self, text, max_lines=MAX_LINES):
+        self.text = text
+        self.max_lines = max_lines
         
-    def write(self, str):
-        #self.text_area.insert(END, str)
-        #self.text_area.see(END)
-        for i in range (len(str)):
-           if (str[i] == '\b'):
-                self.console_backspace()
-           else:
-                self.text_area.message_console.appendtext(str[i])
+        self.lines = collections.deque(maxlen=max_lines)
         
-        self.text_area.root.update_idletasks()
-
+        self._lock = threading.Lock()
+        self._partial = ""
+        self._new_lines = 0
+        self._dirty = False
+        self._clear = False
+        self._widget_lines = 0
+        
+        self.text.mark_set('partial', 'end-1c')
+        self.text.mark_gravity('partial', LEFT)
+        
+    def _rewrite(self, segment):
+        if (('\r' not in segment) and ('\b' not in segment)):
+            self._partial = self._partial + segment
+            return
+            
+        for c in segment:
+            if (c == '\r'):
+                self._partial = ""
+            elif (c == '\b'):
+                self._partial = self._partial[:-1]
+            else:
+                self._partial = self._partial + c
+    
+    def write(self, str):
+        segments = str.split('\n')
+        
+        with self._lock:
+            for segment in segments[:-1]:
+                self._rewrite(segment)
+                self.lines.append(self._partial)
+                self._partial = ""
+                self._new_lines = self._new_lines + 1
+                
+            self._rewrite(segments[-1])
+            self._dirty = True
+    
+    def clear(self):
+        with self._lock:
+            self.lines.clear()
+            self._partial = ""
+            self._new_lines = 0
+            self._clear = True
+            self._dirty = True
+            
     def flush(self):
         pass
-        #self.text_area.root.update_idletasks()
-
-class M10_config_gui(Pmw.MegaWidget):   
-    icon='''\
-AAABAAkAEBAAAAEAIABoBAAAlgAAABgYAAABACAAiAkAAP4EAAAgIAAAAQAgAKgQAACGDgAAMDAA
-AAEAIACoJQAALh8AAEBAAAABACAAKEIAANZEAABgYAAAAQAgAKiUAAD+hgAAgIAAAAEAIAAoCAEA
-phsBAMDAAAABACAAKFICAM4jAgAAAAAAAQAgAPVoAAD2dQQAKAAAABAAAAAgAAAAAQAgAAAAAAAA
-BAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD38toA////AO3grAbq3KEQ6tyfDe3h
-rALq3aIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOPRgwDl1pEA4c57IuPQgXTk0YSx49GD
-yOLPfsLgzHac3cdpUNvCXgzbwl0A7+W/AAAAAAAAAAAAAAAAANzDYADcw2EC2LxOVtrAWdjbw2D+
-3MRi/9m/Vf/YvVH/17xN/9a6R/fTtDmo0LAtIsiiBwD+/fkAAAAAANvCOQD59/8A3MViVd7IbezZ
-v1X/4Mt0/+bVjv/ex2z/zaoe/8uoF//KphP/z68s/93GabrUuDsa0LApAAAAAADLsIoAx6mHINW7
-b9TZwVv/28Re/9e+Xf/fy4z/6tyh/9K1O//EngD/xqEH/9rCXf/WvFf/wJ5jhgAAAAGGSAgAj1Yb
-AIpOEG6WYCn/sYlR/7yYWv+neUP/pXdI/+XVov/gzHj/xZ8A/8+vLf/bw17/w6Jg/4xRFtyERAMg
-hkgIAIZICASGSAephUYG/4VGBv+FRwj/hEYF/4pOEf/Tu43/6NmW/8mmE//Wu0z/2L9e/6V3Qv+E
-RQX6hkgITYZICACMURQMik4QwIhLDf+HSQr/hkgI/4ZICP+FRgb/v55v/+veo//QsTL/2cBY/9K3
-YP+VXif/hUcG/4ZICGSGSAgAl2IqCZdhKbmUXCP/kFcc/41SFf+KThD/hkgI/66FVP/r3ab/2L5U
-/9rCW//Mr2H/jVMY/4ZHB/6GSAhchkgIAK2BVgCjdEOQoXE//55rN/+aZjD/l2Ao/5FZHv+oe0r/
-6Nml/+DMef/bw13/xaVf/4hMD/+GSAjwhkgIN4ZICACvhlsAroVaRq6FWvKrgFP/qHpM/6R1RP+g
-bjv/qX1P/+PTof/r3qX/3MRh/76bYP+LTxP/iUwNuYVHBwyGSAgAt5JsALaRagi6lnGcuZRv/7WP
-Z/+xiWD/roNY/66EWv/dyp//7eGt/9rCYf+5lWX/l2Ep7ZNbIUqWYCgAi08SAM20mgDCo4MAwqOC
-G8Slha/Do4P9v558/7uYdP+3kmz/1Lyb/97JbP/Xv2z/to9o7aFxP2iUXCMCnms3AAAAAAAAAAAA
-38y5AMuvkwDMsJUUzLGVesywlNbJrI/3xaeI/sirjf3axpzu1b6at7SOaEemeUkDroRZAAAAAAAA
-AAAAAAAAAAAAAAAAAAAA1sCpANnDrgHTuqIa0beeRc6zmV3JrI9WxaePM7qYhAvu4d8AWB4BAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAD8PwAA8A8AAMAHAADAAwAAgAEAAIABAAAAAQAAAAEAAAABAACAAQAA
-gAEAAIADAADAAwAA4AcAAPAfAAD//wAAKAAAABgAAAAwAAAAAQAgAAAAAAAACQAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAO3hrADgzXoA6NmYCujYlijo2JZF59iVUufWkUvm1Y0z5NOIE+XWkQHl1Y4A
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADl1YwA4Mx3AOHOexTi
-0H9l49GDueTRhOfj0YP449CB/OLPfvrhzXrv4Mt0zt7IbIbcxGIr2sBZAdzDYQAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAANrBWwDSszsA28NfPt3FZsDdxmj73MVl/9vDYP/bwl7/28Jd
-/9rBWv/awFj/2b9V/9i+Uv/XvEzg1bhCbNGyMwnTtDgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-/v78AAAAAADex2pR1rlG49W5Rf/VuEL/28Jd/+DKdP/awFn/07Q4/9KzNf/RsjP/0bEw/9CwLf/Q
-ryv/zq0m+NS3QYv9+/UL9e7TAAAAAAAAAAAAAAAAAAAAAACsdAAA2L5JAM2sKzzl04zh4s17/9e8
-Tf/hzHf/59eU/+fYlv/u4rP/3sds/8qmE//JpRD/yaQO/8ijDP/Hogj/0bEy/+XUjfrStT56rHYA
-AtCxLgAAAAAAAAAAAAAAAAD38uIA/Pr4EuHNe7vRsjH/2L5T/+DMeP/YvlL/0bMz/+LOfP/l04r/
-7uKz/9K0Ov/EngD/xZ8B/8WfAP/IpRH/5NKK/9K0Of/YwGLrz7aVP+TVtgCGSAcAAAAAAIVGCACv
-h10Anm06XraRavrUvI3/28Rs/9e8Tv/aw2j/0rqL/7+efP/l1q3/6dmZ/+XUjf/GoAT/xZ8B/8Se
-AP/ZwFn/28Nh/9e8U/+/nnf/i1AUp3s3AAaGSAgAAAAAAIZICACHSQkHhUcHsYRFBP+NUhf/pXhJ
-/7KLYP+neUv/jVMY/4RFBf/GqIX/6dub/+zgrf/MqyL/xJ4A/8ejDP/k0Yf/0bIy/9a+i/+PVh3/
-hUcG6IZICC6GSAgAAAAAAIZICACGSAghhkgI4IZICP+GRwf/hEUF/4RFBP+ERQT/hkcH/4RFBP+m
-eEn/6dyq/+zfqP/XvE//xJ0A/8+wLv/gzHj/1bpJ/7qWbf+ERQX/hkgI/oZICGGGSAgAiEgIAIdJ
-CQCHSQk6hkgJ84ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv+SWyL/4tGr/+rbnf/gzHn/w50A
-/9i+VP/ZwFj/2sJt/6BwQP+ERgX/hkgI/4ZICIWGSAgAhkcIAI1SFQCNUhVGjFAT+IpND/+ISwz/
-h0kJ/4ZICP+GSAj/hkgI/4ZICP+JTA7/1L6b/+namP/n15f/xqAE/97Ibv/UuEH/2MGB/5JaI/+F
-Rwf/hkgI/4ZICJSHSQkAhkcHAJZfJgCWXyY/lV0k9ZJaIP+QVhv/jlMW/4tPEv+JTA7/iEoL/4dJ
-Cf+FRgb/xKWB/+rbnP/r3qf/yqcX/+HNfP/StTj/0rqG/4tPFP+GSAf/hkgI/4ZICIuGSAgAhkcH
-AJ5rNwCeazconWs25ptoMv+ZZC3/l2Ao/5RdI/+SWR7/j1UZ/41SFf+JSw3/tpBo/+rcov/s36v/
-0LI0/+LPgv/StTb/y6+C/4dJC/+GSAj/hkgI/4ZICGyGSAgAhkcIAKV2RgCldkYMpnhIwKR1Rf+i
-cUD/n247/51qNv+bZzH/mGMs/5ZfJ/+SWR//roRZ/+rcqv/r3qf/2sFd/+HOfv/Utz//wJ91/4VG
-Bv+GSAj/hkgI8YZICDuGSAgAAAAAAKt/UgCwh10AroRYdK2DV/+rf1L/qHtN/6Z4SP+kdEP/oXE+
-/59tOf+baDP/qX1Q/+jasP/q257/59eW/97Ib//XvVL/tY5l/4hKC/+ISgz/h0kKvIVHBw2GSAgA
-AAAAAAAAAAC0jmYAtI5mILWPaNO0jWX/sYlf/6+FWv+sglb/qn5R/6h6TP+ldkb/qXxP/+PTsv/o
-2JT/9e7T/9nAWP/bxG//rYJX/5FYHf+QVhr2jVEUWZBWGgCHSAkAAAAAAAAAAAC7mHQAv516ALya
-dlq8mnbyupdy/7iTbf+1j2j/s4xj/7GIXv+uhFn/rIFV/9rGq//o2Zb/8unE/9K0Of/dyI7/p3pN
-/5tnMf+YYyyeklkfCZRcIwAAAAAAAAAAAAAAAAAAAAAAwqKCAMGhgAXDpIR5w6SE9cGhgP++nXr/
-vJl1/7qWcf+3kmz/tI1k/82zl//q3KT/2cFa/9K0Nv/XwZ//p3pM/6N0QrSfbTkboG47AKmAVAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAMmsjwDJrI8Gyq2QaMqtkOPIq43/xaeI/8Ojg//AoH7/vZt4/8Gh
-gf/k1bH/2b9V/+LQkP/FqIn2rIJVm6l9UBqrf1IAq4BTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAADQtpwA0bieAc+1mjHPtZqYzrOZ4cyxlfvKrZH/x6qM/8Smhv/MsZb+3cq07tW/qLi5lXFU
-sophCbWOZwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANS7pADV
-vqgE0rqiI9G4oFPQtp14zrOYh8uvk4DHqYtjv55+NK+GXwvhyKoAXSoIAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD/AP8A/AA/APgAHwDwAA8A4AAHAMAA
-BwDAAAMAgAADAIAAAwCAAAMAgAADAIAAAwCAAAMAgAADAMAAAwDAAAcA4AAHAOAADwDwAB8A+AA/
-AP4A/wD///8A////ACgAAAAgAAAAQAAAAAEAIAAAAAAAABAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-APfy3AD6+OoA7eO0A+vfqgTt4a8D8u3SAPHqzAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADx
-58AA5dSJAOfXkgjn1pEv59eTZOfXk5Dn15Op59aRsubVj6vl1IuU5NKHa+PQgTbiz38L38hyAOfa
-lQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAADv7LcA4c15AOHOewniz31O49CBr+PRg+rj0YL+49CB/+LPf//izn3/4c56/+HNeP/gzHb+
-4Mtz797JbbrdxWZc28JfD9vCXgDizH8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAA3cZsAN7GZQDcxWUo3sdrpN7IbfXeyGz/3sdq/93GZ//dxWX/3MRj/9zE
-Yf/bw1//28Jd/9rBW//awFn/2cBX/9m+VPnXvE601blFNcyiCADVuEQAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMWdGgD//+8A1rpKQdm+VNLZv1X/2L5T/9i9T//Xu0z/
-17tL/9a6SP/WuUb/1rlG/9W4RP/VuEL/1LdA/9S2Pv/TtTv/07Q5/9K0OP/SsjPfzq0mVKhsAAHA
-lQUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADs364A6NiVAPPrzEDcxGPd07Q5/9K0
-N//SsjT/1rlG/+XTiv/s36v/6Nma/9rBWv/Pryr/z64o/8+tJ//OrST/zqwi/82rIP/Nqh7/zKkc
-/8uoGP/XvE3q8ejBVf///wDTt0IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADAAAAMehBgDBmAAm
-28Niz+/kt//j0IP/1rpI/93FZf/t4K7/59eV/+PQg//s36r/8+zM/9zFZf/JpA3/yaQN/8ijC//I
-ogn/x6II/8ehB//GoAP/1LdB/+7jtP/XvFDgwpoAOcObAADk0ocAAAAAAAAAAAAAAAAAAAAAAAAA
-AAD69+gA////B93HaJ7KqBf/zawi/+LOfv/r3qj/59iX/9K1O//IpA7/2b9U/+DLdP/m1pD/8+rJ
-/9CyM//EngD/xZ8B/8WfAf/FnwH/xJ4A/8yqH//t4bD/1blG/8qoGf/k04+349bbEN/PvQAAAAAA
-AAAAAAAAAAAAAAAAhkcIANnGsgDKr5NH38668encs//awVj/yqcV/8ikDv/IpAz/0rU3/+fXoP/l
-18X/7uPG/+TShf/s4Kz/59eW/8WgBP/FnwH/xZ8B/8WfAf/FnwH/4tCD/+DLeP/Iow7/5tac/7+f
-ffqNUxdhmmYxAIZHBwAAAAAAAAAAAAAAAACGRwgAgUEABYlMDqSLUBP/onND/861mP/l1a//5dWd
-/+XVpP/bx6r/roVc/41SF//An3//7+W5/+PRhP/y6cb/zq4p/8SeAP/FnwH/xZ4A/82tJ//t4K7/
-yqga/93GZ//MsZX/iEsM/4VHB7+GSAgOhkgIAAAAAAAAAAAAAAAAAIZICACGSAgmhkgI4oZHB/+E
-RgX/h0oL/5ZgKf+gcED/nGk2/4xRFf+FRgX/hEYF/5ZgKf/p3cT/5NKE//DmvP/cxGX/xJ0A/8Wf
-Af/EngD/3cdr/+LOfv/KphT/5dWt/5pmM/+FRgX/hkgI8YZICDyGSAgAAAAAAAAAAAAAAAAAhkgI
-AIZICFaGSAj8hkgI/4ZICP+GSAj/hUcG/4RGBf+FRgX/hkcH/4ZICP+GSAj/h0oK/9K6oP/q3J7/
-6tuf/+jZnP/FoAP/xZ8A/8ahB//p2p7/0rU8/9e8S//OtZf/h0kK/4ZICP+GSAj/hkgIdIZICACH
-RwgAAAAAAIVHBwCGSAgAhkgIgIZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+ERQT/t5Js/+/luf/l04n/8Oa9/8qnFv/EngD/zKof/+zfq//Kpxb/4tCG/7GJYf+ERQT/hkgI
-/4ZICP+GSAiehkUGAYZHCAAAAAAAik0OAIFAAACISguZh0kK/4ZICf+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4RGBf+gcD//7uTG/+PQgf/y6cb/0LI0/8SdAP/TtkD/6Nmb/8ikDv/l
-1aX/m2g1/4VGBf+GSAj/hkgI/4ZICLaFRwgGhUgIAAAAAACOVBgAk1wjAY5TF6KNURT/i04R/4lM
-Dv+ISgv/h0kJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/5FZIP/m2cH/5dOG//Dnvv/ZwFn/w5wA
-/9vDYP/iz4D/zKob/+DOq/+PVhz/hUcH/4ZICP+GSAj/hkgIvoZHCAmGRwgAAAAAAJNcIgCUXCEA
-lV0kmZNbIv+SWR7/kFYa/45TF/+MUBP/ik4Q/4lMDf+ISgv/h0kJ/4ZICP+GSAj/iUwO/9nGrf/o
-2JT/7eGu/+HOfv/DnAD/4c16/9zEZP/RsjD/18Kj/4lMDv+GSAj/hkgI/4ZICP+GSAi2hUcHBoZH
-CAAAAAAAmWQuAJtoMgCbZzJ/mmYw/5hjLP+WYCj/lV0k/5NbIf+RWB3/j1UZ/41SFv+MUBL/ik0P
-/4hLDP+GSAn/yq6R/+zfpf/p2pz/6Nqd/8WfAv/m1ZH/1bpJ/9a7SP/MspT/hkgI/4ZICP+GSAj/
-hkgI/4ZICJ6DQgYAhkcIAAAAAAAAAAAAoXE/AKFxPlahcD37n205/51qNv+baDL/mmUv/5hiK/+W
-Xyf/lF0j/5JaIP+RVxz/j1UY/4tPEf+8mnf/7+S1/+bVjf/u4rT/yaYV/+rcov/PsC//3MVl/7+f
-ff+ERQT/hkgI/4ZICP+GSAj/hkgIdIZICACGRwgAAAAAAAAAAACneUoAp3lLJqd6S+Kmd0j/pHRE
-/6JyQP+gbzz/nmw5/51qNf+bZzH/mWQu/5dhKv+WXyb/klkf/7KKYv/w5sH/49GE//Hnwf/Rszb/
-696p/8uoGf/iz4P/sYlh/4RFBP+GSAj/hkgI/4ZICPGGSAg8hkgIAAAAAAAAAAAAAAAAAKyBVACr
-gFIErYNXpKyBVf+qf1L/qXxO/6d5Sv+ldkf/o3RD/6JxP/+gbjv/nmw4/5xpNP+ZZC7/q39T/+7k
-yP/j0IH/8ejC/93HbP/p26H/yKQO/+XWnv+ldkn/h0kK/4dKC/+HSQn/hkgIvoZICA6GSAgAAAAA
-AAAAAAAAAAAAsolfALOMYwCzi2NGs4tj8bGJX/+vhlz/roNY/6yBVP+qflH/qHtN/6Z5Sf+ldkb/
-o3NC/6FwPf+neUv/6d3H/+XTh//v5Lb/7+S4/+PRh//KpxT/5daw/55rOf+OVBj/jVIW/4xQEvqJ
-TA5hjFATAIZICAAAAAAAAAAAAAAAAAAAAAAAt5JsALaRawe4lG+duJNt/7aQav+0jmb/s4ti/7GI
-Xv+vhVr/rYNX/6uAU/+qfVD/qHpM/6d6S//fzrr/6dqZ/+rcoP/8+vL/2sFc/9CxL//ezbL/m2cz
-/5ZfJ/+UXSP/klkfto5UFxCPVRkAAAAAAAAAAAAAAAAAAAAAAAAAAADKr5YAvZt4AL2beCW+nHnO
-vZt3/7uYc/+5lXD/t5Js/7aQaf+0jWX/soph/7CHXf+uhVr/q4BT/9G5of/u47T/5dOJ//bv1f/O
-rin/28Ng/9G5oP+eazf/nWo1/5tmMd+YYis4mWQtAJhkLgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADDo4MAw6SEAMKjgz/DpITcwqKC/8Cffv++nHr/vJp2/7qXc/+5lG//t5Jr/7WPaP+yi2L/w6SF
-//Doy//iz37/4Mt1/8ijDf/n2J7/wKCA/6R1RP+jc0LpoG88VLWOYwCdazcAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADIq40Ay62PAMiqjUDIq47Rx6qM/8WniP/DpIT/waGA/7+eff++
-nHn/vJl1/7qWcf+7mHT/59rH/+DLcv/Howz/07c+/+faw/+zjGT/q39T3qh7TVOdazgBpnhIAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADNspcAzLCVAMyxlSfNsZaizLGV
-9Muvkv/JrI7/x6mL/8Wmh//Do4P/waF//76dev/Ns5n/7OHF/+bVlP/s4cH/zLKY+LKKYbKwh100
-cjgAAK+FWgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/
-9P4A0LacANC3ngnQt51M0LadrM+1m+nOs5j9zLGV/8qukf/Iq47/xqiK/8Slhv/MsZf+18Ku7c61
-nLe6l3Nat5FrDriTbQC+oIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAA6NvUANG5oADUvKUH0rqiLdK5oWHRt56Nz7Wbp86zmK/MsJSp
-yq2QkcaniGi/nXs0sophCtS6mAB/SCEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA5uDUAPT4
-9QDYw68C1L2mBNW+pwLf0r8A3c67AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA///////8f///wAf/
-/wAB//4AAP/8AAA/+AAAP/AAAB/gAAAP4AAAD8AAAAfAAAAHwAAAB8AAAAPAAAADgAAAA8AAAAPA
-AAAHwAAAB8AAAAfAAAAH4AAAD+AAAA/wAAAf+AAAP/wAAD/+AAD//wAB///AB////H//////////
-//8oAAAAMAAAAGAAAAABACAAAAAAAAAkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6dqtAOjY
-kADo2pkH6NmYIejZmEbo2Zhq6NmYg+jZl5Ln2JaW59eUj+fXkn3m1o9g5dWMO+XTiRjl1IkD5dOI
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAObViwDm1o0C5dSKIeXUjGfm1Y2v5tWO3+bVjvfm1Y3/5dSM/+XUiv/l04n/5dOI/+TS
-hv/k0oX+49GD8uPQgNTiznyc4c14UeDMdBPQt04A4s98AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADhz34A382AAOHOfCPiz36E49CA2+PQgf3j0ID/4s9+/+LPff/i
-znv/4c56/+HNef/hzHf/4Mx2/+DLdf/gy3P/38py/9/Kcf/fyW//3slt+N7HasbcxWVl28JgEtvD
-YQDcxWMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAN7IawDeyGsL38lvZt/KctjfynL+
-38px/9/Jb//eyW7/3shs/97Ia//ex2r/3cZo/93GZ//dxWX/3MVk/9zEYv/cw2H/28Ng/9vCXv/b
-wl3/2sFc/9rBWv/awFn62b9VvNe8T0LVukYC17tLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADcxm0A2sFc
-ANrBXB7bw2Gg3MRj+NzEYv/bw2D/28Je/9vCXf/awVz/2sFa/9rAWf/awFf/2b9W/9m+Vf/ZvlP/
-2L1S/9i9UP/YvE//17xO/9e7TP/Xu0v/1rpJ/9a6SP/WuUb/1rlF/9W4Q+rUtj510rM3C9K0OAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAANK1OADZvlQA17tMLNi9UcDYvlL/2L1R/9i9T//XvE7/17tM/9e7Sv/WuUf/1blF
-/9W4Q//VuEL/1bhD/9W4Qv/Vt0H/1LdA/9S2Pv/Utj3/07U7/9O1Ov/TtDn/0rQ3/9KzNv/SszT/
-0bIz/9GyMv/RsTD50K8rlMyoHRHOrSMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////ANe7TQDm1pEr1rpJyNS3P//Ut0D/1LY+/9S2
-Pf/TtTz/07Q4/9S3QP/ex2z/5tWP/+bUjf/ex2v/1LY+/9CwLv/QsS//0LAu/9CvLP/Qryv/z64p
-/8+uKP/PrSb/zq0l/86sJP/OrCL/zash/82rIP/Nqh7/zaod/dvCXJv///8P+/jtAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6tylAOTSiRz5
-9eW+7+W5/9i+U//Qryv/z68q/8+uKP/Prif/2L1Q/+/luf/69+r/9/Lc//fy2//69+n/8urH/9m/
-Vv/MqRv/zKkb/8ypGv/MqBn/y6gX/8unFv/LpxX/yqYT/8qmEv/KpRH/yaUP/8mkDf/JpA//38lx
-//jz4Pzo2p2LrXcAB8WfAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAADEnQIAwZkACceiC5rWukr/8efB//jz3//l04r/1rpH/9W5RP/k0of/9/Lc/+3hsv/a
-wVv/2sFa/+HNef/n1pL/9e7R//j04v/XvU//x6II/8iiCf/Hogj/x6EH/8ehBv/HoQX/xqAE/8ag
-BP/GoAP/xp8C/8WfAv/dxmv/+vbn/+DMeP/Iow31w5wAYuDJAAC3iAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPPszQC0ggAAz68tXseiCfbEnQD/yaYU/97JcP/z68z/
-+PPg//j04v/07M7/3MZo/8ejDf/EnQD/yaYU/9W6SP/fynH/4s9///TszP/07dD/zasj/8WeAP/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/9S5Rv/49OP/4Mt3/8WfBP/FnwT/2L5U2/jz
-4Cz07M8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD///8d+vbl
-z+3hrv/TtT3/xZ8D/8SdAP/JphT/0rU8/9O3QP/Kpxj/xJ0A/8WfBf/XvE3/8unC//PryP/k04n/
-4Mx2/+TSh//59eX/5dON/8WfAv/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FngD/yqcX//HoxP/p
-26H/x6IJ/8WfA//eyW//9fDj/860m5tHAAAFik4QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAj1YcAP///wDHq41307ym/und0//48+X/59eT/9CyMv/GoQf/xJ0A/8OcAP/FoAT/z68r
-/+fYlf/38uf/4tPG/+PVyf/49OT/5tWO/+DMdv/t4a7/+PPf/86uK//EngD/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/EngD/3slx//bx2v/Orir/xJ0A/9i/Vf/28eX/upZz/4lNDu2FRwY9hkgIAIdGBwAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkgIAIZICRmISgvPhkkJ/5BXHP+zjGX/49TH//fy
-4//w5rr/59eR/+XUiv/t4a7/9vHf/+TWyf+uhFr/i1AT/5BYHf/g0MH/9O3L/+HNef/k0YX/+fbn
-/+DMef/EngD/xZ8B/8WfAf/FnwH/xZ8B/8WeAP/Kpxj/9OzO/+LPgf/EnQD/zKof//Ttz//JrZL/
-h0oL/4ZHB/+GSAiZhUYIAoVHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACKRgcAhkgIAIZICFaG
-SAj6hkgI/4VHB/+ERQX/jlQY/6yCV//Kr5X/2ca0/9vIt//NtJv/r4Zd/49WG/+ERgX/hkcH/4RF
-BP+vhlz/+fXr/+bWkP/gzHf/8ejC//Howv/IpA7/xZ8A/8WfAf/FnwH/xZ8B/8SeAP/ZwFv/9/Ld
-/86uKv/EnQD/4s58/+ne0v+UXCT/hUYG/4ZICP+GSAjehkgIJIZICAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAACFSAcAhUYGAoZICJ2GSAj/hkgI/4ZICP+GSAj/hUcH/4RFBP+FRwb/iEoL/4hLDP+G
-Rwf/hEUE/4VHB/+GSAj/hkgI/4VHB/+QVxz/6NzQ/+/ltv/gzHX/6dqc//r25//Rszb/xJ4A/8Wf
-Af/FnwH/xZ8B/8agBf/r3qn/6t2l/8WfAv/KqBj/9O3Q/72cev+ERgX/hkgI/4ZICP+GSAj8hkgI
-XoZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAhkgIFYZICNGGSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwf/yq6T//jz2//i
-znz/49GE//r25//eyG//xJ0A/8WfAf/FnwH/xZ4A/8yrIf/28dn/2sFd/8OcAP/Zv1b/8Ojd/5hk
-Lv+FRgb/hkgI/4ZICP+GSAj/hkgImYc+AgCGRwcAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAhkgI
-NIZICO6GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+ERQT/rIFW//n16//m1I3/4c14//Tt0P/r3ab/xaAD/8WfAf/FnwH/xJ0A/9e8UP/3
-8t3/zq0n/8SeAP/p25z/18Ow/4hLDP+GSAj/hkgI/4ZICP+GSAj/hkgIxYZICA6GSAgAAAAAAAAA
-AAAAAAAAAAAAAAAAAACGSAgAhkgIUoZICPuGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRgb/lmAp//Do3//r3qb/4Mt1/+7js//07dH/
-yqYV/8WfAP/FnwH/xJ4A/+PQhf/x58D/x6IJ/8mmE//07c7/upd0/4RFBP+GSAj/hkgI/4ZICP+G
-SAj/hkgI34ZICCCGSAgAAAAAAAAAAAAAAAAAAAAAAI1NDQCHSQkAh0kKaodJCf+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAf/ik4Q
-/9/Ovv/y6sL/4Mx2/+jZmv/59uf/0LI0/8SeAP/FnwH/xqAG/+3hsf/n15X/xJ0A/9GyNP/17+D/
-onJC/4RGBf+GSAj/hkgI/4ZICP+GSAj/hkgI7YZICDCGSAgAAAAAAAAAAAAAAAAAAAAAAItQEwCL
-ThAAi08ReYpNEP+JTA7/iEoL/4dJCv+GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hUcG/8mukv/489r/4c57/+TSiP/69+n/2cBb/8SdAP/FnwD/yaYU
-//Ttz//dx2v/w5wA/9rBW//t49j/k1si/4VHBv+GSAj/hkgI/4ZICP+GSAj/hkgI84ZICDyGSAgA
-AAAAAAAAAAAAAAAAAAAAAI9VGQCPVRkAj1UZfI9UGP+NUhb/jFEU/4tPEf+KTQ//iUsN/4hKC/+H
-SQn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/7ONZv/69uj/5NKF/+LO
-fP/4897/49CF/8SeAP/EngD/zq0o//fy3f/Vukn/w5wA/+PQgf/g0MH/ik4R/4ZIB/+GSAj/hkgI
-/4ZICP+GSAj/hkgI9YZICD+GSAgAAAAAAAAAAAAAAAAAAAAAAJJbIQCUXCIAlFwjc5NbIf+SWR//
-kVcc/5BWGv+OVBf/jVIV/4xQE/+LThH/ik0P/4hLDP+HSgv/h0kJ/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hEYF/6FxQP/38un/59eU/+HMd//z68v/7N+s/8agBP/EngD/07Y+//jz4P/QsDD/xJ4A/+rd
-of/Su6b/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI8YZICDeGSAgAAAAAAAAAAAAAAAAAAAAA
-AJZkHgCYYywAmGIsX5hiK/6WYCj/lV4m/5RcI/+TWyD/klke/5BXG/+PVRn/jlMX/41RFf+MUBL/
-ik4Q/4lMDv+ISwz/h0kK/4dJCf+GSAj/hUcG/5RdJP/u5tz/7N+n/+DLdf/v47X/8+vL/8ilEf/E
-nQD/2cBZ//bw2P/LqRz/xqEG//Dmu//Fp4r/hEYF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI54ZI
-CCiGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAACcaTQAnGk0Q5xpNPabZzH/mmUv/5hjLP+XYSr/lmAn
-/5VeJf+UXCL/k1og/5FYHf+QVhv/j1UY/45TFv+NURT/i08S/4pNEP+JTA3/iEoL/4xRFP/i08X/
-8ee7/+DLdf/q3KL/+PPg/82sJf/EnQD/4Mt4//Lqx//Iowz/yaYS//Tt0P+3kW3/hEUE/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI04ZHCBaGRwgAAAAAAAAAAAAAAAAAAAAAAAAAAACgbzwAoG88JKBv
-POKfbjr/nmw4/51qNf+caDP/m2Yx/5llLv+YYyz/l2Ep/5ZfJ/+VXST/k1si/5JaH/+RWB3/kFYa
-/49UGP+NUhb/jFET/4tPEv/Uvqn/9e7O/+HMd//m1pH/+vfp/9O2P//EnQD/59iY/+zgrf/FnwH/
-za0l//Xv3f+ofE//hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIsYVHCAaGRwgAAAAAAAAAAAAA
-AAAAAAAAAAAAAACkdUQApHVECqR2RbmkdET/o3NB/6FxPv+gbzz/n206/55rN/+dajX/m2gy/5pm
-MP+ZZC7/mGIr/5dgKf+WXyb/lF0k/5NbIf+SWR//kVcc/45TFv/Hqoz/+PTe/+LOff/k0YX/+vbo
-/9rCX//FnwP/7+S4/+XTjP/EnQD/07Y+//Ps4P+caTb/hUYF/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgIfIZICACGRwcAAAAAAAAAAAAAAAAAAAAAAAAAAACofE8Aqn1PAKl8Tnqoe03/p3lL/6Z4SP+l
-dkX/o3RD/6JyQP+hcD7/oG47/59tOf+dazb/nGk0/5tnMv+aZTD/mWQt/5diK/+WYCj/lV4l/5Ja
-H/+6lnL/+fbo/+TShf/iznz/9/Ld/+LQg//JpRP/9e7S/9zFZ//DnAD/28Nf/+zi1/+SWiD/hUcG
-/4ZICP+GSAj/hkgI/4ZICP+GSAjxhkgIPoZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-rIJVAKyCVTOsglbqq4BU/6p+Uf+pfE//qHtM/6d5Sv+md0f/pHVF/6NzQv+ickD/oXA9/6BuO/+e
-bDj/nWo2/5xpNP+bZzH/mmUv/5dhKf+vhlz/+PPr/+fXk//hzHf/8+zL/+veqP/QsDH/+PPf/9S4
-Q//DnAD/5NKE/+HRwv+NUhb/iEoL/4dJCv+GSAn/hkgI/4ZICP+GSAjAhkgID4ZICAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAr4ZcAK+GWwawiF6nsIdd/6+FWv+ug1j/rIJV/6uAU/+qflH/
-qXxO/6h6TP+meEn/pXdH/6R1RP+jc0L/onE//6FvPf+fbjr/nmw4/5xpNP+oekz/8uvi/+vepv/g
-y3X/7uO0//Pqyf/bw2T/9/Hb/82sI//FnwH/7eGs/9K7pf+NUhX/jFAT/4tPEf+KTQ//iUsN/4hK
-C/2HSQlqiEoKAIZICgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALSOZgC0jmZEtI5m
-77OMZP+yimH/sYhe/7CGXP+uhVn/rYNX/6yBVf+rf1L/qn1Q/6h8Tv+nekv/pnhJ/6V2Rv+kdET/
-o3JB/6FwPv+kdUT/59vP//Hnvf/gzHX/6dqc//j04f/s4K7/8efB/8ejC//JpRH/9O3O/8Kig/+Q
-Vxv/kVcc/49WGv+OVBf/jVIV/4xQE8yKTQ8Zik0PAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAALaSbAC2kWsGuJNumbiTbf+2kWr/tY9o/7SNZf+zi2P/sopg/7GIXv+vhlv/roRZ
-/62CVv+sgVT/q39S/6l9T/+oe03/p3lL/6Z4SP+kdUX/2cWy//bx1v/hzXr/5NOI//r36f/9/Pf/
-5taT/8SeAP/PsC//9vHi/7OLY/+VXiX/lV4l/5RcI/+TWyD/klke95BWGl+SWx8AjlMXAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALyeeQC7mHQAu5h0J7yZddS7mHP/upZx/7mU
-b/+3kmz/tpBq/7WPZ/+0jWX/s4ti/7GJYP+wh13/r4Zb/66EWP+tglb/q4BT/6p+Uf+oekz/ya6S
-//r26f/k0ob/4c57//Xv1P////7/2sFd/8OcAP/awl3/8erh/6d6S/+aZjD/mmUv/5hjLP+XYSr/
-ll8npJNbIAuUXCIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC+
-nXoAwaB+AL+efFG/nnztvp16/72bd/+8mXX/u5dz/7mVcP+4lG7/t5Js/7aQaf+1jmf/s4xk/7KK
-Yv+xiV//sIdc/6+FWv+sglb/vJl1//fz7P/p253/4Mx1/+7jtP/59OP/zq0n/8SeAP/o2Zj/49TH
-/6JyQf+fbTr/nmw4/51qNf+baDLNmWQuJpplLwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAwqKCAMGfgALCo4NvwqOD9MGigf/AoH7/v558/76cef+9
-mnf/u5h0/7qXcv+5lXD/uJNt/7eRa/+1j2n/tI5m/7OMY/+yimD/tI1l/+vh1//y6cH/4cx3/+fW
-kv/m1pP/xqAE/8qnF//17tH/zrSc/6R0Q/+kdEP/o3NB/6FwPt2fbTo+oXA9AJxqNgAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMWoiQDEp4gG
-xqiKdsaoivPFp4j/xKWF/8Kjg//BoYD/wJ9+/7+de/+9nHn/vJp2/7uYdP+6lnL/uZRv/7iTbf+2
-kWr/tI5m/9bBrP/489//38py/9zFZP/MqyH/xJ0A/9nAWP/28ej/upZx/6h7Tf+oe03/p3lK3KV2
-Rkasg1UAo3JDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADKrJAAyqyPBcqtkGXKrZDmyayP/8iqjP/GqIr/xaaH/8Okhf/CooL/
-waGA/8Cfff++nXr/vZt4/7yZdv+7mHP/uZVw/8Kjg//07uj/5NKI/8ikD//DnAD/yqcX//HowP/h
-0sP/sIdd/66EWP+sgVXLqn5QPLOLYgCpfE4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAzLGVAMuxlQHMsZVAzbGW
-wsyxlf3Lr5P/yq2Q/8mrjv/HqYz/xqiJ/8Smh//DpIT/wqKB/8Ggf/+/nnz/vp16/7yadv/Xw67/
-+fbr/+XTi//bw2D/7uOy//Tu6P/Co4P/s4ti9bKJYJ+vhlsisYheAK6EWQAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAANC4oQDPtJkAz7WbF8+1m3nPtZvczrSZ/s2yl//MsJT/y66S/8mtkP/Iq43/x6mL
-/8WniP/EpYb/w6OD/8GhgP/CooH/2cWy//Hq4//07uj/6+DW/8uwlPq4k27FtpFqV7SNZgm0jmcA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0rqiANO7owHRuaAk0bifedG4
-n8nQt530z7Wb/86zmf/Nspb/zLCU/8qukf/JrI//yKqN/8apiv/Fpoj/w6SE/8aoif7HqYvrwqKB
-tbuYdF67mHQUuZVvAL6eewAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAADVvaYA18CqANO7pBLSuqJC0rqhfdG5oK3Rt57N0Lac38+0mufNspfpzLGV5suv
-ktvJrI/FyKqMoMWniGzCooIyv517Cr6ceQDGpocAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADXxrMAz6SFANS+pwXS
-uqMS0rmhH9G4nijPtpwrzrSZJs2ylxzLsJQNzLGWAsuvkwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////////AAD///////8AAP///////wAA//+AA///AAD/
-/AAA//8AAP/4AAA//wAA/+AAAA//AAD/wAAAB/8AAP+AAAAD/wAA/wAAAAH/AAD+AAAAAP8AAPwA
-AAAA/wAA/AAAAAB/AAD4AAAAAD8AAPgAAAAAPwAA8AAAAAAfAADwAAAAAB8AAOAAAAAAHwAA4AAA
-AAAfAADgAAAAAA8AAOAAAAAADwAA4AAAAAAPAADgAAAAAA8AAOAAAAAADwAA4AAAAAAPAADgAAAA
-AA8AAOAAAAAADwAA4AAAAAAPAADgAAAAAB8AAPAAAAAAHwAA8AAAAAAfAADwAAAAAD8AAPgAAAAA
-PwAA+AAAAAB/AAD8AAAAAH8AAP4AAAAA/wAA/gAAAAH/AAD/AAAAA/8AAP+AAAAH/wAA/8AAAA//
-AAD/8AAAH/8AAP/4AAB//wAA//8AAf//AAD//+AP//8AAP///////wAA////////AAD///////8A
-AP///////wAAKAAAAEAAAACAAAAAAQAgAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOncnQDp3aAC6dqbEenamyvo2ZtG6dqbXejZmm7o2Zl3
-6NmYd+jYl3Hn2JVi59eTTOfWkTLm1pAX5taRBdrIZQDy5rkAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOzt6wDm1owA59iSBefWkSbn15Jg
-59eTnefXlMrn15Tn59eT9ufXkv3n15H/5taQ/+bWj//m1Y7/5tWN/uXUjPnl1Irs5dOI1OTShqvj
-0YNx4tCANeHPfwvfyXEA5teTAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-5NWJAOXShADk0oYN5NOHTOXTiaLl1Irh5dSK/OXTif/l04j/5NOH/+TShv/k0oX/5NGE/+PRg//j
-0IL/49CB/+PQgP/iz3//4s9+/+LPff/iznz/4c57/uHNeezgzHe34MtzY9/Kbxndxm4A38lwAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADh6+EA4c15AOHOewniz31Q4s9/t+PQgPXj0H//4s9+/+LPff/i
-znz/4s57/+HOev/hzXn/4c14/+HMd//gzHb/4Mx1/+DLdP/gy3P/38py/9/Kcf/fynD/38lv/97J
-bf/eyG3/3shs/97HavvdxmjP3MRkbdvDYBXawV0A3chqAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADfy3EA38tvAd/KcTDg
-y3Sl4Mx19ODLdP/gy3P/38py/9/Kcf/fynD/38lv/97Jbv/eyG3/3shs/97Ha//ex2r/3cZp/93G
-Z//dxWb/3cVl/9zFZP/cxGP/3MRi/9zDYf/bw2D/28Nf/9vCXv/bwl3/28Fc/9rBW/vawFjD2b5U
-TNe8TwXXvVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAADcxWMA28RjCN3FZmTdx2ne3cdp/93GaP/dxmb/3cVl/9zFZP/cxGP/3MRi/9zD
-Yf/cw2D/28Nf/9vCXv/bwl3/2sFc/9rBW//awVr/2sBZ/9rAWP/Zv1b/2b9V/9m/VP/ZvlP/2L5S
-/9i9Uf/YvVD/2L1P/9e8Tv/XvE3/17tM/9e7Su/WuUeJ1bhBFtW4QwDXuUIAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOTVhwDZv1gA2b9YFNrBW5Dbwl3128Fc/9rB
-W//awVr/2sBZ/9rAWP/Zv1f/2b9W/9m/Vf/ZvlT/2L5T/9i9Uv/YvVH/2L1P/9e8Tv/XvE3/17tM
-/9e7S//Xu0r/1rpJ/9a6SP/Wukf/1rlG/9W5Rf/VuET/1bhD/9W3Qv/Ut0H/1LdA/9S2Pv/Utj7/
-07Y9/dO0ObXSsjUq07Q3ANGzOQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANnD
-VADXu00A17tMG9i9T6nYvVH92L1P/9i8Tv/XvE3/17xM/9e7S//Xu0r/1rpJ/9a6SP/WuUX/1bhD
-/9W3Qv/Vt0H/1bhC/9W4Qv/Vt0H/1LdA/9S2P//Utj3/1LY8/9O1O//TtTr/07Q5/9O0OP/StDf/
-0rM2/9KzNf/SszT/0bIz/9GyMv/RsTH/0bEw/9GxL//QsC7/0K8szc+tJjfTuUIAzKUTAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAOvr6wDTtTwA2L1QGtS3QK7VuET/1bhD/9W4Qv/Vt0H/1LdA
-/9S2P//Utj7/1LY9/9O1Ov/TtTv/2L5S/97IbP/gynL/3MRh/9a5Rv/RsjP/0bEy/9GyMv/RsTH/
-0bEw/9GxL//QsC7/0LAt/9CvLP/Qryv/z68q/8+uKf/Prij/z60n/86tJf/OrST/zqwj/86sIv/O
-qyH/zasg/82qHv/NqyHU3cZpOLqKAAD9/f4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///8A////
-Evjz36bk0YX/1LY+/9GyM//SszT/0bIz/9GyMv/RsjH/0bEw/9CwLP/Wukn/6tyi//n15f/9/Pf/
-/fz4//z78//38dn/59eU/9S2Pv/OrCL/zqwj/86sIv/NrCH/zasg/82rH//Nqh7/zKod/8yqHP/M
-qRv/zKka/8ypGf/LqBj/y6gX/8unFv/LpxX/yqYU/8qlEf/Nqx//5dSM//v57877+fAt////AMml
-EgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADIow4AsX0ABuDMeYn489/8/v36/+/jtv/XvE7/zq0l/86sI//OrCL/
-zasg/8+uKP/eyG3/9/HZ//79+v/179T/7eGv/+vdpf/v5Lj/+PTh///+/f/07c//17tL/8qmFP/L
-pxX/yqcU/8qmE//KphL/yqUR/8mlEP/JpA//yaQO/8mkDf/Jowz/yKML/8ijCv/Iogn/x6II/8eh
-Bf/LqBn/6tyi//7++//w5r3/0rQ7usCXABnFnwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADEoAMAyKAFAMagBFzGoATz
-z7Au/+nbof/9/Pb/+fbm/+fWkf/XvE7/07U7/9rBWv/t4a7//fz2//Xv1P/cxWb/0LEy/9W5Rv/e
-yG3/4c14/+PQgf/u47T//fz2//bw2P/TtTv/x6EG/8ehB//HoQb/x6EG/8ahBf/GoAT/xqAE/8ag
-A//GoAP/xp8C/8WfAv/FnwL/xZ8B/8WfAP/How3/6Nib//7+/P/q3KT/yqga/8SeAP7EngCPuIwA
-BrySAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAxZ8CAMSeAijEngDWxJ4A/8SeAP/GoQn/2L5U//Hnwf/9/Pj//fv1//v47P/+
-/fr/+/nv/+fXlv/NrCT/xJ4A/8SeAP/EngH/zKsh/9zEZP/hzXn/4c14/+zfq//+/fn/8Oa9/8qn
-F//FngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwL/4Mt4
-//79+v/r3qj/yaUU/8SeAP/EngD/zKog8uXUkVTGoQwA////AAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/f36AP///wXu4rWY4c19/86vK//F
-ngH/xZ4A/8SeAP/IpRH/1rtM/+TSif/p2qD/4s+C/9K0Ov/GoAb/xJ4A/8SeAP/IpBD/3MVl/+bV
-kP/dxmn/38lv/+HNef/hzXr/8ee///7+/f/gzHn/xZ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/EngD/07ZA//r36//y6sj/zKof/8SeAP/EngD/0bI1//Lqxv/8+/nJ
-5dfLGuvg1gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAA////AP///wD///9C////7v/////489//3shw/8mmFP/EngD/xJ4A/8SeAP/EngD/xZ8B/8Se
-AP/EngD/xJ4A/8WeAf/RsjX/7eGx//7++////////Pnw/+nbn//hzHf/4c14/+TShv/59ub/9/Lc
-/82sJv/EngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/yKQP/+7jtv/8+fD/
-1blI/8SeAP/EngD/z7Aw//Xu0v/49PH/v59+/pBXHXfi0ccAhkgHAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKJzQwCbaTUHwqSEp8Smh//Wwaz/8uzm//7+
-/P/y6sb/28Nh/8uoGv/FnwL/xJ0A/8SdAP/EnQD/xZ8C/8yrIv/hzn7/+vbl//r49v/gz7//zrac
-/+7l3f/8+vH/6NmY/+HMd//hzHf/7eGw/////v/gzHr/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xJ4A/9nAWv/+/fn/5taV/8WgBP/FngD/yaYW//Dlu//59vT/tpBq/4ZICP+F
-RwfVhkgIIIZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACHSQkAh0kJOoZICeyERgX/iEsM/5pmMf/GqYv/8erk//7+/P/38df/6dqc/97JcP/awl//3shu
-/+nanv/49N7//v38/+TWyf+tg1j/i1AT/4VGBf+neUv/9vLu//bw1//iz37/4cx4/+TSh//7+Ov/
-8+zM/8mmFv/FnwD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8A/8ikD//w5rz/+fbm/8+wL//E
-ngD/xZ8B/+HNff/+/fz/xaeJ/4dJCv+GRwf/hkgI/oZICHCGSQgAhUYIAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACFRggAwcAmAIZICIyGSAj/hkgI/4ZICP+FRgX/hkgI
-/5llL//Co4T/6NzR//f08f/9/Pv//v38//37+//28e7/4dHC/7mUcP+QWB3/hEUF/4ZHB/+GSAj/
-h0oL/9C4oP///vv/6dqd/+HMd//hzXj/8ejC//38+P/Wu03/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8SeAP/VuUj//fz2/+fXl//FnwP/xJ4A/8+vLf/59eL/5NbJ/5BYHv+FRwb/hkgI/4ZI
-CP+GSAjChUcIEIVHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkcI
-AIZHCBiGSAjRhkgI/4ZICP+GSAj/hkgI/4ZICP+FRgb/hUcG/49WGv+dbDj/q4BT/6+HXf+qf1L/
-nGk1/4xRFP+ERgX/hUcH/4ZICP+GSAj/hkgI/4RFBP+kdUX/+PXy//Pryf/hzXn/4cx3/+nam//+
-/vz/5taT/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwP/59iZ//379P/Tt0H/xJ4A/8Wf
-AP/k0oj//Pv6/7CIX/+ERQT/hkgI/4ZICP+GSAj/hkgI8oZICEGGSAgAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIZICACGSAhJhkgI9oZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+FRwf/hUYF/4RFBP+ERQT/hEUE/4VGBf+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-Rwf/i1AT/+DQwP/8+u7/5NOI/+HMd//j0YL/+vbn//Tt0P/Jphb/xZ8A/8WfAf/FnwH/xZ8B/8Wf
-Af/FngD/y6ke//fx2//x6ML/yKQO/8SeAP/Lqh7/9/La/+TWyf+OVBn/hUcH/4ZICP+GSAj/hkgI
-/4ZICP+GSAiCh0kJAIVHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIVJBwCHSAkA
-hkgIgYZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RGBf/An37////9/+rdpP/hzHf/4c15//Lq
-x//8+vP/0rU9/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9e9Uf/+/fr/4c5+/8SeAP/EnQD/2sFe
-//7+/P+9m3j/hEYF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIuoZHBwqGRwgAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAACGSAcAhkcHB4ZICLKGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+ERQX/onNC//n29P/y6sX/4c14/+DMd//r3qf////+/97Jcv/EngD/xZ8B/8WfAf/FnwH/xZ8B
-/8WeAP/l1I3//fv2/9O2QP/EngD/xqAE/+vdpf/18O3/nGk1/4VGBf+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICOCGRwgjhkcIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkcHAIZHCBiG
-SAjUhkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/49WHP/p3dP/+vbk/+PQgf/hzHf/5tWO
-//389v/r3qf/xqAE/8WfAf/FnwH/xZ8B/8WfAP/Iow3/8ejD//bw1//Kpxj/xJ4A/8upHf/489z/
-386+/4pPEf+GSAf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj0hkgIQoZICAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAIZICACGSAgshkgI6YZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSQn/0rqj//7++P/m1pH/4cx3/+LPgP/59OL/9e7T/8qnF//FngD/xZ8B/8WfAf/EngD/
-zq0o//r26P/r3qn/xqAE/8SdAP/VuUb//v34/8Olhv+FRgX/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/oZICGCGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAkAhkgJP4ZI
-CPOGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/7mVcP////7/7N+o/+DMd//hzXn/
-8+vJ//v57//QsjT/xJ4A/8WfAf/FnwH/xJ0A/9a6TP/+/fr/4Mx5/8SeAP/EngD/4Mt3//z7+v+q
-f1L/hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAh4hkgIAIhHCAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAiUwOAIlND06JTA36iEoM/4dJCv+HSQn/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4RFBP+jdET/+vf1//Lowv/hzXj/4Mx3/+3hsP/+/vz/2cFb/8SdAP/FnwH/xZ8B/8SdAP/f
-yXL//v77/9e9UP/EnQD/xaAD/+vdpf/07ur/mGQu/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgIiodJCQCFRwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI1RFACNURRWjFEU
-/IxPEv+LThH/ik0P/4lLDf+ISgv/h0kK/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwb/k1wk/+7m3v/38tr/4s59/+HMd//o
-2Zr//v78/+PRh//EngD/xZ8B/8WfAf/FnwH/6NiY//v57//QsTD/xJ4A/8ikD//07Mr/5tnO/41T
-F/+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICJSJTw8AhUcHAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAACQVhsAkFYbVpBWGvyPVBj/jlMW/41SFf+MUBP/i08S/4pOEP+JTA7/
-iEsN/4hKC/+HSQn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgH/4pOEP/ezb3//Pru/+TShv/hzHf/5dOK//z68v/t4K//xqAG/8WfAf/FnwH/xqEI/+/k
-uP/38tz/y6gb/8SeAP/NqyL/+vfl/9fCrf+HSgv/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAiTh08OAIZHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAk1wiAJNbIk6TWyH6
-klof/5FYHf+QVxv/j1UZ/49UGP+OUxb/jVEU/4xQE/+LTxH/ik0Q/4lMDv+ISwz/h0oL/4dJCf+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwf/y7GW////+v/n15X/4cx3/+LP
-f//59OL/9O3R/8mmFP/FnwD/xZ8A/8mlE//07dH/8unG/8ijDf/EnQD/0bQ5//389P/Hq47/hUYG
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIiYdJCQCFRwcAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAJZgKACWYCg+lmAo85VfJv+VXST/lFwi/5NaIP+SWR7/kVgd/5BWG/+P
-VRn/jlQX/41SFf+NURT/jFAT/4tOEf+KTQ//iUwN/4hKDP+HSQr/h0kJ/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hEUE/7iTbv////7/696n/+DMd//hzXn/9O3O//r36v/Oriv/xJ4A/8WeAP/NqyP/+fXl
-/+zfq//GoAP/xJ0A/9e9Uf/+/vv/uZVx/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICHiGSAgAhkcJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACaZS8AmmUvLJplL+mZ
-ZC3/mGIr/5dhKv+WYCj/lV4m/5RdJP+UXCL/k1og/5JZHv+RVxz/kFYa/49VGP+OUxf/jVIV/4xR
-FP+MTxL/i04R/4pND/+JSw3/iEoL/4dJCv+GSAn/hkgI/4RFBP+meUv/+/n4//Dmu//hzHf/4cx3
-/+/luf/9/Pj/1blI/8SdAP/EngD/0bM4//z78//l1I7/xJ4A/8SdAP/dx2z//fz8/62CV/+ERQT/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP6GSAhghkgIAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAnGo1AJxqNRedajXUnGk0/5tnMv+aZjD/mWUv/5hjLf+YYiv/l2Ep/5Zf
-J/+VXiX/lF0j/5NbIf+SWh//kVke/5BXG/+QVhr/j1QY/45TFv+NUhX/jFAT/4tPEv+KThD/iUwO
-/4hLDP+GSAj/mmUw//Tu6f/07c7/4c15/+DMd//r3qb///7+/93Gaf/EnQD/xJ0A/9e9Uv/+/vv/
-3shv/8SdAP/EngD/5dSM//n29P+gbz3/hEYF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj0hkgIQYZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKBuOwCgbjsHoG88sp9u
-O/+fbTn/nms3/51qNf+caTP/m2cy/5pmMP+ZZC7/mGMs/5diKv+XYCj/ll8n/5VeJf+UXCP/k1sh
-/5JaH/+RWB3/kFcb/49VGf+OVBj/jlMW/41RFP+MUBP/ik4Q/5NaIf/p3tT/+fXh/+LPfv/hzHf/
-59iW//79+//l1I3/xZ4A/8SdAP/eyXD//v77/9e9Uf/EnQD/xqAE/+zfq//y6+b/lmAo/4VGBv+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI4IZHCCOGRwgAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAACic0AApHRFAKNzQoCjc0L/onJA/6FwPv+gbzz/n246/55sOP+dazb/nGk1
-/5xoM/+bZzH/mmUw/5lkLv+YYyz/l2Eq/5ZgKP+VXyb/lV0k/5RcIv+TWyD/klke/5FYHP+QVhv/
-j1UZ/45TF/+QVhv/3cy6//z67//k0of/4cx3/+XTif/8+vL/7OCu/8agBf/FngD/5taT//z68v/R
-sjX/xJ4A/8ijDv/z68f/59vQ/45UGP+FRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CLqFRwcKhUcIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKZ4SQCmeElIpnhJ
-9aV3R/+kdUX/pHRD/6NzQf+icT//oXA9/6BvO/+fbTr/nmw4/51rNv+caTT/nGgz/5tmMf+aZS//
-mWQt/5hiK/+XYSn/lmAo/5VeJv+UXST/lFwi/5NaIP+SWR7/kFYb/9C3nv///vn/59eT/+HMd//j
-z4D/+fXk//Pszf/JpRH/xqEG/+7jtf/489//y6kd/8SeAP/Mqh7/+fXh/9rHtf+ISw3/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAiBh0gIAIRICAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAACpfE4AqXxPGKl9T9CpfE7/qHpM/6d5Sv+meEj/pXZG/6R1RP+jdEL/
-onJB/6JxP/+hcD3/oG47/59tOf+eazf/nWo1/5xpNP+bZzL/mmYw/5llL/+YYy3/mGIr/5dhKf+W
-Xyf/lV4l/5JaH//Co4L////9/+rdo//gzHf/4c16//Xu0f/59ub/zawm/8mlE//179T/8ejD/8ej
-DP/EnQD/0bM3//388//Kr5P/hUcH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjyhkgI
-QYZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArYBTALSXgQCsgVWK
-rIFU/6uAU/+qflH/qX1P/6h7Tf+oekz/p3lK/6Z3SP+ldkb/pHVE/6NzQv+ickD/oXE+/6BvPP+f
-bjr/n205/55rN/+dajX/nGgz/5tnMv+aZjD/mWQu/5hjLP+WXyf/tpBo//38+//v5Lb/4cx3/+HM
-d//w5rz//fz3/9S3Qv/Orin/+/jt/+nan//FnwH/xJ0A/9i/V//+/vz/upZy/4ZICP+HSgr/h0kJ
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIwYVHBxCGRwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAACvhlsAr4ZbOq+GW+yuhVn/rYNX/6yCVv+sgFT/q39S/6p+Uf+p
-fE//qHtN/6d6S/+meEn/pXdH/6V2Rf+kdEP/o3NB/6JyQP+hcD7/oG88/59tOv+ebDj/nWs2/5xp
-Nf+caDP/mmUv/6uAU//38+//9OzM/+HNef/gzHf/696m///+/v/cxWj/1rpL//79+//gy3b/xJ4A
-/8SeAP/hzn3//Pr6/6yBVf+KTQ//i04R/4pND/+JSw3/iEoM/4dJCv+HSQn/hkgI/YZICG6GSAgA
-hkgJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAsYpgALGJYAey
-imGmsoph/7GIXv+wh13/r4Zb/66EWf+tg1f/rIJV/6uAU/+rf1L/qn5Q/6l8Tv+oe03/p3lL/6Z4
-Sf+ld0f/pHVF/6R0Q/+jc0H/onE//6FwPf+gbzv/n205/55rN/+ldkX/7eTb//n14f/iz3//4cx3
-/+fWkv/+/fn/59aW/+DLef/+/fr/1rtN/8SdAP/FoAP/696n//Xw7P+hcD3/jlMW/45TF/+NUhX/
-jFEU/4tPEv+LThD/ik0P/4lLDdWHSQogh0kKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAALGRawC1j2cAtI9nQbWPZ+20jWb/s4xk/7KLYv+yiWD/sYhe/7CH
-XP+vhVr/roRY/62CVv+sgVX/q4BT/6p+Uf+qfVD/qXxO/6h6TP+neUr/pnhI/6V2Rv+kdUT/o3RC
-/6JyQf+hcT7/onJA/+DQwP/9+/L/5dSL/+HMd//j0YP/+vfp//LqyP/u4rX/+vbo/86tKP/EngD/
-yaUS//Xtzv/p3dP/mmUv/5JZHv+RWB3/kFcc/49WGv+PVBj/jlMW/41SFf2MUBN2lFgeAIlPEAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAtpJsALWR
-awW4k22VuJNt/7eRa/+2kGn/tY5n/7SNZf+zjGP/soph/7GJX/+wiF7/sIZc/6+FWv+uhFj/rYJW
-/6yBVP+rgFP/qn5R/6l9T/+oe03/p3pM/6Z5Sv+md0j/pXZG/6NzQf/QuJ/////8/+nbnv/hzHf/
-4c16//Xt0P/9+/b//Pv0//HoxP/IpA7/xJ4A/8+vLf/8+ez/2cWy/5dhKf+WXyb/lV4l/5RcI/+T
-WyH/klkf/5FYHf+QVxvHj1QXGY9UGAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC6lnIAupZyJ7qXc9W6lnL/uZVw/7iTbv+3kmz/tpFq
-/7WPaP+1jmf/tI1l/7OLY/+yimH/sYlf/7CHXf+vhlv/roRZ/62DV/+sglb/rIBU/6t/Uv+qflD/
-qXxP/6h7Tf+md0j/waGA//38+//v5Lj/4cx3/+HMd//u47P////////////m1ZL/xZ8A/8SdAP/Z
-wFj///78/8eqjP+YYyz/mWQu/5hjLP+XYSr/lmAo/5VfJv+VXSTxk1shUpVdJACSWR0AAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAvJp2
-AL+dewC9m3hZvZt48ryadv+7mXX/u5dz/7qWcf+5lW//uJNu/7eSbP+2kWr/tY9o/7SOZv+0jGT/
-s4ti/7KKYP+xiF7/sIdc/6+GW/+uhFn/rYNX/6yCVf+rgFP/qn5Q/7aQaf/18ez/9vDW/+LOfP/h
-zHf/59iW//389//+/fv/2b9X/8SdAP/FngD/5dSP//v5+f+2kGn/nGgz/5xpNP+baDP/m2Yx/5pl
-L/+ZZC3+l2IrjZVdJAaWXycAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/nnwAvp17BcCffYbAn338v557/76cef+9m3j/
-vJp2/7uYdP+6l3L/uZVx/7mUb/+4k23/t5Fr/7aQaf+1j2f/tI1m/7OMZP+yi2L/solg/7GIXv+w
-hlz/r4Va/66EWP+vhlv/59vO//z68P/l04r/4cx3/+PQgf/49OL/+PPf/82rI//EngD/yKQQ//Pr
-yP/w6OL/qn5Q/6BvO/+gbjv/n205/55rN/+dajX/nGgztpplMBeaZjAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAMKiggDCooIQwqODosKjg/7BooH/waB//8Cfff+/nXv/vpx5/72bd/+8mXX/u5h0/7qWcv+5
-lXD/uJRu/7iSbf+3kWv/tpBp/7WOZ/+0jWX/s4xj/7KKYf+xiV//r4Zb/9S+p/////7/696n/+HM
-d//hzHj/8Oa7/+jZnP/FoAP/xJ4A/9K1O//9+/L/3Mu5/6V2Rv+kdET/o3NC/6JyQP+hcT7/oG88
-zJ5sOCufbToAnGs2AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxKeHAMSmhxjFp4isxaeI/sSlhv/D
-pIT/wqKC/8GhgP/AoH7/v558/76dev+9nHj/vJp3/7yZdf+7l3P/upZx/7mVcP+4k27/t5Js/7aR
-av+1j2j/tI5m/7OLY//CooL/+fb0//Pryf/gzHb/4c57/+LOff/QsTH/xJ4A/8WeAP/j0IX//v39
-/8aoif+neUr/p3pL/6Z4Sf+ld0f/pHVF0aNzQTWkdUMAonJDAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAMuslADIqowAyKqNGcirjaXIqo38x6mL/8aoif/Fpof/xKWF/8Okg//CooL/waGA/8Cf
-fv+/nnz/vp16/72beP+8mnb/u5l0/7uXc/+6lnH/uZRv/7iTbv+3kmv/uJNu/+jb0P/8+e7/3cZo
-/9m/Vf/Pryv/xZ8B/8SeAP/MqiH/9vDX//Dp4v+0jWX/q39S/6t/Uv+qfVD/qHxOy6d5SjWne00A
-qHpKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMqtkADKrZASyq6Ri8qu
-kfTKrZD/yauO/8iqjP/HqYv/xaeJ/8Smh//DpIX/wqOD/8Gigf/BoH//wJ99/7+ee/++nHn/vZt4
-/7yadv+7mHT/updy/7iUb//OtJr//Pv6/+3gr//JpRT/xJ0A/8SeAP/FoAX/5NKJ//7+/v/Uvqf/
-r4Va/6+FWv+uhFj9rIJVs6t/UiirgFMArIJVAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAzLGVAMyxlQfMsZVgzbGW28yxlf/Lr5P/yq6R/8msj//Iq47/yKqM
-/8aoiv/Fp4j/xKaG/8OkhP/Co4P/waGB/8Cgf//An33/v517/76cef+9mnf/vpx5/+TWyP/+/vv/
-6tyj/9O1Pv/RsjX/49GG//379P/t5Nv/u5dz/7OLYv+yimHusYhehq+FWhWvhlsAr4RcAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADPtJoA0bei
-AM60mizPtJqgzrSZ8s6zmP/Nspb/zLCU/8uvkv/KrZH/yayP/8irjf/HqYz/xqiK/8WniP/EpYb/
-w6SE/8Kigv/BoYD/wKB+/7+de//Fp4f/6d3S//79/P/9+/T//Prx///+/f/w6OD/xqmK/7aRa/q2
-kGm/tI1mSbOLYwSzjGMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADQtp0A0LedCNC3nkzQt56z0Led88+1m//OtJn/
-zbOX/8yxlf/MsJT/y66S/8qtkP/JrI//yKqN/8epi//GqIn/xaaH/8Slhf/DpIP/waGA/8Smhv/W
-wKr/4tPE/+PUxf/Yw67/w6WF+rqXcsu5lnFpuJNuE7mUbwC3lG4AAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAANm3owDQuqEA0rmiDNK5oUfSuaCc0big3tG3nvvQtp3/z7Wb/860mf/Nspf/zLGV/8uvk//K
-rpH/yq2Q/8mrjv/Iqoz/x6mL/8Wnif/Epob/wqOD/8Kigf7BoH/pv517sr2beF69m3gXoqZsALud
-eAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADSu6QA07ylBNO7oyPS
-uqJa0rqil9K5ocbRuJ/k0bee9NC2nPzPtZr/zrOY/82ylv/MsJX/y6+T/cqukffJrI/qyKqN0Mep
-iqbFpohsw6SFMMKiggnDooEAwqSIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0r2kANO/pgLTvKQP07ujJ9K5oUDRuaBY0bieaNC2
-nXDPtZtxzrOZa82yl13MsJRHyq6SLsqtkRTKrJAEyKyPAM2ukwAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAD//////////////////////////////////////////////wAD////
-///4AAB//////+AAAB//////gAAAB/////4AAAAB/////AAAAAD////4AAAAAH////AAAAAAP///
-4AAAAAAf///AAAAAAA///4AAAAAAB///gAAAAAAD//8AAAAAAAP//gAAAAAAAf/+AAAAAAAB//wA
-AAAAAAD//AAAAAAAAP/8AAAAAAAAf/gAAAAAAAB/+AAAAAAAAH/4AAAAAAAAP/AAAAAAAAA/8AAA
-AAAAAD/wAAAAAAAAP/AAAAAAAAA/8AAAAAAAAD/wAAAAAAAAP/AAAAAAAAA/8AAAAAAAAD/wAAAA
-AAAAP/AAAAAAAAA/8AAAAAAAAD/wAAAAAAAAP/gAAAAAAAA/+AAAAAAAAH/4AAAAAAAAf/wAAAAA
-AAB//AAAAAAAAP/8AAAAAAAA//4AAAAAAAH//gAAAAAAAf//AAAAAAAD//+AAAAAAAP//4AAAAAA
-B///wAAAAAAP///gAAAAAB////AAAAAAP///+AAAAAB////8AAAAAP////8AAAAB/////4AAAAf/
-////4AAAH//////4AAB///////8AA///////////////////////////////////////////////
-/////////////////////ygAAABgAAAAwAAAAAEAIAAAAAAAAJAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAOncngDn4aQB6NufB+janRPp250g6dudLunanDjo2pw/6NqbP+jamkDp2Zk76NmZM+fYmCbn
-15YY59iUC+jZlwOqewAA9OzAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6NqXAOjblwLo2ZgV6NmZN+jZmWHp2ZmN6NmZ
-sOjZmcvo2Znd6NmY5+jZmO/o2Jf06NiW9efYlvXn2JXx59eU6+fXk+Hn15LT59aRu+bWj53l1Y50
-5dWMSOXUiiLm04kH5dWHAOfRiwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAA59eQAOfYjwPn15Ef59aSVufXkpbn15PM59eT7efXk/zn15P/59eS/+fWkf/n1pD/59aP/+bW
-j//m1Y7/5tWN/+bVjP/m1Yz/5tSL/+XUi//l1Ir/5dSJ/+XTif/l04j+5NOH9eTShdzj0YOv49GB
-cOLQgDPhz34L381+AOLQfwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA5teOAOTQhQDl1IoM5dSLQ+XUi5Pm1YzW
-5tWN+ObUjP/l1Iz/5dSL/+XUiv/l1In/5dOJ/+XTiP/k0of/5NOG/+TShv/k0oX/5NGE/+TRhP/j
-0YP/49GC/+PRgv/j0IH/49CA/+PQgP/iz3//4s9//+LPfv/izn3/4s59/eLOfOnhzXqy4Mx3Y+DM
-dB3kznQB4s10AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAObSgwDgz4IA49GCD+PRg1bk0oW05NKG8OTShf/k0oX/5NGE/+PRg//j0YL/49CC
-/+PQgf/j0IH/49CA/+PPf//iz3//4s9+/+LPff/iz33/4s58/+HOfP/hznv/4c56/+HNev/hzXn/
-4c14/+HMeP/gzHf/4Mx2/+DMdf/gy3X/4Mt0/+DLc//fy3P/38py+9/KcNPfyW1+3sdrJ9zGagLd
-x2sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADn1X4A3816AOHOewrh
-z3xQ4s9+ueLPf/Xiz37/4s99/+LPff/iznz/4s57/+HOe//hznr/4c15/+HNef/hzXj/4c13/+HM
-d//gzHb/4Mx1/+DMdf/gy3T/4Mtz/+DLcv/fy3L/38px/9/KcP/fynD/38lv/9/Jbv/eyW7/3slt
-/97IbP/eyGv/3shr/97Iav/ex2n/3cdp/93GaP/dxmf93cVm2tzEY3zbwmAe2bBXANrBYQAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAODMdADgzHIC4Mt1M+DMd6TgzXfy4Mx3/+DMdv/gzHb/
-4Mx1/+DLdP/fy3P/38tz/+DKcv/fynH/38pw/9/KcP/fym//3slu/97Jbv/eyW3/3shs/97IbP/e
-yGv/3cdq/97Hav/ex2n/3cZo/93GZ//dxmf/3MVm/9zFZf/cxWT/3MRk/9zEY//cxGL/3MRi/9vD
-Yf/cw2D/3MNg/9vDX//bwl7/28Je/9rCXfzawVvO2sBYXtm/Vgzav1cAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADgyXQA3shqAN7Iaw/eyW5w38lv4N/JcP/fyW//3slu/97Jbf/eyG3/3shs/97Ia//ex2r/3cdq
-/93Haf/dxmj/3cZo/93GZ//dxWb/3cVl/93FZf/cxGT/3MRj/9zEY//cxGL/3MNh/9zDYf/bw2D/
-28Jf/9vCXv/bwl7/28Jd/9vBXP/awVz/2sFb/9rBWv/awFr/2sBZ/9rAWP/ZwFf/2b9X/9m/Vv/Z
-v1X/2b5V/9m+VP/ZvlP/2L5S9ti9UKPXu00rbf+vANm6TQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANvEYgDfyGoA3MVkKt3FZqjd
-xmf53cZn/93GZv/dxWX/3cVl/93FZP/cxGP/3MRi/9zEYv/cw2H/3MNg/9zDYP/bw1//28Je/9vC
-Xv/bwl3/28Jc/9vBW//awVv/2sFa/9rAWf/awFn/2sBY/9rAV//av1b/2b9W/9m/Vf/Zv1T/2b5U
-/9m+U//ZvlL/2L5S/9i9Uf/YvVD/2L1P/9i9T//YvE7/2LxN/9e8Tf/Xu0z/17tL/9e7Sv/Xu0r/
-17pJ/9a6Sf/WukfV1blEVtW3QAXVt0IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAA28FcANu/WgLawV1I28Jf0NvCX//bwl//28Je/9vCXf/bwlz/
-2sFc/9rBW//awFr/2sFa/9rAWf/awFj/2b9X/9m/V//Zv1b/2b9V/9m/Vf/ZvlT/2b5T/9i+U//Y
-vVL/2L1R/9i9UP/YvVD/2LxP/9e8Tv/XvE7/17xN/9e7TP/Xu0z/17tL/9e6Sv/Wu0n/1rpJ/9a6
-SP/WuUf/1rlH/9a5Rv/VuUX/1blE/9W4RP/VuEP/1bdC/9W3Qv/Ut0H/1LdA/9S2QP/Utz//1LY+
-79O1O4DSszcQ0rQ4ANW1OwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADYvlMA2L5SBNm/VmLZv1fl2cBX/9m/Vv/Zv1b/2b9V/9m+VP/ZvlP/2L5T/9i+Uv/YvVH/2L1Q
-/9i9UP/YvU//17xO/9e8Tv/XvE3/17tM/9e7TP/Xu0v/17tK/9a6Sv/Wukn/1rpI/9a6R//WuUf/
-1rlG/9W5Rf/VuUX/1bhE/9W4Q//VuEP/1bhC/9W3Qf/Ut0D/1LdA/9S3P//Utj7/1LY+/9S2Pf/T
-tTz/07U7/9O1O//TtTr/07Q5/9O0Of/TtDj/0rQ3/9KzN//Sszb/0rM1/9KyNfrRsTKf0LAvGdGy
-LgDPo0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANe7SwDWukoG17xOcdi9T+/Y
-vE//17xO/9e8Tf/XvEz/17tM/9e7S//Xu0r/1rtJ/9a6Sf/Wukj/1rpH/9a6R//WuUb/1rlF/9W5
-RP/VuEP/1bhC/9W4Qf/Vt0H/1bdB/9S3QP/Utz//1Lc//9S2Pv/Utj3/1LY9/9S2PP/TtTv/07U7
-/9O1Ov/TtTn/07Q5/9O0OP/StDf/0rM2/9KzNv/SszX/0rM0/9KyNP/RsjP/0bIy/9GyMf/RsTH/
-0bEw/9GxL//RsS//0LAu/9CwLf/QsC3/0LAs/9CvK//Qryv+z64pr8+tJSDOriYAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAA0rE2ANCsKgbVuEVz1rlH8tW5Rv/VuUb/1blF/9W4RP/VuEP/
-1bhD/9S4Qv/Ut0H/1LdB/9S3QP/Utj//1LY+/9S2Pv/Ttjz/07Q5/9O1O//VuEL/1rpI/9a5Rv/U
-tj7/0rM3/9KyNP/SszX/0rM2/9KzNf/SszX/0bI0/9KyM//RsjP/0bIy/9GxMf/RsTD/0LEw/9Cw
-L//QsC7/0LAu/9CwLf/Qryz/0K8r/8+vK//Qryr/z64p/8+uKf/Prij/z64n/86uJ//OrSb/zq0l
-/86sJP/OrCT/zqwj/82sIv/NrCL/zash/8ypHLjKphIixp4AANrFXAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAD9/PgA////A+PPgW7VuETy07U8/9S2Pf/UtT3/07U8/9O1O//TtTr/07Q6/9O0Of/TtDj/0rQ4
-/9K0N//Sszb/0rM1/9GyMv/TtTv/3shs/+vdpv/z6sj/9vDX//bv1f/y6cT/692k/9/Kcf/Utj7/
-z68q/9CvK//Qryz/0K8r/8+vKv/Prin/z64p/8+uKP/Prij/z60n/86tJv/OrSX/zq0k/86sJP/O
-rCP/zqwi/82sIv/NqyH/zasg/82rIP/Nqx//zaoe/82qHv/Nqh3/zKoc/8ypG//MqRv/zKka/8yp
-Gf/LqBj/y6cV/9O1O//t4K6w////Gv7+/QAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD///8A////XPz68e3u
-47X/2sFZ/9GyMf/RsjL/0rIy/9GyMv/RsjH/0bEw/9GxMP/RsS//0bAu/9CwLv/Qryz/0K8r/9rA
-WP/v5bn//fv0//////////////////////////////////79+f/17tH/4c15/9CwLP/NqyD/zqwi
-/86sIf/NqyD/zasg/82rH//Nqx7/zaod/82qHf/Nqhz/zKob/8ypG//MqRr/zKkZ/8yoGP/MqBj/
-zKgX/8uoF//Lpxb/y6cV/8unFf/LpxT/yqYT/8qmE//KphL/yqYR/8mlEP/JpA//2L5S//Xu0///
-///+///+o/r26RL+/v0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAyqQSAP///wDl1I9A+vfq4f//////////+PTi/+PQgf/RsjP/
-z60m/8+uKf/Prij/z64o/8+tJ//Prib/zq0l/86rIf/RsTD/5NGF//n15f////////7+//r26P/y
-6sf/7uO1/+/ktv/z68n/+fbn//7+/P///////v34/+zgrP/SszT/y6cW/8uoGP/LqBf/y6gX/8un
-Fv/Lpxb/y6cV/8qmFP/KphT/yqYT/8qlEv/KpRL/yqUR/8qlEP/JpRD/yaUP/8mkDv/JpA7/yaMN
-/8mjDP/Iowz/yKML/8iiCv/Iogn/yKII/8iiCf/bw2H/+fbm///////9/Pj/6t2l+86uK4i5jAAH
-xJ4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADPsCIAyKILAMijDCLIow7H07dC/+zfrP/9+/b///////78+P/v5Lb/2L5T/86sIv/MqRv/zKkc
-/8ypG//MqBn/zaoe/9i+Uv/w5br//v36///////69+v/696o/+HNe//gzHb/4c14/+HMd//hzXn/
-5NKF/+3grf/59ub////////////x58D/0bEx/8mkDf/JpA//yaQO/8mkDv/JpA3/yaMM/8ijDP/I
-owv/yKIK/8iiCv/Iogn/yKII/8ehB//HoQf/x6EG/8ehBf/GoAX/xqAE/8agBP/GoAP/xqAD/8ag
-A//FnwL/xZ8C/9rBX//69+v///////v47v/gy3f/x6MO/8WeAPLFnwBfyp4AAMSfAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADHoQcAx6IJCsagBZvF
-nwH/xJ4A/8eiDP/bwmH/9e/U/////v//////+/jr/+zfqf/cxWT/1LdA/9S2Pf/bw17/692l//v4
-6////////v36/+7itP/TtkH/yaQR/8mlE//Prir/2b9X/+HMd//hzXr/4c14/+HMd//l1Iv/9O3Q
-///+/f//////7uO1/8ypHf/HoAT/x6EF/8ehBf/GoAT/xqAE/8agA//GoAP/xqAC/8afAv/GnwL/
-xp8C/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/1bpL//n15f//
-////+vfp/9rCYP/FnwT/xZ8A/8WfAP/FnwDaw50AMsqmAACXXgAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMehBgC9mAAAxJ4BYMWfAPTFnwD/xZ8A/8WfAP/EngD/
-zawl/+XUjv/59ub////////////+/fn/+vfr//r36f/9/Pf////////////48+D/38p0/8ilEv/E
-nQD/xZ8A/8WfAP/EngD/xqEG/9K0Of/fynL/4c16/+HNef/hzHf/49CC//Tszf/////////+/+XU
-j//GoAf/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/Pry7/9e7T///////7+O3/2sJf/8WfAv/FnwD/
-xZ8A/8WfAP/EngD/yqgcruvesBDl1ZcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAMuoHgDQsTQmyqYY1MagBv/EngD/xZ8A/8WfAP/FnwD/xJ4A/8WfBP/Rsjb/5tWR
-//bw2P/9/Pj////////////+/vz/+PTi/+fWlf/PsDD/xZ4C/8WeAP/FnwD/xZ8A/8WeAP/FngL/
-yKUS/8mlFP/QsTL/38px/+HNev/hzXn/4cx3/+TRhf/38tz///////z58P/XvFH/xJ4A/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8A/8ikEP/s36z///////389//fynP/xZ8D/8WfAP/FnwD/xZ8A/8WeAf/Ut0P/8efB
-+f7+/Grv5b0A////AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/v7+AP///wT4
-9OKQ9OzM/+rcpP/VuUf/xqAH/8SeAP/FnwD/xZ8A/8WfAP/EngD/xZ8E/8yqH//Wu03/3sly/9/L
-eP/awVz/zq4q/8WgBf/EngD/xZ8A/8WfAP/FnwD/xJ4A/8mlFP/fynX/8urI//Pqyf/jz4P/2L9V
-/+DMdf/hzXn/4c15/+HMd//o2Jf//Prx///////x58H/yaYW/8WeAP/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/93Hbf/+
-/fr//////+nanv/Hogz/xZ8A/8WfAP/FnwD/xZ8D/9rBXf/59eT///////38+9br4dcm8erjAHlE
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD///8A////AP///z3////o///////////7+e7/
-5taS/82sJf/EngD/xZ4A/8WfAP/FnwD/xZ8A/8WeAP/EnQD/xJ0A/8SdAP/EnQD/xJ4A/8WfAP/F
-nwD/xZ8A/8WeAP/FnwP/0rQ8/+/kt//+/fr//////////////v3/8ejB/+DLdf/hzXj/4c15/+HN
-ef/hzXj/8Oa8///////+/fr/3MZp/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/zq4r//bx2v//////9e3R/82sJv/EngD/
-xZ8A/8WfAP/FnwH/2sFd//r46///////9/Pv/8Olhv+UXSWLWAUAA4VIBgAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAD///8A////CP79/aP7+ff//v39///////////////+//Xv1f/dx23/yqcY
-/8SeAP/EngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/xJ0A/8qnGP/hzHv/
-+fXl/////////////////////v////////////LpxP/hzXr/4c15/+HNef/hzXj/5dOJ//r26P//
-////8urH/8mmF//FngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwT/5tWQ///////9/Pb/2sJf/8SeAP/FnwD/xZ8A/8SeAP/UuEX/+fXk
-///////z7eb/sYlg/4ZJCv+FRwbjhkgIMYZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC5
-lnAAsYpgPrSOZ+ypfE//s4tk/860mv/s49n//fz7///////+/fr/8+rJ/97Hbf/NqyP/xZ8E/8Sd
-AP/EngD/xJ4A/8SeAP/EngD/xJ0A/8SeAf/Jphb/2sFd//LpxP/+/vv///////n28//ezbv/vp17
-/7iUcP/i08T///////7++//t4rH/4c14/+HNef/hzXn/4cx3/+/kuP///////v35/9nAW//EnQD/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/Q
-sTT/+fXl///////t4bL/x6MO/8WfAP/FnwD/xJ4A/8yqIP/y6sj///////fy7v+xiWD/hUYG/4ZI
-B/+GSAj/hkgIjoVFBQKGRwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIdGBwCIRQYEhkgImIRGBf+ERQT/
-hEUE/4ZICP+VXib/updz/+nd0v/+/fz///////7++//38dv/6dqf/9vEZf/StTz/zq4p/82sJv/P
-sC//1rtL/+PQhP/z6sj//fz3///////9/Pz/4tPE/6yCVv+LUBP/hEUE/4NEA/+WYCn/5tnM////
-///69+r/5dSL/+HNeP/hzXn/4cx4/+XUjf/7+O3//////+3gr//Hogr/xZ8A/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfA//m1ZH///////z68P/Vukr/
-xJ0A/8WfAP/FnwD/xqAF/+XUj////////fz7/8Cff/+GSAn/hkgH/4ZICP+GSAj/hkgI3oZHCCmG
-SAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAIZIBwCGRwgqhkgI4IZICP+GSAj/hkgI/4ZICP+FRgb/hEYF
-/5NcJP+8mnf/6NvP//38+//////////////+/f/8+vH/+fXk//jz4f/69uj//fz3////////////
-/v79/+3k2/++nHr/kFcc/4RFBP+FRwf/hkgI/4ZICP+ERQT/sopi//z6+f//////8Oa7/+HNeP/h
-zXn/4c15/+HNef/z6sj///////r36f/Rsjb/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xJ4A/86tKf/38t7//////+3hsf/Hogv/xZ8A/8WfAP/EngD/07ZB
-//r36///////28i1/41SF/+FRwb/hkgI/4ZICP+GSAj/hkgI/4ZICHaISAgAhEkIAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAgkQHAIdKCACGRwhyhkgI/oZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv+FRgb/kVkg/7WP
-aP/cyrj/8erj//r39f///v7//////////////////Pv6//Tv6f/fz77/vJp3/5dhKv+FRwf/hUcG
-/4ZICP+GSAj/hkgI/4ZICP+FRwf/jlQZ/+HSwv//////+vbm/+TShv/hzXj/4c15/+DMd//p25//
-/v35///////gzHr/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xJ4A/9/KdP///////fz3/9i+Vv/EnQD/xZ8A/8WfAP/Hogr/696p///////18Or/o3ND/4RF
-Bf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICMSFRwcShUcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkcIAIZHCA2GSAi7
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcG/4RFBP+KThH/l2Is/6d6S/+3
-kmz/v558/8Cgf/+7mHT/roRZ/5xpNf+MUBP/hEUF/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hEUE/7aQav/9/Pz///79/+zfqf/hzHf/4c15/+HNeP/j0YP/+fXj///////w5bz/yKMO
-/8WfAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/yKQR//Hnwf//////
-8+rJ/8qmF//FngD/xZ8A/8SeAP/Ut0P/+/nv///////Mspf/h0kK/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICPKGSAhFhkgHAIFGDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB+NAAAhkgIAIZHCDaGSAjrhkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwf/hUYG/4RFBP+ERAP/hEUE/4RFBP+ERQT/
-hEUE/4VGBf+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUYG/5RdJv/s
-49n///////Xu0f/iznv/4c15/+HNef/hzXj/8ejC///////69+r/0LI1/8SeAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/07dC//z68f//////4s5//8SeAP/FnwD/xZ8A
-/8agBf/o2Zz///////Tu6P+ebTr/hEUF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FSAiI
-j04HAIJFBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAACFSAYAh0cJAIZICHGGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICf/OtZv///////v57//l1I3/
-4cx4/+HNef/hzHf/6tuf//79+v////7/3sdu/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FngD/49GG///////7+Ov/0bM4/8SeAP/FnwD/xJ4A/86uK//48+D//////9O8
-pf+ISwz/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjEhUcIEYVHCAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSgcA
-hkkHBoZICKmGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RFBP+tg1j//Pr5/////v/s4Kz/4Mx3/+HNef/hzXj/5NKH
-//r36f//////696o/8agBv/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAP/IpRH/
-8ejD///////w5r7/yKMO/8WfAP/FnwD/xJ4A/97Ib/////7/+/j2/6uAVP+ERQT/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjqhkgIM4ZICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACFSAcAhkgHHIZICNWGSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4VGBv+UXib/7uXb///////07M3/4c16/+HNef/hzXn/4c16//Ttz///////9vDY/8up
-H//FngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/Rszj/+/js///////izoD/xJ4A
-/8WfAP/FnwD/x6IL/+7jt///////59vO/5BXHP+FRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj8hkcIYYVICACgNgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAhkgIO4ZICO+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ISwz/
-1sCr///////69+j/5NKG/+HNeP/hzXn/4Mx3/+7isf///////Pvz/9S4Rf/EnQD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/dxmz///////z78//UuEX/xJ4A/8WfAP/EngD/z7Av//n2
-5v//////yKyP/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-kYlFBgCGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAII2FQCGSAgAhkgIYIZICPyGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/upZy///////+/fn/6dqc
-/+HMd//hzXn/4cx3/+jYlv/9/Pf//////+DLd//EngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8agBf/q3KP///////bv1v/LqRz/xZ4A/8WfAP/EnQD/3MRm/////f/7+Pb/qXxP/4RFBP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIt4hICAqHSAgAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIZGCQCFTAYAhkcI
-hIZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQX/oXE///fz7///////7+S4/+HMd//hzXn/4c14/+PR
-hf/59uf//////+zfqv/GoAb/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ4A/8qmF//07M7/////
-/+zfq//GoAb/xZ8A/8WfAP/FoAT/6dqf///////s4tj/k1sj/4VHBv+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI1IZICBmGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIVIBwCERwYEhkgIoIZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+FRwf/kFcd/+nd0v//////9e7S/+HOe//hzXn/4c15/+HOe//17tH///////Xu0f/K
-pxn/xZ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/9CyNf/7+Oz//////+DMeP/EngD/xZ8A/8We
-AP/Kpxf/9O3P///////Xwq3/iEsM/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI5YZHCCyGRwgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAIdIBwCHSAcJhkgItoZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/h0oK
-/9S+p///////+vfp/+TShv/hzXj/4c15/+HMd//v5Lf///////v47f/Rszj/xJ4A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xJ0A/9rBXP/+/vz//fz3/9a7TP/EnQD/xZ8A/8SeAP/Rszj/+/jt//////+9
-nHn/hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI8oZI
-CD2FSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AIlLDACJSwwQiEoLyYdJCv+HSQn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/7yaeP///////fz3/+jY
-l//hzHf/4c15/+DMd//q26D//v77//7+/P/awl//xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A
-/+PQhP//////+fXk/86uK//EngD/xZ8A/8SdAP/awmD////+//r49f+nekz/hEUE/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI+YZIB06FSAcAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIpOEQCKThEWik0Q1IlM
-Dv+JSw3/iEoM/4dJC/+HSQr/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/6d6TP/69/X//////+3grf/gzHf/4c15/+HMeP/m
-1Y3//Prx///////k0or/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xqAF/+zfqv//////8+vL/8ml
-Ev/FnwD/xZ8A/8WeAP/k04v///////Hq4v+XYiv/hUYG/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/IVICFyFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIxRFACMURQdjFAT2oxQE/+LTxL/i04R/4pNEP+J
-TA7/iUsN/4hKC/+HSQr/h0kJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hUYG/5ZhKf/x6eH///////Lqxv/hzXj/4c15/+HNeP/j0IH/+PTh///////u4rP/
-xqEI/8WfAf/FnwH/xZ8B/8WfAf/FnwD/yaUU//Pryv//////696p/8agBv/FnwD/xZ8A/8ahCP/t
-4bH//////+PUxf+MUhb/hUcH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/oVICGWFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAI5UFwCOVBcdjlQX2o5TFv+NUhX/jVEU/4xQE/+MTxL/i04R/4pOEP+KTQ//
-iUwO/4hLDP+ISgv/h0kK/4dJCf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkcH/4tQ
-FP/g0cH///////fy2//iz37/4c15/+HNef/hzXr/9OzM///////17tT/yqgb/8WeAP/FnwH/xZ8B
-/8WfAf/EngD/zawl//jz4P//////5NKJ/8SeAP/FnwD/xZ4A/8qmFv/07c7//////9O9pf+HSQr/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZHCGyG
-SQgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJBX
-HACQVxwdkFcc2pBWG/+PVRn/j1UY/45UF/+OUxb/jVIV/41RFP+MUBP/i08S/4tOEf+KTRD/ikwP
-/4lLDf+ISwz/iEoL/4dJCv+GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP/OtZz///////v47P/k
-04j/4c14/+HNef/hzHf/7+S3///////7+Oz/0LE0/8SeAP/FnwH/xZ8B/8WfAf/EngD/0rQ8//z6
-8P//////3cZq/8SdAP/FnwD/xJ4A/86uKv/59ub//////8Kjg/+ERgX/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/oZICGSGSAgAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJNbIQCTWyEWk1sh1JJaH/+S
-WR7/kVgd/5FXHP+QVhr/j1UZ/49UGP+OVBf/jlMW/41SFf+MURT/jFAT/4tPEv+LThH/ik0Q/4lM
-Dv+JSw3/iEoM/4hKC/+HSQr/h0gJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RFBP+6lnP///////389//o2Jf/4cx3/+HNef/gzHf/
-6tyj//7+/P/+/fn/2L5V/8SdAP/FnwH/xZ8B/8WfAf/EnQD/2L5U//79+v/9/Pj/1rtO/8SdAP/F
-nwD/xJ0A/9O3Q//8+/P//v7+/7OMZP+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/IVICFyFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJReJQCUXiUQlV4lyJVdJP+UXCP/k1si/5NaIP+SWh//
-klke/5FYHP+QVxv/kFYa/49VGf+OVBj/jlMW/41SFf+NUhX/jFET/4xQE/+LTxL/i04R/4pND/+J
-TA7/iUsN/4hKC/+HSQr/h0kJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4RFBP+oe03/+/n3/////v/s36r/4Mx3/+HNef/hzHf/5taS//379P//////4c17
-/8SeAP/FnwH/xZ8B/8WfAf/EnQD/3shu///////7+e//0bM2/8SeAP/FnwD/xJ0A/9nBW//+/vz/
-+vj1/6Z5Sv+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI+YZHB06GRwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAJdhKACXYCgJl2EqtZdhKf+WYCj/ll8m/5VeJf+UXST/lFwj/5NbIf+TWiD/klkf
-/5FYHf+RWBz/kFYb/5BWGv+PVRj/jlQX/45TFv+NUhX/jVEU/4xQE/+LTxL/i04R/4pOEP+KTQ//
-iUwO/4hLDP+ISgv/h0kK/4dJCf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VGBf+Z
-ZDD/8uzl///////w5r3/4cx3/+HNef/hzXj/49GE//r25///////6dqf/8WfBP/FnwH/xZ8B/8Wf
-Af/FngD/5dOM///////38t3/zKsi/8SeAP/FnwD/xJ0A/9/Ld///////9e/q/5toNf+FRgX/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI8oZHCDyGRwcA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJlkLgCa
-Yy4DmmQuoJlkLv+YYyz/mGIr/5dhKv+XYSn/ll8n/5VfJv+VXiX/lF0j/5RcIv+TWyH/k1og/5JZ
-H/+RWB3/kVcc/5BWGv+PVhr/j1UY/45UF/+OUxb/jVIV/41RFP+MUBP/jE8S/4tOEf+KTRD/ikwP
-/4lMDf+ISwz/iEoL/4dJCv+HSQn/hkgI/4ZICP+GSAj/hkgI/4VHB/+OVRr/59vO///////17tH/
-4c16/+HNef/hzXn/4s58//bx2P//////8Oe//8ejDv/FnwD/xZ8B/8WfAf/GoAb/696o///////z
-68r/yaUU/8WfAP/FnwD/xZ4A/+bVkf//////7eXb/5NcI/+FRwb/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI5YZHCCuGRwgAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJxnMACaaDcAm2gyg5tnMv+bZzH/
-mmYw/5plL/+ZZC3/mGMs/5hiK/+XYSn/lmAo/5ZfJ/+VXib/lV0l/5RcI/+UWyL/k1sh/5JaH/+S
-WR7/kVgd/5BXHP+QVhr/j1UZ/49UGP+OUxb/jVMW/41SFf+MURT/jFAT/4tPEv+LThH/ik0P/4lM
-Dv+JSw3/iEoM/4dKC/+HSQr/hkgJ/4ZICP+ISw3/18Ou///////49OL/49CB/+HNeP/hzXn/4c14
-//Lqxv//////9/Ha/8upIP/FngD/xZ8B/8WfAP/IpA//8ejB///////u4bL/xqEH/8WfAP/FnwD/
-xqAF/+3hr///////5NXH/4xRFf+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI04VHCBmFRwgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAKWBMACdazcAnWs2YJ1rNvydajX/nGk0/5xoM/+bZzL/m2Yx
-/5plMP+ZZC7/mWMt/5hjLP+XYir/l2Ep/5ZgKP+WXyb/lV4l/5VdJP+UXCP/lFsi/5NaIP+SWh//
-klke/5FYHP+QVxv/j1Ya/49VGf+OVBf/jlMW/41SFf+NURT/jFAT/4xQE/+LTxH/ik4Q/4pND/+J
-TA7/iEsN/4hKC/+GSAj/yKuO///////7+e7/5dSL/+HNeP/hzXn/4Mx3/+7jtP//////+/jt/9Gz
-Nv/EngD/xZ8B/8WeAP/LqR7/9vHZ///////n1pX/xZ4A/8WfAP/FnwD/yaUS//Pqyf//////1sCr
-/4hKDP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgItoZGCAqGRwgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAACfbzsAn247O6BuO++fbTr/nm04/55rN/+dazb/nWo1/5xpNP+caDP/m2cy/5tm
-Mf+aZS//mWQu/5ljLf+YYiv/l2Iq/5dhKf+WYCj/ll8m/5VeJf+VXST/lFwj/5NbIf+TWiD/klkf
-/5FYHf+RWBz/kFcb/5BWGv+PVRj/jlQX/45TFv+NUhX/jVEU/4xQE/+MTxL/i08R/4pOEP+ISQv/
-uJNt//7+/v/+/Pj/6NmY/+HMd//hzXn/4cx3/+rcof/+/vv//v77/9i+Vf/EnQD/xZ8B/8SeAP/Q
-sTL/+vfq///////gy3b/xJ0A/8WfAP/FngD/zKsi//fy3f//////yKyQ/4VGBv+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIkIE5BgCFRwgAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAChcT8A
-onE/G6JxP9ShcT7/oXA9/6BvPP+fbjv/n205/55sOP+eazf/nWo2/5xpNf+caTT/m2gy/5tnMf+a
-ZjD/mmUv/5lkLv+YYyz/mGIr/5dhKv+XYCn/ll8n/5VfJv+VXiX/lF0j/5RcIv+TWyH/k1og/5JZ
-Hv+RWB3/kVcc/5BWGv+PVhn/j1UY/45UF/+OUxb/jVIV/41RFP+KTQ//q39T//v59/////3/696o
-/+DMd//hzXn/4cx3/+fWkv/9+/T//////9/Kdv/EnQD/xZ8B/8SdAP/Wu0z//fz4//79+v/Yv1f/
-xJ0A/8WfAP/EngD/0bM4//v57v//////uZZy/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj8hkgIYIVICACkNgAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACjdEEAonRCBaR0RKikdEP/o3NC
-/6JyQP+icT//oXA+/6FvPf+gbzv/n246/59tOf+ebDj/nWs2/51qNf+caTT/nGgz/5tnMv+bZjH/
-mmUw/5llLv+ZZC3/mGMs/5diK/+XYSn/lmAo/5ZfJ/+VXib/lV0k/5RcI/+UWyL/k1sg/5JaH/+S
-WR7/kVgd/5BXG/+QVhr/j1UZ/49UGP+NUhT/oG88//Tv6f//////8OW7/+HMd//hzXn/4c14/+TS
-h//69+r//////+fXl//FnwL/xZ8B/8SdAP/dx2z///////v57//StDv/xJ4A/8WfAP/EnQD/17xS
-//79+f/8+/n/q4BV/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAjqhUcIM4VICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACld0gApnhJAKV4SG+meEj+pXdH/6R2Rf+kdUT/pHRD/6Nz
-Qv+ickD/onE//6FwPv+hbz3/oG47/59uOv+fbTn/nmw3/51rNv+dajX/nGk0/5xoM/+bZzL/m2Yx
-/5plMP+ZZC7/mWQt/5hjLP+XYir/l2Ep/5ZgKP+WXyf/lV4l/5VdJP+UXCP/lFsi/5NaIP+SWh//
-klke/5FYHf+QVhr/mWQt/+vg1f//////8+zL/+HNef/hzXn/4c15/+LPfv/38tz//////+7jt//H
-ogv/xZ8A/8WeAP/l1I////////jz3v/MqyH/xJ4A/8WfAP/EnQD/38ly///////38+7/n206/4RG
-Bf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjDhUgI
-EIVICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAC1zq4AqHpMAKh7TDWoe0zqp3pM/6d5Sv+meEn/pXdH/6V2Rv+kdkX/pHRE/6N0Qv+j
-c0H/onJA/6JxP/+hcD3/oG88/6BuO/+fbTr/nmw4/55rN/+dazb/nWo1/5xpNP+caDP/m2cy/5pm
-Mf+aZS//mWQu/5hjLf+YYiv/l2Eq/5dgKf+WYCj/ll8m/5VeJf+UXST/lFwj/5NbIf+SWh//lV4l
-/+DQwP//////9/Lc/+LPfv/hzXn/4c15/+HNef/z7Mv///////Xv1P/KqBn/xZ4A/8ahCf/t4bL/
-//////How//IpBD/xZ8A/8WfAP/FnwH/59eV///////t49r/k1wk/4VHBv+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAiGikkLAINJBgAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqn1Q
-AKp9Tw2qflG6qn1Q/6l8T/+ofE7/qHpM/6d6S/+meUr/pnhI/6V3R/+ldkb/pHVF/6R0Q/+jc0L/
-o3NB/6JxP/+hcD7/oXA9/6BvPP+fbjr/n205/55sOP+dazf/nWo1/5xpNP+caDP/m2gy/5tnMf+a
-ZjD/mmUv/5lkLv+YYyz/mGIr/5dhKv+WYCn/ll8n/5VfJv+VXiX/lFwi/9K7o///////+vfr/+TS
-h//hzXj/4c15/+HMd//v5Lf///////r36v/QsTP/xJ0A/8mmFv/07c///////+rcpP/GoAT/xZ8A
-/8WfAP/HoQn/7uO1///////h0sP/i1AU/4ZHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICPKGRwhEhkgIAIZDCgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAs4FQAKqCVwCsgVRwrIFU/quA
-U/+rf1L/qn5R/6p9UP+pfE//qHtN/6h6TP+nekv/p3lJ/6Z4SP+ld0f/pXZG/6R1RP+kdEP/o3NC
-/6JyQf+icT//oXA+/6FvPf+gbzv/n246/59tOf+ebDj/nWs2/51qNf+caTT/nGgz/5tnMv+bZzH/
-mmYw/5plL/+ZZC3/mGMs/5hiK/+XYSr/lV0k/8Wmh////////fv1/+fXlP/hzHf/4c15/+DMd//r
-3aT///79//38+P/XvVL/w5wA/8+vLv/59uf//////+LPgP/EngD/xZ8A/8WeAP/Kpxj/9e7T////
-///TvKT/iEsM/4hKC/+HSQr/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICMKFRwcShUcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAK2EWACthFgproRY362DV/+tglb/rIFV/6uAVP+r
-f1P/q39S/6p+Uf+pfU//qXxO/6h7Tf+nekz/p3lK/6Z4Sf+md0j/pXZH/6R1Rf+kdUT/o3RD/6Nz
-Qf+ickD/onE//6FwPv+gbzz/oG47/59tOv+ebDn/nmw3/51rNv+dajX/nGk0/5xoM/+bZzL/mmYx
-/5plL/+ZZC7/l2Ep/7eRa//8+vj////+/+vepv/gzHf/4c15/+HMd//n1pL//Pv0///////gy3n/
-w5wA/9a7Tf/9/Pf//v79/9nAWv/EnQD/xZ8A/8SeAP/PsDD/+vfp///////DpIT/iUsN/4pND/+J
-TA7/iEsN/4hKC/+HSQr/h0kJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/oZICHSHSgkAhUQEAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAK+HXACth1oDsIdclrCHXP+vhlv/roVZ/66EWP+tg1f/rYJW/6yBVf+rgFT/
-q39S/6p+Uf+qfVD/qXxP/6l8Tv+oe03/p3pL/6d5Sv+meEn/pXdH/6V2Rv+kdUX/pHRE/6N0Qv+j
-c0H/onJA/6FxP/+hcD3/oG88/6BuO/+fbTn/nmw4/55rN/+dajb/nWo1/5xpNP+caDP/mmUv/6yA
-VP/28ez//////+/luv/hzHf/4c15/+HNeP/j0YT/+vbn///////q3KL/xJ4B/+DKdf//////+/jt
-/9GzNv/EngD/xZ8A/8SdAP/XvFH//v35//38+/+zjGT/ik4Q/4xQE/+LTxL/i04R/4pOEP+KTA//
-iUwO/4hLDP+ISgv/h0kK/4dJCf+GSAj/hkgI3YZICCiGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACyimEAsopgPLKKYeuyiWD/sYhe/7CHXf+whlz/r4Vb/66FWf+uhFj/rYNX/62CVv+sgVT/q4BT
-/6t/Uv+qflH/qn1Q/6l9T/+ofE7/qHtM/6d6S/+neUr/pnhI/6V3R/+ldkb/pHVF/6R0Q/+jc0L/
-o3NB/6JyQP+icT7/oXA9/6BvPP+gbjv/n205/55sOP+eazf/nGk0/6R1RP/s4tj///////Tt0P/h
-zXr/4c15/+HNef/iznv/9e/U///////z6sj/yaUV/+nanv//////9e/U/8qoG//FngD/xZ8A/8Sd
-AP/gy3j///////fz7/+meEf/jVIV/45UF/+OUxb/jVIV/41RFP+MUBP/i08S/4tOEf+KTRD/ikwP
-/4lMDf+ISwz/h0kKjIRCBAKHRwkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACyjGUAsoxkB7ONZaG0
-jWT/s4tj/7KLYv+yimD/sYlf/7GIXv+wh13/r4Zb/6+FWv+uhFn/rYNY/62DVv+sglX/rIFU/6uA
-U/+rf1L/qn5R/6p9UP+pfE7/qHtN/6h6TP+neUv/pnlJ/6Z4SP+ld0f/pXZG/6R1RP+kdEP/o3NC
-/6JyQf+icT//oXA+/6BvPf+gbzv/n206/6BvPP/gz77///////n15P/j0YL/4c14/+HNef/hzHj/
-8Oe+///////59eX/0rQ///LpxP//////7eGy/8ahCP/FnwD/xZ8A/8WfA//q3KL//////+3k2v+c
-aTT/kFcb/5BXG/+QVhr/j1UZ/45UGP+OUxf/jVIW/41RFP+MURT/jFAT/4tPEv+KThHiiU0PMYpN
-DwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACzkWoAtpBoALWQaTq1kGnntY9o/7SOZ/+0jWX/
-s4xk/7OLY/+yimH/solg/7GJX/+wiF7/sIdc/6+GW/+vhVr/roRY/62DV/+tglb/rIFV/6uAVP+r
-f1P/qn9S/6p+Uf+pfVD/qXxO/6h7Tf+nekz/p3lK/6Z4Sf+ld0j/pXdH/6R1Rf+kdUT/o3RD/6Nz
-Qv+ickD/onE//6BuO//QuJ////////z78//m1pD/4cx3/+HNef/gzHf/692l//7+/P/9/Pf/4s5/
-//j04v//////49CF/8SeAP/FnwD/xZ8A/8mlEv/y6sj//////9/OvP+WYCj/k1sh/5NaIP+SWR//
-kVke/5FYHP+QVxv/kFYa/49VGP+OVBf/jlMW/41SFf+NURSIh0sPAopPEgAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAtpJrALSRagO3km2MuJJt/7eSa/+2kGr/tpBp/7WPZ/+0jmb/tI1l
-/7OMZP+zi2L/soph/7KJYP+xiV//sIhd/7CHXP+vhlv/roVa/66EWP+tg1f/rYJW/6yBVf+sgFT/
-q39S/6p/Uv+qflD/qX1P/6l8Tv+oe03/p3pL/6d5Sv+meEn/pXdI/6V2Rv+kdUX/pHRE/6JxP//B
-oH///fz8//7+/P/r3aX/4Mx3/+HNef/hzHf/5tWP//z68v////7/9vDX//39+P/+/fn/2L5V/8Sd
-AP/FnwD/xJ4A/8+vLf/59ub//////861mv+VXiX/ll8m/5VeJf+UXST/lFwj/5NbIf+TWiD/klkf
-/5FZHf+RWBz/kFcb/49WGdOOVBcljlQXAKJsJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAALmVcQC5lXAkuZVx0bmVcP+5lG//uJNt/7eSbP+3kWv/tpBq/7WPaP+1jmf/tI5m/7SN
-ZP+zjGP/s4ti/7KKYf+xiWD/sYhe/7CHXf+whlz/r4Va/66EWf+uhFj/rYNX/6yCVf+sgVT/q4BT
-/6t/Uv+qflH/qn1Q/6l8T/+oe07/qHpM/6d6S/+meUr/pnhI/6R1Rf+0jWX/9vLt///////w577/
-4cx3/+HNef/hzXn/49CA//jz4P/////////////////59eX/z64s/8SeAP/FnwD/xJ0A/9i+Vf/+
-/fn//v39/7yadv+XYCj/mGIr/5dhKv+WYCj/ll8n/5VfJv+VXSX/lF0j/5RcIv+TWyH/klof+JJZ
-HWeRYCoAk1YZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALmWcgC+m3YA
-u5hzXbuYdPO7l3P/upZy/7qVcf+5lG//uJRu/7iTbf+3kmz/tpFq/7aQaf+1j2j/tY5n/7SNZf+z
-jWT/s4tj/7KLYv+yimD/sYlf/7GIXv+wh13/r4Zb/6+FWv+uhFn/rYNX/62CVv+sglX/rIFU/6uA
-U/+rf1L/qn5R/6l9UP+pfE7/qHtN/6d6S/+sgVX/6+HW///////28Nj/4s59/+HNef/hzXn/4c14
-//LpxP/////////////////w57//yKMO/8WfAP/FnwD/xJ4A/+PRh///////9vLt/62DV/+ZZC//
-mmUw/5llL/+ZZC3/mGMs/5diK/+XYSn/lmAo/5ZfJ/+VXiX/lV0kq5NbIg+TXCIAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC8mXYAvJp2CL2bd5e9m3f/vJp2
-/7yZdf+7mHT/updz/7qWcv+5lXD/uZRv/7iUbv+4k23/t5Js/7aRav+2kGn/tY9o/7SOZv+0jWX/
-s4xk/7OLY/+yimH/sopg/7GJX/+xiF7/sIdc/6+GW/+vhVr/roRZ/62DV/+tglb/rIJV/6yBVP+r
-gFP/q39S/6p+UP+pfU//28m2///////7+O7/5dSL/+HNeP/hzXn/4Mx3/+vdpf/+/vz/////////
-///k0oj/xZ4A/8WfAP/FnwD/x6IM/+/kuv//////6t/T/6N0Q/+caTT/nGk0/5xoM/+bZzL/m2Yx
-/5plMP+ZZC7/mWQt/5hjLP+XYSrYlmAoMJZgKACcZjQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADGoHkAvp17AL6deh+/nnvEv517/76cef+9m3j/vZp3/7ya
-dv+7mXT/u5hz/7qXcv+6lnH/uZVw/7mUb/+4k27/t5Js/7eRa/+2kGr/tZBp/7WPZ/+0jmb/tI1l
-/7OMZP+zi2L/soph/7KJYP+xiF7/sIdd/7CHXP+vhlv/roVZ/66EWP+tg1f/rIJW/6yBVP+qflH/
-yq6R//79/f/+/vz/6t2k/+DMd//hzXn/4c14/+XTiv/7+O3///////379f/Wukv/xJ0A/8WfAP/E
-ngD/zq4q//n04///////18Ot/59uOv+fbTn/nmw4/55rN/+dajb/nWk1/5xpNP+baDP/m2cx/5pm
-MPCZZC5cnW0zAJphLwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAwZ1/AMChfwDAoH88waB/3cCgfv/An33/v558/76dev++nHn/vZt4/7yadv+8
-mXX/u5h0/7uXc/+6lnL/upZx/7mVcP+5lG//uJNt/7eSbP+3kWv/tpBq/7WPaP+1jmf/tI5m/7SM
-Zf+zjGP/s4ti/7KKYf+xiWD/sYhe/7CHXf+whlz/r4Va/66EWf+tglb/updy//by7f//////8unE
-/+HNeP/hzXn/4c15/+HOe//07c////////Xu0f/LqBv/xZ4A/8WfAP/EnQD/2sFe//7++//9/fz/
-w6OD/6BvPP+hcT7/oXA9/6BvPP+fbjr/n205/55sOP+eazf/nWo2+pxpNIKaZy8Fm2gxAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AMOjhAC3oHcAwqKCV8Kjg+vCooL/waGA/8Ggf//An37/wJ99/7+ee/++nXr/vpx5/72beP+8mnb/
-vJl1/7uYdP+7l3P/upZy/7qVcf+5lXD/uJRu/7iTbf+3kmz/t5Fr/7aQaf+1j2j/tY5n/7SNZv+0
-jWT/s4tj/7OLYv+yimD/sYlf/7GIXv+wh1z/soph/+jc0P//////+fXl/+PRhP/hzXj/4c15/+HM
-d//r3qb///7+/+XTjP/FnwH/xZ8A/8WfAP/GoAT/6dug///////07+n/solg/6NzQv+kdEP/o3NC
-/6JyQf+icT//oXA+/6FwPf+gbzv+n205oJxqNxCdazgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDpIYAwaKEA8Ol
-hmjEpobww6WF/8OkhP/Co4P/wqKB/8GhgP/BoH//wJ9+/7+efP+/nXv/vpx6/72beP+9m3f/vJp2
-/7yZdf+7mHT/updy/7qWcf+5lXD/uZRv/7iTbv+4k23/t5Jr/7aRav+2kGn/tY9o/7SOZv+0jWX/
-s4xk/7OLY/+yimH/sIhd/9S+p////////v36/+nbnv/hzHf/4c15/+HNeP/k0YX/8+zL/9K0O//E
-ngD/xZ8A/8SeAP/NqyP/9/Lc///////j1MX/qXxO/6Z4Sf+md0j/pXZG/6R2Rf+kdUT/o3RD/6Nz
-Qf+icUCuoG89GaFvPgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxKiJAMOoiAXGqIpxxqiK8cWniP/E
-pof/xKWG/8Okhf/Do4T/wqOC/8Gigf/BoYD/wKB+/8Cfff+/nnz/vp16/76cef+9m3j/vJp3/7yZ
-dv+7mXT/u5hz/7qXcv+6lnH/uZVw/7mUb/+4k27/t5Jt/7eRa/+2kGr/tY9o/7WPZ/+0jmb/s4tj
-/8GhgP/49PD//////+/luf/fynD/4c56/+HNev/hzXr/2L5U/8ahBv/FnwD/xZ8A/8SdAP/cxWb/
-/v78//7+/f/LsJT/qHpM/6l8Tv+oe0z/p3pL/6d5Sv+meEj/pXdI/qV2Rq+jdEMdpHZFAKBwQQAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMmpjADKqIwGyKqNa8irje3Iqoz/x6mL/8aoif/Fp4j/
-xKaH/8Slhv/DpIX/wqOD/8Kigv/BooH/waF//8Cgfv/An33/v558/76dev++nHn/vZt4/72ad/+8
-mXX/u5h0/7uYc/+6l3L/upZx/7mVcP+5lG//uJNt/7eSbP+3kWv/tpBp/7eSa//l2Mr///////n1
-5P/awVz/3cZp/+DLdP/XvE3/x6IL/8WfAP/FnwD/xZ8A/8ilEv/w5r3///////Ps5f+2kWr/q39S
-/6t/Uv+qflH/qn1Q/6l8T/+oe039p3pMrKZ5SR2meUoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAADKrZAAyq2QA8qtkFvKrZDhyayP/8mrjv/Iqo3/x6mM/8epiv/GqIn/xaeI
-/8Smh//DpYX/w6SE/8Kjg//CooL/waGA/8Ggf//An37/v598/7+ee/++nXr/vpx5/72bd/+8mnb/
-vJl1/7uYdP+7l3P/upZy/7mVcP+5lXD/uJRu/7eRa//Ns5j//Pr5///////n15j/yqca/8yqHf/G
-oQf/xZ8A/8WfAP/FnwD/xJ0A/9rCX//9/Pj//////9rGsv+uhFj/rYNX/62CVv+sglX/rIFU/6uA
-U/mqflGbqX1OF6l9TgDFi3IAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAybCRAMawjwHLr5JBy6+Tysuvkv/KrpH/yq2Q/8msj//Jq47/yKqN/8epi//GqIr/xqiJ/8Wn
-iP/Epob/w6WF/8OkhP/Co4P/wqKB/8GhgP/BoH//wJ99/7+efP+/nXv/vpx6/72beP+9m3f/vJp2
-/7uZdP+7mHT/updy/7qWcf+8mnb/6d3S///////8+fD/2b9Z/8SdAP/FngD/xZ8A/8WfAP/EnQD/
-zq0r//Tt0P//////9fDr/76dev+whlz/sIdc/6+GW/+vhVr/roRY7qyCVnusgFIOq4BTALCEUgAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMyzlgDMr5QA
-zLGVJsyxlqLMsZX3zLCU/8uvk//Lr5L/yq6R/8qtkP/JrI//yKuO/8iqjP/HqYv/xqiK/8Wnif/E
-pof/xKWG/8Okhf/DpIT/wqOC/8Kigf/BoYD/wKB//8Cfff+/nnz/v517/76cef+9m3j/vZp3/7ya
-dv+7l3P/y6+T//j08P//////+PTh/9rBXv/Iow7/xZ8D/8ahB//Rszf/8Oa9///////+/f3/18Kt
-/7OMY/+zi2L/soph/7KJYP+xiF7Rr4ZcU66FWQWvhVoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADMtZ0AzrKXAM6ylwzOs5lpzrOZ
-3M6zmP/Nspf/zLGV/8ywlP/Lr5P/yq6S/8qtkf/KrZD/yauO/8irjf/Hqoz/x6mL/8aoif/Fp4j/
-xKaH/8Slhv/DpIT/wqOD/8Kigv/BoYH/waB//8Cgfv/An33/v557/76dev++nHn/vZt3/9jEr//8
-+vn///////z78//w5r//6dqg/+3hsf/59eX////////////n2s3/updz/7WPaP+1jmf/tI1m9LOM
-Y5+yimIouJhqAK+GXwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAM+1nADPtJwBz7WbLc+1m53PtZvwz7Sa/860
-mf/Ns5f/zbKW/8yxlf/LsJT/y6+S/8qukf/KrZD/yayP/8mrjv/Iqo3/x6qM/8epi//GqIn/xaeI
-/8Smhv/DpYX/w6SE/8Kjg//CooL/waGA/8Ggf//An37/v558/8Cfff/ax7P/+PXx////////////
-/////////////////fz6/+bZy//AoH7/uJNt/7iTbfu3kWvItZBpWLSNZgq0jmYAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADKyqIA0LWcAM+3nQjQt55L0bees9C3nfTQtpz/z7Wb/8+0mv/O
-s5j/zbKX/82ylv/MsZX/y7CT/8uvkv/KrpH/yq2Q/8msj//Jq47/yKqN/8epi//GqIr/xaiJ/8Wn
-iP/Epob/w6WF/8OkhP/Co4P/wqKB/8GhgP/AoH7/zbOZ/+PUxP/v597/8uvk//Hp4f/n287/07yk
-/76dev+6l3L9updy1rmVcHa4lG4byaB9ALSQawAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAANPCrQDTtJsA0rmgDdK5oFDRuaCu0bif7dG4nv/Qt53/0Lac/8+1m//OtJn/
-zrOY/82yl//MsZX/zLCU/8uvk//LrpL/yq6R/8qtkP/JrI//yKuN/8iqjP/HqYv/xqiK/8Wnif/E
-pof/xKWG/8Okhf/Co4P/waGA/8GhgP/DpIX/xKWG/8OkhP/An33/vZt4+b2beM28mnd3u5l0I7uX
-bwG7mHIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAyL61ANS4nADSuqIK07qiPdK6oYvSuaHQ0rmh9tG4n//Rt57/0Lad/8+1nP/PtZr/zrSZ
-/82zmP/Nspb/zLGV/8ywlP/Lr5P/yq6S/8qtkf/KrZD/yauO/8iqjf/Iqoz/x6mL/8aoif/Fp4j/
-xKaH/8Slhv/DpIT/wqOD/MKigeTBoH+qwJ9+XL+efBq8nn8Bvp5+AAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAA0rukANG8pALTvKQa07ujTtK6o43SuqLG0rqh6dK5oPrRuJ//0bee/9C2nf/PtZv/z7Sa/860
-mf/Os5f/zbKW/8yxlf/MsJT/y6+T/8uukv/KrZH/yayP/8mrjv/Iqo39x6mL8saoitbFp4inxKWG
-aMOkhC3CooIIw6KEAMKjgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-0bunANC6qQHTvKUR0rujMdK7o1nSuqKE0rmhqNK5oMPRuJ/Y0bee4tC3nevQtpzuz7Wb8c60me/O
-s5jszbKX5syxld3LsJTNy6+StMqukZXJrJBqyauOQciqjBzIqYwFxqyEAMyllgAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-ANXAqwDVwawA07ukBdG5ow/RuqIb0rmgKNG4oDPQuJ430LedO8+2mzjOtJo1zrSZLM2zmCDNspYU
-zLCUCcuykwLJrpIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/////////////////////
-////////////////////////////////////////////////////////////////////////////
-/////gAD////////////4AAAP///////////AAAAB//////////8AAAAAP/////////wAAAAAD//
-///////AAAAAAB////////8AAAAAAAf///////4AAAAAAAP///////wAAAAAAAD///////AAAAAA
-AAB//////+AAAAAAAAA//////8AAAAAAAAAf/////4AAAAAAAAAP/////wAAAAAAAAAH/////wAA
-AAAAAAAD/////gAAAAAAAAAB/////AAAAAAAAAAB////+AAAAAAAAAAA////+AAAAAAAAAAAf///
-8AAAAAAAAAAAf///4AAAAAAAAAAAP///4AAAAAAAAAAAH///wAAAAAAAAAAAH///wAAAAAAAAAAA
-D///gAAAAAAAAAAAD///gAAAAAAAAAAAD///gAAAAAAAAAAAB///AAAAAAAAAAAAB///AAAAAAAA
-AAAAB///AAAAAAAAAAAAA//+AAAAAAAAAAAAA//+AAAAAAAAAAAAA//+AAAAAAAAAAAAA//+AAAA
-AAAAAAAAAf/+AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8
-AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAA
-Af/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/8AAAAAAAAAAAAAf/+AAAAAAAAAAAAAf/+AAAAAAAA
-AAAAAf/+AAAAAAAAAAAAA//+AAAAAAAAAAAAA//+AAAAAAAAAAAAA///AAAAAAAAAAAAA///AAAA
-AAAAAAAAB///AAAAAAAAAAAAB///gAAAAAAAAAAAB///gAAAAAAAAAAAD///gAAAAAAAAAAAD///
-wAAAAAAAAAAAD///wAAAAAAAAAAAH///4AAAAAAAAAAAH///4AAAAAAAAAAAP///8AAAAAAAAAAA
-f///+AAAAAAAAAAAf///+AAAAAAAAAAA/////AAAAAAAAAAB/////gAAAAAAAAAB/////wAAAAAA
-AAAD/////wAAAAAAAAAH/////4AAAAAAAAAP/////8AAAAAAAAAf/////+AAAAAAAAA///////AA
-AAAAAAB///////wAAAAAAAD///////4AAAAAAAP///////8AAAAAAAf////////AAAAAAB//////
-///wAAAAAD/////////8AAAAAP//////////AAAAB///////////4AAAP////////////wAD////
-////////////////////////////////////////////////////////////////////////////
-//////////////////////////////////////////////////////////////////////8oAAAA
-gAAAAAABAAABACAAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAOTjogDg6aQB6NugBOnbngrp254Q6dudE+janRfo2p0X6NqcF+janBfp
-2poV6dqaEujamg3n2JoH6dOfAuOnkgDnzJwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA6t2hAO3hqQDo
-254F6dqbEenbmyrp2ptL6NqbZujZm4Xp2pub6dqbrunam77o2ZrJ6Nma0+jZmtTo2ZnU6NmY1ejZ
-mNDo2JfE6NiWt+fYlqXn15SR59eTd+fWklrn15E95teRHeXXkAvl2o0C5dmOAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADm2ZcA5NmYA+fZlRTo2JY66NmXaujZ
-mJvo2JjD6NmY4+jZl/Po2Zf76NiX/+jYlv/o2Jb/6NiV/+fYlP/n2JT/59eT/+fXk//n15L/59eS
-/+fWkf/n1pH/5taQ/+bWkP/m1o/+5tWO9+bVju3l1Y3Y5dSMseXUiobl04lW5dKHJ+XShgrq1n8A
-59SDAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAOfYkADo2JAD5teQGOfWkkzn1pKL59eTxefXk+zn15P759eS
-/+fXkv/n15H/5taR/+bWkP/m1pD/5taP/+bWjv/m1Y7/5tWN/+XVjf/l1Iz/5tSM/+bUi//l1Iv/
-5dSK/+XUiv/l1In/5dOJ/+TTiP/k04j/5NOH/+TTh//k0ob/5NKG/uTShfbj0YTe49GCq+LRgW/i
-z4Ax4c9+C+nWfgDk0X4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAA49mOALf/7QDk1osL5dWMOubVjITm1Y3J5tWO8+bVjv/m1Y3/5dWN/+bUjP/l1Iz/
-5dSL/+XUi//l1Ir/5dSJ/+XTif/l04j/5NOI/+TTh//k04f/5NKG/+TShv/k0oX/5NKF/+TRhP/j
-0YT/49GD/+TRg//j0YL/49GC/+PQgf/j0IH/4tCA/+LQgP/j0H//4s9//+LPf//iz37/4s99++LO
-feXhznut4c15YeDMdx/iz3QD4c51AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-4tGGANjNhgDl04UT5NOHU+XTiKvl04np5dOI/uTTiP/l04j/5NOH/+TSh//k0ob/5NKF/+TShf/k
-0YT/49GE/+TRg//j0YP/49GC/+PQgv/j0IH/49CB/+PQgP/j0ID/49B//+LPf//iz3//4s9+/+LP
-fv/iz33/4s99/+LOfP/hznz/4c57/+HNe//hzXr/4c16/+HNef/hzXn/4c14/+HMeP/hzHf/4Mx3
-/+DMdv/gzHX54Mt00eDLcoPgynAw38htBt/JbgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA4tGBAN7TggDj
-0IAT49CCWePRg7rj0YPz5NGD/+PRgv/j0IL/49CB/+PQgf/j0ID/49CA/+LQf//jz3//4s9+/+LP
-fv/iz37/4s99/+LPff/iznz/4s58/+LOe//hznv/4c16/+HNev/hzXn/4c15/+HNeP/hzXj/4cx3
-/+HMd//gzHb/4Mx2/+DMdf/gy3X/4Mt0/+DLdP/fy3P/38ty/9/Kcv/fynH/38px/9/KcP/fynD/
-38lv/9/Jb//fyW7/3slu/d7IbODex2qS3cZpNd3DaAXdxGgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA//+OAN/LegDhznsL4c98UOLP
-fbniz3714s9+/+LPff/iz33/4s98/+LOfP/iznv/4c56/+HNev/hzXn/4c15/+HNeP/hzXj/4c13
-/+HMd//hzHb/4Mx2/+DMdf/gzHX/4Mx0/+DLdP/gy3P/4Mtz/+DLcv/gy3L/38px/9/Kcf/fynD/
-38pw/9/Jb//fyW7/38lu/9/Jbf/eyW3/3sls/97IbP/eyGv/3shr/97Hav/ex2r/3sdp/97Haf/d
-x2j/3cZo/93GZ//dxmf/3cZm/93FZv7cxGTi3MRjitvCYSnbvWEB28FgAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAODNdwDhznYD4Mx3NeDMeKLhzXjw4c14
-/+HMeP/hzHf/4cx3/+HMdv/gzHb/4Mx1/+DLdf/gy3T/4Mtz/+DLc//gy3L/4Mpy/+DKcf/fynH/
-38pw/9/KcP/fyW//38lv/9/Jbv/fyW7/38lt/97Ibf/eyGz/3shs/97Ia//eyGv/3sdq/97Hav/e
-x2n/3sdo/93GaP/dxmf/3cZn/93GZv/dxmb/3cVl/93FZf/dxGT/3MRk/9zEY//cxGP/3MRi/9zD
-Yf/cw2H/3MNg/9zDYP/cw1//28Jf/9vCXv/bwl792sJd1trBWm/bwFkU0cZUAN6+WwAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANzObwDixnMA38pwFd/KcXbfynPf38tz/9/Lcv/fynL/
-38px/9/Kcf/fynD/38lw/9/Jb//fyW//3slu/97Jbf/eyG3/3shs/97IbP/eyGv/3sdr/97Iav/d
-x2r/3cdp/93Gaf/dxmj/3cZo/93GZ//dxmf/3cVm/93FZv/cxWX/3MRk/9zEZP/cxGP/3MRj/9zE
-Yv/cxGL/3MNh/9vDYf/bw2D/28Jg/9vDX//bwl//28Je/9vCXv/bwl3/28Fc/9vBXP/awVv/2sFb
-/9rBWv/awVr/2sBZ/9rAWf/awFj/2cBY/9nAV//Zv1f/2b9W+Nm+VLbYvVI/1b1OBNa9TwAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADdyGsA28xqAd7HajfeyGyz3slt+N7IbP/eyGz/3shr/97Ha//e
-x2r/3cdq/93Haf/dxmn/3cZo/93GZ//dxmf/3cZn/93FZv/dxWX/3cVl/9zEZP/cxGT/3MRj/9zE
-Y//cw2L/3MNi/9zDYf/cw2H/28Ng/9vDYP/bwl//28Jf/9vCXv/bwl7/28Jd/9vBXP/bwVz/2sFb
-/9rBW//awVr/2sFa/9rAWf/awFn/2sBY/9rAWP/Zv1f/2cBX/9m/Vv/Zv1b/2b9V/9m/Vf/ZvlT/
-2b5U/9m+U//YvlL/2L5S/9i9Uf/YvVH/2L1Q/9i9UP/YvU//2L1P/9e8TuPWu0x417pJEte4SwDV
-wkUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAA28VjANvEYgrcxWVl3cVm293GZ//dxmb/3cVl/93FZf/dxWT/3MRk/9zE
-Y//cxGP/3MNi/9zDYv/cw2H/3MNg/9vDYP/bw1//28Jf/9vCXv/bwl7/28Jd/9vCXf/bwlz/28Fc
-/9vBW//awVv/2sFa/9rBWv/awFn/2sBZ/9rAWP/awFf/2b9X/9m/V//Zv1b/2b9V/9m/Vf/Zv1T/
-2b5U/9m+U//ZvlP/2b5S/9i+Uv/YvlH/2L1R/9i9UP/YvVD/2LxP/9i8T//XvE7/17xO/9e8Tf/X
-vE3/17tM/9e7S//Xu0v/17tK/9e7Sv/Xu0n/1rpJ/9a6SP/Wukj/1rpH/9W5R/jVuUWr1bhCLW9/
-AADUuEEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAA3cFlANnCWwDawV4X28NgjdvDYfPbw2H/28Ng/9vCX//bwl//28Je/9vCXv/bwl3/2sJc
-/9rBXP/awVv/2sFb/9rBWv/awVr/2sBZ/9rAWf/awFj/2cBY/9nAV//Zv1f/2b9W/9m/Vv/Zv1X/
-2b9V/9m+VP/YvlT/2L5T/9i+U//YvlL/2L1S/9i9Uf/YvVD/2L1Q/9i9T//XvE//17xO/9e8Tv/X
-vE3/17xN/9e7TP/Xu0z/17tL/9a7S//Wu0r/1rtK/9a6Sf/Wukj/1rpI/9a6R//WuUf/1rlG/9W5
-Rv/VuUX/1blF/9W5RP/VuET/1bhD/9W4Q//VuEL/1LhC/9S3Qf/Ut0H/1LdA/9S3QP/Utj7Q07Y8
-TNK0NwPTtToAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-ANi+VgDdw10A2cBYKNrAWq7awVv72sFa/9rAWv/awFn/2sBZ/9nAWP/ZwFf/2b9X/9m/Vv/Zv1b/
-2b9V/9m+Vf/ZvlT/2b5U/9i+U//ZvlP/2L5S/9i9Uv/YvVH/2L1R/9i9UP/YvVD/17xP/9e8T//X
-vE7/17xO/9e7Tf/Xu03/17tM/9e7S//Xu0v/1rtK/9a6Sv/Wukn/1rpJ/9a6SP/Wukj/1rlH/9a5
-R//VuUb/1blG/9W5Rf/VuEX/1bhE/9W4RP/VuEP/1bhC/9W4Qv/Ut0H/1LdB/9S3QP/Ut0D/1Lc/
-/9S2P//Utj7/1LY+/9O2Pf/TtT3/07U8/9O1PP/TtTv/07U6/9O0Ov/TtDn/07Q5/9K0OP/Sszfm
-0rI1a9GxMQnRsjMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADYvlEA
-2L9cANi+UjXZvlTE2b5U/9m+VP/ZvlP/2L5T/9i+Uv/YvlL/2L1R/9i9UP/YvVD/2L1Q/9i9T//Y
-vE7/17xO/9e8Tf/XvE3/17tM/9e7TP/Xu0v/17tL/9e7Sv/Xu0r/1rpJ/9a6Sf/Wukj/1rpI/9a6
-R//WuUf/1rlG/9a5Rf/VuUX/1bhE/9W4RP/VuEP/1bhD/9W4Qv/VuEL/1bdB/9W3Qf/Ut0D/1LdA
-/9S3P//Utz//1LY+/9S2Pv/Utj3/07U8/9O1PP/TtTv/07U7/9O1Ov/TtTr/07Q5/9O0Of/TtDj/
-07Q4/9K0N//StDf/0rM2/9KzNv/SszX/0rM0/9KzNP/RsjP/0bIz/9GyM//RsjL/0bEx/9GxMf/R
-sTDx0LAugc+tLA3Pri0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1bxJAO6weQDX
-u00917xOz9i8Tv/XvE3/17xN/9e8TP/Xu0z/17tL/9e7S//Xu0r/17tK/9e7Sf/Wukj/1rpI/9a6
-R//Wukf/1rlG/9a5Rv/WuUX/1rlF/9a5RP/VuET/1bhD/9W4Q//VuEL/1bhC/9W3Qf/Vt0H/1bdA
-/9S3QP/Utz//1Lc+/9S2Pv/Utj3/1LY9/9S2PP/UtTz/1LU7/9O1O//TtTr/07U6/9O1Of/TtDn/
-07Q4/9O0OP/TtDf/0rQ3/9K0Nv/Sszb/0rM1/9KzNf/SszT/0rIz/9KyM//SsjL/0bIy/9GyMf/R
-sTH/0bEw/9GxMP/RsS//0bEv/9GxLv/QsC7/0LAt/9CwLf/QsCz/0K8r/9CvK//Qryr/0K8q/8+v
-Kv/Prin2z64njM+sJBLPrSUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANm3RgDFyUkA1rlGPta5
-SNLWukj/1rpH/9a5R//WuUb/1rlG/9a5Rf/WuEX/1bhE/9W4RP/VuEP/1bhC/9W4Qv/Vt0H/1bdB
-/9W3QP/Vt0D/1Lc//9S2P//Utj7/1LY+/9O1PP/TtDn/07Q4/9O0OP/TtDj/0rQ3/9KzNv/SszX/
-0rM3/9O0OP/TtDj/07Q3/9OzN//Sszb/0rM2/9KzNf/SszX/0rM0/9KyNP/SsjP/0rIz/9GyMv/R
-sTL/0bEx/9GxMf/RsTD/0bEw/9GwL//RsC7/0bAu/9CwLf/QsC3/0LAs/9CvLP/Qryv/0K8r/9Cv
-Kv/Qrir/z64p/8+uKf/Prij/z64o/8+uJ//PrSb/z60m/8+tJf/PrSX/zq0k/86sJP/OrCP/zqwj
-/86sIv/OrCL5zaoflsijDRPKphUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADizW4AtoIAANO0OzzUtj/S1bdC
-/9W3Qf/Ut0H/1LdA/9S2P//Utj//1LY+/9S2Pv/Utj3/07Y9/9O2PP/TtTz/07U7/9O1O//TtTr/
-07Q6/9O0Of/TtDn/07Q4/9KzNv/SsjT/1bhD/9zEY//j0IL/59eX/+rbof/o2Jf/5NGE/93Gaf/X
-u0v/0rM0/9CwLf/QsTD/0bEw/9GxMP/RsS//0LAv/9CwLv/QsC7/0LAt/9CvLf/Qryz/0K8s/8+v
-K//Pryr/z64q/8+uKf/Prin/z64o/8+uKP/Prif/z60n/8+tJv/OrSb/zq0l/86sJf/OrST/zqwk
-/86sI//OrCL/zawi/82rIf/NqyH/zasg/82rIP/Nqx//zaof/82qHv/Nqh7/zaod/8yqHf/Mqhz/
-zKkc/8ypGv/MqRr62L5Sjv///w7y6sgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/v7+APjz3gD+/vwx696ozNnAWP/TtDn/
-07Q5/9O1Ov/TtDn/07Q4/9O0OP/TtDf/0rQ3/9KzNv/Sszb/0rM1/9KzNf/SszT/0rM0/9GyM//R
-sjP/0bIy/9GxMf/QsC7/1bhD/+TSiP/07Mz//Pnw//79+/////7////////////+/vz//fv0//jz
-3//t4a//3shr/9GzNP/PrSb/z64p/8+uKP/Prij/z64n/8+uJ//PrSb/z60l/86tJf/OrCX/zq0k
-/86sJP/OrCP/zqwi/86sIv/NqyH/zawh/82rIP/NqyD/zasf/82rH//Nqh7/zaoe/82qHf/Nqh3/
-zKoc/8ypG//MqRv/zKka/8ypGv/MqRn/zKkZ/8uoGP/LqBj/y6gY/8uoF//Lpxb/y6cW/8unFf/K
-phL/zaoe/+HNe//49OL3////hP7//wn+/v4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD+/v4A/v7/Iv7//77+/v3/+PPf/+TSif/U
-tj3/0bEv/9GyMv/RsjL/0bIx/9GxMf/RsTD/0LEw/9CxL//RsS7/0LAu/9CwLf/QsC3/0LAs/9Cv
-LP/Pryn/0LAt/97Ha//07Mz//v37////////////////////////////////////////////////
-///////9+/T/8Oa9/9vCXf/OrCL/zasg/82rIf/NqyD/zasg/82rH//Nqx//zaoe/8yqHv/Nqh3/
-zaod/8yqHP/Mqhv/zKkb/8ypGv/MqRr/y6kZ/8uoGf/LqBj/y6gY/8uoF//LqBf/y6gW/8unFv/L
-pxX/yqcV/8qnFf/LpxT/yqYU/8qmE//KphL/yqYS/8qlEv/JpRH/yaUR/8mlEP/JpQ//yaMM/8+u
-J//q3KH//fz3///////////z////cfn15gT9/PgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA8efBAOjYmRL8+vOk/////v///////////fz4/+/l
-uP/Zv1T/z64p/8+uKf/Qryr/z68q/8+vKf/Prin/z64o/8+uKP/Prif/zq4n/8+tJv/OrSX/zawi
-/9O2Pf/p2pz//Pnw//////////////////379f/4897/8+vK//LpxP/z68j/9/HZ//v57//+/v3/
-////////////////+vfr/+TRhv/OrSX/y6gY/8ypGv/LqBn/y6gZ/8uoGP/LqBj/y6gX/8uoF//L
-pxb/y6cV/8qnFf/KpxX/yqcU/8qmFP/KphP/yqYT/8qmEv/KpRL/yqUR/8mlEf/JpRD/yaUQ/8ml
-D//JpA//yaQO/8mkDv/JpA3/yKQN/8ijDP/Iowz/yKML/8ijC//Iogr/yKIK/8ehBv/Qry7/7+S4
-///+/v////////////v58P/m1ZHpy6gbVmwEAADFnQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAMijDgDHoAUGyqYXgNrBXvnw5r3//fz3////////////////
-//j04f/j0IH/0bIy/82rIP/OrCL/zqwj/86sIv/OqyL/zqsh/82rIf/NqyD/zKkc/86sI//cxGL/
-9OzN///+/f////////////38+P/07M3/6dqb/+PQgv/hzXn/4cx3/+HNef/iz37/5tWP/+7jtP/5
-9OP//v79/////////////fz4/+rbn//OrST/yaUR/8qmE//KphP/yqUS/8qlEf/KpRH/yaUR/8ml
-EP/JpBD/yaQP/8mkD//JpA7/yaQO/8mkDf/Jow3/yaMM/8ijDP/Iowv/yKMK/8iiCv/Iogn/yKIJ
-/8eiCP/HoQj/x6EH/8ehB//HoQb/x6EG/8ehBf/GoAT/xqAE/8agBP/FngH/zq4s//Dmv///////
-///////////28Nf/2cBc/8ahCf/FngDYxJ8ANsaeAADCoQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADKpxEAv48AAMmkDlbFnwLtxJ0A/8mlFv/dxmz/9u/W////////////
-//////38+P/x6MD/3MRj/8+uKf/LqBj/y6gX/8uoGP/Lpxb/y6cV/8ypHP/WuUX/692j//v57///
-///////////+/f/17tP/4s5//9e9T//YvlT/3cdp/+HNeP/hznr/4c15/+HNeP/hzHf/4cx3/+TS
-hv/w5rv//Prz/////////////v78/+rcof/MqRr/yKMK/8mjDP/Jowv/yKML/8ijCv/Iogr/yKIJ
-/8iiCf/Iogj/x6II/8ehB//HoQb/x6EG/8ehBf/HoQX/x6EF/8agBP/GoAT/xqAD/8agA//GoAL/
-xaAC/8WfAv/FnwL/xZ8C/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8yqI//v5bv/////////////
-////8ejE/9GzOf/EngD/xZ8A/8WfAP/FnwC1xJ8AGMSfAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAo8oAAMigCADHogkqxqAE0cWfAP/FnwD/xZ4A/8SeAf/Ori3/6dqe//z68v//
-///////////////8+vP/8ejB/+PQgP/YvlH/1LY+/9W5Q//dxWX/692m//n15P////7/////////
-///7+e7/5tWQ/82sJv/FnwT/xZ8C/8agBv/JpRL/0bM2/9zFZv/hznv/4c15/+HNef/hzXn/4c14
-/+HNef/q25//+vfp/////////////v36/+TSiP/Hogz/x6AE/8egBf/HoAT/xqAE/8agA//GoAP/
-xqAC/8WgAv/FoAL/xZ8C/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/JpRX/696o//////////////////Dl
-vP/OrSr/xJ0A/8WfAP/FnwD/xZ8A/8WfAPzFnwCEwJwABcOeAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAADFoAMAxaEHDMWfAZ/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/GoQv/2L5V//Ho
-wv/+/fn//////////////////v78//z68v/69uf/+/js//38+P/////////////////+/vz/8+vJ
-/9e9U//GoAn/xJ4A/8WfAP/FnwD/xZ8A/8WeAP/FngD/yaYV/9i9Uv/hzXn/4c16/+HNef/hzXn/
-4c15/+HMd//o2Zn/+vfp/////////////Prx/9rCYP/EngH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/xqAI/+TSiP/+/vv////////////w5r7/zqwp
-/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAevHohZNjUAAAPLt1AAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAuo8AAO3VCADEnQJgxJ0A9MWeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/yqcZ
-/93HbP/z6sj//fz3/////////////////////////////////////////v7/+PPf/+PQg//MqiH/
-xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/DnAD/xqAJ/9W5Rv/hzXj/4c15/+HNef/h
-zXn/4c15/+HMd//p257//Prx////////////9e/V/86vLv/EngD/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/ZwFv//Pnw////////////9OzO/8+wMf/EnQD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwT/1LdC/+7juML///8d/fz5AAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAADdx2wA4tCEJdW5S87Rszj/yaYV/8SeAf/FngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/
-xJ4B/8qnGv/awV3/6t2l//bw2P/8+fD//fz2//389v/7+O3/8+zM/+PRhv/PsDD/xZ8E/8SeAP/F
-nwD/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/FnwX/za0n/9W6S//Rsjf/yqYX/9a6SP/hzXn/4c15/+HN
-ef/hzXn/4c15/+HNeP/u4rP//v37////////////6Nmc/8ahCf/FnwD/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/zq4s//Xu0/////////////n15P/VuUf/xJ0A/8WfAP/F
-nwD/xZ8A/8WfAP/FngD/xqIL/97Jcf/59eT//////P///3////8D////AAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-/v7+AP///wT9/PeH+/nv/vv47P/x6ML/3MRm/8mlFP/EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ4A/8SdAP/GoQj/zKog/9O2Qv/XvVX/171U/9K0PP/Kpxj/xZ4D/8SeAP/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/EnQD/yqca/+LOgP/38tz//Pvz//v46//u4rT/2L1T/9rBWf/hzXr/4c15
-/+HNef/hzXn/4c14/+LPf//07tH////////////7+e//1rtM/8SdAP/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8A/8ahCv/o2Zv////////////9/Pf/3sly/8WeAv/FnwD/xZ8A/8Wf
-AP/FnwD/xZ4A/8ikEf/k0on//fv1/////////////fz73+7m3TX18OsARScAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD+
-/v4A/v7+N////+L////////////////9/Pf/7uKz/9O1P//FnwX/xJ4A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/EngD/xJ0A/8SdAP/EnQD/xJ0A/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/EngD/xZ8F/9S4Rf/w5r7//v37///////////////////////59eb/49CC/97IbP/hzXr/
-4c15/+HNef/hzXn/4Mx3/+fXlf/8+e/////////////u4rP/yKMQ/8WfAP/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/EnQD/171T//z68f///////////+zeqv/IoxD/xZ4A/8WfAP/FnwD/xZ8A
-/8WeAP/Hog3/5dON//79+f////////////j08P/IrJD/mGMunXQtAAmGRwcAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////AP//
-/wf///+b////////////////////////////////+fXl/+TRh//MqyT/xJ4B/8SeAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xJ0A/8qnGv/iz4H/+vbn///////////////////////////////////////79+v/5dOM/+DLdf/h
-zXn/4c15/+HNef/hzXn/4c15//HowP////////////z68//XvVL/xJ0A/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ4A/8mmF//w5r7////////////3897/0bI2/8SeAP/FnwD/xZ8A/8WfAP/FnwD/
-xqAG/+HNfP/9/Pb////////////x6eH/sopj/4dKDP+FRgbshkgIRIVHCQCJSwAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD69/QA+/r4
-Pvbx7eju5dv/8erj//r39P////7//////////////////v78//Xu0v/fynP/y6kg/8SeAf/EngD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8ehC//X
-vFH/8efA//79+v/////////////////9/fz/+PTx//n28////v7////////////49OH/5NKG/+HM
-d//hzXn/4c15/+HNef/hzHf/5dSO//v47P///////////+zgrf/Hogz/xZ8A/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/EnQD/3MVo//79+f///////v78/+HNfP/FngL/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/Z
-v1j/+/jt////////////7+fe/6h8Tv+FRgb/hkcH/4ZICP+GSAilh0gHCoZIBwAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAmGUvAIdMDwasg1ea
-onNC/5VeJv+YZC7/qX1Q/8aoiv/m2cz/+/n3//////////////////79+v/07M//4cx6/8+vLv/G
-oQj/xJ0A/8SeAP/FngD/xZ8A/8WfAP/FnwD/xZ8A/8WeAP/EngD/xJ0A/8ejDv/UuEb/692l//z5
-7//////////////////59vL/3cu5/7qWcv+jdUX/p3pM/9S+pv/8+vj////////////z7Mz/4s99
-/+HNeP/hzXn/4c15/+HNef/hzXn/8ejB////////////+/js/9O2QP/EnQD/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ4A/8qnGv/y6cX////////////z68v/y6kg/8SeAP/FnwD/xZ8A/8WfAP/EngD/zq4t//Xv
-1P////////////Tv6f+tg1j/hEUF/4ZIB/+GSAj/hkgI/4ZICOuGSAhChUgIAJA1CgAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGRwcAhkcIM4VGBuKE
-RQT/hUYF/4RFBf+ERQT/hUcH/5FYHv+xiWD/3869//v59//////////////////+/vz/+PTh/+vd
-pv/cxGb/0bI3/8qnGP/How3/xqEJ/8ahCP/Hogz/yqYW/9GyNv/dx27/7uKz//v47f//////////
-///////8+/n/4NDA/6yBVv+MUBT/hEUE/4RFBP+DRAP/jFEV/9K7o/////////////389//q3KH/
-4cx3/+HNef/hzXn/4c15/+HMd//n15T//Pry////////////5dSQ/8WfBP/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/EnQD/3MRl//79+f///////v35/9zFaf/EngD/xZ8A/8WfAP/FnwD/xZ8A/8eiC//p2p//////
-///////7+ff/vJl3/4ZICP+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICJqHRgcGhkcHAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkYHAIVAAwGGRwiDhkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hUYG/4RFBP+OVBn/s4xl/+LSw//7+fb/////////////////////
-//79+v/69+r/9O7R/+7jt//r3qj/696o/+7itP/07M7/+vfp//79+///////////////////////
-7ubd/72bef+PVxz/hEUE/4VHB/+GSAj/hkgI/4ZICP+ERQT/mmYy/+7m3f////////////bw1v/i
-z3//4c14/+HNef/hzXn/4c15/+HOfP/07dD////////////179b/zKoi/8SeAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ4A
-/8mlE//w5r7////////////z6sj/yqca/8WeAP/FnwD/xZ8A/8WfAP/EnQD/2L5W//z68v//////
-/////9S9p/+LTxP/hUcG/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI4YZHCDGGRwgAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGRwgAhkcIHYZICM+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv+ERQT/j1Ub/7CIX//dy7n/+PXx////////////
-///////////////////////////////////////////////////////////+/fz/8Ojg/8qvk/+b
-aDT/hUYH/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwj/xaeJ/////v///////fz3/+nb
-nv/gzHf/4c15/+HNef/hzXn/4Mx2/+vdpf/+/fr///////79+P/bwmD/xJ0A/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/
-17tO//z68v///////v77/9/Jcv/EngD/xZ8A/8WfAP/FnwD/xZ4A/8mmF//w5r7////////////t
-5Nv/m2g1/4RFBf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj+hkgIe+ItAgCESAgAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAgUMHAIdICACFRwhZhkgI94ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwb/hEUE/4xRFf+pfE//z7ed/+rg1f/2
-8u3//Pr5//////////////////////////////7+//v59//z7ef/3sy7/72cef+aZzL/hkkK/4RF
-Bf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RFBf+ZZTH/7ubd////////////8+zL
-/+HOe//hzXn/4c15/+HNef/hzXj/5NKG//n15v///////////+vdpf/GoAj/xZ8A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8A/8agCP/q
-26H////////////28Nf/zasl/8SeAP/FnwD/xZ8A/8WfAP/EnQD/3MRm//79+P///////fz7/72b
-eP+FRgb/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjEhUcHFYVHBwAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAhUcHB4ZICKGGSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4RFBP+HSQr/kloh/6Fw
-P/+yimH/xKWF/82ymP/QuaD/0Lmg/8yyl//BoYD/r4Vc/5xpNv+MUBT/hEUF/4RGBf+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICf/JrpH////////////7+e//
-5tWP/+HMd//hzXn/4c15/+HNef/hzXj/8enD////////////9/Lc/82sKP/EngD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/zq4t//jz
-3////////////+XUj//FnwP/xZ8A/8WfAP/FnwD/xZ4A/8mmFf/x6MH////////////l18n/kVkg
-/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPGGSAdJh0gHAFA6OgAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIZHCACHRwgmhkgI3IZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwb/hEUE
-/4REA/+ERQT/hUcH/4dJCv+HSQr/hUcH/4RFBP+ERAT/hEUF/4VHB/+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/6JyQv/18ez////////+/v/u
-47P/4cx3/+HNef/hzXn/4c15/+DMdv/q25///v35///////9/Pj/2sFf/8SdAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/ex23//v78
-///////7+e7/07dC/8SdAP/FnwD/xZ8A/8WfAP/EnQD/2b9Z//379f///////fv6/7eSbP+ERQT/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VICIyBRg0ChEcJAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACERQIAh0gJAIZHB12GSAj4hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwf/i1AU/93Muv////////////bw
-2P/iz37/4c14/+HNef/hzXn/4c14/+TShf/59eb////////////o2p3/xaAG/8WfAP/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/x6IO/+7itP//////
-//////DmvP/IpBH/xZ4A/8WfAP/FnwD/xZ8A/8eiC//s4K3////////////o28//klsi/4VGBv+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgIx4RHCBaFRwgAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIVIBgCESQUFhkgImYZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/u5l1//79/f///////Prz
-/+fXk//hzHf/4c15/+HNef/hzXn/4c15//PqyP////////////Xu0v/LqB7/xZ4A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/QsDL/+fXl////////
-/v3/4Mt3/8SeAP/FnwD/xZ8A/8WfAP/EnQD/0bM5//r26P////////7+/8Ghgf+FRgb/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjuhkgIQIZICAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkgHAIZIBxeGSAjKhkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RFBP+ebDr/9O7o//////////7/
-7uO0/+HMd//hzXn/4c15/+HNef/gzHb/696n//7++////////Prx/9W4R//EnQD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/93HbP/+/vz///////r3
-6v/Rszj/xJ4A/8WfAP/FnwD/xZ8A/8SeAP/iz4D////////////y7OX/nWo2/4RFBf+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP2GSAh0gkwJAIlFBwAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAhkgIPIZICOyGSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4xQFP/ezbz////////////1
-79T/4s58/+HNef/hzXn/4c15/+HMd//m1Y3/+/nv////////////4c59/8SeAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAP/GoQr/696p////////////8Oa+
-/8ikEf/FngD/xZ8A/8WfAP/FngD/yaYW//Lpxf///////////9bBq/+JTA7/hkcH/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICKaFRwcIhkcHAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAj0gCAINICgCGSAdlhkgI+oZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUYF/8Kjgv////////////v5
-7v/l1Iz/4cx3/+HNef/hzXn/4c14/+LPfv/28Nf////////////t4bH/x6IM/8WfAP/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8yrI//28dn////////////j0IT/
-xZ4A/8WfAP/FnwD/xZ8A/8SdAP/Tt0P/+/nu///////8+/n/tI1l/4REBP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI0YdGBxmGRwcAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAACGSAcAh0gFAoZICJGGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/pnlL//n18v///////v37
-/+vepv/gzHb/4c15/+HNef/hzXn/4cx3//DmvP////////////fx2v/MqyT/xJ4A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/1rtO//379P///////Prz/9W6S//E
-nQD/xZ8A/8WfAP/FnwD/xJ4A/+LOf/////////////Do3/+YYyz/hUYF/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjshkgIOYZICAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAIVIBwCFSAcNhkgIt4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VGBv+SWyH/6t/U////////////
-8unE/+HNeP/hzXn/4c15/+HNef/gzHb/6tug//79+f///////Prz/9W6TP/EnQD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WeAf/j0IP////////////28Nj/zKoh/8Se
-AP/FnwD/xZ8A/8WfAP/How//7+W6////////////1sGs/4lMDv+GRwf/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPiGSAhdhEkIAKU/DAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAhkcHAIZHCByGSAjUhkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgH/4dKDP/TvaX////////////3
-897/49CA/+HNeP/hzXn/4c15/+HMeP/l1Iv/+/nu////////////4c18/8SeAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/x6IM/+3isv///////////+3grv/HoQv/xZ8A
-/8WfAP/FnwD/xJ4A/8+vLv/59eP///////79/f+6l3P/hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICIB7PQcAiEkIAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAACGRwgAhkcINIZICOiGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/7qXcv/+/f3///////z6
-8v/m1pH/4cx3/+HNef/hzXn/4c14/+LPfv/28dj////////////s36v/xqEK/8WfAP/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/MqiH/9/Ha////////////4c18/8SeAP/FnwD/
-xZ8A/8WfAP/EnQD/2sFd//79+P//////9/Lu/6BwP/+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgInYVHBwWGSAgAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAIZICACFSAdJhkgI8oZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/o3RE//j08P///////v37
-/+vep//gzHf/4c15/+HNef/hzXn/4c14//Howf////////////Xu0f/LqBz/xJ4A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9O3RP/8+vD///////z78//Wu03/xJ0A/8WfAP/F
-nwD/xZ8A/8WfAv/m1ZH////////////n2s3/kFcd/4VHBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAi2hUYIDYVHCAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAACeVgAAhEcIAIZHCF2GSAj4hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv+SWyH/6uDU////////////
-8ejC/+HNeP/hzXn/4c15/+HNef/gzHb/7N+o//7+/P//////+/jt/9K0O//EnQD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/3sdu//7+/f//////+PTh/86tKv/EngD/xZ8A/8Wf
-AP/FngD/yKQR//Dmvf///////////9G5of+HSQv/hkgH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICMyFRwgUhkcIAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAI9QCQCCRAkAh0kJcodJCf6GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkcH/4hLDv/Wwav////////////2
-8dn/4s9+/+HNef/hzXn/4c15/+HMd//n15P//Pv0///////+/fr/28Nj/8SdAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WeBP/n15X////////////x6MH/yKQS/8WeAP/FnwD/xZ8A
-/8SeAP/OrSj/+PTg///////+/v3/uZZx/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI3IZHBx+FSAcAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAi0sQAIVMBwCJSw2DiEsM/4hKC/+HSQr/h0kJ/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUF/8Gigf////////////v4
-7P/l04r/4cx3/+HNef/hzXn/4c14/+PRhP/59eT////////////l1I3/xZ4C/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwD/x6MO/+/kuP///////////+nanv/FnwX/xZ8A/8WfAP/FnwD/
-xJ0A/9a6S//8+vP///////j18v+ld0n/hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjkhkcILIVHCAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAACLThMAgUcAAIpOEY2KTRD/ikwP/4lMDv+JSw3/iEoM/4hKC/+HSQr/h0kJ/4ZICf+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERAT/q4BV//r49f///////fz4
-/+nam//gzHf/4c15/+HNef/hzXn/4s57//Xu0f///////////+7itP/Hog3/xZ8A/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8SeAP/Mqh7/9vDY////////////4Mx4/8SdAP/FnwD/xZ8A/8WfAP/E
-nQD/38ly/////v//////7+fe/5ZhKf+FRgX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICOqFSAc2hUgIAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAItQEwCKTxIDjFATmIxQE/+LTxL/i04S/4tOEf+KTRD/ikwP/4lMDv+JSw3/iEoM/4dKC/+H
-SQr/h0gJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RGBf+aZjD/8+3m//////////7/
-7uKy/+HMd//hzXn/4c15/+HNef/hzXf/8Oa8////////////9vDW/8ypH//EngD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xJ4A/9KzOf/7+Oz///////389v/YvlT/xJ0A/8WfAP/FnwD/xZ8A/8Wf
-BP/o2Jj////////////gz7//jFEV/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI7YVICDyFSAgAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAjFMVAItSFASNUxaZjVIV/41SFf+NURT/jFAT/4xQE/+LTxL/i04R/4pOEP+KTQ//iUwO/4lM
-Df+ISw3/iEoL/4dKC/+HSQr/h0gJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcG/45UGP/j1MX////////////z
-68n/4c15/+HNef/hzXn/4c15/+DMdv/r3qX//v37///////7+O3/0rQ8/8SdAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/EnQD/2L5W//389v//////+vjr/9GzOf/EnQD/xZ8A/8WfAP/FnwD/x6MO
-/+/kt////////////9C4n/+GSQr/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjxhkcHRoZHBwAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACPVRkAjVQZBI9VGZmPVRj/jlQX/45UF/+OUxb/jVIV/41RFP+MURT/jFAT/4xPEv+LTxL/i04R
-/4pNEP+KTQ//iUwO/4lLDf+ISwz/iEoL/4dJCv+HSQn/h0gJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAf/hkkL/9G5ov////////////fy
-3P/jz3//4c14/+HNef/hzXn/4cx3/+fWkv/8+/T///////79+f/awmD/xJ0A/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8SdAP/fyXL///79///////28dn/zKoh/8SeAP/FnwD/xZ8A/8SeAP/LqR3/
-9vDV////////////v558/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPGGRwdGhkcHAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AJBXHQCQVx0DkVgdmJFXHP+QVxv/kFYa/49VGf+PVRj/jlQX/45TFv+NUxb/jVIV/41RFP+MUBT/
-jFAT/4tPEv+LThH/ik4R/4pNEP+KTA//iUwO/4lLDf+ISwz/h0oL/4dJCv+HSAn/hkgJ/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/vp17////////////+/jt
-/+XTi//hzHf/4c15/+HNef/hzXj/5NKF//n25v///////////+PQhf/EngH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ4D/+bVkP////////////How//IpBL/xZ8A/8WfAP/FnwD/xJ4A/9CxMv/6
-9+r///////z6+P+wh1z/hEUD/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI7IZHCDuGRwgAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-kVofAKprMwCSWyCOk1og/5JZH/+SWR7/kVgd/5FXHP+QVhv/kFYa/49VGf+PVRj/jlQX/45TFv+N
-UxX/jVIV/4xRFP+MURT/jFAT/4tPEv+LThH/ik4Q/4pND/+KTA//iUwO/4lLDf+ISgz/iEoL/4dJ
-Cv+HSQn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4REBP+qf1T/+vj1///////9/Pf/
-6Nma/+DMd//hzXn/4c15/+HNef/iznz/9u/V////////////696o/8agCf/FnwD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAP/GoQn/696o////////////696p/8ahCf/FnwD/xZ8A/8WfAP/EnQD/1rtO//z7
-9P//////9/Pv/6FxQf+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjqhUgHNoVICAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACV
-XSUAlFwiAJRdJIKUXSP/lFwi/5NbIf+TWyH/klof/5JZHv+SWR7/kVgd/5FXHP+QVhv/kFYa/49V
-Gf+PVBj/jlQX/45TFv+NUhX/jVIV/4xRFP+MUBP/jFAT/4tPEv+LThH/ik4Q/4pND/+JTA7/iUwN
-/4hLDP+ISgv/h0kK/4dJCv+HSQn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUF/5toM//z7uj///////7+/f/s
-4a3/4Mx3/+HNef/hzXn/4c15/+HNeP/x6ML////////////y6sj/yaYV/8WeAP/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8A/8ilEf/x58H////////////m1ZH/xZ4B/8WfAP/FnwD/xZ8A/8SdAP/cxWf//v78
-///////w6eH/l2Is/4RGBf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICOSFRwgshUcIAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJFi
-IQCYXSoAlV8ncJZfJv2VXib/lV0l/5RdJP+UXCP/lFwi/5NbIf+TWiD/klkf/5JZHv+RWB3/kVgc
-/5BXG/+QVhr/j1YZ/49VGP+OVBf/jlMX/45TFv+NUhX/jVEU/4xRFP+MUBP/jE8T/4tPEv+LThH/
-ik0Q/4pND/+JTA7/iUsN/4hLDP+ISgv/h0kK/4dJCf+HSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwb/kFcc/+bazP////////////Ho
-wf/hzXj/4c15/+HNef/hzXn/4Mx3/+3hrv///v3///////n15f/Oriv/xJ4A/8WfAf/FnwH/xZ8B
-/8WfAf/FngD/y6kb//bw2P///////////+DLdv/EnQD/xZ8A/8WfAP/FnwD/xJ4A/+LPgf//////
-/////+fazf+QVxz/hUcG/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI24ZHBx6GRwcAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAomAM
-AJdhLACXYSpdl2Eq+JdhKf+WYCj/lmAo/5ZfJv+VXiX/lV4l/5RdJP+UXCP/lFsi/5NbIf+TWiD/
-klkf/5JZHv+RWB3/kVcc/5BWG/+QVhr/j1UZ/49VGP+OVBf/jlMW/45TFv+NUhX/jVEU/4xRFP+M
-UBP/i08S/4tPEf+KThH/ik0Q/4pMD/+JTA7/iUsN/4hKDP+ISgv/h0kK/4dJCf+HSAn/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZHB/+ISw7/18Ku////////////9e7T
-/+LOfP/hzXn/4c15/+HNef/gzHf/6dqb//38+P///////Pry/9W5Sf/EnQD/xZ8B/8WfAf/FnwH/
-xZ8B/8SeAP/QsTL/+vbo///////9/Pf/2cBZ/8SdAP/FnwD/xZ8A/8WfAP/FnwX/6Nmc////////
-////3Mu5/4pOEv+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjLhkcHFIZHBwAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-mWQuAJlkLkmZZC7ymWQt/5hjLP+YYiv/l2Eq/5dhKf+WYCj/lmAn/5ZfJv+VXiX/lV0k/5RdI/+U
-XCL/lFsh/5NbIP+TWiD/klkf/5JZHv+RWB3/kVcc/5BWG/+QVhr/j1UZ/49VGP+OVBf/jlMW/45S
-Fv+NUhX/jVEU/4xRE/+MUBP/jE8S/4tOEf+LThH/ik0Q/4lND/+JTA3/iUsN/4hKDP+ISgv/h0kK
-/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv/Gqov////////////59eT/
-49GE/+HNeP/hzXn/4c15/+HMd//m1I3//Pnw///////+/vv/3MVp/8SdAP/FnwH/xZ8B/8WfAf/F
-nwH/xJ0A/9W5S//8+/P///////z58P/TtkP/xJ0A/8WfAP/FnwD/xZ8A/8eiDP/t4rL/////////
-///RuqH/h0kK/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICLWFRggNhkcIAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACb
-ZjEAm2YxMptmMeeaZjD/mmUw/5plL/+ZZC7/mWMt/5hjLP+YYiv/l2Eq/5dhKf+WYCj/ll8n/5Vf
-Jv+VXiX/lV0k/5RdI/+UXCL/k1sh/5NaIP+SWh//klke/5FYHf+RWBz/kVcc/5BWG/+QVhr/j1UZ
-/45UGP+OVBf/jlMW/41SFf+NUhX/jVEU/4xQE/+MUBP/i08S/4tOEf+KThD/ik0P/4lMDv+JSw3/
-iEsM/4hKDP+HSgv/h0kK/4dICf+GSAj/hkgI/4ZICP+GSAj/hEUD/7WPaP/9/Pv///////z68v/m
-1Y//4cx3/+HNef/hzXn/4c14/+PQgv/59OL////////////l04v/xJ4C/8WfAf/FnwH/xZ8B/8Wf
-Af/EnQD/28Ni//79+v//////+fTi/8+uK//EngD/xZ8A/8WfAP/FngD/yqcW//Psy///////////
-/8Smh/+FRgX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgInYVHCAWFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJxp
-MwCcaTMbnGk01JxpNP+caDP/m2cy/5tmMf+aZjD/mmUv/5lkLv+ZZC3/mGMs/5hiK/+XYir/l2Ep
-/5ZgKf+WYCj/ll8n/5VeJv+VXiX/lF0k/5RcI/+UXCL/k1sh/5NaIP+SWh//klke/5FYHf+RVxz/
-kFcb/5BWGv+PVRn/j1UY/45UF/+OUxf/jlMW/41SFf+NURX/jFEU/4xQE/+MTxL/i08S/4tOEf+K
-TRD/ik0P/4lMDv+JSw3/iEsM/4hKC/+HSQr/h0kJ/4ZICf+ERQT/pXdI//j18f///////f34/+nb
-nf/gzHf/4c15/+HNef/hzXn/4c58//Xu0////////////+zfq//GoQr/xZ8A/8WfAf/FnwH/xZ8B
-/8SeAP/i0IH////////////07dD/yqcY/8WeAP/FnwD/xZ8A/8SeAP/OrCb/+fTj///////9/fz/
-t5Fr/4RFA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwh+ik0GAIVHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnWs3
-AJ1rNw2daze2nWs2/51qNv+cajX/nGk0/5xoM/+baDP/m2cy/5tmMf+aZjD/mmUv/5lkLv+ZZC3/
-mGMs/5hiK/+XYir/l2Ep/5ZgKP+WXyf/lV8m/5VeJf+VXiX/lF0k/5RcIv+UWyL/k1sh/5NaIP+S
-Wh//klke/5FYHf+RVxz/kFcb/5BWGv+PVRn/j1UY/45UF/+OUxb/jVMV/41SFf+NURT/jFAU/4xQ
-E/+MTxL/i08R/4pOEf+KTRD/ikwP/4lMDv+JSw3/iEsM/4ZHCP+ZZC//8urj/////////v3/7eGv
-/+DMdv/hzXn/4c15/+HNef/hzXj/8ejB////////////8+rI/8mmFP/FngD/xZ8B/8WfAf/FnwD/
-xZ8F/+nZnP///////////+7jt//Hog3/xZ8A/8WfAP/FnwD/xJ0A/9O2P//7+e////////n28/+o
-e07/hEQE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI+IZICFyESQgAoDMNAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACfbjoA
-n2w5Ap9uOpGfbjr/n205/55sOP+ebDf/nWs2/51qNv+dajX/nGk0/5xoM/+bZzL/m2cy/5tmMf+a
-ZTD/mmUv/5lkLv+ZYy3/mGMs/5hiK/+XYir/l2Ep/5ZgKP+WYCf/ll8m/5VeJf+VXST/lF0j/5Rc
-Iv+TWyH/k1sh/5NaIP+SWR//kVgd/5FYHf+RVxz/kFcb/5BWGv+PVRn/j1UY/45UF/+OUxb/jlMW
-/41SFf+NURT/jFEU/4xQE/+MTxL/i04R/4pOEP+KTRD/iUsN/5JYH//l2Mr////////////x6MH/
-4c14/+HNef/hzXn/4c15/+HMd//t4a////79///////59OP/zq0n/8SeAP/FnwH/xZ8B/8WfAP/H
-ow7/7+S4////////////6Nmb/8WfBP/FnwD/xZ8A/8WfAP/EnQD/2b9a//38+P//////9e/q/51q
-OP+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAjshUcIOIVHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKhqPwCf
-cj0AoXA+ZKFwPvqhbz3/oG88/6BuO/+fbTr/n205/55sOP+eazf/nWs2/51qNf+dajX/nGk0/5xo
-M/+bZzL/m2cx/5pmMP+aZS//mmUv/5lkLv+YYyz/mGMs/5hiK/+XYSr/l2Ap/5ZgKP+WXyf/lV8m
-/5VeJf+VXST/lF0j/5RcIv+TWyH/k1sg/5JaH/+SWR7/kVgd/5FYHP+RVxz/kFYa/49WGv+PVRn/
-j1QY/45UF/+OUxb/jVIV/41SFf+NURT/jFAT/4xQE/+LThH/jVEV/9nFsf////////////Xu0f/h
-znv/4c15/+HNef/hzXn/4Mx2/+nbnf/9/fj///////z68P/Ut0T/xJ0A/8WfAf/FnwH/xZ4A/8qn
-Gv/17tP////////////izn7/xJ4A/8WfAP/FnwD/xZ8A/8SdAP/fy3X////+///////s4tj/k1wk
-/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICNCGRgcZhkcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKNz
-QQCjc0E5o3NB6qJyQP+icT//oXE+/6FwPf+gbz3/oG87/59uOv+fbTn/n204/55sOP+dazf/nWo2
-/51qNf+caTT/nGgz/5toM/+bZzL/m2cx/5pmMP+aZS//mWUu/5lkLf+YYyz/mGIr/5diKv+XYSn/
-lmAo/5ZgJ/+WXyf/lV4m/5VdJf+UXST/lFwj/5RbIv+TWyH/k1og/5JaH/+SWR7/kVgd/5FYHP+Q
-Vxv/kFYa/49WGf+PVRj/jlQX/45UF/+OUxb/jVIV/41RFP+MUBP/y7CV////////////+PPg/+PQ
-gv/hzXj/4c15/+HNef/hzHf/5tWQ//z68f///////v35/9rCYP/EnQD/xZ8B/8WfAf/EngD/0LAx
-//n25v///////v34/9rBXf/EnQD/xZ8A/8WfAP/FnwD/xZ4D/+fWk////////////+HRwv+MUBX/
-hUcH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hUgIpYRIBwiFSAcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAo3RE
-AKN0RBWkdUTJpHRE/6R0Q/+jc0L/o3NB/6JyQP+icT//oXA+/6FwPf+gbzz/oG87/59uOv+fbTn/
-nmw4/55sN/+dazf/nWo2/51qNf+caTT/nGgz/5xoM/+bZzL/m2Yx/5plMP+aZS//mWQu/5lkLf+Y
-Yyz/mGIr/5diKv+XYSn/lmAo/5ZgJ/+WXyf/lV4m/5VdJP+VXSP/lFwj/5RbIv+TWyH/k1og/5JZ
-H/+SWR7/kVgd/5FXHP+QVxv/kFYa/49VGf+PVRj/jlQX/4tQEv+9m3f//v79///////7+e//5dOL
-/+HMeP/hzXn/4c15/+HNeP/j0YT/+fbm////////////4s+A/8SeAP/FnwH/xZ8B/8SdAP/VuUz/
-/Pvz///////8+fD/07ZD/8SdAP/FnwD/xZ8A/8WfAP/GoQr/7OCu////////////1L6n/4hKDP+G
-SAf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP2FRwhzgUwJAIlFBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACld0gA
-pHdIBKV3SJeld0f/pXdH/6V2Rv+kdUT/pHVE/6R0Q/+jc0L/o3NB/6JyQP+icT//oXA+/6FwPf+g
-bzz/oG47/59uOv+fbTn/nmw4/55sN/+dazb/nWo2/51qNf+caTT/nGgz/5xoM/+bZzL/m2Yx/5pm
-MP+aZS//mWQu/5lkLf+YYyz/mGIr/5dhKv+XYSn/lmAo/5ZfJ/+WXyb/lV4l/5VdJP+UXSP/lFwi
-/5RbIv+TWyD/k1of/5JZH/+SWR7/kVgd/5FXHP+QVxv/jVMW/7CHXf/69/X///////389v/o2Jf/
-4cx3/+HNef/hzXn/4c15/+LPff/28Nj////////////p26D/xaAG/8WfAP/FnwH/xJ0A/93Gav/+
-/vv///////jz4P/OrSb/xJ4A/8WfAP/FnwD/xZ4A/8qmFP/z7Mv////////////GqYv/hUYF/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI7YVICD6FSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKV9TgCn
-eUsAp3pLW6d6S/eneUr/pnhJ/6Z4SP+ld0f/pXZG/6R2Rf+kdUT/pHRD/6N0Qv+jc0H/o3JB/6Jy
-QP+icT//oXA+/6FwPf+gbzz/oG47/59tOv+fbTn/nmw4/55rN/+dazb/nWo1/5xpNf+caTT/nGgz
-/5tnMv+bZzH/m2Yw/5plL/+ZZS//mWQu/5hjLf+YYyz/mGIr/5dhKv+XYSn/lmAo/5ZfJ/+VXyb/
-lV4l/5VdJP+UXSP/lFwi/5NbIf+TWiD/klof/5JZHv+QVhr/pXdH//Xx6////////v78/+vep//g
-zHb/4c15/+HNef/hzXn/4c15//Lqx/////////////Hnv//IpBD/xZ8A/8WfAf/FngH/5dSO////
-////////8urI/8mlE//FngD/xZ8A/8WfAP/EngD/z64q//n15P///////fz7/7aRa/+ERQT/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAjFhEgHFYVHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKl8
-TgCpe04kqXxO26h8Tv+oe03/p3pM/6d6S/+neUr/pnhJ/6Z4SP+ld0f/pXZG/6R1Rf+kdUT/pHRD
-/6NzQv+jc0H/onJA/6JxP/+hcT7/oXA9/6BvPP+gbjv/n247/59tOv+ebTn/nmw4/51rN/+dajb/
-nWo1/5xpNP+caTT/nGgz/5tnMv+bZjH/mmYw/5plL/+ZZC7/mWQt/5hjLP+YYiv/l2Iq/5dhKv+W
-YCn/lmAn/5ZfJ/+VXib/lV4l/5RdJP+UXCP/lFwi/5JZH/+eazf/7ePZ////////////7+W5/+HM
-d//hzXn/4c15/+HNef/gzHf/7uO0/////v//////9/Ld/8yrIv/EngD/xZ8A/8ehC//s4K7/////
-///////r3af/xqAI/8WfAP/FnwD/xZ8A/8SdAP/UuEf//Prx///////59vL/pnlL/4REBP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZHCIuGQgYChkYHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAqn5R
-AKp9UAeqflGgqn5R/6p9UP+pfU//qXxO/6h7Tf+oekz/p3pL/6d5Sv+meUn/pnhJ/6V3SP+ld0f/
-pXZG/6R1Rf+kdET/o3RD/6N0Qv+jc0H/onJA/6JxP/+hcD7/oXA9/6BvPP+gbjv/n246/59tOf+e
-bDj/nmw4/51rNv+dajX/nGo1/5xpNP+caTP/m2gz/5tnMv+bZjH/mmUw/5plL/+ZZC7/mWQt/5hj
-LP+YYiv/l2Iq/5dhKf+WYCj/ll8n/5VfJv+VXiX/lF0k/5hiK//h0cH////////////z7Mv/4c15
-/+HNef/hzXn/4c15/+DMdv/q3KH//v35///////7+e7/07VB/8SdAP/FngD/yaYX//Pszf//////
-/////+TRh//FngD/xZ8A/8WfAP/FnwD/xJ0A/9zEZf/+/fr///////Ls5v+aZzP/hEUF/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAjwhkcIR4ZIBwCIMyYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC1gEwA
-qoFVAKyBU1esgVT2q4BT/6t/Uv+qf1L/qn5R/6p9UP+pfU//qXxO/6h7Tf+oe0z/p3pL/6d5Sv+m
-eUn/pnhI/6V3R/+ldkf/pXZF/6R1Rf+kdET/o3RD/6NzQv+jckH/onJA/6JxP/+hcD7/oXA9/6Bv
-PP+gbjv/n246/59tOf+ebDj/nmw3/51rNv+dajX/nWo1/5xpNP+caDP/m2cy/5tnMv+aZjH/mmUw
-/5plL/+ZZC7/mWQt/5hjLP+YYiv/l2Iq/5dhKf+WYCj/ll8n/9S+p/////////////fy3P/jz4D/
-4c14/+HNef/hzXn/4cx3/+bWkf/8+vL///////79+f/awmD/xJ0A/8SeAP/Pry//+fXk///////+
-/fr/28Rk/8SdAP/FnwD/xZ8A/8WfAP/EngD/5NKI////////////6NzQ/5FYH/+HSQn/h0kK/4dJ
-Cf+GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICMOGRwcVhUcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACs
-g1cArINXG62DV8ytg1b/rIJV/6yBVf+sgVT/q4BT/6t/Uv+qflH/qn5R/6p9UP+pfE//qXxO/6h7
-Tf+oekz/p3pL/6d5Sv+meEn/pnhI/6V3R/+ldkb/pXZF/6R1RP+kdEP/o3RC/6NzQf+ickD/onJA
-/6JxPv+hcD7/oW89/6BvPP+gbjv/n206/59tOf+ebDj/nms3/51rNv+dajX/nWk1/5xpNP+caDP/
-m2cy/5tnMf+aZjD/mmUv/5llLv+ZZC7/mWMt/5hiK/+WXyf/xqiK////////////+/jt/+XTiv/h
-zHj/4c15/+HNef/hzXj/49GE//n15f///////////+PRhv/FngH/xJ0A/9a7Tv/8+/P///////z5
-8P/Ut0P/xJ0A/8WfAP/FnwD/xZ8A/8ahCP/r3qj////////////ax7P/jVEV/4lMDf+JTA3/iEsM
-/4hKC/+HSQr/h0kK/4dICf+GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj9
-hkgId4xbGwCFRgYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKyF
-WQCjh1UBroVaga+FWv6uhFn/roRY/62DV/+tglb/rIFV/6yBVP+sgFT/q39T/6t/Uv+qflH/qn5Q
-/6l9T/+pfE7/qHtN/6h7TP+nekv/p3lL/6Z5Sv+meEn/pndI/6V3R/+ldkb/pHVF/6R1RP+jdEP/
-o3NC/6NzQf+ickD/onE//6FxPv+hcD3/oG88/6BvPP+fbjr/n205/55sOP+ebDf/nms3/51qNv+d
-ajX/nGk0/5xoM/+baDP/m2cy/5tmMf+aZjD/mmUv/5dhKv+3kmz/+/j2///////9/Pf/6NmZ/+DM
-d//hzXn/4c15/+HNef/iznz/9e7T////////////7N+r/8ahCv/EnQD/38p0/////v//////9/Pe
-/82rI//EngD/xZ8A/8WfAP/FngD/yaYV//Pry////////////8uwlf+LThH/i08R/4tOEf+KTRD/
-ikwP/4lMDv+JSw3/iEoM/4hKC/+HSQr/h0kJ/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICN+G
-SAkvhkgIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-ALCHXQCwh10ysIdd4bCHXP+vhlv/r4Zb/66FWv+uhFn/roNY/62DV/+tglb/rIFV/6yBVP+sgFP/
-q39S/6t+Uv+qflH/qn1Q/6l9T/+pfE7/qHtN/6h7TP+nekv/p3lL/6Z5Sv+meEn/pXdH/6V3R/+l
-dkb/pHVF/6R0RP+kdEP/o3NC/6NyQf+ickD/onE//6FxPv+hcD3/oG88/6BuO/+fbjr/n205/55s
-OP+ebDf/nWs2/51qNv+dajX/nGk0/5xoM/+baDP/mWQu/62CVv/18Ov///////7+/P/s4Kv/4Mx2
-/+HNef/hzXn/4c15/+HMd//x57/////////////07dD/yqcZ/8WfA//p2Zz////////////w5r3/
-yKQP/8WfAP/FnwD/xZ8A/8SeAP/Pry3/+fXk///////9/Pv/u5hz/4tPEf+NURT/jFEU/4xQE/+L
-TxL/i08R/4pOEf+KTRD/iUwP/4lMDv+JSw3/iEoM/4hKC/+HSQr/h0kJ/4dICf+GSAj/hkgImIVH
-CAaGRwgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-sYpgALCJXwWyimCWsopg/7GJX/+xiF7/sIhd/7CHXP+vhlv/r4Va/6+FWf+uhFn/roRY/62DV/+t
-glb/rIFV/6yBVP+rgFP/q39S/6t/Uv+qflH/qn1Q/6l9T/+pfE7/qHtN/6h7TP+nekv/p3lK/6Z5
-Sf+meEj/pXdH/6V2R/+ldkb/pHVF/6R1RP+kdEP/o3NC/6NyQf+ickD/onE//6FwPv+hcD3/oG88
-/6BuO/+fbjr/n205/55sOP+ebDf/nWs2/51qNv+caDP/pHVE/+vh1/////////////HowP/hzHf/
-4c15/+HNef/hzXn/4Mx2/+vfqP/+/vz///////r36f/QsTX/x6IO//HnwP///////////+jYmP/F
-nwT/xZ8A/8WfAP/FnwD/xJ0A/9a7Tv/9+/T///////n28v+sgVT/jFET/45UF/+OUxb/jVIV/41S
-Ff+NURT/jFAT/4xQE/+LTxL/i04R/4tOEf+KTQ//ikwP/4lMDv+ISw3/iEoL/4dJCuqHSAlAh0gJ
-AJVLDgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAsoxjALKMYz2zjGPos4tj/7OLYv+yimH/solg/7GJX/+xiF7/sIdd/7CHXP+vhlv/r4Va/66F
-Wf+uhFj/rYNX/62CVv+sglX/rIFV/6yAVP+rgFP/q39S/6p+Uf+qflH/qn1Q/6l8T/+pfE7/qHtN
-/6h6TP+nekv/p3lK/6Z4Sf+meEj/pXdH/6V2Rv+kdkX/pHVE/6R0Q/+jc0L/o3NB/6JyQf+icUD/
-onE//6FwPv+hbz3/oG88/6BuO/+fbTr/n205/55rN/+fbjv/3s28////////////9u/V/+LOff/h
-zXn/4c15/+HNef/hzHf/59eV//379f///////fz4/9m/Wv/Nqyb/+PTg///////+/v3/3shv/8Sd
-AP/FnwD/xZ8A/8WfAP/EnQD/4Mt1/////v//////8uvj/6FvPf+PVRn/kFYa/49WGv+PVRn/jlQY
-/45UF/+OUxb/jVIV/41SFf+NURT/jFAT/4xQE/+LTxL/i04R/4pNEP+KTQ//iUwOpYdLCwqISwwA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACzjmYAso5nB7SOZpe0jmb/tI1l/7OMZP+zjGP/s4ti/7KKYf+yimD/sYlf/7GIX/+xiF7/sIdd
-/7CGXP+vhlv/roVa/66EWf+uhFj/rYNX/62CVv+sglX/rIFU/6uAVP+rf1P/q39S/6p+Uf+qfVD/
-qX1P/6l8Tv+oe03/qHtN/6d6TP+neUv/pnlK/6Z4Sf+md0j/pXdH/6V2Rv+kdUX/pHVE/6R0Q/+j
-c0L/o3NB/6JyQP+icT//oXA+/6FwPf+gbzz/oG47/55sOP/RuaD////////////69un/5NKG/+HN
-eP/hzXn/4c15/+HNeP/k0YX/+fbm////////////49CF/9a6Tf/8+/P///////z68v/VuUj/xJ0A
-/8WfAP/FnwD/xZ8A/8WfBf/p2p3////////////k1sf/mGMr/5JZHv+SWR7/kVgd/5FXHP+QVxv/
-kFYa/49VGf+PVRj/jlQX/45TFv+NUxb/jVIV/41RFP+MURT/jFAT/4tPEuqKThFDi04RAIVXGQAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAC2kWkAtpFpNbaQauC2kGn/tY9o/7WOZ/+0jmb/tI1l/7OMZP+zjGP/s4ti/7KKYf+yiWD/
-sYlf/7GIXv+wh13/sIdd/6+GXP+vhlv/roVa/66EWP+tg1j/rYNX/6yCVv+sgVX/rIFU/6uAU/+r
-f1P/qn9S/6p+Uf+qfVD/qX1P/6l8Tv+oe03/qHtN/6d6S/+neUr/pnhJ/6Z4SP+ld0j/pXdH/6V2
-Rv+kdUX/pHRE/6N0Q/+jc0L/o3NB/6JyQP+icT//n246/8GhgP/8+/n///////379v/n2Jf/4Mx3
-/+HNef/hzXn/4c15/+HOe//17tD////////////t4rL/4s+C/////v//////9/Hc/82rIv/EngD/
-xZ8A/8WfAP/FnwD/yaQS//Lpxf///////////9S+p/+UXST/lFwi/5NbIv+TWyH/klof/5JZH/+R
-WR7/kVgd/5FXHP+QVhv/kFYa/49VGf+PVRj/jlQX/45TFv+NUhX/jVEVmYtQFAeMUBQAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAALaSbAC0kmoDt5Jsg7eSbP23kmz/tpFr/7aQav+1j2n/tY9o/7WOZ/+0jWb/tI1l/7OMZP+z
-i2P/s4ti/7KKYf+yimD/sYlf/7GIXv+wiF3/sIdc/6+GW/+vhVv/roVZ/66EWP+tg1f/rYNX/62C
-Vv+sgVX/rIFU/6uAU/+rf1L/qn9S/6p+Uf+qfVD/qX1P/6l8Tv+oe03/qHtM/6d6S/+neUr/pnlJ
-/6Z4SP+ld0f/pXZH/6V2Rv+kdUX/pHRD/6N0Q/+icT//tI1k//by7v///////v78/+zgrP/gzHb/
-4c15/+HNef/hzXn/4cx3/+/kuP////////////jz4P/z68v////////////u47T/x6IN/8WfAP/F
-nwD/xZ8A/8SeAP/Priz/+fTj///////+/v3/xKWF/5RdI/+WXyb/lV4l/5RdJP+UXSP/lFwi/5Nb
-Iv+TWyH/klog/5JZHv+SWR7/kVgd/5FXHP+QVhv/kFYa/49VGd2OUxczjlQXAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAALiTbwC4k24huZRwyrmUb/+4lG7/uJNt/7eSbP+3kWv/tpFq/7aQaf+1kGn/tY9n/7SO
-Zv+0jWb/tI1l/7OMY/+zi2L/soti/7KKYf+yiWD/sYhf/7GIXv+wh13/sIdc/6+GW/+vhVr/roVZ
-/66EWP+tg1f/rYNW/6yCVf+sgVT/rIFU/6uAU/+rf1L/qn5R/6p+Uf+qfVD/qXxP/6l8Tv+oe03/
-qHpM/6d5S/+neUr/pnhJ/6Z4SP+ld0f/pXZG/6R1RP+rf1L/7OLY////////////8unF/+HNeP/h
-zXn/4c15/+HNef/gzHb/6tuf//79+f///////v79//7+/P///////////+TSif/EngH/xZ8A/8Wf
-AP/FnwD/xJ0A/9e9U//9+/X///////r39P+zjGT/ll8n/5dhKv+XYCn/lmAo/5ZfJ/+VXib/lV4l
-/5RdJP+UXCP/lFwi/5NbIf+TWyD/klof/5JZHv+RWB37kVcbepFTEwKRVhkAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAuZhyAL2PcwC6lnJbupZy8rqWcf+5lXD/uZRw/7mUb/+4k27/uJJt/7eSbP+3kWv/tpBq
-/7aQaf+1j2j/tY5n/7SOZv+0jWX/tI1k/7OMY/+zi2L/soph/7KKYP+xiV//sYhe/7GIXv+wh13/
-r4Zc/6+FW/+vhVr/roRZ/66DWP+tg1f/rYJW/6yBVf+sgVT/q4BT/6uAU/+rf1L/qn5R/6p+UP+p
-fU//qXxO/6h7Tf+oe0z/p3pL/6d5Sv+meUr/pnhI/6Z4Sf/dzLr////////////38tz/48+A/+HN
-eP/hzXn/4c15/+HNeP/l04r/+/js///////////////////////9/Pf/2L9Y/8SdAP/FnwD/xZ8A
-/8WfAP/EngD/49CD////////////8enh/6Z4Sf+YYyz/mWQt/5hjLP+YYiv/l2Iq/5dhKf+WYCj/
-lmAn/5ZfJv+VXiX/lV0l/5RdJP+UXCP/lFsi/5NbIL+SWh4aklofAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAuph0ALqXcwq7mHSau5h0/7uYc/+6l3P/updy/7qWcf+5lXD/uZRv/7iUbv+4k27/
-uJJt/7eSbP+2kWv/tpBq/7aQaf+1j2j/tY5n/7SNZv+0jWX/tIxk/7OLY/+zi2L/soph/7KJYP+x
-iV//sYhe/7CIXf+wh1z/r4Zb/6+FWv+uhVr/roRZ/66DWP+tg1f/rIJW/6yBVf+sgVT/q4BT/6t/
-U/+rflL/qn5R/6p9UP+pfU//qXxO/6h7Tf+oe0z/pndI/820mf/+/v7///////z58P/m1Y//4cx3
-/+HNef/hzXn/4c15/+LOfP/179P///////////////////////jz4P/OrSn/xJ4A/8WfAP/FnwD/
-xZ8A/8eiDP/t4rL////////////h0cH/n2w5/5tmMf+aZjH/mmUw/5plL/+ZZC7/mWMt/5hjLP+Y
-Yiv/l2Eq/5dhKf+WYCj/lmAn/5ZfJv+VXiXolV0kSZpeIgCPXCcAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAvJp3ALyadie9m3fMvZt3/7yadv+8mXX/u5h0/7uYc/+6l3P/updy/7qWcf+5
-lXD/uZRv/7iUbv+4k23/uJJt/7eSbP+3kWv/tpBq/7aQaf+1j2j/tI5n/7SOZv+0jWX/s4xk/7OM
-Y/+zi2L/soph/7KJYP+xiV//sYhe/7CIXf+wh1z/r4Zb/6+FWv+uhVn/roRY/66DV/+tg1b/rYJV
-/6yBVf+sgVT/q4BT/6t/U/+rf1L/qn5R/6p9UP+oekz/vpx5//n39P///////v37/+vep//gzHb/
-4c15/+HNef/hzXn/4Mx3/+7ktv////7/////////////////7uO1/8ejDf/FnwD/xZ8A/8WfAP/E
-ngD/zasl//fx2////////////9C3nv+caDP/nGk1/5xpNP+caDP/m2gy/5tnMv+bZjH/mmYw/5pl
-L/+ZZC7/mWMt/5hjLP+YYiv/l2Eq+5ZgKIGWXSYEll8nAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAC/nHgAup2AAL6celC+nXrpvpx5/72beP+9m3f/vJp3/7yadv+8mXX/u5h0/7uY
-c/+6l3L/upZx/7qVcf+5lXD/uZRv/7iTbv+4k23/t5Js/7eRa/+2kWr/tpBp/7WPaP+1j2f/tI5m
-/7SNZf+0jWX/s4xk/7OLY/+yi2L/soph/7KJYP+xiV//sYhe/7CHXf+wh1z/r4Zb/6+FWv+uhVn/
-roRY/62DV/+tglb/rIJV/6yBVf+rgFT/q4BT/6p+Uf+yi2L/8Ojg////////////8unF/+HNeP/h
-zXn/4c15/+HNef/gzHf/6NiX//389v/////////////////hzXz/xJ4A/8WfAP/FnwD/xZ8A/8Sd
-AP/XvFD//fv0///////7+ff/vJp1/51qNf+ebDj/nms3/51rNv+dajX/nGk0/5xpNP+caDP/m2cy
-/5tnMf+aZjD/mmUv/5llLv+YZC2ymGIsFphiLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAC/nXwAvZp7BMCffXvAn334v558/7+de/++nXr/vpx5/72beP+9m3f/vJp2
-/7yZdf+7mXT/u5h0/7qXc/+6l3L/upZx/7mVcf+5lXD/uZRv/7iTbv+4km3/t5Js/7eRa/+2kWr/
-tpBp/7WPaP+1jmf/tI5m/7SNZf+zjGT/s4xj/7OLYv+yimH/sopg/7GJX/+xiF7/sIhe/7CHXf+v
-hlz/r4Zb/6+FWv+uhFn/rYNY/62DV/+tglb/rIFV/6yCVv/fz77////////////49OH/49CC/+HN
-eP/hzXn/4c15/+HNeP/j0IL/+PPg////////////+/nu/9O2Qf/EnQD/xZ8A/8WfAP/FnwD/xJ4B
-/+TTiv////////////Ps5f+tg1f/n206/6BuO/+fbjr/n205/55sOf+ebDf/nWs2/51qNv+dajX/
-nGk0/5xoM/+baDL/m2cx0pplMDGbZi8AlmM0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADAoH8AwKB/EMGggJzBoYD+waB//8Cffv+/n33/v558/76de/++nXr/
-vpx5/72beP+9m3f/vJp2/7yZdf+7mHT/u5hz/7qXcv+6lnL/upZx/7mVcf+5lXD/uZRv/7iTbf+3
-kmz/t5Js/7aRa/+2kGr/tpBp/7WPaP+1jmf/tI5m/7SNZf+zjWT/s4xj/7KLYv+yimH/sopg/7GJ
-X/+xiF7/sIdd/7CHXP+vhlz/r4Zb/66FWv+uhFn/rIFU/820mf/+/fz///////379f/o2Zf/4cx3
-/+HNef/hzXn/4c15/+HNeP/w5r3////////////x6MP/yaUV/8WeAP/FnwD/xZ8A/8WeAP/IpBP/
-8efB////////////4dHA/6V2Rf+icUD/onE//6FwPv+hcD3/oG88/6BvO/+fbjr/n205/55sOP+e
-bDf/nWs3/51qNuacaTRPm2lDAJxpMgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAADCooIAwqKDH8KigrjCo4L/waKB/8GhgP/BoX//wKB//8Cffv/A
-nn3/v557/7+de/++nHr/vpx5/72beP+9mnf/vJp2/7yZdf+7mHT/u5hz/7uXc/+6lnL/upZx/7mV
-cP+5lG//uJRu/7iTbf+4kmz/t5Jr/7aRa/+2kGr/tY9p/7WPaP+1jmf/tI5m/7SNZf+zjGT/s4tj
-/7KLYv+yimH/solg/7GJX/+xiF7/sIdd/7CHXP+uhFn/vZt3//fz7v///////////+/luf/hzHf/
-4c15/+HNef/hzXn/4cx3/+jYlv/9+/T//////+HNe//EngD/xZ8A/8WfAP/FnwD/xJ0A/9K1Pf/7
-+Ov///////7+/v/Mspf/onJB/6R0RP+jdEP/o3NC/6NyQf+ickD/onE//6FwPv+hcD3/oG88/6Bu
-O/+fbTrynms4bJlpOQOcazkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAMWmhwDBo4QAw6SFLMOlhcfDpIX/w6SE/8Kjg//CooL/waKB/8Gh
-gP/BoH//wKB+/8Cfff+/nnz/v557/76dev++nHn/vZx5/72beP+9mnb/vJl1/7uZdf+7mHT/u5dz
-/7qXcv+6lnH/uZVx/7mVcP+5lG//uJNu/7iTbf+3kmz/t5Fr/7aRav+2kGn/tY9o/7WPaP+0jmb/
-tI1l/7SNZf+zjGT/s4ti/7KKYf+yimH/solg/7GIXv+zjGP/6NvP////////////9/Lc/+PQgf/h
-zXj/4c15/+HNef/hzXj/4s99//bv1f/59eP/z7Ay/8SeAP/FnwD/xZ8A/8WfAP/EngD/4c59////
-////////+PTw/7iUbv+kdUX/pXdH/6V2Rv+kdUX/pHVE/6R0Q/+jdEL/o3NB/6JyQP+icj//oXE+
-9qBvPYCfbTsJn247AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAMOnhwDGpocAxKeHNcSniM7Epof/xKaG/8Olhf/DpIT/w6OD
-/8Kjgv/CooL/waGB/8GhgP/BoH//wJ9+/8Cfff+/nnz/v517/76cev++nHn/vZt4/72ad/+8mnb/
-vJl1/7uZdP+7mHP/u5dz/7qXcv+6lnH/uZVw/7mUb/+5lG//uJNu/7eSbf+3kmz/t5Fr/7aQav+2
-kGn/tY9o/7WOZ/+0jWb/tI1l/7OMZP+zjGP/s4ti/7GJX//TvaX//v79///////9+/X/59eT/+DM
-d//hzXn/4c15/+HNef/hzHf/6t2k/+TTi//GoAb/xZ8A/8WfAP/FnwD/xZ4A/8mlFP/x6ML/////
-///////n287/rIFV/6d5S/+neUv/pnlJ/6Z4Sf+ld0j/pXdH/6V2Rv+kdUX/pHRE/6N0Q/ejc0GJ
-om4/DaJwQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMOpiwDRqIgAxqmKPcepi9DGqIr/xqeJ/8WniP/Epof/
-xKWG/8Olhf/DpIT/w6OD/8Kjgv/CooL/waGB/8GhgP/AoH7/wJ99/7+fff+/nnz/v517/76cev++
-nHn/vZt4/72ad/+8mnb/vJl1/7uYdP+7l3P/u5dy/7qXcv+6lnH/uZVw/7mUb/+4lG7/uJNu/7eS
-bf+3kmz/tpFr/7aQav+1kGn/tY9o/7WOZ/+0jWb/s4tj/8Cgfv/28e3////////////s36r/3sdr
-/+HOe//hzXn/4c15/+HOe//dxmj/y6gb/8WeAP/FnwD/xZ8A/8WfAP/EnQD/1rpM//z68v//////
-/v7+/9C3nv+pfE7/qXxP/6l8Tv+oe03/qHtM/6d6S/+neUr/pnlJ/6Z4Sf+ld0j3pXZGiqN1RQ6k
-dUUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMuniwCqwqUAyKmNN8iqjcnIqo3/x6qM/8epi//G
-qIr/xqeJ/8WniP/Epof/xKWG/8Olhf/DpIT/wqOD/8Kjgv/CooH/waGA/8Ghf//AoH7/wJ99/8Cf
-ff+/nnz/v517/76dev++nHn/vZt4/72bd/+8mnb/vJl1/7uYdP+7mHP/updy/7qWcv+6lnH/uZVw
-/7mUb/+4lG7/uJNt/7iSbP+3kmz/t5Fr/7aQav+1j2j/tpFq/+PUxf////////////fy2//YvVH/
-3sdq/+LOfP/hznz/3cZp/82rIv/FngD/xZ8A/8WfAP/FnwD/xZ8A/8ahCP/q3KL////////////1
-8Or/uZVw/6p+Uf+rf1P/q39S/6p+Uf+qfVD/qX1P/6l8Tv+oe03/qHpM9ad5S4ineEgOpnhJAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMiqjwDNs5AAyayPL8msj7zJrI/+yauO/8ir
-jf/Iqoz/x6mL/8epi//GqIn/xaeJ/8WniP/Epof/w6WG/8Okhf/DpIT/wqOD/8Kigv/CooH/waGA
-/8Ggf//AoH7/wJ99/7+efP+/nnv/vp16/76cef+9m3j/vZt3/7yadv+8mXb/u5l1/7uYdP+7mHP/
-updy/7qWcf+5lXD/uZVw/7mUb/+4k27/uJNt/7eSbP+1j2n/y7CV//v59/////////7+/+PRh//M
-qSH/1blG/9W4Q//LqBn/xZ8B/8WfAP/FnwD/xZ8A/8WfAP/EnQD/07ZC//r36v///////////9/O
-vP+uhFn/rYJW/6yCVf+sgVT/q4BU/6uAU/+rf1L/qn5R/6p9UPCpfE57qHtNDKh7TQAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMuukQDIro8Ayq6QI8qukabKrpH5yq2Q
-/8msj//JrI//yauO/8iqjf/Iqoz/x6mL/8aoiv/GqIn/xaeI/8Wmh//Epob/w6WF/8OkhP/Co4P/
-wqOD/8Kigv/BoYH/waGA/8Ggf//An37/wJ99/7+efP+/nXv/vp16/76cef+9m3j/vZt3/7yadv+8
-mXX/u5h0/7uYc/+6l3P/upZy/7qWcf+5lXD/uZRw/7iTbv+8mXX/6t/U////////////+fTj/9K0
-Pf/EnQD/xZ8B/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8ejD//s36v////////////49fH/wqOC
-/66DWP+vhVr/roRZ/66EWP+tg1f/rIJW/6yCVf+rgVTjq39SZqp9TwiqflAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMG9lgDNrZMAy6+TEsuwk4PLsJPw
-y6+T/8qukv/KrpH/yq2Q/8mskP/JrI//yauO/8iqjf/HqYz/x6mL/8aoiv/GqIn/xaeI/8Smh//E
-pYb/w6WF/8OkhP/Co4P/wqKC/8Kigf/BoYD/waF//8Ggfv/An37/v599/7+efP+/nXv/vpx6/76c
-ef+9m3j/vZp3/7yadv+8mXX/u5h0/7uYc/+6l3L/upZy/7mUb//OtJv/+/j2////////////8OW6
-/8uoHv/EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WeAP/FnwT/38lz//389v///////////+HSwv+zi2L/
-sYhe/7CHXf+wh1z/r4Zb/6+FWv+uhVr/roRYzK2CVkasgU0CrIJSAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADLsZUAy7GWCMyxlV3M
-sZbWzLGV/8ywlP/LsJP/y6+T/8uukv/KrpH/yq2Q/8msj//Jq4//yauO/8iqjf/HqYz/x6mL/8ao
-iv/Gp4n/xaeI/8Smh//EpYb/w6WF/8OkhP/Do4P/wqOC/8Kigf/BoYD/waF//8Cgfv/An33/v559
-/7+efP+/nXr/vpx6/76cef+9m3j/vZp3/7yadv+8mXX/u5h0/7yadv/j1Mb//////////////v3/
-7N6q/82sJ//EnQH/xJ0A/8SdAP/EnQD/xqIL/9zFaf/69+r////////////17+r/wqKB/7KKYf+z
-i2L/soph/7KKYP+xiV//sYhe9rCHXKWvhlortIV7AK+GWAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADMsZYAw6uSAM2y
-lzHOspiqzrOY982yl//NsZb/zLGV/8ywlP/Lr5P/y6+S/8qukf/KrZH/ya2Q/8msj//JrI7/yKuN
-/8iqjP/HqYz/xqmL/8aoif/Fp4j/xaeI/8Smh//EpYb/w6SF/8OkhP/Co4P/wqKC/8Gigf/BoYD/
-waB//8Cgfv/An33/v558/7+ee/++nXr/vpx5/72ceP+9m3j/vJl1/8Wnh//w6eH/////////////
-//7/9O3Q/+DLeP/VuUr/1LdE/9rBX//r3qj//Pry/////////////Pr5/9S9pv+0jmb/tI5m/7SN
-Zf+0jWT/s4xj/7OLYuCyiWFysIdeD7CFXwC7q1sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRtpgAzbSb
-AM61mxDPtJptzrSa2M60mv/Os5j/zbOX/82ylv/MsZb/zLGV/8uwlP/Lr5P/y66S/8qukf/KrZD/
-yayQ/8msj//Jq47/yKqN/8iqjP/HqYv/xqiK/8aoif/Fp4j/xKaH/8Smhv/DpYX/w6SE/8Ojg//C
-o4L/wqKC/8Ghgf/BoYD/waB//8Cffv/An33/v558/7+de/++nXr/vZt3/82zmP/07+n/////////
-/////////v78//z68//8+vD//v35//////////////////38+v/ezLr/uZVw/7aRav+2kGr/tpBp
-/7WPaPa0jmavs4xkO7KOYwOzjWMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-0LabANK4nQHPtpwtz7acmc+1m+zPtZv/z7Sa/860mf/Os5j/zbKX/82ylv/MsZX/zLCU/8uwk//L
-r5L/y66S/8qukf/KrZD/yqyQ/8msj//Jq47/yKqN/8eqjP/HqYv/xqiK/8Woif/Fp4j/xaaH/8Sl
-hv/DpYX/w6SE/8Ojg//Co4L/wqKB/8Khgf/BoYD/wKB//8Cfff+/nnz/vp16/82yl//u5dz//v38
-///////////////////////////////////////59fL/28i0/7yZdv+4lG7/uJRu/7iTbfy3kmzQ
-tpFqZraRaBG2jmsAtpRoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAANC2nADPtpwJ0LeeSdG3nrHQt53y0Lad/9C2nP/PtZv/z7Sa/860mf/Os5j/zbKX/82y
-lv/MsZX/zLCU/8uwk//Lr5L/y66S/8qukf/KrZD/yayP/8msj//Jq47/yKqN/8eqjP/HqYv/xqiK
-/8Wnif/Fp4j/xKaH/8Slhv/DpYX/w6SE/8Kjg//CooL/wqKB/8GhgP/BoH//v558/8WniP/cybb/
-7+bd//j18f/7+fb/+/n3//r39f/07uj/5NbI/8yxlf+7mHT/updy/7qXcv66lnLduZVwgriUbiO0
-k2YBt5RsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAM+6oQDatpsA0bmgD9K4oFLRuKCz0bif8dG4nv/Qt53/0Lac/8+2nP/PtZv/zrSa
-/860mf/Os5j/zbKX/82xlv/MsZX/zLCU/8uvk//Lr5L/yq6R/8qtkf/KrZD/yayP/8mrjv/Iq43/
-yKqM/8epi//HqIr/xqiJ/8WniP/Fp4f/xKaH/8Olhv/DpIX/w6SE/8Kjg//CooL/waGA/8Cgfv/E
-pYX/y6+T/860mf/OtJn/zLGV/8WniP++nXr/vJp2/72bd/y8mnbbu5l1irqYcy+4lXIEuZZyAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADTuKUA8KLFANG5ow/SuaFL0rmhodK5oePSuaD80bif/9G3nv/Qt53/
-0Lac/8+1m//PtJr/zrSZ/86zmP/Nspf/zbKW/8yxlf/MsJT/y7CU/8uvk//KrpL/yq6R/8qtkP/J
-rI//yayP/8mrjv/Iqo3/x6qM/8epi//GqIr/xqiJ/8WniP/Epof/xKaG/8Olhf/DpIT/wqOD/8Ki
-gv/BoYD/wJ9+/8Cfff+/nnz/v599/7+efPa/nnzLvZx6er2beCm6m3YFvJt2AAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA3rqbAMm5qgDTuqMI07qiMtK6onnSuqLA0rqi79K5of7R
-uKD/0bif/9G3nv/Qt53/0Lac/8+1m//PtJr/zrSZ/86zmP/Nspf/zbKW/8yxlf/MsJT/y7CT/8uv
-kv/KrpL/yq6R/8qtkP/JrI//yauP/8mrjv/Iqo3/x6mM/8epi//GqIr/xqiJ/8WniP/Epof/xKWG
-/8Olhf/DpIT/w6OD+sKigt7BoYCiwKB/V8Ggfhu9oHwCv599AAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRvKMA0L6kAdO8pRPTu6RD0rqjgNK6
-o7vSuqLn0rqh+dK5of/RuKD/0bif/9G3nv/Qtp3/0Lac/8+1m//PtJr/zrSZ/86zmP/Nspf/zbKW
-/8yxlf/MsJT/y7CT/8uvkv/LrpL/yq6R/8qtkP/JrI//yauP/8mrjv/Iqo3/yKmM/8epi/3GqInz
-xaeI18Smh6PEpIZkw6SDKcKigQjVNecAwqZ/AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANO9pQDSvqUC0rul
-D9O8pDLSu6Nh0rqjkNK6orrSuqLc0rmh79K5oPjRuJ/+0bie/9C3nv/Qtp3/z7ac/8+1m//OtJr/
-zrOZ/86zmP/Nspf/zbGW/8yxlf/MsJT/y6+T/8uukvzKrpH1yq2Q6Mmsj87Jq46oyKqNesipi0rH
-qIofxqiKCMingwDHp4gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-o8yQAOS1rgDSu6YD0rylDtO7pCLTu6NB0rmiXNG5oXnSuaGS0bmgo9G4n7PRuJ7A0LedxdC2nMnP
-tpzOz7Waxc60msTOs5m6zbKXrM2yl5zMsZWIy6+Ta8qvklHKrpEzya2RF8mtkAjNs5cByq+TAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADIuKkAuayzAM++pALRuqMH0rmhDNG5oRDQuZ8S0LieE8+3
-nhXQtpwSz7WcEs60mw7PtZoKz7WbBNe8oAHUup8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-/////////////////////////////////////////////////////////gAH////////////////
-/8AAAB////////////////wAAAAD///////////////gAAAAAH//////////////gAAAAAAP////
-/////////gAAAAAAA/////////////gAAAAAAAD////////////gAAAAAAAAP///////////gAAA
-AAAAAB///////////wAAAAAAAAAH//////////wAAAAAAAAAA//////////4AAAAAAAAAAH/////
-////8AAAAAAAAAAAf////////+AAAAAAAAAAAD/////////AAAAAAAAAAAAf////////gAAAAAAA
-AAAAD////////wAAAAAAAAAAAAf///////4AAAAAAAAAAAAD///////8AAAAAAAAAAAAAf//////
-+AAAAAAAAAAAAAD///////AAAAAAAAAAAAAA///////gAAAAAAAAAAAAAH//////4AAAAAAAAAAA
-AAA//////8AAAAAAAAAAAAAAH/////+AAAAAAAAAAAAAAB//////gAAAAAAAAAAAAAAP/////wAA
-AAAAAAAAAAAAB/////4AAAAAAAAAAAAAAAf////+AAAAAAAAAAAAAAAD/////AAAAAAAAAAAAAAA
-A/////wAAAAAAAAAAAAAAAH////4AAAAAAAAAAAAAAAB////+AAAAAAAAAAAAAAAAP////AAAAAA
-AAAAAAAAAAD////wAAAAAAAAAAAAAAAA////8AAAAAAAAAAAAAAAAH///+AAAAAAAAAAAAAAAAB/
-///gAAAAAAAAAAAAAAAAP///4AAAAAAAAAAAAAAAAD///8AAAAAAAAAAAAAAAAA////AAAAAAAAA
-AAAAAAAAP///wAAAAAAAAAAAAAAAAB///8AAAAAAAAAAAAAAAAAf//+AAAAAAAAAAAAAAAAAH///
-gAAAAAAAAAAAAAAAAB///4AAAAAAAAAAAAAAAAAf//+AAAAAAAAAAAAAAAAAD///gAAAAAAAAAAA
-AAAAAA///4AAAAAAAAAAAAAAAAAP//+AAAAAAAAAAAAAAAAAD///gAAAAAAAAAAAAAAAAA///4AA
-AAAAAAAAAAAAAAAP//8AAAAAAAAAAAAAAAAAD///AAAAAAAAAAAAAAAAAA///wAAAAAAAAAAAAAA
-AAAP//8AAAAAAAAAAAAAAAAAD///gAAAAAAAAAAAAAAAAA///4AAAAAAAAAAAAAAAAAP//+AAAAA
-AAAAAAAAAAAAD///gAAAAAAAAAAAAAAAAA///4AAAAAAAAAAAAAAAAAP//+AAAAAAAAAAAAAAAAA
-D///gAAAAAAAAAAAAAAAAB///4AAAAAAAAAAAAAAAAAf//+AAAAAAAAAAAAAAAAAH///wAAAAAAA
-AAAAAAAAAB///8AAAAAAAAAAAAAAAAAf///AAAAAAAAAAAAAAAAAP///wAAAAAAAAAAAAAAAAD//
-/+AAAAAAAAAAAAAAAAA////gAAAAAAAAAAAAAAAAP///4AAAAAAAAAAAAAAAAH////AAAAAAAAAA
-AAAAAAB////wAAAAAAAAAAAAAAAA////8AAAAAAAAAAAAAAAAP////gAAAAAAAAAAAAAAAD////4
-AAAAAAAAAAAAAAAB/////AAAAAAAAAAAAAAAAf////wAAAAAAAAAAAAAAAP////+AAAAAAAAAAAA
-AAAD/////gAAAAAAAAAAAAAAB/////8AAAAAAAAAAAAAAAf/////gAAAAAAAAAAAAAAP/////4AA
-AAAAAAAAAAAAH//////AAAAAAAAAAAAAAB//////4AAAAAAAAAAAAAA//////+AAAAAAAAAAAAAA
-f//////wAAAAAAAAAAAAAP//////+AAAAAAAAAAAAAD///////wAAAAAAAAAAAAB///////+AAAA
-AAAAAAAAA////////wAAAAAAAAAAAAf///////+AAAAAAAAAAAAP////////wAAAAAAAAAAAH///
-/////+AAAAAAAAAAAD/////////wAAAAAAAAAAB/////////+AAAAAAAAAAB//////////4AAAAA
-AAAAA///////////AAAAAAAAAAf//////////4AAAAAAAAAf///////////gAAAAAAAAP///////
-////+AAAAAAAAP////////////4AAAAAAAP/////////////gAAAAAAP/////////////+AAAAAA
-f//////////////8AAAAA////////////////8AAAB//////////////////AAf/////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////KAAAAMAAAACAAQAAAQAgAAAAAAAAQAIAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA59CjAOjMpAHl2J8K
-5tycFejbnCDp2p0v6NucQenbnUzp2p1Y6NubX+janWzo2pxt6Nqcbejam23o2ptt6NqbbejamWrp
-2Zpd6dmZV+jamUrn2Zg859iYLOjWlxzl15MS6NqRCPLakQDs2pEAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADu4KUA////AOreoQLo
-2pwI6tqaD+rbmyXo25tK6dqba+janIfo2Zuk6dmbv+nam83p2pvW6dqb4enamufo2Zru6Nma8+jZ
-mvro2Zr76NmZ++jZmfvo2Zn76NmY++jYl/no2Jfx6NiX7ujYlubn2Jbe59iV1efXlcrn15O459eT
-n+bWk4Hn1pFn59eSRObYkh/m15MO5tePBuXeiwHo1Y8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADp2JUA69uPAOjXlgvo2Jgi6NqYP+jZmWro2ZmT6dmZwOnZmeHp2Znw6dmY9+jZmPzo2Zj+6NmY
-/+jZl//o2Zf/6NmX/+jYlv/o2Jb/6NiV/+jYlf/o2JX/6NiU/+fYlP/n2JT/59eT/+fXk//n15P/
-59eS/+fXkv/n15H/59eS/+fXkf/n1pD/59aQ/ufWkPvn1o/35tWP7ubVj93l1Y675dWNieTVi2Ll
-04s75dOJH+fSiQjk1IoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADh0pYAv6CiAOPWlg/m2JQ36NiVZ+fYlZvo2JbF6NiW5efYlvzo2Jb/
-6NiV/+jXlf/o2JX/59iU/+fXlP/n2JT/59eT/+fXk//n15L/59aS/+fWkv/n1pH/59aR/+bXkf/n
-1pD/59aP/+bVj//m1o//5taO/+bWjv/m1Y7/5tWO/+bVjf/m1Y3/5dSN/+bVjP/m1Yz/5tSM/+bV
-i//l1Iv/5dSL/+XUiv/l1Ir/5dSK/+XTifnl04ji5dOHweTShZHk0YVd5dKDLuXUfwzl0IQAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADk148A6tmSAubYjg7m15E159aTeOfWkq/n
-15Lb59eS9OfXkv/n15L/59eS/+fWkf/m1pH/5taR/+bWkP/m1pD/5taP/+bWj//m1Y//5tWO/+bV
-jv/m1Y7/5tWN/+bVjf/m1Y3/5dWM/+XUjP/l1Iv/5dSL/+XUi//l1Ir/5dSK/+XUiv/l04n/5dOJ
-/+XTif/l04j/5dOI/+XTiP/k04f/5NOH/+TSh//k0ob/5NKG/+TShv/k0oX/5NKF/+TShf/k0oT/
-5NGE/+PRg/7j0YPw49GC1OLRgaji0IFp4c6AK+HPfgrl0n0C5dJ+AAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADg1YgA+9CoAOPU
-jArm1Y4q5tWNZ+bWjq7n1o/l59aP+ufVj//m1Y//5tWO/+bWjv/m1Y3/5tWN/+bVjf/l1Iz/5dWM
-/+XVjP/l1Iv/5dSL/+XUi//l1Ir/5dSK/+XTif/l04n/5dSJ/+XUiP/l04j/5dOI/+TTh//k0of/
-5NKG/+TShv/k0ob/5dOF/+TShf/k0oX/5NGE/+TRhP/k0oT/5NKD/+TSg//j0YP/49GC/+PRgv/j
-0YL/49CB/+PQgf/j0YH/49CA/+PQgP/j0ID/4s+A/+LPgP/iz3//4s9//+LQfv7iz3734s994OHP
-fKLhznta4c16JN7JdQXiz3sAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAOTVigDk1YoR5dSLSeXVi5Tl1IvS5dSL+eXUi//m1Iv/5tSL/+XUi//l1Ir/
-5dOK/+TTiv/l04n/5NOJ/+XTiP/l04j/5NOI/+TTh//k04f/5NKH/+XShv/k0ob/5NKF/+TShf/k
-0oX/5NKE/+TShP/k0YT/5NGD/+PRg//j0YL/49GC/+TRgv/j0IL/49CB/+LQgf/j0IH/49CA/+PQ
-gP/j0ID/49CA/+PPf//iz3//4s9+/+PPfv/iz37/4s5+/+LPfv/iz33/4s59/+HOfP/iznz/4s58
-/+HOfP/hznv/4c57/+LOe//iznr/4c16/+HNef/gzHn04cx4yODMd4PgzHQ94s9vCd/KewD//wAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAOHRhQDh0YUD5tSEF+TTh1vk0oiv5dOI5eXTiP7l
-04j/5NOI/+TSh//k0of/5NKG/+TShv/k0ob/5NKF/+TShf/k0YX/5NGE/+TRhP/k0YT/49GD/+PR
-g//j0YP/49GC/+PRgv/j0IL/49CB/+PQgf/j0IH/49CA/+PQgP/iz4D/4s+A/+LPf//iz3//4s9/
-/+LPfv/iz37/4s9+/+LPff/izn3/4s58/+LOfP/iznz/4s58/+LOfP/hznv/4c57/+HNe//hzXr/
-4c16/+HNev/hzXn/4c15/+HNeP/hzXj/4cx4/+DMd//gzHf/4Mx2/+DMdv/gzHb/4Mx1/+DLdf/g
-y3X/4Mt1/+DLdPvgy3Pe4MpyoeDKcErgyW0S3cdsAd7IbQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADl0YMA59GDAeTR
-ghzj0YNg5NGEvOTShPPk0YT+5NGE/+TRg//k0YP/49GD/+PRgv/j0YL/49GC/+PQgf/j0IH/49CB
-/+PQgP/j0ID/49CA/+PQf//iz3//4s9//+LPf//iz37/4s9+/+LPfv/iz33/4s99/+LOff/iznz/
-4s58/+LOfP/iznz/4s57/+HOe//hznv/4c56/+HNev/hzXr/4c15/+HNef/hzXn/4c14/+HNeP/h
-zXf/4Mx3/+DMd//gzHb/4Mx2/+DMdv/gzHX/4Mt1/+DLdf/gy3T/4Mt0/+DLc//gy3P/4Mtz/+DL
-cv/fy3L/38py/9/Kcf/fynH/38px/9/KcP/fynD/38pw/9/Kb//fyW//38lv/t/JbuzeyG2v3sdr
-Vd3IaxbbxX4A3MV3AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAy8xmAP3VnQDh0H4a4tB/Y+PQgbni0IHz49CB/+PQgP/j0ID/49B//+PQf//j0H//
-4s9+/+LPfv/iz37/4s99/+LPfv/iz33/4s98/+HPff/iz3z/4s57/+LOe//hznv/4c57/+HOe//h
-znr/4c56/+LOev/hzXn/4c15/+HNef/hzXj/4c14/+HMeP/hzXf/4cx3/+HMd//gzHb/4Mx1/+DM
-df/gzHX/4Mt0/+DMdP/gy3T/38t0/+DLc//gy3P/38tz/9/Kcv/fy3L/38py/9/Kcf/fynH/38px
-/9/KcP/fynD/38pv/9/Jb//fyW//38lu/9/Jbv/fyW3/3slt/97Jbf/eyWz/38hs/97IbP/eyGv/
-3shr/93Ia//ex2r/3shq/97Iav/dyGr/3cZp8N3GaK3cxGZU38VnD9S5ZwDlzGcAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADhzXsA4M56DOHOfFDiz3204s998eLPfv/i
-z33/4s98/+LOfP/iznz/4s58/+LOe//iznv/4c57/+HOev/hznr/4c15/+HNef/hzXn/4c14/+HN
-eP/hzXj/4c13/+HNd//hzHf/4Mx2/+DMdv/gzHb/4Mx1/+DMdf/gzHT/4Mt0/+DLdP/gy3P/4Mtz
-/+DLc//gy3L/4Mty/+DLcv/fynH/38px/9/Kcf/fynD/38pw/9/KcP/fym//38lv/9/Jb//fyW7/
-38lu/97Jbv/eyW3/3slt/97IbP/eyGz/3shs/97Ia//eyGv/3shr/97Iav/eyGr/3sdq/97Haf/e
-x2n/3cdp/93HaP/dx2j/3cdo/93HZ//dxmf/3cVm/93FZv/dxWb/3cVl/93FZf/dxWX/3MRk/9zE
-ZP7cxGPp28NjpdvDYT7bwGAH28ZQANqukwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA38x5AN7M
-eQbhzXg64M15n+HNee7hznr+4c15/+HNef/hzXn/4c14/+HNeP/hzXj/4c13/+HNd//gzHb/4Mx2
-/+DMdv/gzHX/4Mx1/+DLdf/gy3T/4Mt0/+DLc//gy3P/4Mtz/+DLcv/gy3L/4Mty/9/Lcf/fynH/
-38px/9/KcP/fynD/38pw/9/Kb//fym//38pu/9/Jbv/fyW7/38lt/97Jbf/eyW3/3sls/97IbP/e
-yGz/3shr/97Ia//eyGv/3sdq/97Iav/eyGr/3sdp/97Haf/dxmn/3cZo/93GaP/dxmj/3cZn/93H
-Z//dxmf/3cVm/93FZv/dxWX/3cVl/93FZf/dxGT/3MRk/9zEZP/cxGP/3MRj/9zEY//cxGL/3MRi
-/9zEYv/cw2H/3MNh/9zDYf/cw2D/3MNg/9vDX//bw1//28Nf/trCXuTbwV2M2sFbLdrCWQHawVoA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAADfyngA4MxzHd/Ldnrgy3bY4Mx2/uDMdv/gzHX/4Mx1/+DLdP/gy3T/
-4Mt0/+DLdP/fy3P/38tz/9/Lcv/fynL/38py/9/Kcf/fynH/38pw/9/JcP/fynD/38pv/9/Kb//e
-yW//3slv/97Ibv/eyW7/3slu/97Jbf/eyW3/3sls/97IbP/eyGz/3sdr/97Ha//eyGv/3chq/93H
-av/dx2r/3cdp/97Haf/dxmn/3cZo/93GaP/dxmf/3cZn/93GZ//dxWb/3MVm/9zFZv/cxmX/3cZl
-/9zFZP/cxGT/3MRk/9zEZP/cw2P/3MRj/9zEY//cxGL/3MRi/9zDYv/bw2H/28Nh/9vDYf/bwmD/
-28Nf/9vDYP/bwl//28Je/9vCXv/bwl7/28Jd/9vCXf/bwl3/2sJc/9rCXP/awVz/2sFb/9rAW//a
-wVv/2sFb/9rBWv/awVr92sBZzNrAV2XbvlcU275XAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADb0W4A4MRwAN3KbgjfynFJ38pxut/Kcvff
-ynL/38py/9/Kcf/fynH/38px/9/JcP/fyXD/38lw/97Jb//eyW//3slu/97Jbv/eyG7/3sht/97I
-bf/eyW3/3shs/97IbP/eyGv/3shr/97Ha//ex2r/3cdq/93Hav/dx2r/3cdp/93Haf/dxmn/3cZo
-/93GaP/dxmj/3cVn/93FZ//cxWf/3MVm/9zFZv/cxWX/3MVl/9zFZf/cxGT/3MRk/9zEZP/cxGP/
-3MNj/9zDY//cw2L/28Ni/9vDYf/bw2H/28Nh/9vDYP/bw2D/28Jg/9vCX//bwl//28Jf/9vCXv/b
-wl7/28Jd/9rBXf/awV3/2sFc/9rBXP/awVz/2sFb/9rBW//awFv/2sBa/9rAWv/awFr/2sBZ/9rA
-Wf/awFn/2b9Y/9m/WP/Zv1f/2b9X/9m/V//Zv1b/2b9W/9m/Vv/ZvlX/2b5V/9m+VPHYvlOl171Q
-M9W+TgPUvE4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AADdyWwA3sdrHd7JbIHfyW7j38lu/t/Jbf/eyW3/3slt/97JbP/eyGz/3shs/97Ia//eyGv/3shr
-/97Hav/ex2r/3sdq/97Haf/ex2n/3sdp/93GaP/dxmj/3cZo/93GZ//dxmf/3cZm/93FZv/dxWb/
-3cVl/93FZf/dxWX/3cVk/93EZP/cxGT/3MRj/9zEY//cxGP/3MRi/9zEYv/cw2L/3MNh/9zDYf/c
-w2D/3MNg/9zDYP/cw1//28Nf/9vCX//bwl7/28Je/9vCXf/bwl3/28Jd/9vCXP/bwlz/28Fc/9vB
-W//awVv/2sFb/9rBWv/awVr/2sFa/9rBWf/awFn/2sBZ/9rAWP/awFj/2sBY/9rAV//awFf/2r9X
-/9m/Vv/Zv1b/2b9W/9m/Vf/Zv1X/2b9V/9m/VP/Zv1T/2b5U/9m+U//ZvlP/2b5S/9i+Uv/YvlL/
-2L5R/9i9Uf/YvVD/2L1Q/9i9UP/YvU/817xP1te8TWjXukwR17pMAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAA28lkANnLYATdx2g93sdpsN7HafreyGr/3shp/97Haf/dx2n/
-3sZo/93GaP/dxmj/3cZn/93GZ//dxmb/3cZm/93FZv/dxWX/3cVl/93FZP/dxWT/3MVk/9zEY//c
-xGP/3MRj/9zDY//cxGL/3MRi/9zDYv/cw2H/3MNh/9vDYf/cw2D/3MNg/9vCYP/bwl//28Je/9vC
-Xv/bwl7/28Jd/9vCXf/bwl3/2sJd/9vBXP/bwVz/28Jc/9vBW//awVv/2sBb/9rBWv/awVr/2sFZ
-/9rBWf/awFn/2sBY/9rAWP/awFj/2sBX/9rAV//ZwFb/2sBW/9m/Vv/Zv1X/2b9V/9m/Vf/ZvlT/
-2b5U/9m+VP/Zv1P/2b5T/9m+U//ZvlL/2L5S/9i+Uv/YvlH/2L5R/9i9Uf/YvVD/2L1Q/9i8T//Y
-vU//2L1P/9e8Tv/YvE7/2LxO/9e8Tv/XvE3/17tM/9e7TP/Xu0z/17tM/9e8S//Xu0v/1rtL/9a6
-SvHWukmZ1rpGKs/BKwDVu0MAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADbxmQA28RiC9zFZWfd
-xWbW3cVm/dzFZv/cxWX/3MVl/9zFZP/cxWT/3MRk/9zEY//cxGP/3MRj/9zEYv/cw2L/3MNh/9zD
-Yf/bw2H/28Ng/9vDYP/bw2D/28Nf/9vCX//bwl//28Je/9vCXv/bwl7/28Jd/9vCXf/bwl3/2sFc
-/9rBXP/awVz/2sFb/9rBW//awVv/2sFa/9rAWv/awFn/2sBZ/9rAWf/awFj/2sBY/9nAWP/ZwFf/
-2b9X/9m/V//Zv1b/2b9W/9m/Vv/Zv1X/2b9V/9m/Vf/ZvlT/2b5U/9i+U//YvlP/2L5T/9i+Uv/Y
-vVL/2L1S/9i9Uf/YvVH/2L1R/9i9UP/YvVD/2L1Q/9i9T//YvE//17xP/9e8Tv/XvE7/17xN/9e8
-Tf/XvE3/17tM/9e7TP/Xu0z/17tL/9e7S//Xu0v/1rtK/9a7Sv/Wukn/1rpJ/9a6Sf/Wukj/1rpI
-/9a6SP/Wukf/1rlH/9a5R//WuUb/1rlG/9W5Rv/VuUb71blExda3QkrUt0EF1LdBAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAA2rtZANrLagDawmAb28NhitzEYvHcw2L/3MNi/9zDYf/cw2H/3MNg/9zDYP/cwl//3MNf
-/9zDX//bw17/28Je/9vCXv/bwl3/28Jd/9vBXf/awVz/28Fc/9vCW//bwlv/28Fb/9vBWv/awFr/
-2sBa/9rAWf/awFn/2sFZ/9rAWP/awFj/2sBY/9q/V//av1f/2r9X/9q/Vv/av1b/2b9W/9m/Vf/Z
-v1X/2b5U/9m+VP/Zv1T/2L9T/9i+U//ZvlP/2b5S/9m9Uv/ZvVL/2L1R/9i+Uf/YvlH/2L1Q/9i9
-UP/YvVD/2LxP/9i8T//YvU7/2LxO/9i8Tv/YvE3/2LxN/9i8Tf/Xu0z/17tM/9e7TP/XvEv/17xL
-/9e7S//Wu0r/1rpK/9e6Sv/Xukn/17pJ/9e6Sf/Wukj/1rpI/9a5SP/WuUf/1rlH/9a5Rv/WuUb/
-1rpG/9a5Rf/WuUX/1rlE/9a4RP/WuET/1blD/9W5Q//VuEP/1bhC/9W3Qv/Vt0L/1LdB/9S3Qf/U
-uEH/1bhA/9W3QOPUtz5w1Lc6ENW1OwDTuTsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADbwF0A371iAdrAXDDawV2r2sJe+NvCXv/bwl3/
-28Fd/9vBXf/bwVz/28Fc/9vBW//bwVv/28Fb/9rBWv/awVr/2sBa/9nAWf/awFn/2sBZ/9rAWP/Z
-wFj/2cBX/9rAV//awFf/2r9W/9q/Vv/Zv1b/2b9V/9m/Vf/Zv1X/2b5U/9m+VP/ZvlT/2b5T/9m+
-U//ZvlP/2b5S/9m9Uv/ZvVL/2L1R/9i9Uf/YvVH/2LxQ/9i9UP/YvVD/171P/9e8T//YvE7/2LxO
-/9i8Tv/YvE3/17tN/9e7Tf/Xu0z/1rtM/9e7TP/Xu0v/17tL/9e7S//Xu0r/17pK/9e6Sv/Xukn/
-17pJ/9a6Sf/Wukj/1rpI/9a6SP/Wukf/1rlH/9a5Rv/VuUb/1blG/9a5Rf/WuUX/1rhF/9a4RP/V
-uET/1bhE/9W4Q//VuEP/1bhC/9W4Qv/Vt0L/1bdB/9W3Qf/Vt0H/1bdA/9W2QP/Vt0D/1Lc//9S2
-P//Utj//1LY+/9S2Pv/Utj7/07Y9/9O1Pf/Ttj3/1LY8/9S1PP/TtTvv07Q6kdKzNx3UtToAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANe+VgDX
-vlUD2cBYQNrAWcbawFr82sBa/9rAWf/awFn/2sBZ/9rAWP/awFj/2b9X/9m/V//Zv1f/2b9W/9m/
-Vv/Zv1b/2b9V/9m/Vf/ZvlX/2b5U/9m+VP/ZvlT/2L5T/9i+U//YvlP/2L1S/9i9Uv/YvVL/2L1R
-/9i9Uf/YvVD/2L1Q/9i9UP/YvE//2LxP/9i8T//XvE//17xO/9e8Tv/XvE7/17xN/9e7Tf/Xu0z/
-17tM/9e7TP/Xu0v/17tL/9a6Sv/Wukr/1rpK/9a6Sf/Wukn/1rpJ/9a6SP/Wukj/1rpI/9a5R//W
-uUf/1rlH/9a5Rv/WuUb/1blG/9W5Rf/VuEX/1bhE/9W4RP/VuET/1bhD/9W4Q//VuEP/1bdC/9W3
-Qv/Vt0L/1LdB/9S3Qf/Ut0H/1LdA/9S3QP/UtkD/1LY//9S2P//Utj7/1LY+/9S2Pv/Utj7/1LY9
-/9S2Pf/TtTz/07U8/9O1PP/TtTv/07U7/9O1O//TtTr/07U6/9O0Ov/TtDn/07Q5/9K0Of/StDj/
-0rQ4/9KzOP/Sszf/0rM3+tKyNq3SsjMu16wAANKyMQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAA2L5SANi+UQXYvlRU2L9W19m/Vv/Zv1X/2b9V/9m/VP/ZvlT/2b5U
-/9m+U//ZvlP/2L5T/9i+Uv/YvlL/2L1R/9i9Uf/YvVH/2L1R/9i9UP/YvVD/2L1P/9i9T//YvE//
-2LxO/9i8Tv/XvE7/17xN/9e8Tf/XvE3/17xM/9e7TP/Xu0z/17tL/9e7S//Xu0v/1rtK/9a7Sv/W
-ukr/1rpJ/9a6Sf/Wukn/1rpI/9a6SP/Wukf/1rlH/9a5R//WuUb/1rlG/9a5Rv/WuUX/1blF/9W5
-Rf/VuET/1bhE/9W4Q//VuEP/1bhD/9W4Qv/VuEL/1bdC/9W3Qf/Vt0H/1LdB/9S3QP/Ut0D/1LdA
-/9S3P//Utz//1LY//9S2Pv/Utj7/1LY9/9S2Pf/Utj3/1LY8/9S2PP/TtTz/07U7/9O1O//TtTv/
-07U6/9O1Ov/TtTr/07U5/9O0Of/TtDn/07Q4/9K0OP/StDf/0rQ3/9KzN//Sszb/0rM2/9KzNv/S
-szX/0rM1/9KzNf/SszT/0rI0/9KyNP/SsjP/0bIz/9GyM//RsjL/0bIy/9GyMv3QsTHB0LAvPMip
-JAHPry0AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADYvk8A3LRWBdi9UGPYvVHf
-2b1R/9i9Uf/YvVD/2L1Q/9i9UP/YvU//2L1P/9i9T//YvU7/17xO/9e8Tv/XvE3/17xN/9e8Tf/X
-vEz/17tM/9e7TP/Xu0v/17tK/9e7S//Xu0r/17tJ/9e6Sf/Xu0n/1rpI/9a6SP/Wukj/1rpH/9a6
-R//Wukf/1bpG/9a6Rv/WuUb/1blG/9W5Rf/VuUX/1blF/9W5RP/VuET/1rhD/9W4Q//VuEP/1LhC
-/9W4Qv/VuEH/1bdB/9W3Qf/Vt0H/1bdA/9S3QP/Ut0D/1LY//9W3P//Utz//1LY+/9S2Pv/Utj3/
-1LY9/9S2PP/Utj3/07Y8/9O2O//Ttjv/07U7/9O1O//TtTr/07U6/9O1Ov/TtTn/07Q5/9O0Of/T
-tDj/07Q4/9O0OP/TtDf/0rQ2/9K0Nv/Sszb/0rM1/9KzNf/SszX/0bM1/9KyNP/SszT/0rM0/9Gz
-M//RsjP/0bIy/9GyMv/RsjL/0rIx/9GyMf/RsTH/0bEw/9CxMP/RsTD/0bEw/9GxL//RsS//0bAv
-/9CwLv/QsC7/0bAu/9CwLf/QsC3/0K8szc+uKkSrcVEA//8AAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAANS+RgDUvkYH2LtNaNe8TefXvE3/17xN/9e8Tf/XvEz/17tM/9e7S//Xu0v/17tL/9e7
-Sv/Xu0r/1rtK/9a6Sf/Wukn/1rpI/9a6SP/Wukj/1rpH/9a6R//WuUf/1rlG/9a5Rv/WuUb/1rlF
-/9a5Rf/VuUX/1blE/9W5RP/VuET/1bhD/9W4Q//VuEL/1bhC/9W4Qv/Vt0L/1bdB/9W3Qf/Ut0H/
-1LdA/9S3QP/Utz//1Lc//9S2P//Utj7/1LY+/9S2Pv/Utj3/1LY9/9S2Pf/Utjz/1LY8/9O1PP/T
-tTv/07U7/9O1Ov/TtTr/07U6/9O1Of/TtTn/07Q5/9O0OP/TtDj/0rQ4/9K0N//StDf/0rQ3/9Kz
-Nv/Sszb/0rM2/9KzNf/SszX/0rM0/9KzNP/SsjT/0rIz/9KyM//RsjP/0bIy/9GyMv/RsjH/0bIx
-/9GyMf/RsTD/0bEw/9GxMP/RsS//0bEv/9GxL//QsC//0LAu/9CwLv/QsC3/0LAt/9CwLf/QsCz/
-0LAs/9CwLP/Qryv/0K8r/9CvK//Qryr/0K8q/8+vKv/Pryn/z64p/8+uKf/Prij/z64o/8+uJ9HP
-rSZN06cmBNGqJgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA1btGANW7RAjWukhr1rpJ6Na6Sf/Wukn/1rpI
-/9a6SP/Wukj/1rpH/9a6R//WuUb/1rlG/9a5Rv/WuUX/1rlF/9W5Rf/VuUT/1blE/9W4RP/VuEP/
-1bhD/9W4Qv/VuEL/1bhC/9W3Qf/Vt0H/1bdB/9W3QP/Ut0D/1LdA/9S3P//Utz//1LY//9S2Pv/U
-tj7/1LY+/9S2Pf/TtTv/07U6/9O1Of/TtTn/07U5/9O1Ov/TtTv/07U7/9O1Ov/TtTr/07U5/9O1
-Of/TtTj/07Q4/9O0OP/TtDj/0rQ3/9K0N//Sszf/0rM2/9KzNv/Sszb/0rM1/9KzNf/SszX/0rM0
-/9KzNP/SsjP/0rIz/9KyM//RsjL/0bIy/9GyMv/RsjH/0bIx/9GxMf/RsTD/0bEw/9GxL//RsS//
-0bEv/9GwLv/QsC7/0LAu/9CwLf/QsC3/0LAt/9CwLP/QsCz/0K8r/9CvK//Qryv/0K8q/9CvKv/Q
-ryr/z68p/8+vKf/Pryn/z64o/8+uKP/Prij/z64n/8+uJ//Prif/z60m/8+tJv/PrSb/zq0l/86t
-Jf/OrSX/zq0k/86tJP/OrCP/zqwj/86sI//OrCLczqogV8eoGQPPqR4AAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADWt0MA
-1rJJBta4RGvVuEXn1rlF/9W4Rf/VuET/1bhE/9W4RP/Vt0P/1bhD/9W4Q//Ut0L/1LhB/9S3Qv/U
-t0H/1LdA/9S3QP/Ut0D/1Lc//9S3P//Utj//1LY+/9S2Pv/Utj7/1LY9/9O1Pf/TtT3/07U9/9O1
-PP/TtTz/07U8/9O1O//TtTv/07Q6/9O0Of/StDf/0rI0/9KzNf/TtTz/1LdA/9W4RP/VuEL/1LY9
-/9O0OP/RsTH/0bEx/9GyM//SsjX/0rI1/9KzNf/SszX/0bM0/9GyM//RsjP/0rIz/9GyMv/RsTL/
-0bEy/9GxMv/RsTH/0bEx/9GxMf/QsDD/0LEw/9CxMP/QsS//0bEv/9CwL//QsC7/0LAt/9CvLv/Q
-sC3/0K8s/9CvLf/Qryz/0K8r/8+vK//Pryv/z64r/8+uKv/Prir/z64p/8+vKf/Prin/z64o/8+t
-KP/Prij/zq4n/8+tJ//OrSf/zq0m/8+tJv/OrSb/zqwl/86tJf/OrSX/zq0k/86tJP/OrCP/zqwj
-/86sI//NrCL/zasi/82rIv/NqyH/zqwh/82rIf/NqyD/zasg/82rIP/Nqh//zaof/82qH//Nqx7/
-zKoc3MmkEFG6wQABwb0EAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAODKXADgy10E07Q5ZtS2P+jUt0H/1LdB/9S3QP/UtkD/1LY//9S2
-P//Utj//1LY+/9S2Pv/Utj7/07Y9/9O2Pf/TtT3/07U8/9O1PP/TtTz/07U7/9O1O//TtTv/07Q6
-/9O0Ov/TtDn/0rQ5/9K0Of/StDj/0rQ4/9KzOP/Sszj/0rQ3/9KzN//SsjT/0bEx/9O0Of/YvlL/
-4c16/+jZmf/t4rH/8Oa///Pry//y6sf/7+W5/+zfqv/n1pL/4Mtz/9i+UP/TtDj/0LAs/9CvLP/Q
-sC//0LEw/9CwL//QsC//0LAv/9CwLv/QsC7/0LAu/9CwLf/Qry3/0K8t/9CvLP/Qryz/z68r/8+v
-K//Pryv/z64q/8+uKv/Prir/z64p/8+uKf/Prin/z64o/8+uKP/PrSj/zq0n/86tJ//OrSf/zq0m
-/86tJv/OrSb/zq0l/86sJf/OrCX/zqwk/86sJP/OrCT/zqwj/86sI//NrCL/zasi/82rIv/NqyH/
-zash/82rIf/NqyD/zasg/82rIP/Nqh//zaof/82qH//Mqh7/zKoe/8yqHv/MqR3/zKkd/8ypHP/M
-qRz/zKkc/8ypG//MqRv/zKkb/8ypGv/LqBf/y6cW/9S3QdTu47RE////AP7+/gAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA/v7+AP///wT07cxb38lw
-5NS3QP/StDj/1LU7/9S2O//TtTv/07U7/9O1Ov/TtTr/07U5/9O1Of/TtTn/07Q4/9O0OP/TtDj/
-07Q3/9O0N//StDf/0rQ2/9KzNv/Sszb/0rM2/9KzNf/SszX/0rM0/9KzNP/SszT/0rIz/9KyM//S
-sjP/0bEx/9CwLf/Utj3/38pw/+3isv/59OP//fz2//7+/P////7/////////////////////////
-/v/+/fv//fz2//n15v/w5r3/5NGF/9e8TP/QsCz/zq0m/9CvKv/Qryr/0K8q/9CvKf/Pryn/z64p
-/8+uKP/Prij/z64o/8+uJ//Prif/z64n/8+tJv/PrSb/z60m/8+tJf/OrSX/zq0k/86tJP/OrCT/
-zqwj/86sI//OrCP/zqwi/86sIv/OrCL/zqwh/86sIf/OqyH/zasg/82rIP/NqyD/zasf/82rH//N
-qx//zase/82rHv/Nqh3/zaod/82qHf/Nqhz/zaoc/8yqHP/Mqhv/zKkb/8ypG//MqRr/zKka/8yp
-Gv/MqRn/zKkZ/8yoGf/MqBj/zKgY/8yoF//LqBf/y6gX/8uoFv/LqBb/y6cW/8qmEf/MqRz/3sds
-//Xv1f/+/fvR/v7/P////wD+/v4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAD+/v4A/v7+Af7+/kz+/v3c+vbp/+3hrv/bxGL/0rM2/9KyNP/Sszb/0rQ2/9KzNv/S
-szX/0rM1/9KzNP/SszT/0rM0/9KyM//SsjP/0rIz/9KyMv/RsjL/0bIy/9GxMf/RsTH/0bEx/9Gy
-MP/RsjD/0bEv/9CxL//RsS//0bEv/9GwLv/Qryv/0LAv/93FZf/v5Lf/+/nw////////////////
-/////////////////////////////////////////////////////////////v77//fx2f/o2Jj/
-17xN/86tJP/OrCT/z60l/86tJf/OrST/zq0k/86tJP/OrSP/zq0j/86sI//OrCL/zqwi/82rIv/O
-rCH/zqsh/86rIf/NqyD/zasg/82rIP/Nqx//zaof/82rH//Nqh7/zaoe/8yqHv/Nqx3/zaod/82p
-Hf/Nqhz/zKob/8yqG//MqRv/zKka/8ypGv/MqRr/zKga/8ypGf/MqRj/y6gZ/8ypGP/MqBf/zKgY
-/8yoF//LqBb/y6gX/8unFv/LpxX/y6gV/8unFf/LpxX/y6cV/8unFP/LpxT/y6YU/8qnE//KphP/
-yqYS/8qmEv/KpRL/yaQN/9CuKf/n15T/+/nv////////////////xv7+/jL///8AAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD+/v4A/v7+Nv7+/tD///////////7+
-/f/48+D/5tWQ/9S3P//QsC3/0bEw/9GxMf/RsTH/0bEw/9GxMP/RsTD/0bEv/9CxL//QsC//0LAu
-/9CwLv/QsC7/0LAt/9CwLf/QsC3/0LAs/9CvLP/Qryz/0K8r/9CvK//Pryv/z68p/8+tJf/UtkD/
-6NiX//r25///////////////////////////////////////////////////////////////////
-///////////////////////////////+/fr/9/Lc/+TRhf/RsTH/zKoc/82rIP/NqyD/zasg/82r
-H//Nqx//zaof/82qHv/Nqh7/zKoe/8yqHf/Mqh3/zKoc/8yqHP/MqRz/zKkb/8ypG//MqRv/zKka
-/8ypGv/MqRr/zKkZ/8yoGf/LqBn/y6gY/8uoGP/LqBf/y6gX/8uoF//Lpxf/y6cW/8unFv/Lpxb/
-y6cV/8unFf/KpxX/yqcU/8qmFP/KphT/yqYT/8qmE//KphP/yqYS/8qmEv/KpRL/yqUR/8qlEf/K
-pRH/yaUR/8mlEP/JpRD/yaUQ/8mkD//JpA//yaQP/8mkDv/Iowr/0rM1/+/jtf/9/Pj/////////
-/////////////v///7T///8j////AP//3AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AP///wD///8l////uf///////////////////////////fz4//Dmu//bwlz/0LAr/8+vKf/Qry3/
-0K8s/9CwLP/Qryv/0K8r/9CwK//Pryr/z68q/8+uKv/Prin/0K4p/8+vKP/Pryj/z64o/8+tJ//P
-rSf/z60n/86tJ//NrCP/zq4n/9zEY//z6sj//v77//////////////////////////////////38
-+P/7+O3/+fXk//j04f/59OL/+fbm//v57//+/fn/////////////////////////////////////
-//38+P/v5Lb/1rpG/8uoGP/MqRr/zKkb/8yqG//MqRr/zKka/8ypGv/MqBn/zKkZ/8ypGf/LqBj/
-y6gY/8uoF//LqBf/zKgX/8unFv/Lpxb/y6gW/8uoFf/LqBX/y6cV/8qnFf/KphT/yqYU/8qmFP/K
-phP/yqcT/8qmE//KphL/yqYS/8qlEv/KphL/yqYR/8qmEf/KpRH/yaUQ/8mlEP/JpBD/yaQP/8mk
-D//KpQ//yaUO/8mkDv/JpA7/yaMN/8mjDf/Jow3/yKMM/8ikDP/Iowv/yKML/8ijC//Iowv/yKIJ
-/8ehB//VuEX/8+vJ///////////////////////////////+//Xv1PvfynWdvpIAFcmlDgDCmQAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0bAvAMegBRLl1I6a9/Le+////v//////////////////
-///////////////49OD/5dOJ/9KzNv/OrSP/z64n/8+uJ//Prif/z60n/8+tJv/PrSb/zq0m/86t
-Jf/OrSX/zq0k/86tJP/OrCT/zawj/82sI//OrCP/zash/8yqHf/TtTv/59eU//r26P//////////
-/////////////////////v/7+O3/8+vK/+zfqf/n15T/5NKG/+PQgf/j0IL/5dOJ/+jYmP/s4Kz/
-8+zL//r36v////7/////////////////////////////////9e7R/9rCXP/Lpxb/y6cV/8unF//L
-pxb/y6cW/8unFv/LpxX/y6cV/8unFf/LpxT/yqYU/8qmFP/LphP/yqYT/8qmE//KphL/yaYS/8qm
-Ev/KpRL/yqUR/8mlEf/JpRH/yaUQ/8mlEP/JpBD/yaQP/8qkD//JpA//yaQO/8ikDv/JpA7/yaQN
-/8mjDf/Jow3/yaMM/8mjDP/Jowz/yaIL/8mjC//Iowv/yKIK/8iiCv/Iogn/yKIJ/8iiCf/IoQj/
-x6II/8ehCP/HoQf/x6EH/8ihB//HoQb/xp8E/9a6Sv/17tP////////////////////////////9
-/Pb/7OCt/9GzO//FnwX1xZ4AgsOeAAnFngAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADGoAYAzaofBseh
-B3fIpBPz0rQ8/+fWlf/59eT////+/////////////////////////////fv2/+/kuf/awVj/zq0k
-/82qHv/OrCH/zqwj/86sIv/NqyL/zash/82rIf/NqyD/zasg/82rIP/NqyD/zasf/82qHf/MqRn/
-zasg/9vDXf/x6MH//v35/////////////////////////////fv1//Pqx//o2Jf/4s9+/+DMdv/g
-zHb/4cx3/+HMd//hzHf/4Mx3/+DMdf/gzHb/4c58/+bWkf/w5bn/+vbo///+/f//////////////
-//////////////jz3//dxmb/yqYS/8mlEf/KphL/yqUS/8qlEv/KpRH/yqUR/8qlEf/JpRH/yaUQ
-/8mlEP/JpBD/yaQP/8mkD//JpA//yaQO/8mkDv/JpA7/yaMN/8mjDf/Iowz/yKMM/8ijDP/Iowv/
-yKML/8ijC//Iogr/yKIK/8iiCv/Iogn/yKII/8iiCP/Iogj/yKEH/8ehB//HoQf/x6EG/8ehBv/H
-oQb/x6EG/8egBf/HoAX/x6AE/8egBP/HoAP/xqAD/8WgA//GoAP/xp8D/8WfAv/FngL/1LdG//Xv
-1P////////////////////////////r36f/jz4H/yqcb/8OdAP/FngD/xZ8A6sSfAFnApAABwqMA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAP/4OACYWwAAzKgZUMagBOjEngD/xJ0A/8agCv/TtkL/7N+r//v57///////
-/////////////////////////v/59eX/6NmZ/9W4Q//Mqh7/y6cX/8ypG//Mqh3/zKod/8yqHP/M
-qRz/zKkb/8ypG//MqBn/y6cV/8yoGf/VuEP/6dqb//r47P////7///////////////////////79
-+//179X/5taR/93FZf/cxWX/38lv/+HNeP/iznz/4c57/+HNef/hzXn/4c15/+HNef/hzXn/4cx4
-/+DMdv/hzHf/5dSM//Lpw//8+/P////////////////////////////59eX/3cZn/8ijC//JpA3/
-yaQN/8mkDf/JpA3/yaMM/8mjDP/Iowz/yKML/8ijC//Iowv/yKMK/8iiCv/Iogr/yKIJ/8iiCf/I
-ogn/yKII/8iiCP/Iogf/yKIH/8ehB//HoQb/x6EG/8ehBv/HoQX/x6EF/8egBf/HoAT/x6AE/8eg
-BP/HoAP/xqAD/8WgA//FnwL/xZ8C/8WfAv/FnwL/xZ8C/8WfAv/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8SdAf/TtkP/9e7T////////////////////////////9/Ld/9rBXv/GoAj/
-xJ0A/8WfAP/FnwD/xZ8A/8WfANHEnwA3wZ0AAMmhAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMilDgDIpQ4rx6EIxsWfAf/F
-nwD/xZ8A/8WfAP/EnQD/yKQS/9zFZ//17dD///79//////////////////////////////79//bv
-1v/m1ZH/17xN/86sIv/LpxX/yqUR/8qmE//KphL/yqUQ/8qlEf/Mqh3/1bhF/+XTiv/28dj///79
-////////////////////////////+fbn/+bVkf/StDz/yqcZ/8mlE//Kphf/zKoi/9KzNf/Zv1b/
-38py/+HOe//hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2/+HOe//q3aX/+fXj/////v//
-////////////////////+PTg/9i9Uf/HoQb/x6IJ/8iiCf/Iogj/yKIH/8iiB//HoQf/x6EG/8eh
-Bv/HoQb/x6EF/8ihBf/HoQX/xqEE/8agBP/GoAT/xqAD/8agA//GoAL/xqAD/8afAv/GnwL/xp8C
-/8afAv/GnwH/xZ8B/8WgAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0A/8+vMv/y6cX/////////////
-///////////////17dD/1rpN/8SeAv/FngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP7EnwCpxJ8AF8Sf
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAB8/gAAyaELAMmkDBDHoQiZxZ8C/cWfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8SeBP/QsDP/6NiZ
-//z68P/////////////////////////////////+/fv/+fTj/+/kuP/j0YL/2sJd/9W6R//VuUP/
-2b9U/+DMdf/t4a//+PPf//79+v////////////////////////////7++//x6ML/17xP/8agDP/E
-nQD/xJ4A/8SeAP/EngD/xJ4A/8WeAf/HoQv/zq0n/9rAWf/hzXn/4c57/+HNef/hzXn/4c15/+HN
-ef/hzXn/4c15/+HNeP/gzHf/5taR//fx2/////7///////////////////////Tszf/Sszj/xZ4B
-/8egBP/HoAT/x58E/8egA//GoAP/xaAD/8agAv/GoAL/xp8C/8afAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/EnQD/y6gd/+7jtP////7///////////////////////Xt0P/Ut0X/xJ0C/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD2xJ8AecSjAAXDngAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDnwAAwKEAAsSfAGXFnwHwxZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/xqEM/9i+V//w5r3//fz3////////////////////////
-/////////////v/+/fr//Pv0//r36v/59uf//Prx//79+P////7/////////////////////////
-////////+fbl/+TSiP/LqiP/xJ0B/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/xJ4A
-/8eiDP/Ttj7/38lx/+HOfP/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+bVjv/28Nn/
-//7+///////////////////////t4rL/yqge/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/IoxH/59eV//7++///////////////////////
-9e3R/9S2Qv/EnQH/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A5sCYAEbJ
-pQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADC
-mwAAyKMML8SfANLFnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8Od
-AP/KqR7/38p0//Psy//+/fr/////////////////////////////////////////////////////
-//////////////////////////////////38+P/v5br/171S/8agCP/EnQD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WeAP/FnwT/z68u/93Ha//hznv/4c15/+HNef/h
-zXn/4c15/+HNef/hzXn/4c15/+DMdv/m1Y//9/Ld///////////////////////+/fn/4tCC/8Wf
-B//FngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ4A/8WeBf/e
-yHD//Pry///////////////////////38dr/1blK/8SdAf/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FngD/xJ4D/9CyPbf49OQe+PTjAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAL6WAAC+lgAMxp8EnMSeAP3FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/xZ4D/86uLP/hzXv/9O3P//389///////
-///////////////////////////////////////////////////////////+/fn/9e7S/9/JcP/L
-qB3/xJ0B/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8Se
-AP/EnQD/xJ0B/86tJv/ex2r/4s57/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzHb/6NeW
-//r36///////////////////////+fbm/9W6S//EnQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9O2Qv/38dv///////////////////////r25//awV3/xJ4E
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/IpBL/3sdr//bv1vb+/ft6
-////Bv7+/gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA18FVAEcAAADKpxxZ
-yaUX68ikE//FnwX/xJ0A/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ8A/8SdAP/FngT/zKoh/93Hbf/u47T/+PPf//38+P//////////////////////////////
-////////+/nv//Pqx//gzHr/zasl/8SeA//EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WeAP/EnQD/xqEK/8qnHf/Kpxz/xqEK/8ScAf/NrCb/3sht/+HOe//hzXn/
-4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2/+vfqf/9+/X//////////////////////+/kuP/L
-pxv/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/yqcb/+/luf//////
-/////////////////fv0/+DLdv/Fnwb/xZ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/w50B/86uLf/q3KL//Prz///////////b////PP///wD///8AAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAD///8A9/PhAPr47SDv5bq/7eCu/+3grP/l0on/1blI/8eiDv/EnQD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8SdAP/IpBH/0rQ8
-/97Ibv/o2Zn/7+W3//Pryf/z7Mv/8urG/+3isP/l04v/2MBZ/8upIf/FngP/xJ4A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8ehC//Wu03/59eV//DmvP/w
-5rv/6dma/9nAW//Jphj/z68s/9/LdP/hzXv/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HO
-fP/x6cP//v79//////////////////379f/fyXP/xZ4D/8WfAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwX/4c6A//79+v////////////////////7/6duh/8ikEv/EngD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/0rU///Hpw/////7/////////////////////
-ov7//w7+/v8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD+/v4A/f39BP7//3b////5////
-/////////v3/+fXk/+rco//Tt0L/xp8H/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/xJ0A/8SdAf/HoQr/yaYa/8upJP/LqSb/yqgj/8ilFv/F
-nwb/xJ0A/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8We
-AP/EnQL/zasl/+bVkf/69uf////+//////////////////v57v/t4bD/1bdD/9S2Pv/gzHf/4c16
-/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+DMdv/l1Iv/+PPh///////////////////////07M3/
-zq4r/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8ScAP/Tt0L/9/Pe////////////////
-///////y6sf/zq0t/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8WeA//Wukr/
-9O3P/////////////////////////////v387vLr5VX///8ALAwAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAD+/v4A/v7+Lf///9j//////////////////////////////v/59eP/49CD/8upIP/E
-nQH/xZ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Wf
-AP/FngD/xJ4A/8SdAP/EnQD/xJ0A/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8ehC//Yvlb/8+vJ//7++///////////////////////
-//////////////7/9/Ld/93GaP/ZwFf/4c16/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+HNef/g
-zHb/69+n//389////////////////////v3/49CF/8WfBv/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xJ4A/8mlFv/s4Kz///////////////////////r36f/Yvlb/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/xJ0A/9W5Sf/28dr////////////////////////////49PD/07yk/6Jx
-QryERQMchUcFAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP///wD///8H/v7+jP////z/////////////
-/////////////////////////v36//Dlu//Zvlf/x6IL/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WeAP/EnQD/zqwp/+bVkf/6
-9+n///////////////////////////////////////////////////////n25v/hzHr/3cZo/+HN
-ev/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXj/4s9///Xu0v//////////////////////9vHZ
-/8+vLf/EnQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0B/9vDYf/8+vL//////////////////v78/+bV
-kf/HoQz/xZ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/0rU+//Ttz///////////
-/////////////////+/n3v+5lXH/jFEW/4NEBPSGRwhugUoAAoVIBQAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////
-AP7+/gD+/v48////3P/////////////////////////////////////////////////////69+r/
-6dqc/9GyN//Fnwb/xJ0A/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xJ0A/8ahDP/YvlX/8unG//7+/P//////////////////////////////////////////
-///////////////////////38tz/4c16/9/Lc//hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXn/
-4Mx2/+rbnv/8+vL//////////////////v77/+PQhf/FngT/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/y6kd
-//Lpxv//////////////////////9O3P/82sKP/EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8SdAP/Oriz/8ejC//////////////////////////7/6d7S/6h8Tv+FRwn/hEUF/4ZICP+G
-SAjDhUgHIoVICACJSwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////AP///wr///+S//////38+//9/Pv////+////////
-//////////////////////////////////////7+//jz4P/j0Yf/z7Ax/8WfB//EnQD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/Fngb/0LAw/+jYmf/7+Ov/////////////////
-////////////////////////////////////////////////////////////////9O3O/+DMd//g
-zHf/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HOfP/z68v///////////////////////Xu
-0f/OrSz/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngL/4Mt3//79+f/////////////////9+/T/3MVm/8SdAv/F
-nwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8mlF//r3qb////+///////////////////+
-/v/j1cX/n288/4REA/+FRwf/hkgI/4ZICP+GSAj5hkgHbodJBAKGSAcAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADy8+wA7d7TAPLt
-5Tvl2cvd0ruj/8Kigf/AoH7/zLKX/9zKt//v597//Pv6////////////////////////////////
-//////////3/9e/U/+PQhP/QsDP/xqAG/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/xJ0B/8yqIv/g
-y3f/9e7S/////v/////////////////////////////////8+/n/7uXc/9zLuf/Vv6j/4tPE//r3
-9P///////////////////////v77/+/ktv/hznr/4c14/+HNef/hzXn/4c15/+HNef/hzXn/4c15
-/+DLdf/p2p3//Prx//////////////////38+P/fynP/xZ4B/8WfAP/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/Nqyf/8+vJ////
-///////////////////t4a//yaYY/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8F
-/+HOfP/9/Pb//////////////////////+fbzv+gcD7/g0QD/4ZHB/+GSAj/hkgI/4ZICP+GSAj/
-hkgIyYZHBx+GSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAACSXCMAiE4RBplmMYqYYyz+iEwP/4VGBf+FRgX/hkgK/45UGv+cajb/
-t5Fr/9nGsv/17+n//v79//////////////////////////////////79+v/38Nj/59aU/9S3RP/I
-pBL/xJ0D/8SdAP/EngD/xZ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8We
-AP/EnQD/xJwA/8WeBf/MqyT/3shu//Lqx//9+/X/////////////////////////////////+fXy
-/9vJtf+1kGn/m2k0/49WHP+KThL/kloi/7aRaf/u5dr///////////////////////z68f/p257/
-4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+HNeP/iz3//9e7S///////////////////////w
-5r3/yqge/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8A/8WeAv/fynT//fz3//////////////////r36v/XvVb/w5wA/8WfAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/DnQD/1blI//n15f//////////////////////8Ojg/6d5S/+E
-RQX/hkgH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI9oVICGhMtQAAkTcMAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACERgUAhkYIKoRGBdqE
-RQT/hUYG/4VHB/+FRwf/hUYG/4RGBf+ERQT/hEUF/4tPE/+jdEP/y7GV/+/n3v/9/Pv/////////
-/////////////////////////v78//v47P/v5br/4Mp0/9O1Pf/Kpx7/xqEL/8SdAP/DnQD/xJ0A
-/8SdAP/EnQD/xJ0A/8SdAP/EnAD/xJ0A/8agCf/LqB//1bhH/+TRhv/17tD//fz3////////////
-//////////////////////r49f/dy7n/rIJX/4xRFf+ERQX/hEUE/4RGBf+FRgb/hEUE/4REBP+s
-gVX/8eri///////////////////////17tP/49CA/+HMd//hzXn/4c15/+HNef/hzXn/4c15/+HN
-ef/gzHb/6t2k//389//////////////////8+vH/2L5U/8OdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0A/82sJv/z68n/////////////
-///////+/+vdpP/Hog//xJ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/LqR//8OW7////
-///////////////////28u3/tY9p/4VGBv+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4VIB72HRgcah0YHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAJswAACiKQABhkgHeYZICPmGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4VHBv+DRAT/h0kL/6FwQP/Ns5j/8uvk////////////////////////////////////////////
-//7+//n14v/w5r3/6NiY/97Jcf/Yvlb/07ZC/9CxNP/QsTT/0LAz/9K1Pv/XvVL/3cdr/+bWk//x
-58D/+vfr///////////////////////////////////////+/v7/6t/U/7qYdP+QWB7/g0MD/4VG
-Bv+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHBv+GSAr/waKB//z7+v/////////////////9/Pb/6t2j
-/+HMdv/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzHj/49CD//jy3v//////////////////////
-6duf/8agCv/FnwD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xJ0C/93Ha//+/fn/////////////////+vfq/9W4Rv/EnQD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ4A/8WfBf/hzHr//fz3//////////////////z7+f/IrI//iEwQ/4VGBv+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICO2GRwhbhk8AAIZDDQAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIVGBwCFRgcdhkcIwoZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4NDA/+KTRH/pHRF/9C4oP/0
-7ef//v39//////////////////////////////////////////////////79+//7+O7/+PTh//fx
-2f/38dn/9/HZ//jz3//7+Ov//v35////////////////////////////////////////////////
-//Xw6//NtJr/nGk2/4RGBv+ERQX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/
-k1wl/+fbzv//////////////////////9vDV/+LQf//hzHj/4c15/+HNef/hzXn/4c15/+HNef/h
-zXn/4Mx3/+7jtP///v7/////////////////+PTh/8+vLP/EnQD/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/yaUW//Howf//////////////////////
-7N+r/8eiDv/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/9GyN//28Nf/////////////
-/////////+HSwv+UXib/hEUE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAijhUUIEYVGCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAikMIAINLBwCFSAdbhkgI74ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+FRgb/g0QC/4lMD/+icUD/y6+U/+7m3P/9/Pr/////////////////////
-////////////////////////////////////////////////////////////////////////////
-///////////////////////+/v/28Ov/2say/6l9UP+JTA//g0QD/4VHB/+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUG/7uYdP/8+/r//////////////////fz3/+rc
-oP/gzHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2/+bWkf/69+r//////////////////v34
-/9/Jcv/EnQL/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/D
-nQD/2L5V//z68v/////////////////7+e//2L1S/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xqAK/+fXlv//////////////////////9fDq/6l9Uf+DRAT/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjihUgIO4ZGBwCESgoAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkYIAIVFCA+GRwihhkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZHB/+ERAT/
-h0kL/59uPP/Ep4f/59rO//z7+f//////////////////////////////////////////////////
-///////////////////////////////////////////////+/v3/8Ojf/9O8pP+sglf/jVMX/4NE
-BP+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE
-/5VfKP/k18j///////////////////////TszP/iznz/4c14/+HNef/hzXn/4c15/+HNef/hzXn/
-4c14/+LOfP/z68v//////////////////////+/jtf/JpBH/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WeAP/HoQv/692l///////////////////////u47X/yqYZ
-/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/1LdD//r25//////////////////+/v7/
-zLKX/4dLDf+FRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj9hUgIgINHBwWFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACBQgYA
-hkgIAIVGBzKGSAjZhkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4NEA/+GSAr/l2Eq/7WQaP/Xwq3/7ePZ//fy
-7v/7+ff//v38//////////////////////////////////////////////////38+//6+PX/8uvk
-/9zKt/+8mXb/n248/4pPE/+DRAT/hEUF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4RFBv+9m3j/+/n3//////////////////v47P/n
-15T/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+DMdv/r36j//fz3//////////////////jz
-3v/StD3/xJwA/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8ScAP/Sszz/
-+PPe//////////////////379P/dxmn/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/H
-oQ3/6duh/////v/////////////////r4NX/nGk1/4NEA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcIxoZGBhmFRwgAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACFRwgAg0YIAoZHCG6GSAj6hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+FRwf/hEQD/4REBP+ITA7/lF0k/6V3SP+1j2j/yKuN/9rHs//k1sj/59vO/+rf0//q39P/
-6t/T/+fbzv/h0sP/1sGr/8Slhv+wiF//nGk1/4tPEv+ERQX/g0QC/4VGBv+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4NE
-BP+YYy7/6d3R/////////////////////v/w5bv/4cx4/+HNeP/hzXn/4c15/+HNef/hzXn/4c15
-/+DMdv/l04n/+fXk//////////////////79+v/fynb/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8A/8WeA//izXz//v37//////////////////Tszf/NrCf/xJ0A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/UuEb/+fXj//////////////////z6+f/An37/hUYH
-/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI8YZIB0+GSAkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAgAiEcH
-DYZICLOGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAf/hUYG/4NEBP+C
-QwP/hkgI/4pPEf+NUxb/k1si/5ZhKv+WYSr/lmEq/5JbIv+MUhX/iU0O/4VHB/+DQgT/hEUF/4ZH
-B/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZIB/+GSAf/xqqM//39/P/////////////////38t3/
-5NKF/+HMd//hzXn/4c15/+HNef/hzXn/4c15/+HNeP/hzXr/8urI/////v/////////////////t
-4a//yaQW/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8qnHf/w5bv/////
-/////////////v78/+XUjv/FngX/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8ahCv/m1pP/
-/////////////////////+fazP+XYCr/g0QE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/YZIB5V/Rg4Ef0YOAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAACERwgAh0cINIZICOeGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4VGBf+ERgX/hEUE/4REBP+ERAT/hEQE
-/4RFBP+FRgX/hUYG/4ZIB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+D
-RAP/onJB//Tu6P/////////////////9/Pb/6tyh/+DMdv/hzXn/4c15/+HNef/hzXn/4c15/+HN
-ef/gzHb/692k//79+f/////////////////38tz/0bI2/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xJ0A/9W5Rv/7+O3/////////////////+/nt/9S3Q//EnQD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/xJ0A/9GyNf/38dr//////////////////Pv6/7+efP+ERQb/hkcH/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4VHCMqFRwkjhUcJAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAHc1AABoIAAAhkcHcIZI
-CPiGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwf/ik4T/9vJtv//////////////////////8ejC
-/+HNeP/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXj/5NKH//r36f/////////////////+/vz/
-3cZp/8SdAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ4H/+XTi///////////////
-////////7+W5/8mkEf/EngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4E/+LOff////7/////
-////////////7OLY/5hjLP+ERQX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICOqFRwhRh0oJAHw5AAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAIZHBACGRwQNhkcHq4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hEUF/7qXcf/9/fv/////////////////+fXl/+PRhf/hzXj/4c15/+HNef/hzXn/4c15/+HNef/h
-zXn/4c16//Pryv//////////////////////6t2l/8agC//FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/EngD/y6gc//Psy//////////////////+/fv/38py/8SeA//FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/EngD/yqcb//PryP//////////////////////x6qN/4VHCf+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+FRwiGfkYGA4NHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIVIBwCFSActhkgI1IZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/g0QD/51rN//u5dz//////////////////fz4/+rc
-of/gzHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2/+zgrP/+/vz/////////////////9vDY
-/82rJP/EngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/1bhH//v57//////////////////4
-9OH/0bM4/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnAD/2L5W//z68v//////////////
-///y7OX/onND/4NDA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAi4hkcHG4ZHBwAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAmGQAAIRFCACFSAdXhkgI7YZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEYF
-/4tQFv/Xwq3////////////////////+//LpxP/hzXn/4c14/+HNef/hzXn/4c15/+HNef/hzXn/
-4cx2/+bWkf/69+v//////////////////Pry/9e8UP/EnQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FngH/5NKJ//7+/P/////////////////t4a7/yaUV/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8WeAP/GoQj/6tyi///////////////////////WwKr/i1AV/4VGBf+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAjhh0cIOINLCACTPQgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAhkoHAIZPBQSGSAiGhkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkcH/4RFBf+9mnf//Pv5//////////////////j04f/k
-0YX/4cx3/+HNef/hzXn/4c15/+HNef/hzXn/4cx3/+LQgP/179X//////////////////v77/+PR
-hf/FngH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/Kphf/8Oe///////////////////7++//hzXn/
-xZ4B/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/PrzH/9vDX//////////////////n28/+0
-jmb/hEQD/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj4hUgHYYNEAAGFSAcAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAhUgHAIVIBxeGSAixhkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ND
-Av+ickL/8enh//////////////////z68f/p2pv/4Mx1/+HNef/hzXn/4c15/+HNef/hzXn/4c15
-/+HNeP/w5rz///////////////////////Dlu//IpBH/xJ4A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8OcAP/T
-tkL/+PTh//////////////////n04v/Ut0T/xJwA/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Sd
-AP/dxmz//fv2/////////////////+rf0/+XYSz/g0QE/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgIj4ZHBweGRwgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACeQgAAgkgJAIdHBy2GSAjShkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RGBf+OVRn/4NC///////////////////7+/f/v5bj/
-4c13/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+DMdf/q26D//Prz//////////////////fx2//Q
-sTb/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/fyXH//fz4//////////////////Hnwf/Kpxn/xJ4A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8eiEP/r3aP//////////////////v7+/862nP+HSgv/
-hUcH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkcIwYpFBxGFRwgAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACISQUA
-g0UKAIZHB0mGSAjvhkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZIB/+F
-Rwf/xaeJ//38+//////////////////179P/4s+A/+HMd//hzXn/4c15/+HNef/hzXn/4c15/+DM
-dv/l04r/+fbm//////////////////z58P/awV7/w5wA/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8ehDf/p25//
-//////////////////79/+XVj//FngH/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/86uLP/1
-79T/////////////////+vf0/6yCV/+DRAT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkcI
-5YVHCCiGRwcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAcAh0cFAoZICG2GSAj+hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+DQwP/q4BV//n28v/////////////////69+n/5taQ
-/+HMdv/hzXn/4c15/+HNef/hzXn/4c15/+HMeP/iznz/9O7R///////////////////////l0on/
-xZ8G/8WeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xJ0A/8yqJv/z7Mv//////////////////Pvz/9i+VP/EnQD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/9nBWv/9/Pj/////////////////7OPY/5ReJf+FRgX/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI84ZICFGFSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACFRwgAhEcH
-CIVICJaGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRgb/
-lF4l/+3k2v/////////////////+/vv/696m/+DLdv/hzXn/4c15/+HNef/hzXn/4c15/+HNef/g
-zHX/7+S1//7+/P/////////////////u4rL/yaUX/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9W5SP/7+e//////
-////////////+PPf/8+tKf/EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8J/+jZmf//////
-////////////////zrWa/4dKDP+GSAf/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI+oZI
-CHqGSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAACFSAcAhUgHDoVIB7yGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAf/iUwO/9fCrP//////////////////////8efA/+HN
-eP/hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHb/6Nqb//38+P/////////////////38dr/z7Av
-/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xJ0E/+DMd//+/vz/////////////////7+O0/8ijEP/FngD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/EngD/yqca//Pryf/////////////////8+vj/tI1m/4NDBP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/oZICJmSSAsFkUgLAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAcAhkUIHoZH
-B9WGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUF
-/7yad//+/v7/////////////////9/Pe/+LPf//hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHj/
-5NOI//r36//////////////////9/Pf/2L5R/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/xqEK/+ncov//////////////
-////////5NGG/8SeBv/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/07U+//v47P//////////
-///////v597/nGk3/4REA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZHB7iG
-SQcThkkHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAACGSAcAhkYIOIZHCOeGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/g0QC/6d5Sv/28ev/////////////////+/rx/+bWkf/g
-zHb/4c15/+HNef/hzXn/4c15/+HNef/hzXj/4s59//Xu0f//////////////////////49CD/8Se
-Bf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/EngD/y6gb//Tt0P/////////////////9/Pb/171S/8SdAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/EnQD/38pz//79+P/////////////////ax7P/jVMZ/4RGBf+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZHCM2GSAgihkgIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACGSAkAhkgHUIZICPOG
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/5Re
-Kf/m2sz//////////////////v35/+vepv/gzHX/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4cx3
-//Dmu/////7/////////////////7OCs/8ehDf/FnwD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/0bM4//v47f/////////////////3
-8tv/z7Av/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/GoAf/696p////////////////////
-///GqYv/hkcH/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICNuFRwc3
-hUcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAACHSQkAhUgHZYZICPaGSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUYG/4tPE//Vv6n///////////////////79//HnwP/hzXn/
-4c15/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+vcpP/9/Pn/////////////////9e/U/8yqIf/E
-nQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/DnAD/28Nj//389v/////////////////u47X/yaUZ/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8SdAP/MqiP/8+zM//////////////////fz7/+wh13/g0QC/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICOeGRwhLhkcIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALVVAAD/bAAAhkcIfIZICPqGSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgH/4RGBf/A
-oH7//v79//////////////////bx2v/iz3//4c14/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+bV
-kP/7+O3/////////////////+/nv/9O2QP/DnQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngL/5tWS///+/f/////////////////n15T/
-xqAJ/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8OcAP/UuEf/+fXk/////////////////+zj2f+b
-ZzX/g0MD/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPKFRwhdhUcI
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAJRUAACVVQADhkgHkYZICP2GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4NDAv+rgFP/9fDq//////////////////r36f/m1Y7/4Mx2
-/+HNef/hzXn/4c15/+HNef/hzXn/4cx3/+PRg//28dn//////////////////fz3/93FaP/EnQD/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/I
-oxD/7uKz//////////////////389//eyG7/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Sd
-AP/eyG3//fz2/////////////////97Nu/+NUxf/hUYF/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICPyGRwdvgkkIAP8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI5QDACOUAwHh0kJpIdJCf+HSAn/h0gJ
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4NDA/+ZZDD/
-6+HX//////////////////379P/q26D/4Mt0/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HNe//y
-6sj////////////////////+/+fXlf/FngH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/Mqyb/9O3P//////////////////r36P/Vuk3/w5wA
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8WfB//m1pL//////////////////v79/8qwk/+FRgb/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FSAeAaBMAAIZJ
-CAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAItLDgCLSw4LiEsMtYhKDP+ISgv/h0kL/4dJCv+HSQn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4RFBf+NUxf/3s26//////////////////7+/P/v5Lf/4cx3/+HN
-ef/hzXn/4c15/+HNef/hzXn/4c15/+DMd//u4rT//v37/////////////////+/luf/IpBH/xJ4A
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8ScAP/StUD/
-+PTg//////////////////bw1v/PrzD/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8mlGP/u
-47T/////////////////+/n3/7SOZ/+DRAT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GRweMh0UKBYZGCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAItMEwCLTBMNiU0PwolMDv+JSw3/iUsN/4hL
-DP+ISgv/iEoL/4dJCv+HSQr/h0gJ/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZIB/+FRgf/ya6T
-//7+/f/////////////////z7Mv/4s57/+HMeP/hzXn/4c15/+HNef/hzXn/4c15/+DMdf/p257/
-/Pry//////////////////Xu0//Ori3/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/bw1///Prx//////////////////Howf/JpRP/xJ4A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/86tK//179T/////////////////9/Pv/6JyQf+DRAP/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FSAiahUgHDIVICAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AIpPEwCKTxMTi08RxYpOEP+KTRD/ik0P/4lMD/+JTA7/iUwN/4lLDf+ISwz/iEoM/4hKC/+HSQr/
-h0kJ/4dICf+GSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+CQwT/tI5n//v59//////////////////38tv/5NGF/+HMd//h
-zXn/4c15/+HNef/hzXn/4c15/+DMdf/m1Y//+vfq//////////////////r25v/VuUv/w5wA/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SeAP/iz37/////
-/////////////////+rco//GoAT/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/9W4Rf/7+e7/
-////////////////7OHW/5VeJf+ERQT/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+FSAihhUYGD4VHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAIxPEwCMTxMgjFATzotQE/+LTxL/i08S/4pOEf+K
-ThH/ik0Q/4pND/+JTA//iUwO/4lLDf+ISw3/iEsM/4hKC/+HSgv/h0kK/4dICf+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/oHA9//fz
-7//////////////////7+e7/59aT/+HMdv/hzXn/4c15/+HNef/hzXn/4c15/+HNeP/j0IH/9/Hb
-//////////////////389v/ex2z/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ4A/8ehDP/p2p3//////////////////v36/+HNe//EngD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/xJ0B/93GaP/+/fr/////////////////28i0/4tPE/+FRwb/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FSAikhEcHEIRHBwAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAItR
-EwCLURMhjVEUzo1RFP+MURT/jFEU/4xQE/+MTxP/jE8S/4tPEv+LThH/i04Q/4pNEP+KTQ//ikwP
-/4lMDv+JTA3/iUsM/4hKDP+ISgv/h0oL/4dJCv+HSQn/hkgJ/4dICf+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+FRgX/klsh/+vh1v/////////////////+/vv/6t2j/+DMd//hzXn/
-4c15/+HNef/hzXn/4c15/+HNef/hzXj/8+rI///////////////////////m1ZH/xZ8H/8WeAP/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8qmG//v5Lj/////////
-/////////fv1/9nAW//EnAD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4G/+TSiv//////////
-////////////y7CV/4VGCv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAiyhkcHF4ZHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI1TFgCNUxYhjlMWzo5TFv+NUhX/jVIV/41SFf+NURT/
-jFEU/4xQE/+MUBP/jFAT/4tPEv+LThH/i04R/4pNEP+KTQ//ik0P/4lMDv+JTA7/iUsN/4hLDP+I
-Sgv/iEoL/4dJCv+HSQn/h0gJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwb/ik4R/9fCrP//
-////////////////////7+W4/+HNd//hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHb/7uKx//7+
-+//////////////////t4a7/yaQV/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xJ0A/82rKf/17tD/////////////////+/js/9O2P//DnQD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/FngD/x6IM/+veqP/////////////////9/fz/updy/4RFBv+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwi2hkYGGYZGBwAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI5UGACO
-VBghj1UZzo9VGP+OVBf/jlQX/45TFv+OUxb/jVIV/41SFf+NURT/jVEU/4xQE/+MUBP/jFAT/4tP
-Ev+LTxL/i04R/4tOEP+KTRD/ik0P/4lMDv+JTA7/iUsN/4lLDf+ISwz/iEoL/4hKC/+HSQr/h0kK
-/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hEUI/8Slh///////////////////////9O3P/+HNev/hzXn/4c15
-/+HNef/hzXn/4c15/+HNef/gzHb/6Nqb//38+P/////////////////07tD/zKwp/8SdAP/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9K0Of/59OL/////////////
-////9/Ha/86tJ//EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/y6gY//Pryf//////////////
-///69/T/qHxN/4RFA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GRwi2hkYGGYZGBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAJBWGwCQVhshkFYbzpBWGv+QVhr/j1UZ/49VGf+PVBj/jlQX
-/45UF/+OUxb/jlMW/41SFf+NUhT/jFEU/4xRFP+MUBT/jFAT/4tPEv+LTxL/i04S/4pOEf+LThD/
-ik0Q/4pND/+JTA7/iUwO/4lLDf+ISwz/iEoM/4hKC/+HSQv/h0kK/4dJCf+GSAn/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/g0QE/7OMZP/7+vj/
-////////////////+PTg/+TRg//hzXj/4c15/+HNef/hzXn/4c15/+HNef/gzHb/5tWO//v57v//
-///////////////69un/0rQ9/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xJ0A/9i9Uv/8+vL/////////////////8urG/8mlE//FngD/xZ8A/8WfAP/FnwD/xZ8A
-/8WfAP/EnQD/zq0o//n25v/////////////////x6uP/nWw4/4RFA/+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GRwiwhUcHFoZHBwAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJFYHQCRWB0g
-kVgdzpFYHP+RVxz/kFcb/5BXG/+QVhr/j1UZ/49VGf+PVRj/jlQY/45UF/+OUxb/jlMW/41SFf+N
-UhX/jVEU/41RFP+MURT/jFAU/4xQE/+LTxL/i08S/4tOEf+KThD/ik0Q/4pND/+JTA//iUwO/4lM
-Df+JSw3/iEsM/4hKC/+HSgv/h0kK/4dJCf+HSAn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/g0QD/6FxQf/07+n//////////////////Pnw/+bVj//gzHb/4c15/+HN
-ef/hzXn/4c15/+HNef/hzXj/49CC//fy3f/////////////////9/Pf/28Je/8SdAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xJwC/93Gaf/+/vz/////////////////
-7OCv/8agDP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/1LdC//z68f/////////////////l
-2Mn/lV8m/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+FSAiihkcHD4ZHBwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAJBaHwCQWh8TklogxpJaH/+SWR7/klke/5FYHf+RWBz/kVcc/5BX
-G/+QVxv/kFYa/49WGf+PVRn/j1UY/45UF/+OVBf/jlMW/45TFv+NUhX/jVIV/41RFP+NURT/jFAT
-/4xQE/+MUBP/i1AS/4tPEv+LThH/ik4R/4pNEP+KTQ//ik0P/4lMDv+JSw7/iUsN/4hLDP+ISwz/
-iEoL/4dJCv+HSQr/h0gJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hEUE/5RdKP/n2s3/////
-/////////////fz4/+nbn//gzHX/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4c15//PszP//////
-////////////////4s+B/8SdBf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xJ4F/+LPgv//////////////////////5tWQ/8WfB//FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Wf
-AP/EnQD/2sNh//389v/////////////////Zx7L/jVMY/4VGBf+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FSAihhkcGD4VHBwAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJVbIQCVWyENlFsi
-wZRcIf+TWyH/k1og/5NaIP+SWh//klkf/5JZHv+RWB3/kVcc/5FXHP+RVxv/kFcb/5BWGv+PVhn/
-j1UZ/49VGP+PVBf/jlQW/45TFv+OUxb/jVIV/41SFf+NUhX/jVEU/4xRFP+MUBP/jFAT/4xPEv+L
-TxL/i04R/4tOEf+KTRD/ik0P/4pND/+JTA7/iUsN/4lLDf+JSwz/iEoM/4hKC/+ISQr/h0kK/4dI
-Cf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hUYF/4xSF//YxbD//////////////////v78/+7jtP/gzHf/4c15/+HNef/h
-zXn/4c15/+HNef/hzXn/4cx3/+/kuf////7/////////////////6dug/8agCv/FnwD/xZ8B/8Wf
-Af/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/xqEJ/+janP//////////////////////4Mp1
-/8SeA//FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/DnAD/4c5///7++v/////////////////Pt53/
-h0oN/4VGBv+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+FSAiahUgHDIVICAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAJReJwCUXicLlV0ks5VdJP+VXSP/lFwj/5RcIv+UWyL/k1sh/5NbIP+T
-Wh//klof/5JZHv+SWR7/kVgd/5FYHP+RVxz/kFcb/5BWGv+QVhr/j1YZ/49VGf+PVRj/jlQX/45U
-F/+OUxb/jlMW/41SFf+NUhX/jVEU/41RFP+NURT/jFAT/4xQE/+LTxL/i04R/4tOEf+LThD/ik0Q
-/4pND/+KTA//iUwO/4lMDf+JSw3/iEsM/4hKC/+ISgv/h0kK/4dJCv+HSAn/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcH/4ZICP/JrZH/////////
-//////////////LryP/hzXj/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+vdpf/+/vv/////
-////////////8unF/8qmFf/FngD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/
-yKMN/+/ktv////////////////////7/2sFb/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/E
-ngH/59eX/////v////////////79/f/Epob/hUcH/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+FRweMg0IIBYRFCAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAI9hIQCPYSEHlV4mo5Vf
-Jv+VXiX/lV4l/5VdJP+UXST/lFwj/5RcI/+TWyL/k1sh/5NbIf+TWiD/klof/5JZH/+RWR7/kVgd
-/5FYHf+RVxz/kFcc/5BWG/+QVhr/j1YZ/49VGf+PVRj/jlQY/45UF/+OUxb/jlMW/41SFf+NUhX/
-jVEU/4xRFP+MURT/jFAT/4xQE/+LTxP/i08S/4tOEf+KThH/ik0Q/4pNEP+JTA//iUwO/4lMDv+J
-Sw3/iEsM/4hKDP+ISgv/h0kK/4dJCv+HSQn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkcH/4RFA/+6lnD/+/n2//////////////////fx2f/iz3//4c14/+HNef/hzXn/
-4c15/+HNef/hzXn/4cx2/+fXlv/8+vL/////////////////+fbm/86tJ//EngD/xZ8B/8WfAf/F
-nwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwD/yaYU//Xu0f/////////////////8+vD/1rpH/8Sd
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SeAP/Howz/7OCr//////////////////r49f+4lG3/g0UD
-/4ZIB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-Rwd+cDkAAIhJCQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAJhmGQCZZhgCl2ApjpZgKP2WYCj/ll8n/5ZfJ/+VXyb/lV4m/5VeJf+VXST/
-lFwj/5RcI/+UXCL/k1si/5NbIf+TWiD/klog/5JaH/+SWR//klke/5FYHf+RWBz/kFcc/5BXG/+Q
-Vhv/kFYa/49VGf+PVRj/j1UY/45UF/+OVBf/jlMW/45TFv+NUhX/jVIV/41SFf+NURT/jFAT/4xQ
-E/+MUBP/i08S/4tPEv+LThH/ik4R/4pNEP+KTQ//iUwP/4lMDv+JSw3/iEsN/4hLDP+ISgv/iEoL
-/4dJCv+HSAn/h0gJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4NDAv+pfE//9O7o////////
-//////////r25v/m1Iv/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4cx3/+XTiv/49OL/////////
-/////////Prx/9W4Rv/EnQD/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EngD/zq0n
-//n04//////////////////38tz/0bI0/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/Kpxv/
-8ejC//////////////////fy7v+tglj/gkIB/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPuGRwdthkcHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALFPAADYKwAAl2IqfJhiK/qX
-Yiv/l2Eq/5dhKf+XYCn/lmAo/5ZfJ/+VXyb/lV8m/5VeJf+VXiX/lV0k/5RcI/+UXCP/lFwi/5Rb
-If+TWyH/k1og/5NaIP+SWh//klkf/5JZHv+RWB3/kVgd/5FXHP+QVxv/kFYb/5BWGv+PVRn/j1UZ
-/49VGP+OVBf/jlMW/45TFv+OUxb/jVIV/41SFf+NUhX/jVEU/4xQFP+MUBP/jFAT/4tPEv+LTxL/
-i04R/4pOEf+KTRD/ik0P/4pMDv+JTA7/iUsN/4lLDf+ISwz/iEoM/4hKC/+HSQr/h0kK/4dICf+G
-SAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4NDA/+baDb/7eTZ//////////////////z57//o2Jf/4Mt1/+HNef/hzXn/4c15
-/+HNef/hzXn/4cx3/+LPf//279T//////////////////fz3/93Fav/DnAD/xZ8B/8WfAf/FnwH/
-xZ8B/8WfAf/FnwH/xZ8B/8WfAf/EnQD/1LdD//v57v/////////////////z68j/zKsk/8SdAP/F
-nwD/xZ8A/8WfAP/FnwD/xZ8A/8OdAP/NrCn/9e7S//////////////////Lr5P+idEb/gkIC/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICPGGRwhd
-hkcIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAACZZS8AmWMtZZlkLvaZZC3/mGMs/5hjLP+YYiv/l2Eq/5dhKv+XYSn/lmAp
-/5ZgKP+WYCf/ll8n/5VeJv+VXiX/lV4k/5VdJP+VXSP/lFwj/5RcIv+UWyH/k1sh/5NaIP+TWiD/
-klof/5JZHv+SWR7/kVgd/5FYHf+RVxz/kFcb/5BWGv+QVhn/j1UZ/49VGf+PVRj/jlQX/45UF/+O
-Uxb/jVIW/41SFf+NUhX/jVEU/41RFP+NURP/jFAT/4xQE/+MTxL/i08R/4tOEf+LThH/ik0Q/4pN
-D/+KTA//iUwO/4lLDf+JSw3/iEsM/4hKC/+ISgv/h0kK/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4RFBf+QWB7/4tPD////////////
-//////389//s36n/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HNev/z6sf/////////////
-/////v78/+TTi//EnQL/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/DnAD/2sFd//37
-9f/////////////////v5Lb/yaUZ/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/Rszv/+PPd
-/////////////////+vi1/+aZjH/g0QD/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICOaGRwhKhkcIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACbZTAAmmUwTpplMPKaZS//
-mmUu/5lkLv+ZZC3/mGMt/5ljLP+YYiz/l2Ir/5hiKv+XYSr/lmAp/5dgKP+WYCf/ll8n/5VfJv+W
-Xib/lV4l/5VdJP+VXST/lF0j/5RcIv+UXCL/lFsh/5NbIf+TWiD/k1of/5JZH/+SWR7/klgd/5FY
-Hf+RWBz/kFcc/5BXG/+QVhv/j1Ya/49VGf+PVRj/jlQY/49UF/+OUxb/jVMW/45TFv+NUhX/jVEU
-/41RFP+NURT/jFAT/4xQE/+MTxP/jE8S/4tPEv+LThH/ik4Q/4pND/+KTQ//ikwO/4lMDv+JSw3/
-iUsM/4hKDP+HSgv/iEkK/4dJCv+HSQn/hkgJ/4dICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZHB/+HSgv/1cCp///////////////////+/v/w5bv/4Mx3/+HNeP/hzXn/4c15/+HN
-ef/hzXn/4c14/+HMd//v5Lb//v78/////////////////+veqP/Hogv/xJ4A/8WfAf/FnwH/xZ8B
-/8WfAf/FnwH/xZ8B/8WfAf/DnAD/38t3//79+f/////////////////q3KH/x6IP/8SeAP/FnwD/
-xZ8A/8WfAP/FnwD/xZ8A/8SdAP/XvVD/+vfq/////////////////+TXyP+QWB3/hEYF/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICNqFRwg1hUcI
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAACaZzIAm2cwNZtnMeWbZzH/m2Yx/5pmMP+aZTD/mmUv/5plLv+ZZC7/mWQt/5hj
-LP+YYyz/mGIr/5hiKv+XYSr/l2Ep/5dhKf+WYCj/ll8n/5ZfJ/+VXyb/lV4m/5VeJf+VXST/lV0k
-/5RcI/+UXCL/k1si/5NbIf+TWyD/k1og/5JaH/+SWR7/klke/5FYHf+RWBz/kVcc/5BXHP+QVhv/
-kFYa/5BWGf+PVRn/j1UY/45UF/+OVBf/jlMW/45TFv+NUhX/jVIV/41SFf+NURT/jFAT/4xQE/+M
-UBP/i08T/4tPEv+LThH/i04R/4pNEP+KTQ//iUwP/4lMDv+JTA3/iUsN/4hLDP+ISgz/iEoL/4dJ
-Cv+HSQn/h0gJ/4ZICf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+ERQT/xqiJ//79/P//////////
-///////z68r/4c17/+HNeP/hzXn/4c15/+HNef/hzXn/4c15/+DLdf/r3aX//fz3////////////
-//////Lpxf/Kpx3/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8WfAf/FnwP/5dSO//7+/P//
-/////////////v/k0Yb/xp8E/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/dx2n//fz2////
-/////////////9zKt/+JTQ7/hUcH/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZHCM2GSAgihkgIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACbaTQAnGoyHZtpNNWcaDT/nGgz
-/5xoM/+bZzL/m2Yx/5tmMf+aZjD/mmUw/5plL/+ZZC7/mWQu/5lkLf+YYyz/mGIs/5hiK/+XYSr/
-l2Ep/5dhKf+WYCn/lmAo/5ZfJ/+WXyf/lV8m/5VeJf+VXiX/lV0k/5RcI/+UXCP/lFwi/5NbIf+T
-WyH/k1og/5JaH/+SWR//klke/5JZHv+RWB3/kVcc/5FXHP+QVxv/kFYb/5BWGv+PVRn/j1UZ/49V
-GP+OVBf/jlMX/45TFv+NUxb/jVIV/41SFf+NURT/jVEU/4xQE/+MUBP/jFAT/4tPEv+LTxL/i04R
-/4pOEP+KTRD/ik0P/4pND/+JTA7/iUsN/4hLDP+ISwz/iEoL/4hKC/+HSQr/h0gJ/4dICf+GSAj/
-hkgI/4ZICP+DRAT/s41l//v59v/////////////////28Nf/49CC/+HMd//hzXn/4c15/+HNef/h
-zXn/4c15/+DMdf/n2Jf/+/nv//////////////////bw1//OrzH/w50A/8WfAf/FnwH/xZ8B/8Wf
-Af/FnwH/xZ8B/8SeAP/Iow3/7OCt//////////////////79+f/eyG7/xJ0A/8WfAP/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8SeAP/j0IP////////////////////+/861nP+GSAj/hkcH/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4VHB7WDRwcSg0cHAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAACdajUAnWo1Dp1qNbydajX/nWo1/5xpNP+caTT/nGgz/5toM/+baDP/m2cy/5tnMf+b
-ZjH/mmUw/5plL/+ZZS//mWQu/5lkLf+ZYy3/mGMs/5hiK/+YYir/l2Eq/5dhKf+WYCn/lmAo/5Zg
-KP+WXyf/ll8m/5VeJv+VXiX/lV0k/5RdJP+UXSP/lFwj/5NbIv+UWyL/k1sh/5NaIP+TWh//klkf
-/5JZHv+SWR7/kVgd/5FYHP+RVxv/kFYb/5BWGv+QVhr/j1UZ/49VGP+OVBj/jlQX/45UF/+OUxb/
-jlMW/41SFf+NURT/jFEU/41RFP+MUBT/jFAT/4tPEv+LTxL/i04R/4pOEf+LThD/ik0Q/4pMD/+J
-TA//iUwO/4lLDf+JSwz/iEoM/4hKC/+HSQr/h0kK/4dJCf+DRAT/pHRE//j08f//////////////
-///59eX/5dOK/+HMd//hzXn/4c15/+HNef/hzXn/4c15/+DMd//l1Ir/+fbm////////////////
-//n25v/Vukr/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/Kphj/8unF////////////
-//////v57//Yv1n/w5wA/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8ehCv/p2Zv/////////////
-/////fv6/8CffP+FRgX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/oZHCJiMPwwFjEAMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACdbDcAnWw3CJ5sOJSebDf/nms3/51r
-Nv+dajX/nWo1/5xqNf+caTT/nGk0/5xoM/+baDP/nGcy/5tnMf+bZjH/mmYw/5pmMP+aZS//mWUu
-/5lkLv+ZZC3/mWMs/5hjLP+YYiv/mGIr/5dhKv+XYSn/l2Ao/5ZgKP+WYCf/lV8n/5VfJv+VXyb/
-lV4l/5VdJP+UXSP/lFwj/5RcIv+UWyL/k1si/5NbIf+TWyD/klof/5JZHv+SWR7/kVgd/5FYHP+R
-Vxz/kFcb/5BXG/+QVhr/j1YZ/49VGf+PVRj/j1QX/45UF/+OUxb/jVMW/41SFf+NUhX/jVEU/41R
-FP+MURT/jVAT/4xQE/+MTxL/i08S/4tOEf+KThD/ik0Q/4pND/+KTA//iUwP/4lMDv+JTA3/iEsM
-/4hLDP+FRgb/mmQv//Do4f/////////////////8+vL/59eV/+DMdv/hzXn/4c15/+HNef/hzXn/
-4c15/+HNeP/iz37/9/Hb//////////////////379f/cxGT/xJ0A/8WfAf/FnwH/xZ8B/8WfAf/F
-nwH/xZ8B/8SdAP/OrSr/9e7T//////////////////j04P/TtUD/xJ0A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xJ4A/8mmF//u47L/////////////////+vj2/7GJYf+DQwT/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI+YVICHiISQgAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAACebjoAnW84Ap9uOm2fbjr+n206/55tOf+ebDj/nmw4/55rN/+dazb/nWo2/51qNf+caTT/
-nGk0/5xpNP+caDP/m2gz/5tnMv+bZjH/m2Yx/5pmMP+aZTD/mmUv/5llL/+ZZC7/mWQt/5hjLP+Y
-Yyz/mGIr/5diKv+XYSr/l2Ep/5ZgKf+WYCj/lmAn/5ZfJ/+VXyb/lV4l/5VeJf+VXST/lF0k/5Rc
-I/+UXCL/k1si/5NbIf+TWiD/k1og/5JaH/+SWR//kVke/5FYHf+RVxz/kVcc/5BXG/+QVhv/kFYa
-/49WGf+PVRn/j1UY/45UF/+OVBf/jlMW/45TFv+NUhX/jVIV/41RFP+NURT/jFEU/4xQE/+MUBP/
-i08S/4tPEv+LThH/ik4R/4pNEP+KTQ//iUwP/4lMDv+ISQv/klkf/+PUxf/////////////////+
-/fn/692l/+DMdv/hzXn/4c15/+HNef/hzXn/4c15/+HNeP/hzXr/8+vK////////////////////
-///j0IP/xZ4A/8WfAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/Ut0P/+fTi////////////////
-//Xu0v/NrCj/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8uqJf/z68r/////////////////
-+PTw/6V3SP+DQgP/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI8oVHCE+HSAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACkbD4AmnQ6AKBvPEmgbzzuoG88/6BuO/+g
-bjv/n246/59tOf+fbTn/nmw4/55sN/+eazf/nWs2/51qNf+dajX/nGk0/5xpNP+caTT/nGgz/5xo
-M/+bZzL/m2Yx/5tmMf+aZjD/mmUv/5plL/+ZZC7/mWQu/5lkLf+ZYyz/mGMs/5hiK/+XYir/l2Eq
-/5dhKf+XYSn/lmAo/5ZfJ/+WXyf/lV8m/5VeJf+VXiX/lV0k/5VdI/+UXCP/lFwi/5RcIv+TWyH/
-k1og/5NaH/+SWh//klke/5JZHv+SWB3/kVgd/5FXHP+QVxv/kFYa/5BWGv+PVhn/j1UZ/49VGP+P
-VBf/jlQX/45TFv+OUxb/jVIV/41SFf+NUhX/jVEU/41RFP+MUBP/jFAT/4tPEv+LTxL/i04R/4tO
-EP+KTQ//i04R/9bAq/////////////////////7/7+S1/+DMdv/hzXn/4c15/+HNef/hzXn/4c15
-/+HNef/hzHf/7+S3//7+/P/////////////////p25//x6IN/8WeAP/FnwH/xZ8B/8WfAf/FnwH/
-xZ8B/8OcAP/ZwFv//Prw//////////////////Lpw//KpRX/xJ4A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xJ0A/8+wM//3897/////////////////8eri/5toM/+ERAT/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUcI5YZGCCiFRwcAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACtaUAAoHI+AKFxPiuhcT7RoXE+/6FwPf+hcD3/oG88/6BvPP+gbjv/oG46/59uOv+fbTn/n2w4
-/55sOP+ebDf/nms2/51rNv+dajb/nWo1/5xpNP+caTT/nGg0/5xoM/+caDL/m2cy/5tmMf+bZjH/
-mmYw/5plL/+aZS//mWUu/5lkLf+ZZC3/mGMs/5hjLP+YYiv/mGIq/5dhKv+XYSn/lmAo/5ZgKP+W
-YCf/ll8m/5VeJv+VXiX/lV0k/5VdJP+UXSP/lFwj/5RcIv+UWyH/k1sh/5NaIP+TWiD/klof/5JZ
-Hv+SWR3/kVgd/5FYHP+RVxz/kFcb/5BWGv+QVhr/j1YZ/49VGP+PVRj/jlQX/45UF/+OUxb/jlMW
-/41SFf+NUhX/jVEU/41RFP+MURP/jFAT/4xQE/+LTxL/ikwP/8mskP//////////////////////
-8unE/+HNeP/hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHX/696l//79+f/////////////////v
-5bn/yaYc/8SeAP/FnwH/xZ8B/8WfAf/FnwH/xZ8B/8SdAP/fyXP//v77/////////////////+zf
-qP/Hogr/xJ4A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/9a6Sf/7+Oz/////////////////59zP
-/5FZH/+FRgX/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hUgIv4hFBxCESAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAo3NAAKNzQBWic0CuonJA/6JyQP+icT//
-oXE//6FwPv+hcD3/oG89/6BvPP+gbzv/n247/59uOv+fbTn/n205/55sOP+ebDf/nms3/51rNv+d
-ajb/nWo1/5xqNf+caTT/nGk0/5xoM/+bZzL/m2cy/5tnMv+aZjH/mmYw/5plMP+aZS//mWUu/5lk
-Lv+ZZC3/mGMt/5hjLP+YYiv/l2Ir/5dhKv+XYSn/l2Ap/5ZgKP+WYCf/lV8n/5VfJv+VXib/lV4l
-/5VdJP+UXSP/lFwj/5RcIv+TWyL/k1sh/5NbIf+SWiD/klof/5JZH/+SWR7/kVgd/5FYHf+QVxz/
-kFcb/5BWG/+QVhr/j1Ya/49VGf+PVRj/jlQX/45UF/+OUxb/jVMW/41SFf+NUhX/jVEU/41RFP+M
-UBP/i00Q/7qWcf/9/fz/////////////////9e/U/+LPfv/hzXj/4c15/+HNef/hzXn/4c15/+HN
-ef/gzHX/6NiY//379f/////////////////17tH/zKwq/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xZ4A
-/8agCP/m1Y///////////////////v77/+TSh//EngH/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/
-xJwB/9zEY//+/fr/////////////////3Mu4/4hMEP+GRwf/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUgIj4RHBweFSAgAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAonRBAJ9zOwKjdEKBo3RD/qNzQv+jc0L/o3NB/6JyQP+ickD/onE//6FxPv+hcD7/oXA9/6Bv
-PP+gbjz/oG47/6BuOv+fbTr/n205/59tOf+ebDj/nms3/55rN/+dazb/nWo1/51qNf+caTT/nGk0
-/5xpNP+caDP/m2gz/5tnMv+bZjH/mmYx/5pmMP+aZS//mmUv/5lkLv+ZZC3/mWQt/5hjLP+YYyz/
-mGIr/5diKv+XYSr/l2Ep/5dhKf+WYCj/ll8n/5ZfJv+VXib/lV4l/5VeJf+VXST/lF0k/5RcI/+U
-XCL/k1sh/5NbIf+TWiD/klog/5JaH/+SWR7/kVke/5FYHf+RWBz/kVcc/5BXG/+QVhv/kFYa/49V
-Gf+PVRn/j1UY/45UF/+OVBf/jlMW/41TFv+NUhX/i04Q/6yBVf/59vT/////////////////+fXl
-/+TRhf/hzHf/4c15/+HNef/hzXn/4c15/+HNef/gzHf/5dSL//v36//////////////////49OP/
-0rU7/8SdAP/FnwH/xZ8B/8WfAf/FnwH/xJ4A/8ijFP/s4Kv//////////////////fz3/93Hbf/D
-nAD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0E/+HMe///////////////////////z7ad/4ZI
-C/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj4
-hUcHYYdIAAGFSAcAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAQAAAAKV2RgCkdUVWpHVF7aR1RP+kdUT/pHRD
-/6R0Q/+jc0L/o3NC/6NzQf+ickD/onFA/6JxP/+hcD7/oXA+/6FwPf+gbz3/oG88/6BuO/+fbjr/
-n206/59tOf+fbTj/nmw4/55rN/+eazf/nWs2/51qNf+dajX/nGk0/5xpNP+caTT/nGgz/5xoM/+b
-ZzL/m2cy/5tmMP+aZjD/mmUv/5plL/+ZZC7/mWQu/5lkLf+YYyz/mGIs/5hiK/+XYSr/l2Eq/5dh
-Kf+WYCn/lmAo/5ZfJ/+WXyf/lV8m/5VeJf+VXiT/lV0k/5RcI/+UXCP/lFwi/5RbIf+TWyH/k1og
-/5NaH/+SWh//klke/5JZHv+RWB3/kVgd/5FXHP+QVxv/kFYa/5BWGv+PVRn/j1UZ/49VGP+OVBf/
-i1AS/6N0Qv/x6uL//////////////////Prz/+bUjv/gzHf/4c15/+HNef/hzXn/4c15/+HNef/h
-zXj/4s9///jz4P/////////////////9+/X/2b9Y/8ScAP/FnwH/xZ8B/8WfAf/FnwH/xJ0A/8uo
-If/x6ML//////////////////Pry/9e8UP/DnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xqAI
-/+fYmP//////////////////////wKGA/4VGB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjghkcIN4FKCACTPQgAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAKV3SACld0gqpXdI0qV3R/+ld0f/pXZG/6R2Rf+kdUT/pHVE/6R0Q/+kdEP/o3NC/6NzQf+j
-c0H/onJA/6JyQP+icT//oXA+/6FwPf+hbz3/oG89/6BvPP+gbjv/n247/59uOv+fbTn/nm05/55s
-OP+ebDf/nms2/51rNv+dazb/nWo1/5xpNP+caTT/nGk0/5xoM/+caDP/m2cy/5tnMf+bZjH/mmYw
-/5plL/+aZS//mWQu/5lkLf+ZZC3/mGMs/5hjLP+YYiv/l2Eq/5dhKv+XYCn/lmAp/5ZgKP+WXyf/
-ll8n/5VfJv+VXib/lV4l/5VdJP+UXSP/lFwi/5RbIv+UWyL/k1sh/5NaIP+TWh//klof/5JZHv+S
-WR7/kVgd/5FYHP+RVxz/kFcb/5BXG/+QVhr/jlMW/5xpNP/m2Mv//////////////////fz4/+na
-nf/gzHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4c16//Xu0P//////////////////////38pz
-/8SdA//FnwH/xZ8B/8WfAf/FnwH/xJ0A/9CxMf/38dj/////////////////+fXl/9CwL//EngD/
-xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/yKMO/+/luv/////////////////+/v3/soph/4REA/+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAi3hUcI
-GoVHCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAKR6SgCkekoMpnhKqaZ5Sf+meEn/pnhI/6Z3
-SP+ld0f/pXZG/6R2Rv+ldkX/pHVE/6R0RP+jdEP/pHRC/6NzQv+jc0H/o3JA/6JyQP+icT//oXE/
-/6JxPv+hcD3/oG89/6BvPP+gbzv/n247/6BuOv+fbTr/n205/59sOP+ebDf/nWs3/55rNv+dajb/
-nWo1/5xqNf+caTT/nGk0/5xoM/+caDP/m2cy/5tnMv+bZzH/m2Yw/5plMP+aZS//mmUu/5lkLv+Z
-ZC3/mWMt/5hjLP+YYiv/l2Ir/5hiKv+XYSn/lmAp/5dgKP+WYCj/lV8n/5ZfJv+VXib/lV4l/5Vd
-JP+VXST/lF0j/5RcIv+UWyL/k1sh/5NbIf+TWiD/k1of/5JZH/+SWR7/klgd/5FYHf+RWBz/j1UZ
-/5VfJ//bybb//////////////////v37/+3grf/gzHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/
-4c14//Dmvf//////////////////////5taS/8WgCP/FnwH/xZ8B/8WfAf/FnwH/xJ0A/9a7S//8
-+vD/////////////////9e/T/8qnF//FngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/y6gZ//fx
-2P/////////////////28u7/pnhI/4NEA/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+FRwiEfk8HA4NJCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-ALaJawD///8Ap3pMbqh6TPinekv/p3lL/6d5Sv+meUn/pnhJ/6Z4SP+ld0f/pXdH/6V2Rv+kdkX/
-pHVF/6R1RP+kdET/pHRD/6NzQv+jc0H/o3NB/6JyQP+icUD/onE//6FxPv+hcD7/oXA9/6FwPP+g
-bzz/oG47/59uO/+fbjr/n205/59tOf+ebDj/nmw4/55rN/+dazb/nWo2/51qNf+cajX/nGk0/5xp
-NP+caDP/nGgz/5tnMv+bZzH/m2Yx/5pmMP+aZTD/mmUv/5llLv+ZZC7/mWQt/5hjLP+YYyz/mGIr
-/5diK/+XYSr/l2Ep/5dhKP+WYCj/ll8n/5ZfJ/+VXyb/lV4l/5VeJf+VXST/lF0k/5RcI/+UXCL/
-k1si/5NbIf+TWyD/k1og/5JaH/+SWR7/kVcc/5JZH//Su6L///////////////////7+//Dnv//g
-zHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2/+zgq/////7/////////////////7+S2/8ej
-Df/FnwD/xZ8B/8WfAf/FnwH/xJ0B/9zEZf////7/////////////////7uO0/8eiDf/FnwD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/EnQD/0rI2//v36v/////////////////s4tj/nGk1/4REA/+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICOiFSAdOhkcIAHtP
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACpfE0AqntOMKl8TeaofE7/qHtN/6h6TP+n
-ekz/p3pL/6d5Sv+neUr/pnhJ/6Z4SP+ld0j/pXdH/6V3R/+ldkb/pHVF/6R1RP+kdET/pHRD/6R0
-Q/+jc0L/o3NC/6NzQf+ickD/onFA/6JxP/+hcD7/oXA+/6FwPf+gbz3/oG88/6BuO/+fbjv/n246
-/59tOf+ebTn/nmw4/55rN/+dazf/nWs2/51qNf+dajX/nGk0/5xpNP+caDP/nGgz/5xoM/+bZzL/
-m2Yx/5tmMf+aZjD/mmUw/5plL/+ZZC7/mWQu/5lkLf+YYy3/mGIs/5hiK/+XYSr/l2Eq/5dhKf+W
-YCn/lmAo/5ZfJ/+WXyf/lV8m/5VeJf+VXiX/lV0k/5RcI/+UXCP/lFwi/5NbIv+TWyH/klkf/5FY
-Hf/GqYr//fz7//////////////////Ttz//iznz/4c14/+HNef/hzXn/4c15/+HNef/hzXn/4Mx2
-/+nanf/9+/X/////////////////9vHY/8uoGv/FngD/xZ8B/8WfAf/FnwH/xZ8G/+TSif//////
-////////////////5dSO/8WfB//FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/DnQD/2L5W//379P//
-///////////////g0MD/kVgg/4RFBP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4VHCMmGRgchhkYHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACpfVAAqntODal9ULGqfVD/qX1P/6l8T/+pfE7/qHtN/6h7Tf+oekz/p3pL/6d5S/+neUr/p3lJ
-/6Z4Sf+meEj/pndH/6V3R/+ldkb/pXZG/6V1Rf+kdUT/pHRE/6N0Q/+jdEL/o3NC/6NzQf+jckH/
-onJA/6JxP/+icT//oXA+/6FwPf+hbz3/oG88/6BvO/+gbjv/n246/59tOv+fbTn/nmw4/55sOP+e
-azf/nWs2/51qNv+dajX/nWo1/5xpNP+caDT/nGgz/5toM/+bZzL/m2cy/5tmMf+aZjH/mmUw/5pl
-L/+aZS//mWQu/5lkLf+ZYy3/mGMs/5hiK/+YYiv/l2Iq/5dhKf+WYCn/lmAo/5ZgJ/+WXyf/ll8m
-/5VeJv+VXiX/lV0k/5VdJP+UXCP/lFwi/5BXG/+5lG7/+fby//////////////////fz3v/j0YT/
-4cx3/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+bVkP/69uj/////////////////+vfp/9KzOP/E
-nQD/xZ8B/8WfAf/FnwD/xqEM/+zgrf////////////////////7/3shu/8SdAv/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/DnAD/38p2//79+f/////////////////Wwav/ik4U/4VGBv+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/YZICJOGQw0FhkMNAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACrf1IArH9SAqt/Umurf1L6qn5R/6p+Uf+qfVH/
-qn5Q/6l9T/+pfE7/qXxO/6h7Tf+oekz/qHpM/6d6S/+neUv/p3lK/6Z5Sf+meEn/pnhI/6V3R/+l
-d0b/pXZG/6R1Rf+kdUX/pHVE/6R0RP+kdEP/pHRC/6NzQf+jckH/onJA/6JxQP+icT//onE//6Fw
-Pv+hcD3/oG88/6BvPP+gbzv/oG87/59uOv+fbTn/n205/55sOP+ebDj/nms3/51rNv+dajX/nWo1
-/5xpNP+cajT/nGk0/5xoM/+baDP/m2cy/5tnMv+bZjH/mmYw/5plMP+aZS//mWUu/5lkLv+ZZC3/
-mGMs/5hiLP+YYiv/mGIr/5dhKv+XYSn/lmAo/5ZgKP+WYCf/lWAn/5VfJv+VXib/lV4l/5FZHv+t
-g1b/8+3m//////////////////r36f/m1Y7/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4cx3/+PR
-hP/38tz//////////////////fv0/9nAXP/DnAD/xZ8B/8WfAf/FngD/yaUV//Pry///////////
-///////8+vP/2L5S/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WeAP/GnwT/59eU///+/f//////
-///////////IrZD/h0kK/4VHB/+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI8YZHCEuGSQgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC3
-f0gAqYBUAKyAUTGrgFPYq4BT/6t/U/+rf1P/q39S/6p+Uf+qflH/qn1Q/6l9T/+pfU//qXxO/6h7
-Tv+oe03/qHtM/6d6S/+nekv/p3lK/6Z5Sv+meEn/pnhJ/6Z4SP+ld0f/pXdH/6V2Rv+kdUX/pHVF
-/6R1RP+kdET/o3RD/6N0Qv+jc0L/o3NB/6JyQP+icT//onE//6FxPv+hcD7/oXA9/6BvPP+gbzz/
-oG47/59uO/+fbjr/n205/55sOf+ebDj/nmw4/55rN/+dazb/nWo2/51qNf+caTT/nGk0/5xpNP+c
-aDP/m2gz/5tnMv+bZjH/mmYx/5pmMP+aZS//mmUv/5llLv+ZZC7/mWQt/5hjLf+YYyz/mGIr/5di
-Kv+XYSr/l2Ep/5ZgKf+WYCj/lmAn/5NcIv+kdEP/7OPY//////////////////z68f/p2p3/4Mx2
-/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+LPff/07c3//////////////////v36/+HNfP/EnQH/
-xZ8B/8WfAf/EnQD/z7Av//j04f/////////////////4897/0bI1/8SdAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ8A/8SeAP/IpBD/7uO1//////////////////z6+f+6lnH/hUYF/4dJCv+HSQr/h0gJ/4ZI
-Cf+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI
-/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hUgIxYZHBhiFSAgAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAArIJUAK2CUw2sgladrIJW/6yCVf+sgVT/q4BT
-/6uAU/+rgFP/q39S/6t/Uv+qf1H/qn5R/6p9UP+qfVD/qX1P/6l8Tv+oe07/qHtN/6h6TP+oekz/
-p3pL/6d5Sv+neUr/pnhJ/6Z4SP+md0j/pXdH/6V3R/+ldkb/pHVF/6R1Rf+kdUT/pHRD/6R0Q/+j
-c0L/o3NC/6NzQf+jckD/onJA/6JxP/+hcT7/oXA+/6FwPf+gbzz/oG88/6BuO/+gbjv/n246/59t
-Of+fbTn/nmw4/55rN/+eazf/nWs2/51rNv+dajX/nGk0/5xpNP+caDP/nGgz/5xoM/+bZzL/m2Yy
-/5tmMf+aZjD/mmUv/5plL/+ZZC7/mWQu/5lkLf+YYyz/mGMs/5hiK/+YYir/l2Eq/5ZfJ/+bZzL/
-5NbH//////////////////79+v/t4a7/4cx2/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HMeP/w
-5rv////+/////////////////+nbn//GoQj/xZ4A/8WfAf/DnAD/1rtP//z68f//////////////
-///y6sf/y6kj/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/LqSD/9OzM////////////////
-//bx7f+tglb/hUYG/4lLDf+ISwz/iEoL/4hKC/+HSQr/h0kK/4dICf+GSAj/hkgI/4ZICP+GSAj/
-hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+G
-SAj9hUcHfIRFBQSFRgYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-qHxWAK6GWACtg1hXroNY7a6DV/+tg1b/rYJW/6yCVf+sglX/rIFU/6yAVP+rgFP/q39T/6t/Uv+r
-flL/qn5R/6p+Uf+qfVD/qX1P/6l8T/+pfE7/qXtN/6h7Tf+oekz/p3pL/6d6S/+neUr/p3lJ/6Z4
-Sf+meEj/pndH/6V3R/+ldkb/pXZG/6V1Rf+kdUX/pHVE/6R0Q/+kdEP/o3NC/6NzQf+jc0H/onJA
-/6JxP/+icT//oXA+/6FwPf+hbz3/oG88/6BvPP+gbjv/n246/59tOv+fbTn/n2w4/55sOP+eazf/
-nWs2/51rNv+dajX/nWo1/51pNP+caTT/nGgz/5xoM/+caDL/m2cy/5tmMf+bZjH/mmYw/5plL/+a
-ZS//mWQu/5lkLf+ZZC3/mGMs/5diK/+YYyz/1sGr///////////////////////x58D/4c14/+HN
-eP/hzXn/4c15/+HNef/hzXn/4c15/+DLdf/s36n//f35//////////////////Howv/JpRb/xJ4A
-/8WfAf/EnQD/3shw//38+P/////////////////s36r/yKMT/8SeAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8SdAP/StDv/+PLd/////////////////+7m3f+hcD7/h0kK/4pND/+KTA7/iUwO/4lLDf+J
-Sw3/iEsM/4hKC/+ISgv/h0kK/4dJCf+HSAn/hkgJ/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZI
-CP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAjehUgIN4ZJCQCFRAQAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAK2FWACthVgdroRZwa6EWf+uhFn/roRY/62D
-WP+tg1f/rYJW/6yCVv+sgVX/rIFU/6uBVP+rgFP/q39T/6t/Uv+rf1L/qn5R/6p+Uf+qflD/qX1Q
-/6l8T/+pfE7/qHxO/6h7Tf+oe0z/qHpM/6d5S/+neUr/p3lK/6Z4Sf+meEn/pnhI/6V3R/+ldkf/
-pXZG/6R2Rf+kdUX/pHVE/6R0RP+kdEP/o3NC/6NzQv+jc0H/onJA/6JyQP+icT//oXA+/6FwPv+h
-cD3/oG89/6BvPP+gbzv/n247/59tOv+fbTn/nm05/55sOP+eazf/nms3/51rNv+dajX/nWo1/5xp
-NP+caTT/nGk0/5xoM/+baDP/m2cy/5tnMf+aZjH/mmYw/5plMP+aZS//mWQu/5lkLf+XYSr/xqiK
-//z7+v/////////////////17tH/4s9+/+HMeP/hzXn/4c15/+HNef/hzXn/4c15/+DMdv/o2Jj/
-+/nv//////////////////bw1//PrzD/xJ0A/8WfAf/GoAT/6NmZ/////v/////////////////k
-0on/xZ8D/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8OcAP/ZwFr//Pnw/////////////////+bZ
-zP+WXyj/iUwO/4tPEv+KThH/ik0Q/4pND/+JTA//iUwO/4lMDf+ISw3/iEsM/4hKDP+ISgv/h0kK
-/4dJCv+HSAn/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAj/hkgI/4ZICP+GSAif
-hUgKD4VICQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AJecZwCQoWoBr4ZcdrCGXPmvhlv/r4Va/6+FWv+uhFn/roRZ/66EWP+tg1f/rYJX/62CVv+sglX/
-rIJV/6yBVP+rgFP/q4BT/6uAU/+rf1L/q39S/6p+Uf+qflH/qn1Q/6l9T/+pfE//qXxO/6l7Tf+o
-e03/qHpM/6h6TP+nekv/p3lK/6d5Sv+meEn/pnhJ/6Z4SP+ld0f/pXZH/6V2Rv+kdUX/pHVF/6R1
-RP+kdEP/o3RD/6NzQv+jc0H/o3NB/6JyQP+icUD/onE//6FwPv+hcD7/oXA9/6FvPP+gbzz/oG47
-/59uOv+fbTr/n205/59sOP+ebDj/nms3/55rN/+dazb/nWo1/51qNf+caTT/nGk0/5xpNP+caDP/
-m2cy/5tnMv+bZjH/mmYx/5pmMP+XYCn/uZRv//r49v/////////////////49OH/5NKG/+DMd//h
-zXn/4c15/+HNef/hzXn/4c15/+HMdv/k04j/+fXl//////////////////r36v/XvFH/w5wA/8We
-AP/JoxD/8ea///////////////////389v/dxmj/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8SdAP/gy3f//v78/////////////////9rGs/+QVhz/i08S/4xQE/+MUBP/i08S/4tPEv+KThH/
-ik0Q/4pNEP+KTQ//iUwP/4lMDv+JSw3/iEsN/4hLDP+ISgv/h0kL/4dJCv+HSAn/h0gJ/4ZICP+G
-SAj/hkgI/4ZICP+GSAj/hkgI/4ZICOyGSAhYhEMAAIdLDwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACwiF4AsIhdKbCIXtewiF7/sIdd/7CHXP+w
-h1z/r4Zb/6+FWv+vhVr/roRZ/66EWP+uhFj/rYNX/62DV/+tglb/rYJV/6yCVf+sgVT/rIBU/6uA
-U/+rf1P/q39S/6t/Uv+qflH/qn5R/6p9UP+pfU//qXxP/6l8Tv+oe03/qHtN/6h6TP+oekz/p3pL
-/6d5Sv+neUr/pnhJ/6Z4SP+meEj/pXdH/6V2Rv+ldkb/pHVF/6R1RP+kdUT/pHRD/6N0Q/+jc0L/
-o3NB/6NzQf+ickD/onFA/6JxP/+hcD7/oXA+/6FwPf+gbzz/oG88/6BuO/+gbjv/n206/59tOf+e
-bDj/nmw4/55rN/+eazf/nWs2/51qNf+dajX/nGk0/5xpNP+caTT/nGgz/5toM/+ZYy3/roRZ//Xv
-6v/////////////////7+O3/5teT/+DMdv/hzXn/4c15/+HNef/hzXn/4c15/+HMd//iz37/9u/W
-//////////////////79+v/fynP/xJ0A/8SdAP/OrSz/9u/U//////////////////n15P/UuEb/
-xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8ehDP/p2Zr//////////////////v38/8qukf+N
-UhT/jVEU/41SFf+NURT/jVEU/4xQE/+MUBP/jFAT/4tPEv+LTxL/i04R/4pOEP+KTRD/ik0P/4lM
-Dv+JTA7/iUsN/4lLDP+ISwz/iEoL/4hKC/+HSQr/h0kK/4dICf+GSAj/hkgI/4ZICLyGRwgZhkcI
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AACximAAsYpgBrKKYIWyiWD9sYlg/7GJX/+xiF7/sYhe/7CHXf+wh1z/r4Zc/6+GW/+vhVr/r4Va
-/66EWf+uhFn/roRY/62DV/+tg1f/rYJW/6yCVf+sgVX/rIFU/6yAVP+rgFP/q39T/6t/Uv+rflL/
-qn5R/6p+Uf+qfVD/qX1Q/6l9T/+pfE7/qHtN/6h7Tf+oekz/p3pM/6d6S/+neUr/p3lK/6Z4Sf+m
-eEn/pXdI/6V3R/+ldkb/pXZG/6R1Rf+kdUX/pHVE/6R0Q/+kdEP/o3NC/6NzQf+jckH/onJA/6Jx
-P/+icT//oXA+/6FwPv+hcD3/oG88/6BvPP+gbjv/n247/59uOv+fbTn/nmw4/55sOP+eazf/nWs3
-/51rNv+dajX/nWo1/5xpNP+bZzL/pHVE/+vh1//////////////////9/Pj/6t2k/+DMdf/hzXn/
-4c15/+HNef/hzXn/4c15/+HNef/hzXj/8ejB///+/f/////////////////o2Jf/xqEL/8ObAP/V
-uU3/+vfo//////////////////Xu0f/NrCn/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8mm
-HP/v5br/////////////////+/n3/7qWcP+LTxH/jlQX/45UF/+OUxb/jVMW/41SFf+NUhX/jVEU
-/41RFP+MUBP/jFAT/4xQE/+LTxL/i08S/4tOEf+LThH/ik0Q/4pND/+KTA7/iUwO/4lLDf+JSw3/
-iEsM/4hKC/+ISQr/h0gK9YZHCWNuRQUAmE0OAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACti1wAtYtlALKLYTayi2Lbs4ti/7OKYf+yimH/
-sYlg/7GJX/+xiF7/sIhe/7GIXf+wh13/sIdc/7CGW/+vhVr/r4Va/6+FWf+uhFn/roRY/62DWP+t
-g1f/rYNW/6yCVv+sglX/rIFU/6uBVP+sgFT/q4BT/6t/Uv+rf1L/q35S/6p+Uf+qflD/qX1Q/6l9
-T/+pfE//qHxO/6l7Tf+oe03/p3pM/6h6S/+neUr/pnlK/6d5Sf+meEn/pnhI/6V3SP+ld0f/pXZG
-/6R2Rf+kdUX/pHVE/6R0RP+kdEP/pHRC/6NzQv+jc0H/o3JA/6JyQP+icT//oXE//6FwPv+hcD7/
-oG89/6FvPP+gbzv/n247/59uOv+fbTr/nm05/59sOP+ebDf/nWs3/55rNv+dajX/nms3/97Nuv//
-////////////////////7uS2/+HMdv/hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHX/7OCr//79
-+v/////////////////v5Lj/yaUb/8OcAP/dx2z//fz2/////////////////+7jtf/IpBL/xJ4A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/8+vLf/179P/////////////////9/Pv/6yBVP+NUhX/
-kFYa/49VGf+PVRj/jlQY/45UF/+OUxb/jVMW/45SFf+NUhX/jVIV/41RFP+MURT/jFAT/4xQE/+M
-TxL/i08S/4tOEf+LThH/ik4Q/4pNEP+KTA//iUwO/4lMDf+JSw3/iEsLyYhJCx6ISwsAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAsoxlALGNZwqyjGSSs4xk/7OMZP+zi2P/s4ti/7OKYf+yimH/solg/7KJX/+xiV//sYhe/7GI
-Xv+wh13/sIdd/7CHXP+vhlv/r4Zb/6+FWv+uhVn/roRZ/66EWP+tg1f/rYNX/62CVv+sglX/rIJV
-/6yBVP+sgFT/q4BT/6uAU/+rf1L/q39S/6p+Uf+qflH/qn1Q/6l9T/+pfE//qXxO/6l7Tv+oe03/
-qHpM/6h6TP+nekv/p3lK/6d5Sv+meEn/pnhJ/6Z4SP+ld0f/pXdH/6V2Rv+kdkX/pHVF/6R1RP+k
-dEP/pHRD/6NzQv+jc0L/o3NB/6JyQP+icT//onE//6FxPv+hcD7/oXA9/6BvPP+gbzz/oG47/6Bu
-Ov+fbTr/n205/59sOf+ebDj/nWs2/8+3nf//////////////////////9OzM/+HOfP/hzXn/4c15
-/+HNef/hzXn/4c15/+HNef/gzHb/6NiY//379f/////////////////28Nj/z7Aw/8WeBv/n15X/
-//////////////////79/+bWkv/FngL/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJwA/9a7S//8
-+vH/////////////////8Ojg/59tOf+QVhr/kVcc/5BXG/+QVhr/kFYa/49VGf+PVRn/j1UY/45U
-F/+OVBf/jlMW/41TFv+NUhX/jVIV/41RFP+NURT/jFAT/4xQE/+MUBP/i08S/4tPEv+LThH/ik4R
-/4pNEP+KTQ/5iU0OboNNDAKITQ4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAnKJ1ALaNZgC0jmc3tI5m2LSOZv+0jWX/s41l
-/7OMZP+zjGP/s4tj/7OLYv+yimH/soph/7KJYP+xiWD/sYlf/7GIXv+wiF7/sIdd/7CHXP+vhlz/
-r4Zb/6+FWv+uhVr/roRZ/66EWP+ug1j/rYNX/62CVv+tglb/rIJV/6yCVf+sgVT/q4BT/6uAU/+r
-f1P/q39S/6t/Uv+qflH/qn5R/6p9UP+pfVD/qXxP/6l8Tv+oe03/qHtN/6h6TP+nekz/p3pL/6d5
-Sv+meUr/pnhJ/6Z4SP+md0j/pXdH/6V2Rv+ldkb/pHVF/6R1Rf+kdUT/pHRD/6N0Q/+jc0L/o3NC
-/6NzQf+ickD/onE//6JxP/+hcD7/oXA+/6FwPf+gbzz/oG88/6BuO/+fbjr/nWo2/8Ghf//+/fz/
-////////////////+PTj/+LQgf/hzXj/4c15/+HNef/hzXn/4c15/+HNef/hzXj/5NGF//r26P//
-///////////////8+/T/17tN/8ijF//v47X//////////////////fz3/93HbP/EnAD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xJ0B/97Ha///////////////////////4dLC/5dgKP+SWR7/klke
-/5FYHf+RWB3/kVcd/5FXHP+QVxv/kFYa/5BWGv+PVRn/j1UZ/49VGP+OVBf/jlQX/45TFv+NUxb/
-jVIV/41SFf+NURT/jFEU/4xQE/+MUBP/jFAT/4tPEv+LThHBik4QIopNEACFVxgAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAK6TawCulGwEtZBoh7WPaPu1j2j/tI5n/7SNZv+0jWb/s41l/7SNZP+zjGT/s4xj/7OLYv+z
-i2L/soph/7KKYP+yiWD/sYlf/7GIX/+xiF7/sYhd/7CHXf+wh1z/r4Zb/6+GW/+vhVr/r4Va/66E
-Wf+uhFj/roNY/62DV/+tglb/rYJW/6yBVf+sgVX/q4FU/6yAU/+rgFP/q39S/6t/Uv+qflL/qn5R
-/6p+UP+qfVD/qX1P/6l8T/+pfE7/qHtN/6h7TP+oekz/p3pL/6d5S/+neUr/p3lJ/6Z4Sf+meEj/
-pndH/6V3R/+ldkb/pXZG/6V1Rf+kdUT/pHRE/6N0Q/+jdEL/o3NC/6JyQf+jckH/onJA/6JxP/+i
-cT//oXA+/6FwPf+gbzz/nmw4/7aQaf/18Or//////////////////Pry/+bWkP/hzHf/4c15/+HN
-ef/hzXn/4c15/+HNef/hzXn/4s58//Xu0f//////////////////////38p0/86uMP/28Nb/////
-////////////+/nu/9K0O//EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8I/+fYmP//////
-////////////////z7ed/5RcIv+TWyH/k1sh/5JaIP+TWh//klkf/5JZHv+RWB3/kVgd/5BXHP+R
-Vxv/kFYb/5BWGv+QVhr/j1UZ/49VGP+OVBf/jlQX/45TFv+NUxb/jlMW/41SFf+NUhX/jFEU/4xQ
-FPKMUBNoc0ERAYlOEwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC2kWkAtpFrK7aRatS2kGr/tpBp/7aP
-af+1kGj/tY9o/7WOZ/+0jmf/tI1m/7ONZP+zjGT/s4xj/7OMY/+zi2L/sopi/7KKYf+yiWD/solg
-/7GJX/+xiF7/sYhe/7CIXv+wh13/sIdc/6+HXP+vhlv/r4Va/66EWf+uhFn/roRY/66DWP+tg1f/
-rYNW/6yCVf+sglX/rIFU/6uAVP+rgFP/q4BT/6t/U/+rf1L/q35S/6t+Uf+qflH/qX1Q/6l9T/+p
-fU7/qXxO/6h8Tf+oe03/qHpL/6d6S/+neUr/p3lK/6Z4Sf+meEn/pnhI/6V4SP+ld0f/pXZG/6R1
-Rf+kdUX/pHVE/6R0RP+jdEP/pHRD/6NzQv+jc0H/onJA/6JxQP+icT//oG47/6yAVP/q39T/////
-/////////////v35/+vdpf/gy3b/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4Mx3/+/luf//////
-////////////////696m/9e9Uv/8+/T/////////////////9e7T/8upG//EngD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/yKMQ//Howf/////////////////+/fz/v599/5JaH/+UXST/lVwj/5Rc
-I/+TWyL/k1sh/5NaIP+SWiD/klof/5JaH/+SWR7/kVke/5FYHf+RVxz/kFcb/5BWG/+QVhr/j1YZ
-/49VGf+PVRn/jlUX/45UF/+OUxb/jVMW/41SFriNURQZjVEUAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAC2kmwAtZNrA7eSbG+3kmz4t5Js/7eRa/+2kWr/tpBq/7aQaf+1j2j/tY9o/7WOZ/+0jmf/
-tI5m/7SNZv+0jWX/s4xk/7OMY/+zi2P/s4ti/7KLYv+yimH/solg/7GJYP+xiV//sYhe/7CIXv+w
-h13/sIdc/6+GXP+vhlv/r4Zb/6+FWv+uhVn/roRZ/62EWP+tg1f/rYNX/62CVv+sglb/rIFV/6yB
-VP+rgFT/q4BT/6t/U/+rf1L/qn9S/6p+Uv+qflH/qn1Q/6l9UP+pfU//qXxO/6h8Tv+oe03/qHtM
-/6d6TP+nekv/p3lL/6Z5Sv+meEn/pnhI/6V3SP+ld0f/pXdH/6V2Rv+kdUX/pHVF/6R1RP+kdEP/
-o3RD/6NzQv+jc0L/onE//6V3Rv/ezbv//////////////////v79/+/lu//gzHf/4c15/+HNef/h
-zXn/4c15/+HNef/hzXn/4Mx2/+vdpP/9/Pj/////////////////9e3Q/+jZmv////7/////////
-////////692m/8ehC//FngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/zq4p//jz3v//////////
-///////38u3/soph/5NbIv+VXyb/lV4l/5VeJf+VXST/lF0j/5RcI/+UXCL/k1si/5NbIf+TWyD/
-klog/5JaH/+SWR7/klke/5FYHf+RWB3/kVcc/5BXG/+QVhr/kFYa/49VGf+PVRj/j1QY7I1TF1KQ
-VRoAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABfdY0AuZNsALWRbRy4k264uJNu/7iTbf+4
-k23/t5Js/7eSa/+3kWv/tpFq/7aRav+2kGn/tY9o/7WPaP+1j2f/tI5n/7SOZv+0jWX/tI1l/7OM
-ZP+zjGT/s4xj/7OLYv+yimH/soph/7KJYP+yiWD/sYlf/7GIXv+xiF7/sIdd/7CHXP+whlz/r4Zb
-/6+GWv+vhVr/roRZ/66EWf+uhFj/rYNX/62DVv+sglb/rIJW/6yCVf+sgVT/q4BU/6uAU/+rf1P/
-q39S/6t/Uv+qflH/qn5R/6p9UP+pfU//qX1P/6l8Tv+pfE7/qHtN/6h6TP+oekz/p3pL/6d5Sv+n
-eUr/pnhJ/6Z4SP+meEj/pXdH/6V3Rv+ldkb/pHVF/6R1Rf+kdUT/pHRD/6NyQf/QuJ///v7+////
-//////////////Xu0v/izn3/4cx4/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+bVj//69+v/////
-/////////////Pnx//n25v///////////////////v3/4c17/8SdBP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/DnAD/17xR//z68v/////////////////s49n/pndI/5VdJf+XYSj/lmAo/5ZfJ/+W
-Xyf/lV8m/5VeJf+VXiX/lV0k/5RcI/+UXCP/lFwi/5RcIf+TWyH/k1og/5NaIP+SWh//klke/5JZ
-Hf+RWB3/kVcd/5FXHP+QVxv+kFYam5JTGAyQVhkAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAtZBtAMCedwC5lXBTupVw6LmVcP+5lG//uZRu/7iTbv+4k27/uJJt/7eSbP+3kmv/t5Fr
-/7aRav+2kWr/tpBp/7WPaP+1j2j/tY5n/7SOZv+0jWb/tI1l/7SNZP+zjGT/s4xj/7OLY/+zi2L/
-soph/7KKYP+yiWD/sYlf/7GJX/+xiF7/sIhd/7CHXf+wh1z/sIZb/6+GW/+vhVr/r4VZ/66EWf+u
-hFn/roNY/62DV/+tg1f/rYJW/6yCVf+sglX/rIFU/6yAVP+rgFP/q39T/6t/Uv+rflL/qn5R/6p+
-UP+qfVD/qX1P/6l8T/+pfE7/qHtN/6h7Tf+oekz/p3pL/6d6S/+neUr/p3lJ/6Z4Sf+meEj/pndH
-/6V3R/+ldkb/pXZG/6JxQP/Co4P/+ff0//////////////////n15f/k04j/4cx2/+HNef/hzXn/
-4c15/+HNef/hzXn/4cx3/+PQgv/38dj////////////////////////////////////////////8
-+vL/171Q/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/4c17//79+v//////////////
-///fz77/nWs4/5dgKf+YYiv/l2Iq/5dhKv+XYCn/lmAo/5ZgJ/+WXyf/ll8m/5VfJv+VXiX/lV0k
-/5VdJP+UXCP/lFwi/5RcIv+TWyH/k1sg/5NaIP+TWiD/klkf/5JZHv+SWB3XklgbN45bIACVVRgA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAALiZcQC4mXELupZylLqWcfy6lnH/
-uZVx/7mVcP+5lG//uZRv/7iTbv+4k27/uJNt/7eSbP+3kmz/t5Fr/7aRav+2kGr/tpBp/7WPaf+1
-j2j/tY5n/7SOZ/+0jmb/tI1l/7ONZf+zjGT/s4xj/7OLY/+zi2L/sopi/7KKYf+yimD/solg/7GI
-X/+xiF7/sIhe/7CHXf+wh13/sIZc/6+GW/+vhVr/r4Va/66FWf+uhFn/roRY/62DV/+tg1f/rYJW
-/6yCVv+sglX/rIFU/6uAVP+rgFP/q39T/6t/Uv+rf1L/qn5R/6p+Uf+qfVD/qX1P/6l8T/+pfE7/
-qHtO/6h7Tf+oekz/qHpM/6d6S/+neUr/pnlK/6Z4Sf+meEn/pnhI/6N0Q/+2j2j/8uvk////////
-//////////z68f/p2pz/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4c14/+HNef/x6MH/////////
-///////////////////////////////////28Nf/zq0t/8SdAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8SeAP/Hogn/7eCu///////////////////////Ptpz/mWQu/5lkLf+ZZC3/mGMs/5hjLP+YYiv/
-l2Iq/5dhKv+XYSn/lmAp/5ZgKP+WYCf/ll8n/5VeJv+VXiX/lV4l/5RdJP+UXCT/lFwj/5RcIv+T
-WyH/k1sh/5NaIPWSWh50kVsYBJJbHAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAC7l3QAupdyK7qXc827mHP/updy/7qWcv+6lnH/upZx/7mWcf+6lXD/uZRv/7mU
-b/+4k27/uJNt/7iTbf+3kmz/t5Fs/7eRa/+3kWr/tpBq/7aQaf+1j2j/tY9o/7WOZ/+0jmb/tI5m
-/7SNZf+0jGT/s4xk/7OMY/+zi2P/s4ti/7KKYf+yimH/solg/7GJYP+xiF//sYhe/7CHXf+wh13/
-sIdc/7CHXP+vhlv/r4Vb/6+FWv+uhFn/roRY/66EWP+tg1f/rYJX/62CVv+sglX/rIJV/6yBVP+r
-gFT/q4BT/6t/U/+rf1L/qn9S/6p+Uv+qfVH/qn1Q/6l9T/+pfE//qXxO/6h7Tf+oe03/qHpM/6h6
-TP+nekv/p3pL/6V3R/+sgVT/6NzP//////////////////7++//u4rL/4cx2/+HNef/hzXn/4c15
-/+HNef/hzXn/4c15/+DMdv/s3qf//fz3///////////////////////////////////////t4Kz/
-yKQU/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/MqiP/9e3P//////////////////r39P+/
-nnz/mGIs/5plMf+aZS//mWQv/5lkLv+ZZC7/mGQt/5hjLf+YYiz/mGIr/5dhKv+XYSr/l2Ep/5Zg
-KP+WYCj/ll8n/5ZfJ/+VXib/lV4m/5VdJf+UXST/lVwj/5RcI7KSXCMbklwjAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC7mXQAuJh0AruZdF68mXXtvJl1
-/7uYdP+7mHP/u5hz/7qXcv+6lnL/upZx/7qWcf+5lXD/uZVw/7mUb/+5lG//uJNu/7iTbf+4k23/
-t5Js/7eRa/+3kWv/tpFq/7aQav+2kGn/tpBo/7WPZ/+1jmf/tI5m/7SOZv+0jWX/tI1l/7OMZP+z
-jGP/s4tj/7OLYv+yimH/soph/7KJYP+xiWD/sYlf/7GIXv+xiF7/sIdd/7CHXP+vhlv/r4Zb/6+F
-Wv+vhVr/roRZ/66EWP+uhFj/rYNX/62DVv+tglb/rIJV/6yBVf+sgVT/rIFU/6uAU/+rf1P/q39S
-/6t/Uf+qflH/qn5R/6p9UP+pfU//qXxP/6l8Tv+oe03/qHtN/6d5S/+oekz/2cax//7+/v//////
-///////////z68v/4s58/+HNeP/hzXn/4c15/+HNef/hzXn/4c15/+DMdv/m1Y7/+vfp////////
-//////////////////////////7+/f/izn//xZ4C/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8Oc
-AP/VuUv/+vbn//////////////////Hq4/+vhlz/mWQu/5xnM/+bZzL/m2Yx/5pmMf+aZjD/mmYv
-/5plL/+ZZC7/mWQt/5ljLf+YYyz/mGMs/5hiK/+XYSr/l2Eq/5dhKf+WYCj/lmAo/5ZfJ/+WXyb/
-lV4m4ZZdJUCVXiYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAvJl2ALyYdQ28m3eRvZt3+72bd/+8mnb/vJl1/7uZdP+7mHT/u5hz/7uYc/+6
-l3L/updy/7qWcv+6lnH/uZVw/7mVcP+5lG//uJRv/7iTbv+4k27/uJNt/7eSbP+3kmz/t5Fr/7aR
-av+2kGr/tpBp/7WPaP+1j2j/tY5n/7SOZv+0jWb/tI1l/7ONZP+zjGT/s4xj/7OMY/+zi2L/soph
-/7KKYf+yiWD/sYlf/7GJX/+xiF7/sIhe/7CHXf+wh1z/r4Zc/6+GW/+vhVr/roVa/66EWf+uhFn/
-roRY/62DV/+tg1f/rYJW/6yCVf+sgVX/rIFU/6uAU/+rgFP/q39T/6t/U/+rflL/qn5R/6p+UP+q
-fVD/qX1P/6l9T/+meEn/yKyP//z6+P/////////////////48+D/5NKH/+HMd//hzXn/4c15/+HN
-ef/hzXn/4c15/+HNeP/iz3//9u/V//////////////////////////////////r36P/WvE//xJwA
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WdAP/gynX//v35/////////////////+fbz/+kdUX/
-m2cx/5xpNP+caTT/nGk0/5xoM/+caDP/m2cy/5tmMf+bZjH/mmYw/5plL/+aZS//mWQu/5lkLv+Z
-Yy3/mGMs/5hiK/+YYiv/l2Eq/5dhKv+XYSn1ll8odZZdJwSWXiYAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAL6ceAC+nHgmvZx5v72c
-ef+9nHj/vZt3/72ad/+8mnb/vJp2/7yZdf+7mXT/u5h0/7uYc/+6l3P/updy/7qXcv+6lnH/uZZx
-/7qVcP+5lXD/uJRv/7mUbv+4k23/uJNt/7iSbP+3kmz/t5Jr/7aRa/+2kWr/tpBp/7WQaP+1j2j/
-tY9n/7SOZ/+0jmb/tI1l/7ONZf+0jWT/s4xj/7OLY/+yi2L/soti/7OKYf+yimH/sYlg/7KJX/+x
-iF//sIhe/7GIXf+wh1z/sIdc/7CGW/+vhlv/r4Va/6+FWf+uhFn/roRY/66DV/+tg1f/rYNW/6yC
-Vv+sglX/rIFU/6uBVP+rgFT/q4BT/6t/Uv+rf1L/q35S/6p+Uf+pfE7/uZVw//by7v//////////
-///////8+/T/6Nqb/+DMdv/hzXn/4c15/+HNef/hzXn/4c15/+HNef/gzHb/7+W5//7+/P//////
-//////////////////////Tszf/Nqyb/xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8eiD//q
-3KL//////////////////v7+/9bBq/+ebDj/nWs2/55rNv+dajb/nGo1/51qNf+daTT/nGk0/5xo
-M/+baDP/nGcy/5tnMv+bZjH/mmYw/5plMP+aZS//mmUu/5lkLv+ZZC3/mWMt/5hjLP6XYiukl18p
-FZdgKgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAP+cGwC0nokAvpx7Rr6deuK/nXr/vp16/76cef+9nHj/vZt4/72bd/+9mnf/
-vJp2/7yZdf+8mXX/u5h0/7uYc/+7mHP/updy/7qXcv+6lnL/upZx/7qVcP+5lXD/uZVw/7mUb/+4
-k27/uJNt/7iTbf+3kmz/t5Js/7eRa/+2kWr/tpFq/7aQaf+1j2j/tY9o/7WOZ/+1jmb/tI5m/7SN
-Zf+0jWX/s4xk/7OMY/+zi2P/s4ti/7KKYf+yimH/solg/7KJX/+xiV//sYhe/7GIXv+wh13/sIdc
-/7CGXP+vhlv/r4Zb/6+FWv+uhVn/roRY/66EWP+tg1f/rYNX/62CVv+sglX/rIJV/6yBVP+rgFT/
-q4BT/6t/U/+rflL/r4Zb/+vh1f//////////////////////7uO0/+HMd//hzXn/4c15/+HNef/h
-zXn/4c15/+HNef/gzHb/6NmY//389////////////////////////////+nboP/GoAX/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/82sJ//07Mz//////////////////Pr4/8Okgv+dajX/n205
-/59tOf+ebDj/nms3/55rN/+dazb/nWo2/51qNf+caTT/nGk0/5xpNP+caDP/m2gz/5tnMv+bZzH/
-m2Yx/5pmMP+aZS//mmUv/5hkLs6YYy4ykmMoAK1jQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAC/nXsAvZl7BL+efHDA
-n33yv558/7+de/+/nXv/vp16/76cev++nHn/vZt5/72beP+9m3f/vJp2/7yadv+8mXX/u5l1/7uY
-dP+7mHP/updz/7qXcv+6l3L/upZy/7qWcf+5lXH/uZVw/7mUb/+4lG//uJNu/7iTbf+4km3/t5Js
-/7eRa/+3kWv/tpFq/7aQav+2kGn/tY9o/7WPaP+1jmf/tI5m/7SNZv+0jWX/s4xl/7OMZP+zjGP/
-s4tj/7OLYv+yimH/soph/7KJYP+xiV//sYhf/7GIXv+wiF7/sIdd/7CHXP+vhlz/r4Zb/6+FWv+u
-hVr/roRZ/66EWP+ug1j/rYNX/62CVv+tglb/rIJV/6yBVP+sgVT/q4BT/9jDrv//////////////
-////////9e/V/+HOfP/hzXj/4c15/+HNef/hzXn/4c15/+HNef/hzHj/49GD//j04f//////////
-/////////////fv1/9rCX//EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/9e8Tf/9+/T/
-////////////////9vLt/7GJX/+fbTn/oG88/6BuO/+fbjr/n206/59tOf+ebTn/nmw4/55rN/+d
-azb/nWo2/51qNf+dajX/nGk0/5xpNP+caDP/nGgz/5tnMv+bZzL/m2Yx5ZplMFCSYTYBlWM0AAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAwJ99AMCffRDAoH6SwKB++cCffv/An33/wJ99/7+efP+/nnz/v517
-/76cev++nHn/vpx5/72beP+9m3j/vJp3/72adv+8mnX/u5l1/7yZdP+7mHP/updz/7uXc/+7l3L/
-updy/7qWcf+6lXH/uZVw/7mUb/+5lG//uJRu/7iTbv+4k23/uJJs/7eSbP+3kmv/t5Fq/7aQav+2
-kGn/tpBp/7WPaP+1j2j/tI5n/7WOZv+0jWb/s41l/7SMZP+zjGT/s4tj/7KLYv+zi2L/soph/7KK
-YP+yiV//sYhf/7GIXv+xiF7/sIhd/7CHXf+whlz/sIZb/6+GW/+vhVr/roVZ/66EWf+uhFj/roNY
-/62DV/+tg1b/qn9R/8erjf/7+ff/////////////////+/js/+XUjP/hzHf/4c15/+HNef/hzXn/
-4c15/+HNef/hzXn/4c14//Dnvv////7/////////////////+PPf/8+uLP/EnQD/xZ8A/8WfAP/F
-nwD/xZ8A/8WfAP/FnwD/xJ4G/+PRh///////////////////////5tjK/6d5Sv+hcD3/oXA+/6Fw
-Pf+hbz3/oG88/6BvO/+gbjv/n206/59tOf+fbTn/nmw4/55sOP+eazf/nWs2/51qNv+dajX/nWo1
-/5xpNP+caDPxm2gydJdqLAWbZzIAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMGggADBoIAe
-waGBsMGhgP7BoYD/waF//8Cgfv/An37/wJ99/7+efP+/nnz/v558/7+de/++nHr/vpx6/76beP+9
-nHj/vZt3/72ad/+8mnb/vJl1/7yZdf+8mHT/u5hz/7uYc/+6l3L/upZy/7qXcv+6lnL/upZx/7qV
-cf+5lXD/uZRv/7mTbv+4k23/uJJt/7eSbP+3kmz/t5Jr/7eRav+2kGr/tpBp/7aPaP+1j2j/tY5n
-/7WOZ/+0jWb/tI1m/7SNZf+zjWX/s4xj/7OMY/+zi2L/s4ph/7KKYf+yimH/solf/7KJX/+xiF7/
-sYdd/7CIXf+wh13/sIdc/7CGXP+vhlv/r4Va/6+EWf+uhFn/rIFV/7qWcP/x6eH/////////////
-/////v35/+vfqP/gzHb/4c15/+HNef/hzXn/4c15/+HNef/hzXn/4cx2/+nanP/9+/T/////////
-////////6t2j/8ahDP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/yaQT//Dmvf//////////
-/////////v7/0bmg/6JxP/+jckH/o3JB/6JyQP+icT//onA+/6FwPv+hcD3/oW89/6BvPP+gbzz/
-oG46/6BuOv+fbjr/n2w5/59sOP+ebDj/nms3/51rNvqcajaUm2kzEZtpNAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADBooEAwqODL8KigsnCooL/wqKB/8Ghgf/BoYD/waF//8Cg
-f//AoH7/wJ9+/8Cfff+/nnz/v558/7+de/++nXr/vp16/76cef+9nHn/vZt4/72bd/+8mnf/vJp2
-/7yZdf+7mXX/u5h0/7uYdP+7mHP/updy/7qXcv+6lnL/upZx/7mVcf+5lXD/uZRw/7mUb/+4k27/
-uJNu/7iSbf+3kmz/t5Jr/7eRa/+2kWr/tpBq/7aQaf+1j2j/tY9o/7WOZ/+0jmb/tI5m/7SNZf+z
-jWX/s4xk/7OMZP+zjGP/soti/7KKYf+yimH/solg/7KJYP+xiV//sYhe/7CIXv+wh13/sIdc/7CG
-XP+vhlv/roRZ/7GJX//i08P///////////////////////PszP/izXr/4c14/+HNef/hzXn/4c15
-/+HNef/hzXn/4cx3/+PQgv/28Nj////////////9/Pb/2cFa/8SdAP/FnwD/xZ8A/8WfAP/FnwD/
-xZ8A/8WfAP/EnQD/07U9//r36v/////////////////59vP/vpx5/6JxQP+kdEP/o3RD/6NzQv+j
-c0H/o3NB/6JyQP+icUD/onE//6FxPv+hcD3/oXA9/6BvPP+gbzz/oG47/59uO/+fbjr/n205/p1r
-OK6cajkdnmg3AC3/ogAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADDpIQAyKyG
-AMOjhEPCpITUw6SE/8Kjg//Co4P/wqKC/8Kigf/CoYH/waGA/8Ggf//BoH//wKB+/8Cfff/An33/
-v558/7+efP+/nXv/vp16/76dev++nHn/vZt5/72beP+9m3f/vJp3/7yadv+8mXX/u5l1/7uYdP+7
-mHP/u5hz/7qXcv+6lnL/upZy/7qWcf+6lXH/uZVw/7mUb/+5lG//uJNu/7iTbf+3k23/t5Js/7eR
-a/+3kWv/tpFq/7aQaf+2kGn/tY9p/7WPaP+1jmf/tI5m/7SOZv+0jWX/s4xl/7OMZP+zjGP/s4tj
-/7OLYv+yimH/soph/7KJYP+yiV//sYlf/7GIXv+xiF7/sIdc/66EWf/RuaD//fv6////////////
-//////n25v/l04r/4Mx2/+HNef/hzXn/4c15/+HNef/hzXn/4c15/+HMd//u47T//v37///////y
-6sf/zKsj/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EngD/4c5+//79+v//////////////
-///s4tj/r4Zc/6N0Q/+ldkb/pHVF/6R1RP+kdUT/pHRD/6R0Q/+jc0L/o3NB/6NyQf+ickD/onFA
-/6JxP/+icT7/oXA+/6FwPf+gbzz/n247wp9sOi6fbjsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAw6OHAMWfigLDpYVTxKWG38Slhv/DpYX/w6SE/8OkhP/C
-o4P/wqOC/8Kigv/CooH/wqGA/8GhgP/BoH//waB+/8Cgfv/An33/wJ99/7+efP+/nnz/v517/76d
-ev++nHr/vpx5/72beP+9m3j/vZt3/72adv+8mnb/vJl1/7uZdP+7mHT/u5hz/7uXc/+6l3L/updy
-/7qWcf+6lnH/upVw/7mVcP+5lG//uJRu/7iTbv+4k23/uJJs/7eSbP+3kmz/t5Fr/7aRav+2kGn/
-tpBp/7WPaP+1j2j/tY5n/7SOZv+0jWb/tI1l/7SNZP+zjGT/s4xj/7OLYv+zi2L/soph/7KKYf+y
-iWD/sYlf/6+GWv/An33/9O7o//////////////////38+P/s36r/4Mx2/+HNef/hzXn/4c15/+HN
-ef/hzXn/4c15/+HMdv/m1Y7/+vfo/////f/j0IL/xZ4F/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A
-/8SeAP/JpRT/8Oa7///////////////////////ax7P/p3pL/6V3R/+meEj/pndH/6V3R/+ldkb/
-pXZF/6R1Rf+kdUT/pHVE/6R0Q/+kdEP/o3NC/6NzQf+jckH/onJA/6JxP/+hcD7LoG8+O////wCf
-bzwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAMSn
-hwDEp4cDxKeHWMSmh+PEpof/xKaH/8Slhv/DpYX/w6SF/8OkhP/Co4P/wqOD/8Kigv/CooH/waGB
-/8GhgP/BoYD/waB//8Cgfv/An33/wJ99/7+efP+/nnz/v517/76de/++nHr/vpx5/72cef+9m3j/
-vZt3/7yad/+8mnb/vJl1/7yZdf+7mHT/u5h0/7qXc/+6l3L/updy/7qWcf+6lnH/uZVx/7mVcP+5
-lG//uZRv/7iTbv+4k23/uJNt/7eSbP+3kmz/t5Fr/7aRa/+2kGr/tpBp/7WPaP+1j2j/tY5n/7SO
-Z/+0jWb/tI1l/7ONZf+zjGT/s4xj/7OLY/+zi2L/soti/7GJX/+1jmb/5tnL////////////////
-///////z68r/4s57/+HMeP/hzXn/4c15/+HNef/hzXn/4c15/+HNef/hzXj/8ejA//Xv0v/QsTX/
-xJ0A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8ScAP/VuUn/+fXl//////////////////n28//F
-p4n/pXdH/6d5S/+neUr/p3lK/6Z4Sf+meEj/pXdI/6V3R/+ldkf/pXZG/6R2Rf+kdUT/pHVE/6R0
-Q/+jdEP/o3RC/6NzQdCicEBDbq5lAKhpPAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADEqIkAw6iIBMWoiWXGqIrnxaiJ/8WniP/Epof/
-xKaH/8Slhv/DpYb/w6WF/8OkhP/DpIT/wqOE/8Kjg//CooL/wqKB/8KhgP/BoYD/waCA/8Ggf//A
-oH7/wJ9+/8Cfff+/nnz/v517/7+de/++nXr/vpx6/76cef+9m3n/vZt4/72bd/+9mnb/vJp2/7yZ
-dv+7mXX/u5h0/7uYc/+7l3P/updy/7qWcv+6lnH/upZx/7mVcf+5lXD/uZRw/7mUb/+4k27/uJNt
-/7iTbf+3kmz/t5Fs/7eRa/+2kWr/tpBq/7aQaf+1j2j/tY5o/7WOZ/+0jmb/tI1m/7SNZf+zjGX/
-s4xk/7OMY/+xiV//0bmg//37+v/////////////////59eP/4c17/+DMdv/hzXn/4c15/+HNef/h
-zXn/4c15/+HNef/hzXj/5dSN/9zFZv/FoAT/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ4A/8af
-Bv/l0on////+/////////////////+7l3P+0jWX/p3lK/6h7Tv+oe03/qHpM/6d6S/+nekv/p3lL
-/6d5Sv+meEn/pnhI/6Z3R/+ld0f/pXZH/6V2Rv+kdkb/pHVF0aN0RESSXSkBmGUyAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAx6iLAManiwjIqYtqx6mL5sepi//HqIr/xqiJ/8Woif/Fp4j/xaaI/8Smh//EpYb/xKWG/8Ol
-hf/DpIT/w6OE/8Kjg//Co4P/wqKC/8Kigf/CooH/waGA/8Ggf//BoH7/wKB+/8Cfff/An33/v558
-/7+ee/+/nXv/vp16/76cef++nHn/vZx4/72beP+9m3f/vZp3/7yadv+8mXX/vJl0/7uYdP+7mHP/
-u5hz/7qXcv+6l3L/upZy/7qWcf+5lXD/uZVw/7mUb/+5lG//uJNu/7iTbf+4k23/t5Js/7eSa/+3
-kWv/tpFq/7aQaf+2kGn/tZBo/7WPaP+1jmf/tI5m/7SNZv+zi2L/vp16//Tu6P//////////////
-///+/vz/5dSN/9vDX//hznz/4c15/+HNef/hzXn/4c15/+HNef/iznz/2b9X/8eiDf/FngD/xZ8A
-/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0A/82rJ//z7Mv//////////////////v7+/9rHs/+qflH/
-qn5Q/6p9UP+pfU//qXxP/6l8Tv+oe03/qHtN/6h6TP+nekv/p3lL/6d5Sv+meUr/pnhJ/6Z4SP+m
-d0jRpXdGRqJwPAGldkUAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAM6ligDOpIoGyKmNW8iqjeDIqo3/yKqM
-/8epi//HqYv/x6iK/8aoif/Fp4n/xaeI/8Wmh//Epof/xKaH/8Slhv/DpYX/w6SE/8OkhP/Co4P/
-wqOD/8Kigv/CooH/wqGB/8GhgP/BoYD/wKB//8Cgfv/An33/wJ99/7+efP+/nnz/v517/76dev++
-nHr/vpx5/72beP+9m3j/vZt3/7yadv+8mnb/vJl1/7yZdf+7mHT/u5hz/7uXc/+6l3L/upZy/7qW
-cv+6lnH/uZVw/7mVcP+5lG//uJRv/7iTbv+4k23/uJJt/7eSbP+3kmz/t5Fr/7aRav+2kGr/tpBp
-/7WPaP+1j2f/tY9n/97OvP//////////////////////9OzM/9O1PP/cxWT/4s99/+HNev/hzXn/
-4c16/+HOfP/bw17/yqcX/8SeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ0C/93Gav/9
-/fj/////////////////+fXy/8Cgfv+qfU//q39T/6t/Uv+rflL/qn5R/6p+Uf+qfVD/qX1P/6l8
-Tv+pfE7/qHtO/6h7Tf+oekz/p3pL/6d5S8+meElEwoI+Aat6RwAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAADIqo4Ax6iNA8mrjljJrI/ZyauO/8irjv/Jqo3/yKqM/8epjP/HqYv/x6mK/8aoiv/G
-qIn/xqeJ/8WniP/Epof/xKaH/8Slhv/DpYX/w6SF/8OkhP/DpIP/wqOD/8Kjgv/CooL/waKB/8Kh
-gP/BoYD/waF//8Ggfv/AoH7/wJ99/8CefP+/nnz/v557/76de/++nXr/vpx5/72cef+9nHj/vZt3
-/7yad/+8mnb/vJl1/7yZdf+7mXT/u5h0/7uYc/+7l3P/updy/7qWcf+6lnH/uZVx/7qVcP+5lXD/
-uJRv/7mUbv+4k27/t5Nt/7iSbP+3kmz/t5Jr/7aRav+2kGr/tI5m/8mtkP/59fL/////////////
-/////fz3/93HbP/MqSD/2sJc/+HMeP/hzXr/4Mx2/9i/VP/Lpxn/xZ4A/8WfAP/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/EngD/yqgb//LpxP//////////////////////59rN/7GIX/+sgFT/rIFU
-/6uBVP+rgFP/q4BT/6t/Uv+rf1L/q35R/6p+Uf+qflD/qn1Q/6l8T/+pfE7/qHxNyKh6TEAAof8A
-c4GQAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAyq6RAMuukQTKrZBKyqyPzcqt
-kP/JrI//yayP/8mrjv/Iq43/yKqN/8iqjP/HqYv/x6mL/8eoiv/GqIr/xaiJ/8WniP/Fp4j/xKaH
-/8Smhv/EpYb/w6WF/8Okhf/DpIT/wqOD/8Kjgv/CooL/wqKB/8Kigf/BoYD/waCA/8Ggf//AoH7/
-wJ9+/8Cfff+/nnz/v558/7+de/++nXr/vp16/76cef++nHn/vZt4/72bd/+8mnb/vJp2/7yZdf+8
-mXX/u5h0/7uYc/+7mHP/updy/7qXcv+6lnH/upZx/7mVcP+5lXD/uZRv/7mUb/+4lG7/uJNt/7iT
-bf+3kmz/tpBq/7uXcv/o28////////////////////////Pryf/Nqyj/x6IN/9CwLv/TtTv/z64p
-/8eiDP/FngD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/EnQD/3cZp//389v//////
-///////////8+/n/zbKY/6yBVf+tg1f/rYJX/62CVv+sglX/rIJV/6yBVP+rgFT/q4BT/6t/U/+r
-f1L/q39S/6p+Uf2pfVC8qX1PNqB3SwCofE4AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAMutkQDMrZECyq6QNsmukLzKrpH7yq2R/8qtkP/KrJD/yayP/8mrjv/Jq47/
-yKqN/8iqjf/Iqoz/x6mL/8epi//HqIr/xqiK/8Woif/Fp4j/xKeI/8Smh//Epof/w6WG/8Olhf/D
-pIT/wqSD/8Kjg//Co4P/wqKC/8Kigf/BoYH/waGA/8Ggf//BoH//wKB+/8Cfff+/n33/v558/7+e
-fP+/nXv/vp16/76cef++nHn/vZt4/72beP+9m3f/vJp2/7yadv+8mXX/u5h1/7uYdP+7mHP/updz
-/7qXcv+6l3L/upZx/7qWcf+5lXH/uZVv/7mUb/+4lG//uJNu/7aRav/RuKD/+vj1////////////
-//////79+v/j0Yb/xZ8J/8SdAP/FngL/xZ4A/8WeAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/F
-nwD/xZ8A/8OdAP/NrCn/8+zK///////////////////////r4NX/t5Fq/66DWP+uhVr/roRZ/66E
-WP+tg1j/rYNX/62DV/+tglb/rIJV/6yBVP+sgVT/q4BT+Kt/UqWqflAopo1bAKt9TwAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADIsJEAGP9xAMqukSjL
-r5Kdy6+S9Mqukv/LrpH/yq6R/8qtkP/JrZD/yqyQ/8msj//Jq47/yauO/8iqjf/Iqoz/yKmM/8ep
-i//GqYv/xqiK/8aoif/Fp4n/xKeI/8Smh//Epof/w6aG/8Slhf/DpIX/w6SE/8Ojg//Co4P/wqOC
-/8Kigv/CooH/waGA/8GhgP/BoH//waB+/8Cffv/An33/wJ58/7+efP+/nnv/v517/76dev++nHn/
-vZx5/72beP+9m3f/vJp3/7yadv+8mnb/u5l1/7yZdP+7mHP/updz/7uXc/+6l3L/upZy/7qWcf+6
-lXH/upVw/7iUbv+9m3n/6t7T///////////////////////59eP/1rpN/8SdAP/FnwD/xZ8A/8Wf
-AP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xJ4A/8ahDP/l04z//v36////////////////
-//z6+P/QuJ//r4Va/7CHXP+whlz/r4Zb/6+GW/+vhVr/r4VZ/66EWf+uhFj/rYNX/62DV/+sglbs
-rIFUiayBURmrgFMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAMuwlADLsJQTy7CUfMuwlOzMsJT/y6+T/8uvkv/Kr5L/yq6S
-/8qtkf/KrZH/yq2Q/8qtkP/JrI//yauO/8mqjf/Iqo3/yKqM/8ipjP/HqYv/x6mL/8eoiv/GqIr/
-xaiJ/8WniP/Fpof/xKaG/8Slhv/DpYb/w6WF/8OkhP/CpIT/wqOD/8Kigv/CooL/wqGB/8KhgP/B
-oYD/waB//8Ggf//AoH7/wJ99/8CefP+/nnz/v518/7+de/++nHr/vpx6/76cef+9m3j/vZt3/72b
-d/+8mnb/vJl1/7yZdf+8mHX/u5hz/7uYc/+6l3L/updy/7qXcv+4lG7/zrSa//r39f//////////
-////////////8+rH/8+uLP/EnQD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FnwD/xZ8A/8WfAP/FngD/
-xJ0E/9zEZf/69+r//////////////////////+zi2P+5lW//sIhd/7KJX/+xiF7/sYhe/7GIXf+w
-h13/sIdc/7CGW/+vhlv/r4Va/6+FWeCthFhnrYJWDKt+WgC0kUoAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADLsJUA
-y7KWCMyxlVvMsZXOzLGV/Myxlf/MsJT/y7CT/8uvk//Lr5L/yq6S/8qukf/KrZH/yq2Q/8msj//J
-rI//yayP/8mrjv/Iqo3/yKqN/8iqjP/HqYv/x6mL/8eoiv/GqIr/xaiJ/8aniP/Fp4j/xKaH/8Sm
-h//EpYb/w6WF/8Okhf/DpIT/wqOD/8Kjg//CooL/wqKB/8Ghgf/BoYD/waF//8Ggf//AoH7/wJ9+
-/8Cfff+/nnz/v558/7+de/++nXr/vp16/76cef+9nHn/vZt4/72bd/+8mnf/vJp2/7yZdf+7mXT/
-u5h0/7uYdP+6l3L/vJl1/+LTw//+/v7////////////////////+/+/kt//PrzL/xJ0C/8SeAP/F
-nwD/xZ8A/8WfAP/FnwD/xZ8A/8SdAP/Fnwn/2L5X//j04P//////////////////////+ff0/8yx
-lv+xiV//s4ti/7KKYf+yimH/solg/7GJYP+xiV//sYhe/7CIXv+wh134r4Zbv66FW0WuhlgEr4ZY
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAz6+XANKtmALMsZYzzbKXpc2yl/XNspf/zbKW/8yx
-lf/MsZT/zLCU/8uvk//Lr5P/y6+S/8uukv/KrpH/yq2R/8qtkP/KrJD/yayP/8msjv/Jq47/yKqN
-/8iqjf/Iqoz/x6mM/8epi//HqIr/xqiK/8Woif/Fp4j/xaaI/8Smh//Epob/xKWG/8Olhf/DpIX/
-w6SE/8Kjg//Co4P/wqKC/8Kigf/CoYH/waGA/8Ggf//BoH//wKB+/8Cfff/An33/v558/7+efP+/
-nXv/vp16/76dev++nHn/vZt4/72beP+9m3f/vJp3/7yadv+8mXX/upZy/8WniP/w6OD/////////
-//////////////7+/P/z6sj/2cBb/8ikE//EnAD/xJ0A/8SdAP/DnAD/xJ0B/8yrJP/hzX3/+fXk
-///////////////////////+/v7/4NDA/7aQaf+zjGT/s41l/7OMZP+zjGP/s4tj/7OLYv+zi2H/
-soph/7KJYO2xiF+QsIddJLKnNgCwiVsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAADNspcAzrKXGM6ymHLOs5ndzrOZ/s6zl//Nspf/zbKW/82ylv/MsZX/zLCU/8ywlP/Lr5P/
-y6+S/8uvkv/KrpH/yq6R/8qtkf/KrZD/yqyQ/8msj//JrI//yauO/8iqjf/Iqo3/yKqM/8epi//H
-qYv/x6iK/8aoif/FqIn/xaeI/8Smh//Epof/xKaG/8Slhv/DpIX/w6SE/8OkhP/Co4P/wqOC/8Ki
-gv/CooH/waGA/8GhgP/BoH//waB+/8Cgfv/An33/wJ58/7+efP+/nnv/v517/76dev++nHr/vpx5
-/72ceP+9m3j/vZp3/7uYc//RuaD/+PTw////////////////////////////+vfq/+3isv/gzHv/
-2cBb/9i9VP/cxGb/5dON//Pryv/9+/T////////////////////////////u5Nr/wJ99/7SNZf+1
-j2j/tY5n/7SOZv+0jWb/tI1l/7SNZP+zjGT8s4tj0LKKYl+yiGAPsohgAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADjyJcAyrWcAMq5nQPOtJo+z7Sars60mfLO
-tJn/zrOZ/86zmP/Ns5f/zbKX/82xlv/MsZX/zLCV/8ywlP/Lr5P/y6+T/8uvkv/KrpH/yq6R/8qt
-kf/KrZD/ya2Q/8msj//Jq4//yauO/8irjv/Iqo3/yKqM/8epjP/HqYv/xqiK/8aoiv/FqIn/xaeI
-/8SniP/Epof/xKaG/8Olhv/DpYX/w6SF/8OkhP/Co4P/wqOD/8Kigv/CooH/waGB/8GhgP/BoX//
-waB//8Cgfv/An37/wJ99/7+efP+/nnz/v517/76dev++nHr/vpx5/72beP+9m3j/2MSv//r39f//
-/////////////////////////////v/+/fr//fv1//z78//9/Pb//v78////////////////////
-//////////////Lr5P/Iq47/tY9o/7aRa/+2kGr/tpBp/7WPaP+1j2j/tY5n/7SOZuyzjGWetI1j
-LbGSYwK1jl8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAADPtZkA0LabFs+1m2zPtpvPz7Wb/M+0mv/PtJn/zrSZ/86zmf/Os5j/zbOX
-/82yl//Nspb/zLGV/8yxlP/LsJT/y7CT/8uvk//Lr5L/yq6R/8qukf/KrZH/yq2Q/8qtkP/JrI//
-yayP/8mrjv/Jq43/yKqN/8iqjf/HqYz/x6mL/8apiv/GqIn/xqiJ/8Wnif/Ep4j/xKaH/8Slhv/D
-pYX/w6WF/8OkhP/CpIT/wqOD/8Kjg//CooL/wqKC/8Gigf/BoYD/waF//8Ggf//BoH7/wKB+/8Cf
-ff+/nnz/v517/7+de/++nHn/v558/9rHs//49fH/////////////////////////////////////
-////////////////////////////////////////////8uvj/8uwlf+4km3/uJNu/7iTbf+3kmz/
-t5Fr/7eRa/+2kWr5tpBpwrWPaFm0j2YPtI9mAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA0LacANG2nAXPt5ww
-z7acktC2nOjQtpz90Lab/8+1m//PtJr/z7Sa/860mf/Os5j/zrOY/82yl//Nspb/zbKW/8yxlf/M
-sZX/zLCU/8uvk//Lr5L/y6+S/8uukv/KrpH/yq2R/8qtkP/KrZD/yayP/8mrj//Jq47/yKqN/8iq
-jf/Iqoz/yKqL/8epi//HqIr/xaiJ/8Wnif/Fp4j/xaeH/8Smh//EpYb/xKWG/8Olhf/DpIT/w6OE
-/8Kjg//CooL/wqKC/8Kigf/CooH/waGA/8Ggf//AoH7/wKB+/8Cfff/An33/vp17/7+efP/TvKX/
-8urj//79/f////////////////////////////////////////////////////////////z7+f/q
-3tP/yKuO/7iUbv+5lXD/uZVw/7mUb/+4k27/uJNu/biSbd23kmt/tpFqJbeRbgG2kWwAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRtZ0Az7acCtC2nkfRt56q0bee7dC3nf/Qtp3/0Lac/8+1
-m//PtZv/z7Sa/8+0mv/OtJn/zrOY/86zmP/Nspf/zbKW/82ylv/MsZX/zLGU/8ywlP/LsJP/y6+S
-/8uvkv/KrpH/yq6R/8qtkf/KrZD/yq2Q/8msj//JrI//yauO/8iqjf/Iqo3/yKqM/8epi//HqYv/
-x6iK/8aoif/Fp4n/xaeI/8Smh//Epof/xKWG/8Slhv/DpYX/w6SE/8OkhP/Co4P/wqKC/8Kigv/C
-ooH/waGB/8GhgP/BoX//waB//8Cfff+/nXv/yKuN/+HRwf/07uf//Pn4///+/v//////////////
-//////////////79/f/59vP/7+fe/9bCrP+/nn3/uZVw/7uXcv+6l3L/upZy/7qWcv26lnHkuZVw
-mriUbjW3lGwFt5RsAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA////
-AMuwlADQuaAS0LifVtG4n7DRuJ/v0bie/9C3nv/Rt53/0Lac/8+2nP/PtZv/z7Wa/860mv/OtJn/
-zrOZ/86zmP/Ns5j/zbKX/82ylv/MsZX/zLGV/8ywlP/LsJP/y6+T/8uvkv/Lr5L/yq6S/8qukf/K
-rZD/ya2Q/8qsj//JrI//yauO/8irjv/Jqo3/yKqM/8ipjP/HqYv/xqmK/8aoiv/GqIn/xqeJ/8Wn
-iP/Ep4f/xKaG/8Olhv/DpYX/w6SF/8OkhP/DpIP/wqOD/8Kjgv/CooH/waGB/8KhgP/BoX//wJ99
-/8Ggfv/JrY//18Gr/+LTw//p3dH/69/U/+rf0//q3tP/59rM/97Nu//RuJ//wqOC/7yZdP+8mXT/
-vJl1/7uZdf+7mXT/u5h06rqXcqK5lnJJu5VwC66TdwDNmmYAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADRu6EAzsKjAdK5oBbSuKFV0bmgstK5oPDR
-uJ/90bif/9G3nv/Qt53/0Led/9C2nP/Qtpz/z7Wb/8+0mv/PtJn/zrSZ/86zmP/Os5j/zbKX/82y
-lv/Nspb/zLGV/8yxlP/MsJT/y6+T/8uvk//Lr5L/yq6S/8qukf/KrpH/yq2Q/8qtkP/JrI//yayP
-/8mrjv/Iq43/yKqN/8iqjP/HqYv/x6mL/8eoiv/GqIn/xaiJ/8WniP/Fp4j/xKaH/8Smhv/EpYX/
-w6WF/8OkhP/DpIT/wqOD/8Kjg//CooL/wqKB/8GhgP/An33/v558/8Ggf//CooH/wqKC/8Kigf/B
-oYH/wKB+/76cev+8mnb/vZt3/76cef+9nHj/vZt4/b2bd+e8mnakupp1SruZdBG5nHYAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAANK2pQDStqYCz7qlENG6ok3SuaGi0rmh3tK5ofvSuaD/0bif/9G4n//Rt57/0Led
-/9C2nf/Qtpz/z7Wc/8+1m//PtJr/zrSZ/860mf/Os5j/zbKY/82yl//Nspb/zLGW/8yxlf/MsZX/
-zLCU/8uvk//Lr5P/yq6S/8qukf/KrpH/yq2R/8qtkP/JrJD/yayP/8mrjv/Jq47/yKqN/8iqjP/H
-qYz/x6mL/8epi//HqIr/xqiJ/8Woif/Fp4j/xKaH/8Smh//EpYb/w6WG/8Olhf/DpIX/wqOE/8Kj
-g//CooL/wqKC/8GhgP/BoH//wKB+/8Cfff/An33/v599/8Cfff/An33/v558/7+efPm+nXvWvZx6
-k72beT69m3UMtZt4AbibdwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAANS5nwDUuZ8M
-0rmiPtO6ooTSuqLG0rmh8tK5of/SuaD/0rig/9G4n//RuJ7/0Lee/9C3nf/Qtpz/z7ac/8+1m//P
-tZv/zrSa/8+0mf/Os5n/zbOY/86zl//Nspf/zLGW/82xlf/MsZX/zLCU/8ywlP/Lr5P/y6+S/8qu
-kv/LrpH/yq6R/8qtkP/KrJD/yayP/8msj//Jq47/yauN/8iqjf/Iqoz/yKmM/8epi//GqYv/xqiK
-/8aoif/Fp4n/xKeI/8Smh//Epof/w6WG/8Slhf/DpIX/wqSE/8OkhP/Co4P/wqKC/8Kigf/CoYH/
-waGA/8GhgP7AoH/uwKB+vMCffni+nnwzvJ57B72eewAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAADip6MAysagANa3oQbTu6Ij0rqiWNK6op/Su6Pc07qi+NK6
-ov7SuaH/0rmg/9K4oP/RuJ//0bif/9G3nv/Qt53/0Lad/9C2nP/Ptpz/z7Wb/8+0mf/Os5n/zrOZ
-/86zmP/Os5j/zbKW/82ylv/NsZX/zLCV/8ywlP/MsJT/y6+T/8uvkv/KrpL/yq6R/8qukf/KrZD/
-yq2Q/8qskP/JrI//yauP/8mrjv/Iqo3/yKqM/8ipjP/HqYv/x6mK/8eoiv/GqIn/xaeJ/8WniP/F
-p4j/xKaG/8Slhv/EpYX/w6WF/8OkhP7Do4T0w6OC1cKigZPBoYBNwZ+AHMaigAPAnn8AAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAADTuKEAzcWkAdK8pQvTvKUq07ykaNO7oqTSuqPS0rqi7dK6ov7SuaH/0rmh/9K5oP/RuJ//
-0bif/9G3nv/Qt53/0Led/9C2nP/PtZz/z7Wb/8+1m//PtJr/zrSZ/86zmP/Ns5j/zbKX/82yl//N
-spb/zLGV/8yxlP/MsJT/y6+T/8uvk//Lr5L/yq6S/8qukf/KrZH/yq2Q/8qtkP/JrI//yauP/8mr
-jv/Iqo3/yKqN/8iqjP/HqYz/x6mL/8eoiv/GqIn/xqiJ/8WniP3EpofqxKWHzcSkhpnEpIRYwqOC
-IcKiggjBq3sBwap7AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD/fn4AyMiqANS3oAjT
-u6Qr0rukV9O7pI3Tu6O70ruj3dK6ovbSuqL/0rmh/9K5oP/SuaD/0bif/9G4n//Rt57/0Led/9C3
-nf/Qtpz/z7Wc/8+1m//PtZr/zrSa/860mf/Os5j/zbKY/82yl//Nspb/zLGW/8yxlf/MsJX/zLCU
-/8uvk//Lr5P/y6+S/8qukv/KrpH/yq2R/8qtkP/KrZD/yayP/8msj//Jq47/yKqN/8iqjPLHqYvW
-x6mLsseniYTGp4pRxaeIJsanigXFpYYAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAADrk5wAzcurANe5pwXTvaQc0ryiNNK7o1vSu6OD0ruj
-sdK6otfSuqLq0rqi9NK5ofrSuaD90rig/9G4n//RuJ//0bee/9C3nf/Qtp3/0Lac/9C1m//PtZv/
-z7Sa/860mf/Os5n/zrOY/86zmP/Nspf/zbKW/82xlf/MsZX/zLGV/8ywlP/Lr5P/y6+S/cuukvnK
-rpH0yq2Q6MmtkNDJrJCnyauOfcmrjlTIqYwuyKmKF8GuhwPNp4oAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAA1bipANa2qwDTu6YF0r2kDNK7phrTu6Q607qjXNK6onnSuaKS0rmhr9G5ocTS
-uaHP0bif19G4n+HRt57m0Lee7tC3ne/Qtp3u0Lac88+2nPjPtZvxz7Sa7s60me/OtJnszrOY5M2y
-l97NspfWzbKWzsuxlcLMsJSpy6+TjsqvknbKr5FYyq+QM8mrkRXJrZELyKyPBMSqjQDGq44AAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAMy7qgDMu6oEz7ihDtG6oRfRu6Ij0rmhMdK5oEHRuKBJ0bmgV9C4nlnQuJ5Y0Lee
-X8+3nWnPt5xcz7WbWM+1m1nOtJtUzrSaR8+0mj3OtJgvzrOZIc6zlxbPtJUM07SXAtK0lgAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA
-AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAP//
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-//////////////////////////////////////////////+AAAB/////////////////////////
-/+AAAAAA/////////////////////////wAAAAAAH///////////////////////+AAAAAAAA///
-////////////////////gAAAAAAAAD/////////////////////+AAAAAAAAAA//////////////
-///////4AAAAAAAAAAP////////////////////AAAAAAAAAAAB///////////////////8AAAAA
-AAAAAAA///////////////////4AAAAAAAAAAAAP//////////////////gAAAAAAAAAAAAD////
-/////////////+AAAAAAAAAAAAAA/////////////////8AAAAAAAAAAAAAAf///////////////
-/wAAAAAAAAAAAAAAH////////////////gAAAAAAAAAAAAAAD///////////////+AAAAAAAAAAA
-AAAAB///////////////8AAAAAAAAAAAAAAAAf//////////////4AAAAAAAAAAAAAAAAP//////
-////////gAAAAAAAAAAAAAAAAH//////////////AAAAAAAAAAAAAAAAAD/////////////+AAAA
-AAAAAAAAAAAAAA/////////////8AAAAAAAAAAAAAAAAAA/////////////4AAAAAAAAAAAAAAAA
-AAP////////////wAAAAAAAAAAAAAAAAAAH////////////gAAAAAAAAAAAAAAAAAAD/////////
-///AAAAAAAAAAAAAAAAAAAD///////////+AAAAAAAAAAAAAAAAAAAB///////////8AAAAAAAAA
-AAAAAAAAAAA///////////8AAAAAAAAAAAAAAAAAAAAf//////////4AAAAAAAAAAAAAAAAAAAAP
-//////////wAAAAAAAAAAAAAAAAAAAAH//////////gAAAAAAAAAAAAAAAAAAAAD//////////gA
-AAAAAAAAAAAAAAAAAAAD//////////AAAAAAAAAAAAAAAAAAAAAB/////////+AAAAAAAAAAAAAA
-AAAAAAAA/////////8AAAAAAAAAAAAAAAAAAAAAA/////////8AAAAAAAAAAAAAAAAAAAAAAf///
-/////4AAAAAAAAAAAAAAAAAAAAAAP////////4AAAAAAAAAAAAAAAAAAAAAAP////////wAAAAAA
-AAAAAAAAAAAAAAAAH////////gAAAAAAAAAAAAAAAAAAAAAAH////////gAAAAAAAAAAAAAAAAAA
-AAAAD////////AAAAAAAAAAAAAAAAAAAAAAAB////////AAAAAAAAAAAAAAAAAAAAAAAB///////
-+AAAAAAAAAAAAAAAAAAAAAAAA///////+AAAAAAAAAAAAAAAAAAAAAAAA///////8AAAAAAAAAAA
-AAAAAAAAAAAAA///////8AAAAAAAAAAAAAAAAAAAAAAAAf//////4AAAAAAAAAAAAAAAAAAAAAAA
-Af//////4AAAAAAAAAAAAAAAAAAAAAAAAP//////4AAAAAAAAAAAAAAAAAAAAAAAAP//////wAAA
-AAAAAAAAAAAAAAAAAAAAAH//////wAAAAAAAAAAAAAAAAAAAAAAAAH//////gAAAAAAAAAAAAAAA
-AAAAAAAAAH//////gAAAAAAAAAAAAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAAAAAAAAAAAAD//
-////gAAAAAAAAAAAAAAAAAAAAAAAAD//////AAAAAAAAAAAAAAAAAAAAAAAAAB//////AAAAAAAA
-AAAAAAAAAAAAAAAAAB//////AAAAAAAAAAAAAAAAAAAAAAAAAB/////+AAAAAAAAAAAAAAAAAAAA
-AAAAAA/////+AAAAAAAAAAAAAAAAAAAAAAAAAA/////+AAAAAAAAAAAAAAAAAAAAAAAAAA/////+
-AAAAAAAAAAAAAAAAAAAAAAAAAA/////8AAAAAAAAAAAAAAAAAAAAAAAAAA/////8AAAAAAAAAAAA
-AAAAAAAAAAAAAA/////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAA
-AAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAA
-AAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////4AAAAAAAAAAAAAAAA
-AAAAAAAAAAf////4AAAAAAAAAAAAAAAAAAAAAAAAAAf////4AAAAAAAAAAAAAAAAAAAAAAAAAAP/
-///4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAA
-AAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAA
-AAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4
-AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAA
-AAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAAAAP////4AAAAAAAAAAAAAAAAAAAAAAAA
-AAf////4AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAA
-AAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAA
-AAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf////8AAAAAAAAAAAAAAAAAAAAAAAAAAf/
-///8AAAAAAAAAAAAAAAAAAAAAAAAAA/////8AAAAAAAAAAAAAAAAAAAAAAAAAA/////+AAAAAAAA
-AAAAAAAAAAAAAAAAAA/////+AAAAAAAAAAAAAAAAAAAAAAAAAA/////+AAAAAAAAAAAAAAAAAAAA
-AAAAAA/////+AAAAAAAAAAAAAAAAAAAAAAAAAA//////AAAAAAAAAAAAAAAAAAAAAAAAAB//////
-AAAAAAAAAAAAAAAAAAAAAAAAAB//////AAAAAAAAAAAAAAAAAAAAAAAAAB//////gAAAAAAAAAAA
-AAAAAAAAAAAAAD//////gAAAAAAAAAAAAAAAAAAAAAAAAD//////gAAAAAAAAAAAAAAAAAAAAAAA
-AD//////gAAAAAAAAAAAAAAAAAAAAAAAAH//////wAAAAAAAAAAAAAAAAAAAAAAAAH//////wAAA
-AAAAAAAAAAAAAAAAAAAAAH//////4AAAAAAAAAAAAAAAAAAAAAAAAP//////4AAAAAAAAAAAAAAA
-AAAAAAAAAP//////4AAAAAAAAAAAAAAAAAAAAAAAAf//////8AAAAAAAAAAAAAAAAAAAAAAAAf//
-////8AAAAAAAAAAAAAAAAAAAAAAAA///////+AAAAAAAAAAAAAAAAAAAAAAAA///////+AAAAAAA
-AAAAAAAAAAAAAAAAA////////AAAAAAAAAAAAAAAAAAAAAAAB////////AAAAAAAAAAAAAAAAAAA
-AAAAB////////gAAAAAAAAAAAAAAAAAAAAAAD////////gAAAAAAAAAAAAAAAAAAAAAAH///////
-/wAAAAAAAAAAAAAAAAAAAAAAH////////4AAAAAAAAAAAAAAAAAAAAAAP////////4AAAAAAAAAA
-AAAAAAAAAAAAP////////8AAAAAAAAAAAAAAAAAAAAAAf////////8AAAAAAAAAAAAAAAAAAAAAA
-/////////+AAAAAAAAAAAAAAAAAAAAAA//////////AAAAAAAAAAAAAAAAAAAAAB//////////gA
-AAAAAAAAAAAAAAAAAAAD//////////gAAAAAAAAAAAAAAAAAAAAD//////////wAAAAAAAAAAAAA
-AAAAAAAH//////////4AAAAAAAAAAAAAAAAAAAAP//////////8AAAAAAAAAAAAAAAAAAAAf////
-//////+AAAAAAAAAAAAAAAAAAAA///////////+AAAAAAAAAAAAAAAAAAAB////////////AAAAA
-AAAAAAAAAAAAAAD////////////gAAAAAAAAAAAAAAAAAAD////////////wAAAAAAAAAAAAAAAA
-AAH////////////4AAAAAAAAAAAAAAAAAAP////////////8AAAAAAAAAAAAAAAAAA//////////
-///+AAAAAAAAAAAAAAAAAB//////////////AAAAAAAAAAAAAAAAAD//////////////wAAAAAAA
-AAAAAAAAAH//////////////4AAAAAAAAAAAAAAAAP//////////////8AAAAAAAAAAAAAAAAf//
-////////////+AAAAAAAAAAAAAAAB////////////////gAAAAAAAAAAAAAAD///////////////
-/wAAAAAAAAAAAAAAH////////////////8AAAAAAAAAAAAAAf////////////////+AAAAAAAAAA
-AAAA//////////////////gAAAAAAAAAAAAD//////////////////4AAAAAAAAAAAAP////////
-//////////8AAAAAAAAAAAA////////////////////AAAAAAAAAAAB////////////////////4
-AAAAAAAAAAP////////////////////+AAAAAAAAAA//////////////////////gAAAAAAAAD//
-////////////////////+AAAAAAAA////////////////////////wAAAAAAH///////////////
-//////////AAAAAB///////////////////////////AAAB/////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-////////////////////////////////////////////////////////////////////////////
-/////////////////////////////////////////////////////////////4lQTkcNChoKAAAA
-DUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAAARnQU1BAACvyDcFiukAAGisSURBVHja7X13nCRHke6X
-Ve17vHfrZnd21ssj7wWSkAQCZPBCHAgOb4/D3Ft0h+cO87BCAh0PK+HuBAgJo5W3K7fe21kzs+Nn
-2lZVxvuj2lRXZ3ZXz/T0zO7Wx0/sdFVlVmRmZURkRGQk4MKFCxcuXLhw4cKFCxcuXLhw4cKFCxcu
-XLhw4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLhw
-4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLhw4cKFCxcuXLgoH9hsE+Biarj3b+trI7paryqsihSl
-moF3kKHUEkM3AzxE1ASGNk5kAAAROAPqCdQO4CgnNgwiBeZNhYABAIMgFucKHYRBE0xhBzkhYjAa
-VeAdf9+1a0Zmu90uyguXAcxxrFu3znNYa1kEhS8zOHoBWkSELgZqJ2KdTKFGIuYnAEQEAEj9A4BA
-5j9IX7I/k3oi+ztbOFWWc044AmIDBDpMREfAsJcY28FBG0P9yp73vOdMbbb7ycXU4DKAOYQ71q/3
-BkY8izykLiJGpxPDeSC2EkRNxFgIRGp24qb+peyvYpNadj/9TME603WknuGcEwObJNAwAzZzwlNE
-tFFRlN3BQWW7yxSOD7gMYBZx7733qonqVS2qj19iEL8QhDVEbAlj1JqdeNnnRVI+M20zUp5gL0up
-m3n3MxVTqu70T7sWQJZnc8vm0UM0QsAWItpEUB7lLPl4/UjwiMsQ5iZcBlBhrF1LypILN5zPSD0T
-4FeBsfOJEAZEkzv1r1X6TlHK2yV4/nJB/kyxSZ9mKnnlAHCOBAM9R4we5BxP+lT21MdvPi822+Pg
-woTLACqAe9dtqtJ0nEqMbuKE8xjRSgIC6ftUTKoWWqdbnrFL/IJ1yia75aL1nn2yF6aXi+kl6ETY
-QsCjnNE9elLfdPutl47O9viczHAZwAziZ39/+XTi7DpFwTVE7CwAIE4AA1L/mJOEZa9npXz+mpw4
-QMz8zdJqOQOII1UngSFVt7VOMuskRqmyAGcEBpYzeYX0pMpykJTeTFnbxOc8RQ/S98l2H1sAus8A
-/fH2t1/85GyP18kIlwGUGT/7y5Z2rhpXMIZbwOkMMNQJhKtzld1m0Zeu01GClLfbAJAr5R3VLZHy
-eR6I1DWx1pL6l9MkQBuI2M+gKPfffsuFByo+cCcpXAZQJtz94KZTVRhvZYryes5pUVryAemP3yJt
-JYY7R+47+2+Hhrtcgx/LvNNJ3ab8z6c3+4yc3vQzudeZ5b6lLAMYoZ8T/ZbAf/nFd17uagUzDJcB
-TAPr1q3zHEzWXwSmvJeIrgJYtd2ynvrT/DfHGl+64U5YZ46BsCRrffG6i0h5OyMTGhYz90vUeIjH
-iLG/gfO7BnndAz9yvQgzApcBTAFr15Ky+NyNryFGHyKwSwHn7jlH7rvUe0qZtIWkbymGO5mUd+Zu
-zK2bc4LBCQbn4AJDoqIwMDCoKivSF/QIEf9FsG70p7ffdFNyNsb8RIXLAEoAEbGf/m3DdeDsw2C4
-zO6eKyjBp+ieI8uP6Up5MT1ZKT81d6P9OkHnBN3g8HlUNNaEUBPyIRzw5TIuAsZjCUzGkugfiUDT
-Dagqg8qUzFcpYKovE+GbMd3zu+9/4NLJ2fkKTiy4DMABiIj994MvXwngX4nYxamrcnXcifsO+WUK
-ue/SFwsuHwoyBF5k+VCE3qIahDnpGRia6sJY092MJe0NqK8OoCroBWP5n5rBCZG4hqGxKLYdHMKG
-Pf0YGI2AE+BVlQIaDz0NTl+d9DT92V0aTA8uAyiCH//ppbMVFZ8gsBuAmZLyYttAupDdWu+o7pyy
-fGr0yia9rSznhKRmoKW+CpeeugBrulvgUZWS+1rTDTy34wgefnEfjgxPwutVoTCLwTCPHv4gEfvS
-tz9w5aPlGu+TDS4DkOCuvz7fAV35FBh7ByPUlMtwl3ffUsapSi97Jn8dXwK9dsNd3j2xxpNe579i
-WSdeecYiVId80+77iWgSf356F57cfACKokBRWCHGFyPQrwzN+OIPPnbtnmm//CSDywAEuOv+l94J
-Rp8BZ4tzI+wAljbmMaSCbrLBN+lgG6SMfYyZhrB0WSD14VqiYzI/icAYyzCJdFlrIA3PXE/VTQBL
-SXdKB+fALrlT9DAzeIhn6MqSkaaLMWa+MxOQRNK6wQBdN+D1qLjmnB6cs7yz7OPwyMYD+MOjW2Fw
-QFVSoUYCxsUAcEb9jPCVyZrgD39666Xx2ft6ji+4DMCCu+5/6TRO9CUGXAU4l/KlWuunWtYq5YWh
-uSWq9Pl12y39cg1CNzh8XhU3X7ISqxY2z9iYPLvtEH75j83QDS7WBOzLJ84f5wyf/dFHr3WXBQ7g
-MgAAd69bF9AitZ8CsY8So1oAUpeUVV0Xu6yKq/TSsnm++AKGO9uELOqek8UlWMo6qRswjXdEwJsu
-W4nTlrTN+Pg8uuEAfv73jfCoChSWZlbZtuYxPk4awL4X9Sprf/HhV4/POIHHMU56BvCDP75wigr2
-f4nRRUCuNX4qxrf0RVlZslQil7Jc/q4CUj73vqzu6RkxiUyD36vP6cErT19UtH+HEzqeOjaBjSNR
-7B6PQ+OEkFfFspoA1jSEcXZzFYIODIa/eWQbHnhuJ3we1dKvRel9gRH/5F2ffO1DpXwTJxNOagbw
-g/te+ARAn2ZAQ2bCQGQYcyjlBVK2uAZhD7MtPmnF0txmJCxguCtYt6ytKfrimo41i1rxjivXFLT0
-G0T43rajuHNbPzYNTZoGC4Vl3gFOgMeDs1qq8d7eVtza01LwY0xqBr75u2ew7cAQfF6liAaWQ3eM
-CF+NxOJf/s3tbhCRHSclA/jBH15cSIrxdcbYDbkfjUMpL/zg8rfjFtQgikh565srJeWLaTy6QagJ
-+fDB152FptqQtH93T8Txgaf24oEDgwAY4JEwCiLAMPvh5p42fOfshWgOeKX17jkygq/f8xQSugE1
-FVcgZXCW/yMAxOlvhoIP/uJT128v9n2cTFCnX8Xxhe/9z3PXkEr3AjjPlJrp/8wJzC3r4ZRhH+k/
-7NftZbPXKec+J276y4mQ+R+RpTyQ9jaQ9T1kWutFdPFM3ZZ3IbdsTt2WZ7isrek6uY0WmNc4cbz2
-/F70zmuU9u/WsRiu//t2PH1kFPCqFqkvAGOAogCKgs3HJvDIsUlcN68eVV7xZ1lfHYSmGdi07xgU
-JZ3PlDJ9lDc2lrYSsBicblhz2c39Gx+6Z8Nsf4dzBScVA/jefes/AcIdAGsiDsDiVuJpJ1/Gz5Tz
-T+Y65+bFHAnJROo3T087swwsLkGhem7u90+7ENPXCWb99rJp91267jwXYNo/huzkSLfHyiTMsqm6
-Uhc4EYjl9kVSM9Db1YTrz18KRTKpj8Y0XPf3bdgyOGFO/lKgKjg0GsPOiIbXzK+HTxFrDQvbavH8
-jiMYiyTM6MIUE8zkRYCorZmRrCKw16+8/Obg8gvf8OiWR35jTPljOkFwUjCAO+5dX3vVW979XeL4
-VwI83CIdgPJIeYJIyiNPEmekrvB+ft2AdWIWKktCLUAk5a0MrJjGg9Q9hQFvvGwVmuvEqr9BhLc9
-uguPHxouffKnoSrYPjSJJGN4VUed8BGvRwVTFKzffhiqwnI1Hsjbau0LEF3AmHLq0stvfnjbQ/ee
-1HsKTngG8O3/eXqFztgfAFybkXoWKQuLJOS2yW5lFLnMgOeq8nkqPVnKitVy0cSTqbH5Ze1qf4pe
-yOglKZMRTXZYygJANK7jzKUduPz0RWASjf672/rx7Zf7AI86PcuSwvD0wDjOa63B4uqA8JG2hjBe
-2NWPofFYJmjJSVszY2Ne74VBr1526Ruf3fbwvYcr/2XODZzQDODbv3/2YiL8lgErnBjOqOgz5qdj
-Nziln5nuZpriZUvMzVeiq1LkUdA4IeBTcdOlK9EgmZA7xmN4x2O7ENWNdO6v7NqlVGbAGEjn2DKZ
-xNsWN8MrWG54PSqIgPU7DkO12AJkbRWNTerJZhBd33vJTbu3PfKbrSVSekLghGUA3/rds28kwk8Z
-WDuouEqflppZLYDnSniBlE/XJ5Py9rpFZe0qu10LyKtbSm9hKW/XeJz0BRGQ1A0sn9eMK8/qlvb1
-x5/bjyf7RgCPika/DwuqA2gM+BDjHJqeWpizEjiBquDIWAxd1UGc2VQlfKSjsQrPbTuK0cl4Tm7C
-Yv2X0XiyTDIMotf1XnzT8PZHf/PcbH+3lcYJyQC+9btn30egOwBUAYUkYvaXVcrnHpLhTFJnJpqF
-DpmWkVd3pqy87qxNwKGUd6JxWCa97Bnd4LjpkhVorQ8L+/qx/nF85KndqAn6cFlHHa6aV4eVdSGs
-rA9iTUMYXlXB0agOg3hpTADAtokE3tnTIjQIej0qJmIaXtx1FB6VIbVLQ9g36Y6QjQ2Z8+Ca3otu
-wPZHf/tISUQe5zjhGMA37n16LQFfB0Et3XDHhWvtUg13TsrmaQXpOgrRKzPsAXapVrIRM59eIKHp
-6G6vx3Xn9kiDft771B4MxHS8cXEzlteHcmaZX2VYUh1AY8CLXRNJGLwEJqAwjESS6KgK4BUSLaC+
-2o+ntxxCJK6lNlLZpDxs/SHq+9x+v2TphTe0vumylX955JFHyBGdxzlK37Q9R7F2LSnfuOfpLxDw
-edMIl/6g06p7evJwELj5L6X97Ob9jD85z4qfez/HwJdTN2UZiqSsve40fTJ6rXVkP2LK+dhzP2RL
-3dxed/4zsrYanINzwqk9bQj4PMI+f/LYJF4ciuDG7ia0h71IGDxjiCQABgFJTlhRH8TrFtTDp6jW
-RXhxMOAH245iXBN76zoaq7FsXiM0nZsuS0tfOBkbbu8LTiDQPz+b6P3RxWvXeZwTevzihNAA7rhj
-vZfmHfwhGD6SscDLpHzeOj1X8nH7/YIahE1q2soW1AJkddqkfEZaAWKpJijrmF7I6TU4oTrkw5sv
-W4WQIDqPAHx14yHUeFUsqwsiacgntkFAe8gHL2PYNR4rSQs4NpnAGS3VWCFxP/p9Hjz80n5zp2D5
-xuZ0rzHZ0Xn5B/6y/5GfcmfEHp847hnAvffeq/YHwj9iwD/ZDXdpKS8zvgEpHztZjGnITjwgv6yc
-UeROSFifsdWZyR1gM9xZVVOrSs8EZbmAUYjozdUacu9bNRkrvQCQ0A2ctqQNF5+yQNjvh6IJ3LNn
-EGsawtDSFRSAQcDCah9iBuHQRLxwhKAVnDCuE966WLzluDbsx7PbDmN4wmQssrZmx7vw2GT7nk5X
-tfH2t71yzZ9P5OXAcb8E2MM7v05Et3LiNou4TdVDVjPIUbspd92bznKTfi7t8Xdct03ttqvm1nfn
-MpMsEfZyBs8vK6vbTm+WHuf0Gqk6z+xtl/b7M8ci6KryZyZOMSQ4R09NEHddsBgNIb/zpYDC8OSx
-CWwYiQpvhwM+nNHTjnjSMFX4Qm2V9F/OeOeMDXv345GeO8647Q6vM2KPPxzXDODLv3r8/xCnj3JO
-MAxzIHkqBbUZu07Zv63/UTZlNU9NsJyyZL/uoG7KLZ9Tp+UZg2fLEc9+fFSQ3tyyhoSekulNfehp
-lT99L5k00NFYLY351zhhMK4hqCpwMo0JgJcB5zRXYVVdCO9f3gboDqNwFYaJaAL/c2BY+sjpS9sR
-DnigG7zg2Aj7L6d/8/uCE72rJhz4PkAn5Ma545YBfOmXj30ahNvtxqw8bs/zVWWxlChBytskSdrg
-JJKq9jIyKS+TyIWMWfa6S6M3v62cCAYRNINjcUcDakJ+Yd/3xzQciCTgcTglkgahtzaEBVVmINGt
-S1rQXBU01wVOoDD8fv8wYoZ4Ob5qYROa68LQDF762EDQF7B9K2Dvuvgj/+/Ls/3NzwSOSwbwpZ89
-dgsnuj3LvblUyssln0Ta5klNLpXyXCJJ0v9RWsqnJ1gxKS+qm2z0lEpvRso7KJu67lUVnLlUnuln
-82gUMYMLU33bQQT4VIYzG8OZj21RlR9XdtUhs3unGFQFG4YnsWVUfKq416PizKUd0HTDwdgg+20U
-HdecfvzUBR+++7Oz/e2XG8cdA/jCzx+72gD9gDjzZqU8HEt5cyLK3WH5UlNSp33tnKlPLuVJKuWL
-08tLphc5bc32UQENAoBhcISDXiyb3yTsf50IG0eiwhBdEQwQmgMeLK0N5ly/rbcVKCF1OOkG7tk3
-KL1/Zm97dinFHWg8yI5rWmAUGxvO8fnzPnD3O2blw58hHFcM4As/f/xUzvnPiRBMf8CZdR3ZpFoh
-KZ+Sqtmy9nW65b5gHS+W8siR8nIbALfR60ArsdErk/L5NgCLBiHRhOxtTWgGVi5sQViSmONwNIlR
-zQBzGORvcGB1XQg+G8N4RWMVTm+qziQEKQ6GfxwZQ0LyfHdbHbqaa5DQjXwpT0XG1XZfpjES4DGI
-f//c99110WzPhXLhuGEAa//fEy3cMH7ByUzflV07W9b6SFvMbVIgJRnsFvUcDSKnrKmd2o1v6Tpl
-Ut407CGHORj2uq2SBhZ6bMuFNL3W2IU0vUbqvQaHraz52xC0NVfyZX/b26pzjlWLWqTjsHUshrhh
-OHLlE4CgR8HquvwwYr+q4A0LG7N+uWJQFWweiuLZQfHu3frqAHo66xFLGsK2mhMatm/G1hd2Dcw2
-Nmb4MAtysJ+d9f4fLZ3N+VAuHBcMYO3d6wKMaz82CCvMAeGWCWwx9FgGLIeTpyWuVf3NmSSmF8HK
-SDgkk10g5Q2r9RmWum3MKdf9aGFStrJWejP2jFRbjdTHmKWXZ8rm1G1ray69WQlnbaumG2isCaKn
-s144DklO2DORABzK/yQnLKryozkoDqq7tqsedSG/MybAgEQiiaeOTYhvM4Y13W3wqgqMtMXf2lbK
-FRBWps5t/ZZrG8iOjUXbnM8N5e5XfPBnNbM9N6aL44IBcLAvceDatPqb/yGL3WHZQS5q4Mm5n15H
-QuCey0z2goa73P+K0Sv+6CAuK6nbsTFL5qokU/1va6hCR4M49n40oeFwNAGPg/U/wQxgWlLtz+Tv
-s2NNfQirGkLZtEbFoDL8/fCY9PYZS9sQDnhNd2C5xsayhLMKGYDO05Kx/4u1a4+LOSTDnCf+cz9e
-91YAHyUSG7PyVDeLgaeYi01quLNKA1vZPBcR5dOTZ3CyGu4E9NqNVfnGzQJ1y+gpwdCYvgYQersa
-oUqMcwejSUR07uijIQKqPAqW14UKPndJWy0cJw1QFDwxMIGjMfF5oPNbatHeWAXdKHVsChtG0+2x
-ljNTw7FbTj3c9YEKTYUZwZxmAJ/70T9WctA3TWkuNmZlVWU7ty/dcJeR8k40CIHmkFtW7J4TqfZO
-tBInbZ0KvZm+4ASFKTitp4D7bywmleZ2cCI0+D1oCRQOonvd/AZAdcgAGEM0qeMfR8Zkt7G6uzVl
-CJSPjUxjzE7uLGMoOjZkfPWUf/rBJbMyQcqAOcsAPnnX49VcZXcCaLKv9Z1J+VzJmJbyZLtuDRSy
-S3mpcShNj83QmHdf4J6jIlK+WFvFLitn9BLP7QurEdMwOGpCPixoqRWOR8LgOBxJOt7HYxBhRV2w
-6HO9NQGsbqhy7g0wOB45Kl8GnLK4BaDcCS3TeNJjkIZIyhcfGxYwwO449dYfz9z5aDOIObvlUUVi
-Lec4F4BFDaPUv6nflu1x9mesO+eEZdO/IfhNmdrzyhS7n1unrO5s6aL02NpaKr3Ieae8bEI3cHpn
-A6qCYom9fzKBSd2A4kBdJwAextBdFSj6bNir4qL2GmzsH3e2NY0xrB+KYEIzUC1IPtrb2YC2+ioM
-jEbg8Sj5fSHrI3tfZ34TSNZ/2eeXJijxTQBvddCCOYU5qQH8yx1/v5qIPiQKpMl338mlvF2ly3eH
-CdbpGW4vWEunpWjRDSYSGwC3SxLJOl1EL5cEFUnotUv5XA+ERYqlyiY1Az1djZkce3YciCQQ1bmj
-TXwGEVqCXrQEnR0Vfn5zNZTUaT9FoSjYMRrDngnxAcDtjdVob6pCQrO4AwtI+fx+tPe9XGO0jg0Y
-e8vSt3//XRWYHmXFnGMAn7zrrx0EfJdzeK1Wd7svnqe++JzNNDx3zZe3bsvzEoit8XkWYRLXw1NM
-yBp0Iixr+S9nnV4KvSSmNxP5xi19IXBV5tGethsYBF3nCAe8WCJx/3EiHIomoTjU/3VOaA/6UOVx
-9nmd01SF+oAvK1ILQQEisSQ2jIp3B3pUBd1tdSk/vqUvCoyNYbehCL6V/LHheWMD0JeWv+MHPbMy
-caaIOccASGO3c6JuuzErbayilFTjZJt4Tg13NqOc0HBHZGMUIsOdKJ48W7eUnjyDVOmGO7Gr0toX
-BfYHCOrWuIGasB8L28Tr/4jO0RfVHLn/AMCjMCyo8jt6FgAWVQfQUxN0HhTEgEePyg/9PXVJGzyK
-Am5kg6vsY0PcGpxlMxYWcfVmA7byBEFzUuffWHHjWmeqzxzAnGIAH/3Bg68j0D9Z1TOh4c6qGktU
-el5EtSvFxZajJmbKUl5Zu8HPSieX1M2L0Gt3VeYtbzJlKbM/QEyvvK26ztFYE0JTjTjx50BMw1hS
-d+b+A+BTFPTUFF//W3FFR63zhxWGJ/rl53msWNAMr0cBB88fd8mSaCpjI3a50rUJf9M7ZmSCzADm
-DAP46J0PNDDOvswJzPoBi1RkuZS3xczzwpJP5GIzbNK0kJTPc89Nkd4ctTLPPWdzVQrpddJWLiib
-ff/Khc1SC/+BaMLR8hwwx6zep6LJX5p9+eK2GmdLAABQGPqiCeyV2AE6GqvQUheGpsvHpnSNMav1
-5ZW1ldM4/XvnW77dVaGpMy3MGQYAjX2aGHrzDXe5nDlX9bK42iyGMMdagEDKC/fxC8s6MA4hXysR
-0suzUlmu8aR3O+ZKeedtFdObZi7L5ssP/DwQcc4AzNRfAcf2gjSW1gTQXO18GTCZ1PGkZF+A3+fB
-mu4WJDTN0dgUHu/C7uUcDSL1PxBaFc6+hOMgicicYAAf/Pb9p3ED7ytkbJEZyPIlX4HdgJm/BXvC
-ue1d9rplUqIYvYVCSzNlJRpPqW0VBT8VMTTqBkfA58Wi1jrh2CQMjsG47viAH4MTFobF63+dE3TJ
-BG8N+My4ASdhwYyBNB0vDEXEt2EuA5IaL3FsslK+qB2m+Njc3P7Gb19R4alUMmadAaxdu1YBY18l
-UKiQO4znrIudu8PsUl4kVaUaBAqsBfPqzqdX5C6ETcoLXZUSKS+jN9NWQNp/Mo0nqRuY31qDesmx
-X0djGsY1w1GwHiegyquiWaL+H4lpeKRfbLzzqwxrGkKA493BDBuHI9Aly4bFnQ2oCvmgGzx/vGEf
-bxTWlopoYCINggg+GPiP9mvvCDls0axg1gOBhprOeQMIr8yowCgQJGO7LwuMsX4TsrJ5dduelz5D
-goAbSZ32AJxSysraaqdXWGdem8TXQWYAUFdTjXT//7G4hohmwOcgeYdBhFa/F02Suo5Ek/jJjgFc
-0lYjDCk+vaEKzJsK3inGcFQFm0djOBrV0BXON7p3NVWjsTqIQ0Pj8DLV0gfyvhCOjegbc/gtgehs
-Hph4L4BvFO28WcKsagAf/uYf6jin2zPbckEZaWYGWFBO+KrJbXnmmfR2W7MsshLP7uaxqGz53oPc
-94rKZteElndmtJIsPZk943Ypz/PLWutMlxXRa2+rnV5DSC/ytCXr2tZaFhxY0tkgTe91NK6VZABs
-9HsQkvj/90USuO/AMOKSsN+zGsMIej0O4wEYDk/EcSSWFN7uaKxGU10QSY1ngnVybSa2frRft/a3
-YGzyvlWr1sezBlpw5WNNr/tGe/EGzQ5mlQFoauDdRFieNs5k11Op7DZIW3GtKZvNSWVYXVuZstlE
-G9n98fmGw9yAD2vaLHPyGDnPp20GNlUwY6mHGZeQjkoUWYbtRrmctWK2rSJ6zbZa6BHQyyGwIVB6
-O7F13YucyW9wMwCoWxIAZBDhSDTpeAOQyhg6Q3IX+KP945hMJLFxRJzbr7c2WHTzUA44x0ZJQJDX
-o6C7vT7VB0jlWrDlkchJ1iLamCUfm7TQsX5LZBkb4mntgDoB/tGZnEfTwawxgPd/5/eNhmF80Kkx
-y5AY7nJSPUvK5rne8sqKDY2iOvMi7ux1Fyg7NXplZfONVTkBS7x43Qbn8Ps9WNQq9sEnDI4jsSQU
-hwFAjKEgA3i6fwIg4MVhsfHOozDzNGCHngAwhqf6J6S3e+c1gYFl+qKY6zRvbMj52ORokDaBRhy3
-Nb7mq70VmlolYdYYgK75P0KEeYWNWfnx7Rm1VuYOy5TNH5Ci7rACxrdChrs0PSJ6BcahkujND0gi
-aVkrU5IFJFnp1Q1CfVUA7ZIEIINx3Yz/dzCeBCCgKFIGcDiaxIFoEuCE547Jg3guaqsuKSJwvcQT
-AABrulukBtOc4KxCrtUiY4PMuNjGzGIXIFCtAfbJ8s+i6WNWjIDv+eYfFuqG8f50YilK/V+pxpZs
-WbsBx2pQFN0vXKeVFmHdZafXbmiUGCUF73LcVkGdusGxbJ7c/38k5nz9b3BCW7UPQcn6f9NoFONJ
-HWAMuybi0IngESwtlteGzPwATgyBYDiW0DCc0NEg8Dwsbq9HfXUA45FExsZhH5uc/pKNt60ThN9M
-8bF5S91rv/zt0f/99EaHXVoRzIoGYOie9wOsPkfK27hsfkis1Zgl2Gtv1SDy3DgoWGdB91xe2cL0
-CjUISOixuSplbkZrW4tKKUlbRfTqBqGrWZ7Wri+acHx2hwGgNeAVTmoAeGk4ikRCAzwMO8dj2D+Z
-ED7XGfKi0enRYQwYjGvSJUUo4MXCtjokNaOgxij6lvIleb4Gkb3uaGwCus4+NnOzamqoOAN469d/
-12KA3uw0bDW7phYEcYjW8URF123WLDjpQbWvjaVrwSJ1F6RHtI63ruWl60xnGX9KpdfgHMsXivP/
-cyIMlOgBaC2w/XfDcMScDYqCo5Nx6XbeBeEAuqsDzgKCFIZEQse2MXFdIb8HSzrqzQxBBccmP++f
-fSeh3XvkdGxyvyXcEL7yKysrOd+KdmGlX+gl7zuJo6OwlJev02VhtiST8jxXypOtblHZPE7Oi2sQ
-+fRSjsTIBOHkSQkqua1yjcY5vbpBaK4NoaNevP4f1wxMaIajHB2cgLBHQWvAI61r21gMUFOLPoOw
-fVwyaT1KigE4/KA4x45xsSeAMYZF7fXQjGyKsJzAHp6V5BCMTVbKC2woOeMuHxur5gBOVRx8TiUN
-qagN4M1f/lO9wfV3mos729oVgrW0dV1s+Z3zjMMgnJLW6UWeKZ3e8rV1KvTmPUdmCvCW+jDqJFl7
-RpMGxjXDUUw/ByHs8aDRL3bhjSR07Bq3HAmuMLw4KDferawLOs8TqCjYNhpHklPe4SMAsLC1FiG/
-GRGoMJbpXy4Ym2w/lTY2eXaFnHGyjB0AYrgteNVXvhd74F/7nDVwZlFRBqAw7fVErIdAeZ1c1JjF
-kJXimetiw52w7iLPCI1DzFLGIsGF9ML2wTDBB1SwrLVt06M39132smbJRNJAV1O1lAGMJDREdY6A
-gwhATkBIVVDrE39OuybiGIslwdIGQoXhmQKegDObwmCqw4hAhWHrWBRjSR3NghiCpV0NqK/yY2gs
-CkVVLRPf6dhYvEAljo0IDGggMt4B4AtFO7YCqNgS4LY77vCSwf6pVGOWNRoro1pRKtAi84x4OZA2
-/MgMd9bIujx6gMyJOSLjUJbefOMQIXfpUbSt6bYVpRdSegkAOPLflWdUzdbTKlH/AWAg4XwDEAPQ
-EfJK04U9J9i1dzSWxGhSFz6/si4En6IABSZSBgpD30Qcx+LiujoaqxD0e6EblDP5c8eGCowNCo6N
-6Hsr3mHs5tprvlxf/MGZR8U0gPHBpksY8TNyVHO7lAdsLiuLelZEhc7nzGI1rJCLzS7l8+8L3i+h
-p1jdjumV1JnXdnKo8aT+9nlVLO4Qf4NEpt++lC29zQUi+F6y++oZMKEbeGE4gssEWYhaAl50hf3Y
-PRZ1dGQAEWH7eEyYhbi+Ooj5zTXYdWgYHp6Wd7lSfjoa4xSxKmnwywH8djqVlAOVMwJy3ECATyTl
-ZS6rdJhtWsJbjS3FpXzhuq3GN2v4rF2q5kh5QdkcKStw6+VpECXSa6UHsEp4q5QvUreNXoObR4B3
-t9cJh4pAGIzrjhKAItVHsgAgToStY/bQX4akZmDTiNh451eU1M5A55PspWG5TWFxZ72ZHiw91iRx
-rZagMU4XBPaOaVdSBlREA7hx7b1tBLopfRy81Zhl1QLKZbgrutYW1GHXRGRlS6q7ZEOjyCCV209S
-G0AJbTU4R3XQhyWdDcLxGk7opgHQSQpwAsKqIt0BeDCSxGBCg5WbMAaQwbFL4gpkzNwX4JgBEOHl
-4aj09or5zRl3nKP+K4+UL0b0Jd5XfnGV9rfPbprBlxRFRRgAedQbOVFdbifnfq1C1VowWOWw1ouf
-cVZWel9Cr7AOyOkRlStHW633dZ3QVBtCtURqDyV0GESO1G8DhDq/N7Vmz8eOiRiGROtzBmwdjUkj
-Atc0hByfGAaYWYs0TvAK1JaerkboaSnucGxmHiysKPRGAJ+r0AuFmPElwMVr13m4zt/AOWWytJLF
-qCUN3rEGbfD8wzGzJ7WWsGEjp6y5201UNu/8+EJ1S+iVBeFY6c0z1BWk10lbHQRQEUEzDCyd1yhd
-4x+NadA5OZp/nICmgEcaArx7PGFGANonpsJwMJLAUFx8zl9n0Ad/wOtMC2AMg3ENA5KtwfNaqtFQ
-HTDjASR9XC7VvhQwhutxxVdqp1/T1DHjDKABw2sAvAKZNVXuWtm6ZTY9GazHV2e2z+asjfPLWo/q
-JrKXza7l86ICSXBEuH3iccFkg3Xy2j6odGQYcqPOMnYNpHMW5O/oK9ZWK7057ybJbrZ0nciudzWD
-Y36BEODhpC7NtGOHwQmNPo/0Q9o3GQdIwEwUBfvGY1Lr/aKqAFoDDrNrM4ahhI69ETEDqA370dlc
-jaRmzOqEFxC+0q/SabNJwYwzAEb61UQUtBrhzL3ZNhcVz+7LzhpjzN85iT/I5nIjm8sNQDrnX35Z
-ymE+REBe4g+R+w42SW2jNzdpiM1ViRR9loQUOanDqLS25iUN4RJjlsU4aKT6yMokeySbgAwiDCY0
-Rx4AAuBTmdQDoHEyPQCC5QFjZizCIYnUbgt60ej3ONYAonENfRHx/oKG6iDmt9SCG8ZMf+4lg4G/
-aTbfP8MMgJjO8Uaripw5JdeqZgvuF423t0ncjHTnhU7RlcfGZyYHFTtUI/++/XTZzPLG/s5ibRXQ
-a0holtObYgpW7cJSt2Zw1IYD6KgXnwEQ0zkmNMPxEeA+RUGdTxwwHDc49kWSkLoTGMNGiSfAqzAs
-rHK+KQicY6fEqOhRFXQ2VQP6bEt8QR8ydnX15V9qnH5NU8OMGgGv/7ffnG4QemG1vpZozLI/Y/UY
-lOqTJ0uFeca/Eg13cp+887J2eqZHr7O6Nd1AZ1M1WiU5ACZ1A2NJZyHABEJAVaRZfIaTOnaORVHI
-n7h9NCa911sXhOPjiBWGnaNx6e2FbXWAykDkvMpKgBF1JFR2LoA/zcb7Z5QB6LpxDRjzcoupP/15
-Zj/k1L85kyb/frqslFGUUnfmevYP6zUqQC9sZaVWZAk9+YytdHeitKwDRpHUOerCATRITu6J6Nxx
-ElAiwK8qqPGKP6PtY3FzE4xUAwA2jMjdd6vrQ3AcjMAU7J6MI8EJfkGZ3q4mBII+cE7S/IezAsZU
-xuhSzBIDmLElwI1r7/URo0usYauyTDXZNTFs922egrQ0Q/46XVq3bW1sD91NB4Zk6hDQa5Wy9rK5
-ddvW9gJ68usoTK+VnnQflZr3wEqvoRtoqQ8h6BNL7aMlJAEhmDkAZPPppeGI2ABoe19UF6/Nl9cG
-4RgM2DkeR0KScHRBaw1Cfu8cMPwJSCdcjWvXzkr68BnTACaSiSWMK2dlzkaxS1mrJLRcN/91ptLL
-nrEO8lRVenlZKju9YnrEZaVhqw7bqigM8wp5ABK6YwlJABoLhADvmYyj4HxjDOOaju3jcZzWkG+T
-6Az5UOf3YjSpFdfbGcOxeBJ9kaQwJHhRex38Pg/GInE4UG4qDNYbNLwrYsD6Sr955rqCq6cTY1V2
-aZkvGQVSFWIpnyOxUSiLkFjK8xypagnvtKnlIimfLiusW0KvI43HIuWt4cBc0tZM3ZC3VVh36h5j
-DIva5PtQjsU1x/E3RISOoJwBbBuNFTbiMWAiqWPPhNh6H1QVLKgOoBSVZOeE2KbQUB1EW0NVKdHF
-lQODQpxdNRuvnjEGwDm/Mu2Tz81ia1H1C1n6DUmmlYwvXGT9pkzGH/t1StdhdT9aA5Is1nZhlmDO
-pfSShN7shLR7LKz0Ii/IKTfDrLituanFSUpvbqZgDqYwaRpwIjMK0PGyG0C9ZAvwhGZgOK4XlNyM
-MRhJQ5odqNqrosdpdqCUJ2BrAaNiT2d9xjU758BwMWbhLMEZWQKccdsdXoPo7HQspylhmUUVLWII
-c2T1dm58y3+XPSFJbtniVnjnhrtcb0V+X5SzrcXoJSIoCsPCFvESYEIzpGtoOwwiVPsKHAIyGcfh
-WNKBEY+wX+K/B4AltQHnewI4mYlHJOhur3fGTGYBRFgWuOKr8+J/x4FKvndGGEBtbWg1ETqQM5EI
-srWxc+u3c3eipWNzymbX8SLLurO1vP1++hm5td5elqbeVhLQV4TeNAyD0N5QjcYasb3pWEJDghOY
-w01AdV4VIY84BqA/rmM0oTlI6KFg97g8S/D8sL8kv93BSFLq6utur3e+nKgwGEMn9+orgROAAXCO
-c0BkWnUEEtkqZXPup8o7NdxZJR0sZYUahqxu5P4u6k4sSG8JdRdsq8BVaZPyheiFpG5N51jYVgu/
-JHBnNKFD49yREdAgQpVXRVCSuutgJAEjqYP5inxiCsOBSALjSUOY2rsr7IPqU81jthwYAgfiGiKG
-gSoBY1rQXlvYJjGrYEzhOAPAXyr51hliAPw0llZzKZfplhQkY/m4s8+U7pOXSVBhGZlUzdAjsdZb
-Knaq0RStuwR68/rCVpCIkNQNLGyrg08itYeSOpKcEHCQj48DqPd7pAFDOyfiziQ3Aw5MJDChiRnA
-oio/6nxeDMWSxbUJZhoxB2Iaqqrz29haF0Z9QxgT0SQ8c88VADCcZdoBWMW4VNkZwMXvu7eKU3R1
-zlq64Lq48Ecv/cAlk6ckFVkywYqt4x3XLaAnj94S6nTC/NIXRfQmNQM9nfKo05Gks1h5AuBhTBoC
-DAB7x50xAMYYJhMajsaTWFDlz7u/sMqPGp8HQ9EEinIAhWEormEgrpmZhW1oqAqiuS6M0YkEPE7S
-HVcYRDgPr/zPEP6GyPRrc4ays0GuxJs50UpRppU895jNfWd1WRXLgpPzW1R3ahJwW5m8IB5k72e8
-Ann0wpGrUpTNR5pVRlInl7XRyphsZbP9ZAsIsgYAkZkGrK1BvAdA44SxpO44DZhXYdIQ4CQnbBmN
-lRDFB+yQGO+qPCoafR5na3fGEI8ncSwh3mHYWBtES10YNEcNgQyoDzF9WSXfWXYNQFf1pYxYlSjt
-8pSlvBMNApIyJRsap162nPTaabHfK5RARFS3pnM01ASwUHIQaFznGE3qjrJxE5m7ABv94s8nphs4
-OOlAZc9UCGksAAB0V/uxvt9hXYxJPQEhvxet9WHzaOm5CMZUA8ZqAM9X6pVlZwBk0ApTMqZcs9ZJ
-wpBVTy1MgbHUwQkWt2G6LIMpFdPPMJb6nblO5lbbdApvgQss+x7KlkXGdWym8E69n1LvNOnNagnm
-+yjbDp7LAGT05qYHN+tEml5QJj+AtR5KuSoZy53EjJGNXotglNCbbqtuGKgNBaRHgcU4x4jDTUAA
-QWUKGgqkAZ/QDTjnAKmgIQkWS/YtCMGYGYEowbzmmlROspLIqxgYY2cA+O9Kva/sDIATOyP9WXLL
-10lpnTl9xSK1RO65dNmcWHikGYXlPmXrLiap05qfve5cS3pKvc9cz38fSFC3hN40U4K1Tqs5394X
-2auZtuaq/iRvq4DetCamGwYaasxoOBGG4zo0Lj5cI2+MYWYB9ksMadvG4tB5KQyApGcFAqn8gE7B
-gD3j8rq6WmrBPOpcnf8AscWVNASWXwPgfDlgN6yl/7WrrUXcc1TkvrVO6yTO+V162XLSazfcyVT9
-crS1EL0gwoK2Wqldrj/hPASYE9Dol1vR9k3GzYecnu7DGIaSGiK6gbDAOre42u+snlRdO8fjkG1C
-XNxeB59XTWl6c5AFMMyrvvzLDRP/wFAlXldWBnDqB3/czHXewMCEa1dH7jDR87b7zup0WLfQBlAq
-vamnJJNeVLbgu0je1lI2OuWAMaySHAQKmO4zpyAitBU4CHTjSBQwOJhTVxtjGEsaOBRNYmlNvrRv
-DfgQ8HkRNwxHYnsgnsSkrgu3KS9qq4PXoyCpOaur0iCitoTHaAKOQwaAJDo4qCazhjabJJDIU5Py
-het0WHcRw9106EWR60XbKtMgLPTY3Z+S6Z4PxtDb1Sy9PVgKAwBMy7wABif0xxzs3suhzTw/8GBE
-zACqPCpagl4cmNAdBAMBSYOwbzKJNfX5NC5orYXPqyKhzb30YCb5rIGp3lYA2yvxvvK6AbneAc7q
-rO6wnD3qOe4uucvKvJ9e3+e6E3PrlJW11S1wzwnz/qF0egu5KtMgh20V0WunJ+cdTic/zG3AyxeK
-YwA0gzDpcEJwMidkncQDcDiWxL7JhHMXIACAIZnUzb0DAtT6VMwL+xzuCWCIG/INRsGUJ8CYu5uC
-FOi8q1KvK6sGQKTMI0aK3UKdL2VLV82LrosLli2m9kvClAV1FL9eQEWfJr1ThW5wdDXXoLFabEwb
-TOiIcnI0ZzkIVV4PwpJNQIMJHYMxrSQGkD4o5GhMrIWEPAq6wr7cD0haGUBcvsHI61Ewv6UWW/cP
-opIHY5UEhoWVelVZGQAn3mE5oDbzIXOe6yZLu9Io7SZD9iKlXWMsK1FN11+qbPpdNpdgZhJZyqb9
-ataJRDxVR8rFJqwztSHG6sc36YWN3iys0tnuvoPldyF6s4yivNJJNzi62+tQExYb04aTOuI6d2QU
-MzihxqtK04DtjyQwGUsU3wNgh8KkUhsAOsN+57sCDY69Eq+CwhgWtdeVdOxY5cEWVupN5WYA7dkt
-zTapirTamp2cmbVtnuTLNYTZXX9Wa33aoyZzh2WOI7NrDqI6ycYsrHRlCkrsBgJ6M/dta/tC9M4I
-NANLOhsQ9Isj9wbjGuI6R8DjTCJWe1WpgN/tMAQ4D4yhbzIJgwiqoHxHyAt4lAwzLggiHJWcEQAA
-81tq5uy24BSOwyXAjfeqnA+1gZFDY5bluoVR5JVl+RNO6u6yTS5pnbZn7NcZk0/estJbQSyb1yyd
-N8MJB8a1FBTG0FYgC9DLQ9GpMYDUrsC4wYWuwK6QD6qqmEeWOdgT0B/XoHEOr+BMgnnNteZhCXMU
-BGqr1LvKxgCWtB3xYNxXmyM5LSp0qZb+TFme+4xjaz0KT0Trdfs9skX5Oak7U4I7aFMFwTnBH/Jh
-niQJiEaEwYSzEGDAdO3LQoCBVEquqbjXGLBnIo64QQgLqu+uCiDgURHRdAd1MRyLaxhNGmgO5DOA
-5rowfGE/ODcTpMw9sJZKvalsVhBtnAd1Mjpy02WZmlb+QR6CAzus5SwHZuQdIEL2gzGKHwKSa/EX
-XE+l70rfM3jxAzukB4sI6C3NXl9eGJyjviaEVYvELsCkQRiIJ4Vqtx0EQGUMXZJDRSO6YZ74O8Ul
-QEQ3MCAxBHaFfQh4VDjqRsZwNMUARGiuDaGmKgCD5uoygPyhV3+tIlpA2RhAkHtUgAUzZ9VbXW2A
-I/dc+lgua3JMuzvMXqfMxSZ3z6W62DLh88qWSK99N+DsTfd8cALCAQ8WSPYATOq6eRKQw01AIY+C
-Kq84CnDneBxxfeqTigjYK7HetwV9CKuKY0/AaCyJMYm20FQbQn2VH3zOLgOYR0/GqyvxprItAQzm
-CXDD6EjbAAsFrFgt3unf1idKUrttY2hfp0NStljij4L0zKJKXyqIcyyb14SwJHLvaNT5OQAGEdoC
-PuG6GjDPAYgkndsT8oklHJBs5GEA5oV9ODAeLV5PKtmo7ODRppog6qoCczZBKGPkVRVvTXL6VRVF
-2TSAeFInYsRy9tqnpS5EEloiVYmKSnnp/vi867l78XOCi2x159Mrzh8w2yp9ySBg9SJ5BGB/XCsl
-5yYaAx6pvWDPRAKk8ynZAMzNkYUThJpnBTqvUJYiPBTwoqU+PJc9AT5dNSpiByibBqCqejXnKrNa
-+KWGMjiX8nbDHZdcL1S2qOHOVkZ0/7gF51ixQP4tHYkmUzsGnSQCJbRLPAAEYPuYOeGmbFbjhP0T
-crm3oCoAxxyAMewuEFewqK1OeGrxXAEzlIp8emVjAFxnXcQoEzCTlwsAuROSIRsXkHnGss/dWi6z
-t50VUMeLuP7SwURZr0F+opITYsJbQETw+704ZXGr8L7GCaNJw1ESUAIQ8Ciol3gAIrphSm+n7gQJ
-DkXlsQA9NaVpAIW2BS9qq8ccPCIoCwUVUU/KaANQiNmNb6l7Ikks0hRgm5Ci4J2puhPTEYDH4zp+
-qtB0jiVdDWiS7KcfSeqY1LmjOcuJUOvzSA8CGYhp5um80zl4kzEMJ0yaagWGxgVVfjDGHI/YjjG5
-BrB0XgM8CnMUV1RxEFMZqK4SrypfIJCugytK3oQsFEiTvZZ/3bxXWKUXBvigsJQ/kSe8HVw30N1e
-j5Y6cR7AkUTaA+AkDThQ7VGlMQDH4hqGY3Gw6WTbVBgG4xqORpOoFTCtRr8XgYAPsaSDvQaMYUzT
-MZjQ0CSIgOztajRjAOYiB2BQOLHjyw2oIyvZc4/Dyjf+AQJXoUPDnXWXntQ9l6kj9/7JNPkBAAbH
-0s4GaQrswYSOBOeOv/8anyJlFhtGHVjni4GZR5P1S6z3zQGPGYPgxBUI86SjbWPyswIba0KZjElz
-DYwqswQo6yLIkATgWDPi5gfnUM71vEAbexCO/W/rGXhzKABntsGJoAa8WLFQbgA8FHUWAASYQrIr
-JM/M8+zAJKYrShlj0BIa+uNiQ2CDz4PWoMdhLABDTJMfPBoOeLFiYTN03UFk4QmM8mkAhpETgAOU
-IuVJKuXTWkBmQtvqzHENnrTTPR9EQDjow+puMQPQiXAkliwla5c0AhAAthc4k68kMHmCUL+qmEeF
-OZGNDCDNwE4JXQGfB8vnNZpuyzkIYpXZq1zmfAAC9xxNw3DnwJ3oQgzOCTVhP05dLGYAMZ1jOO7s
-HACCeQ5As+QcgMGEhr0T8fKspRkraL1fXBMo4bwBZtIlgXlY6Fz8kogUhuFKvKl8DIAzRmYUQEZK
-M+uef6sxjuXu+U9PaGvUIJCN03Cne+kwOMfy+U0ISbYAH4klkUwnJygCnooAlJ0EvHU0hpHpRABa
-wRi2jEWlST17agLOXY0Kw/bxOMY1AzUCr8KSrgYEqgIwOEGdW5uCdCI6VokXlU/NIKMvbXjLnmtv
-WjLyNs9wM0Ygey1VJrOON+0JrlI/DXAu9f8D5im6BpEjoa0T0Bb0IiAxJu4cjyOSKDEPoAwKsHsi
-jogu3shzSn0IPlV1ZgdQTA1gXJLubElHAxpqgjDmYkQgVYYjlY0BMNU7bnBOuRM9d8eeYTPciYx+
-7qQvE3SOV/R2Sm8fjWmpvfXFwYmk6j8AbBxNZQEu0yc7md5VKEB3dcDMF+CEdMYwFElgr2R/weL2
-OrTUh8Hn4ElBpPLjiwHwWFIlAhMl2pQZ7twJPzPQDI7Gpmr0zmsQ3k8YHMNJ3XkEoKLIzwE0CBuH
-o2UMq2VI6FxqCAyqCpbXBR27AgHgpSGxi9LnVbF8XpPz6MLKIekx1IFKvKhsDCDp8cQ50ZG0lDfy
-pLzrnqsUDM3Aoo56LGitE94fTRoYTujwOGAAnAhhjyLNAjSu69g2Fi0xC7AcjAHQDWwYFR+QqzKG
-UxpDJRnvXhiSH7a7urtlzgUCETHNAI1V4l1lYwCqquqc06R9NyB33XOVh8GxuL0etZIkoINxDaNJ
-3XEOgCqvKt0DcCiaxKHJBFg5l6xEBcN4l9eWwgAILw5HpAE/Z/S2zz0NgJGheHls+hUVR9kYwJiX
-JwzigxmfvjvtZwVEAPOqOG2JPJL0YDTp+BhwAtAa9EoDhp4djJSkjjuComDvRAJjkow+K+uC8Pic
-BwQNxJPoi4qDi5bPa0JzY9XcMgQStNifP3u4Eq8qnxeAzUsyYoOVINpFIRB8Xg/OWtYhfeJgJAGn
-EfsEoLNAAND6gckZYAAM+yYTOCo5KGRR2I+WsMOdgYzhWEw3DZUCNNUEsXphM7Tk3DkpiDE2WKnD
-QcvHAH5zkwHQkUoQ7UIOToTG2iBOl2gAUd1Af0xzHksDYFGVeClBgHStPh0whWEkEsdBidSeX+U3
-k4M4sd4rDHoiaRoqBQj6vThtSTtgzB0GAKIDlXpVWcMNCXAZwCxD0zlOW9ImXf8fjmqIc+7IA2CQ
-GX9fI8kB2BdN4FC0TP5/AZ4YGBdeVxlDT3XAeUUKw9MDk1K355lLO+AN+sHnTJJQdqhSbypvvLGC
-ihHuQoKkjrN6O6QTfH8kgbjhLADIIEJL0IsqyRbfTSMxHJ6Ml80DkAPGsP7YpPT2+W3VzhN6KAqe
-H5qUnn949ooOMyBojigBBKrI+h8otwbAWX+lCHeRD04EX8CLM3rl6/8jsaTjLbCcCO0hrzRMdvNo
-FIbmLKNQyVAYNo3GEJeo+ec1Vzt33ykMfZNx7JTsDFzUVodFbbVzxhDICDsq9a6yMgAPsUNEGK0U
-8S5yoekGOlrrsGqhOAloRDcwENcc+f8JgF9haJdkEyYALwxGZvR8zWNxDVslAUHzw34srgk6dwcS
-4f6+Eent81bOc2ZTmGkQODxKX6VeV9bhYzrvA1CRAAYX+SCdo7u9FgskpwCNJnX0RzV4HKjsRISA
-R8WCsJgBRHWOJ49NzFxiTYUhktDxzOCE8HaVV8V5LTXOJy0nPDEwIb19xRmLK2R3LwwCxjnnFfOm
-lXX0Ig99th+MXFfgbEFhuHjNAqlKvncyAafpLwhArVdFg2Q34f7JBA5GppkDsAAYABiGNNMQA3B2
-cwlnZygMW0dj0niANYuasWheI5La7BoCGEOfz+OvSBgwMDMKXMXWLy5ywRQFF69ZKL2/YyzueMAN
-AuaH5f7/R/rHzJN1ZjKMVlXw4mAUk5Kdgac2hBAOOjw2XFHQNx7FS8Nit2V7QxVO62kDT856hqAj
-k3/6+FClXlZ2BsAIL1WKeBdZ6AbHvNYa6SEgcYNjIK45nq8GEbqrg9L7jx+dMHcAzmSjFAUbBifR
-Lzkv8NSGEDpCPmcMgAFkcDx9TLwMUBSG81bOA/Oqsx2/uqNSQUDADDAAYuylShHvIgs9qeOCFfNQ
-J5m0ByIJRHTuKASYE1DjVdEWFMf/j2sGNo9O8RjwEsAYEE1qeHZQ7A4Me1Ssrg86r1BV8McDI9Al
-DOP685eioTYIPoveAALbUMn3lX8JQGwHiCamX5ELp0jvuThnRZfUJb9vMomI7uwQUI1ztAV9aJJs
-Ad49Hjdz7U3zEBBHYAz3H5Rb76/qqnNel6Jg02gEmyR2he72eqxa2AJ9tvIEEhkqGesr+cqyM4CE
-XxkisO2VbMTJDt0gNNaHce5KcQIQjQj7J+OOMwADZgYgmbvw5ZEIorHEzPj/BXh+KAJNIrUva6uF
-z+cwsx0DuMbxpwLuwGvPXTpriUIJbDjK/RWdO+XXAO77l0nGaGMlG3GywzA4ujsacOpicfz/RFLH
-/kjCmfsPgFdR0F0lTwH+2NHxyp2rpzAcjCTw/JB4GdAZ9OHs5irA6aQlwsNHxs18iAJcc/YSNDVV
-QdMr7w1gwHr87RNlOGDBOWZgFBkR8GIlG3HSg3NcdupC6QEgeyach/8CQEBl6JbE2htEeHxgonJJ
-NBSGyVgST0nCggMeBee31jgPCPIoeO7YBPZI0oUvm9+Es3o7YMzO7sCnKmkABGYojosxvACgTIni
-XRQDYwpedVa39P72cee5JQxO6Aj5pPH/Lw5FsH8yMTPx/6K2mQ3EI0fGpJt5ru6sQzDo1BvAMB5N
-4q9HRqXvu+7cpbNwcCgRV3hF1//ADDGAeDjwAsjdGFQJJJM6Tulpw+k97cL7UZ3jcFRzPNAaEXqq
-A1ID/8P940hoZUoB7hQeBf84MiZ1B76iqQodBWIW8qAy/HSXPF7t9RcsQ0dzDfQKhgYTWJ+ieTZX
-7IUpzAyb++3HY8ToyUo35mQE1wycvawDdZLtv/sm4xhKaI7y3nMCQqqCBbL9/wQ82T8BcOfLiXJh
-MqHj0X7x9uCAquDKjjrnywCFYctIROpebK0P47pze6AnNGf1lQEM2BX/+6cOVuyF6a6Yuarp4Uo3
-5mSDwTl8IR9eeeZi6TM7J+JIOpywRir9d5dEmvbHk3hxOFI5A2AKDAA4x+/2yQPkbljY4NwuwRji
-cQ337JVrAW+6bBXCIX/FtAAiPFbp9T8wgwyAM/U5ECpq0TzZYHDCvJZaXHHGIuH9uMGxdTQGn8P1
-OgHoCPngk0zwzaMx7B+NglXC/2+HwrB+OIqBuFgqr6kPY2lDlfPNQSrD/xwYxlBCHPp74ap5OGtF
-F/QK7Q1QFP7HirzI/t6ZqliLxncS8NxsNOpkAU8auPacHtRKTu3dP5nASNLZ+X+A+TGsrgtJ7//x
-4HD+2Y+VgqLg4FgUz0i8AY1+D17dVed8GaAq2DMckRoDFYXh1itPRUVSBhPtiEW1bTP/IkE7Z6zm
-R26PA3hkNhp1MoAI8HoUvOa8pdJnNoxEoTv8fjmAaq+K+ZL1v0GEdUfGK2b9t4MxM97htwWXAY1Q
-fV7nSUoZw9075Efwvfb8pVjd046kNsMbhBj+ikdun5x+RaVjRhdzjCl/A9EcSbR0YiGR0HDa8k6c
-uVRu/T8QSTi3/nPCkpqA9ADQp49NYNf4DKX/cgpVwZ/7RjAkMc6d01SF0xvDJWgBDE/0j0uNgbVh
-P952+Rpwnc+c5kNkMMK6SnSfCDPKAOIPfOoJMLZ1thpXCEQE3eBI6gbiSd38L6EjntBs/5n3EpoB
-TTdgzIHjpNMUvO78XtRI1P89k3EciSXhdRj9pwJYXhuU2tEePjqOaDyJWT1GR2EYiiZxf9+o8LbK
-GN68uMm5HYAxROMJ3LlDnsnulitXo3te04zlCSDGDnsp+fAM95wU5TseXAhGhC/9DwNWzVYDrdAN
-Dl03AN0APCpqwgHUVgVQHfLBoyjoaq5BKODNcHuFmVFofYPjiCV0TMaTGI8kEJ0wE2GoPhVej9MM
-++WDwc3Y/5svXSl9xjwPz9lkNYhQ7/eYqbYFiBsc/zg8DjBWUfe/HQwAcY7f7BvCW7qbhcrIa7oa
-8KXqII5Fk842K3k8+PWeQXxqdSeWCKIfW+rCePc1p+HT3/8bUEKogWMQ1o3/9fbhindmuvkz/QKF
-8z8SUz4GhtD0aysNnFOKc5sTekFbPVYtasbCtjqsWNCMJZ0N6O1qwILW2qJ1TcaSODAwjl2HRrD1
-wDFs3ncMz20/jJ19wzB0A2CA1+upyDnzeiyJm685DYva6oT3R5I6dk3EHOX+A0yNeV7YhzrJpprd
-E3E8fnQU8FQ6Ok4AVcGjR8axfTyG5bX5W4G7q/14ZWc9frn9CKA6YM7MHNuf7BzAl06fL3zkPdec
-jp8++DJ2HBh0vvHIKRh+MRvdmMaMM4BYQnvBH/C9wMAuqFSjiAiJuAbV58GpPW246qzFeP2Fy9DV
-XIPG6iB83tKldlXQhxULmrBiQRNec14PAODYaBTb+4Zwz7rNeHzTQWzZfwzxWBI+vxfKDDECXeeo
-rQ3hlledIn3mhaEIIjp3tPkHMCXraQ1h6f0/941C0ziYd/YZAFMYxqIJ3N83ImQAAHDLkib8aveA
-aQt00gUKw093DuC9va2YLwioqq8O4BM3nYt3ff2PIKLy7YIk2pow1Gdmrzfh+ISoqWP/I9y7+PIG
-MPaqmX6VphvQEjp8Pg+uOXcpvnDrpfjSP12Kq1+xBJ1N1agO+qCWMcY7HPBifkstXn32ErzjylNw
-Zm8HfD4P9vePYmIiDgMk3aAzVSQTGt5w6Qp86HWvEN6PGRz3941iQjMcbf81iNAY8OBV7XXwSWj9
-+HP7cWgyXt4DQKcFhkMxHbf1tgpdnN3VATx4eAx94zFnRkuFYSKaRE3Ii0vbxNrgqoXNeGLzQezq
-G4anTMs+An5i/O0zf57NnqzIAtaz6FWHoNC7MTOrKNOYF9dQXxPCW161Bt/5wNX46A1nY8WCZvgq
-tEb3qAp6uxpx/fm9uO68XgT8XuwfGMPISARMVR374guBc4Lf78UPP3oNOpvECTG3jcXw+MAEPApz
-JPySnHBWUzVW14tXaC8OR/BfGw8j4fA0oYqAAYOxJE5pqhJqAQyARwX+d9+Qc68FM88heGN3E2oF
-ar6qKljYXo97Ht4Ew6ByaHhxRaFP6rseqtghICJUZHboe/4+pi65bDkDO2X6tWWR0AzoSR1tTTW4
-9epT8c33XYnbrjkdnU3Vs/qxNteG8Kozu/Gac3vBGcO2/YOYnIxB9XimZURLxDW88fLV+MD1Z0mf
-+WPfCIYSuiPpz4ngVxVc1VEnPf77zh0DeGDfINhcWP+nwBgD6RwaU3DjwkZhn3ZXB/D7vlEMRRzu
-XGQMsbiGCAeum1cvfGRhay0GxqJ4asN+eLzTXD0TPRp/4HNfme2+rNyocvwMhOT0KzIlfjyaQEdj
-NT79tgvx1Hduxbc/cCVOXdJaseY4wZLOenz3g1fhj196I155Tg8SSc3cSTcFaDpHTVWg4OTfPRHH
-3sk4PA6ZjEFAe9CHhVXivf8Jngq8qfjWWAfwKHjw4DC2jomjzWu8Kv65t7W0k4tVBffsPoYXhuQH
-nq5920VYsaQNielmDyb8eDa6La/JlXqRUXfzQTUcew0D2qdcBycko0k0N1Tjwzecg+988CrccNFy
-6UGYxTCpGzga0/DScAR/OzyOPx4cxq/3DeFPfSP4U98I7ts/gseOjWPHeByDCR0qMyPSAiVOiPkt
-tXjjpSsxr6UOG/cOYHB4AoqqlqSlaPEkbrpCLv05CH/qG8Uhhwd/pPvzVR110s0/j/aP4+sb+gDV
-2XKikmCMQUvq8HpVXNUpkdhVAfxy3zAmkw63LzOGRFJHX1zHW7qbhI8E/V4s7qjHHx7bBs3gU10K
-bPfq7DPJvf9wnqhhpvqxki/zX/nldzFGd5ZShoiQ1A2QzlFbE8KbL1+F9153BtZ0t0yJhpdHInhy
-YBLPDUxgw2gUG0eiSOp6NrpGJDBY6v8UhmV1IZzXXIWL2mvxyvZaMy11CTh4bBxfu+dJ3PXnFxGP
-JeHxeYoaCuMJDYs6GvDIN9+Oec3iU3/2TMRxx45+KMzZZNU5ocHvwft621DjE8uBtz22Ez/fdhRs
-Cl6TSoAMjsaQHxtee4p0HD7/ch9uf3YvUEobDI7/vqQXtyxulj7yb3c/jC/cvQ7+cKDkSUSEf088
-+Jm1s91/QAU1AAAILbx8vwZ+E2OoKyb9OBESCR0G51jc2Yi3X3kKvvuhq3HrVaegtT7s8I0mdo3H
-8dPdA/jYs/vxjU2H8dvdx/DS4ASORJMwAHON6OS/lPHpxYEJ/M+BIdyzZwhPHJtE2KugM+R3tOuu
-NuzHq1+xBJeethDHxmM4ODCOWCQuNRTGEzpqwwH86BPX4izJoZ8GEe47MIL+uO7Y969xwjnNcuPf
-/skEPv38AUR0Yw5Z/21QGGIJHbUBLy5uEzPGpTUB/PbgKMbiSecGQSJsGInhxoWNqJYwjgtWzcOW
-Q8PYtKsfqkd1zAQINMQM9b36nr/PiSP0KsoAknv/EatbfVUN57g0ltCgawZ0InBO0AwOPamb0Xqc
-EAp4ceVZS/DxG8/FV999BW64aDla6pxPfE7AfQeHsfbFg/jkc/vxxz3H0DeZQMzg5ppWVTKTuiQw
-lloTM0wkNWwdjuBXu4/hkf4JaCCsrAs5Cr+d31KLN122CuesnAefz4O+Y+MYi8Sh64bZL7oB3TCw
-qLMeP/rka3DdOT3SuraMxvDQ0THHln8CEPQouH5eA8KSD/wnuwbw+10DYLMQ6egU6bZuG4vjrYub
-USVoS7VXhV9luH/fYAnHiTOMTMYxbBCun98gfERVFVxyygL89fm9ONw/Bo9DDYMBd8X/+pl7Zrvv
-7H1YMRwdHe3uOxZ7+nePbGl+dOMBHB2OIKHpCPq8aK4NYfn8Rly4ZgHOXzUPC1trS/ajjyYN/OHA
-EL61+Sg2j0zC0Awzgm2mvQI6BxiworEKn1nThTcsaCjJVnBkeBLPbD2M57b3YXtq2+2lpy7CTZcU
-ZnwTmoG7dg7gSCzpWPonDI6zm6tx08JG6f0z/rgRm4cmwOaiAdAG0gx8/qxFWHtql/D+cELDxfdv
-xqbhSedMgMwkKr+4pBdvWtQkfWzzvgFc97l7sPfwCAKScxQtmDQ4u0D766dfnu0+S2NWdDvO+dcZ
-Y58AgAMD44jEk6gK+qTrWydIcI67dx3Dj7YexYsD4xa1vYJNJACcAwRc2tWAtad14eLWqbfJCX6w
-7Si2jccQdiipORFUxnDb0lZp6q/f7BvCTQ9tAxxqFLMNMghd1QE8c+1qqS3gF3sG8dZ120r7JgyO
-lnAAT1yzSrhPII3HNx3EG9bei4GRSDEm8N/xBz5z62z3lxWzwt4ZY98johEAmN9Sg+Xzm6Y8+XVO
-+PmeYzjrvg3458d24sVjE6bBR62A1M9rGMz3ehSsOziMKx7Ygg8+vReHomXxfubhoaNjeH4o4njy
-A+baf3ltUDr5dSLcsb1/5s/9KydUhr6xKO7eJT9U9y3dTbhyfqPz8wMAQFUwMBHDOx7bJT2gFDDt
-Ab/+Pzego7kG8YQuSyESNxj7xmx3lR2zxQD2AfjJdOt56OgYXvngFrxt3XZsHJrMTL45Aa8CnRv4
-7oY+XHj/poL556aCXeNx3LVjAA0BTwkGKCDkUXFxm3zz0xMD43j8yOjc6UcHYACgKvjm5iNmynIJ
-vnj6PFQFvM7zBQCAV8UTh0fx8Wf3F3zs0lMW4IGvvBkru5uRiIkYPv1c+8un59yBObNm4fn85z+/
-jYjewhgrzaQPYO9EAv+y/gA+8sxe7BuNmru+5qKlOmUwHI0l8du9gzgQ1XBmUxVqpulWG07o+Miz
-+1Dv86DGp8KpTEsYHOc0V5sn6UjwoWf2Yctw5LhY++cgFckXY8C1XeK4gI6QD2M6xxOHR0sLblIY
-nu8fQ9DnxQUt1dLHWuvDuObsHuw+OootO4+AFMXcHUqIGgy38V0P9Tt/aWUwa6PMGDsA4FullEly
-wve3HcWFf9mEu7akjh3wqrOao8IRVAVQFNy99Qgu+PMm3LNv6se/xw2OjzyzFzGDoy3kheFQmKX3
-/J/fLP+AHz46hgf7Ritz6GeZkdYCfrZjAM8NyrNrfXZNJ05trXWeNCQNVcG/PbcXP9h+tOBjC1pr
-cc+/vR7/8d5XoibsRzyaABju1h74bEVP/XXcrNl8+dq1a7cCuIExVl/s2U2jUbzj8d34zsY+TCR1
-c7fH8fSdMgAqM7WBfUPYN5nE2S3VUj+zCEeiSdz48A7siyRxWUeN9MBMEZKccEVHLVZJ/P6cgI89
-tw+bB48Py78I6ejA3VENb1/cJIy09KsKltUGce/eY+Yx4U7tRIyBE/BA3yhOawqjt1Z+LLnXo+Ki
-NfNx4Zr56B+NDmw9PHQLdq8bd/aiCvfZbBPAOX8nY0waF30wksBPdg3gW5uOYDSWnJm1KSfzP6Lc
-9SGD+YHMhEdBM9BdX4Uvnzlf6o6z4oHDY/jwU3swqhu4dUkzPApzvJRNcsKCsA/v7mlFQNJ/fzk0
-iuv+ugXGFEIj5hIo5Yn58cU9eGeBvSGfefEAvvzcfsBXogzkhCqfB987rxtv724u+rhhGJ/yeDxf
-m+1+kWHWx5qIGBE9wRg713p9z0QcP9k1gJ/tPIYDY9Fs4E45wMlUARUGpipYVB3EmvoQeuuC6Ar7
-Mv70iG5g70QCG4ajeHEogslk0txBUy5aDA4whrf2tOLjK9txqi0pBxHw+MA47tjRj19s70fY78W7
-eltQ6/VAc7jJJe32e2dPMxZXi6WWxgkX/WUznj4yOqd2/U0VZHA0hfx48bVr0CXJmZjkhKv+tgXr
-DgyXFiYMAJygAPjOeYvxvmVt0seI6GUAFymKMielPzAHGAAAfHHDgYuf7I/8tT3o83EQto7GsHk0
-ivFYMutaKwc4ATpHMOjDmU1hXNVVj2s669BdHUCVVx7OmeSEkYSGvx0Zw2/2DmHdkTFMpLWR6WoF
-BMAwEAr4cFZTFc5qrkJb0IstIzG8MBTB1tEoEnENgYAXb+xuwoIqv/RoaxESBserOupwZWed9Jkf
-7RjAex7bYTLEubLnf5ogzcBbe9vws4vkEZQ7x2O49IHNODQRL/0bS2mLHztlHr58+jzZYSqvY4z9
-z2z3RSHMndG+89HvgvB+sJQOWk6V2zCDc9qrA7i1pwWvnd+AVzRVTbm6F4Yi+OHWI/j53iHE4uVi
-BJRdigCppQcAYvB6GF6/sAnLakNIcufGq4TB0VsbxK1LWqThyYejSZx+3wb0RxNzN+Z/CiACQBw/
-v2SZdGcfYOZPeP3ft5r2gFLbT6YmeeX8JnznnIXoqcnRsH4D4M2MsRk+VGB6mDuB3tff+pzf53uL
-wVBdtslvEMA5VjVV46Oru/DDc7vxmvkN6CxxB58d7SEfrpvfgOvm1WPUIGwZiYJSS4opI21rsO5T
-IMDnUXHd/AasrA+XNPk1Tmj0e/F2SYx8Gh9/bh8e7Rs5IVR/KxgDwAlPD07iNfPr0SiJ0OutCaLK
-68FfDw5nbT6lvERRsHs4gt8dHEF9wIvTGsIgomMA3qooyjHnlc0O5g4DuO/uaN1Ntw3EdOP1ZZGm
-BkdnTRCfOqUL3zmnG6/qqC04EaaC1qAPNyxsxAVtNdg6HsfhiRiAMjEvTgh5Vbx6Xj1W14dKsvjr
-3MxZ8ObuJnQWODb7d/uH8Ln1+8DZiaP6W8EUholYEtsmE3hzd5M0Lds5LdWY4ISnSo0PSENVMJHU
-cd++QWwZi+GC1trP1fo9s5rrz3EfzTYBefjJ478CY2+cUlky1/h+n4r3r+zAp1Z2oiVYdINGWRA3
-OP5ryxF89aU+TMSTpRuWrDA4GoI+vHZeAxZU+5EoYfIbRPAwhpsWNuKUApl+j0STOPvPG3FwPHbc
-uv2cgIgAnfD5VyzE2lO6pM8lDI63PbYLv9nRP/XYEiIgpv3jyesWX3fe/PmznuzDCeaOBpDGG255
-AZy9AYyVtjkgtc6/ZkETfnFxL25Z0iLd6loIUZ0johswiKSn5IrgURguaq3BpR212DmZwP7RaOl2
-DCKAgBUNVbh+YSNag14kS0hpZRDgVZSik1/jhFuf2IVnDo/N6e2+5QBL2VKeODqOFfVhrKgTe0I8
-CsO1XfXYPpnElqHJqS3nGJuEDzf/+OI1h2a73Y5Jnm0CRKj5+bM3x3X9V0kiB+damVJ/YV0Inzt1
-Ht7Z01JSoyZ1A08dm8TzQ5PYOx5HXzSJiM4R8ijoDPmwoNqPC1tqcF5ztaN9/oCpDXx982F87eVD
-mIwlAW8BIyEhk7euMeDFOS01OK0xBMaYaZhyCI0TfEpxyQ8At7/ch8+v3wfVoyATDEo5/wAwtzdn
-fs/+iWjTAukcjWE/Hr5qpTQYCgAiOsfbH92J3+8eKF2LI/5BvPPC7852W0vBnGQAAFDz86fvHE8a
-7ypIoWGmqr6lpxX/ccZ8dJVg3Ht+KILf7x/C/X2jOBrTMKHp4ITMJCcgs+6u9alYGPbjDQsbcf38
-BvTUBBy945nBCXxm/UGsOzoK0gVGQiJ4PB40BzxYXRfCqoYQqrwqdE6O5xvBVF87Qz5cP78Bi6sL
-03bP3kHc+vhuaJzgYeJMaPZJL7xn2YFAtofmKq8gg6O3PoyHr16JtqD8W4npHLc8tgu/2dVfQsQp
-/Ra3XnDjbLexVMxZBlB/7/papvEnhhPJlXnSMxXI09tQhS+eOR9vWFA8ki6NR46O48c7BrDu6Bgm
-NAM+VTGTfSI3BI4AMEq56YlgcILGCa1BL25c1IgPr2hHa6C4fcEgwq/3DuGXuwfQF9WQMAiMEao8
-Kpr8XjQHvegM+RBQFWjES9qoluQElQGnN4RxVWedMJ+9FU8em8Br/r4NY0kDfpU5nvTS35aZP7W6
-uOjijDIQ0gxc0tWA31/WK02FDpiawKdf2I/vbOgDlCKBX0T7oCgX4B3nHTeqfxpzlgEAwGn3bTh3
-0/Dk3zVOIaTcOkglgnz/ynZ8dEW79Dw7O7aMRvHDHf2478AIJjUDQVWxWIVtEjc18e0nSxHMSadx
-jnlhPz6wvB1v7W5EyME6ui+SwP2HRrF9LA6PAvgUBo+igIigETnOXp1mSDonzA/7cXFbTcFjvdJ4
-YSiCmx/ZgQOTCQQ9St77UuYHpPUfe/szv8n223Ifgr9BBeqy9TXy6uDWavLui97tqA+TOt68rB13
-nb8YwSIG0K9tOozPrd8HLZ1KLh8JMP46vOPCv5RIxpzAnGYAABD86VPvixnG96AbqAkF8OZFjfjQ
-yg7puXB2TGoGfrJrAHfuGMCxuGab+FZpVUCSWX9TennAoXHC+a01+NTqDpxXYJddGhonPDs4iScG
-xjEQN+NDvA6z7nAy3+lRGJr8XpzTXI0zG8MIOvDfPzs4ibc+uhOHokkEVSVHZZe3l0rTCsj6u0hf
-0vQ0jJzfkrpMBsHzngVSbCUVKXjn+YuLpm77w4FhfPjpvTg4FhXYBWgtbr3g34sOwhzFnGcAALDy
-9y/98NXz6t7zjiXNWFHn/JDh9YOT+MLLh/Ds0CQCKoNXUTISCUCJ6q7tQ2QMRISIwVHrUfHPy1vx
-nqVtCDuYkBGNY/3wJDaNRHEwkoTGudRHnX5ftVdBd1UAK+qCWFMfdmyQfPDwKN7/1F70xzUEVea4
-zbL+kU7yYvVSkfKl1FVoXETPCpgEB2AkNbxtWTvuPK8b/iJMYMd4HB96Zg8e3D+UTQxL+AtY8vW4
-9dK4o8GYgzguGMA7H99afdd5vX9hjJ3v5PmIbuCOHf24e+cxRHWOgJo17JXjQ7XXZRAhwQlnN1Xh
-02s6cZbDMOOEwdEf17B/MoFD0SSGkzoSqQ3+KmOo86loDZg2gvaQD41+58dRGUS4Y/sAvrKxD1Gd
-w6coeS0p1CZ5/4j7w1lfFunbQs9PYVyKMRBOQFLXcUtPK75/XjdCRZhAknN8Y/MR/OfGQxiKa5tB
-eBXedcGsnu03XRwXDAAAiKibiB5ijC0o9NxzQ5P42obDeHE4Ap/KzJ19VgOTdeHILJ+R9aNJ/81y
-V5kECOxWZNZDQNTgqPGoeHdvK97T21p0fTlTGIxr+PzLffj1nkF4U7aGzMS1LZxzLPi2/sh9luWq
-5QxyiSzSHGQLdrLdt/dt+r61HGM50z9DF8F+NUunnabU+HMCYpqO6xY04q7zF6PFgWF360h04NXr
-tr9q3xtOnzPZfaeK44YBAADn/CIAf2GM5a0DJjUDP99zDHfvOoYxzTC5eTEV1ula1PKH+H72qk5A
-Quc4p7kK/7K6E6c3lpzxbFr4y6FRfG3jIWwejSHkUcBkNOdZ3QWaQVE7gWwtXnzdXvh+ubQM5xpG
-RNdxTnMNfnz+YiwrYF8iojiAmxRF+SNOABxXDAAAOOdvAvBTxliGVT8+MI47tvXjpeEofAqDqrAS
-Pr5prEUlHyonMxio2qvgLYubceuSlpLU96ngucFJ/GTXAB7oG4VBBL+i5EjdUtbTBdsMGQMR9GWJ
-DKRgXUXfnT8uEJUt8N6IbmBRVQDfOnshrpZsnyaiDyiK8j2cIDjuGAAAcM7/RSP66sbhKH69bwiP
-948jYRACqlIy58/77UQyOqgbAHTOkTAIPTVBvL2nCVd21Dl2WzpBkhOeG5zEr/cNYd3hUVPz8ahm
-bB9ZteLS1v1prUH0m1ncesWeTa0UCtNheXepddmfz1Rpu5BfNwnfCwBxgxBQGT6xqgMfXdGeYxwk
-os8rinJ72QZwDuC4ZAAAcMeO/i/+eHv/ZwwCAirLWNGtUkD0sacHPOc32e+T9L61LmHdtmcJZgBR
-khNW14dwWXsNXtVeh3lVzs4StCOmc+ydjOOho+N4on8CLw5HoHGCX2VQU5QL21igTfZJUEga259N
-1yV/r71/SHo/r29JVJctrsDhu0tpk8EJcZ3j1V31WHtaF1bWhUBEdyqKclvJAzbHcdwyABCxi+7f
-fKeq4J8A59bfYur7lFVUKv7eeCoTbdhjJqY8s6kKC6r86Az6UONTEVKV1Em9DBHdwIRmIKJzDMY1
-HIwmsW0shq2jURyIJBHVOQhAQGFm3pAptaFAm4qq2fm9MPX3Fh+b6YxLsXfLGE5UN9Ac8OIzazrv
-emdPy3sYYyWmEp77OH4ZAIAb793kG65mP2QMtwJOVfTiH+t0PlThb9tk4kTQiZBMufzq/ebk9ylK
-JrAnYXBEDULC4BjXDMR0MwjIozB40seVO2nTFO0Ypay97RSUzkCcjUsxOsvTptyy4wnjf3uWqzc+
-f+aZGk5AHNcMAABuvJfU8dqtdwJWJiCTAgzCD41m+EO0meLtdBhE2aTEKRU3kxUNLJMdzImWIaZR
-1iaWU2khJlHKZHKkYUjGRd6OMmoZEmOnnQ5OeHBMi75p7C0XjuAExXHPAADgjPXrva3DoR8CeCcw
-1Uli/V2iGlmKNJvCh1qWZUrJangZ2+SUgTiis4Sl1xTakP6TCA/oSc+bD7xlzQk7+YEThAEAJhPo
-GKm6A4zylgOZ32VQh8u5npbTJWBAbKoTuXR1eDrraXmbK7RMkdRXmp2DfuHRfB/acvOqYZzgOGEY
-AACsXUvKyxdt/z6A9wBT+BAtf0g1gykalYR1WX+XxCRkKqyT99rrpcL3C9ZdYhsKPluEjjKMiyM6
-ie7a8rpTbwNj9lsnJE4oBpDG6x/atlYB+zyh8Ic6NYniXI0U11UuLaP8y5QpMZBS2iTsn5lbpoji
-CKxm/MxvotRuc/qGb8D41+ffc2Ia/EQ4IRkAANz40Lb3Kwz/BTA/h3Pff+ZZst7LPmuF/UPMvsdW
-Fyz3895rrSJ7s9gkKFSXkI4C7838psIMwt4/9jZK654W08sfF+fvFdclkPoJDvbvL732lC/hJMMJ
-ywAA4I0Pb38dA7sTQE7KoJkxVomTijiqK+/56a2Xp/7e/DY5fm8pbZDUN1PjUvA+IcKBD65/zZq7
-cRLihGYAAPC2h3eeS4x+woBlTtXdmTNGTZFJOFwvOzaClcKcik78EpjEDNsxCMgJ6XNAx16D+C3P
-XnfKYzhJccIzAAB4y7odXR4P7mJgV5ZsrAJQMDJtptbLwrrzJ1tZ6iq1TVNghKUwkOm0oVg7KPMv
-PcSB25589erdOIlxUjAAAPjg/Tv8k9XsPxTGPpm7t1zw8VmtSMj9zIQfVybgJ7c7M89ywYfKZHVZ
-yotyF5BgwjA7dSmLBrfRkbKETe29trrs+QWsVebkBLA8YGuD7U9JrgbkMhCyPWtnICItg1noIIBA
-P4iS71+fffXSOXtqb6Vw0jCANN715M63K6T8J4BmAhWUEnm/nUoyyx+laAZTX6tbfkuj3ORtslM/
-ZVtG2bSM0selYF0pcGCYOPvUQ1evuAsuAJyEDAAA3vXMzpVeQ/kuMXaJeUWiStq2fpS8PMh7tsh9
-B0xEbiOgIvcd1jXtNk2DEZai4pe+THlWY/Tef7xy5YtwkcFJyQAA4KNPHggmmf45AJ8Ag6+Uvec5
-22F5/j72NETSrLQ970X209smduG6xW3IPEuF3mtrUxEto3DdVPTd0rpJ3B+F30sGEfu/hq5+/gFX
-5c/DScsA0vjAs7uvUKH8FwhrgOlJsimpwrx4vaW6wUrRMEpZokz9vdNokwMNQ1YPEW0jhk/dd/ny
-++BCiJOeAQDAh57a3epRlc8Q8D4GeEpZL9vvT2e9LH22KJOgou8uZb08HTtGsTaXrS7rb0FfcuCH
-Gk9+/o9XrOmHCylcBmDBx57fd7nK6asAOwNwOqGKf6jlXC+XomVkfotP4Mr+nqlNUCW3qXQ7hv03
-B21mXPnsPZf1/C9cFIXLAGxYu/5QKIHkhwH2EQAtVjdX5kOUfdTClNuSjzrtMhS49QjIiXvNmUwy
-KSoKgEn/Zpb35NGYupB2VSq2etP3pvJe0bN2bSVDY26CE7K9KM/2kPPlMnCiKIBvebn36z+9dNEo
-XDiCywAk+NeX+pYqXL8dxF4PBvMoWacqbDFXXBlU61KWFqW+u9CSZ8rLlBnSMogTB9ifiWjtzy5Z
-+iJclASXARTBZ1/Yf4XC2KcAXGG9XlTaWf5y9qzlNwnKlvRe+7MO19Mkuj+HlylE64nhP35yQY9r
-5JsiXAbgALetX+9t97S8DYQPMIbTrJoAwZZR13K9+LqVhM9PR8vI+V0RJiE2hjp/b4H+sD+f0TJo
-O+Ps6xQM/OpHZ3ZG4WLKcBlACVi7qb9KNbQbQPRBxnC6xRwAIP+jtv2ZuuDcul0s7TVgBv1mflOx
-OAI7GZT3vpyyJK8rhxaiEt9rbyc5ey/RXjB8hxv0ix+ev2SgLIN6ksNlAFPA2r17A95x9a0MynvA
-cCYAobormtTWiQpkNd/cvPzOmET6Iokv5/xVdqu8pK6ZsAEQaCMn/MzQ1Lt+cOGCEbgoG1wGMA2s
-3TFY40/Er1aA94HYOWljYbmMd8WeldZtE7OFGQQcMZFyMZBi77W80yBizxNj30ty9c/fO7trCC7K
-DpcBlAlf29x3BSP2NmJ4PSNUOZswJJGi8jTZjgxqRd+LMmoZYjtGVrEvTkf2HgMYxTjhfzljv/yv
-0+f/6WTJzTdbcBlAmfHVzQd7PKTcQIzdBKLVjDE1fa9kg5vt4pSkLFBQyyjt+dK0DHsb5O/hBLCt
-HPidbhi/+PorurdPpe9dlA6XAcwQiIh9c+vRVzNGVwHsNYww37yeecL8/wLBQ3l790V78y2WMqm3
-QKRqFwhEyqErdVfIFCTvztwTeSrSpxoRgUCDBPwvgf1pLBz/y3eWLk1UfKBOcrgMoAL4z22Hmvwc
-FwLKmwGsIoZl1vuOXWJUWGuYkoaR915xfVPTVvLbQKD9IDzLgN8bCePh289edHQm+tyFM7gMoML4
-/ob99eTzXExQzmdgVwPUy8A8WbeXRCLb6inkXhOq+KXEGFgqLGXii70eZIBjLxj+ZIA9Yih44fZV
-nQcq2+suZHAZwCzivw4cCAaivh6FcClTcB5AywCsADEPkC/d01OyUA6BYvkGrPXlxQEU8Pvn10XC
-ACgOMhjYLk60DWDPcmIPejjb9slT2yOz3d8u8uEygDmE7+8frfck4r0MWEKE8wjsNMbQQ0A1A3zZ
-SVzceFfAvZb3rL2uEpYKSYAmCXQEhCc4Y08Y4Dt9umfPR9a0udtwjwO4DGCO4+69I3W6Hj8VYEtA
-bDljNA8cnQTWyYA2YvBbn88xIqLAxC6BSRBHnBj6AQyAaC8BR4ix3Qqwkau0+UM97YPMddcdl3AZ
-wHGI//fSkbAeNho4U2tBrJoR6wTQTIwWMjA/CAsIYMSoXiG0FZLu5qlBbIgYjoLgAaMDRJgg4gcV
-sGPEWZ9ONG549TEgOP7hpU1uWi0XLly4cOHChQsXLly4cOHChQsXLly4cOHChQsXLly4cOHChQsX
-Lly4cOHChQsXLly4cOHChQsXLly4cOHChQsXLly4cOHChQsXLly4cOHChYuy4v8D5OioxIDpkl8A
-AAAASUVORK5CYII=
-'''
-
-
-
-    file_manager_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAFMUlEQVR4nO2WbWxb1R3Gf+fmJrHj
-JHZjN65L6YCmlJY1LS1qQSAqhDRNAoRUYNNeJIbQPuzjpr18gW+8fanEi9BUIUSBDZCmIm0rAqEJ
-JJIISp3WeWnatHG6tLGXNC9N7Bvb9+38+XCd1k3SFqZN8KGPdHXs63PP8zz/53/ONVzHdXzHUNVx
-DbAhHG5Mtidak8nVrWssq+wNncrvB6YA+b8piMVi5tN/+MXQ3MRh8UvDostnRFfGxS0MyU8f2f0Z
-EK8Rq4A6oB6IAhsMw9gdDtU/mFod+tXWjubfhxrNHaZp1n1TfhO45bHHHr0tmridwKiACGYowp9+
-+8R98xcmXktETRKrwvFEW2s8EY/GE/FofHW8rSmRiKtEIk401obZGANVzzuvP3f+qWe69wJfAPpa
-AlQsFku9d+CFf//4wZ81gAbRiGgQH/FL4JfAaEQpo3pfc7VEpDTKI3t/fujDnvkngNlrCTAA60j6
-aBZxEO0g2gZdBl1GiQ+qDrSNeBZ4xeplXfkyW9lyc3gTl6K7ZgR2urdvQHRpc5CAB9oF8ZDqiPaC
-UXyQa/fjlo1rUjDRVl3fAOKGoVLxVZEbUsloSoTmgRO5d7dv3z5pAl762OljuDM/wWgC7SLaAe0E
-n/0F8G1QRrXGywWMjuWYL8wDGoVP6pY7Iq+8sP2tVGp1+IZUe3sq1d6YTCZUKBQBo4GZiVOyfuuv
-PWC/OTc3p+fgaP7cCGvXbUD8MlI6g5SywehMI94C+A7UxzAiG1EtP0QZIQToOTLI1s7b6bhtM6gG
-MBpQKPUj1Ca1TCoIPvteef9sueKOAGJW7w+m0+nKw6vckF4YBmcWcQuIW0R8pxqJA855fHuSYv5L
-cpVtTBXr2X3XNlri66uru+C7F1v08loFciZzJ+XVNz49BBzPZDLOooDCkfSxUw/dE+nEsxC/gvgV
-0HYQhbiczmmKrKOuoYXW1hY23RqjsykB4STiFq7eFKpaC/F4cd/bZxZKzkfABNUmAbDTfWP94t/Z
-KX4FquSibRCX6QsOOrKZXbcmaxatIJUc+Daqcd1FhxfPVpYHMD52Svb/9at/Av2AXSvA6x3IZcQv
-/xJdQfSiexe0x8l8I3vubQ56YakzbwFxZlANKTAallqvOnfBneX5l/4xUrG9j4HJxRmLAmR6ttQ7
-dm5KftAuCt++mP1ovsLNN920nLzWobeA2OdRdREwwqDMS8S6jPgVxvKWvHlw6O/AAOAsFQBwIt0/
-Xlp/fyIS5O6AeORm67mvQ1UFXF5WBQiqJuLlcxZnPvvno8OOqz8Bztf+UivA6h2cPLl3T8vO4Bzw
-6B8p0bmxHbzyCsbVCt2+Mvm/Ds+U/3Lo7N+AQcC9kgC79/hMv+gbd6IdfN+jUFJEmzzE95YTXMa1
-EjFMXfDk4KdTc398aeSA78sHBK/2y1ArwD96Yu6Y9pwnDfH46rjFri0twTa8Ki6R56dd6c4UFroy
-xXxXpjA6PFY+IUI/cBgYAbylT9cKkHnL682eLcjauFJmnaLBlOD8XwEicHbSlu6MVezKWLmuvuJo
-dtweAoaBcSAPTAMFoMwVXs3mku+nvxyYn7+x3Yzt2dGyhFDI5mzpyliF7kxxvLvPyo5NOMeB08A5
-4D/ADFAk2OPL3K6EpeGFWpqM3zz+QNtzL/9ufTg7XpHPM9Zcd1/xXHfGyuan3UGCUo4vEnZ0dFjJ
-ZNLu6elZuVTfUgBAAng02lx397zlnwGyVcKJqkOLYB//V4TfRABAM8F/PhtY+F8SXsd1fO/wNWDe
-sLk+ls5fAAAAAElFTkSuQmCC
-'''
-
-
-
-    program_flash_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAAHgAAAB4CAYAAAA5ZDbSAAAAAXNSR0IArs4c6QAAAARnQU1BAACx
-jwv8YQUAAAAJcEhZcwAADsQAAA7EAZUrDhsAAAAGYktHRAD/AP8A/6C9p5MAAAAldEVYdGRhdGU6
-Y3JlYXRlADIwMTctMDQtMTVUMDU6MjM6NDQtMDQ6MDCMfZVKAAAAJXRFWHRkYXRlOm1vZGlmeQAy
-MDE3LTA0LTE1VDA1OjIzOjQ0LTA0OjAw/SAt9gAAGJhJREFUeF7tXAl0XFd5/mZfNJs0WkarZS3W
-Ymu1Fe+L5DXGbgLZnEA2KAVaEprSk3BO21NawlJKe6AnHNrCAUogBAKJTeIktpOQGBPFjm15l2TZ
-1m5Z+zL73v+/b8axHadpWlnWPM038+a9d98677v/du9/nyJKQBKyhTI2T0KmSBIscyQJljmSBMsc
-SYJljiTBMkeSYJkjSbDMkSRY5kgSLHMkCZY5Er4t+s0BLxr3DEhVlf6JVq2E/5OF0sYkEl+CrVol
-KtJ0qLfrsThDj+pUTWxLEgxZqOgITWFSRDxFkn1jVyFpg2WOJMEyx5wm+PUBDyYD4diaPDFnCW4e
-8uHO/cMIytxmz0mCv9c2hQebRzBB0mtQKWKl8sScI/jBt4fxr6cnYaJ42aBScugsa8wZgp3BCB59
-dwx7LnqQrldCLW/BvYw5QXC/J4THDo9hV68beQY1FIo5wi5B9gR3TAZx11tD2E9OVbqO/u4cIpch
-a4J393lQ8WIfpkg9WzRKwe1cSwOXHcEapSShz3S68LmDI6hJ1cJADlWEiB3xRhAIR+cUybIimP8M
-E/nE0TH844kJcqZUwt4yqUO+MP6u2oYvL7Jh2B+eM5paVgQzmdxw8WKfm6RWAQ2t+4ncyVAEf1Nl
-w2dKzSizqOEJJSU4YaEiUo1qlZhPBUhSKdL97uI0fGGBRWx3kT2eK9LLkB3BcYz7Qyg0qXHkY7m4
-vSAlVipJ+VyC7Ahm/6nfHUKFTYufrMi47HTNVciGYAV9GL3uoLC1T6/MQI5RLcrmMmRBMFMbiITR
-7Qzi35el48naVKRqVdLGOQ5ZEOwhL1lBf+Xb5Ex94gp7m4QMCHYSuVqys1+rteHhEnOsNIk4Ep7g
-hTYNnl+bhY8nJfe6SHiC7To1qpKpsh8IWdjgJD4YSYJljiTBMofsCObepOlEOMGHSsiO4OZhP964
-5I2t/d8x6g/j5xdc6HaHYiWJCdkRrFUp8PDbw3j88Bh+dsEZK30P13b2XyvwFz0h/MOJcTrHCB76
-4zCKzIntocuO4Aa7Dl9ZaMXPu1z4+skJVP2uD//SOhnbCmTq1ZcHqPHcrJEeQcuoH437LmHLG5dI
-ct2kCXx4dUOW2JbIkOW7Kr3hKD5NUsykGTQqjPhCmAxE8UBxCriv/81LPkHseCCE+wrNaBn3Y/+g
-H/lGFWkApUiIf6DIhK/WpMbOmLiQ7ctID5AtfvDAMGxaBZQKBSIkrlOhCC0DFiKd/zR3UoyRrdWS
-EKdQGYPbtTN0KvxidQbyZNAbJTsVHceqDB225xkw5pMGlymIWatWRZIrkcvgeSqRGSeX4Q9H8HCJ
-SRbkMmRLMOOb9Wm4RBIajPAQ8Q8Hp9fOM6vxIKlnuUDWBPPAsleaHJgMfnh8zJUgSLZ7d6NDVmk9
-siaYsdZhwHqHDmMiAe/64PJudxh/UW4RA9LkBNkTzOQ9WGSGmpY4P/p6GCfyb88z4q8rpcxLOUH2
-BDNWZ+nxuTIzPJH3j+YPklPF+VwPiWQB+ajmOOYEwYwHSIqz9RrhJV8JFwXGf1tlxTqqBHLEnCE4
-S68SQ1fOOYP0pyVV7aWYd4FFQ+GUUazLEXOGYMbGbAO25aeIcUpM8llnAN9rsCONYmG5IuEJ9ni8
-8PsDNPkRCFA89CH4apWNfpXocYXwaJlNSLCckbBNlRMTE3j5lVdx4lQbLOaUWC+RAnV11chxZKOo
-qBApJhNUyvfX4V9ccOGfz0zh1aYsOIzyzp9OSIL/cOCPOHz0GCKREFKMFAKJN+UoEAyFMDXlRDQc
-goKInVc4D6XFRcjJyUZ2drZ0MOHkRIiOjaAmTRsrkS8SiuCBiwN446396OzsgtFghI68YpWCJrUk
-pWEiLUQkhwIBBEJBuJwuuFwuZGZmIDcvB3qtDqvXrEGWPRUK9dzIxEwYglvPtGLXS7sRoTDHYDSS
-1KqgIMlVK7RQ8ytzFAqEwmGEaQqRTQ5FaTlIyyTNPr8PXr+Xjo1Co1TBarOgsrISmzZugMFgiF1B
-npj1BA+PjGLnC7tw4vQZ5OY4oNFoRVuxRq2GSqhmDS3TTKEUKpqlOEwEB6MsySFhm0PBEIKkzkkv
-I+gNwhPwwDk1hZGREaSTdN+2fRuqq2uEKtfr5RUPz1qCA6RmW9ta8dxzuxAMB5Fqs4H9JZVKczXB
-pKI14qVXZINJeiMsxayiieCIn8gmSRYE0zk4PyfkD9G2ANnpCKKRKDxuD8YnxulwBZFchfnz56O+
-rpbUeibsdrt0MwmMWUnwyNgofvPcC+jq6YJWrYXeSFIVVQpVPJ0Eczk7W2y3A8EA3C43aYAw2Wo9
-zBYziovnY+XKFUK6U1ISc2jMrCP4tddfx/79B+D1+mBIMZLNJCJFh/z0E8w2mgkVtppUuHDQeO4P
-w+P1Ihj0I4oIsrOysXDhQty6dRPKyirouokTWs0agn0+H363+2W8Qo5UliMXOh0ZVnai6DNTBAeD
-QdAa6FBBdoQdNdrfG/DC6XQiGAiSJBuxefMWbNy0gWLtYlits7sHalYQ3NzcjF//5nl6iC44sjKp
-REnk0UxFpN4kgnmZpTcS4BL6hKTz+AJ+TJAJcbpdZK9LsHnTRtQvrkPZgjKqmFl0T7NLum86wd/9
-t6dwtv0seccasrUU/oiQlmhlz5i8KpVCJQjmAd5q2nhdgvmZxrxoYVNjXnSYyIlEJVs7HQSH6Ty0
-lQNumofIZnvh9rgpJjegsLAQJpMJP/zRD/kPzBrctLbo4ydO4pFHv4T21lYKTXSkknXk1cY2CnAv
-LRMYW6N5NBpbuQKihMiVZrF+Ij6MD7gS/9M/vW4Vf/+1uIx3FTJBk96gR2pqqpDazs5O7NmzB088
-/gTa29tFFDAbMOMSPDY2hmd++SwOv3sYBmMKDAYdlapIOkkMldxwQbQqVVCStKpV0pth1SStStqm
-JIdLSQ9TzZJN+yhINatJgq9tyWIVHWLJpThYNHzEpDNK0hqkMm78CJMUivUQSS1LMJUJaWctECJJ
-J4ln9R4V0k3SyxOdKxoi6aVlzvHidT6GfsT5uRbW19RgbeM6sd1GoV1BQQHS09PFslY7802jMybB
-XI9aWo7hG9/6J7z9drNQZxqtTkimQhGrYyShkuTRXAiJVB6lFWkxti5+eS9e5n3pl44T+1Mhl11V
-b2OagffhD385P5pPJMp4ooL48ZJCiJVfOaf7i14ui4p8a/6wWWANVFZWhjdee03cn9VqpUjAi9On
-T+PQoUPYu3cvOjo6+MQzihkh2E/e58+e/jm+SeSOjIzBnp4mbCs9m2sgPXzxcOmXaJXY5JmYmDpp
-Ht+V9xEfKpMmKuR1USmk/d6DRIgoi5VLJbFyPlaUSxtFGf9eJphXY8tiByKcyFWSRsnPy0PzgQNI
-z8qSzA1dm1U3L7NWYLJHR0f5qBnFDSeYHZ9HHvkS9u17DTaLVWr7FSwIJj4Y0rONPcz4gxZb3o/4
-BvHwxWEC0tqNRYBUc1Z2NgYHB9Hf1Y0d990jCGf1fVk70MSdHhUVFbGjZg43jGC2cU899QMsaVhK
-NZjjR4OwoR9CawJBIZIM5s0rIE87gHZSxd/+j//E6k3bYSPHi9U2SzHPedq+fbtQ2zONG0LwwYMH
-8fgTX8Hrb7yOWxoaZl1s+P8GKQYfkZthT4dBZ8CZM6dx70MPo6K8EouKclFXXSONh4oRnEVqm52s
-m4FpJ5htza+f+y3azp5FKtVY9mzlBLK6wqaaLRbk5ObixLEWLF+1Cuu3bIPJqCMvX4OOri5hmjgi
-YHVdV1cnIoGbgWknmO1NtsNB9tYCt9sjrKAwuTcUsQvc8AspROjEZM0vLERr6ymkWFOxumkzaheW
-oqK0mEwThVkKNXpHnRgYGcWCkpKb2uc87QSLkMFoxKpVq7FkaYOQaP7ToRC3AX0UAsg5obCELJg4
-jpeu19AhThkr58rFYJ7jx17GdQ79SKBzCs+cYuR5RO7gpWE4J534/g+ewv333ilas9RqDQYGR9FC
-Ut24/BbU1VSjYuHC2AluDqadYHYsfF4fBoeHYdCnYMutW1FcWgKz2SoaFUSDQPxp075XC118XaoK
-cQ9UfETgGiNS/PJe9AdEcayc5tJx0jJ/pA3STIRRvAd/ecd4WWwS+4lt0sb4/vE5t05xwwVfpaen
-G1//1rcwNO7G7/cfgNFowKFjJzE8OgxHTh5ayUQtqa8X57mZuAEE81CQqFDRTtcUxX5j5GQ4UEk1
-uaamBlaLCePj46JjgPfjBgMpuiVwoCkervRALyP24Jk4LhWSyrvGNvJmUSbm4ldaZvbjpxHz2Hl5
-mSex+b1P/LwSpLJ4gT9ITlVmOt2/DT3dPdj6J7djyh+CxaDBxsa16DjXDQOZ2Y7OHhg1KjStWhG/
-mZuKaSfYZDKLzIj+/j4Ukf3h/gC30yniQpPZjAYKm9auXSfan90ej2gWfK8lSxmTVCWUpF3jksWT
-NPyTK8/lhilx81x+1T705XdviHV28PiA2OkVCjo/F/A3Vs6kKrmc5pzhwSeVKgvtSXPu5GCtY6UK
-W1xUgvMXzqOweAGsFAqtWrqE1HCVSCvy+Nw43TWAgf6LSLcYqTJkiGvebNyQtmiOD199qxlnqTZb
-FUEYqdZ73U7R6sMdAkay0WazCcNDQzh37hxcbrdod1ZrdNCKl6Jw2zTPru4u5N4jtnP84K/uLuSr
-vpeTxXHpdHUXBr0BKLQKlJdVoOt8t0j023H/p1BZuYiu40EpVeKTZ9rw8mtvYf3KBrg8XqxbvZJv
-aFZg2iWYwc1zuY4slOelQ5FixdiUSwywTrGlEoEqeuBBTExMwmpLw/IVK0h1V4tMR5ZN7lSXRI6l
-6GoIwbouYhuExE0nSDOQdiktLsXE2AT8AS8e+uxn6f8ZoFdTOZF78Ohx9JG22rB2JX5/4J1ZRS7j
-hhDMSKGYcPvHtiI9LRU6tQJ6cxouDg7DS9KVYk2DXquB3+cRqTk52blYessyYaNtNnLGqAJwJZhu
-uj4KWJ1PTU6R71BByypS+xFs3Lqd7tmHgtxs5Obkov18FxSkGSwUKrUcP4m7btsaO3r24IYRnGaz
-4fldL2H1ssXkec5DTqYNKlKD5vQctHWcRWdfPzIdeSKZzUO2mHOaLWTnKhctwpKGJdAbjHA6p6Su
-uctWd6agENcumj8fRtJAly5dgj3NhrWrl2PF8mWwp0qtUjnZDjy3902caW1DVXkRCvILRPlswrTb
-YA9J5DM7X8HI4EU89ud/iiMnW6EI+THhCqC+agHefPsYPBMXYcosxJFDzchMtWBBeQXZS7+gkdut
-WYJt3N3mceNCZ5dIXGdoyNiq1dfkRd+AlJ2gL4i0tDQUF5fgLIU7ZeXlWExx/SgR7Ui3EskrsOvl
-fWhvb8Ndt29DT98AljXUQzcLc6qnnWA+2yiFQX39/bg0MoHzHW3YsmEDjrV3oKIgG609Q5jnsKPv
-0iDOtbUjq7AIHa2nYbdaUEqOjHt8mBwxFXnYXtGGza1GHiLa7wuIsIsdYw2pdy05ZSom9nopO0Qw
-J7pflbITIYK5Y95PFShKDtR1COb9/FQZOVW3nEidmJyEWqtDcckCzMvPRk11NUlyKg4eboFRp8bx
-ji6qyAP49L33wEKmZTZi2lU0O0Jsd2urFqGiZD6ptVXYf+gYnCNDYiAYR0GcWMMXvuvuOxEg9ZyV
-aoU9Jx8H330Xvb390JmswtOO0MOfpIfMLzHjbAgeY2S3p4oRgyIjgz4suyy94pcuHq+tvHwZ5Chx
-+zF79yLDgwhlj/5aE8+VgSsVJ79PTTpFU+vChZVoWNqAvJw86DUakWoUpEP3Nh9B2OPEtk1Ns5Zc
-xoyk7LS2tZGKdlPYdBGakAv33Xsv9je/S0/UT1JIRIYDdCdK7P7dLtSvWY/2UyehDvmwYFE1qfcA
-Bkja+S65EYUl2mDUUwUhJ2hqSki7VoqTRIgkpJgkmFN22CNnQr1UiWxkN9nGs5S6KGQbGBhEIKb6
-4xLspnCtrLwMbhc5f34vdtz3KRxsOUVxrQ7r161DXm4Ovv/jp5GXkQpbmh2XKOa95+47xDlmK2aE
-4Di6urrw7sk2Cj1UGOw5jy9+/s+w7w/N4tVFbnrwjSsa8NNf7cTF8+3IK60EBcY4f6wZy1atw8jw
-kCCKs0PCRKKKiM4iiWbpDpBkssReVtGxrMpIIEJeuw95eblIT7djyunEmZOnEPB6kU2e8OjYJCbI
-nPAxXp8X+fl5CISicE1Noqi4GJlZmXjw/k+Ka7B0P79zJxrXNeLHv94JoyKMz3/mIZENOpsxowQz
-+GJHWo4TyQqysz60nTmF7bduxuHjZ7DyllqcPnsBfq+H1LQNu3/7LKyZubBlOjDefwHZ2XlEbhAu
-0gZe2sdPDh0notsz0qEkSWaV63a6BMEhJallH1cEDtlSRGtTZpYD3Rc6cO58J8aGL2Hd+g3kIQ+K
-iiGNfVKit38AVYvK0bBiLcYpfq+Y5yDi56H74kUcb+3A4EA/llZXoqpqIWmF2T926YaFSR8ENntL
-6mrQUFuNVJOB7F0x3jnWilF64BZTCqory4WERkg1r2tqwn077kT/+TYi1QNjmgOTFL5ESaWnkp3X
-6LQiL7mbPO2L5NSxNFrIWTOaTeIc3BLF1ddDlYGzNjkzk+2xUa/DxMQUxkZHxf2YTSYoSYt093SL
-dnO9NZPUbw9qy0uwqKoKHd29VClbUJabgSxHDtykAVJMifFOrRkn+ErUVFdh+S31SNFEkUEP9rd7
-D+DFF3ejuDCXnB01rOS85GamIzc3TzTuDw70YP++fbDkzoPRaqeQxS7GCbNeYPs5SNJ4ilSwhyQ8
-3Z4Ovd4gHCU+FyfFsaPGzaGsRZo2NEFPks1NpylGAzovdFLFiWLlyqW4besmFBSVoJScxK6eXrqH
-VOQUzMeutw4hVQts2bx51qvmOFRfJcSWbwq4WbOE7J0jIwN6ksipyTHobRm42NeNPEcGeahpuEC2
-u4Kcn+H+PmwhogMU6rzwy6ehpLizdkUjwj636Mpjh4q968GhQQwPD4uxvmkk6TyuaJLsqpQBqYYj
-20FOVAAuKufkhJZjx8j5CuK2u3dg3OXFIF17DRHNxz+76xW8c+gIivMzSeOkoL6+hpy12es1X4ub
-KsFXwkwPbxGpxO3bPoaRoSFEgn6o9Wa0UaxsI1WeTl6wixyh0vn5FKcqsHXbVqzZsBXNv38NLUeP
-oHBBJXILCkhKVdCRpHKjBY82aCMPnmNdTpQfGx8jZ21YkK8ilewgcg/TsWFyoPIK5qGusgSrlzVg
-TWMTdHoj/uuZX+HOW5tQV1+PA4dPoKgghxy2/NgdJwZmDcE8YoHBanTN0nqso7Ckl0KZI0eOkHOU
-TbbXSUSnkPSYeW/R6GAxGZFp1aN++Rr4QhG8vudVZDhyUVKxUHjAIkQiR+z8uQvo7u4h79iNqho6
-jsKlUapEHe3tGB+fQP3ixbj7/gfIU1ZQ5OahymQle9wnWti+8/0fIeAax6ol1cKzTjTMGoKvRIrJ
-jMz0dGxcvQx33H4bxjwBvES2OYNsLvfLBin04dd6c39yVXUNmpoaofS7RCtT9vxS0RAxMTqM+iVL
-RMMKO1psi3t7e0m69ZicmEB/j+SUmVJSoCN7mk+2vra2BjW1tei5OICjLYdhVoax454d6B8aRV11
-rejrTjTMSoKvhJ1IbVpah7s+sR1a8m6/89SPoFGEULKgnLxhLdEchkGjJonNwBcfewwmgx4vP/c0
-VAYzzNnzUUWElRTPF/3PFqsZPqocjAgdx2HRyuXLhKO2b++rouHERx6yIhrGuE+BZ/fsR/+5U/jC
-px+AiY5PRMx6ghnciM/hS+OyOmxeu5w82iIcPH4avefPIicnHzabBT6fn2xkvngVw6OP/RU+cdc9
-cA734e8ffwK7d+0kiY+gtLSEzqYQIwL5vVlM+ASRyhkoJSXFwg84fOwUjh1twcrqBbCTql5UVS3d
-RIIiIQiOg9tkuIHhlvpqZNutwgPuHJrEUSLEZNCIkQPc3mwhaTOzfbal4Etf/ksKhwz42U9+ipde
-eF5khPAIx86ubgQoVn700UewmGwwpxFxsycTHSXn7p2jJ7Bx+WKRQZnISCiC4x0InN6zqLICjevW
-kjoNkRPVgRC0GBqbhCLklRpBtDqEKGT6+B134IVdu/C1bz4pUoN4AFiQQqSVK1bgySefRH5+vhh5
-EI9rszPt+PiW9djQtO6mp7xOB2a8qfJG4Y9HjuP48RNwWIxYVFcvXgcxRY5W4/qm2B4S+IWlWu3c
-eMsdQzYEM3p7ejFB4dTBE20oyErFJvKu5zpkRXAcPX39yLCnyf41hf8byJLgJN5DQjlZSXx0JAmW
-OZIEyxxJgmWOJMEyR5JgmSNJsMyRJFjmSBIscyQJljmSBMscSYJljiTBMkeSYJkjSbDMkSRY1gD+
-G9km+xf0Mn86AAAAAElFTkSuQmCC
-'''
-
+    
+    #========================================================================
+    #  update_widget
+    #------------------------------------------------------------------------
+    # Remarks: Tk thread only
+    #========================================================================
+    def update_widget(self):
+        with self._lock:
+            if (self._dirty == False):
+                return
+                
+            new_lines = min([self._new_lines, len(self.lines)])
+            finished = [self.lines[i] for i in range(len(self.lines) - new_lines, len(self.lines))]
+            partial = self._partial
+            clear = self._clear
+            
+            self._new_lines = 0
+            self._dirty = False
+            self._clear = False
+        
+        if (clear):
+            self.text.delete('1.0', END)
+            self.text.mark_set('partial', '1.0')
+            self._widget_lines = 0
+        
+        self.text.delete('partial', 'end-1c')
+        
+        if (len(finished)):
+            self.text.insert('end-1c', "\n".join(finished) + "\n")
+            self._widget_lines = self._widget_lines + len(finished)
+        
+        self.text.mark_set('partial', 'end-1c')
+        self.text.insert('end-1c', partial)
+        
+        if (self._widget_lines > self.max_lines):
+            excess = self._widget_lines - self.max_lines
+            self.text.delete('1.0', '%d.0' % (excess + 1))
+            self._widget_lines = self.max_lines
+            
+        self.text.see(END)
 
-    book_ad_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAAKoAAADyCAYAAADdq14YAAAABGdBTUEAALGOfPtRkwAAACBjSFJN
-AACHDwAAjA8AAP1SAACBQAAAfXkAAOmLAAA85QAAGcxzPIV3AAAACXBIWXMAAC4gAAAuIAHVHB4b
-AABcm0lEQVR4Xu1dZXhVx9Y+5CQhxN3d3d3dHYIHdw/B3aG0UEqFOqW9dS8t7tLiFIpUbm9v29v2
-1h3C92d975p9dnIS9JKT9ITuPM969sneI2tm3nnXmtkzs7tdPtqNVMqfUgMdXQMyyrohI/wmVTdV
-t25qFZFapcK1mwq/uxngIf82UJEBnquNVSoDG1U3iIqBqohSB7eFgSOot7bSjCcjunzMlC4ft6bL
-J5wg7nT5pDc1vR9Al98PoctnIuny2Xi6fC6NLp/PgRRS04UiugxpOl9AVy4U4JpJTR8kI2wMqS4h
-I5brZ6g04m01YlclgLZYeA/tz6LByaWjBnTpaHeA0BLgcwD4POny6UAAUAIeA6vpXBZAlgvgAWwX
-JQA2XcAVgGw6l4FwiZAYADAM8RD3lC9dOoF0TjgD2DYSwI8ZgkANJBJF3qqmDytEglfOpUooP+VF
-Tcdt6dIxEwAYSkFJbZGVlhMQAO+qjXKn692mbf5ksGmAJ1+5PZvJ6qga7Q6QnLAFeAAcMF8T2KyJ
-WU+AroyaPqqhpg97UtPHveiK+A38XCwBCAHOD5KAoXBgyA/CDOoI4NkBdADfUSuIOdLvgSvYFnkx
-EC/JbQCs3QhHqj9By5e4R5xhGs4GaJHph7V05cM6KFVHly9WQcliPMtCL0iA8kF06aSH6E2XAOjL
-R0HtxyxwRQG5px3V6gl3OhA6u3xXkQI3Ljc4NzzXPbeBucR2x9AuzE4n7NBeaOOTAM5pf8Filz8A
-o53PQFvno30BPrRx04e90N690e4aAF4oRRg8FwwYK9pdgA9t/ifA/CeDWhAZdJBZV8O8HUFeLaZf
-07MkF4ArwEQUtkkUkKk9CgVMkvyG83lSDwOdSz4FCoQedfmDFAgo/X1UxmkumB/iy5QOUB8zQ7rG
-UuVe17e5wxn6Wm6W1r1LRwAA1JFgHgYckwH7eCfdIF506ZQP6jcA7REs1TNMaBMIpAl1L7UNzCsA
-KPl7bHbRRjC/l7nNuI3Ycn6A8GeikQZ8RW6jE0hbWFG0zzGAngEom/pr6CuzYDMbdkKHvflgqo2i
-kj8rO8rcY53RWwFGpntUXtOZCFRanFQhwlfJh2OMCrvIgObKQ4WdYycZoOdKRmU3cdyTLqgsmIdj
-3EjcWzW+s+x6aPRoMVMaQMv6dXBlcaO0aiDtepE7uRajiHoSPhYsDMokDSxsAAonYVabTjPYUPaz
-UVI9cH2wiUXdCCbDgEICGvt3TAosEtiazqfDVYMvyEx3BgTyfijSAjEwY57yRl26w+dDu8DsXjoO
-sB8F6I+gXrV8vq5GFDcH6s0AcBVQ0DjCEWZTxD2UzZANKsweoHYEI7jB1UAjoYEuf8AjPu79pTA9
-VfB5etKVj9n8VAt/iEHddC4djRFHl+B0M5gvHWM/x0hUuvCz3tWIltN/yz5zG7C1MmFa5kx0DuFP
-Mei6oywoF0wqA4LZ7TIGEk1nATSU54oGaE0XS1GeSgjcKDapcKOa8Lvpwxq6/GF5syW6dC6HLrFv
-dzYaQAtG3fig46OOxEgZgxWuNzHAYB+P65KtEvt5bJlu4GbdYWOH9gP1ZkDWPNdmI8E2ginR+O8C
-2CzsbgiXAz2fmRUgaELDXcFI8soH8Kd4+uLDSgg3eB80PHwqDaAF67DP9QH7UjyKxIAQZvLyCVfJ
-mReCEaWYImETCvaGNJ3yADAkv02wEwBz5Tz76Tw9UkRXeJBwEYMFHjSgE4l8P+G85c5ULsJJAwmA
-FKNZ0QEZvEhbAhp8Rs3gQfh0cjn5Kvw7zT2ZjZvr88aDi1vujLfYPnqT3jFgQ5bj+A1pgtwYqDfx
-p64yH9rhr6ogZlr4psIMsv8FZjiOQZhw+uGHHedGZTC5AmQA0wluaAYcfLKTPIpE48NXZjMn/LIP
-0oUrIUagn9TTlU9H05XPGujKv2fSlf8spf/7cgn+nygBGmx25bMJdOWLhXTlS8jns/B/I/3fp+MR
-dyhGsH3E6PUS/Dg2v008v3cWo9f3/aRBCA8cYRkusd9+BCzG4NIeQMgg0x5M3LAu7nA/XBtoJ1BW
-WU7it5Y04XezAIxstX5D3f542ID+e9CAvtyrpk93qunCO2rMo2pM2iX0ejElJRxqC7AaBlLCkQeA
-hDPvKo324cw3nfIXPhabKjGFwU69mMDFQOpsHEDEzj3Pp7GDj4ZnJ/8CnHwxscuMlQe2gsm/KPte
-8pV92GJpACCcf8zF8QBAsGUqJBFmkkEUCzDBVMqDttMYEJz2hW4s8NGEjphcFrMTYE8eLOBZ02nW
-lQEYAX0Rn9NCmgKcwmTnSvme43yzpZkOjHrFM554FrMeYEwuN5dfDBQ1IGaXQIyE28xLXwu8esRy
-TdCllQBkTbIwm8kgOwWQsZxuKyCg9/kerpCmk+jExyXA/XRITf/dp6bPd6vp461q+uBNNR1/yZAO
-/kNNWx9R0yvrDemZ1Wp6ZJEh3TvDkFZMMqK5IwxpUn9DGlptSL0Ljag8w5Dykw0xj8p+IVhH8qV4
-XoyvYCGeJ/uYf8NfhK8lTCD7jR9iOgPCZvEKQHUFDXtF06CXzwNM5wBSZjyNk88NeglAunyaAeQp
-/K/LJ8GcmDJhn1XyweD0H+NRJ88MwJ8VU17sk/G0F/tkPO0CNpP9Mh4Zi9GxNA8n3IqbvbRoNbKW
-BjoCWOxqCJ8Pvi/yFXoIf5ons6Enm3AwaxPPD4o3KRjIYKAj5hS5Ttj9YLcAzM4+dtNF1JVwB9Ax
-MRK/wp3qDAY78D1FevA3Lx3nskigvp5f3DxffR1fk8HF5roZVAwujZkUVwaYNrgYTGfayFn8fxYA
-k69nALTTaoBNLaaffnlXTd/vV9OXYLV/blHTeQDt1EtqOviMmrY9Zkiv3WdEz6w0pA0LjGh1oxEt
-HGtI0wYb0rg+RjSoQk11+YZUmmZEOXFGFB9iROG+hhToZUi+7mrydFaTq4OanOzUZGelJitzNZmb
-GpKpiZq6G6nJSA3pBjEwEKK6fJLfMAAQJ3iitwecePYRMao/zgMHNtUaEfN1WtLsU7Ivpe1jav4X
-I8w2fpa2//FX/9b4P+wD3ZIck8rTpLk218tx1Anq6xLq7vJJdLBTGNWf8YVfHU7/dy6O/u9CBv3f
-xVwMENGpPwaIP6mly5/0gvSmPz+uoz9BBH98VEG/4/mvF3LpF4zof4ZF+hGs//2pIPruuDd9f9yF
-foRr9Asm4n8F0H9+z4p+OGRJ3+61oK92mdG/t5rSJ++Y0IU3utPZl43oxPNGdOgpQ9r9GJhrg5re
-WGtIz69S0xOLDemheWpaM92Ilk8ypHmjjKih3ohG1xlSfbkh9cw3EsDKTjSipEgjig4yoiBvQ/Jy
-NiJnOyOyMTcks+5G1N3QEEAyJMNmUZPawBDCVwPp2g1XIWoyhBhrxATPZOkBMN6qqD7c0o0+2mpA
-H29T0yfbJZ/gX7sM6DPIv3cb0Od71PQFhP2Fr/YZ0Nf7utE3+w3omwPwIw6o6VvIdwdZDOj7Q92E
-/ABhP+MHjfyIwdJPGpF//4z/b0fkdKSrmn7iPPBb5HUIOhyGDiz4Lekl6ci6st5fs6AM/0FZuExc
-PhYuK5f5052QHVJdcJ1w3VzcYkDn3zakD95S0xmwyuk3DOjka2o69qqajr5sQO+9aECHn1PTAZi0
-fZsMaM+TBrQLINkB87ZtQzd65341vbVOTa+vNaCX7jaif6zsQRuXmdOjS+3ooYWutH6eN62ZFUyr
-pkfQkqkxNG9SIs0Yn0oNY7JpwvBcmjwql+ZMKaCVcwppzaJCWj2/kBbPzKfZk3Jo6tgsGjcsi4YO
-SKW+tUlUUxZPxXnRlJkaTsnxwRQbFUChQb7k5+1Jnh4e5ObmRs7OzuTo4ED2trZkbWVFFmbmZNrD
-hEy6G5OxkREAKAHNgEXVjbA8BCL9lgFoiGcy23VXdyMhhgYAHsQQANSxqApT1FSUpqYS9KTyTCOq
-yjKkmjw11YK2exUYUl2RIfUpNqL+JUZUX6amweVqGlqppmHVRjSyxohG1RrRmF5GNBa9cnxfA5rQ
-z4Am9lPTlAFGNHkgi6HotVMHaWSwETVCpg81ohnDDGn6/yKI05wO0mscZEwNuHIeIq8BhiL/8ZBx
-fdQ0pg56QbdR0JN1HVZlSEMqDWkQyjAQZelXgrIVGVEdfCEuay3KXZWtpsosIypLN6LiNEMqSlUL
-Hyk3wZiy440oI1ZN6ZDUKGYdQ0oIV1NsqBrsY0gRAYYU5qemYG81BXgZkZ+HIfmwmXMxJHdHNbk4
-GAhT52BtQLaWBmRtYUBWZt3IvEc3MJUBmRqjkY0MyMSQG96AjCFGYCpjtTGZGJnALJqRhbk12dgA
-ZPYAm5Mbubp5kaenD/l4+1OAfyCFBIdQeFg4RUVGU0JsHCUnJlFqSgplZqRTXnY25eXkUF5uDhXm
-5wkpyMsV9wpy+VkWZWdmUEZaCqWlJCFuPMXFxlBMVBRFhodRWGgIBQUGkK+PN3l5uJObizM52duR
-nbUlTHcPsjA1IbMextTD2BD6GgC43aB7N5ShGxlqC+4ZaoSfs3BYFo7XVnqgXlTGQL62dNf6n3/L
-/2tf+bcJ/Aj2Jfja9re4Z9xaenQ3pNaCXtf9dkVOC3kgjVZ5XUcfWVe+irJornIZ25bPGKzStm7E
-/4jXfOXfGhHptlPkutS+9kCaLHLjdWcAXEO0G7cH6p7FFHVuBpY0MzEhczNTsrAwJ0tLC8GidjY2
-glEd7ezIxdGePFycyNPNmXy8PCgowI/CQ4MpOiqC4gFUBm1OVgblZ2dRQX4ulRQVUHlpCVWWl1Fl
-RTnVVFdQr57V1Ku2Gr8rqQL3K8pKqKS4UITPycqkjPQ0Sk9NoZTkJIqNiaaIsFAKCQogfwa9uys5
-OzDgoZuFKVmaQV8AnvWXOi1WBcqFUq5S4/7tBKCXWVyAXcNsMtNJPicE7C6LITM9d2SICTqvGXcI
-EyOyALhsLMzIwdYabOtIPh5uFODnS6EhcEFioighPpaSkxIB2GTB3IUM+sJ8Ki8pogoAvrammup6
-1lDful7UE9famirqiXsMfr0FKrNkd0X0rg64XVp3Zg3QtUy2bPK1zb4apl8WdgPYHWARZh9iwv6t
-xgqYA/TMqtaWZmB9a3IG46tM+aGeiRn0scTo0gYK22pE/s1X7fvy82tdbzXcjdLQfna99LR1u9W0
-/pdwt1OO24lzozqU07NGu5jBB+14zMhMzywPH9UcoNA3sYYpqXCwpsWeLrTYzZEWO9tJV3dnWurh
-QktwFf+72NMS/L9UDsf/8zN3J3EVv/kewi7BPfFbXB1osavmHqetuS+eafLiNOU0OA/OW8SDyDqI
-9BF+qSYfKU3c4yvr5cXxoIuIj7RZJ6Qrp73YxU7SRwiXryU+67TUQ0qLf4swCM/lFunJvzU6iPrQ
-hJXrRAqHuKL8Un201B3KItctx9PU51J3xBH6S3XMZZXraxl0H+/mQA4w8Z2NGb0Eqi2AOg6V9E6I
-L+3LSaUjfXvSXlz3pCbQrvgI2pOWQAfyM+lQZTHtiAyi7WF+tD8vA/+X0K7EaNqbmUS7k2Nod1IM
-Ha4pp/35GbQ3PZHera2gXUnRdKiiiA6V5tOe9Dh6r081HSzJR/x02pudQod7louwWzGlsyshEunE
-0s4EzjOeDlUV0+HqEtoZFQxd4kQe7/apot3I81BFMR3Iy6Q9KbFIL1fotQ36sy47ofM+6Ls7FWnF
-htFW3BdxodvulDgRZm9WiijrHtzfj3QOV5dB/yih58HSApH/u70qUA9ptCsugt7rVUX7c9NoZ2IU
-flcijWQ6UJCFMpaLPDhvvh6uLRNp706NETrvSo6mA8XZdLCiUOR7tE8t7UPd7c9NF2XYGRdOh8oK
-hM5cp7tRB4erS8XvHSF+tMHfg1xMu/8FQAUozPVM2MyMQa9+M8iHdqMxPli+gPYBlMcnjaZ3B/am
-I2OG0YnJ4+jIiMG0JSKQtkQG0/GJo+nIqCG0HeB8f94M/D+K9iPOBysW0vtzptExjtM4gXakJ9D5
-u5eLMHvRIPz8UO8akc/h+j50anYjbQdYNgd40x6A6/jYYXQIeR4bM5yOjB5C78+fSfsB9COjBtNR
-pHl4cG/ahQY/s2AW7S8rRBq96YNVC2kHOtPbgV50fPJYcf/Curug81jaW5BNbwd704GeFXR69lTa
-AfCcmjaRzi6dSx8sm0fvDe1PJ6dPxu8FdLh/Lzq7eK4Ie6BnJZ2aMYVO4dk+gIzvHx03gg4N6ktn
-l8yl3Uj3GP4/NWMyvTuoD70V4EF7Ee7UzCm0MzORDqFDnp47HemU05lFs2l/FTpcVhKdX7mE9hTl
-CN2OjBxEO6H3P594iN4bNoDOr1pMhwfW0fsLZyFsMm0B+B/wcydXBmonY0bF0wD6JjamxjQGJuat
-YB/aCmZi0O3KTKEzAMlpAIlByUBlYL0NNt0ChjsxcQy9O7gfvQPgnlk0h96fO432gGHOr14qGu7I
-iHo6hngM5I8eWkdnFs6mbWCLk1PG0S4wzmaAajvY6cjIwXQQjfp2sC9tiw6lM/OmC3C8N6Qf7a8p
-oaNjh9Ohfj0FKE42TqTtKdEC2Azg3YVZtBOsfKCugrYi7uYgb9E59oEVz921RHSQ/eWF4v5BsOAJ
-AJR1YMCeX7uSLqxZQe8CIKdmNIgyvDeYQTif9iD+frDaob61dLJhAh3A76PoNO/iOXfO9xfMRBlS
-Eb6fSPfYhFHoaB60ldl2+EA6PKAX7YZV4TLvzEiEfpWio+1IQydpGE9bY8JEuofRIXdlp9J56HEO
-5HBu1RLaV16AsvdHHfalreGBtN4Hc7ea6aPOxI3KEkDVN7FDjx0L0/8mwMJseWzccAA1WTTKgZoy
-Aabjk8bQkeGDWhh1/CjBsMyYJ6ZPAqCGodEqAODR9E6oH1ixjk5MnUg7YdbPosFONIwTbMadYCfS
-ZqBuiwujd4f0Fcz9dqgv7nkDjBMAwhm0B+byBED9PphzL0z7kRGDwKhDBWB2AZzM0My076DjbAbz
-vI1O9jYAeQxp7SnKpuMAz7m7ltJBmOLNYNT9MNGnZjYIfU82jhcsd3bpfDB0X4B7ElhsNgDWG7rO
-oQMIy2XhPE5OlYDPVoatxOEBdQLUewpzkMdodNDpdBAW4i2UZyubfnRSjrONQQvAbY2PpL0A30nU
-0e6CTFE/W2PD6cQkMOqwemFlTkwdRxdhAU7PagB7F9DBvtWC5behLe73wUQ/gNrZmFFZAaj6Jg4A
-Kvuob6PBt8Av2o6K3BIeQNtjQmlrVCBtAwPsSImnPfCbuJezSdoJX3JPbgZtYx8QbLYtOkT83o6w
-WwCa7fDr9uRnAYzhApAsW6Pg3+L/rREB9A7CcLr70FDbYkIEo4p7nAb8tS1h/sIV4A6zBcDnsBxu
-X2meCLMbjLYLnYDDsW8tCeeL/MDyrAensxXsz/e3oSx74ItuT4iiHdCNw22HL7wtNpR2oCy7s9NE
-J+SOxb+3oQ64fFyOLagDLvsOgG9LRJCwHDthKXamok7gw7IOW9giIA/uVNu5rKwz6oSf7QW77kY5
-3kFnFOXHsx3wrUX68dCXdUDaHI/Ltq8kj3ZAT/Z7H/R1J3cAtbMxo5dAtQVQ8+ytaTxGwRMA2Amu
-Dhhtaq7wXcfz/872NN7JTnoO4f/H8f94JokUXghGzHzl5yKufJ/jyWHlMI62LXE090QYDsvxMcoX
-vzXxxjnaSPrh2TjNswmstyyacCJfzBgIvfgZrs364j4/k55rysZpcRhcOU+OP87JtjkN/j1Bk550
-H/XB4eQ6aS6zpF+zzqKuWsrR/KxN/XF6cv3JeU1Emv0R1xHt0+lAtUSm+ijW0MuGJ33x/livxKw7
-9GHRM706UZ+/Ai8qXkygj2IJvRTRzzr4K/CisgYgFFHqQN8xoLIBUBVR6kDfMaAAVemoXYKoVLZo
-KEWUOtB3DKjsAFRFlDrQdwyo7LDmTxGlDvQdAyo7K3NsV1VEqQP9xoACVKWTdgmiAlBNoagiSh3o
-NwYAVAwkFFHqQM8xoHKwwa5BRZQ60HMMAKjmaCRFlDrQbwwoQFU6aZcgKgWoClAVoCrmVL/NaVdq
-H5UjGEURpQ70HQMqJwBVEaUO9B0DClCVjtoliErlZGeJMzu7pji21dvWkmwtLHGinCXZW1mSM/6/
-WdkcbaTw1hwH53xqh+f0r8qji9bVzepB358DqFZonPaLMxrQzsqarCysrhIbSzyztiJH2/bnwxXq
-CABaIx9LcyuysbTCsd1S2p7OljSw3AyH+JpSbqI5uQhQXT9PjuPvZUmje5vSqDpTig2zkICK+w4A
-sJSHNcol5aGLelLSuL16VDnb4Vg/XQiOB0yOtKQ+BRbUO9+C6nCtKzTHydVmVJJuRUnh1uTtYo2B
-m0278nMBYIK9rWjWcHN6cpkJ9Su1AKisAS5rCvGxopMvG9J3OGt/9VQT8nBigF2/fA7W1jg92hJH
-qeOY9P2GNLzGQoR3AVCTwq1oVYMpPbrEhLLiWO8bp6WTOtRFO9yhaahc7GzAPO0XJwDw7sYe9Ds+
-xvAnf/hLfKnYgP4AaH44bEj/3Nad3nrIlHrmWSE/29vO0xm6lmZY0cc78UGMi91o1+MmAJcNgGpD
-Ib5WdOJFQ/oVn45Z3dCDPJ0AuhuUzdHaBkDFhxvwPYJvcJ7/8GoLEd4VMnmABX2Hb0r9ecGA7pmG
-aSbr29dZF/X7d09Dd0DFMdv3TDOhP/HZGP7cy6vretAmfFTh2bu7044nTOg/+/HlEHwa5tiLxpQZ
-KzHrbVU+AJkdb0X7n+5OXx0wpMcWm2IwIAPVWgD1l/8FqDFW9H0boLJegyos6YM3jOmLvYY0pd4S
-rK0A9bbaSwckyPmqXO3BIDoQZwB1zbQe9Cc+h3NokxGlAwBebjb44IINRQXa4BtElvT1XiPxtZRZ
-w9jE2t52vt4uNpSfZE19i60oLkRiTWbVUD9rOslAxVdSmFG9nG9cNgZ4BhhVAqohjaixJBfUBUuA
-lzVVZFrBhbHCt5Gke7qoJyWN26tHlasDIupAGHgyUA9sxAewwthplhrYESBODLeho893p9/gFtw/
-2xT+Iz+zFnlLPRXAvYYezojPIBRAEc/BbPb4SAIYzhHm2BkfS3DF/xwmTAYqM+pULaBq0uU0JDfB
-FrrZYpRvQ2kA6nf8aR8BVLglAqich41gUTb5rAPnK/Ln54jL6Qjd5TQ5XU2HadG1dd1yHXEYB/7I
-A+uPK6ctM5Wcpi7a405LA0DlBmi/cOOt1TDqgafwaZsIMB0anNN2xjUywIb2bTQWQH1orilG6AwG
-OwrwtKGcRGswmw35u3PDAngMRogHzjlKi4GpT7CiCH98wADnQvFzL1dbDNysMbK3pqgg5IN7DIIw
-PxuJUWWgurSUi3Vxx7lMKdE2VF9hhYGTJQZ5NlQM+WaPsfBRR9ZaaurCjvxhCdLhorBugd74cojQ
-C3lD76x4a0qJshH6eSLNjFhb6l9qRSMQvzoXbOzJ+kjlkAS/He0oJsQWeVvTvNHmtHC8GT5FZEFV
-Odb4ABmXxYoy49kCacdrf7voom31IQ0AVWqA9ooLGqYZqGBUHuUzEDldJzxLYEZ9tjv99J6aFo/H
-oAXPHG3tqSLXks69jc8WPmuM7zoxw0pxuKHD/O1oN/zb99/ApwuHmAtgcLzYUBt6Ya0JXdxmCJeC
-19MiPO6H+dsCqEYSUDGw8xJAleIwAKYOtqTDL5jQ14cwMwA9PtplRDsfN6UfDxgBrGoBNBHezh4D
-Nkva/ZQxnduKb20V8pSYPXSyp9hgGzrxsjFtecyEhlRbgbnN6fibJvQVvvv53WF8TG6nMT0w1xxu
-COdrj/TsRQcrz7LBYLIHfHVj+vmQEX170BB1YYQPsBnRuc1GdB75HH3FGPkyS7e/PdrbnvoWv0OA
-uv9JY/iO+I6RtR3EHvOQdjQQTPLZDmP6ao8RWAfTSQAiN35dsSX9Ab/232iwGrCLNlAjA+3oQ3w2
-8Wew8GIwEAPVFY2YGGFDezYZ41OO3WjddNMbAxXh3ZzsaWQvK/rnVmP685SaTrzSnTat7kHb0Al+
-PozZA3xGsy1QazE78eE7hvQ7PlI7qNKiGagJYTb0LT5E+yO+GvjRNiP66ZgRHXnRBB+g7UGnkO7v
-xwzpK/ji4/vAjRCdzp5CfW3ppXWm9Du+MXoEHWVcXysaXGVF6+ZY4CuCRvQH8uf7d88wgyXSMLAO
-yEPfwNYefVRsDnUh3CBrARoeTB3Dtzh7FVrB/7OhvGRM9Qy0pOMvdhfTVMsnWQJw9iJPZs0+RVb0
-Bz5M+xkavTrbGl+4k55xI0cF2dL5V43FZyQZqJ6uAB1MaFK4Le2GG9GEj9Kum26Gt0dgLtwPD7Cl
-U82MakreHB56RQfb0uYN+FAugHLoGVN0Iil9bz6OsZ8l/YoPADNQR9Yif+Ttis8v1uRb04XNACpm
-MeoxA+AEduQ48bAM3+BzlPxN+Y82G9PsETyvy6bdHubbls4wWJHeowtNBYtznPJMG/piN1gbc7UD
-yzDjgQ7KHdULRzs+d5cZ/QagblpmpjH7umkPXbSpPqXRIUD9DaPub/aBWdD4/B3SS6fwWWx8BPjl
-tWYUFSyZRBmofbWBmmPTDFTufVFBdtcBqs11gXryBdn0a4AKALHf+K/tRvT7Uf4EpTUYGF+qc3KA
-u+AAn9WWvsMXlHkw1QxUx9ZA5akqZ22g7sF3XNF55ozA7AXS4E7KQPVxtafXMC3HnwF/8W5TzOtK
-VmNkrRX9hnnlD143powYW3Q2qfxO6GALxliic/O3U01EB+KOqE8A0RddVB44DFYX4obGXTsDjAqm
-+c8uQ3rnEVN6+T5TegN+2cFn4RfCxP0HZv/ZVWZgJTbHDmAbB+pTAkbF57yZUWsBKA9nSR9+Hh1s
-D6B2h5kFo04wx6cIuYEdMJCypT0buzczKoPFDfEiguwFo/KE/z2NZvjcNvuHODS3n5X4pPeXcC8K
-UwEUpMF5uELnrAQ7zYS/IY3qifxx393JEV9atqaLGkYdjMGXC9LheIkRdmBUNf2AjxQ3Yn7VU6Ov
-O64+yO/5u03wpWl8nPceUwzuHMjRHgfn9pXAeBK+bVqMXXMZXaD3zKH8rBsGmt2F2edy6KI97rQ0
-dAtUmGGu9MNPG2Oe05aCfRwwwLHHx23thIn8HAONn98zpBWTLYXZZYDxXKhs+m8JqGjIZDTonqeu
-D1QeTN2tASoDe/4Y/sy7AT4TbozROsCuAQOzYFaCbQtQYfq5o7gBqLU3AeqPAOp0DM48NR3dHVcf
-dwd64R4GajcAtQcGVA7khM44HOn+gsHbhbeMKQcdQ+6MzgDxIgwsGcQ7HpEYVdbtTgNae8vTIUA9
-iNEysx4zFlc8X31xHPgzK83BuGra+0QPzLOy6esMoDrSskkWgn1P41v2cWGYpupEoLqioxSn2dG/
-YDF+xMzARLgeXG4nB0dMe7GrYAof1QCfRTejAG+pvtrbqHdi/A4DakpUi4nlinMBWJdOsBRrAU6+
-ZEx5YFwn204AKvKVgfo+BmYJcDs6E6juzo6wLPb01HJz+Mhq+gQzDysbzWke3tS9sNYUA0wj+ni7
-MdVXtq6vOxFs7SlT5wEVDLJkPICKRSonXzKi/GT+BHdboPIk/0181P/V9MO3XIgBC5v+D980ptSo
-q4Eqv0IddYum/2v4qLdq+rlTeMHNmTPSmr7HeoevsT7hP/DXv8OVV2wdecWEGgdbka+HwqY3ArLO
-gMoDkLWYB2QflU2/YFSwiQc+hy0xmCM9vMACc4YGdAgLSlLhKzrBR+tTaoN7mEeFaeyZZwufj+NI
-DBwa4CgNpnh6Sh5MIc3kSPsWH3WGOb71joEO8ojE4Is7gTyY8hON70RTBkg+Ig/yitKlgZzIA/FS
-Y+wBIGnULw2mWF8eTNm0DKYqreC+8GDKkRLhb/NUlgxUL3y5RAzAIL7NPqpmMOUvDQrZLz7wjx70
-HSb554ywpn4lNjSql3TNiAWQxQBOMfmdDtQDGMEmhjMQnaQGRsNX52KOEaBj8/fkUnPhj7kCKNV5
-NvQTfLfvwTCje+MVKsLzCNvfy5Em12NyHa83+bkEVAbe9YHaatSPpXkMVA+E711oS1/sMBL+8czh
-PI/pJPLwxudoeJD3B3T6Zg/ybwaqU2ugYnJeAipG/VcBVQKYAKqHI72wRhr1v8yjfgCVfdTybHv6
-EvOoP2IeecFYK/LzdETncsJgUiqrMtK/eSfVKaPeO1Ni1I/fMqI1jVY0b5SVeF366BJzuvh2d5hf
-NZ1+rTtVZDOrMRM5gR0d6NwbeDt00oDefaYHTQT7TRtqRW8+ZEZfHeQ5UbxqxKvJJQCqtwaoKcyo
-mzDqx1ujddqMiump0/L0lBZQ48MdaNtjPcSE/8fQY8ZQa5o00BrTZ2b07SFjMb/KjNoKqAVg1Lcx
-4X+yGw3RAirPYPC6gB8PGdAMjPp59kIbqC8yUFGWl9dIQGVrEgOmf/N+DJqwvvVXyOHnTWjDQnMx
-p1uEgVYoZkbcNUwuzyK0x5+7E+OqPGG6dCFsYu+dZUZ/YGqmCeb98nE1xICawC6/gsn+DUbZ+XgP
-bBXBQg40iidA6uXqhMUfjrR6uqUwi03vd6OfwG4/wkx/jNetDy+yoN1P4l08/meg+mDmgE0zuw17
-4T5cRvj7Zkqmnxs6KtiBTsP0/4JXrvdMB6OCuTgfZrqJ/a3pk3eM6TJeof4K3X4GYD7d1Z0eXmhF
-Z9B5+K3RmF62MMNOYGFnvFkDUPkVKmYLhlZhQYyTk3AjkpH3N/wKlYE6xJJ88IExrj/Wi/N5EWsQ
-+AXHyxgohcN14bL6grkXjLGm/yIPfvX6KeaTf8Gr1p+gw7ktxvTSvaY0tMYWSwu5TnTTHrpoU31K
-Q8Vg0YV4ujrjvb0drZxiIUkDXy3FK9MZw6zgj/HCFAk4MkhFvvg/JtSJpg+1oWfwOvFFNNrqRkuq
-K7KjQB9H6leGb9pPtKDKHFuAAnERJ8wfk/hgXs6jroinm5zF/SBvR5o6xIqWInxPmHsGCOchPxtS
-ZUuPLbGgF9eZ0Xq8Z++PtIN9nWhMH2usZrLEKi0e+Ej6JUc50Cy4BcunmFNmHM99Svc57/ljLYSl
-YDb01qo/H+Q3tNqGlk+2oGEa4LFutXl2dPb17njhYUh3TbWEW2EvXJCNK8zp/Nu82FyNhTfdaQD0
-0UVb3IlpqLiidSJuDBYXNOi1xFlqaMi18mKQe7i4wLS7gDWdBXg98b8X7nu6cFz8xlWO68V5ifuc
-J+7jf/mZuAfRDi+DyYPT4LAeUjx3/C/S0QgDujkPBizS4fRYD47nA/FCZ+GyXCtvjstxRMdBmqyn
-m5MzXAzMH4NleR45zE+Tn0jXhXKTnOhfYFWeDbl3uoVgVZ20h67aVU/S0R1QRYFaACNVtvx/2/vX
-aQwAtCUeg0P7/+s14PXyvHZ4ZpurgcBpXE/Hq9O/dhpXp8udxc/DFe/4sQIMJp8HUtwRWzqDMwZU
-rrT3SawPgMu0Yb65sAoKUK+uSx0DVWEDbZAJQLu50vEXeoilfI/B5w7y4ZkQZyEuDs54vexEH2+W
-gLxkPLZveyp1eK2OqvIR5laRjqoDdydXenC+NWYo1PQ5BohrpllRVa4DlWU4Yg2AHb253hTrceGj
-YkBXleMAYCttca22UIDawZ2UgZca7YRdueb0LeZRv8PA6ct3DekLyFcY+f8AkJ54sQcNrrbHrIEC
-0usRhgLUDgaqLw8OMWgK9nXBkkasd5hoTY8usqTHMbe8doYlTehvi1kPFwzAXBXLdoO2UIDawUCV
-GcLL1RVvoFwFIL3dWTD653twDTxcFJDezPW6w4DKDS5LZ5lR5CdMdku+vuL3tfPnKTh2ByTpWH25
-Qwg97gC/V+WL6RNdSkuDaTdCy29d5tU2LZ4Kar6HRurIvFql7dmSVysdbla3zfHcOkxXP3QiX4C1
-0+riZmW+zec6BWqAlwsF+bpeX3xcsdgEjarVsLqoQO4ccWHO9NB8C9qKvUfThvH++M4DalSIC0b2
-FrTjSRNsybbHy4SbA68sC7sB1pjRDpydVZiGN2hgV13UhZxGQrgzrZ9nQTuhU2M9XlvDzdBl+p2d
-lkqARhfi4UbDe9ljpbq5kKeuI0UZmCd0R0PqIk9NGj5ILz3WmQ4/h9VZeAO0AcsJ/Tx1m8f19PWD
-DomRLmJf2OVz3bCnHztZXdxvWr4BFfZYa2BIl7Hlu08J3mi56U5fH3TS9Hhn2vMMdPoAOs2GTtx5
-dFjnnZ2WypcZTgfCYLlvNvbo4w3LZaygugzAXMaCjlaCRSTDe4Jx3NCQOsizOQ10kjQAlde58umB
-D8wFUHWZ/g3S8vNyo4QIF9q/yURsd1k/C/uuXG9evn7lDljtb0RNWGlVV4Q1EAxUHensA0CmxTvR
-ro2STvfNwIJ0BqqO0v8r0tEpUNfNknZUXnjdCBvqbGl8fwcs29NIf3vxOzkazj2znQ4rzUcA1UUA
-ld+Z3z/XEkDVbR7X05fzSYx0bQbq/QKoHjcpnxv1L3eUgIrVZQKobGV0VCcSUJ3vLKD6e7nDb2y/
-+Hp4CEaVVvibYPWRK7k4eZCrs3sr8fHgvNya8/TzbMnbD3r44n9fhNG+z/q1PPO46pmvp4cGqCYS
-UOdZivQ5DU7rWum1LTOH8UEZWG4pvJaeSTJQsXb1/lk28Ac9r6pToYtWHG2g9i7G+393j9ZxNOG5
-vli4ftvWSdsyaJc3I94FZx9oWB6M6gWW10U7/1VpqHSVsQCqhlEPP41TmhMw0tQC4dX5ABAAGAPD
-T3Plxgr286DwQHfsAMAzTeNxQ3m7u2OQ5k5hAa2fcbqcT1qcK05BkYC6HozKcRlwIQgfCpGAeO3G
-4nxD/d2xZ9+NktDBooIZ5Kzf1eEZDBxe1iXIxwMT9m60BwtLmq4DVAlsHhSCsoWhbJx2r2In+gir
-ptj09y5iv701UFl/1ikhwrVZJ3/E47jXAqjQCbpw3QXimhztioGaqeSOAKjsbumqrf+KdFQMCF2I
-n6cn/DOJURmo2YkuYMFrp+3v5SnAMGWQHdaBWqMh3CgOIJkE12DTMkssOjanNajcglRe6ueJxnIT
-bsOTSyzpFZy2sm6mNZVkumBJnJS+P67p8a50EPn+BqDeM90GHcUNi5Xt6Lm7LeiFuy3Fb248Dttc
-Xvz2gy5Da53omVWWtHcjDsv4hwltvt8Ca1HtKSaMG7clPIcN9vWgsf0c6IklVvTKvWb0xFIrmjzI
-gQ5uAigYqLNtsGXGS+QRCOEOnIjyzR1lR8+u5LJZ4MBjG1owzk4s5GbT37sESwg9PJv1YqANroFO
-KySdDmDnw+b7zbFtxo6iQ6SOKqfPdRnq74E1tY70+GLWyZweXWCNNcAOdOApSaf1M7FuVit9XbR3
-Z6ehW6DOtmoFVF80sj8DSSNy4RjUqTGu2PCGk6hxst7DC3Do2ZNm9DVWvP+Ad+G/gmV+5v3/G01p
-4kBHnC6teYatJPzsF+wg2LXRjPJTAFYBVE8BVHkwtX+TOb2HFUv/xbv0HxHnN8ThXQLP3mNJ0aEt
-Dc2MPh4d4Jt9OBgD79y/5VP98PtX6PAtTty7q9GOQgACuTOE4fdadKBvscX5F6T7I3YwfI/rN+/i
-/4NqgK41ULmc8eHutPMJc/oB211+FnFw6h/S/wbl5qOP2gKVgT11iAN9gb1isk7/ZZ2QF2+tXt2I
-nQACqAA26pdBff9c6AR9f8buhZ+Q9vecPm/hQR68+3b9TFsFqNrgW68F1LxkzKmiEoNhriXh3xLL
-SEB1o8PPYDsJjvP5FYA6j71MD82zpnEYgD290op+5q0puP87Tss7t6U7PbLASgzOHl9kjQYGYAG8
-2SN5F0BroDZp0jv2cg9aMcUOcRzpLbDRbwj/KxpvTG9HwV4M0twUVzr/lrTE7pkV1lSW6QpL4E4P
-zrMRJ7pcwLMChGFWZZlSD1BjE+LPAMDLay1pZG8HGtvXnrY8ZIF7AKoWo3L4IJT3Ueh76bQBVk4Z
-0Xqw7eBq3pZih0ONcboftsxoA5V1So9zw6mDOGUQ+XM9lGa5Um4yVmBh2usnLGr5N84AyICbwy4A
-1yPXyc+8fYd1WmOFr7vw7gcH2vwgOgd05b1oClC13AZh+jVA/TdGs2y2NsyzoofnWwphoM0dDYby
-8xTmNiXWXfiUfwJYB2Giehe7CNB5uHpRPkz+MRzD2ARmOPkCPlBR6CxA78FuQKQbvf8q/EEwxYPz
-rQQYtBn1Ekz/HuyzKs9m18NTxCnJcKVTAC5PlT0Ok+3tDh2g70yY9+8BsHOvmwCkLmIQxM8YwCex
-356BPaIn/EcAOxZuAK+A+hNsvh/mOD3WTaTt4eYJcLvSUdYX6cumn4FUlI5F0292F53q4YXW8K89
-4Ct6iY4yCiD/HGdhCR8Vpt8X9/h+4xB7dE4s+8OpgBU52CmA9L0ghUjr+Es4eh75D6pkn5bdJw96
-A27KH2DbPWDtrAR3UQaOU5DqSocxtyt81DuBUQN9PAGQ9ou/lxcaSfJR+Wsof6IBePvFn6goIe8b
-wP/jDW8yo0pAZZ/y4QUYpcOUsbBJS4l2o204ZI0Z6qkVFqh8LwFG1pPj73zMXDTAU8stNKbZkzLi
-3WD6pcEUA9gfQBTmERIT5iF8Q05v1+NmYHUv4dexT8cnYG9/1AyHA/PMghQ+PsIdjGQmQDR7JPZR
-wecsBtiP4RxU3mG6air2b8npQ6dEdJ59m9B5oNMDc2wAIm+RFrP5V9jd+iUODB5SJYGRy8Dl7MfT
-UzjLgPPoU4opOw8v0RmfgB/OwNuCXbiJ0IPLzZIY5U5vP2QuOtuM4TwXDfCmudLpV03EAXB3T8cp
-2SiXVGb22d1oFw/wxNyuZPp10c5/VRqqQB8vFKD9og3Ui28a0dIpttQ4zB6vMyWZAfYaDnYK8uWK
-98J0UgtQNwCoQb6SDgGo7JRoDzQUwKgBqg8aXtYxPMiTtj5sKRpgE4AaGsAN40UZGDzJo/4HmGlF
-55PSDA/0BKtbi8PITr1kglP/JPC+sV46EOMF+K4hfl4AlyRRIR70/Go+r8qAVjSgkZH/gApn+gSj
-dD5SclQv3tnaUmfJ6Fj7n5aByqDwQf5eOAzOFnv5ceAvVvDnp/KUXEucgRVO+KQR3BstoDJDcgfh
-Y4+eu8sCMwTsongJiYZOL92Dw94Qftlke7CsN85tdaZPcUQQf4NgAjqFH8LJdZgJF2YPmL8FqO1v
-Y13g5HbT0DFQMZjCqSc8j5qKxnN38YZ5bBEvNHgAGvDaQNUASwDVnbZsYEZjRuWppjZAfQRH9NwA
-qA/C19WukDCAeS1mCpg9z2P/UjRAmhjpDiY1Fd/D+nRrd9qGwdy2JyTZ+ZQZ/Qur8fncgLun40Nu
-yH80fNsvdsJnRhq9ijD15tWiE1sAAVTo+wD8UG8Pb+HirJ9jjX383Dl64LhJdlG0geoMoLZm1IQI
-D5hwHN0Jq8AA3KGtEwaWn8HPvQzLtLpRmlkY0xeDLryG/QYnvTDwuZMpQL0J6wpGnSMBlaencuC3
-sSm6Vg/SJVAZhG0ZlYHKjCbnLQOVQXMe25IZqEkwpTtxKMUlnA7Nx7Lvfb5Ha8ERPHshDRiB+3l6
-Y/rHASYcI3WkUVN4c6CG+ntiNG4lgHoc/mvKzYAK4LGp34dJ+kuoQz5Gft+1dHq2B00ZjCMu0RnG
-YZqMdfoa5wz0K73DgcomVxcS6OMtGkbMo8L3zE1yE+x5rbQZWGlxHnQI01PCR8UhEMEwvcL8Q1LR
-qFs3aEw/Rr4+AIqcTkSwF/xXjemH/8pmnQGZiYGEMP0wmzx7EOyrFQemnkfNbOZPv2yCM6oAiihP
-pIMDM3DvlXst4Tq4w69rLRn4PyZUSn805inZ1+Tjf+rgU/p5S+kHa/TluU5m1Afn4DwBTx/4wNxx
-JUblPNNRXi63XI76SphtZlQMCvuW8cIgb0xlecCHlmYDXlpjidH+NXSCnqxTABh9XF/WiRnVEAMs
-FxCDpBPrm5UE0/+UZPrvn2XXqg510d6dnYYqiAGiA2GgPoBRPgP1XQAmL9lNgO5aaQcAROnxnnS4
-LVChhwBqLID6sATUTQAqN6KcTmugWgKo3DDeVwFVO9/YME+cdC2d6Lf3SXN0Cm+KC/ek1zGK50Us
-r62zpAik488+MvJvFmZlTecZUuOCM04lH5V9bQFU6Mtpsb6y6X9wjh309YXp98ap17Zi6usiRv75
-KQAq9JT1qq9yaQ1ULx/4xp5iKo07Dw/+okKuoZNGH05rWK0zfYYj37/DHO74fjh1hjuCpg6zAPK9
-WkBlV0UX7fxXpaEK9vcmXUiQr49Y4ia/mcpBj/ZHZTIohWh+B6EBA9sCFVNXIRo9+HlaLNhOG6je
-Ps06RoZ4azEqgBrELOVNWRg8yIwqfFTcYwnw8aG8VA967zlT4dc+OB9rVZFeeKA3mNxGMN6RZ00B
-dLAUwnL+so6BKFMwmDEQ92oK3HD0j3Sa9AoMZvy8fDXpc94edOQ5mVHxqSBPPzzzwWkoTvQt2O4L
-MHF9FVwh1IGs14g6Z/o3fE5m1H5lGGhBpxDouwEvP7gzHNpkBquEgacAN+Jp6o3jc3sFQteqPDc6
-x/PAmP66q9Fe6C/KDMlPh8VilueZiNnQF8900c5/VRo6AypX0AMa03/8ORO8y3bFlJGnAIAkHuIa
-GSxVcltGlYHKDJUWxyN7DaOuAKO2Beqjsum/Gqg8EHkHE/DFGe7E7Bsf4YVj0u3ESXp8JumQGtfm
-Bp08CEACG32Fc7Hmjnag2HAvjLR9MCvgDR8Wb7ugR2iABBIuyy5Mi/ESxv14K1aU4YG3XF64umPA
-Zy2dncWmfy6AChAzWHqXuoE1u4vpo8cW24B5ebbBE69HXWjHYxZiflUbqAzWsf2c6Ve4F//ZZYwP
-pzkK5g8LQMfSuCsZ8XhxwkBFR0iJ8cTbO2ludw8sRWmWO1jYm8pz3GnjchucdcWDtTsEqCGoBF1I
-kJ8P3ujADwTj8HmjRzHS5XnTQ7KAtQ6B1fqU8pseX/iEnvQeJqT5WPBHFlkBEBo9/AHiOC/a+ghA
-gVH306twTKM3TKnmeVSoD21/DGacn8EtiADwg5F3dpIHXAkwCID0I17FHsEW5Ofxjn/zA5b0FX/L
-Ca8vX8LbpPgIZiRmTh/RIfbhdSsfasb+Ik9XPbHUhv6BPLdjvvUfq63xggHmHeHDwMCrGhxwyBl/
-a1X6DNAb91nQMbx8+BEg5Q9pCMaeB6B6+4k4cegkmx+wErp+jec7HjWntx+0oI8wUPovPowmgdsA
-S/7Yn/cVOiUiv/eeh054m/UvgPwNuAJPLsG5XHBdtj1mRq+ssxJg5PSDUSfLpzjQb3gx8jOmwQ7/
-wwzujCWdxAuM/+IkRH4dzGV7YI49mLmlDnXR3p2dhkpXGQb5+dI6TM3wq7yf0AD8SlFbfsHpd/zJ
-m5F17PT7CUbdhymX7xH2AQC8WQ80QBqA+hYAxmb58WXWrYEa5oMv4PFoWg1QWUtA9felzERmF1N8
-rMwQQLagf26HSUQD/oL339+h0V5aa423O7yCqaVjss7V+ewrm4lXlr8AND/x+3KA+gf8v/1RC7CW
-l9CNgZEW6wXw22AAiOMjAYBf8N7+/Fs9YOIdcRwPz5kaYgUZzCzKx3EYeOU5HnTyVQyQEJbXKTBb
-bnnEAgtZHAVwfwHA+oJ5A3wlIHGcumI3OoD1DT9q64Sy8P/7wKDx4RqgQqfEKG967T6pPn4TOhng
-MIseNBts/NhiW1G/a2coQG0FsORobypKxRsTWdL47YksHlSQxkvimAF9MXjxgW/nJZ4LMKDSZbCG
-B/nA1HoDWFgTAHAwSORnoYiXEY944hlMM/7nuBwnC2BlfzRck/awni4wpS5Ulo3ldRpz2bZjMpOx
-31sNH3RMH2es0nKCe+BCJVkegn2bmV6AyBejeV8AyR1TQ840oNIVjOuNOVU/MKE3Xlvy8jqssNJ0
-htAAuABIPwHp1Fe5CV1qCnnpIfxb3M9Ah+TyR2sYUtaNQcusWZ3vLnSawDpVu1IZdEoASFvrJLF9
-zyJ3DKicaSB0ikMYdj/YGkg6SZ1ZV6T0V6SjM0Zl5QNRwWymry1+gmlEYwuG8hXmiMNyPO3CMzC5
-gaUBixS+5Tn7f1I8vrL5kxhPAoU/7nMenDYDyI9F3Lu+i8Phhc4I64s8pTg8IEL62p0EAONOxnqJ
-cEJ3KV1RdsQTZUGnaO5Yzc80+mh00S6j0E0rH4lZpfQ5H1muVVdcN23DCp2QntQekk6t61A37l5n
-AlanQO1MxZW8uh7Y2tNmClB1NJhsTyMocW/e6VTsRymi1IG+YwBA9QNQFVHqQL8xoAoL9MeoURGl
-DvQbAwpQlU7aJYhKAaoC1K4B1PAgf0yW607CkFawfwDm9gIw5wjx9xe/WUICAnSaly71VtLSHQY6
-oi5Vukw0LFACY0EaL65wxbfonbDSyAH7jlywd96DspPxRipYAasu6/zvkpbOgMogDQ8KoMUTHenM
-Gz3oKyze+P4k9unj3fm3J7DBDXvfH1tuB6B2bM8N8Q/EW6lAweB/l0b8O5RTZ0CNCvGn1dOc6HeA
-8jschrDnCQt6YL4DrZmOxRFLbGkX/l862ZHYNeioig0Fm/cr98DX/6zpyRX2lJ/mK/yvjspPSbfz
-6lYnQGUwVOV701kw6c9YQfTQAgesgMJ7fbBboF+gcAcSo/woKcavQ0ETjLyWTnIUZ4KefM2UKvO8
-FaB2IDF0ZkdVsc/YXmGzP3WwK/awG9E/capJZR6vhgoUroDwSSFhgYFgU83/QfjN/0Miglm0dZDi
-yc/DEVaEwT3+HYI43AGC/ILENUzznOME+gYJv5hXtR9/yZTKcrB3KaBFj+Z8EJb14/CBvtI1VOjS
-ui5kPSQdJNdG5I8OEewfBB3l8vgL/TgNfib0ukZ6UvqBUjhRhpawch7tbYs7Nb4qMiQQy9zaKcFB
-OA/VWSwE5l2eORg0ccVfL93YCGZYfyFRIUFXhYsKCcAStQAsTwugmPAA8VyANCCI0hP8qLoQy9qK
-eXW9H5biIR80fnRoEFbPB2EfvgTU06+Y4txRbyy/C8ACZimNKAgDJTwwiArSfWlEnQfWhbpiWR/O
-BUj0A+hb6xIbHkhJ0f4ifijiBAP0aXH+VIv8y7J9sJsV4NV0uBDxLADLBfEsxxsnqzBYg0Secj1w
-3gzw5OhAqsj1xi4IL9GZuKz8rN3t0N521OP4Kq7I9koEgNo41A3bdvGRr93G2LHJa0LR6Kj8a6U9
-eTD2+rxpggMdumP9pDdAKDWoEMQZ18+dPoAb8eFmEywqZvMdRMVZflhEbY9txN2x9UItTmPhhcpv
-PWiDNa5B2Bnqg0PXzLGqHSvtsd34VyxI/nynMU4jMcHefEcNcwdRCoD2JNLh1e9/8CfRsZKeT3S5
-iAXQ04Zih2e4pAsDZ85oZzqHrz9vxCCwb5k3PbXKHvv9sW/quLQwfPfjFgCmDzqND21aZYddAibi
-U5K8oW/3E5bYzcCHWWjAivTS4wNwygofN4mdDdiGwnujfsH1vefMsXXGD3lq1YMO2qW97apP8XUD
-VLBdTaEPnXmdv/mJjWnPmNOwnrw/iJmwdeVHojEGVnrRx9hmcflsN7pnhhPMc0sYjsM+7mUA6MJb
-OB8gKQCr9/3phbW2ONHOkD7aboLV/1b06r02tGOjBT6dbiuYsLbIh15/2EpKF0D9EaeHnIQ+h142
-oyWTnJr14Pz+QDqfo0O9ts4a3ye1B1BwOgnuvQ+/tiyHASMBdUWDI/2IFfmfo3NcfLsH/eeAMR1+
-yQwnBZrhZD1sI8HGvEPPWNDZzab0zUFjeg/PDj6L3QIA6p94xrsBkmPYagSCNQOx0t5JxPsSnWQb
-9n29gjJswdbvN7FjIS+F3Yf2k4Y+gUuXuqiiwEbtFrBGLJho+RQXsaWDv+3JWzTWznQC0PyFyWaA
-cj6RCJuXFkA7H8e+J2zN2PaolTCTfJ+fJ8cGiBkC3pT2/D02It1hPb3ps53dcSykMUw1DtyF6UyA
-ZCQEUE6Kn0g7HuYzG3mtm+Ug4p7FdozhvbC7IMMXTIbRKcKUgJXPv9lDgGX9XAdKxX12F/qWe2OH
-KbaLAJTThrsC+MEUAX2WTXESR/L8hj1Y72If08yRblSENCrzfOnN+23EiSaXwYoM3Nl4VpLphx0G
-/tgnZY2ydaMzr5pRKe5x2SoQ5+jzZtjFqsZJJ87CTUiICsL2lgARh8sp2FcX7XEHpqEboKJiuGHj
-IoPEFNXXbH6xoY032TG7juyN3achaHwNWOPRQA8vxKY0mL1P3umBbSVgk+BgEaYcjPYZ73cCK80d
-jdOfcW/mSFf6Cf+ffcMU21DgzwFI3PjhiMP5ig4ACfYPwTyus/BRT4BJK3LZV5YAEI44Uwe7Cz/6
-43e6U/8KyeXgPJNjgvApHVux0W7DAnv4oxqgTgZQYeI/xX7+QdW8gxblFOY5hJZMgE4A/C94zm4B
-p89lCA0IoTmjXMRBFZ+B3XsX4xnuc3x2dfiEwOp8LCsMDBG6c3pyvSggvX5H1RlQZbYMRYOxv/j6
-emv6D3Za8s7M7zH5//RKO8xr+gtAMcgm1XuIk0e+w2ZAZsmIoBDR2NOGu+FsALXwUXvBnHPYKXj+
-Hdj0O6Q3oR7HLXLH0IBVu3HD0PhLJklAPQmgVgIQgqkh0QDkfbMdhU94AmeT5oPFwjRAj8Gg6X4w
-7O9gR3Yp2CcWjKoB6oc4u7U6n7csBzcz3uwRbmL79Y+QQrAm68O6hKMcU+rdxU5V/pp0v3Ic0oZ4
-fcDa52BlmFFXwk+NgyvALC9bEgWkN7YmOgVqVCiYDo3FpjMlNhADLHeYO3MBgN8wyHgRrMUjXmYe
-Np+nXukBs4qzQ+GTRocFYwAWTM8A0OwSbH7QCsfSANgADIc9/KyFOPLxU/io62c7YYMdtiOjsTkt
-uZFvBNT48GDauNResPg5mPnGYW4Y9LnT6L7YqNffHduQbcS5pFse4rMCWjPqRwBqDQZNMlB5hkEb
-qDzQawFqEE0GUNkiCKCWSUDNgq/9MvLgeuATpDfBtx4KPz4Z9cSAVYDaqUBtyUwyacEYFcOfg8/G
-gGRTObwXH/IQjMn/ANznQ9UMcFiZBaaHAjAVFIgDxbCFGGC6dwYfviClx9NEo/t6YAsxjonko9PR
-2OxT3j/XkbKSeWpHAuv1gMpgT4wKxFGOtvQHtmD/Aob/Eu7J55j3ZfkCv5n1mf23YnBzS0CFO8KM
-+gNcCfZ9m3WALi2MaiSAyu4F69cLnes1+La/wiX6HVuyeeD3LAZcPIDTZmsFtFeDVsVM1lEShbTZ
-hNaV+uIEZRwjCSCswcg3DOYxAo23ssFZHJLGb7R6Fvli5sBPHNTAJ9mN7ccNHCJ0Y6bmtAozAvAh
-CWf6CFNG7E/+BD+QmZAHJZEIEx4UCtPv0mL6C/ykuJBEhHn+LjtxANl5TI2thh5LJjvjHFcnSWDm
-efA0pp+HABant1wzmGJGrS3EghqNPjHQZfZIuCM4rud7gLUki5lf0jUc1ymDPCTTj+mxAeVwX0Kl
-Z5xmWnwQPjQBS/OChTg44jdYG+6ApdmcRse1RUe1cWel26FAlUGWmRiIr3pYidH4owvtANRQMFAI
-1ZX44MQQHJu41xgfWPCkeWPdxDlKPOXDoOSG1a4IBkNIQChWYQXQo4sdcCKLEf2EwcnEAZi3RXrh
-bX1UDVCjkU58ZDCORYfpB1APPW1OqXFBFOAXijdELRKM36HQLRpuwlVAhWW4HlBLtYDKYZqBig6n
-DVSpPrgMIZi5CKLFGJB9gTC/wNqsn+vcYYTRWWDqyHx0CFSJNVoL7qFh8lIDcZyiNOV0N2YFwoND
-wZAh8M+C6CTmHhmcD8x1gmm2o5/QaE9hQUl81PXZheMXAxxHMS3E5zctb3AFiBj8oWDGFkatkoEq
-9Aqhu2c4C9/xLI7hqcjlgV1bnVv+52fLpjiLUf9HmCVoy6hztBhVYkMp7rWAyuBsWzcRuBcXGYKp
-LPaNccL03XaUhPpgy9GRDd5V01bFhIfgbUz7JTosFKY3DIwUJoAoAQe/Q8JowkAvcY4SHzszqrc3
-ABIq8gxHmKdX2mNynM/Wt8Jo3BwffzDEyN+9OQyHi0J4Zjo53TDkUZYTQCdeBMiR5ryxUngG6jIN
-UM/gGJ3qfIzsEZZ14eeTB3uK432+gEmeiNkDfsZpsojfEC5HLOcJYDcDFaa/ZxHmQ0PDhN78fM6o
-FtNfmh0gdORnEbhOQT7yqH9AGY6TRJosYZwP54cwnGd8VAi9vQE+K3zujcsdMDfc/nbQRVvqYxo6
-ASqzVU5yMM7p96D+VT6YrgnAICcIRx8G0HRMN515zUy8pty3yRKT78GYZJcahAHUMMRDzDl+gzdF
-PNXzGeYsK3LR8JowHK4Q6Qyq9qESgDMT6VbkB8CMO4qBDJ9Y16uEQSQBld0H9l+/RnrzxrhRWV4A
-lWiAVJgZSOcwF/sn8jsAXUbBD+ZnJcivvtpXACwjAfqFS4y/XGZUHQA1MymI6mtwVCQ6T1ZKkKij
-pZPcMEWHFxn4ftSc0TiJD2DWR5Dog06q2AgwSDuFK3hIrQ9d3I0Tn/HqkCfVvwRQeFT8B16Ffo9R
-7q6NVnjNGUDRnFeklGdMeBgGEYGYgMfnujGo4A+Kvb3BGv5ki04xESE0dwyme44Y4S2REdYSdBdX
-/sjZVwDpCpj9qDAwHdKLxrVXsT/OI+2O+Uq8w0eazOIv3WtH8dFhghGnDvXC6X7GQk8Ow9+M4lmA
-P0+r8REynqD3h48KZgVYVza40Ld4dgHv5jldTl/UFfSbC2DxiXncWcpysChG8ywS16lDPYXv/G8e
-TFUyo4ZhKsqbPsY6AdaHj7n8HnH5hMHvEG7TSnzMOI47b/vbor1tqa/xVQI07RQGSTEAd/cMF8xD
-WtEhmPAjeH14+EVznFVqTcsmueLVIxoTAGiVF+IlxobQ/fOd6RsMqPiQ3KWT2d9sHW5ApR89e5c9
-wG5JB7CAg6//gD87qd4LI340cIQmPNKLjwqlWSM96B0Afj/eiu14whpAx4FnbFY1IJs40JueW21H
-u59Ces+a4+O2FvT6fTZYvOKC17tYhYX0OOzwOh+YZHssAHfE4E66L+s/sNKXHse87MZldhjcMQtL
-IOYy9i3zp03wsx9Z5CA6IsdjK7FhgRNOGrRCGSxoL0b6r62zpQXj3fAqFz5s27ppZ5u0t031Lb5O
-gMqFkhsxPRGmGo3KLFMEUyuZ0jCKYra4RuXH4N4I+K28Koo/8dgPjSzYSStsHH4nx4TAnQjG260g
-vN/neViYZ/YLZYbWThvAyIAeDLrMJIz4AV45Pc6P0+f4nE5+eqC4poDRYhmIWunFR4ZhdB4K3zEU
-A5/W+vP/iUgjEXrFXRUP99ExkviZHA/pcjoZiXIZeCUXD5yYvdt0YAWkV2FFZ0CVwCoxiixRGhN6
-TTAhPDciy/IprphPVeNrfRZYKQXAXAvQmrSlNCXGu1Gv5zA3yl/WVU6PXZK2afL/srTN60bP5Lq4
-VnrsUjTrJrtcCjBvatV1CtT/xVyIBgMTFYB9+fUov9+/b7bLVcz1v6SphG2/G6evdaiKiwqjzhZ2
-CWaO5Al+/pannVhsfGFzDxpY5SfMaGfro+Sn/3WuigdQO1Uiw7GC35s+3WlCP+DL0Zewyv5zjNJX
-NfKgggdDnayPkl+XqHMANRyKdqIAqFUFgXTvHBd6ejWPqF3wqUQ/SktAr8azTtWlM8ut5NWutu18
-oKLBYiIj8AYnAm+mcIVEh0e0qxAKuO/8Dv6XAFUB1p0PLF23sQJUxSR3CWumAFUBatcAakJ0BN6Y
-6J9om46/Uj+hR3R4cx3x/7rQR1fp6EKXrpCGSl+VTIyJpLTEOEqJjxU9/q/QMyk2irLTU5rzTkuM
-p/TkhGvqwvpKEtF8vZHO6UnxlIry/RXl6op5AqiRqCz9Em7s3j2raOLY0TRhzCgqzs8R7+DjxKKT
-cLEeNA7v4RMQjq9ijSg/x29xxdyovAqIwzffl59zXLAkv8uPxRsy7efciFLcEMrNSKWpkyeJXawc
-rndtFQ0e2L85P7EWQAPQipIiKivMF2kN7FtHeVnpzeHkvPiZrE+/ulrqWVUu5jA5T1EeXGVLIpdR
-Ci/pKPREWTm9RD1rs47GkCopJgqLJ/RLksFk40aNoPr+fWlQvz4AywTKSk2kEgA2NSGOaivKKD87
-XTRqPgBRV1MFMOciTJIIk5ORQlXlxVSclyWAlJeZRhUlhQJ4fOW4yXFRlAu2rCkvpey0ZCovLkC8
-VNyPppqKUsTNoaK8bFq+ZJF4xmkP6t+Hxo0eiTSjqKqsRMTn9JNjo2nYoIE0oHcvAeo5s6ZTz8oy
-KinIpWqklRgbKemG/1PiY6i6rJimNUyiYfX9hdVg5s6FzqxTZkqiYHGOn4Mrh2fQ52dniLJWl5eI
-cJyvvrVbR+qjp0CNpvGjR9BQNOSIIYNoRmMDLV4wD+w6mqY3TKapEyfQzGkN1KdXDc2bNYMaJ02k
-+bNn0aJ5c2jR/DkAbTZA3hsgWwBAFdMD962jGVMn0733rEa6I2nx/Hk0ZGA/WrZ4IU0eP4Y2PLBe
-dIbZM6ZRDkDN+c4F2Pi64cH7hS4cfxyuo4cPpbEjh9MchGVdMgFABuqo4UOoccpEAfzVq1ZQr+oK
-qqkspUXQe1j9AJo9rZFmQbgDzpo+lZYsmIv8GpH/WKoqLab7160VDMv5FOVmoawjaSbK3b93rdB/
-+OB6apg8kebOnE6jhg0RnbQjgaFvaau4N+ubMGMwgBbMnUOjRwwFCxbRNJjgUjDS0kXz8RYrVoCl
-YeJ4AQ5mSQbA/DmzBONkpiSAZStp9coVNLBPHeIsEI0/EwBJT4gXIGOAsFuRAV9x1bIllJuZLgBU
-DBbtC7PMgJ84bgwtXThfsCyHnz51ish31YplApgMJGZrfj5m5DDoO5uGwjVYf+9a6oX8y4ryafb0
-Rpo5tYEmIy22BIvmzxXMzuEYcByH07oLaTZMGi/KzWkyQy+D3iOHDqJZjVPBsOU0b85MxBkq2Jjd
-BH1rt47UR5UEUOibpKDhmcX6w5SyiWOT1zhlkmj4pWBBHojw89Fo4DV3rwJ4hgk2YkasBaMNHtBP
-MCczZj38xWWLFwizO3PaVGwDSaJ5s2cAEOMEUNnsr1q6mApzssB4U2kC4k2eMA4Am0qTABpOgwc9
-UyaOA0Ami3xXrVhK9XBJyosL0WniKDk+GsxfL+6xv8wdhkE+Fp1nKliQ850EoNdCxyUAfk5GmgBp
-fb/ewlosX7oIHW04rVm9UtzjzjdmxDBaOG82gDoYLNsg3Ju50Js7IPvsAhR62HYdpZNeAlU0PJiE
-G4X9u7ysNJqAgRX7aswmM8BsjVMmU5/aanr4oQdggqcIEz910gSqLC0CUPvDJZgpTHBfuAdsLpkp
-GWwZ8AEbYeYZCAwCNt0LAKz8rAwAdCyNgWlfBLPMrsYYsPm6NXcLwE6eMIaGDR4IEzwQuowSetSC
-5VLB7qzvkIF9RcfiARa7BOPAvAxCZnNmSc6PmZ87x7zZMwVg+9X1FH7vffeuEc/Wrr6LqnDleNyZ
-mNW50zHIC9kiAPDsfhTmZMLsw0dVgPrX91aeBmIQcGOkAAgZyfHCxKYmxAgw8uBk8IC+gjlrMfBg
-n1UerHA8dhMYfMx4GXAFeFCSgTTZn2Rzz6zMwiDjAYzIA+GSEa6sME+weHpirBhgVQI8YjoJ6aaJ
-aaVY6FAI8GSK+KwjP09LkgZGGUmS7uxusPCAKR36cx48UKyC/nlg1TRMvaVCmNW5bFwmDsNheQDH
-95nNuS44D3YZeCDG5UhCB1aAqgc9lZlU27yJ/zV6xWneJpUV5Qm/jpmvvl9f0ahyGJ66YuH/5bjN
-abRp5Lb3xbwtxwWoRDqYDmrWRWNyxUsATfptASOn16yDtpnG71Zx8b8YwcsjeY2+YgpKo6d2ejz1
-9ncz+1w3KmaEripJYCGeiirA1A2zXFcth6L3zTGot0CVmZDZRFv4vnbDCjZDGKWxb97YXbmO9BKo
-7E8WYFK+sqxI+HOysH/GDNqVK1zR/fY6lCoVoNA34cEHj9anNUzECHpSs/BkOE+o8/SVvums6NOx
-ONJLoCqN3rGN3hXrVwGqHlqUrgikjtZZ74HK/ipXgnztiArpyLQ7Qt+/Y5p6C9SUOEyGY3I/MxkT
-9YmYDE+WJvvb10iYsMdEfOs0YpFHLCb325u2Er99bXPj+lPxGxR9k5T4OJwJFU3De4fQiD44mbo0
-HAeWBQvQJuMZL/Xja1IcFlZDfw6fjN8s/Iz/52fiOX7z4muWdAzS+lWF4TwqZmiAFuCsrwmlMQNC
-qW8FzqsS95EG5mTFVQ/r5u+qk4pH2PomDLbhvYNpdH98xCwnGuefRuBwX3yDtDiCclIlwBVnRwnh
-sBlJsTgaKIYKs/j/WPF/aR6e5+C1YxozMcoIyQJz1iCtDFwZiDVIb9YYP6SD6bBMZm/EhXB9yFd9
-q5u/qz4q+Z23Pl2z02Jp0tBAqi2JFMvyqgsjcSSkF80cFUCLJ/tSfmYs1ddG0JIGH6qrCKcpQ/EB
-hwl+tGQKvksK9h3bHx+DGONPd83wosaRATSwJozqyiJoeJ9Qmon7uanMlvE0pn+IuJebFgegxiJM
-JE6iDqS89FiaOCgYQI8BaFvWBehTHf3ddNFLoOYAKFOGBVJ1Me+bYqBG4TRrf8pJi6FlDd5UkheN
-U6JjaN54PxpfH0RThwfig2MRNG5AEI3qGwJwBlJPZuFR/jgBO0yEY1DWA7ArpvkCmOzuYKngwGAa
-3CuMBlSFI4w/0uKvBPpTPth5Fq4luVhsogC1eQHPX9k59BKoWSlY/wmW7AWGS4pLoMqCKJh+fDM0
-I1YAdXDPMJo4OFiwKAO1AWHrANTxAOpI+LTTwbwzIKP64YxUgH55ow/NHB0g0lnWKAE1JT6eRvaF
-fwr2ZTBOAYNPGRKEo9xxXioYdiZAXpIbrTCq1kozBajXqIyhdWHwH3F2f2049auMABhhkjPiYPp9
-hLmeMy6AVgB04waE0OQh+KwlQM0mf0RvPAM7rprmQwOr4Y8i7Tlj/eEW4IO66Yjf4CdMPTNqZUE0
-PijhC8Ay6wZg4AbGRZoTB+P8/gZf+MeK6f8rwamdt14yKiuYiTWXvcqiYJrDha9YCB+S14sWw+Tn
-psULtq0rj8T9OAyi4sS9Avwuy42leRP8qS/AvXhyANwGzB4wc2Jkn56YALeBB0yS35mGdaPl+TE0
-rC4c/nAU1oMiXfjF/aoiwKax2A2g+Kd6A1QGhD5KRnIiRurYOJeQCFAlQBLFgmFxFQuTE4Vk4H/p
-niTZaQk0bWQQjRuID5MNDQYbR9K0ETiqPY9nB6Sw2uVNS0zEtFZLWqnIMwUi56ePdfN31El1Jxa6
-AC5CdVE0FWSBZTPiYcJ5yko/O+SdWP8dUaY7EqgMynQwpcy+zMgdUXlKmp1Xr3ckUBUAdR6AOquu
-VbyxTRGlDvQdAyreLqyIUgf6jgEFqEpH7RJEpeK95IoodaDvGFCAqnTULkFUClAVoCpA1XdzoujX
-dVwehVEVRu0ajJqdloT344oodaDfGFDlpCfjCG5FlDrQbwwAqCnirHhFlDrQZwwAqKkAqSJKHeg3
-BhSgKp20SxCVik8xVkSpA33HgCovMxVf4VBEqQP9xoAqH5+KUUSpA33HAICKr8IpotSBnmNAAaqe
-N5BCIhKRKkBVgNolrIkCVAWoClAVs6X4/7rCgIq/UKeIUgf6jgEFqEpH7RJEpSrAB2AVUepA3zGg
-AFXpqF2CqFRFaChFlDrQdwwoQFU6apcgKgWoClC7BlCLc7NwOK4iSh3oNwZUxXlQUBGlDvQcAwpQ
-9byBFBKRiFQBqgLULmFNFKAqQO0aQC3JzyZFlDrQdwyoSvJzAFRFlDrQbwyoSgFSRZQ60HcMKEBV
-OmqXICoFqApQuwZQywpySRGlDvQdA6qygjwAVRGlDvQbA6rywnxSRKkDfceAqrwIjaSIUgd6jgEF
-qHreQAqJSESqAFUBapewJgpQFaB2DaBWFOeTIkod6DsGVPquoKKf0okYAwpQFYvSJSyqqrKkgBRR
-6kDfMaAAVemoXYKoVFWlRaSIUgf6jgEFqEpH7RJEpQBVAWrXAGp1WTEpotSBvmNApe8KKvopnYgx
-oABVsShdwqIqQFWAqgBVMdv6brZL8FaqlKpKSprBWllS2nyvqrRY/K7GtbqsBPOtCA8p5zil/L/0
-jH9X8G90eg5Tjf9Z+H4Vx+P/+Zm4ys843q3Xj6oGERX5+9VBdWkp9a8tpOXT4mhInzwAq5T64f+F
-U5JpweQkmjYmje6ZE0OLpyRSXWURjR2UQyumx9OscSl03/woGtovj8YPyaJ5E1NoSUMijRucDRCW
-0nhc50xIpYUNSYiTTT0ri2nW+FSaMzGZ5k9KokF1BTSify6Nrc+hvtVFt4w9Bah/245aSnMBqAtv
-29ETK8PAkuXUq7KENq0OpdOvOQJcabRsWgKdetWJljYmAIhZdPhZV3r+3iDauCqElk5NpJfXB9DE
-YZk0c0wq7d3kSTPHptJL9wUCwNk0c1waLZqaTEsQ7vl7g2lgz0JaNTOOGsek0/LGJLp3biKN7I8O
-cov1r6otLyVF/k51UEY1aPPBfQpozZx4un9hDF3cbEMjB+bBfJfTg4sjadcTnjD5FTDN5fTqfQG0
-9XFvqgcTbn/MixaAFcsLK+nRZRECuEvAuCsA6PeedwEDx9LOJzzopXWBNH1MBvXvWQSwJtHxl5wB
-zCjBtn1ri2n80FxqGCX9Zl1uBX8KUG+xom6lMrtKGAbHvImpYM8wsGYSnXvDnjauDAUwy2jDkgja
-AUBWA6Rsyp9fG0g7H/eiwb0LaBvuL5qSBHNdRs/cHUL7nnanaaMyaBJYdQJYlMNMG51OL4B1333O
-lR5YFEVD+hbQyhkJtONxT9rzlAeeZ0jgrGB369ZAyvWq6llRSor8feqgtryMBoDpnlgZAfOcLoC0
-bl4snX3dgcYOzgGjRtGBZ9yAiTKY6yLa9aQnPbQkEuHyafdGD/ijACrSWAP2ZDCOG5ID0JVR42i4
-AOMyaPb4dOpdXSqY+p1HfGnVrAQaXZ8r8tn8sC+tnRsr8FbLuAMAbxV7ClD/Rh21thLAqCwD2FLB
-eiE0ekAeQFcuAHbwWQ9avzCWngSAP3rHltbOiwcjxtDGu8Ix2CpAmEza9oQPPbo8CsxZRIMBvOfW
-hNCbDwXQ4ysiaem0ZAA9lx5fGUmrZyfQhqVRtLiBB2YptOmuMFo5MwnuQqTwXwVI/0dRgPo/Vtj/
-WsH6Fr4XwNq3plSwXu8qBkw59cHvXlXlGN2X0yPwPXdt9KT63sXwS3lUXi4Yk8PUVeGqicv3qgHy
-QXXFNAjA5d/MtL0QZmi/Qswg8FRUBaSc+iEO3+P4tQh3O3Wi4oQV+XvVQU8AkgHK7NqLf0NqIX1q
-yuhJMOhu+JKD+hQDoJowwAiHFfEgHIcxI+IhDIu4pwlTU1HRKq4cRsS9TbwpQL3NirvdCtfneAN6
-lWD+NAvTVmk0vL/EgPqirwJUPWoMfQCFxJz6A1C5ThSgKkDVG9a8UUdVgKoAtWsAta4aoz1FlDrQ
-cwyoFJAqHbUrYEABqp4zSVcAUWfoqOpdU0GKKHWg7xhQ9amtJEWUOtB3DACoVQCqIkod6DcG/h+M
-/s79FjnIAAAAAABJRU5ErkJggg==
-'''
+#############################################################################
+# gui_progress : progress events shown in the status line under the load
+#                button, the last event of a phase goes to the console
+#############################################################################
+class gui_progress(Terminal_Progress):
+    def __init__(self, gui):
+        Terminal_Progress.__init__(self)
+        self.gui = gui
 
-    
-    PulseRain_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAARsAAABVCAYAAAB5CECJAAAABGdBTUEAAK/INwWK6QAAABl0RVh0
-U29mdHdhcmUAQWRvYmUgSW1hZ2VSZWFkeXHJZTwAADj1SURBVHhe7V0HfBTV9h6BZIOg8mxPffbe
-2/NZEQSS3dAFKUpXEX2KKE1UlEjIbhJCCyRAINlNCL33jkCyu4EkJPTee5Pe2/1/58zMZpNsTZP3
-Z+b3u79kd6fcOXfuN+d8p1xJ0jZNApoENAloEtAkoElAk4AmAU0CmgQ0CWgS0CSgSUCTgCYBTQKa
-BDQJaBLQJKBJQJOAJgFNApoENAloEtAkoElAk4AmAU0CmgQ0CWgS0CSgSUCTgCYBTQKaBDQJaBLQ
-JKBJQJOAJgFNApoENAloEigRCUxbmltl3JJ1T5nnrXnTsiD3g+TZa6olzV1ddeSs3LfjZuS+NGS6
-9aGE7OyAErmYdhJNApoEbhEJCHFb6pJNz6UuXtsqdfG62JQFaxcnL1izCUBzLHHu6osj5+TeGDl3
-jRg+O1cMnbHqavz07NNDpmbuiZ2alTlg8sqx/SZldosZv7LawGlLq9wiEtNuU5OAJgF/JDAmfcuT
-yQvX/DBq4bpFKQvWnRj952YxLm27GLNsq0hZvFkkzV8vRsxZI4bNyhXxM3NE3IxVYsh0ajliyIzV
-YsjMNWLIrHVi4PRcYRyTfv2P5OUbfzcvG9zTvLxmQoKm9fgzFtq+mgT+X0ogef76t5MXrBuRvHDd
-kbHLtgFctgnLQgALNJdhs3JE/IxsETc9WwyeliVip2aKgZMzxYBJK0W/iStEzIQMET3OLqLG2oRp
-jFWEj0oTv5mXCuNYuxg4LUf0n5orfkn880bnoYusXUcs/vL72Ll3/r8UonZTmgQ0CbiXQML87OeT
-5q8dmTRv7bnRy7YL88INYjjAZejMVfnAZdAUApiVor8KLuMBLuNkcDGOThd9UtNEbwVkeqekiQVZ
-O8Th42fF5YtXxLlzl8T63cfECGhFPw5bIn4cujC7Y9y8z/62cTFb20vJGTMls3Waz81iGy8l2xKx
-f6Rktn0rJVv1UqL1ob/lHiz2UPTFdf8tthmS2R4nxa2v/Lf0raQumrriXYnvxY8xMlsnYf8UjM8A
-HNtVMqc3xt/nS6pLfp0nKf1JyWJNQEvCs5KYr9F3FttQabTtMb/O+b+6c+zcrbqE2TndwL0cSVmy
-RYwA/wLeBeZQlhgMzcUZXPpBc+kLcIkGuESOBbiMkcGFNJg/UpaLXsnLBEwlaC9L+P+Ne44Jddt9
-7rL468o1/nj16jWRNG+1+DZuiegYt0B8PWjujK/6z3mlzGVoxkMwZaOQxuX63savFpLa6LiUDAHA
-2iMlrxhR5g9Nkq2TNHm9675Pwvdm2z4pZeU9ZS7Xkrxgqr2ZNGmd7+NDY+I8RuPxeXSWkCz2Exin
-eVJSenBJds/ruUamfSCNyRbShDUF+oXnaMJaIY1agedn+dtez/O/vsPQ6ZnPDZu1am7igg0iYe5a
-2TRizaWAaTReBReriID2ooJLWPJy8btlmegJU+nXpD/FzyOXiJ9GLBad4xeKtDV7GFjWnTgvQuat
-E3ePXiEenZAlotfu5+/PXrjMJtbnMbPF10OWiHbRM4+0iZzWvkxlarbGyg+irYjNLoMNPUwTMSEs
-1lVSUs59ZXYPFvs3UupK130fhe/Nts3SSPvdZdaf0rhQSkZjnpBFHiOMbTLGKTVTnvDJ9rNS4ooa
-pdFVl+cckQ7NzHqF+1DwHpLx7Fis56Xk9H+XWX/+jgsNnrKiLsBld8K8jQCYrPy8C7SXSIV3YXCB
-9kKaiwouBBIMLol/AlyWiO4Ji0XX4YtEl2ELRcfB8wFWK8T169fFofNXxPOTc4Q0bJmQEtOFNJJa
-mhi66RADjm3DPvFZxFTR0jRNtIqeLVpEzhLNwqcMadJ/QsUykUmxwaYASNFb1WL7uUz6ThfRwMZ/
-EBqL59FiXSJNXB9YJuN0q4PNoImZn0N7uUheIyJ1yTRyxbuEkWkEzUUFF5C7ogeBC7SXbgq4dB66
-UPwYv0B0GjIfQDNPdOg/W2RuOcBgErF6n6g2d534aN56cRuhutnKoPOv8VniEDSbKzCnuiUsEo16
-TRSf/DFJfNJ7imgaMUs06DlhVpOwCaX/Ri5psCEtKdlqlWLn6srkQdbAxn+wIW3CnH5BSrS9XCZj
-lGB7n7XPcQC5savyt3EwpZJpXtj+UyZ9KeuLxIxL7xgzYcW1fpOzCpC6y2XeRQGXntBciHvpoZhG
-BC5dhy0SzuDyPcDlu9i54r+D5oqvB84RX8bM5GMuXLoijl26Krpk7ha9cveKP3L3iYaLN4lyFoAN
-gQ60m37rZECatHyjqP3LWNHgt/Gi3q/jRN1fx4v6YdOEvvvoRfW6jLm3VOVT0mCTAnXfbD1cZtyN
-Bjb+gw09f2xiWpuX6rOlnnzE0tehSa2FGbUJ18zf6DuLNQdm1Etl0peyvEhEavoXkeNs103jMlzy
-LqS5yLxLftPoR3AwnUDkfg/t5TsAzLcAl28ALh0GzBHtocl82W+W+CJmlmgRMU2MWriGQSTj6Fnx
-U/Zu8cuqPaLnqr0i569z4r3ZIMSSADhJ6eLtWWvElRs3xO7Dp8THv08U+p/GcAvuPlrU6jZaBP88
-SVTrnLIguEfCXaUmI1/AhmxtlXSkh9QTd0D7mm1Xy+xNpYFN3niMgdZAxDDxZ974HebprD1L7bly
-PvHEieXhrbzDZaPQD/qN9vn/tPVOWW4IT00/Hz7aBo/RUtk0UsClB8wimXdZyLwLXNLiB4CLahqp
-4PL1gNniK4BLewaXmUTqijZRM0TryOmiBXiXT8G/5GyT+ZjkbUdEd4ANAc6gjQf5uzj8Zd7GbBO6
-FLvIPn5O3Lh+A9rRPFH1h2RRvfMoUe3HFP7/A7SqXcaJd78zp4aFiXKlMhbewEYm9c6hvxPAj0zE
-//BouCD6nB9uIowTbXVLpb8FT6qBjQws8pj8Cc1hFP5uYdLeE+AQ2JitcWUyRrfaRX4zL3sGbV+v
-UTbZNHLiXboCXPLzLvPFt5j8qmnUAQAjg8ss0a7vTNE2GuASNZ1J3RZGGWCa95kiGodNEh0GzhZn
-zl8SZ8DFRKzZJ3pk7xHdsnaL+QdOMthsOXVB3AGvlMrdqJ6poQgU/Pd/E8V731vEux3N4u3vksR/
-vk3Cd2jfpYjX24/4tVTGzBvYkFlkse2VhiyS3cdmaxdWwT09yOzKTG/m6K8FaRpJ6Y3QmgGwmhZu
-1k+kobb7eX/L0gckS7qLfXAcHW+2NuQ3oboVF2xG2Z/GOevg3B3AY/yCaxvRvxi52YyI0/lF/g37
-0L6+bqNWV5JSrG/xvZjTf8C5focmEcXnNdv64rveHP9isbeUkjKqenTP++KNIk5kVHp9eYyWv4lr
-nYab2/04Mbdms7i9HcvSIJzjdckMT5jZ3hH38Ts0crn/FivuwRqOv90Bcm3w20eSZeUDbs9FoQcW
-jLGrsecxRQzQmPR/OI5PXPiQ22eFTL8kWz3HvqPtH3A/uE/2MMj0U8ez5OtYleR+lBrQI2Hx/J4p
-NiZ1C/EuZBoBXPJMIwIX2TT6XAGXNgCXVgXApWn4ZNGk92QGGSJ46/wyDsF8yxlUNpw8z0DzM0yo
-n/F3+5mL/P1laDEfzlFMKRDFtRdu5O/T1+4Rb3w9kgHnTfx9o8MI8dpXI8Qr7RPEy+1Hihe/GH7x
-2XZDa5akXBTw8Oz6ljmY/VL88kdkMEgLxcDe8KjdFASbpBWvYYJdZPWe3K/OjR96fivX4vMnZdRm
-MKPvC+4rmwdnADbPFRtsKBAxxT4XE+4YawFEXOaLTXGKJaLfOJbIfgxtDgcxutssu4Jwrz3Q1qCv
-F/geCsW9KOem70fjnsjstNi2YzIOcjlpfQYbADJtNLnN1p0eXwpyuENyodugNBoK1LTYs/D3nIPY
-dSUb6r88Jtex/x7IaKQ0JuOZwucEQUxj7GpM+f6t1yTzsjyC2GyvL5FJWHD86TONhdm2n2OFKHAx
-JeNSPvnKz9MWOGFkWZT11iV+QZefEpez9kKmkYN3AbGr8i5kGjG4kPaimEatYBqR9vKZUdZcming
-Ql6jxr0mMc/S4LcJol7P8SB1x4kaXVPF2CXrGTxm7zvBGk0PmFDRIILPQdNRtx74nt3g4G4em5gt
-jl++Jg4dP8Mm1EtfDBcvfzkc4DJMvPD5MPFc26HimTbx4pl2I8STLYeseaytpUqJys8XzYbAJiH9
-URlsYB75CzbmrFcYJAhE6G3r3GQwu4YJLMd9mG0GPLiY3KQdFdhXJjVP4G2b90AXRbOhe0jGQ0ox
-J/QAy0DiXgug32ifvDiVyy4D45Cwy6YJBaqRe1m9X7ofd5ognZvAmSYXxSmZrcul6ZvyNDcGDx/i
-bEizUbXJCYhzsti3FwlsLLY/HAGejvHyJhvqvxJnRQRw6vIH8z2j5PqmMXY1pik8phfzxdmQCc4v
-rALjT59pHMzWC2jHJfJkFYw/Yn4Rsk+2X3G8wEp0wng4Wee4+U+DdznSKX4RTCOAy6A54muQuvl4
-F9JeFN5FNo2msmnUDADTFJoLgwu0FwKXhr9PEPUBLuQ1qgMPUujPY4W+xxgRAlK3epdRImuz7GFK
-2HKY+RpqKduP8nd/wTsFxUZM231cNqPA21SA28925Iy4AaK4yR+TCVDEs23jxdOt48VTreLEE/j8
-WIvB4pFPY8UjLYeKh5oP7FWisvMXbJLS6hURbE655BF4klPAlzPY4E3pavLLD9rxYoENueTNNju/
-Ib2RqO5+l+NU5kuiAI+WnPYqT4QiB+DR25/e9PYW+cbYX7AZBZPUYtvhN9iYob1arEcZVIsqG46z
-glnjvPkbZ0Ng44lzUgMUPfWRx9e6DMRz2cQS0f3+d9CcpI7xizn2ReVdVNOoNQCmkGnE4JJnGn0M
-zYW1F7ijyUwicDEwuIxhj1FNaDMfAWSq/pDC+5CGcuHadRGJKGGVr1ly8BSDzeCNh8SB85fFjjOX
-xN1jGdGZLB6mBPh1G75YPNRskHi8xRDx6GeDxcMAmH/h8wNNB4oHmgwQ9zcZJO5t1O+vexpE55kR
-xUWeWw1sEpe9gYfwgkc+w9tEk7Wx41Lykqfyid+c3rF40dggeklDMFvH/T1gA+4ktTjR5Og/E88g
-qp29SyUNNt7GhwlzfjFdgsn9VnGniE/HfxE5/Y0v+80+/wXSAdqB1CWvUSsTTCOQuhS1S6aRyrt8
-ovAuH0NzUcGFTKPaAJdQgIv+J7iiFXCpAXAhk+dD8hp1Shbvg9QlroU8UpTztBvJlj1zFL4GnM1m
-kMKk0YTO3yDSDp0WV6HFvDEDbwBygcOc6mDbzmCUOCdX3Nu4v3hQBZdPBoj78Pnej/uJuxv2E/9o
-ECOqfDxI3FE3Kt4nAfiy060GNsnIM/L25qYJ78l9LGtd0L4KcDfJduSGeZiszA0p5pW7CUN9S7Zl
-5wuKLCvNhkwob/dNGoMn+cmm7q58KSt/B9iQfLmfGV/5Mg2KvU9r0/SEdv3mscdIBpepAJcpeaQu
-AKahwruQaVQXmosMLjCNHPEuqaJGl1QHuJA7msDlvY4W8c53ZvYYvQWgIa7lJ7jOacs8dlZ0Z75m
-j+iNCOITl6+KI8j4fnBcphi+6TDv89myLQ7epuqcdQJYJJav3s1gc48zuNTvK+6sFy0q140Wt9eO
-FBXrRIugUNNfutA++d+qRZXWrQY25E3zBAgykOxggtUTj0MPstn2hUPszNfYFridiI74IysRx2fc
-nptMMLNtVz7eo6zAhrLEveXJmW0boRkedmvmyKYumcwvOGRTGmCjEvqezC05+TSmqFPD5+Na9Jn8
-2KfhU482R5CdO97FobkQ7wJwId6FTCMieol/ccS7QHshlzSBy9sKuPz7m0T2Hr0Or9Gr8BgRiUvu
-a9pmKeQwxdcM3HCQgSQLAASVTnxn38H7mOAW53gbaDePTsxiknj3wRPi0U8Hi8p1oqC9RItK+EsA
-A3DJ3+rEiKDaxpJxhd9qYEMuXHcTirkW6z52cVsyHuc3tDv+RT5HXg4YeaEs4ILcvfVHA5ySbMOl
-hOzbcY3vmSx1pd2ovFRqZp6pXFZgY7HOdGtGMbhaF0sJi+5C9Ds8kvC0uUysZLC+BMB8v9TAhgHG
-Ph/X6S8DtxsXvxy4ONZn0Cjqjo3+mPJ90z7T4ZJWtJeeebwLaS8GBhdn3sVJe1HBxSne5S0HuIyU
-XdJfJrA28yJ5jNoNFU+1jhPzMmVzKEkJ5iNyeJRCDo/GXykhTdREjhRtM/f8xeBDJHHFURliFaKL
-L168DJf3SFEhOKIwwDgDDmk3BuNqqXpY8eu03HJgY+3lFmxkoEh3PHNJ1qXuwYPjVCIc+1LsT7Jt
-ldsMdH7wM9rx/hQHwx44d1nQ5LlDuIC6lRbYJFmH580vaGYW60KP90txR7TJQCyHDBTK4uYI8mtS
-kj2vjEVJajbyNU/BhJU1e4t1otvxlF8IM4uKIT4dFxYWVg68y5KGvaawS5rBhXkXpAI4kboO3oVM
-o05yMN07SjAdmUZvEsBg8jviXRRweR7gorqkyWNEhC59XrfjiCAHd/8NBzhqmEypeftPMrj8gs/S
-iDTx7JRV4sLV61x2IgggI3ulrGLyrr94P/Jy3Varj2ewCSVtJ/JqUJ3Iaj4JxNNOGtjkTRgGG3u6
-IxvabPMMNkkIJFM3AhuLPccj2Iyyf+kAG08lFyi+xbnkgq9gQ4FztKWuuBPPlC/eKBk8aFu6tAK7
-3d1qZkz8yuBKcU5EkLsDG+KzktJrO85dkmAja5p7pOGKe52Kg7nTVJmsts8q9hzxdILg7mOeMfQY
-e8Lw87j8ppFK6sJzRODizTR6WdFenONdyCX9pOqShsfoEZg9DzQZyCbV0RNnxUkUxyKehgL5CGxI
-Y6Gt0ZJNbDZVGbOCCWNygz8xCUSkQhIb18g1bjrFzRdSzXAvYAOzqk5foQs15T0sRZWoBjYewAau
-U0+Tz1+wSbbLtYoISNyCDWsGF6VUpyxoX8Em2faZhBctE9cWu3vzwkGeWvPIU1/ARtVsfAEbqqCo
-biUPNnuhFf5L1mxgSv2dYPNRl5TmtX4axy5pl7wLtBfSXIh3oWhdlXehaF0yjRhcoL24ind59LNY
-8XDzWHZRk0v6n3BJV4GXiLge8kTtPHuJEy85chiNPFNX4Ip6czoCkOB5KoeBXqikLrw/G0FlCti0
-S9/GYBM7BWx+jd4+go1xudS0mAlsGtjkBxuzzcpvedrM1nSOxyF+pWCjwLEkPOj+aDalCTaySbaZ
-tRMz8te8xalYbDew74cFNBurx/s12yN91mzKCmz+bs0G7uiB1bqMYa/Ru/Aave3kNZJTAQqYRojW
-fb5dXrQu8S9PtJTNI4p3oYC6fzUfpLikB4r7FZc0eY3ugUuaSFxyqdOWhVrDZEKRJyocJPApEL8H
-UbfmYVToU+NqEjbLiZrNlyoeKYBQLYXLmWHbIsp742yIv6kdBc3GeCAoOEqO7C3q5i/YFD2C+OYI
-6rN44Gzk+Jl90sjF/5TfmigwlbICoficTpC/pa68jkkd7RfYpNjb8v6jUEempDUb0lboDU9BdV5d
-+xzwtpbJXnVjzQbxMZ7u12Ltw7sPB1/iibOR0xfKRrP5O8GGsqPf/jZx4Tvfpzi0FxVcyGukkrrO
-vMvTAJcnXYDLQ80QTAftJR+4AGA43sXhko5ijoVq4NA2FxwNmU9qpjfF16w8eoZJYCKDyZTqnrmL
-9/0VgKSmLbw8LVdcQPwNRSDfVT9aBBqM3nkbg+kaiOK8t1NRAMcXsCEPzRCloHnicqjoPuRGmZfn
-1UqR0xVuDrBJSuvp0b1LYf9JACTaqMZKQlp11gAKtiR7dZC4T/gONuwq7yYnmsKbY7ZedevNKYoZ
-5VOgm1IqJNl+CR6cBvkfFxDESemvebxfijBmuVCktKfxvEXA5rUfLFVe/2rEpje+TmKX9CvIM3qJ
-8oycNBcGl1ZD5FQARXN5GJrLQ0owHZlGHEzXSI55+UdDBVzgjkZAnagETcbZJS3VCBdjFq9jACHv
-E4ENeaIs8ErRNmHnMTaXuFIftJhmWH+KtkSkNFBdG9J47kcMzh5EF+8/ehp9ihUVQrx4pEi7AW8T
-ZDC1LgrGOI7xCWxsB6SRS5+WKJM5yWrymvVNGkKSrUneNW4isKEMbG+BdxY7cp+s//VLrt4IYtnM
-QV4XyE2z9Qi/eFwBhByP4z9n4xVs+PqXYV6tRJa1nB1elI3GNdme6zZOSA14vBU0m1fbD34C7ujD
-L36RANMoj3dxkLrIM+JUgAK8C4HLfQq43E3g0qCvuKteX8/xLpjwOmgglepEihUb93M8TeyGQ6zV
-UBLmzL2yh6kPKvWRRsNgA9D5AFwN7bsAWhBxOHKOlB0m2DlxBQGAr7UfLsoFe/NIqWBj/K0oz4zP
-YMMPMXKXzKimRt4WC9ya3pIW6Xdn1+dNpdmgpIE3M4OiYClB0EI1fJBE6MvmDWzU6nhq5runxMzS
-ABsOFkRAYVLGO77cTqF9Rma8yvJQM+Q99f9WMaOeaRv3+tNt4s89Ba8RaS6Pq+AC3uUhaC8qqXvf
-JwAXR7RuDEwjgAtMIwqmo6A6jtYtGEzn4jNpIE+0HCwOHDsjToMgNio1bEi7WYlAPtpaKNHCKtg8
-NXkVcznrT14QlVMV9zc0Hoq9oa1W11EwzXzzSAWFGocU6eFRD/Km2aiFmbh2LEhRb0WZ1DczqeSO
-a9xEmo1lJWq0WOkN7znZkH4n/iPZhsr/GaOlpDTPk9QXsPGqfShFsEoDbPilRuZvxj5oNt2QRHqb
-T88N1Zkhnsti+4uzrL3J7VbSbB75LK4qNJer5JImUtfhNXImdQvwLmwaAWAquorW9QI45cDXVIUb
-nVZScPZEUW4UfSZP1DtYhtdhRsFkuhvu7x2ob3MMKQzOxPFgpZof5XH57P42GFN8emjc7eQL2Pgy
-SdR95Cjc3cxN3IxgQ/VaaMG38RgTX+6LtByq5ZIM08ZiGwmz90mXovxfABsmkdW8L/uPXp8bNpls
-qxl0KQLaF3ndSmADvqXmA58MuFaQd2HTSCF1Vd6lIgfHFUgF8PMzgcKXKFFBG9UclmvY7OEqfVSt
-bz94mAfHc6i3bEahkcmUfvi0uAZC+E2s7qC6v7/PUFIZsLKmVNM3M0oXGjnB60PjaYeSBhs5a3k2
-x3vcjGBDfeIVGm1ZDCLu0gYKTiwVdKhIlDMfpd6jT2AD85Imo6cmaw6X/I6zof6S7OmevJmJcurB
-Qbi5Xa9imojVKS32sejnDXaFeysD6yyrWwls7mk48CO4o68RsUvxLw7TCNqLyzwjP8GlIDjdBrCJ
-w8qZtE2FGaR6ouKUshEEKuWVwSCwUU2plG1yjRsO9qNCWmgGZIXTNi19k88EMcCmeLkfyVikjh5S
-b5PAl99Jq5Fr2+av2k+cTbL9lFwQqcBk48JVtvz1bJLt1x0FrZz3l6NHC9ezobeuq/7JEcGuF6kj
-97bZNprBhmJm1AJa3u6TJt+oFSgEVaDmDKcrZOSwBuDyHEoWMhXJ8tTIVKXjRzlxKxTUx8WxPACV
-LMeFkE8qJ0q6krXz8XL6hBxx7LyNt78JWWyWJkLz83YOV/2R5VjY9U1j7ErGXFCLTFWnReocxbNc
-3K8sB+egvgFun1/OYC/FCOI7GsS8A97lsiNLunbxNBdPmg+RwwRgaSjpSdtQxM9wmgLaxF3H+bth
-+I6ARAUa1SNF1fpoY/e3kpD5LLicc9duiI27jsID1te7+1v2RiUWS7NJthcNbOjB4YaHhWqgjKZJ
-SMmG6SMdQXHOmk0yXKV/C9h4WRGTgDHZnsl9T8XD6RV0ABpyacpd+WrdegMbXrUTWdWUH5WEtAV3
-jdZet1ixj9Oqor6ADYFcqlV2ZyejtGqy/aLHe+EXjK13vmdnKsqJktnEZqMHYCNZufvdFdgQye4W
-bBgk84MNxXK5Azq/wIazvksvXSGwTtQLCOM/GVQE/sVfk4rIYaqsd+TEOZhM10UfpByoBbPsqL5H
-W3vrNpdgU1epPcxucdJs4JG6HWTxatQuvoAgwNe+SvAe3McpC5F5gWVFQJ2AlvGxAW1GiIBW8R7a
-UMH7tB0pN/q/TQL2x/et489VaDtsW4WvkyaW6zWteT7zSelPQIvhrwS0jDsV0Br7F7oOvmsZf6V8
-m3guC1r+syEGfL7O5y64b+thtO/xwHbDHGVBK7SI/0bui4v+tx4uKrSK23xnk/6eF/uLWVCp3K8T
-2wd8npDF52rrTR64VpvhIrD54MYOkX+ReEeFlvE59L3LvtA5m8W2LMIQSeVbxDcOoHv3NEa4bvkW
-Q7nuLt1vhVbxuz0eg/5gn5HO/QloOrBdQLtE99eh8YN8KrQZvgt9uei6Pzye18u3inME9VVoOfRd
-jP8V12NK+8edD2g71LH8bvmW8XVdPyuQO+RQoWXc3opthnG6Aq41wO3zS2PZMr70wKZicPRDiKzd
-SxG2/oKHv/tTMF8dJHmipqfYcvqiI0WB0hT2gBy+DrB5B2tDqeSwsxn1HBIyzysJmQQyHF0Mtzgt
-/0IbVRCk+B2PfQLYVDSYOhXlAVaP0dUIj9UFw4UPjshlqxUhsM+poKq9wiq+3+v7ih/0+k73Xs/P
-A979rZnuP78aKr3S+ZU7pI/llRfcbAG1wl+hc+ggr8LXwPlrhl/R1ezNYKML7m3Q1ehzXVeTvi+w
-fy2jCKwZfjwwONwBNtjvG12w0U3f6fvem+/Uh/m0suiD0r9v173X63P0Z1OQPlo5Z7iLc+O7kEgR
-GByRt+5Sg+g7cK0ct31hGUcUaR33wBrGxjoaB3djRN9DNgHVwnlFi8pVjfcF1uy9nb5zewz6Exjc
-J59zITAkwkz3hft39yxc1VULC6/42q9vB9bofdR1n+h5wfjV6pMHNsFh78pj7GpMef/zATV+d4BN
-YK3edV0/K3SfEfQM7K1YM4LBBvc3wO3zKz/XpQc2UpP+FWFaZAXJRaZKtUkf9cZCd/JqCgsPnHIU
-zIpat19cRGnQXQCc+5Tyn/nMKNJiEFGcS2UlsN8riB5WSeLP07fy+UbMhqruDWxqRxPYFIgE9Q96
-dHpjrK42NCQDxQy5aKFRMOdMe++qG5m31IZ/l5ACake+ApPzFLQwF9eg74xX0A8ZbAwRBp3edF1n
-cLEv98V4PLBudB7YGEzf6CAH133H93qjz2Cj3tbtdcIewHHTdZQS4k4uLDNjXtY3gY3BmOO2L7x/
-pAw2RJ5TeRB3LSSmktS0qWPRtkBDVGMd7t1tX6iPodEiINjIYFMpJOZ+yGmHx2PQH+yT7DyU+DzP
-7bPA+5v+pP2DasQ8RuPg+vwYNxo/vSkPbEIj3uUxdjmmvP/5AH14HtgYIuq6flboPuXnsWJdBWwM
-pgGe+ozrliLY8ANrHM/RtaUINvLAG8WSnF0yOGyRF6SjZlbI3xkgjG8jjUUhhgvyNhRBTFvr5Vsd
-aQsvTs1BDeMbYtPuY4hejhGBejdpC2wmGs8F6CPz4ln8BAGe3L6Ajd60vzg5WDcT2ASGGJtg7CbT
-M1K4mSbhN+Yx7qj18z2YUNtoEruc5MUAmwBD+Es6fcQaTLINhZqBvjPmBNQ1OtbhLhOwqR5WAfe5
-zCNYhhgHkmwCDdHPaWCjTLYgQ2T30gab8uBrnkV1vhOIlzkFF3c4ykqofM1SeKBo64EcKDVy2Blo
-VJK4JYL9aKMUB9ZsAErloPVYldUWqPaO5K62DWlutU0b7g6NvbMIGOM45FYDG0xuo65+rNDV7V+4
-1R8EcDflSk3DuCI/8s6WeHlrFkmzqRDa+z88qeugD3X65W/UL7y9K9QxOYIIyw5sjMs9a2ZGrmej
-gY3TjMMbvzq0mmsoMFVq2g2ZOG1Q4Jw2MofI5U1cza8I5ttz7jLH0FRVFqMrCDSq+/vJSYgkRv2b
-vShDcc8YdbWFNNFl5U4+b8IsuEHdmVJEDuPtXByguRU1myC9sZd7AEECrN5kVcFGftO7MTGLo9nA
-ZPBoVhhMFyuEmhyLtt00YAOg1sCmwIwjfgFgszUIbw9PplSAPoJrx0jVwoT0oVOr/gc8Qe6D6uDt
-4t8pHoa2MTuOcTCfWnMYNAwvs3tXqrzMrkuwUbSY2XtP8DkaLVbibaDhPIGF604gneEoPFPk7XJZ
-cgKajU4fmVdwu4ioc6tpNhrYKLxcQc6GzSgvmo0GNq5nGUBmRFBdFAZ3wdtQigGBC/32KpIeG2H5
-Flp69wcsw0upAtVQJpQijhmAXFTNoyTJl1Fk69TZi4rLWzahugJwZingMRRBfQXja1yZUp+nyUWz
-JuzEwnWKKUV/Ryp8Tu+U5YKI6Hz3wcSl8S9d3UjXofN+AE9ZgE2gIdyzjQ/yMCjYWF3RtEJKkyAu
-WbCJ6OcQtS8EcWgUlwUlMtSzZmO8UCE42rHe0U2j2RgiNTPK1dwC8x2MCXrd2ZQikCAt5r5G/XhF
-TOu6veISioy72rbuOSYix1pRWziej3HWdGjy95+YwYelHT7DpDCZUFShjzxQtBkWbPAONtB6HkBp
-iYPnr4gzMKeen0LV32QX+GvwUJ2Da/wYtJsXkL2eL32BQNRgmuQHprjdtSzAhkARHoQjbr0XBtMN
-aIu8fnagIaKhWy9KCXijwMP85sWMSoOXiCv1QcZ/ejSj9JEmv8BGH8VlOAE2r3kxo84E1Il4XT13
-mYCNFFYOJuQij/cbauLiWTp9/6cxnsc0b5Q6QnCBB4REZEo1YCopJhJ5dzoOngdPj5wqQNtu5C5N
-wnK4tLTKb+BbBmHplTQlII9+P37ynOg2fBHnVfF53v9dvISyoX+dPi+ugJcZgP3V4ubx0GaodMQm
-mFB3ejCh8nmlED08YL28ZG8M1gTHMhlywhv+Dlp/kL+fSukLqN5HZh9rONBsiuvyVsVUFmBDbkp4
-1fa5BRHS1OBqxsNeD2Cz0L0ru/iu70B9ZFe3E0r2PG2S3u1fkSeVwZjtiTCFZyuvvAeeN0zAlR4J
-VqVmdHm4+fEydOPeZ1fwyYCQMvZG0f2GmmZ7dH3rZVd5gCHiTXJXuw1luJVc3+pEahw2scPHYVN4
-xQLjmHSxAWkA6jZ330nxCfKS7iNiltIFsMyKlACTBSsgkEfojem5vCwurZZAW85WgAoWoaPVNFdu
-ksFhGVa3JK6GNBrnkhJhAC13XqhCphS0GNJoqOQEFUF/BikLXFAL39+PGJ2NKENBW1jyMjanKhgQ
-rGgwZkrvduYJUdytLMBGCg27k1287uJhKIyACFea7F5jfooXZwOwbuvxGgaK8YFbXB+RCuBBbIib
-+CPqp96YV2ALcTEAG/feK44xijiM1g/HrfKsvSHUoE6fx8pWs5FDRtwDMYEgYqUMxoEUb+M2DoZi
-aW5FsMEcvevGjRsbHQiDf8itXHchTBwyVwhgKFWA/ifAAdA4PtP/aB/OXosMbTn1wHmjpVh+AU9D
-5hOZUbQY3WWUkyDAeFJZNcEVMeySLEYfVO0mBRHE3AfWbtJFNXi0zlyhWGQZcO6oDxMqxNiquCBT
-lpoNrnVboCFygZdJTqkXXgLXiq/ZkHkNALnhPkAOfSB3NLmgXQWhOcAHEcQFAiqhmaV6BkuAKZ23
-doyHYEHsE2paLzWNc6wJVjZmFJlHkf29gT33H4skepTfrQg2NKEANp9fhG1DXEr3rF2iEtUCJpCh
-YDua1NBmAlLs4mkAxMsIqLuXIn5V0KHSjfi/Mo7ptWqvOHrxKgfczQQJ3DFjJ5tPKtisVpZsiV67
-3ytX40q7eRjczV6F7yGNi/ugmFON8fkcubiwoSB6uvRwyWg1sv3tQwRxMYP6FJMkxuMkc6dBOH9f
-ApxNYC3TswhIw/LFXiJyPfVHBsWzAaHGV51BH2DTo9j3KHuJ5uU7bxlFEEOb61Ds/t+qmg0NWIfs
-7AD9/PWLHpi6VgYZhYClyfzQ+CxB2de0NjdpJbRRzAtxJWzOqKDEmk8au6TfwJIs1eauY7OJzKfO
-CNybpGR470KA3wNjKfPZtbvbk6ZD51eD/KgGzgtEFquAg781F2xE5b9zlwGeHNZfUluZgU2osZY8
-wb1rL55TJ4pnRhH5CzXf6vnt7MZ0UgFINqFyVG5HHYsgfdT7OPc1r/foCcigVQXqI3r8HWCDaHR4
-ych09DZGnn6/Rc0ox4BFz8Nyp1QNHnEvmLhBSI/viEJV+xF8p25E6lJwHiVH0nYC5lBHrMsdQNqF
-Q9OxivdgVtECdOTqJqCxIDWBgIqw6hMUMnfF1ThXOHMHOLwPluMlkpm2bCwJ8ygt/6ICzqhs8Y/R
-GYNLCmTK2IySsL5VIN7883V1B7oGHNIWyHzRGzFZiTdxl6dVTLAhglNvasnmApkD3ky3fJoV9RHH
-UOQvcrIKjUWHhAB8P1NXbxBMJSKbvUzaAlqbru4ASk85qAvpk7dqAy5SVmYUBTNCq1pA/XDdd2WM
-6KUhj5PrXLdb1YxykGwW+4+BqOFBWskSJE2qG3EkBpR7eARay/3jssXbs9ayV0gFHVpQrilApDqO
-a4OF5NR4mt9RxJxiamR9SIjfc/aKcgCxiqjDEaQ0HcBNh/oegWgBWPy8Alp57EOtnIWaXEzLORu8
-In6bo8TqrALgvATTTkrhymrZUti0KiUNNvCoJOjqDwaXgAfMVcPEAUic1lWPfLy419bVYhf4cp6w
-fC01ZQD/k/mgN84PCon4nVV5d30xmC4HNoh+Lo88NXWS0w9c9L9eLJ1z/x21TIWy0jFZvkdfdjIp
-zf1Qjy+YxuD0PQAEsjgYGGL63VUpDeoTZSNDuxmHyXpavk9353bqL4Gs7J1agfZRQTkDHJszgLkb
-I/oe9xpQy8QlLCrVHPRPDjXwdAzGPDDUVKjKI5doMZhyGFALjpHM1eRCBj9Cfid09fDiKNQnfMfa
-mameeh8Vahs/0FHEO71oCu5P56D0DH3Y23ljivAHl+em+8TzaEAJGX0fXlYG/w91+/zSPSLlpLjP
-rf/HI9N22MYDo1SQWYMaNC3TtopHATIPT8gGqbtKPDk5R/wL/98/LkuEAoCWKzlOdAxxMuQip2jh
-xQdPcf1g2i6BS+kF4KkyJhN8T6a4D8feC/6F/r8H7W60f+C3KvB63TV6pbgT7Q60yigCVBnu8Ur4
-e7sKTuCGbgNPdD+OUdcIP3zlBvq57Zg01KmSmf937/aIwNDIRpgcg/Dw9HfZkFUbpDeFScXI+s53
-cWQ6Y0K1w0ObQg8CvEN/4sFMRD+a0ps1SN/vEfwGjw2yeQv2iTJ8EetROdR4Xz7TxRA50HXfIwci
-deVnKaRrJVcCqFTT+M/AkMj6uH5PgNJIXHcagGQhR9Ki4fvFOO8M/GYJMBj/oCRO9SH3NgTkusY9
-fI4WDQ/UGPydzXE7fG7TMtbyDMbJ+BuH83bmoMZ6Ybe7Oi9xQ5CZ63tUZYTfEerxOh+PAEOMWU/y
-HLkdV33UoACD6TNX16tcPexeyKETrjke51mKCb0YBL85SB/ZRmoYVoUy0sntj/soPEb6iAHkcQus
-Z3xePbfOEPY4ZciDE3I9pgZjVMXQqIcdYBNqfNH1ufGM8vNo7CU1jeIF9tCvhm6fX5JZqFFeX72s
-N2DDXacvX12WvO+c+BArUL4wNVe8iWLk/565lv++gfb6jDXi1elrxNMAnlfAz0QgwXKfk7mlghWV
-hlhAWg9WtXxwfLZ4XAGrJ3Ac/U/tUbRHJlKTAY2A7CE02v8B8EX/RCNgkwEKTQGo2wFC/wRgmXee
-oILpF8HTNCprWWnX0ySgSaCYEvhw2rpH3pm9NrPG0p2ixrwN4iOATvW562FerRcfwlSqOmed+ADt
-fTQyqV6ZtlroEQ3cBfwMuacp6I9c3o1hWr0KMHoWRO5rAKjX8D+BFAHUyziG2kuIAiZAo/Y82nNT
-cnn/Z9AIzJ5CexJE9BMKOD1GAAVwIm3rgcmrxYMTVl3vnrm32PlPxRSZdrgmAU0CRZVAvUXrH62/
-ZJO9kX2vqLd4M+JuNoo6izaK2vhL5hNxOHp4f0LQggE0BEQAKPEWwOctVN57CxoQARGB0of4zRmg
-3sN3785ex/vTPv/hY9YW0p4YoLCyAgEWAxTaSwCoFwFKL83eKJ6flnsZBHGpq4AwC5pDFR1B6jyp
-ulCZB6MlsEfkRbnUgq/b7RRZaogaAPNoCCJ1h8H8GAZyMyFIH9HG13MU3I+KaaE/KYrZMRBV+l4o
-yrlQha4+3V/F0DCHug6T7Fv09Vd3Zpa765CJoKsdOdCZl6gYTAWiIvr5amYVPHdQjT6P6UIj+qCP
-c2EWTCdOSaqeF2vjzz3fHhr+BkygCOJf/DnO7b51f/4HIru7o18z2RyEiUYFxopzbhpH9BHPGwp2
-GUxTcd/fSVQ0rAgbm+Wh0bEBhqiX1MNvh0kJHjAWz2Hhou5FuEaxDmk5b+ODny7dMrd15gHxWdoO
-0QzmUNM/t4gmaJ+gNUZrtGSz+BitIVoDgFJ9ZGbXX7RJ1EOri1YHzQFQACYHQGGVhFpoNdFqoH0E
-Dap6Pg2KAGq9rEEBmN5DkwEKnxfvEG/PXnf8zam5XHWttDeyfwE2OzFxDjN5BzIYn7dTgSmpbViQ
-P9fnQSdSTm88hodnCxWfAgm5C/9H+XMedV+K0GWvjt50VK6Ch2JioZFHyEXr7/kIRImwpVoy6rH4
-Lgv3faxy9X73+nO+wFAAF0hpHH9A5RoIuHR1+2FVjLw6NL6ek8qcwiu2SfbGmdZAjlvYM2WInCcF
-y9yEPxvk9pWuwRABnqnYzxDzN1Rqg8hdvWkz2lrupyEqxznK2Z/+ISj1A9yvkitnzKZnJIhIfnjy
-/AV+ui4FV8ryMi3Ex9uYUzJEcHmQCgbjh/70rdT27WzfW7G9dXu/9hm7rnfI2i8+T98u2sHj1Bat
-DbKxW6O1QmuJSnot0D5bJrdP0ZoDnBig0GSA2symlSuAqgeQInBigILWVBigNoiQRZtFaNpuUXPh
-puyqs1cXbYnUokgK7lrEngTh4TFwyUUEptFnKTRW5+/pgkIiW8meCOPH+Y/1cfVFp4PIc0XAh4mX
-CY3pQfqJ1jUPrN33QL40AR87KROUxmuBtU3P5oGNcQn6utuVt8rTaQNrR9Rmlzk8JqQF0r5U8hPX
-uIEcNke2to9dQ3Q1CGSawCGR7SQJsoL8AagmPr/e2NXH8zh2Y9CncQiJLDbXBwI/jPsRClKWngk4
-WnDvHfj8BiPfu19bk84VIacVeNbOwsVfk4+F04BKlGK81wcG55V89ee8HC9GgBMS0RSE+qdKGEEv
-f85RJvt+l7H9004rd+3ovuG4+CF7n/huxU7xLSKE/4v2DeJxvka8TQe0r2w7RHu0L63buX2BJgPU
-dhcAtU0GKDQGJ7RmS7cyOOUBFEAK3zWz7xON/tx6o8HijUPrLd3s11u2pAQUFBpVVQabqB+Lek5K
-o2DtA+YTPA9f8AREpnNQcNij/p4TqnpzdhvjLe18LHuilKxsf86J8/RFf5CmEBmBsPwOHC1rMG1F
-X7f7DTahpjoELNA89lPqA0DwPfS3ZVHAhoqxA+D3oR+ZzvfDnjJEOsuuW6cF/3y46RIDGwIW9At9
-OyTlKxrP369Hv7cDgPyqFEkeM8qdwn0lFbqV0O/9fsGp5+C6y9CQAP57SOOESbuOvHI+iKvsd/lp
-xdaHf8rZE/dLzt5zYZv/Er+s3s85T92Q4tAVrUvmbg7io/Zj5k7xA6rpdUL7HsDUEe27FTsAUDvE
-fwFKDoCybQdAbcdyLjI4MUBBa2KAsgK4sg6IL1buE63Tt6+AxlS/7O8674oU3yGDTaTfb1L1LDzh
-5OjaSxTOj8l3Duc9H6gPd8Rc+HqPuhCYJfz2jGzo6zGe9kM/ouS+UYSv6So3Jcu7aGBjAtiYumDS
-HKDqfsSx0Dn91WyYq6GYFbjY8/Uf/AWZonDdrvZXyywxsGlrCUK/YDohWrqApouxhjvcdNhf7kZX
-J7qGHElu/IPu93Yut2HKohijwNDoJeWdCqX7O+5kNnKR+tDIq9CauGTJTb31Xrv/PbSx4WsPXIze
-cVoYNx8Tf6w9wLE0FMj3G4L3eqL9ikbpCtQoP6oHmrpAXTeAFBXS6kKNwWmX+EFpnXP2i27rj4rO
-qw+Jb1fsWvt1+raOXVcfKhIxVpKCLBGwUcwoXYjxawpuIz6DCdMimWTQkiiwzDlOAufR1TaGSFiu
-x997B6fSV36jRjUmU4oaPeQAip1FAhuOojWFciyNnFiZgwmEolf+mVGV6/W7lwMF9cYV+TQbvKkx
-yY/j++XuAgjdycABNrWKCdRhohyV2aD+SQ0HVnG63m2kOaBvuzjuxo8toE5fWbNRylXg/6dxjWQG
-bPB9AcHKChR+nNOxK5ljeqwqgVIfRTn8bzvGtO7gf2I2HBzcd/2BnQO3HBODd58RA7efFDGbjogo
-uMBNiDI2IukyAgvT9UEtnHC03ojJ+QMtjNte+S9+773hiAjf8pfovfk4gdRZANP8bll72oTl7vJr
-oEpTGCUJNlQAq7h9xUPzPB6aC9AcbJXrhbFpycQnh/Sb8tZr8vFCMtiAs0HAmHoIlYQoEmdDZhRp
-gQiIJCAAr7FUTsNA7WA/wUYSAhPXOJkAizRD7pu80kFvmbNxWpvK13tVOZtgo7KIHplhvDTMbT6e
-wrEba4QUtRti+kVdXoZNZIom1kckM8fkz8b8IOr+GKLOBhmiHeQtuJZOdL/FAhsuZQJy3WBM96dL
-N82+MdsP3R+74VCzIZsOjUDLRTs/fNdJMWLvGTECwYEJe8+J4XvPimF7zoqhaPFocQCmIbtPi0E7
-T4q+iMuJXHtgb8S6/XP6rN7fLXz1/jdumptz6ggeqmAlFPyXovaPCE72RhmMe4iDwF/yNKymCGHp
-3yCi/dzI/S57Pky7cY40Tmlgz1ledKqvpyxRbxR5PzABA0KiPqXrVzD0fQ+T5yoBRlG8UQEhMS8D
-uPbIfJfJivvL0dUDqIaabBI0H1/vUd2PeDJKX8C5ILe8cdAZ+gT7ey5a9BEyz5a9PRhPg8lGQIP+
-bqNyr/6ej18assl+kkxa9G8p3y/XMYo6Ud5FuobP16geVgWgeJBSKnw+5mbdMW79kcqJ2w+9PHL7
-8caJW4/0GLn1cNyIrUfGj9hyeO7wzYcWYl3vBcO2HJo2dONB8+DNhyLQvhy84cCHQzbt8VvtL2sZ
-yMtzmBLBlRTZ1q2I5UdwjiQ8PKMw4OPwlhkL+3k8Jk1YUUhdkkFFWucpFHEneMjxgA+hEhFFkU1g
-aFQT8p44r3/FsSMGUyQvFufHRutgkawC6kW/6ZjgIRGI2TGNKGoOmeL+pnB8G7ma0dffpI+HeFxp
-1F2Xg+pEvQ+ZjwRYUwEwdRwmVMRicX7cZt6uIKuJY6E0CzQra4kFkkX9PS9xNQCxIdA27ejrUiLu
-aT0tf8+Tb39UWKTzIK4rX9Z8sc6pHaxJQJOAJgFNApoENAloEtAkoElAk4AmAU0CmgQ0CWgS0CSg
-SUCTgCYBTQKaBDQJaBLQJKBJQJOAJgFNApoENAloEtAkoElAk4AmAU0CmgQ0CWgS0CSgSUCTgCYB
-TQKaBDQJaBLQJKBJQJOAJoH/AQn8H7ct6/eo8CJEAAAAAElFTkSuQmCC
-'''
+    def show(self, event):
+        self.gui.events.put(('progress', self._line(event)))
 
-    hourglass1_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAAHgAAAB4CAIAAAC2BqGFAAAAAXNSR0IArs4c6QAAAARnQU1BAACx
-jwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAADBdSURBVHhe7Z11dJtXuu7vf3et+8+BOzxnoBxm
-pk7bKU0bbqBhThtmJ07SpGF0zBQzW2ZbtliyLMtiZmZmyTIkbX3fLWtmnblnunrvNLF1Zs2zvuVl
-7zjSzi+Pnv2+n7W3/8fYPzUh+ifoCdI/QU+Q/gl6gvTfFfTzkfig364klbJqLpMy93Rc/wRzcRUm
-bZXHIEx+R4rpvw3o56NDTnmvilgsarkjarmroVUa2W2d1z5oOD0Pc34JJm055sLyulPzKAVHk38h
-xZTSoJ8Nx0zcLlZlWtvFpY3H3upIW0S4u5ZZclzc/lBLr7aKCAMV5zHnFrakrWi+uLLpworGC8sq
-vpia/MspplQEbZXSmDVXG88vrTr8ZsPJWU3nFrVfWt5xeVX3V+8Q769jFH4paLqpJpeaeV1K4tOm
-84ubL46DXtmYthxA+0zS5AOlklIFdMRrE3YXtdxYV7TnlfIvptWcnN9wbingA4ht6Svb0ld1Xl6J
-vfI2/vafenP2cusuK3D5RlaLVdjTffNPrZeWt11a2XppZculFY2n5wla7icfNJU0yaBtKg6l/ErR
-F3Nz97z29ItZFScW1JxZXnt2WcO5FY3nIXZXtKQhfO2XVnWkr+y6sgp/8wN61nZB7UUtqVDf3yjE
-ldVeXZvzxcInhxY+2j//wd55d3fPzTi4MPnoqaTJAa3h4lsfH3607ZUnu17PPzTr6bGFZSeWVpxa
-Wnl6WfWZZXXnltefX9ZwYUVT2nIwNbi1E3Lj6ircV283X3q78sL7hWc+eHBgce7RFbc/f+P+zmmP
-d0/LOrI879zqvIubbn/+ptusTj5NKmlCQcuZ2JpbO29s/PX97W9k7p+V/+WiwiOLio8uKTm+uPTk
-0oqTS6pOLas+vRRM3XB+eVPaCuTl9FVVp5flfrn4/t75X22bfXPHrIe7Z1zZNOXW9hmsstMNNzZj
-KrKbm+swzZja+prmbsLw8+RzpZomArSaR6m6tefy2l/d2Pz6g10znxxckH14Qc7hRQj00UXFx5aU
-HFtcemJp+aklVWeWQW5AYpSfXJp1aNGd3fMub5n59bYZ93ZOy9w3syztT/X3D3aW3nx6/3Tautfb
-727FPdrR3Fzf3dHYie3qFyr6+AqdxZl81hTTSwTtNCkbM89eWP0f6et/f2PbtHt75j3YN+/xgQUZ
-BxZkHVqQ88WivC8WFhxZXHRsccmJJZAbcGUfRnDTN8+8snna7W1THu+eWpm+piP3NLkxqw9XT+0o
-JzYV9jTkYRsLj37026en3qY83KjWav2xYanOyhSp6DwZ4E4+fYrppYCmNBVc2Trr9Me/vPzZWzd2
-zL61a96d3XPv7UWL1aP9CzIOzs86uBBWsALIjWNLwNfwR199PvvCxqnXNr91Z+trT8+8i807M9D1
-VMaliAfwXFpbP76W1l5KwOR31WQ1ld7HVGRe2rXi3q4ZvbkHJPRWb2xUa3EAaIZAQWDyk5NIMb1I
-0HajsvDansPv/PuZ1a9c3jz9q8/nXN8+++udc2/umnN717y7CUcDaIgOoPx4//yvd8y5uGlG2oYp
-1ze/8XDX1MY7uxjNWRpxn0kj1EmZSh5Z3N/Fo7UyCY20zqoeTGFz2aPmqmwmg+IKDTVXF1xc+7ue
-x7v6ys7742MOb4ApVoGdKSyRLxhJTiiV9GJAi5j4yzuWHPzDT0+vffPi5pnpW2df/nzWV9vmXN82
-++vtc2/unHN79zyIjof754O1r34++9yG6Wkb3rq+6fXMQwvaMo9xCTVWvcymF1tUXIOsXyOkKbhk
-5OXezj48htBWgW0qHWCQ9WaLb/C5KzjoCESUOuOX7/6k6uJHhLtr/MNjwcggW6JmipQ0jkRjsiWn
-lUr6saBFTMKJtVMPvPOLU2unnN8448Jns9I2zUzfPAui4+q2OdfA0Tvm3to198bOuZe2zDq7ftr5
-9W9d++zVnKMr23LP8MiNepXAqOQaFSyjjKmX9mskfUpBr5RL5THw/eR2Gr5ZwGOarLbQ0Hf+2Kg7
-GHX4wnZvyOrxB0fHTm+clbF/Hi1rh1bKDsVHpVrTeEyzxKrk5FJJPwp0+q5Vu1b+5PiaKafWTz+7
-cca5z2aehyjYPOvSlpmXt86G2AVTA/cz66efW/fWlY2vPzmyqvHJKUZPrZhNlnJIcg5JySMp+VSA
-qxDQZbxeEZvKZeDZfUSFXGx3eWLPx8LD3wXiI95Q3BWKufxAOWz3hGyegCc6WvTw4tWNr5JyDrIw
-9yOjYzqrc0CMYprIFCTnl0r6+0Gf3Djn4Aevnlgz7cS6aafXzTizYfq5DTPPf4ZAp2+ZdWHTzNPr
-p59e89bF9a/f3buo/NbB7vo8Og7TT8AMEDFsSguvt4PPwAr6cfx+Ao9BYNNxfFavVqf2hMLDY2OD
-34xFh78NDY4GYqO+2JAvPOgODrqCEYc3ZENX0BmI9vfTT3z4S8zX60kZ22Lfjdk9fhakh1BJZoni
-Q/AYqaW/H3TWlX2HP3rt2NrpJ9dOO7U+AXrjzHMbZ5xeP+PEmqln175xZfPUnLRN9QU3OuqLuhoK
-cJhCYksJub2Ciq3t7Wmg9TTScE1UXDOP3ac3GgKD8fh3Y4PPx2LPvg2PfhMZeRYZfh6KP/NHR3yx
-YV9k0BME1lGnL2SHC6VHwDc0dvi9X+YfXUZ6sMHldgWjcZZEA6amssUubyA5y5TR3w+aSWzZ886v
-j6+dDo4G0OBf9PnqKWdXv3Jjz9Liu6cwNYWYyhxMWUZT2eOWiidtVdmt1bmtNfktNQXd7XVcdr/e
-ZArGR6MjY5GhbyMjzwFueOR5dBh9jAw/g5Hw4GhwEDnaH417IToCf5Ue3vi3Dy7suLn1LVreQTGx
-Yuj5GFemA1P38qRasz05y5TR3w/62ejI1sX/cmzN9ONrph1bM+346imnPvn91wfeKcm+VV9bUVuR
-X/M0o6rwQUXenbKcm08zv64qzsBhW3h8nsXh9caGvWGED6waiA6FYqOhIeA7GgYjA98E5cjQaHjo
-eTA24o8Oe6ODvhBEx6ArEAZH2zxBSA9XKN7VUnPu09903t9GLzo6MjYm0Zqh9ujjy4UqXXKWKaMf
-tRie2DDniz+9iVj/6dVL25cUZt+vqqkqKymoLMkmdtY3V2aVFj5pa6mj99FVWqPVG4TXu83tt7oC
-dq/f4Qt5/FFPJAqsg9Hh8OCzEPAdTrJGjgbQMJhID/gv8YRintCgMxj5S3rYfEGzO3Tw7X8vO/ce
-/van8edjGrOTI9X0C5X9QnlyiimjHwW6NufaZ/P+186l/3Lr4pdPK6uLigvKy0vrG+pLCp+01hUT
-WsoMzqDW7NBa7FqTXW+2GSwOs91pdnrghW/3Bdy+iCcU9UZj/giYegSBHgLKoyiggXV8NBx/BuOJ
-9TA+vh46gxAgQBmlBxR5UEGn73n7we6ZtJy9egHZ4olw5VqWWA3rYXKKKaMfBRrkthmdJnU/m99F
-6iUzuX1sIVeqeVqUXV+eg2su5YtECr1ZpTepjRbwtM5iM9mcJofb6vLbvH4XmDoQ9YZjvmg8YerR
-v2IN7gZHD4KdR/wQNYn1EBztCkSSMe0NuCPD1YX3L637PT5zH6fumivyjCfXs6UaClv83XffJaeY
-GvqxoMfl8vpbe0g4KoPcx2JwxZimxoqiJz2tVXRSl9JgVuiMKoNZa7DozFaDFUztMju8No8fmdof
-9oYiADEQGwbzhoHyX1gPo9xAjkaFx39aDwMhaFvGY9rhjwgl0qN//FndlU+JDzYERsf4SgNHpqVx
-JcOjo8nJpYZeDGgQphPXTaETepm9Azw8mfo0/3F7Qym+tUJhsMi1eqXepNJbdCar3mIzjpva6UOm
-9gbB1BAgvugQrHvB+Egk/mfWABpWyMFngehwAvSgLxxzI9BQeARtnmSRBy3isU9ezz68kJrxuV4t
-FWttPLkO+sNYfCg5s9TQCwPN5PA7CRQcDZmayZMU5j5qrMzHNhRKlGq5RqfUGYC12mDRgqktDqPd
-BbUHLIwOePn7UVKj8gOSenAkNJRkDTECBkd5ghwdR6DH18NAxOFHhQdaD71Bb+xZwZ1T1z57jZp3
-iNmcITP7+Ao9QyAPRQeTM0sNvTDQDpenBYvvIdOJdCaDI6quLq98mtnTUtlPJ8s0BoVWp9QbVHpz
-IqntRqvD5ESmhvLD5Qt7glB+xPzhOJg3hKo6xBpAg6PRIhmF9XDYl3C0F8V01JkEnUiPYHSgj3Tq
-o1+13t5MytyjcsSEKiMUHqFILDmz1NALAw3CdHRjiTQ8jUFj8jqw2JKCxx2YcmJnnVxrkqt0Cq1e
-pTNqIKyTpnZanJDUPjC1xx9xJ5I6GBkCpuEEayg5wNGQJwg0pAdkdASBhhZwPD3gsrpRyQgV9IG3
-f1J0chXlwXqpzirWWqA/DP4Dg+YKxG04Ug+FTqIPUJnsgpyHmOrCrvoCmdooU2oVGmBtUOuNWqMF
-yg+D1Wm2Q/nhRab2ht3BiCcc9YcHgzEIa8QaMgRAhyA6YqNQ/wFoXwRFRyKmI1CGQ0wDaLPL+83Y
-2L1TG29vm0rPP9iPrZCZPNAfhv9RowMUiUQb27FYEo1AY/RxhKVP86tLsrCYUtZAv1Spl6mAtV6p
-NSBTm/5saofX6vY6vcFETQ2mjgWiKED+zHo0DI6GRjwSR9GRAD3eiDv9aD2EADG7fCPfjuFaKs5/
-+pvux7sphScVthBbqv2HXQzH1YUndxDIOAqd2s/BNGNKCzI6m8rJ3c1SlUGq0MCqCAGi1po0RjPq
-X1Cph0zt8KCaGgLBG44GxptyKEIGh4PAGkCjnmUEVktobWA9BEfDeggxDYuh3RuwuPzxkee+QBBa
-xMq0D0n31qjs0LboRkafJeeUGnrBoI1mS1MnrodEI/UycWRqYe7D5priroZiAC2Rq2VqrVwNFYhe
-ozdrTBaD2QH9i8XpAVNDnQc1tSsc9iHWQ8E/sw7FR6GXgaT2RVBGw59CLw7rIURHIj2gm4f6At0U
-Pb91waO9c+g5uzl9BJ7aMj6f1NELBg1qbMNCnYen0OlsXkFeRm1pTkd9EYcnEMnUEoVaDqw1OpUO
-AsSkNyVNbXF77B6/0xuCpHaHwv5EqTfOOgCsB0fgSyi0E7eWom7owqHwCCRuTHsCLn8oEh+GmK7L
-v3l5/SvknIPUymtioyc5m5TRiwctVahaupCpKQxWTU1VWWFGJ6acQugUydViuUqq1ICvIaw1ehP0
-inoo9cDUDo8NJTVQC3tCKED8kThUIMAaYgTqEIhs5GgU04PeQNTlh8IDcgNiOgCGBkePPP9WrZAc
-e//njdfXER5uNvigEkktvXjQoPqWji4ihURjwNJYnPuopfZpd1O5SK4RShVgapkSwlqr1hrVBpMO
-mdputrktUH54fIh1MALsUFiHk6yBsh+Vd0Porkh4EDXifnTHA7Ut3jAsntH4cHx4BNAe/uOv844s
-JT/cZDYbklNJGb0U0EKJHEyNI9PIjIG8rAd15XltNXl8sUwgkYtlSimwVmmUECBQ6hmsejPqX8wO
-lNSORBRAgCCmIQhrxBqZGqIjMowWw3AUQMN66I4MOQODRospGA7Hhr4ZHn0eHB57dGnvjS1vUnIP
-qmlVyamkjF4KaBCYuptAITPYpaWF5UUZHQ2lNApBIFUIpbIEa41crVGhshpMbYUAMdtc0Ho4E7Hg
-BaaRONTUwBoKOyiiA6gthMUQrqgvPOQOxdVCErc7U0gqNMupVhUj6LE4/IM9XS1nP/mP9rufM4qO
-JOeRMnpZoFUaXXMHFkckNLW2Fec9aq0r6Wmr4UsVfLFUJJNLZCopmBpVILAqov7F5ApoFHwJo0lC
-r1OwWk06kRequgRr8DVciDtU04PPnC6bglkv76sR08p1gm6but+p5+kEWHrDV3qD7vB7vyw9827P
-rU+S80gZvSzQoKaWptqn99qaqwpyM2rL81ur83kSBU8kEUhlIqlCKlclAsSgNph1Zqeor1lIq5Ex
-WxWcThUPq+Z2acVEIAtJPV7w+WMjkCcWDVvHb9PyO9WcVjmj1q4ZsGtZXquMh89ntNzhdj9O37Hk
-/u5Z1Oy9VjE5OY/U0EsEHQrHKkqym6uyOhvyWmty2mvz6AwGT6riS5UiuQrKainqFdFdPT6lRtRb
-J2W2yFkdKl63RoDTCok6EUEvJgHlYOy51+93mKQWOdmioJrlZKOEoBN0GUQ4p57jMvAdWjar8yGr
-8zG740HpwzPp61/DZezh1l1NziM19BJBg9h8UW3p47baXGxjHr4pj4jJpHUU9xMb2HQsn0UTCrlS
-uYxHrhbSaiWMZhmrXcnFqvmIsl5MNkgoegl8JFnUAw4N06Fj23Vsm4ZpVfeb5RQlq9kko7j0XJ9N
-rhzA8PG5HGwGuztHb3V/+e5Pai9/gr+zNjmJ1NDLBQ1qbW9rqszorM/vAdDN+ZS2fHp7PqOrsL+7
-mI0rY+NLedQ6yA0ps13Bwap4OI2AoBOR9BKKQUY1SGmJiwzELap+m47rMAjhEzW3XcFqNivoFkWf
-Vc0UU0tEpGJ2+z25HL1H6eTaqZkH55Mffx50aMfnkAp66aBHRr+pqyltr83uxuQTmgsprYW9HcUM
-bCkTVzGAr+SQ6/i9zcL+DimrW87FK/lEjZCsE1P0UopRRjPKe40yuGh6CRWSRM3r0vC7DWKiht9l
-EBPMyj67jiOmVoGRBfg8PqkkPIR+TliVmT7+VjEpNmd8Dqmglw4a5PIGaytysI35uOZCUmshtaOY
-ji1j9FQMEGu41CZ+X4eQ2SPlEOQ8klJAUYmoGjFVJ6HppVSDjJa8pAi0QUqxKOkQJlpht0WJvGyU
-UXmEQi6ugNF8U29O3t9QSTjHP/hF882N1Kxd4yOpoIkADWIy+zHVuQCa2FJIaS/u7Szr66lkEus5
-tBY+AytiEcUckpRLkvPJSgFZLaJoxRQdZLSUCl4GvloRyaxkWDUDANoIZpeSrap+u5YjYzQIKWUc
-bJaYgx/9JvlcoP1v/7Tw+Er8nTXfPEuVXnyCQD8fHTq75yNsayWxpYjcVkzrLKFjK/rxtSxyI7e3
-jc/oAlOLWTgpG6fg4lV8gloAGULSisiAGC6Lmm3TcsDCEMoA2qJk2DQD8Im0r05EKecRS3yxv7op
-mpG2/ebnb1FzD+iZzcmhydYEgQalb5ufmbatu70G0oOCWJfSseX9+GoWqZ5DbeL1tgoZ7WIU1l1y
-dreS26Pk4VS8Hp2k16rlW7U8SwI0+BrWQPjErmWrOG0yJkZILDY53Mnn+LP6cBhoEbse7BgoO50c
-mmxNHOiOqsxLn/6iM/dMR1MlAZNNacmHVZHeVdLfUz6Ar4JVkUdtEPRihH3NYkarhNkKC6NexTVr
-BWYN36LlWTVci4YFoBN2ZpnkvSpOh6yvRqMW/+fQGNfzb77Zt/JfKy58kDot4sSBdtnNX77704ar
-n5Aytgvk+q66TGLDI2prbm9HIQNbwuwpZxGruZQGQV8bLIxqGVuvFhrUApNGYNYCaD4CrWZbVFBH
-g505sDaqOO0qIckf+9tvlEnfufzhnlmUrF0uNTs5NKmaONCgIx+/kn14EfnR5mcxn9sfJfa04esz
-qC3ZUO0NEGogQAT9XRIOSS7ohUsp7FWKaGoRTSOmacU0HVR4cInJUPOZFAwtAt1mdQeTD/1f1Fr+
-6NK63xOy9guabyeHJlUTCrr0wZlrn71GyT2oIBSNjxgsdjKundqGTM0mNwBrRk95H7Z4AF/BpdRB
-koj722TsTjmnG3oZFR+ltkZIVAvwUkaj0aCMDH5vUeGw6L9876cNX60hPvgsOTSpmlDQEm7vyY9+
-2Xp7c2/egeRQQhaHu5/RS+uuxdXeo7YX9HeXsQjVPGqjoK9FzOyQsbAKbs94KaLi46EIUfPxcla7
-1fsD29y++PB3OV8sJj7cFAtM/nbaCQUN2rfy35+eeht3+9P/+l5PfzDK43EoHWW9HQUDBMjrBOj+
-cdBgZwRaLSRCzafm90CCuwM/ALr4zolrm16HF5CSVJIcmjxNNOj7pzbc2T6VmrPfxO1KDv21YkOj
-QiGP0VPFIdUK6C0iVPBhFRycEkBDaAhRfQ2gzTZrIBxN/p3vkYhFPvXRr9rubKHnH0oOTZ4mGjSl
-vfL86t90P9rNrkpLDv0teQMRNoPAo9SJGe2J2yAJ0HySGigLwNQkmycYCP/wDtm9K/+t5PQfcLc+
-TX49eZpo0PF47MCqf6u6+FHP7R/4xw+NPhcIeAJ6k3QAK+Og+01qAUkDDbqQqJezrC6/JxBKfuv3
-686xNXd2TKPm7DMLcMmhSdJEgwad2zzv8b65lCc7fEZxcuh7FInFRSKBuL9dzsEpeESlABxNAUfr
-1SKry2d2upLf9/0itpRdWP2bnsd7ONWXkkOTpEkA3ViI3ulCzD4gan+UHPp+6Uw2CY8mZfcouEQl
-n6QCR/PxRqPG6vSaHa4f3LgZjaDdRNWXPsbdXp0cmiRNAmiTRnb0jz/HXF9Perw1OfT9GhoeEYlF
-kgEsOFolhNygQh1tsVodHp/N6bE4/++7HP9VZxJbxslPtvstk7lVaxJAgw4ldrwS7m8Yjv1wzooV
-agmrW8Enq4RUNXSJQpLV6QHQdpfPlniDZPL7vkd1edeubHiFlH1A3JGRHJoMTQ7ovGsHv97yJjX3
-oIZWnRz6fqn1JimPquBTVKJejbgXGnGrx2/zoLeQ2cHXbsDtG332vWcp6ZWiY+//vOnrDeSM7cmh
-ydDkgObQus786dcd97Yxin/4hEutwSwTsRQCqkpM10joejlzHK7LF3R4/eBou8dvcXndgdCz538b
-94F3fl5wbDnh3rrRoR8ovV+eJgc0aN+Kfy07917PzR++jalQaxUysQLlRp9W0mdQcQE05AYghgrP
-6UP7cMHdNo/f7PQ6vIHBof/7Bkj2lb03tsIL6IC2ry45NOGaNNDXD71/f9cMavYem5SWHPoeCaVy
-lUqlFNDUEoZW2mfUiNDOF0hntKMr6A1GXH6wNlyQJAH4PwDcJocnEI79ZU/nALkdXkCd97f3Pz0x
-PjLxmjTQ3XV5aWt+i3+yl1d/LTn0t+QPBCVypUprUAp7NdJ+rYRh1MkgKxxun8MXdPqCnkDEF4oC
-bifaPpRg7QlAO2N2evSwaPqT3SO8gMrP/3ESfw4waaD9Hufhd/537ZVP8XfXJYf+liQypUylVutM
-SlGfBhwt6TMZlOhd624fUHb6Qm5/yBuKJt42FvcEI8B6fF+/xe23gLXtXp3VCcl9bf+7D3bPpGbv
-dij6kg89sZo00KDjq9/MOrSA/Hhr2KlPDv21AoEgXyRVJECrJAOJ6KCbTVq72w9edXmDLn8Ivc03
-EAbW/nAsGBkMxQbB3VZ3wOwC3D6Lw2tyeu3Bwcr8u+mJLeP8xq+Tjz6xmkzQlRlpVze+Ss45KOvJ
-Sw79tbgCoVimUCjVUOGpZDy1mK6V9FrMBrT6eQJOf9AdCLr9EQDt8oe9QTD1YDASC8Xi4diQ2x+G
-UsTs8JpdPqsnJBCJj/3xZ3VXV+PvrU8++sRqMkErRQMnPvxFy61NtOw9yaH/JK3ewBOKxSg6Eu+k
-VojUIvQzLYvFhDIa7cMIePxBiAu43AGEG+D60ekf46yHw7E4RLbJ4QPW/uHxLeOLSI+2RL2TsJVo
-MkGD9q/6SdHJlbg7a755/ldvzBgcjDMH2AKJTCxXypUalc6gBuBCikZEgf4bRYcv6PYFPEEIjbAn
-FEWbnINhwO1ExyVEg1HIkHgkFo/FhyFSjA6PKzySc+PY9U2vj28ZTz7NBGqSQT8+v/XW51OgwjWw
-WpNDCQ1wuDyBUCiWJkCr0d5mtUqF3plHtNht4NM/g4aVMAKh4UFbLqKeANq9nAjuMGIdBV8D65Fo
-fNjhj5LwqEtqu7OZkLFL55no7Z6TDJreXX/u0//APtw5UH42OTQ2ZjRZ+llsvlAoQo5WJKJDr9Hp
-lbwejQBvcThRdABoyGi0swhAD6Jdt8GYB21vQTEC1QhU1v5QFMIaWEcHR4ZHn3lj3xz4w0+KT71N
-ub9OpDFprT98Q+oFapJBPxsd3b/yXyvTPvxLhfvtd9/R6H1sLp8nRI6WINBayGiN0aJgd6l53Ran
-B9pC6L9dsBImQHtCaAeGB519EEN7yoNhZyAMrG1utDkuEhsazxB48Dsn0Q/SxreMC7R2+A8bf9IJ
-0CSDBl3cvuTR3tmUzF1uLRe+lCuU/QMsNlcAjhb8BbRGrzU5FOwOFbfT5vLZ3UnQsAz6QmhPHDph
-Am14AVNDWKPNcS5f2OFFu/JhkYwMDkcGh2ARwLdUXFj9G1zGbnIR2jLOFKsGJ+oowskH3VJ6Hypc
-YtZ+Ues9+JJE6WVxOBweOFoMxR1Eh1ylVgJos0PO7lKy2tAhP57ElmZYCQNhXxAh9kdjaK9naNAT
-hjo66g5GXf7kfnGoqSGyo4PDg8PPfMHgobf/veriR8S7a5SOiFBtHBArx6fxsjX5oG1GzZH3ftZw
-bS3tyecmZ5Dex2RxOWyekC8UCSGjZcjRSo1BZ7LL2Vg5Ah2yoa2fCdDg6CAgjqH9cVF0tAp87gVf
-Q4YA6EDEnjh9yer2wZfRxHkH57csyNg3F20ZZxAkegdbqlYarOMzeamafNCgw+//JvfLJfSsHSQq
-vX+Aw+JyEWiBSCCRohYcqg6NHkDL2D3ygXaLJ5go7wKuAGq+E9vi0OET/uigPxJHAZLYXQtL4vix
-HslDEJwBcDr04rV5Ny6vf4WSi7aMyy1+vlI/MQcwpQTooptHv970Kq74Erazjcnmsjg8Nl/AFwFo
-mSRRRyu1BshoKQcnZSJH211QdaATxqDY8MNKiE6eGAygMz2GEicCDQJuSA90lik6YjNk9wUgrE1O
-+PNnChn6OQDm6/XER1tUrrhQZQBTD4heeoCkBGhBP+H0hz+ty/u6raFsgCtgcRKOFolE4OgkaL3G
-ZJdy8JL+5gRoFB0efwjqOXB04jCmeCA25E/szU8ECBR8ECAoqRMHTqDt+RYXugECT3f4/V/nH11K
-fbxZLJeLtVauXAumdr7kc2NTAjRo75L/WVtRhKnI6WfzkKMFAp5QIpRIUUYr1YpE1SFh48SMJpsb
-6jYvqqNRdKCSIwCsI0P+weEA2p4/vnE8DuWHGwVIFEq9xBGbQZsraIFmZngs99rBG1vepOUdkhBK
-JUY3X6FjSVQ0riQ5lZejVAH94OyW0qKclppiIh4LduYIIDokqLxDoNEOfQAtZuEE1GqrJ2xHPzBE
-t+4ANFyB8FAwFg8MDgcH0ZkTaJttFNIDnQs03iuOBwiUH+BrZ3CQ3IO2jKMfpBUddUS+4Sn0HKm6
-lyu1ubzJ2bwEpQpo7kBf7pN7TTXFXU1VLIGEI4CqAxwtB0fLVRrkaLNDNNDNwRVBGwJ1tMMTGHc0
-OoYpkgSNWEdRgKBzfNHeZuhfUPnh8IfH08PmRicxWf0xKPLKzqKjY4e+GROojFyZBv1+gJdp6lQB
-LVeqMh/dqSvPa67KZQtlHD5ktFgolaMWHKJDi6JD0NfG6ik0WsxQddi9/sRt6ARodKZHHOwcjI8G
-Y+jQGrQwwhUehJhGHTlKj8Qpm1DqJY6OvXrgj/d3zaDl7NNx8TZ/jCPTQHpQOWK373vf2f4jlSqg
-BRJ5bvbj8qInrTWFdHovRyjiiyUwCOUdNCwKjUFjcnCpDQBaoxIDLyd0huiOXdQfgYAeDA3GQ7Gh
-UHwUnQsUR0cDQVhDtZdcEoOJOg8uYO0OuCMjdSWPL637HT5zH7MqfQReT3Id1B4MgfzlnYecKqDp
-A+zKqoqnuQ9b60rwnU1ckRSiQyBVQHSgAyegYbG4WfgyNq5Izqc4AnGbzWR3mD0AFB3oMQ56BBwd
-HhwNxIcDUbgSpR7qFdENEAfqyIM2H2rK7b6IVKk6+t5Pa698gr+7FkAb7G62BBV5JJZwvK954UoV
-0ARKb2tnV0H2g8aqwvb6Yp5EwRdJBehkD3TjH8o7rcXJaM9k4Z6K+hpV3E4Nr0Mv7DHJqb5QKIBO
-qAc7jwQHR8PwMY5OcAuiI68SdR7U1KEoxDRaEiGpvYHxo2NPrJmSdWgB9ck2s1YaGRplSdQssYrO
-k0o1xuScXqhSBXQXjkjsZeRlP6guyW6tzmfz+HyxDB1Xo0DnXal0JomYw2h/IqTVyAdaVJwOnRBn
-lJLNcppFTvF4bMHhb8dzAx3+OB4g6OBp5PdEqRdzBWOuUNzhjyaOvPJ7Ys/z74xvqDnEackYfD6m
-MFggpl/ebxdJFdDt3TgCjVFeXlJagM5DphCwAokCZTQCrVWb7ExcOY9YJumrlzFb1NwuvSgBWkm3
-qfvtmj63RRoaeh6GC53Ri6wdRMcSQlIP+wefe6IjdofFrJeaDUpHcNjmh+J6sJdKOP3xr1pubSJn
-7ox+MwahPyBWMYVKKkf0g+/n+zuUMqCx+B5Kb3NbW1Huo5a6p90tVQKZClhLFEqZxihTKgc6MwWU
-KklfnRxA8zr1IrxJRrEq6XYN06ljuwxsj5Ed8DnDo2PhkW8SR0COBoe+9YejNh1Hx8FoWPWq/ioZ
-tVhCKtCrhY7wqDc+dujdnxWdWEm8t87lhQZzGFpEiGk6X8qWvPjfTZQqoDtwxG4ChQDpkXW/viKv
-vSYPQAtlKpnWLBLxGW0ZbFwxn1wp7qtXDDRreF16IQ6BVvXZNANOA8dt4nstAo+J57MIAkEPwj08
-5rLKLdIesxRvFHfrBR1aTpOKWSvrLRXhM8XkYsju++d33t42pTfvoJBUE4w/h1J9QKyE2oPQz//2
-2xd8cn2qgO4hUrvwJEo/u6Q4r6I4s6OxlNHP4PHY/YTaXsxdZlcuG/dUQKkARytYLRoUHXhYCa0q
-hkPLcui5HrPQaxZ5rWKvVQS4vSauS89yqukOTa9NSTVLCSYxVs9vVbMaFH2VUupTESFXRMiszT6X
-tu617ke7eotPBIfH00PJFCogPazOF9wlpgpoMp3RgSeSepmNzc0l+RnYhvye2rvE+rvUpod9bZlM
-bC4HVyxEoOsToDv1YogOmhUCWst2GvkeC6Lst0n9dpnXIoQYcRtZHmCt67ere60KslmKMwrHTV0D
-ppaQC0WkfBY288gHv61M+4BwZ7Un+gxyhifXQotI58s4Uk1yZi9IqQKayeG19xCJdFZXZ3NH9WNs
-Qwa+8Qm5KYPW+oTRngWOhuZbSClPOhqiQ0w0ygE0067jOA0Ct0XiQ5QVQNlr5vvMfPjoNnLdBpZT
-y7CpaFY5EZma1wphreirkFCLRYR8BaPi/Ba0oaY3Z6+UifUNPtfa3FyFgSFU4Bk8j93od72wd4Ck
-CmiRVNGOp7Q2VTdVPu6oy8LWZ+IwmeTmJ70tTxgd2SxsXgJ0hbSvVgmg+eOge62qAZue6zQJvVap
-16H0mgXA128V+eACj5tRajv1Aw5Nn01JAVMbBO1aDkbJqJLSSsTEAim1uPDajssb3yBmH6TkHbRa
-DeyB3qqKotraqvqmpvv7F1/65OeUmjvJKf44pQpovclaX1fZUJHZXJ3TUZuFbcjCNWaRm7NoLZnU
-pkf01sccXKGQXC6l1yoHmlVQdYiJJlmvVY1Au8xij00B/kXpnAgQ5G74aJV4LEKXkevUMSFALDKC
-UdSp4zaPL4lQfohIBeT6Wyc+/n3d1dXkh5v6iJXkzqfdXQ3lGRce7593f+/8kuOLW9L/kJzij1Oq
-gPYFwlXl+Q1VOc3VuW212V0N2XhMNqkpk4R5SGt53Nf2hNmZzSeWAGioOlS8Lp2IYAJHA2gD32WR
-OXQst4EDhYfPKg045H6HIuBQ+OxyYA0FCRR/YGqU1FB+8FrVA/VyermYXCTE5yr6yo6vfiv78CJG
-/v720huld4482jvnzs5ZeUeWNKWh37NfdvD156Mv4CflqQL62fNvq6rKAHRTdV5rbQ62IQeHycI3
-ZlCaM3ohpjuyWGg9LBRRyuVMDNTRWiHBIO+1qFk2Pd+moju0TGRni8hnlwWcyqBL7Xeq4RNgDeuk
-GwJEx0yUHzi9oE2TrD2KJWSI6fKHZz+7vmUKs+xs7t63rm95s+DYMuDbdmklgG5MW15zbJaB87d3
-U/9/KVVAg2ob6usrcppqAXRuV0NOd0MWAWK6JZPelgUxze7O4xGKADSYWsVq1UILLqOhg6zEeJuq
-16EdAOeCf8HOQDng1sIVdGn8ENxWqccsgGrProL0wEPtoec16zgNEnoNBZNRdWvvg/2LL2+amvHF
-8q78cy45jfJke9OFJc1pK5sursRcWF5/ZiGt6AXsE0gh0AQqrbYss6k2v6Uur6Muu7sxm9iUTWnN
-6mvP6e/M5fTk84lPRdRyeV+dio0KD50QpxfjzFISgHbqWEATojngVCHEXn3Iawi69QGXGjwOTncb
-2C4dw6WjWxQUER3TmnM278Q7d7ZPvfb5jJwjy/GZ+zX4XBOz0SYicOuuYc4ubElb0XxxZdOFlXWn
-F2DSViWn+COUQqBFCk116RMMgK7Na6/LwWJyiM051Lacvo5cZhdUHQUAWkKtkPc3qNhtWkG3XkxC
-Ma3qt2tYDh0bNYcQ0C5tyGMM+c0hvyXkNSFru1Qhj9rvkBsV/aTquyVpa+5um3Jt6/Q7u+eWHF+C
-u/4O7dEGZtGXAswNFanExO1Q06qaLyyF9MBcWFb15dT26x+/kN9vlkKg7S5vdWUBphocnd9en4vF
-5BJbcqlteX2deQPYAi6+UEAqkdAq5YxGFaddK8AZJGR0aiashzq2w8BFVYeR5zFxvRY+lBxBlyri
-N0SDNpdVyWjNrfxq053P37y6ecr1bbNyDi9qSlvR/dXb2KursFfext/+uDd7D7c2Xd6TZ2A2Wfjd
-XTc+rjkyBXNuiUVETE7uRyuFQMN6WF1b0ViV21yX31af192UR2jOp7bn93XmM7sLOPgiIQJdJWeC
-ozu0QrxBSk2cOsiy67jQHCJHm4VBhzjilofdGpuOR2/KrLi66eaW1y9vfPPKlhkZBxZWnV7Wnr6y
-/dLK1kvwcVVH+srOK6twN96nZGxllZ+RdDzW0CqN7LaByjQTD5uc1gtSCoEGtXR0NFRmN9UWtNfn
-dWEK8C0AuoDeVTDQU8AjFAvJpeJx0JxOrYBgkPWaVUwboiyEZAi6NT6nViMg48tvFJ3/07WNr1xc
-/8blzdMf7ptfehxqtRWNF5ZjLqxoSlsOq1zrpRVt6as6Lq/svLyq+9o7xHtroTlkV54387qGoy/l
-LaapBZorktWUPYH1sLW+AEATWgvIbYV9nYXMniIevlgEoOkAGqKjUycimVUDLovUaZYb1Px+bGn9
-gy8e7l94ed3vz6174/KWGff3zis+tqTmzNKaM8sS1/L6c8saLiDcsMqhAi59JVytFxY2n5qBu/WR
-id363XffJufxEpRaoG1Ob211IYBuq8vvbCzEI9BF9K6ige4iHqFERC2TM+o0vHboVuQ8Uj+upjH7
-fM6ZT7767PULa187t+6tq1tnQjtXeHRx6YmlpSeWlJ1cWn5qScXpZdVnltaeXV53dln9uRWY88jX
-mLOL6k/MqD82lVN1MWhVJJ/+ZSq1QMPq3oCpx9TktTYgR+Nbiqidxf34Mh6lgkuuYuKr8Q3ZVQ9P
-Zpxee33b7PNrXjm95vULG6de2zYb+OZ+sTDvy0X5Xy4qOLK48Oii4uNLoKgoO7mk4tTSqjNLq88s
-qz27rObUgqqjMysOoiPhbBJK8lknRKkFGlRRVdmEqWhpqmprqW5vrcVU5pRnXs68vPf2lx+mb55x
-dvUrJz9948z6qRc3zbi2fQ7wfbh/fsaBBU8Ozs88uDD7MLBemA+gjyyC3Cg5vrgUTH1ySdnR+SWH
-phXtfRWXsdvwPYdmvWylEGi7SbNr5c/ObVtx5dAn6bv/kLZl/unVr53+5JWTn7x2YvUbp9ZOObdx
-+qUts65vn3Nz59zbu+be2T3v3u65D/bNe7RvQcb++U8OLcw6tABKN/B1wdFFRUcWFRyalbfvrdzd
-r/ZkHTLwepJPM0lKIdBffjr10IevHf30raOfvHns0ynH10w9uW766fUzLnw289LmWelbZ1/5fPZX
-2+Zc2z776+1zb+6cc2v3vLu754KpgfVjAH0Qgc46MDdj99RH21/JOTCDXHrJqhhIPvpkK4VA1+Z8
-tf+Pvz2+dvqJddNOrZ9xZsP0sxtnnv9sxoVNs9I2zUzfPOvyllmI9fbZ13fMvbljzu1d8+7umXtv
-7/z7u+fc3Tn99tbXbqz/VemFjwZac4IuU/JBU0YpBNqgEu9Y8VP0e/PXTgMvn1oPoGcA6wubZqRt
-nnVxy8z0LbOvbp0Fpr4OrLfP+mrLlKsbX0tf86s7O2e2555Xc19YF/cylFqL4Y4VPzv66bTja6af
-WDvt9LoZpzdMP7chaeqLm2emfTbt/LrXz67+/ekPf35189S6h0cElKZ49IdPZUoFpRboJ5d2H3j/
-d8fWTDuxZurx1VOOf/L60Y9fOfLhb75475dfvPOTO4febcq7LOnvHo6n1i/u/X9RaoHWynhH1kyD
-mL6wbfG9E+tK753oqcuWsohBryP5Hf9tlVqg/4H1T9ATpH+CnhCNjf0fTXtTLTwMSyoAAAAASUVO
-RK5CYII=
-'''
+    def end(self, event):
+        line = self._line(event)
+        self.gui.events.put(('progress', line))
+        self.gui.console_print(line)
 
-    hourglass2_pic='''\
-iVBORw0KGgoAAAANSUhEUgAAAHgAAAB4CAIAAAC2BqGFAAAAAXNSR0IArs4c6QAAAARnQU1BAACx
-jwv8YQUAAAAJcEhZcwAADsMAAA7DAcdvqGQAADCgSURBVHhe7Z13cJvXme7vf3fm/rO7uSmbbsey
-rS6rdzmO49iOrGZZxepdtnqnREmWrN5IsTexd4KdBIkOEARA9N57I3oHWCVbvO8BYd9kd72esSUS
-2ckz33DAI5I48+Oj533PB5zD/zX2T02I/gl6gvRP0BOkf4KeIP0T9AQpiUB7jCJMyirMxVXt11eT
-Mvawqy+rSCUD/v5nI4OJr/hHVhKBpuQfrT01D3NhOSZlOeb8kvrT8zqu/cXEadXSKsTNd8XNd9TE
-Iqei59noUOIb/qGURKDLP5vWcGFZ44UVTRdXNqeswJxb2Fd+3iYm6OhVkraHrOLjhLvr2lMWNRx7
-s/XiUnZFipnX+XQ4lvjmpFeygPaZZQh0yvLGCysBdNPFFY3nF6uITyz8Tg25RNh4k1HwOfH++q4v
-3mm/vKrt0vLGc4vqT86uPPxGw/mlrOqrNhkt8YOSVckCWth8v+H0vOZLK1ourWy9tLLl0vKum3+1
-ibpN7GYlLo9Xe7kney/+9l+xV97uuLyyNXVVayr6ZcCvpP7c0uqT88s+m16459XmG+tFXYURrz3x
-Q5NJyQI6/eDCu7vnPtg779H++Y8PLcz+bGHN1XUiXKmB2aAjFQhrLtIzt+Nv/qXzyqr21JVtl1bB
-r6Q5ZSXmwoqG88vrz62oObus+szy8hMLnnw2O2fPa4WfzaWUXbGruYmfngRKFtBui+b2p2/kXtyU
-e25N5pHlabun3985/fanr+ccXfHgwOKCM3+puPBe06W3cV+83XV1VcflVeB6sHNjyvL6Cyvqzi+r
-Pbe86syyitPLyk8tLT2x9MmxhXmHZj/eNeXRtldb0g5refjE00yekqgYDj8ba+oi1NRVY5owTU21
-mPKs+hub2aWnb22feWXT1Ie7Z97cMfuLbXPu752f8/niytPL2lKRrxtTVtSfXw52rjq9tPLUsvKT
-S0pOLi0+vrjo6JKCI4vyPl+UsX/2/e2v39j46+pbOxUsbOLJJlxJBFpvdfYKlEyRsgPb2dXe0NRU
-h3u0o+3u1pT1U57cP91RcrPu/sHSlL9m7Jt1b+f0L7fNvLxl1p3d8zIPLSo7uRQyBNKj8syyslNL
-Sk4sLT62uOjYkoKjCHT24UVZhxc8Prjgwa5ZNzZPubzuV5W39mj4lMSzTpSSCDQgpvPlLLFaprf5
-Y8ManY7ycOOTU28f/eB32IaC7vpcYmMBtb2sF1dHbshszzldkbo2bfe029umXtk8PXUzgp51eBFE
-B1zFJ5YUHlucf2Rx7mcQ94syDy1IP7Ag7cCCB/vm3dsz78a26akbXrmw5jcNGWedZlXi6V+ykgg0
-gSVgCJUAWmd1eGOjUnpLT86Be7tmXtq1AlOe0Vhyv7M6k4DJo7WVMPE1PFqrpA8v51H6Op9gc888
-OfOnO1tfu7b5zQsbp33x6Zx7e+eDl8HU+UcWQV3NPLgw/eD8R/sXQLGFf7qze+6tXfNu7Jhz+ZM3
-T3/4yytbZ1Ma8xOTeGlKFtC+YITCFoOpWRK1wxvwD471lp7vTtt1cd3vm6ryXaEhFoPSVJnVVPqo
-G1NA66hkERr4tBYJs1PFJ+tlLLNWpJX0MpoyG+7serhr2vXNr6d8PPXipplf7ngrbf98YA3RgUDv
-m3d3z7zbu+bd3PXWlzvnXt8+54tP37q8ecaZNa8efucnBdf29JtelsGTBbTWbKdxpSyxiiPVBCMD
-/uExwt21lRc/+PxPP1XpTY5AxBUc8A08M1isfQwytrGE0Frei8fwejrA10oeWSuiGeVMq5pnN0hs
-BjmPUN2acSzj0ILrm6akfPzmuY9nXP10Dhj54f75EB23d8+7ufOtL7fPvb5tzhfb3rr86ezUrXMu
-bp51et0bB//4s8s7lohZL75LSRbQbIk6EdA6c2hwVCfj0DJ3pO+fd3rj7ODomM3j7/eGHL6wOxj1
-x0ZDQ8/NNruQz6Lhm5jkNj4DL+NRVcIerbTXIGOa5CyTkm1S8QxqIZ/c0JpzJvvoymuf/OH8hjfP
-bph+acvsGzshOuZ+uWPute1zrm57C6IjdfPslE2zLnwy+/zGmafWTT3wzr+fWDdNzCIkJvcilCyg
-iSwhBHSfRK23OSOjY2zMfVL2wasb/1D48KInOmr3BPo9oX5v2OUPu0Ixb2gwMDgSHn4eezbW7/Io
-FRJOL5HHwIs5VDm/RymkA3SVgKrikxRckoxLknDIjO6ahsenHh9ZdWXjlHPr3zyzYQaQBTtDoF/e
-OufSllkpm2ef3zTz3CezzgLrDTOOr526a+VPU3etSszvRyspQA8ODZPZYpZIxZZq+j3+2PMxUvo2
-zJcbTrz/SyaT7gxE7d6gHRztDbmCETdkSHjAFxsKgLUHRqPDXw98NTY8NuYJhXV6jYDdw6Hj+AyC
-gEkQMnECBpbf086hNPcRMUwCho7DdNXllt06eHfvoosbppxe++bpDTMubJqVumU2Av3JzHMfzzrz
-8YzT62eeWD/9xNrpB//yh5Mb30rM8scpKUC7vAEqRwJ2Zku1weigy+0iPfg47+iyw+/+0jcEuRGA
-3Oj3hZy+EESHB0BHAPSwPzoSGnwaGX4WGXkaHv0q9vTrgWdjg8/HAgODBpORz+ml4ppouEZad0NP
-dz0VW0NuKyc2F+MwBZ31+e11hXX5N7JTNl3ZPO3sutdPrJ12esPMcxvhQqBPbZh5ct30Y+tmHP7g
-tcwr+xKz/HFKCtA6S38PXwZ25sn1Q8/GJMRyWu7Bm1vffHBhh3fw67/LjQDkRswfHQRHBwdGwwOj
-kZFnkeGn4ZFn0fhHgI5Ghr6OjowFB0cNZjOPw+xqq22uzm+pzmupymmtzGouf9xYmoYpTcdUZGOq
-C4runrqxZ+nZNa+eWDP1+LoZ4HEADY6Gx3ve+TWL2JyY5Y9TUoAWqfW9AgX0G1KdZWRsjF54tOP+
-tnMf/bazudoVGkS54QmCo12BMOo9QgPe6IA/OhyMjYSHgCliHR5GfMNg7REolU9DsdFAdAiMD78S
-b3jIGxuG1pwv4OOwzZVF6U8yvizNvlmee6ey4EH1k/Sa8ry6mvLirFtfHnjn1OpXjq+Zemzt9ONr
-px9bO2Pr4n95OgozegFKCtBMkYIpUnFlWq3FOfhsDH/7o9Jz7x58+ycWd8juC36bG85gxBMa8MQd
-PZ4b4YGnCPQ3lCPDoyHw9cDTYHQYKHsiUY8/6vDB/wa/zRWwu/2QQjZvUK0z0Xvprc21JQWPmyoy
-iR11FcVZpcX5ldWVBVn3L21fcvyvfwDKn/31jRMfv5iABiUFaKiEbImGp9BZPRGDkEzL3vtg96zU
-PW9DN40au/HcCADo2DeVcBBVQnA0ZPRgPD1QYoxGwMvDYOcRf2TIG415QlG3L9LvC0D4WJweS7/T
-aHUYLHaduV9n7ddZHEZnkNBc2lJbVFzwuK6+rqyspLAo/0lF1a2Ln+9c+i+fzPs/NdnXElP80Zp8
-0M+fP6dwJByZlq8wuCJPubXX8Bn7Lq1/pargvjsybPd+E9CBCHJ0cMALgTBeCQdGkKOHAfT/pwyp
-jeyMEiPmCURdvpAd2dlvdrjNdqfeateZbBqTVW0wKw0WgViMayqpK8t+UpjFk2l7OSIyi9dJ6mFy
-BE6zxm03Jab4IjT5oIdHR2k8KVeuE6iMgdEx4oOPa698dPTPPxdJZQ5/ZDygYakCjv7bShgA0LHx
-riNBGZVElM4jgdgw/DK8oYjbH47b2W9xeC39LqPNobfYdEar2mhR6k0qo4VO6uxuqSwvfIxpbGDw
-JOReNo7KaOkmubz+xORenCYfdGxwCNaEfIVeorMbNDJq+qdZhxceWz0lviBEjZ0dOToIldAdiPnC
-ADreREeHwc5Q9xDo8Y+DT4ODI1AhfdEhCA1kZ9R9+21OH9jZZHcarHa92aY2WFUGs0JnUBqt+Jby
-tvqSJ3lpeDK1p49P6GF1UeiYDlxiZi9Ukw86FB1gCBUCpUFu8bGa0qm5h6598lr+nVPe2FOwcxx0
-0OEPOQOoEvqQo1FGh6KQG6PIwoA4Tjk0hMIkEEHNBkpnf8ThRQUQ+g0T2Nnq0FlsGiOirNIbFVq9
-VKXB1hc0VOQV5Dxi8aXIzjRGB4HC4goSM3uhSgLQkRi0HCK1Se2IkTL2tNzefOqDX/X1khxBtCAE
-LwNoJ4AORr2oEsZ80QEIBwCNomMcNLQfQHkIWrphf3jQE4l5gpDOYdRsgJ2dbhOEBlQ/E9jZojIY
-lTq9XGtk0sndzRUVTzKqqsoYXDGRzuom05uxeIfLk5jZC9Xkgw5GYrAmlOisMr2N8mBD4clVB97+
-KfSuqBVzI9DjueGKg/ZGAPQgAAXQ8T76KTQeQDkMlGPDQWg2IgPuUMQzbmePz+oEO6NmA+ysNVrU
-epNSZ1Co9QqdmdhR244pK85Pa8diaSw+nsbAEmmY9q7EtF60Jh90ODoAa0K52cPEltPzDt7eNu3e
-qY1fjY1ZXF4ADQENjTC0HBDQKDrioKF7gyVJaDw64pSDQDk25A8PeMJRdzDi8sbt7IIa6DbaxpsN
-q8YAlI1KrV6u0sk1ps66fExVQX72QyqLQ6L3dVPorTgSTyhJTOtFKymKIUemU9pDlIKTXWm7z3/0
-W1xz+cjXANoHoQGgnf7g+OL7G9ADwcggooyiA1gjyuDxALR0EBrQbPgiTm/Q5vbG0zluZzOyswpR
-NsjVOpnKwO5jYjElVcWZUAp7uSIC2JlEa2jDRiLRxLRetCYf9MjoU55Cr+6PkO6trUh5HxaEvgC0
-D8+sLn8/NNFeAI0qIWo5QjFYhkCtCwDi+BUEygMQI9CEDAWgpQtHUcj4Qg7Pt3ZGKxStyaLRmVFo
-aPUypVamNpK7mjoay0ry0zFNGCqTi6PQ2wnkTjw5MaeXoMkHDeJrrNxeAj1796O9b53fugBGogPD
-8X4jALkBF1RCWHn7wlGU0ZFBSGdYlYQGE5SDiPIQ/KsrHIbeGbo6ZGenB1YoRotDa7ZqoQbqDQqN
-Xq7RSRUaAN1ZX9RUXVSQ8xBHppJ6WN0kWmMHzmSxjs/nZSgpQEtMHmrFNXL2wcsbXq3NuwkBHRkc
-dvkRaDs4GpYqQUhecHTUC71dHCvq5P6Gsh/VwDCks9Mb6vf4rW5YcMftbLZrjWZ1vJ9TAGWlRizX
-cPnC9rrCmpLs/Nx0OoePp9Chq2tofblv+UgK0EbfCOHh5obr64+99wuNUjry7GtwtDcURTdIUcsR
-cvmj3kAUQgOBRo4ehh4D4gIoQ6fhj8CCGyyP7qM6Ue8M6eyJr1D6YR2ohdU2RLMGolkrUajFCg2F
-0NGBKSstSK+urqQw2GDn5k6cTKlOzOblKClAWyxG8sNNuUeWHv7zr6GxGxweiQ6i4mb3hmGpAi2H
-yx+BxbcvDCkMxXAofo90eJxyIIwow2/Fhewc6IeWDtLZDnbu15vtGqNZozMptDq5Sgt2FsmUYoW2
-q7GsueZJUc6jNiyUQEYnkVLX3J6YyktTUoDW0CopOQdvbHnj0aW9weGx4dFnsaGvguGwyWp2Bgbc
-kSGohHHQEB2Q0cOQFcjO8DEyiPIkHEMtnR9qILTeXgvYGdVAsDOsUEwq6OfUWplSI5GrhFKFQCJv
-rc6tLcvNzXxAZvThyMjOIqkiMZWXpqQAzSg80nb307Orf9Pd2ezwDwQ9VpuaYVFQRaQCXleGRkRy
-hwZ9YViMQDGEB7BgGYBWGpo8oAy9Mwx6I5DpUWcgCssci90FoaE32zQGs1pnVGiAshYoi2RyoUxJ
-oxDa60vKCtNLSgrIDE4XYSLsDEoK0N23Vpec+dPhd39pMOrp9V/ohVingW/XMPXCLgmtTNFbrWTV
-OV1238BTCGggC0Ye93IAKMdGzHqxkt0ipddKGY1apcDsCsAKRWu0qvRGlUYvU2ulcrVYDl6WCWTK
-7tbqltriotxHjS2tOCKhqR2r1uoT83iZmnzQNgmZmrX3/u7ZqTuW8LrSGM13+Pg8r03er2P3a/sU
-jBoNt0Un6NALWq1aDqSEPxa/cxQGyoPAXSchanidaj5Wye2Qs1pEtGpxb5Pe4tTACkVrRKEBBVCm
-FMrkfLGUL1W2VOXVlOXl56S3NlXWPLnX2NyYmMdL1uSD5tVexaXvSd3wWsnDM5z2B+yONHbHQ4eO
-4zIKnAauUYzTCztNUoJFQbYqqVYF2WGWef3+YOwZsDZISHoxQSciaoU4Nb9LwW6XsZrFPbUCSrUK
-NRtGmRo1zmKFWiBT8WVqOoPRVpPbUp3dUZ/bVJlZXpwVCk/QLpjJB42/s67m8urP//RTg83N6crm
-YtMF+BxVH8ZnV7gMPLOcomI3WRQUm4Zp17L69RwHXFqWVdNnlJIMUrJRSjFIyMBaI8CpeFg5u03K
-aBLRavjkKplCLhLxBGwah45lEutp7UVETAa+MRfbkNtak1NTksYRiBOTePmaZNBBh46c9mnGwfkn
-102DTxUKIaftnphUJKEW2zQsq7LXoqQr2U0aXptVzXQYRXY9Dx4gvjK4aOiSUw1Sil5M0goJaj5O
-ycXKWG2QHnxqLQdfwsGVMruKGJ0F9LY8SmsesSmvuzG3oy6vsSK9pa11fA4To0kGLcNmj7/1qzIj
-FT4NDz0XkIqF+FywtoRa2a/nWlS9RglBK+g0SohaQZeG3wlZYZBSTXKaSd5jUvTAA4OMopdQtCKy
-SkBU8PAydpeI2S7oaeKSa/vwFSxcOQNb0tNeRGkpIDQVdGHy2mqyaqtLRkZhBTpxmmTQ1MxdTTc3
-Hv/Lv6uliY09BouV0XSTh8vnEwpMcirytapXJ+qCoLCq6EZgKiYYZVSjHLyMLoOMqpfStBKqWkxV
-CSkKPknGJYhY3YLedh61sY9Yzegup2NLqe1FpJYCXFMBtiGvpjzb5Q2OP92EaTJBf/V0BH9nbcHx
-lfvf/lliaGwMfCbh4rnYTBGlVM6o79dxbWqmSUY2ySgA2qbts6gYOjEJiIOv45QpOglFI6aohGSF
-gCzjkSRckphNFDCwXFozi1jX213R01FKaSsiNiPQmKocFouZeLIJ1GSCNrCaqDkHbn76ZnrK9sRQ
-XL7YUz6xWEwpk/XWAl+7ts+qYiDQyl4wuF3HtWo4wDp+kbUikkZIVAsISggNDk7CxiE7Mzp5Pa1s
-cgMTX0PHltM6ismtALoQ21Jxds8Hk7LJeTJB95We7nywAxaEvThMYugbmR1uEbFIzsKoua39Og7w
-haoIXkZJAh7X8W06gV7ao+Z3q/jQbHQrOF0ydqeE2S5itPF7WrjURjapjomvomPLaB0llFaUG11t
-1Rkp21K3zU88x8RqMkHDgrD8wl/2rfzXZ1/9x7oEAaLVSOS91Wpuu1nRY9eywdQA2qpl27Q8q45v
-0QosOqFBzYMCKGW1SBgtot4mYQ+GT62P18BKZncZvbMY1cDmPAImq72xoiPnzKWP/r29MiPxHBOr
-SQPt0nAombse7pmdunN5Yujv5Y+NqkUkNbcNqh9KavCyGtpnThw0UBaYtUKjRmjQiDRyDhRAYW8r
-j1LPJlaxussYWEBcQG3JIdY/6qzNECoMpPTt9VehW/+Zq9+SeIKJ1aSBFjbdJmTuv7T+lZayR4mh
-/ySbOwjRoRMTzEoGdHJ6CVkvhepH1UmgzaBpxDQVXKIehRBdUi5JyOyE0OgjVEM/R23OwtelE7tb
-3f7o05iP/Ghz1uFFRz58NfGjJ1yTBpr44JP6L9Z+/u7PHFZDYug/KTIwYjKqZIwGjRCvFREhkdUC
-WGrjFNwuOadDwmyFrOBRICjKe7FFjO4yoMwh14Odqa0FZFyb0do//nOUhEJKzsFrn7xW8uDM+MjE
-a3JAxwJO4sNN2Z8t/uz93yeGvkM2b0TBbtMI8NBjqAX4bxqMbjkbK2G1C3ub+dQGNqGK2VVKbcvH
-1dyjddUwGT1Whzvx/XH15B5oub355Ae/lPJ6EkMTrskBrSIVI4ttmlJ050Ri6DvkDkRQCgu6oZPT
-iIjfgMYh0EwEmkdp6CNU9bTnU9pL+XyuP/gf3y/wfGwMd/ujJ6fe3rfyJ4mhydDkgKbnHWq9s+XU
-B78Ss7/nFf5AOGqx2wA06pcBtIioAtBcnIyNFQNoejOXVMPorhSJ+LGh0cT3/L3MvE5q9v4726fd
-P/VxYmgyNDmgcbc+Kj79x70r/y3x+XcrEI7YPUHIDfCyBlgLSABawQPQXRJomSm1HAbBG4gkvvq/
-EqcypevR7vNrfktpq0gMTYYmAbRFiKNm77uzY/qdY2sTQ98tTyBkc/kNCjZ4WSska4QAmijn4mV9
-WCG9USjkD40+S3zpd6j79keVFz84sOrfBgcn8wCmSQDNrbrUnbbnwprfEptLE0PfLYvTZXP5DBpx
-3NEUlZCk5BMVXJyE2SYWCyOx7zmpzWeSUB7vSNs399zmeYmhSdIkgMbdXlN16cODb/8kGgklhr5D
-g0PDFofL5vSaTFpoPNRCskpAUvKIMk63lE/Tm7//7CRx2yNi1oHLG15tKLiZGJokTTRov1VBfrw9
-ff+8MxtnJ4a+W1an2+70ODw+q80GfbRGRFWLyOBoaR9WLBEPDX//xjRS2lbM9Q1H//wLs1aeGJok
-TTRoSXs6KevAlY9frc39ng1PDo/f7vL2u3wA2ub06KASSmhqEVUpIEuhEio1ia/7bg3HQoT7aAfu
-oXd/mRiaPE00aHL69sYvPz723i8Mqu98vW706TO7y2d3+/o9PvQWL4/X5vHDylsr6VGLe5QCioxP
-1RjMia/+bmlpVdScg19ueSP32sHE0ORpQkGPDkUJ99bnH1t+4J1fJIb+Xk+fPXMHQlYwsscPjnZ4
-/S5fcBy6QcHSSulqCV0ppMrFbJ3x++8NMYqOtt/bduavv+bSOhNDk6cJBa3rraXmHLix9Y2sK3sT
-Q99oYGjE4Q1YnF67x4/eQuf1O30B6O0AN6QHgDaqeTppr0bSq4T0kENy6BLf+d3qvrm69Ny7+1b8
-a+LzSdWEgmY+OdFxfztYrI/cNj7y/PnzQDhmdngQYpQVAcDt8AZd/qA3GHH7g+hTF9D3mbRinaxX
-I2WohDS1Wi2Sfc+75ewyGjVrz/1dM68fei8xNKmaUNDdt1aXnf/ztxbz+CMGm9Pi9MCSJH6EARg5
-4PQixD60UTDi9AUdcKFfgN+kl+ukDK2MqRL1qHVGqULlD/x3L7Dy667hH+9NWfu7rtrcxNCkauJA
-O5S91KzdD3bPurb/T7CY09uc5n6v1em1uhM74oGyJxhBb6qLvw3X7Y9vtPcFnXHQZqMKokMLjhb3
-avRmuVojlf93B03h766vufLR4Xf+r9/jTAxNqiYOtKDhS3zGvtT1r1Tk3e0PDpgBscMLqz6Ly29z
-B8DFodgAOrYqHEOUA2GXP4Qub9AJMe32W8w6nYwO0aGW9gFopVojEMsC32HqsNNATtuaeWjB8TVv
-JIYmWxMHGn9vQ+3VNcf+/HOhWGLzhCyA2OGFBsPtD4djQ6HYYDASQxt+glGXPwyg3f6IOxB0+gE0
-qo1Wi1En7dFI6Go5H3o7pUojkSt5QlHip/+95N255Pj7cirSUxJDk60JAh31WkmPtmQdXnRs9RT/
-MNraZnag0heODYZjw4hyNIb2oYwjDkQgQ9CFNr6h8oi2pVjNuvjLVxqlGDJarkZveeaLJDqDMfEc
-fyNa1p7mW5tOvP/vKnFfYmiyNUGgxzd5X980JfvGMVd4xARdWzgWGxyOxAbjlAcgLpyIMvANe9Ae
-LIhpeBB2+wIQ0xAdaBUupqhFFI1Kjjb/oA0pKqFUzurjDAz83a2lr549xd1ZW3hy5f5VP00MJYEm
-ArTeM0RI39V6ZzM0diR8p8MfjQ4OxwZHwM6hKKKM9muivSphTwCVQQ8UwyA8AOihBGhPwNpvRy8b
-CohajVqtNykgOhQqkUTGF4r6uLzEM8VlZLdAt37r06lp57cmhpJALx20zuYWa82U++uLTr194I8/
-9ca+Gh59Gh1AlCGa/aEodM3o+C+0ZTPiCcW8QbT7FW37DkXc4600Au23OpxaIV7F79bqDWqdAUWH
-QimWygUiEZPNMZn//xbBvrKz2Ic7z330G3pXXWIoCfRyQQMgoa5/fJP3ne3T7pxELyaNJ0YkNgTm
-tbvBsCEneBlSIgh8Y54w2k/oCSVAuwJBWIXD4tDq9Gj4XUpOp9ZkjWe0TqpQIkeLRByegEbv/fr5
-8/EnhW69IuX9/Sv/9enof/3i1qToJYIeGBpmSdRKe4hceBKXvvvCmt/im8ufojcRDEUGhqHo2dyw
-8Au50Oky8dIXiqJNyOH4WRHwMRSDwQRot8/u8ql5HUpOu87sUMe3dANooUQGjubwhMw+tkKJ2mq3
-jkfJ2PVo75yL25eMTyNJ9BJB90lUIo1J5YgQ48e5Hnr7J75gcGAYcmMYQhl65/F93i5o49ARERDN
-4GJ0eKA/GscdjHmhAwmiLcd2D6zCgyp2q4LTqbM4VFqDQg0ZDY6WQ+PB5QvYXC6Jgt5KIG65R8zc
-D916c8n98WkkiV4WaJXRxpFppAYHl4E2eafvm3t+S3yT9+AQNMg2cCg6yi6MdtP7wc7xbYSRmD88
-6IvGAmh7bAyBRgdkhmFRbvfA14cUCDRWb+6P7wLSQR8tQhkt5vBFbB6X3ssyO4O0x5/WX1t35N2f
-203a8ZkkiV4K6PFjkgQqg8Lqp1Zco+SgTd41uTdg5Q3OtTrRPQ2w8zcHcXy7K3bAHxn0RwcC0cE4
-dNTzoVPYfAHU3nmCir42OacbQKPoUKEluFAqEwjHQfOYfVwSlU7P3JHz+ZLD7/02MZWk0UsB3SdW
-gZ1FaqPaNUh8tAXz5YZj7/1CKRdHh56anT50rgywQ7mBjilGuYFyecCX2FCP9muiAEFnCaKTvhzw
-xeiuU0jGapVxcZDRKh3qo6XxPlogFnMEQjaXz+LwsB2tuKJLX276Q+HNo4mpJI1ePGinNwB25il0
-Ep1NolBQ0zbnHV16+L1fwz9ZXH6rCx33h+7JgZ1RaMTPh0C3ONCmQT/aTT8EjoZP0XEyUA/9IYgO
-dEvaE5Iym2RcvBaiQ2cYBy0GRwNocDSX18cTttaX1uZ+efr9nwmZL/Lo5xeiFw+axpOypWqBUi81
-uaWEElruoRtb3si5djA0PGYFY7rixyTFWzp3IOoGlNBsoJ2wQ36wc2zYPzDsR1vpkcchUtwBSJig
-3e21u0MSRqOUgxyNTiuI3+sQSaG9k3KEyNFMDh9Tnl1TXrh3yf9OTCWZ9IJB213eHp6MK9PwlQZH
-5CtGIXox6ezq35C7m53BAfDyN80GtHRoHYj65fhRdmgffWw4ODAUGBgOxgYDYeiyUYWEFSNyNHrZ
-MCykVknY8ehA5yJppfJ4eyeWcoVCMDURj22uLiopzH5wdktiNsmkFwwa7MwSq3hyrVBtGvoqfpzr
-2XehsbP5Y/B/344Oo4rnBqQz6uqgBsIFBRCFBjriZGA4ARqd94VAI0d7oBj6YGnDxRWK+7qgvQNH
-K9BNJXC0QiAC0CK2UNrZWNlYXZTz+B6vrzcxm2TSiwTt9gWpXAnkBleutftjeh6elr3v/q6ZVw/8
-efw41/hhVONd3fj9oyiqgfEd9HG+Q0F0es8QAh39FjQ67wu6DpPVwu4uEPa2ouiAJTi616EUyRQC
-sYQrEHFE8qbKnNqy3IxHdxSql3vEyQ/TiwTNFCkYQgX0GzyFfmRsjFWZGj/O9fe1xWnuyAhYsj9+
-DDQqg+guKCqD8X4OndUTGETnMIYGR0OxodDAoB/KY2QAnRMYjDohoz1BrVoCoHnUei3KaCMsWOLt
-nUIgkXJFYjq9p6W6oKzwcU5WGgwmJpRMemGgYSVCYotQYyfVGPvdABp/d13NldVH3/2ZTKXu98Ei
-JWgHyl50oqsbQKN7GqilQwd8RYcDg8PooFwEGoiPgx70RIb6HRa73ewIDCoEFA6ukI0v1VvdsGCR
-xaNDKFNCdPDEMnxHY0tt8ZOchxWV5fQ+TmJOyaQXBlqmNdH5MjY6p18TGRq16GTUx9syDy04sXbq
-+HGu6IBiXxDKIApodC8UNcsQGkEwcmwkODgSHhwJDoyG0EcI61FfKGRWUA2ibi2/Xc3rEPc2sHFP
-GG0ZOqsT2js5OoVDJZRDdMj4UmVbXVFDZUF+1oOWjk5CfC2ebHphoMf/vgcEtNJoHXg2xm1Op+Sg
-41zz7pzxxJ7Z0R9SgRoYdYUGXehGKDpVLZEbADoeGuhYxviD4PDXHo/dqqBYFDSTjKwX4dTcdkVf
-s4hWzWh7LJVw1XozOolKqRbJ5AKJnMMXtFTlVRVn5WY9IPYwOnHExJySSS8GtMPjp3LR3/fok6gh
-UqNfjZEzdjbf2nT6w1/1UAnOwIDdH3UEhy1GlcUg63dYPdER/8AzPyQGFECwMzr8ciSMDoB+Fhp6
-5rbK+rW9dg3ToqIDaIMYp+F1ylnN0t46PrGUhSvTmPtlKp1UqYY4FkqVFAK2rb6kJD+trKyYQGO0
-db2Uc4l/pF4MaI5UTRfIIKBhQRgeGHZ5/cR76wtPrDz0p597B8cc4VGDRiQl5cupRWpmpZZdp+di
-7HquPxwNDn0dio0Gh0bDI1+FR8cCPqfHxHEZOU49p1/LsqnoZjnFIMZr+B0KBLpWSKns68iQq1Ry
-rUmqhGKoFMrVXc2VzbVPCnMeNbW2dlN62rCT/2ci/7NeAOivv35OYAqg3+iTqKDJDQ4+E5Gqe3IP
-3t429f75nZDFEnKRGJ8h7ylRs2p03EaDsN0k6bLI8FZZt8umCA+PIcRBj88q9Jj5XqvQbRY4jVy7
-ts+m7kWgRTgtv1PZ1yTprROQKzi4IkZrulgskOssIrkaQLdV59aV5+Zm3if0MLoIlPb/qdFhc3rj
-uaEE0JAbweGxnqITXY92pax/rSbrnJiQISbkyKhPlL0VGna9QdBilmAtMoJdRXVoe5wausvA9pp5
-CLFN7LVJvBaxxyJyGHgOHdumZqB6KMZreZ1K9rijyzm4J6zOnB7MXSahhs/nMJiM9oaS8qKM4qJc
-CpPTiSd1E6mJmSWTXgBorkxLF8hhQchX6CANPNGnhDtrKlL+cuQvv2NjM8SkPCm5IG7narCzSdRu
-keFsSnK/psepZ3oMbLeJDXHhtYr8/XK/XQasPVax0ySI77VnmuU0gwRAd8RB14ko5VxcEQub09ua
-QW18SKy7211zF1ufV5yX3tDUROphteOJZDojMbNk0o8C7XdZPf0mPIPPECl5SqPO7vYNPJOxsD3Z
-e9PQnf55Ska5mJAnpRYpe8shmg18ZGebgmhX05w6htsIlHlei8BnEcDHOGulzy5zW6VOo7Bfj/Z/
-mxQAmoiiI+5oEaUMFuLgaEZbJq3lMbkxHd/wGFuf3l6V1tnRRKSz27qJLC4/Mb9k0g8HTam+c2n1
-L+7vX1zX2FhTU1lZXsjp67HZjJTcg8Ssg5c3vl5wbYeMWiQh5stoxSpGpY6LMQrbwM52FcWh7XUa
-+lBcWIQ+q9hnE/shNxBuodeh8tpkTrPIbuDZ1H0mRQ8CLehUsZtlvTVxRxeysbmM9qye5sfkpsc4
-TAa2LqO9NrOxIq2lsaoNTxHLlIkpJpN+OOjm1D8WH198f+/8tP3zytIvdHXWkzue9BIryA831V5d
-c+LDV8h1t8SkfNRsxMugntdkEndY5YR4aLBcJp7HKvLZpBAX4OJEaJj54HGPXemySBBoTZ9ZjkCr
-+R2qviYZvUZEBkcX0FvSqI2PaM0Z5KZMXEMmtj6zvSazqSq7vjyjrrbCYLYlpphM+oGgn40Olx6c
-gv7wf8rK3CNL7uyc/WjvWyV3jrSV3GDk7c86vOj4mjeVvaUifI6EXKigl2n6UG5YJF2QzmBnaOCg
-tQDKvn5FwKH0O5QBh8Jnk6GWw8h16Nkuq9xuFCDQih69mKCOdx0AWkAsZnVk9bY+pjWnkTAPSY0Z
-eExWZ31Wa01WU1VOfWV2ZVmeLxBOzDKZ9ANBG7md1cdmN6QsB9Dxv4W+Iv/Ysutb3sjZ+yar9Oz1
-LVMfnv1EySiTkvMgPaDf0EK/IWyN5wYV7Ow286HiIcpOld+pCbo08MDXL/daxWBqh45lV9PtBoFV
-wzYqenQiQryPxohRQBewsTmM9syelseUJgjodBwGHJ3dUpPdWJWLQFeWPn32dWKWyaQfCJpWeKLu
-zELMheWNF1c2paxsvLCE8ni7S0HrzDuX/tnyy5umPdi/uPLWXgomXUqv1nPrDfwm6Descny/ugf6
-OQ9ksU3md6iCLm3ArYMLsUamloLTHbo+u7rHJMGbZBSTnKaDJTi7BewMoPmEQk4XCmh6aya5OYOA
-yeiqz+xEoHMaa6Cbzq6pT6J3J/2tfiBoTMqq2tMLGi+gv+vfnLICc3Yhr/aaXUwwsxq0+Bx8xv7s
-I8uvfTrzzvZpuSfeack+K6ZjrEqKS0936aHZgGYO7CwPuDRBtyHkNQa9BoTbqYawht+BU88G0BYZ
-ySDB6eOrFTWnWdFbK6aWCYhPuN15zI6c3rZsSksmsTGrqyGrvTaruTa3sSavpjSDQKUlpphk+oGg
-nz9/3nb9w8rPp2EuLIPcaLqwVEOrNPPa1aRiIeYGq/Bz2qOPcdffKT6+5M7uude2zri7bWpxylpS
-1V2Tkul3KEIeTcClBrghrznkt4b8lpDHFHDpwObI0Wj9DasVJgS0QULSCbvUnFYFs15KLUegcfms
-ztze9hxqazaxKRuLyW6rzW6uycXU5FWVPBYrk+vtHN/qB4Iel1VMxJxbUn1kaueND62CLiOrUdGd
-y6tJ7cnag7/9IfbK29irq7q+eLsxZUX24UXXt82+unnqnU/fqPhiE6Mlx2VTRYP2iN8YdKlRy2EV
-eGB9aEJdh8PIs+s5Vk2fRUk3Ssk6IU7NbVMwGqS0CiGpmIcv6MPm93bkUltzic05WExOW11Oc20e
-piqvqiK/3+VNTC7J9KNAj8vMx/ZVpJg4rVpahbQ9jV12hpK+FXfjvY4rq9pTV7ZdWtVyCT6ubEtd
-WXl6WfqBhVe2zLy88Y2bW6aUX91Eb8yw6/lhtzbiVgQdsP4WoRsdsCzU82xatkXFMMqoOhFezWlX
-sOqltEoRqZiLL2R1Aeg8alseoSmvqzG3tS63qTavoTKnqqY8OSsh6AWAHtdw1G/hd3IqzsOykHhv
-Xde1dzour2q/vLI1FUCvgJrZmLIcc2FFA9TPlBUlx5c83Df/8uYZFze8fm3jq4Xn/4ovu6EVkn1O
-XdCthWxxmtB5rxY1yyjv0QkJai50HfUSAE0u4ROK+rrz6Z351LZ8fHNeJya/rQ4COr++Iqu5fSLO
-Nv9hemGgx/X8+ddmTgvu1gdNp2a2XFjYmgqgUfMHNRMQ119YUXduWfWZ5dVn4CNcS4uOLbm/d97l
-LTPPrX/98vpXHu5fWPfgMya2xKgROC0Kl1VmUffpxaQ46AYJvVIMoPFFrO7C3o4CcmsBoSUfQLfU
-5UMlrC59zBNP8s76/0YvGPS3CtqU3MqLdcem1Z2YiTm7CLyMOb+87tyK2rPLas4urzqztPz0srJT
-S0pPLi05saTkxNKCo2iReXXrrHPr37yw7rUvPpmSfWZ1Q9Z5Jq5awUencWv5ENPQeJTyCcV9XYX0
-zkJyayG+Jb+joaC1Ng+1HFUFdmeSBjToZYH+VnYphZJzsPzga5VHZ1WfWlBzdlnVmWWVAPrU0tKT
-S6AtKTq+pODoovwji/M+X5T7+aKczxYC8Wvb5lzYOO302inn1756fduc9NPrKh+exNdnsfBVPHIl
-n1LOxJdSO4rwzYXI0fX5mOrcekxd4p3oSamXDvpbGXmduPTdhXv/UHxoeunR+WUnl5ScXFp8fDGk
-R8GRRXlHFud+vjDr8MKMgwsfH5yffmDBw/3zEfHtb13cNPPMhmknP3r97JpXUzfPvP35+xmX95Zl
-XMZUZLe11LQ2VzU3VjZiyssrJ/PIpO/VxIH+VkZ+d3fmoZzdf8jd92b+odmFRxblH0VehhYw89CC
-x4cWpu+f/2jfggf75t3bPffO7nm3d829uXPu9e1vXdoy+9zGGafWTT2x5vWTq187vfrV02teS9ky
-P3X3H68cWn1u24pdK3/eb/6f2Ef/SNmUfeSSS9kHZj7a/mr67mmZB+Yi0AcXpu2fD5TBznd3z721
-e97NnW99uX3ute1zvtj21pVP56RunXNp8+wLn8w6vWHmyfUzjq+dduyjqUdXv3H0ozcPvf/a5x+h
-I+yTUJMJ+lsFXea+luySCx/c2PCr21tfu7tzxv3db90D0Hvm3t417+aOt67vmPvF9jlA+fKW2amb
-Z6dsmnVh0+zzn8w8u3HWmY9nnNow88T66cfXzdj/59/VZH+R+KFJpqQA/bfS8IhtOefv7JyVuvZX
-Vze+9sWWqde3z74et/PVrbNTt8y5uGVWCjh6E6J8duPMUxtmIF+vm35s7YwdK35mVL+sP7H5I5V0
-oL/VYDQkpDTWPjxydfO00+//4uyaV86vn5LyyfSLmxN2PvfxrNMfzzi9fuaJddOPr51x9KPpO1b8
-PPHNyafkBf23Gh6MSZmw2L5859CfPnvnp5+9+8sj7//26IevHl895fiaqScgptdOP/De7x9f2p34
-huTTPwbo/6Cg1yFjE7trs0runbh3Yv2FbYshoI+sna6TJ+PLsuP6hwT9j6h/gp4QjY39PzHlUy3U
-Yi+uAAAAAElFTkSuQmCC
-'''
-    
+class M10_config_gui(Pmw.MegaWidget):   
+    # images of the window, PNG files in a zip next to this script. Read
+    # when a widget first needs one, see asset_image()
+    ASSET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "M10_config_gui_assets.zip")
     
     appname      = 'M10 High Speed Config Utility'
     frameWidth   = 1098
     frameHeight  = 736
     version = "1.4.0"
     
+    # ms between drains of the worker queue
+    _TICK_INTERVAL = 100
+    
+    #========================================================================
+    #  asset_image
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    name : file in the asset zip, without the .png
+    # Return:
+    #    PhotoImage, made on the first call and kept
+    #========================================================================
+    def asset_image (self, name):
+        if (name not in self._images):
+            if (self._assets is None):
+                self._assets = zipfile.ZipFile(self.ASSET_FILE)
+            
+            data = self._assets.read(name + ".png")
+            self._images[name] = PhotoImage(data=base64.b64encode(data))
+            
+        return self._images[name]
+    
     def main(self):
         # This method should be left intact!
         self.pack()
@@ -6972,13 +215,13 @@ Yi+uAAAAAElFTkSuQmCC
     
     def baud_rate_select (self, entry):
         if (self.baud_rate != entry):
-            self.need_reinit = True
+            self.session.need_reinit = True
         
         self.baud_rate = entry        
     
     def com_port_select (self, entry):
         if (self.com_port != entry):
-            self.need_reinit = True
+            self.session.need_reinit = True
         
         self.com_port = entry         
     
@@ -7006,7 +249,7 @@ Yi+uAAAAAElFTkSuQmCC
         right_frame = Frame (background_frame, bg='#D6DBE9')
         right_frame.pack (fill=BOTH, side=RIGHT, padx=6, pady=6)
 
-        self.logo=PhotoImage(data=self.PulseRain_pic)
+        self.logo=self.asset_image('PulseRain')
 
         
         logo_label = Label(right_frame,image=self.logo, cursor='hand2')
@@ -7038,15 +281,19 @@ Yi+uAAAAAElFTkSuQmCC
                         scrolledlist_items=available_ports)
         self.com_combobox.pack(side=TOP, fill=BOTH, padx=4, pady=1)
         self.com_combobox.selectitem(available_ports[-1])
+        
+        # board_select leaves a port the user picked alone
+        self._default_port = available_ports[-1]
 
-        available_rates = ("9600", "14400", "19200", "38400", "57600", "115200", "230400", "460800", "921600")
+        available_rates = ("9600", "14400", "19200", "38400", "57600", "115200", "230400", "460800", "921600", \
+                           "1000000", "1500000", "2000000", "3000000", "Auto")
 
         self.baud_combobox = Pmw.ComboBox(right_frame, label_text='Baud Rate: ', labelpos='w',
                         dropdown=1,
                         selectioncommand=self.baud_rate_select,
                         scrolledlist_items=available_rates)
         self.baud_combobox.pack(side=TOP, fill=BOTH, padx=4, pady=1)
-        self.baud_combobox.selectitem(available_rates[-1])
+        self.baud_combobox.selectitem("921600")
 
         
         flash_type = ("CFM (0x08000 - 0x2afff)", "UFM (0x00000 - 0x07fff)")     
@@ -7067,19 +314,32 @@ Yi+uAAAAAElFTkSuQmCC
         self.file_name_entry.setvalue("flash_images/cfm.bin")
         self.file_name_entry.pack(side=LEFT, padx=4, pady=1, fill=BOTH)
             
-        self.file_manager = PhotoImage(data=self.file_manager_pic)    
+        self.file_manager = self.asset_image('file_manager')
         self.browse = Button(file_frame, image=self.file_manager, command=self._open_filedialog, cursor='hand2')
         self.browse.pack(side=RIGHT, padx=6, pady=4, fill=X)
         self.ballon_bind(self.browse, "Browse...")
         
-        self.program_flash=PhotoImage(data=self.program_flash_pic)
-        self.hourglass1   =PhotoImage(data=self.hourglass1_pic)
-        self.hourglass2   =PhotoImage(data=self.hourglass2_pic)
+        self.profile_enable = IntVar()
+        self.profile_check = Checkbutton(right_frame, text="Profile the run", variable=self.profile_enable, cursor='hand2')
+        self.profile_check.pack(side=TOP, padx=4, pady=1)
+        self.ballon_bind(self.profile_check, "Save the call stacks of the next load for a flame graph,\nand show host versus wire time")
+        
+        self.program_flash=self.asset_image('program_flash')
      
         self.load_button = Button(right_frame, cursor='hand2', text="load", image=self.program_flash, command=self.program_chip, width=120, height=120)
         self.load_button.pack(padx=2, pady=2)
        
         self.ballon_bind(self.load_button, "Click to Program the Onchip Flash")
+        
+        self.progress_text = StringVar()
+        progress_label = Label(right_frame, textvariable=self.progress_text, font=("Consolas", 9))
+        progress_label.pack(padx=2, pady=1, fill=BOTH)
+        self.progress = Progress_Bus (gui_progress(self))
+        self.session = M10_Program_Session (self.progress, self.console_print, self.clear, self.version)
+        
+        self.cancel_button = Button(right_frame, cursor='hand2', text="Cancel", command=self.cancel_job, state=DISABLED)
+        self.cancel_button.pack(padx=2, pady=1)
+        self.ballon_bind(self.cancel_button, "Stop the load at the next chunk.\nThe flash is left partly written")
        
         separate_frame_bottom = Frame (right_frame, bg='gray', height=4)
         separate_frame_bottom.pack (fill=BOTH, padx=6, pady=6)
@@ -7087,7 +347,7 @@ Yi+uAAAAAElFTkSuQmCC
         ad_label_title = Label(right_frame,text='Advertisement')
         ad_label_title.pack(padx=2, pady=2)
         
-        self.ad=PhotoImage(data=self.book_ad_pic)
+        self.ad=self.asset_image('book_ad')
                         
         self.ad_label = Label(right_frame,image=self.ad, cursor='hand2')
         self.ad_label.pack(padx=2, pady=2)
@@ -7128,21 +388,11 @@ Yi+uAAAAAElFTkSuQmCC
         self.ico_update_enable = False
 
     def clear (self):
-        self.message_console.clear()
+        self.console.clear()
         
         
-    def console_backspace(self):
-        txt = self.message_console.get()
-        new_txt = txt[:-2]
-        #self.console_print(new_txt)
-        if (len(txt) > 1):
-            if (txt[-2] != '\n'):
-                self.message_console.clear()
-                self.message_console.settext(new_txt)
-                #self.root.update_idletasks()
-                
     def console_print (self, str, end="\n"):
-        self.message_console.appendtext(str + end)
+        self.console.write(str + end)
         
     def ico_update(self):
         
@@ -7150,151 +400,144 @@ Yi+uAAAAAElFTkSuQmCC
             return
             
         frameCnt=2
-        frame = [self.hourglass1, self.hourglass2]
+        frame = [self.asset_image('hourglass1'), self.asset_image('hourglass2')]
         self.ico_update_index += 1
         if self.ico_update_index == frameCnt:
             self.ico_update_index = 0
             
         self.load_button.configure(image=frame[self.ico_update_index])
-        self.root.after(100, self.ico_update)
     
-    def program_chip (self):
-               
-        com_port  = self.com_combobox.get()
-        baud_rate = self.baud_combobox.get()
-        file_name = self.file_name_entry.get()
-        
-        self.need_reinit = 1
+    #========================================================================
+    #  tick
+    #------------------------------------------------------------------------
+    # Remarks: the one timer of the window. Flushes the console, drains
+    #          what the worker queued (progress line, end of job) and
+    #          moves the hourglass, Tk is only touched from here
+    #========================================================================
+    def tick (self):
+        self.console.update_widget()
+        
+        try:
+            while True:
+                (kind, data) = self.events.get_nowait()
+                
+                if (kind == 'progress'):
+                    self.progress_text.set(data)
+                elif (kind == 'done'):
+                    self.worker = None
+                    self.ico_update_enable = False
+                    self.load_button.configure(image=self.program_flash, state=NORMAL)
+                    self.cancel_button.configure(state=DISABLED)
+                elif (kind == 'boards'):
+                    self.board_select(data)
+                    self.load_button.configure(state=NORMAL)
+        except queue.Empty:
+            pass
         
-        self.ico_update_enable = True
         self.ico_update()
+        self.root.after(self._TICK_INTERVAL, self.tick)
+    
+    #========================================================================
+    #  discovery_worker
+    #------------------------------------------------------------------------
+    # Remarks: every port probed once at startup, off the Tk thread. The
+    #          load button stays disabled until the 'boards' event, so a
+    #          probe and a load never open the same port
+    #========================================================================
+    def discovery_worker (self):
+        results = []
+        try:
+            discovery = M10_Board_Discovery ()
+            discovery.scan()
+            results = discovery.results
+        finally:
+            self.events.put(('boards', results))
+    
+    #========================================================================
+    #  board_select
+    #------------------------------------------------------------------------
+    # Remarks: first port a board answered on, unless the user picked a
+    #          port while the scan ran
+    #========================================================================
+    def board_select (self, results):
+        boards = [result for result in results if result['ocd']]
+        
+        if ((len(boards) == 0) or (self.com_combobox.get() != self._default_port)):
+            return
         
+        port = boards[0]['port']
+        self.com_combobox.selectitem(port)
+        self.com_port_select(port)
         
-        if (self.need_reinit):
-                    
-            self.clear()
-            self.console_print ("===============================================================================")
-            self.console_print ("# Copyright (c) 2017, PulseRain Technology LLC ")
-            self.console_print ("# M10 high speed Configuration Utility, Version " + self.version)
-            self.console_print ("===============================================================================")
-            self.console_print ("Baud Rate = " + baud_rate)
-            self.console_print ("Com Port  = " + com_port)
-            self.console_print ("===============================================================================")
+        if (boards[0]['chip_id']):
+            self.console_print("Board found on " + port + ", Chip ID " + boards[0]['chip_id'])
+        else:
+            self.console_print("Board found on " + port)
+    
+    #========================================================================
+    #  cancel_job
+    #========================================================================
+    def cancel_job (self):
+        if (self.worker is not None):
+            self.progress.cancel()
+            self.cancel_button.configure(state=DISABLED)
             
-            self.need_reinit = False
-                            
-            try:
-                self.ocd = OCD_8051 (com_port, int(baud_rate), verbose=0)
-                console = dummy_console(self.ocd, self)
-                console._args = ("load_hex_and_switch ").split()
-                console._do_load_hex_and_switch ()
-                self.ocd._serial.close()    
-                self.M10_high_speed_config_console = M10_high_speed_config_console (com_port, baud_rate, verbose=0)
-                self.Mustang_Console = Mustang_Console(self.M10_high_speed_config_console)
-                         
-                #=========================================================================
-                # Get chip id
-                #=========================================================================
-                self.console_print("===============================================================================")
-                self.console_print("Initializing...", end="")
-                self.M10_high_speed_config_console._serial.reset_output_buffer() 
-                self.M10_high_speed_config_console._serial.reset_input_buffer()    
-                self.M10_high_speed_config_console.uart_port_select(0)
-
-                sleep(0.5)
-                #M10_high_speed_config_console.zero_fill_frame()
-                #M10_high_speed_config_console.zero_fill_frame()
-                
-                (chip_id_msw, chip_id_lsw, mcu_version, firmware_version) = self.M10_high_speed_config_console.flash_read_chip_id()
-                chip_id = chip_id_msw + chip_id_lsw
-                
-                #for k in range(20):
-                #    self.console_backspace()
-                
-             
-                print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\bChip ID         : ", end="")
-                
-                count = 0
-                for i in chip_id_msw:
-                    print (format(i, '02X'), end="")
-                    if (count == 1):
-                        print ("-", end="")
-                    count = count + 1
-                        
-                print ("-", end="")
-                    
-                count = 0
-                for i in chip_id_lsw:
-                    print (format(i, '02X'), end="")
-                    if (count == 1):
-                        print ("-", end="")
-                    count = count + 1
-
-                print ("\nMCU Version     : ", end="")
-                for i in mcu_version[1:]:
-                    print (format(i, '02X'), end="")
-               
-                print ("\nFirmware Version: ", end="")
-                for i in firmware_version:
-                    print (format(i, '02X'), end="")
-               
-                self.console_print("\n===============================================================================\n")
-                    
-            except:
-                self.console_print ("Failed to initialize " + com_port)
-                self.need_reinit = True
-                self.M10_high_speed_config_console._serial.close()
-                self.load_button.configure(state=NORMAL)
-
-                return
-
-        start_time = time.time()
-             
-        print ("=====> Start Time: ", datetime.datetime.now().strftime("%H:%M:%S"))
-       
-        try:    
-            self.Mustang_Console._args = ["load", self.flash_type, file_name]
-                
-            if (file_name.endswith (".bin") or file_name.endswith (".rpd") or file_name.endswith (".dat")):
-                self.Mustang_Console._do_load_bin_file()
-            elif (file_name.endswith (".hex") or file_name.endswith (".ihx") or file_name.endswith (".eep")):      
-                self.Mustang_Console._do_load_hex_file()
-        except:
-            self.console_print ("Failed to load " + file_name + " into " + self.flash_type)
-            self.need_reinit = True
-            self.M10_high_speed_config_console._serial.close()
+    #========================================================================
+    #  close
+    #------------------------------------------------------------------------
+    # Remarks: window closed, a running job is stopped at its next chunk
+    #========================================================================
+    def close (self):
+        self.cancel_job()
+        self.root.destroy()
+    
+    #========================================================================
+    #  program_chip
+    #------------------------------------------------------------------------
+    # Remarks: load button. The widgets are read here, the run itself goes
+    #          to a worker thread so the window stays live
+    #========================================================================
+    def program_chip (self):
         
-        end_time = time.time()
-        delta_time = end_time - start_time
-        print ("==================> {0:0.2f}s\n".format(delta_time))  
+        if (self.worker is not None):
+            return
         
-        self.M10_high_speed_config_console._serial.close()
-                        
-        self.load_button.configure(state=NORMAL)
+        com_port  = self.com_combobox.get()
+        baud_rate = self.baud_combobox.get()
+        file_name = self.file_name_entry.get()
         
-        self.ico_update_enable = False
-        self.load_button.configure(image=self.program_flash)
+        self.load_button.configure(state=DISABLED)
+        self.cancel_button.configure(state=NORMAL)
+        self.ico_update_enable = True
+        self.progress.rearm()
         
-        return
-      
-          
-            
+        self.worker = threading.Thread(target=self.program_worker, \
+            args=(com_port, baud_rate, file_name, self.flash_type, self.profile_enable.get()), daemon=True)
+        self.worker.start()
+    
+    #========================================================================
+    #  program_worker
+    #========================================================================
+    def program_worker (self, com_port, baud_rate, file_name, flash_type, profile):
+        try:
+            self.session.program (com_port, baud_rate, file_name, flash_type, profile)
+        finally:
+            self.events.put(('done', None))
+    
     def __init__(self, **kw):
         
-        self.need_reinit = True
-        self.ocd = None
+        self.worker = None
+        self._assets = None
+        self._images = {}
+        
+        # worker to Tk: ('progress' | 'done' | 'boards', data)
+        self.events = queue.Queue()
         
         self.root = Tk()
-                    
-        # create a temp ico file and use it 
-        if (os.name == 'nt'):
-            tempFile= "./app_icon.ico"
-            iconfile= open(tempFile,"wb")
-            iconfile.write(base64.b64decode(self.icon.encode()))
-            iconfile.close()
-            self.root.iconbitmap(tempFile)
-            os.remove(tempFile)
-                
+        
+        # straight from the asset zip, no .ico file written
+        self.root.iconphoto(True, self.asset_image('icon'))
+        
         self.root.option_add('*background', '#D6DBE9')
         self.root.option_add('*foreground', '#000063')
         self.root.option_add('*disabledForeground', 'blue violet')
@@ -7335,12 +578,28 @@ Yi+uAAAAAElFTkSuQmCC
         self.__createInterface()
         
         #sys.stdout = StdoutRedirector (self.message_console.component('text'))
-        sys.stdout = stdout_redirect (self)
+        self.console = console_sink (self.message_console.component('text'))
+        sys.stdout = self.console
         
         self.ico_update_index = 0
         
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.after(self._TICK_INTERVAL, self.tick)
+        
+        self.load_button.configure(state=DISABLED)
+        threading.Thread(target=self.discovery_worker, daemon=True).start()
+        
 if __name__ == '__main__':
         app = M10_config_gui(balloon_state='both')
+        
+        if ('--startup-bench' in sys.argv[1:]):
+            # window drawn once, report and leave
+            app.pack()
+            app.root.update()
+            sys.__stdout__.write("Startup Time : {0:0.3f}s\n".format(time.perf_counter() - _start_time))
+            app.root.destroy()
+            sys.exit(0)
+            
         app.run()
         
     
\ No newline at end of file
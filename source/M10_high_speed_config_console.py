@@ -18,13 +18,21 @@
 
 
 
-import sys, getopt
+import sys, getopt, atexit
 import math, time
 
 from OCD_8051 import OCD_8051
 from ROM_Hex_Format import *
 from time import sleep
 from CRC16_CCITT import CRC16_CCITT
+from Low_Latency_Serial import Low_Latency_Serial
+from Code_Upload_Planner import Code_Upload_Planner
+from Code_Image_Cache import Code_Image_Cache
+from Link_Bench import Link_Bench
+from Program_Telemetry import Program_Telemetry
+from Frame_Trace import Frame_Trace
+from Run_Profiler import Run_Profiler
+from Progress_Bus import Progress_Bus, Terminal_Progress, Json_Progress, Null_Progress
 import serial
 
 from Console_Input import Console_Input
@@ -34,6 +42,26 @@ from Console_Input import Console_Input
 ##############################################################################
 
 
+#============================================================================
+#  hex_image_bytes
+#----------------------------------------------------------------------------
+# Parameters:
+#    hex_list : Intel hex lines, such as dummy_console._FP51_CONFIG_FIRMWARE
+# Return: length bytes of the image from addr, as a list (0 where the image
+#         has none)
+#============================================================================
+def hex_image_bytes (hex_list, addr, length):
+    data = [0] * length
+    
+    for record in Intel_Hex ("", 0, hex_list).data_record_list:
+        for i in range (length):
+            offset = addr + i - record.address
+            if (0 <= offset < len (record.data_list)):
+                data[i] = record.data_list[offset]
+    
+    return data
+
+
 ###############################################################################
 # The dummy console here is pretty much a derivative of OCD_Console.
 # The reason is that we need to turn the M10_high_speed_config.py into .exe file.
@@ -500,6 +528,16 @@ class dummy_console:
         ":04310D0075820022A5",
         ":00000001FF"]
 
+    # Where the image above keeps the version it reports. It takes the chip
+    # ID MSW frame (0x47) at 0x16B5, loads DPTR with the version (MOV DPTR,
+    # #imm16 at 0x1741) and calls the reply routine at 0x0BB8, which sends
+    # DPH, DPL as the first two payload bytes: the firmware_version of
+    # flash_read_chip_id. Read from the image, so that a config firmware of
+    # another build is replaced
+    _FP51_CONFIG_FIRMWARE_VERSION_ADDR = 0x1742
+    
+    _FP51_CONFIG_FIRMWARE_VERSION = hex_image_bytes (_FP51_CONFIG_FIRMWARE, _FP51_CONFIG_FIRMWARE_VERSION_ADDR, 2)
+
 #############################################################################
 # command procedures
 #############################################################################
@@ -509,6 +547,8 @@ class dummy_console:
     _TIME_COUNTER_INDEX_RESET  = 3
     _TIME_COUNTER_INDEX_SET    = 4  
     
+    _CODE_PAD_BYTE = 0x00 # NOP
+    
     def _string_to_data (self, data_string):
         if (data_string.startswith('0x')):
             data = int(data_string[2:], 16)
@@ -534,36 +574,8 @@ class dummy_console:
     
     
     def _write_code (self, addr, data):
-        offset = 0
-        length = len (data)
-        addr_end = addr + length
-        
-        if (addr % 4):
-            for i in range (min([(4 - (addr % 4)), length])):
-                self._ocd.code_mem_write_byte (addr + offset, data[i])
-                offset = offset + 1
-        
-        total_words = (addr_end - addr - offset) // 4
-        total_128byte_frame = total_words //32
-        
-        for i in range (total_128byte_frame):
-            self._ocd.code_mem_write_128byte (addr + offset, data[offset : offset + 128])
-            offset = offset + 128
-            
-        
-        for i in range (total_words - total_128byte_frame * 32):
-            data_int = (data[offset] << 24) + \
-                       (data[offset + 1] << 16) + \
-                       (data[offset + 2] << 8) + \
-                       (data[offset + 3])
-            
-            ##print ("write32bit addr = ", addr + offset, "data_int=", hex(data_int))            
-            self._ocd.code_mem_write_32bit(addr + offset, data_int)
-            offset = offset + 4
-        
-        for i in range (length - offset):
-            self._ocd.code_mem_write_byte (addr + offset, data [offset])
-            offset = offset + 1
+        # 1024 byte frames if the OCD takes them, then 128 / 4 / 1 byte
+        self._ocd.code_mem_write (addr, data)
 
 
     
@@ -593,73 +605,56 @@ class dummy_console:
         print ("Loading Program...")
         
         last_addr = intel_hex_file.data_record_list[-2].address + len(intel_hex_file.data_record_list[-1].data_list)
-        len_completed = 0
-        
-        address = 0
-        merge_data_list = []
         
         start_time = time.time()
         
-        print_cnt = 0
-        print ("Writing | ", end="")
-        for record in intel_hex_file.data_record_list:
-            #print ("xxxxaddr=", record.address, "data=", record.data_list)
+        # gaps in the image are don't-care, the CPU is reset after loading
+        planner = Code_Upload_Planner (self._ocd.code_mem_frame_sizes())
+        segments = planner.segments_from_records (intel_hex_file.data_record_list)
+        segments = planner.coalesce (segments, pad_byte=dummy_console._CODE_PAD_BYTE)
+        
+        # only the blocks changed since the last upload, if that can be trusted
+        segments_to_write = segments
+        if (self.image_cache is not None):
+            segments_to_write = self.image_cache.plan (self._ocd, segments)
+            if (segments_to_write is None):
+                print ("Full write: " + self.image_cache.reason)
+                segments_to_write = segments
+            self.image_cache.invalidate()
+        else:
+            # not cached here, but the image FP51_upload cached for the
+            # port is about to be overwritten
+            Code_Image_Cache (self._ocd._serial.port).invalidate()
+        
+        self.progress.begin ("fp51_upload", sum ([len (data) for (address, data) in segments_to_write]))
+        for (address, merge_data_list) in segments_to_write:
             
-            self.gui.ico_update()
+            self._write_code (address, merge_data_list)
             
-            if ((print_cnt % 64) == 0):
-                print("#", end="")
-                sys.stdout.flush()
-                
-            print_cnt = print_cnt + 1
-                
-            if (len(merge_data_list) == 0):
-                address = record.address
-                merge_data_list = record.data_list
-                #print ("YY addr = ", address, " ", len (merge_data_list))
-            elif ((address + len (merge_data_list)) == record.address):
-                merge_data_list = merge_data_list + record.data_list
-                
-                #print ("WW addr = ", address, " ", len (merge_data_list))
-                #print (merge_data_list)
-                
-                
-            else:
-                #print ("XXXXXXXXXXXXXXX ", address, " ", len(merge_data_list))
-                self._write_code (address, merge_data_list)
-                #print ("YYYYYYYYYYYYYYYY")
-                
-                len_completed = len_completed + len(merge_data_list)
-                
-                load_progress = math.ceil(len_completed * 100 / last_addr);
-                if (load_progress > 100):
-                    load_progress = 100
-                
-                #print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
-                #print ("%d%% completed" % load_progress, end="")
-                
-                    
-                print("####", end="")
-                sys.stdout.flush()
+            self.progress.advance (len (merge_data_list))
+            
+            if (len(self._args) > 2):
+                f.write('addr %d\n' % (address))
                 
-                if (len(self._args) > 2):
-                    f.write('addr %d\n' % (address))
-                    
-                    for item in merge_data_list:
-                        f.write('%d\n' % (item))
-                        
-                address = record.address
-                merge_data_list = record.data_list
-
-
-
+                for item in merge_data_list:
+                    f.write('%d\n' % (item))
                 
+        self._ocd.code_mem_flush()
+        
         if (len(self._args) > 2):
             f.close()
         
+        self.progress.end()
         end_time = time.time()
         delta_time = end_time - start_time
-        print (" | 100% {0:0.2f}s".format(delta_time))        
+        print ("Written in {0:0.2f}s".format(delta_time))        
+        if (segments_to_write is segments):
+            # the coalesce stats are of the whole image, of no use when
+            # only the changed blocks went out
+            planner.print_stats()
+        if (self.image_cache is not None):
+            self.image_cache.save (segments)
+            self.image_cache.print_stats()
         self._do_resume_cpu()
         print ("\nCPU reset ...")
         self._do_reset_cpu()        
@@ -677,9 +672,8 @@ class dummy_console:
         self._do_uart_select()
         
         self._ocd._serial.write ([ord('\r')])
-        sleep(0.5)
-        if (self._ocd._serial.in_waiting):
-            r = self._ocd._serial.read (self._ocd._serial.in_waiting)  
+        r = self._ocd.drain_input()
+        if (len (r)):
             prt_out = ""
             for i in r:
                 if (i < 128):
@@ -703,7 +697,7 @@ class dummy_console:
 # Methods
 #############################################################################
   
-    def __init__ (self, ocd, gui):
+    def __init__ (self, ocd, gui=None, progress=None):
         self._ocd = ocd
         self.uart_raw_mode_enable = 0
         self._do_uart_select()
@@ -715,16 +709,25 @@ class dummy_console:
         
         self._do_pause_cpu()
         print ("CPU paused");
-        sleep(0.5)
+        if (not self._ocd.wait_ready()):
+            raise IOError ("OCD not ready after CPU pause")
         print ("CPU reset ...")
         self._do_reset_cpu()        
-        sleep(0.5)
+        if (not self._ocd.wait_ready()):
+            raise IOError ("OCD not ready after CPU reset")
         
         self.uart_raw_mode_enable = 0
         self._do_uart_select()
         
         self.gui = gui
         
+        # Code_Image_Cache of the port for incremental uploads, or None
+        self.image_cache = None
+        
+        if (progress is None):
+            progress = Progress_Bus()
+        self.progress = progress
+        
 ###############################################################################
 # The M10_high_speed_config_console here implementes the command set for flash r/w.
 ###############################################################################
@@ -785,6 +788,8 @@ class M10_high_speed_config_console:
     
     _CONFIG_FRAME_REPLY_LEN = 12
     _CONFIG_SERIAL_TIME_OUT = 6
+    _CONFIG_PROBE_TIME_OUT  = 0.2
+    _CONFIG_READY_TIME_OUT  = 2
     
     _CONFIG_WRITE_EXT_FRAME_LEN     = 1024
     
@@ -810,10 +815,22 @@ class M10_high_speed_config_console:
     
     #========================================================================
     # __init__
+    #------------------------------------------------------------------------
+    # Remarks: serial_link is an open port to take over (such as the one
+    #          used by OCD_8051 to upload the config firmware), so the port
+    #          is not closed and reopened between the two phases
     #========================================================================
-    def __init__ (self, com_port, baud_rate, verbose=0):
-        self._serial = serial.Serial(com_port, baud_rate, timeout=M10_high_speed_config_console._CONFIG_SERIAL_TIME_OUT)
+    def __init__ (self, com_port, baud_rate, verbose=0, serial_link=None):
+        if (serial_link is None):
+            self._serial = Low_Latency_Serial(com_port, baud_rate, timeout=M10_high_speed_config_console._CONFIG_SERIAL_TIME_OUT)
+        else:
+            self._serial = serial_link
+            self._serial.timeout = M10_high_speed_config_console._CONFIG_SERIAL_TIME_OUT
+            
         self._verbose = verbose
+        
+        # progress of reads and buffer fills, replaced by the GUI / --progress
+        self.progress = Progress_Bus()
 
     #========================================================================
     # _serial_read_clear
@@ -836,6 +853,13 @@ class M10_high_speed_config_console:
         else:
             return False
     
+    #========================================================================
+    # _crc_retry
+    #========================================================================
+    def _crc_retry (self):
+        if (isinstance (self._serial, Low_Latency_Serial)):
+            self._serial.crc_retry()
+    
     #========================================================================
     # zero_fill_frame
     #========================================================================
@@ -874,6 +898,7 @@ class M10_high_speed_config_console:
                 
                 condition = not self._verify_crc (ret)
                 if (condition):
+                    self._crc_retry()
                     if (print_enable):
                         print ("flash_erase reply CRC failed, Retry!")
                     self._serial_read_clear()
@@ -912,6 +937,7 @@ class M10_high_speed_config_console:
                 
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (print_enable):
                     print ("flash_erase status reply CRC failed, Retry!")
                 self._serial_read_clear()
@@ -959,6 +985,7 @@ class M10_high_speed_config_console:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (print_enable):
                     print ("flash_read reply CRC failed, Retry!")
                 self._serial_read_clear()
@@ -990,17 +1017,12 @@ class M10_high_speed_config_console:
                 length = length - (4 - (addr % 4))
 
                 
+        if (show_progress):
+            self.progress.begin ("read", length_save)
+            
         while (length):
             if (show_progress):
-                
-                load_progress = math.ceil((length_save - length) * 100 / length_save);
-                if (load_progress > 100):
-                    load_progress = 100
-            
-                print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
-                print ("%d%% completed         " % load_progress, end="")
-                sys.stdout.flush()    
-        
+                self.progress.update (length_save - length)
             
             if (length < M10_high_speed_config_console._MAX_READ_WRITE_BUFFER_SIZE):
                 ret += self._flash_read_short(addr, length)
@@ -1010,6 +1032,10 @@ class M10_high_speed_config_console:
                 length = length - M10_high_speed_config_console._MAX_READ_WRITE_BUFFER_SIZE
                 addr = addr + M10_high_speed_config_console._MAX_READ_WRITE_BUFFER_SIZE
         
+        if (show_progress):
+            self.progress.update (length_save)
+            self.progress.end()
+            
         return ret
 
     #========================================================================
@@ -1037,6 +1063,7 @@ class M10_high_speed_config_console:
             ret = self._serial.read (M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN)
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (print_enable):
                     print ("\naddr=", addr, "Write protect reply CRC failed, Retry!")
                 self._serial_read_clear()
@@ -1079,6 +1106,7 @@ class M10_high_speed_config_console:
                 ret = self._serial.read (M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN)
                 condition = not self._verify_crc (ret)
                 if (condition):
+                    self._crc_retry()
                     if (print_enable):
                         print ("\naddr=", addr, "Write 32bit reply CRC failed, Retry!")
                     self._serial_read_clear()
@@ -1125,6 +1153,7 @@ class M10_high_speed_config_console:
                 ret = self._serial.read (M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN)
                 condition = not self._verify_crc (ret)
                 if (condition):
+                    self._crc_retry()
                     if (print_enable):
                         print ("\naddr=", addr, "Write 32bit reply CRC failed, Retry!")
                     self._serial_read_clear()
@@ -1176,6 +1205,7 @@ class M10_high_speed_config_console:
                 ret = self._serial.read (M10_high_speed_config_console._OCD_DEBUG_FRAME_REPLY_LEN)
                 condition = not self._verify_crc (ret)
                 if (condition):
+                    self._crc_retry()
                     if (show_crc_error):
                         print ("\naddr=", addr, "Write 32bit reply CRC failed, Retry!")
                     self.code_mem_zero_fill_frame()
@@ -1212,6 +1242,7 @@ class M10_high_speed_config_console:
 
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("\naddr=", addr, "Write 128byte reply CRC failed, Retry!")
                 self.code_mem_zero_fill_frame()
@@ -1246,6 +1277,7 @@ class M10_high_speed_config_console:
 
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("\naddr=", addr, "Write EXT reply CRC failed, Retry!")
                 self.code_mem_zero_fill_frame()
@@ -1285,6 +1317,7 @@ class M10_high_speed_config_console:
             ret = self._serial.read (M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN)
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (print_enable):
                     print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\baddr= ", addr, " CRC failed, Retry!", end="")
                 self._serial_read_clear()
@@ -1321,6 +1354,7 @@ class M10_high_speed_config_console:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 
                 if (print_enable):
                     print ("flash_read chip id 32 bit CRC failed, Retry!")
@@ -1334,6 +1368,86 @@ class M10_high_speed_config_console:
         ret_list = ret[len(M10_high_speed_config_console._CONFIG_SYNC) + 3 : len(M10_high_speed_config_console._CONFIG_SYNC) + 7]
         return (version, ret_list)
         
+    #========================================================================
+    # ping
+    #------------------------------------------------------------------------
+    # Remarks: one chip id frame with a short timeout. Returns True if the
+    #          config firmware answered with good CRC
+    #========================================================================
+    def ping (self, time_out=_CONFIG_PROBE_TIME_OUT):
+        frame_type_byte = M10_high_speed_config_console._CONFIG_TYPE_READ_CHIP_ID_LSW * 2 + M10_high_speed_config_console._toggle
+        M10_high_speed_config_console._toggle = 1 - M10_high_speed_config_console._toggle
+        
+        frame = M10_high_speed_config_console._CONFIG_SYNC + [frame_type_byte] + [0x01, 0x02, 0x03, 0x04, 0x05, 0x06]
+        frame = frame + self._crc16_ccitt.get_crc (frame)
+        
+        timeout_save = self._serial.timeout
+        self._serial.timeout = time_out
+        
+        try:
+            self._serial.write (frame)
+            ret = self._serial.read (M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN)
+        finally:
+            self._serial.timeout = timeout_save
+        
+        if ((len (ret) == M10_high_speed_config_console._CONFIG_FRAME_REPLY_LEN) and self._verify_crc (ret)):
+            return True
+        
+        self._serial.reset_input_buffer()
+        return False
+        
+    #========================================================================
+    # wait_ready
+    #------------------------------------------------------------------------
+    # Remarks: ping until the config firmware answers, instead of sleeping
+    #          for a fixed time after the UART switch
+    #========================================================================
+    def wait_ready (self, time_out=_CONFIG_READY_TIME_OUT):
+        deadline = time.time() + time_out
+        
+        while (not self.ping()):
+            if (time.time() > deadline):
+                return False
+        
+        return True
+        
+    #========================================================================
+    # firmware_active
+    #------------------------------------------------------------------------
+    # Remarks: True if the config firmware is already running on the CPU
+    #          (and reports expected_version, if given), so it does not
+    #          have to be uploaded again through the OCD
+    #========================================================================
+    def firmware_active (self, expected_version=None):
+        self._serial.reset_input_buffer()
+        
+        if (not self.ping()):
+            return False
+        
+        if (expected_version is None):
+            return True
+        
+        (chip_id_msw, chip_id_lsw, mcu_version, firmware_version) = self.flash_read_chip_id()
+        
+        return (list (firmware_version) == list (expected_version))
+        
+    #========================================================================
+    # calibrate_baud_rate
+    #------------------------------------------------------------------------
+    # Remarks: bursts of CRC checked frames at each candidate rate, see
+    #          Low_Latency_Serial.calibrate. The chip id frame is used if the
+    #          config firmware is running, otherwise the OCD status frame.
+    #          Returns the rate picked, or None
+    #========================================================================
+    def calibrate_baud_rate (self, ocd, firmware_active):
+        if (firmware_active):
+            ping = self.ping
+        else:
+            ocd.uart_select (1)
+            ping = ocd.ping
+        
+        return self._serial.calibrate (ping)
+        
     #========================================================================
     # _start_buf_fill
     #========================================================================
@@ -1371,6 +1485,7 @@ class M10_high_speed_config_console:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 
                 if (print_enable):
                     print ("flash_buf_fill CRC failed, Retry!")
@@ -1425,6 +1540,7 @@ class M10_high_speed_config_console:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 print ("ocd read status reply CRC fail")
             
             ret_list = [i for i in ret]
@@ -1465,14 +1581,14 @@ class M10_high_speed_config_console:
         
         num_of_loops = len (data_list_to_write) // M10_high_speed_config_console._CONFIG_BUF_FILL_SEGMENT_SIZE
 
+        self.progress.begin ("buffer_fill", len (data_list_to_write))
         for i in range(num_of_loops):
             
             condition = True
             while (condition):
                 PC = self.read_cpu_status ()
                 #print ("i = ", i, "PC = ", PC)
-                print ("#", end="")
-                sys.stdout.flush()
+                self.progress.update (i * M10_high_speed_config_console._CONFIG_BUF_FILL_SEGMENT_SIZE)
                 
                 if (((i % 2) == 0) and (PC & 8) and ((PC & 2) == 0) ):
                     condition = False
@@ -1490,8 +1606,8 @@ class M10_high_speed_config_console:
             else:
                 addr = M10_high_speed_config_console._CONFIG_BUF_FILL_BUF_START_ADDR
         
-        print ("\n")
-        sys.stdout.flush()
+        self.progress.update (num_of_loops * M10_high_speed_config_console._CONFIG_BUF_FILL_SEGMENT_SIZE)
+        self.progress.end()
                 
         self.uart_port_select (0)
         
@@ -1559,20 +1675,28 @@ class Mustang_Console:
 
     #========================================================================
     # _print_spin
+    #------------------------------------------------------------------------
+    # Remarks: one wait between erase status polls, the spinner is drawn by
+    #          the progress renderer at its own rate
     #========================================================================
     def _print_spin(self):
-        self._spin_counter = (self._spin_counter + 1) % 4
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")
-        if (self._spin_counter == 0):
-            print ("|", end="")
-        elif (self._spin_counter == 1):
-            print ("/", end="")
-        elif (self._spin_counter == 2):
-            print ("-", end="")
-        else:
-            print ("\\", end="")
+        self._M10_high_speed_config_console.progress.update()
         
-        sleep(0.5)
+        sleep(Mustang_Console._ERASE_POLL_INTERVAL)
+        
+        if (self.telemetry):
+            self.telemetry.add_device_wait (Mustang_Console._ERASE_POLL_INTERVAL)
+
+    #========================================================================
+    # _phase_start / _phase_end
+    #========================================================================
+    def _phase_start (self, name, sector=None):
+        if (self.telemetry):
+            self.telemetry.start_phase (name, sector)
+            
+    def _phase_end (self, payload=None):
+        if (self.telemetry):
+            self.telemetry.end_phase (payload)
 
     #========================================================================
     # _do_read_flash
@@ -1606,13 +1730,11 @@ class Mustang_Console:
         ret_data = self._read_flash (start_addr[0], length)
         
         if (file_name):
-            print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
             print ("Save data to", file_name)
             f = open(file_name, 'wb')
             f.write(ret_data)
             f.close()
         else:
-            print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")
             print ("==> addr:", hex(start_addr[0]))
             print ("==> data:", [hex(i) for i in ret_data])
     
@@ -1623,6 +1745,7 @@ class Mustang_Console:
     
         
         self._M10_high_speed_config_console.flash_erase (flash_index)
+        self._M10_high_speed_config_console.progress.begin ("erase")
         
         loop_condition = 1
         while(loop_condition):
@@ -1632,7 +1755,7 @@ class Mustang_Console:
             else:
                 self._print_spin()
         
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")
+        self._M10_high_speed_config_console.progress.end()
     
     #========================================================================
     # _do_erase_flash
@@ -1736,16 +1859,12 @@ class Mustang_Console:
         total_words = (addr_end - addr - offset) // 4
         total_128byte_frame = total_words //32
         
-        count = 0
+        progress = self._M10_high_speed_config_console.progress
+        progress.begin ("write", length)
         for i in range (total_128byte_frame):
-            if ((count % 4) == 0):
-                print ("#", end="")
-                sys.stdout.flush()
-            count = count + 1
-             
-            
             self._M10_high_speed_config_console.flash_write_128byte(addr + offset, data[offset : offset + 128])
             offset = offset + 128
+            progress.update (offset)
             
         
         for i in range (total_words - total_128byte_frame * 32):
@@ -1761,42 +1880,35 @@ class Mustang_Console:
         for i in range (length - offset):
             self._M10_high_speed_config_console.flash_write_byte (addr + offset, data [offset])
             offset = offset + 1
+        
+        progress.update (offset)
+        progress.end()
     
     #========================================================================
-    # _do_load_bin_file
+    # _build_bin_image
+    #------------------------------------------------------------------------
+    # Return:
+    #    the bytes to write for a binary file, bit reversed and sized to
+    #    the flash, or None if the file can not be read
     #========================================================================
-    def _do_load_bin_file (self):
-        if (len(self._args) < 3):
-            print ("Not enough number of arguments")
-            return
-        
-        print ("Load as binary format")
-        flash = self._args[1]
+    def _build_bin_image (self, flash, file_name):
         (start_addr, default_len, flash_index, flash_size) = self._get_flash_addr_len (flash)
         
-        
-        data_list = bytearray()      
-    
-        count = 0
         try:
-            f = open(self._args[2], 'rb')
-            byte = f.read(1)
-            while byte:
-                data_list += byte
-                count = count + 1
-                byte = f.read(1)
-                
+            f = open(file_name, 'rb')
+            data_list = f.read()
         except IOError:
-            print ("Fail to open: ", self._args[2])
-            return
+            print ("Fail to open: ", file_name)
+            return None
                     
         f.close()    
+        count = len (data_list)
         
         if (count != default_len):
             print ("Acutal File Size", count, "not matching the expected length of ", default_len)
             
         
-        print ("Loading...", self._args[2], " ", count, " bytes\n")
+        print ("Loading...", file_name, " ", count, " bytes\n")
         
         data_list_to_write = [self._bit_reverse_8bit(i) for i in data_list]
             
@@ -1804,53 +1916,25 @@ class Mustang_Console:
             data_list_to_write = data_list_to_write + [0] * (default_len - len(data_list_to_write))
         elif (len(data_list_to_write) > default_len):
             data_list_to_write = data_list_to_write[0 : default_len]
-     
-        offset = 0
-        
-        for i in range (len(flash_index)):
-            
-            for j in range (i, len(flash_index)):
-                print ("Erasing...", self._args[1], ", flash index:",  flash_index[j])   
-                self._do_erase_flash_by_index(flash_index[j])
-        
-        
-            print ("Loading...", self._args[2], ", start addr:", start_addr[i], ", flash size: ", flash_size[i])
         
-            self._M10_high_speed_config_console._start_buf_fill (start_addr[i], \
-              flash_size[i] // self._M10_high_speed_config_console._CONFIG_BUF_FILL_SEGMENT_SIZE )        
-        
-            self._M10_high_speed_config_console._do_write_buffer_fill (data_list_to_write [offset : offset + flash_size[i]])
-            offset = offset + flash_size[i]
-            
-        self._M10_high_speed_config_console.flash_protect()
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
-        print ("File Loading Done, Flash is now write protected")
-        sys.stdout.flush()
-                
-        
-        
-         
+        return data_list_to_write
     
-
     #========================================================================
-    # _do_load_hex_file
+    # _build_hex_image
+    #------------------------------------------------------------------------
+    # Return:
+    #    the bytes to write for an Intel hex file, in flash word order, or
+    #    None if the file has no data
     #========================================================================
-    def _do_load_hex_file (self):
-        
-        if (len(self._args) < 3):
-            print ("Not enough number of arguments")
-            return
-        
-        print ("Load as hex format\n")
-        flash = self._args[1]
+    def _build_hex_image (self, flash, file_name):
         (start_addr, default_len, flash_index, flash_size) = self._get_flash_addr_len (flash)
         
         data_list_to_write = [0] * default_len
         
-        intel_hex_file =  Intel_Hex(self._args[2])
+        intel_hex_file =  Intel_Hex(file_name)
         
         if (len (intel_hex_file.data_record_list) == 0):
-            return
+            return None
             
         
         last_addr = intel_hex_file.data_record_list[-2].address + len(intel_hex_file.data_record_list[-1].data_list)
@@ -1880,25 +1964,85 @@ class Mustang_Console:
         self._endian_data_list (data_list_to_write)       
         #print ([hex(i) for i in data_list_to_write[0:16]])        
         
+        return data_list_to_write
+    
+    #========================================================================
+    # _write_flash_image
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    flash              : "cfm" or "ufm"
+    #    data_list_to_write : from _build_bin_image / _build_hex_image
+    #    erase_ahead        : 1 to erase all the sectors still to be written
+    #                         before each one (binary files), 0 to erase
+    #                         just the sector about to be written
+    #    name               : for the messages
+    #========================================================================
+    def _write_flash_image (self, flash, data_list_to_write, erase_ahead=0, name=""):
+        (start_addr, default_len, flash_index, flash_size) = self._get_flash_addr_len (flash)
+        
         offset = 0
+        
         for i in range (len(flash_index)):
-            print ("Erasing...", self._args[1], ", flash index:",  flash_index[i])   
-            self._do_erase_flash_by_index(flash_index[i])
             
-            print ("Loading...", self._args[2], ", start addr:", start_addr[i], ", flash size: ", flash_size[i])
+            if (erase_ahead):
+                erase_list = flash_index[i:]
+            else:
+                erase_list = [flash_index[i]]
+                
+            for j in erase_list:
+                print ("Erasing...", flash, ", flash index:",  j)   
+                self._phase_start ("erase", j)
+                self._do_erase_flash_by_index(j)
+                self._phase_end (0)
+        
+            print ("Loading...", name, ", start addr:", start_addr[i], ", flash size: ", flash_size[i])
         
+            self._phase_start ("buffer_fill", flash_index[i])
             self._M10_high_speed_config_console._start_buf_fill (start_addr[i], \
               flash_size[i] // self._M10_high_speed_config_console._CONFIG_BUF_FILL_SEGMENT_SIZE )        
         
             self._M10_high_speed_config_console._do_write_buffer_fill (data_list_to_write [offset : offset + flash_size[i]])
+            self._phase_end (flash_size[i])
             
             offset = offset + flash_size[i]
             
+        self._phase_start ("protect")
         self._M10_high_speed_config_console.flash_protect()
-        print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b", end="")            
+        self._phase_end (0)
         print ("File Loading Done, Flash is now write protected")
         sys.stdout.flush()
         
+    #========================================================================
+    # _do_load_bin_file
+    #========================================================================
+    def _do_load_bin_file (self):
+        if (len(self._args) < 3):
+            print ("Not enough number of arguments")
+            return
+        
+        print ("Load as binary format")
+        data_list_to_write = self._build_bin_image (self._args[1], self._args[2])
+        if (data_list_to_write is None):
+            return
+            
+        self._write_flash_image (self._args[1], data_list_to_write, 1, self._args[2])
+
+    #========================================================================
+    # _do_load_hex_file
+    #========================================================================
+    def _do_load_hex_file (self):
+        
+        if (len(self._args) < 3):
+            print ("Not enough number of arguments")
+            return
+        
+        print ("Load as hex format\n")
+        data_list_to_write = self._build_hex_image (self._args[1], self._args[2])
+        if (data_list_to_write is None):
+            return
+            
+        self._write_flash_image (self._args[1], data_list_to_write, 0, self._args[2])
+        
     #========================================================================
     # _do_load
     #========================================================================
@@ -1921,7 +2065,53 @@ class Mustang_Console:
 #############################################################################
     
     _Mustang_Console_PROMPT = "\n>> "
+    
+    # erase status poll, each poll is one frame
+    _ERASE_POLL_INTERVAL = 0.05
 
+    #========================================================================
+    # _do_bench
+    #------------------------------------------------------------------------
+    # Remarks: OCD frames go to the ping-pong buffer of the config firmware,
+    #          which is scratch space outside of a load. 1024 byte frames
+    #          only if self.ocd has them
+    #========================================================================
+    def _do_bench (self):
+        count = Link_Bench.DEFAULT_COUNT
+        file_name = ""
+        
+        if (len(self._args) > 1):
+            count = self._string_to_data (self._args[1])
+            if (count <= 0):
+                count = Link_Bench.DEFAULT_COUNT
+                file_name = self._args[1]
+                
+        if (len(self._args) > 2):
+            file_name = self._args[2]
+        
+        config_console = self._M10_high_speed_config_console
+        bench = Link_Bench (config_console._serial, count)
+        
+        config_console.uart_port_select (1)
+        
+        frame_sizes = (Code_Upload_Planner.FRAME_SIZE_128, Code_Upload_Planner.FRAME_SIZE_WORD)
+        if (self.ocd is not None):
+            if (self.ocd._ext_frame_support is None):
+                # a probe in the scratch buffer does no harm
+                self.ocd.code_mem_probe_ext (config_console._CONFIG_BUF_FILL_BUF_START_ADDR, [0] * 1024)
+            frame_sizes = self.ocd.code_mem_frame_sizes()
+        
+        bench.run_ocd_tests (config_console._CONFIG_BUF_FILL_BUF_START_ADDR, frame_sizes)
+        config_console.uart_port_select (0)
+        
+        (start_addr, default_len, flash_index, flash_size) = self._get_flash_addr_len ("ufm")
+        bench.run_flash_read_test (start_addr[0], config_console._MAX_READ_WRITE_BUFFER_SIZE)
+        
+        bench.print_table()
+        
+        if (file_name):
+            bench.save_json (file_name)
+        
     #========================================================================
     # _do_help
     #========================================================================
@@ -1956,6 +2146,7 @@ class Mustang_Console:
        # 'load_bin'             : (_do_load_bin_file,     "(CFM|UFM) binary_file_name", "load binary file to flash"),
        # 'load_hex'             : (_do_load_hex_file,     "(CFM|UFM) hex_file_name", "load hex file to flash"),
         'load'                  : (_do_load,     "(CFM|UFM) file_name", "load file to flash"),
+        'bench'                 : (_do_bench,    "[count] [json_file]", "measure link latency, throughput and retries"),
         'exit'                  : (_dummy_exit,             " ", "exit console")
     }
     
@@ -1970,13 +2161,19 @@ class Mustang_Console:
     # __init__
     #========================================================================
     def __init__ (self, M10_high_speed_config_console):
+        # None for building flash images only, without a board
         self._M10_high_speed_config_console = M10_high_speed_config_console
-        if (M10_high_speed_config_console._serial.in_waiting):
+        if (M10_high_speed_config_console and M10_high_speed_config_console._serial.in_waiting):
             r = M10_high_speed_config_console._serial.read (M10_high_speed_config_console._serial.in_waiting) # clear the uart receive buffer 
             
         self._stdin = Console_Input(">> ", Mustang_Console._MUSTANG_CONSOLE_CMD.keys())
         self._stdin.uart_raw_mode_enable = 0
-        self._spin_counter = 0
+        
+        # Program_Telemetry, if phases are to be recorded
+        self.telemetry = None
+        
+        # OCD_8051 on the same port, for the frame sizes of the bench
+        self.ocd = None
 
     #========================================================================
     # _execute_cmd
@@ -2037,6 +2234,13 @@ if __name__ == "__main__":
     raw_uart_switch = 0
     cfm_image = ""
     ufm_image = ""
+    autobaud = 0
+    bench_file = None
+    telemetry_file = None
+    prometheus_file = None
+    trace_file = None
+    profile_file = None
+    progress = None
 
     #=========================================================================
     # print banner
@@ -2052,7 +2256,7 @@ if __name__ == "__main__":
     #=========================================================================
     
     try:
-          opts, args = getopt.getopt(sys.argv[1:],"hP:b:U:",["CFM=", "UFM="])
+          opts, args = getopt.getopt(sys.argv[1:],"hP:b:U:a",["CFM=", "UFM=", "bench=", "telemetry=", "prometheus=", "trace=", "profile=", "progress="])
     except (getopt.GetoptError, err):
           print (str(err))
           sys.exit(1)
@@ -2064,14 +2268,34 @@ if __name__ == "__main__":
             com_port = args
         elif opt in ('-U'):
             image_file = args
+        elif opt in ('-a'):
+            autobaud = 1
         elif opt in ('--CFM'):
             cfm_image = args
         elif opt in ('--UFM'):
             ufm_image = args
+        elif opt in ('--bench'):
+            bench_file = args
+        elif opt in ('--telemetry'):
+            telemetry_file = args
+        elif opt in ('--prometheus'):
+            prometheus_file = args
+        elif opt in ('--trace'):
+            trace_file = args
+        elif opt in ('--profile'):
+            profile_file = args
+        elif opt in ('--progress'):
+            progress = args
         else:
-            print ("Usage:\n  py M10_high_speed_config.py -P comport [-U new_nios_hex_file | -b baud_rate]")
-            print ("  Options: \n    -U: replace default nios image with a new one\n    -b: baud rate in bps \n    -h print usage")
+            print ("Usage:\n  py M10_high_speed_config.py -P comport [-U new_nios_hex_file | -b baud_rate | -a]")
+            print ("  Options: \n    -U: replace default nios image with a new one\n    -b: baud rate in bps \n    -a: look for the fastest baud rate (up to 3M bps) \n    -h print usage")
             print ("\n    --CFM=image file for CFM \n    --UFM=image_file for UFM")
+            print ("    --bench=json file to save link benchmark results")
+            print ("    --telemetry=file to append per phase timing of the run to, one JSON line per run")
+            print ("    --prometheus=textfile to write per phase metrics to, for node_exporter")
+            print ("    --trace=file to dump the raw frames of the run to (see Frame_Replay.py)")
+            print ("    --profile=file to save the sampled call stacks of the run to (collapsed, for flame graphs)")
+            print ("    --progress=none to run quiet, or file to append progress events to as JSON lines")
             print ("\n  Example: using com port 7, baud rate 921600, default FP51-1T image")
             print ("           py M10_high_speed_config.py -P COM7 -b 921600")
             sys.exit(1)
@@ -2085,36 +2309,84 @@ if __name__ == "__main__":
         print ("image file = ", image_file)
     print ("===============================================================================")
 
+    if (progress is None):
+        progress_bus = Progress_Bus (Terminal_Progress())
+    elif (progress == "none"):
+        progress_bus = Progress_Bus (Null_Progress())
+    else:
+        try:
+            progress_bus = Progress_Bus (Json_Progress (progress))
+        except IOError:
+            print ("Fail to open: ", progress)
+            sys.exit(1)
+    
+    setup_start_time = time.time()
+    
+    telemetry = Program_Telemetry (station=com_port)
+    telemetry.start_phase ("port_open")
+    
     try:
         ocd = OCD_8051 (com_port, baud_rate, verbose=0)
     except:
         print ("Failed to open COM port")
         sys.exit(1)
+    
+    telemetry.attach (ocd._serial)
+    telemetry.end_phase (0)
 
+    if (trace_file):
+        # dumped on the way out, including the sys.exit() on failures
+        ocd._serial.trace = Frame_Trace()
+        atexit.register (ocd._serial.trace.dump, trace_file)
+
+    if (profile_file):
+        # host versus wire time of everything after the port is open
+        profiler = Run_Profiler (ocd._serial)
+        atexit.register (profiler.finish, profile_file)
+        profiler.start()
+
+
+    # same port handle for the config phase
+    M10_high_speed_config_console = M10_high_speed_config_console (com_port, baud_rate, verbose=0, serial_link=ocd._serial)
+    M10_high_speed_config_console.progress = progress_bus
 
     #=========================================================================
     # Load Program
     #=========================================================================
     
-    console = dummy_console(ocd)
-   
-    if (image_file):
-        console._args = ("load_hex_and_switch " + image_file).split()
-        console._do_load_hex_and_switch ()
-        
-    elif (raw_uart_switch):
-        console._do_uart_switch()
-    else:
-        console._args = ("load_hex_and_switch ").split()
-        console._do_load_hex_and_switch ()
-  
-    ocd._serial.close()    
+    firmware_active = (image_file == "") and (raw_uart_switch == 0) and \
+        M10_high_speed_config_console.firmware_active (dummy_console._FP51_CONFIG_FIRMWARE_VERSION)
     
-    try:
-        M10_high_speed_config_console = M10_high_speed_config_console (com_port, baud_rate, verbose=0)
-    except:
-        print ("Failed to open COM port")
-        sys.exit(1)
+    if (autobaud):
+        print ("Baud rate calibration ...")
+        rate = M10_high_speed_config_console.calibrate_baud_rate (ocd, firmware_active)
+        if (rate is None):
+            print ("No baud rate passed, staying at ", baud_rate)
+        else:
+            baud_rate = rate
+            print ("baud_rate  = ", baud_rate)
+        print ("===============================================================================")
+    
+    if (firmware_active):
+        print ("Config firmware already running, upload skipped")
+    else:
+        telemetry.start_phase ("fp51_upload")
+        try:
+            console = dummy_console(ocd, progress=progress_bus)
+        except IOError:
+            print ("OCD not ready")
+            sys.exit(1)
+       
+        if (image_file):
+            console._args = ("load_hex_and_switch " + image_file).split()
+            console._do_load_hex_and_switch ()
+            
+        elif (raw_uart_switch):
+            console._do_uart_switch()
+        else:
+            console._args = ("load_hex_and_switch ").split()
+            console._do_load_hex_and_switch ()
+        telemetry.end_phase ()
 
 
     
@@ -2125,18 +2397,21 @@ if __name__ == "__main__":
     print ("===============================================================================")
     print ("Initializing...", end="")
     sys.stdout.flush()
+    telemetry.start_phase ("chip_id")
     M10_high_speed_config_console._serial.reset_output_buffer() 
     M10_high_speed_config_console._serial.reset_input_buffer()    
     M10_high_speed_config_console.uart_port_select(0)
 
-    
-    sleep(0.5)
+    if (not M10_high_speed_config_console.wait_ready()):
+        print (" config firmware not ready")
+        sys.exit(1)
     #M10_high_speed_config_console.zero_fill_frame()
     #M10_high_speed_config_console.zero_fill_frame()
     
     
 
     (chip_id_msw, chip_id_lsw, mcu_version, firmware_version) = M10_high_speed_config_console.flash_read_chip_id()
+    telemetry.end_phase ()
     chip_id = chip_id_msw + chip_id_lsw
     
     print ("\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\b\bChip ID         : ", end="")
@@ -2167,6 +2442,7 @@ if __name__ == "__main__":
     for i in firmware_version:
         print (format(i, '02X'), end="")
    
+    print ("\nSetup Time      : {0:0.2f}s".format(time.time() - setup_start_time), end="")
         
     #=========================================================================
     # configuration console
@@ -2177,11 +2453,17 @@ if __name__ == "__main__":
     
     print (" Please type in command to configure the device. \n Use help to see the list of available commands.")     
     console = Mustang_Console(M10_high_speed_config_console)
+    console.telemetry = telemetry
+    console.ocd = ocd
     
     #=========================================================================
     # load CFM or UFM image for command line
     #=========================================================================
-    if (cfm_image):
+    if (bench_file is not None):
+        console._args = ["bench", bench_file]
+        console._do_bench()
+        console._M10_high_speed_config_console._serial.close()
+    elif (cfm_image):
         print ("CFM Image load: ", cfm_image)
         console._args = ["load", "cfm", cfm_image]
         console._do_load_bin_file()
@@ -2195,3 +2477,16 @@ if __name__ == "__main__":
         console._M10_high_speed_config_console._serial.close()
     else:
         console.run()
+    
+    #=========================================================================
+    # per phase timing
+    #=========================================================================
+    if (cfm_image or ufm_image):
+        print ("===============================================================================")
+        telemetry.print_summary()
+        
+    if (telemetry_file):
+        telemetry.write_json_line (telemetry_file)
+        
+    if (prometheus_file):
+        telemetry.write_prometheus (prometheus_file)
@@ -18,10 +18,13 @@
 
 
 
-import sys
+import sys, time
 import serial
+from collections import OrderedDict
 from ROM_Hex_Format import Intel_Hex
 from CRC16_CCITT import CRC16_CCITT
+from Low_Latency_Serial import Low_Latency_Serial
+from Code_Upload_Planner import Code_Upload_Planner
 
 #############################################################################
 # Onchip Debugger for FP51 (1T 8051 core from PulseRain Technology, LLC) 
@@ -185,7 +188,7 @@ class OCD_8051:
        0x2E                :  ("ADD",    1, "A, R6"),
        0x2F                :  ("ADD",    1, "A, R7"),
        0x30                :  ("JNB",    3, "bit code"),
-       0x31                :  ("ACALL",  1, "code"),
+       0x31                :  ("ACALL",  2, "code"),
        0x32                :  ("RETI",   1, ""),
        0x33                :  ("RLC",    1, "A"),
        0x34                :  ("ADDC",   2, "A immediate"),
@@ -317,7 +320,7 @@ class OCD_8051:
        0xB0                :  ("ANL",    2, "C bit/"), 
        0xB1                :  ("ACALL",  2, "code"), 
        0xB2                :  ("CPL",    2, "bit"), 
-       0xB3                :  ("CPL",    2, "C"), 
+       0xB3                :  ("CPL",    1, "C"), 
        0xB4                :  ("CJNE",   3, "A immediate code"), 
        0xB5                :  ("CJNE",   3, "A data code"), 
        0xB6                :  ("CJNE",   3, "@R0 immediate code"), 
@@ -401,6 +404,7 @@ class OCD_8051:
     _OCD_DEBUG_TYPE_PRAM_WRITE_4_BYTES_WITHOUT_ACK = 0x5C
     _OCD_DEBUG_TYPE_PRAM_WRITE_4_BYTES_WITH_ACK    = 0x5C | 1
     _OCD_DEBUG_TYPE_PRAM_WRITE_128_BYTES_WITH_ACK  = 0x5B
+    _OCD_DEBUG_TYPE_PRAM_WRITE_EXT_BYTES_WITH_ACK  = 0x57
     
     _OCD_DEBUG_TYPE_PRAM_READ_4_BYTES  = 0x6D
     _OCD_DEBUG_TYPE_CPU_RESET_WITH_ACK = 0x4B
@@ -424,6 +428,13 @@ class OCD_8051:
     
     _OCD_DEBUG_FRAME_REPLY_LEN = 12
     _OCD_SERIAL_TIME_OUT = 6
+    _OCD_PROBE_TIME_OUT  = 0.2
+    _OCD_READY_TIME_OUT  = 2
+    _OCD_QUIET_TIME      = 0.05
+    
+    _OCD_WRITE_EXT_FRAME_LEN = 1024
+    
+    _OCD_CODE_WORD_CACHE_SIZE = 64
     
     _crc16_ccitt = CRC16_CCITT()
     
@@ -434,8 +445,19 @@ class OCD_8051:
     #========================================================================
     
     def __init__ (self, com_port, baud_rate, verbose=0):
-        self._serial = serial.Serial(com_port, baud_rate, timeout=OCD_8051._OCD_SERIAL_TIME_OUT)
+        self._serial = Low_Latency_Serial(com_port, baud_rate, timeout=OCD_8051._OCD_SERIAL_TIME_OUT)
         self._verbose = verbose
+        
+        # None: not probed yet, the first ext frame of an upload is the probe
+        self._ext_frame_support = None
+        self._planner = Code_Upload_Planner ()
+        
+        # code memory words seen lately, {word index : [4 bytes]}. Only valid
+        # while the CPU is paused, dropped on run / reset
+        self._code_word_cache = OrderedDict()
+        
+        # partial word waiting for more bytes: [word index, [4 bytes], mask]
+        self._code_pending_word = None
     
     #========================================================================
     #  _verify_crc
@@ -451,6 +473,16 @@ class OCD_8051:
         else:
             return False
     
+    #========================================================================
+    #  _crc_retry
+    #------------------------------------------------------------------------
+    #  Remarks: let the link count retries, it falls back to a lower baud
+    #           rate if there are too many of them
+    #========================================================================
+    def _crc_retry (self):
+        if (isinstance (self._serial, Low_Latency_Serial)):
+            self._serial.crc_retry()
+    
     #========================================================================
     #  code_mem_zero_fill_frame
     #========================================================================
@@ -465,6 +497,8 @@ class OCD_8051:
         addr_write_low_byte  = addr & 0xFF
         addr_write_high_byte = (addr >> 8) & 0xFF
         
+        self._code_word_cache_update (addr, [(data >> 24) & 0xFF, (data >> 16) & 0xFF, (data >> 8) & 0xFF, data & 0xFF])
+        
         condition = True
         
         while (condition):
@@ -489,6 +523,7 @@ class OCD_8051:
                 ret = self._serial.read (OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN)
                 condition = not self._verify_crc (ret)
                 if (condition):
+                    self._crc_retry()
                     if (show_crc_error):
                         print ("\naddr=", addr, "Write 32bit reply CRC failed, Retry!")
                     self.code_mem_zero_fill_frame()
@@ -503,6 +538,8 @@ class OCD_8051:
         addr_write_low_byte  = addr & 0xFF
         addr_write_high_byte = (addr >> 8) & 0xFF
         
+        self._code_word_cache_update (addr, data_list [0:128])
+        
         condition = True
         #print ("wr128, addr = ", addr)
         
@@ -524,10 +561,119 @@ class OCD_8051:
 
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("\naddr=", addr, "Write 128byte reply CRC failed, Retry!")
                 self.code_mem_zero_fill_frame()
             
+    #========================================================================
+    #  code_mem_write_ext
+    #------------------------------------------------------------------------
+    #  Remarks: 1024 byte frame. With retry=0 only one attempt is made, and
+    #           the return value tells whether the target acked the frame.
+    #========================================================================
+    def code_mem_write_ext (self, addr, data_list, show_crc_error=0, retry=1):
+    
+        addr_write_low_byte  = addr & 0xFF
+        addr_write_high_byte = (addr >> 8) & 0xFF
+        
+        condition = True
+        
+        while (condition):
+            frame_type_byte = OCD_8051._OCD_DEBUG_TYPE_PRAM_WRITE_EXT_BYTES_WITH_ACK * 2 + OCD_8051._toggle
+            OCD_8051._toggle = 1 - OCD_8051._toggle
+            
+            frame = OCD_8051._OCD_DEBUG_SYNC + [frame_type_byte] + [addr_write_high_byte, addr_write_low_byte]
+            frame = frame + (data_list [0:4])
+            frame = frame + OCD_8051._crc16_ccitt.get_crc (frame)
+            frame = frame + data_list [4 : OCD_8051._OCD_WRITE_EXT_FRAME_LEN] + OCD_8051._crc16_ccitt.get_crc (data_list [4 : OCD_8051._OCD_WRITE_EXT_FRAME_LEN])
+            
+            self._serial.write (frame)
+            
+            if (self._verbose):
+                print ("Xsend: ", [hex(i) for i in frame])
+            
+            ret = self._serial.read (OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN)
+            
+            acked = (len(ret) == OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN) and self._verify_crc (ret)
+            condition = (not acked) and retry
+            if (not acked):
+                if (retry):
+                    self._crc_retry()
+                if (show_crc_error):
+                    print ("\naddr=", addr, "Write EXT reply CRC failed, Retry!")
+                self.code_mem_zero_fill_frame()
+        
+        if (acked):
+            self._code_word_cache_update (addr, data_list [0 : OCD_8051._OCD_WRITE_EXT_FRAME_LEN])
+        
+        return acked
+    
+    #========================================================================
+    #  code_mem_probe_ext
+    #------------------------------------------------------------------------
+    #  Remarks: Older OCD builds only take 4 byte and 128 byte frames. Send
+    #           a real ext frame once, with a short timeout, and remember
+    #           whether it was acked. The data is written if it succeeds.
+    #========================================================================
+    def code_mem_probe_ext (self, addr, data_list):
+        timeout_save = self._serial.timeout
+        
+        # time on the wire for the frame, plus some slack for the reply
+        self._serial.timeout = OCD_8051._OCD_PROBE_TIME_OUT + \
+            (OCD_8051._OCD_WRITE_EXT_FRAME_LEN + 20) * 10 / self._serial.baudrate
+        
+        try:
+            self._ext_frame_support = self.code_mem_write_ext (addr, data_list, retry=0)
+        finally:
+            self._serial.timeout = timeout_save
+        
+        if (not self._ext_frame_support):
+            self._serial.reset_input_buffer()
+        
+        return self._ext_frame_support
+    
+    #========================================================================
+    #  code_mem_frame_sizes
+    #========================================================================
+    def code_mem_frame_sizes (self):
+        if (self._ext_frame_support == False):
+            return (Code_Upload_Planner.FRAME_SIZE_128, Code_Upload_Planner.FRAME_SIZE_WORD)
+        else:
+            return Code_Upload_Planner.FRAME_SIZES_ALL
+    
+    #========================================================================
+    #  code_mem_write
+    #------------------------------------------------------------------------
+    #  Remarks: write a segment of any length / alignment, using the
+    #           largest frames the target accepts
+    #========================================================================
+    def code_mem_write (self, addr, data_list):
+        self._planner.frame_sizes = self.code_mem_frame_sizes()
+        plan = self._planner.plan_segment (addr, len (data_list))
+        
+        for (offset, size) in plan:
+            data = data_list [offset : offset + size]
+            
+            if (size != Code_Upload_Planner.FRAME_SIZE_BYTE):
+                self.code_mem_flush()
+            
+            if (size == Code_Upload_Planner.FRAME_SIZE_EXT):
+                if (self._ext_frame_support is None):
+                    if (not self.code_mem_probe_ext (addr + offset, data)):
+                        # not supported, re-plan the rest without ext frames
+                        self.code_mem_write (addr + offset, data_list [offset:])
+                        return
+                else:
+                    self.code_mem_write_ext (addr + offset, data)
+            elif (size == Code_Upload_Planner.FRAME_SIZE_128):
+                self.code_mem_write_128byte (addr + offset, data)
+            elif (size == Code_Upload_Planner.FRAME_SIZE_WORD):
+                data_int = (data[0] << 24) + (data[1] << 16) + (data[2] << 8) + (data[3])
+                self.code_mem_write_32bit (addr + offset, data_int)
+            else:
+                self._code_mem_combine_byte (addr + offset, data[0])
+            
     #========================================================================
     #  code_mem_read_32bit
     #========================================================================
@@ -536,6 +682,9 @@ class OCD_8051:
         addr_write_low_byte  = addr & 0xFF
         addr_write_high_byte = (addr >> 8) & 0xFF
         
+        if ((self._code_pending_word is not None) and (self._code_pending_word[0] == addr // 4)):
+            self.code_mem_flush()
+        
         condition = True
         
         #print ("read32bit, addr = ", addr)
@@ -560,25 +709,120 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("addr=", addr, "\nread 32bit reply CRC failed, Retry!")
                                 
         if (self._verbose):
             print ("receive: ", [hex(i) for i in ret])
-                
-        return [i for i in ret[OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN - 6 : OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN - 2]]
+        
+        data_list = [i for i in ret[OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN - 6 : OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN - 2]]
+        self._code_word_cache_store (addr // 4, data_list)
+        
+        return data_list
         #print ([hex(i) for i in r])
     
+    #========================================================================
+    #  _code_word_cache_store
+    #========================================================================
+    def _code_word_cache_store (self, word_index, data_list):
+        self._code_word_cache [word_index] = list (data_list)
+        self._code_word_cache.move_to_end (word_index)
+        
+        if (len (self._code_word_cache) > OCD_8051._OCD_CODE_WORD_CACHE_SIZE):
+            self._code_word_cache.popitem (last=False)
+    
+    #========================================================================
+    #  _code_word_cache_update
+    #------------------------------------------------------------------------
+    #  Remarks: keep cached words coherent with a whole word write. Words
+    #           that are not cached yet are left alone.
+    #========================================================================
+    def _code_word_cache_update (self, addr, data_list):
+        if (len (self._code_word_cache) == 0):
+            return
+        
+        for i in range (len (data_list) // 4):
+            word_index = addr // 4 + i
+            if (word_index in self._code_word_cache):
+                self._code_word_cache [word_index] = list (data_list [i * 4 : i * 4 + 4])
+    
+    #========================================================================
+    #  _code_word_get
+    #------------------------------------------------------------------------
+    #  Remarks: content of a code memory word, read at most once while the
+    #           CPU stays paused
+    #========================================================================
+    def _code_word_get (self, word_index):
+        if (word_index in self._code_word_cache):
+            return list (self._code_word_cache [word_index])
+        else:
+            return self.code_mem_read_32bit (word_index * 4)
+    
+    #========================================================================
+    #  code_word_cache_invalidate
+    #========================================================================
+    def code_word_cache_invalidate (self):
+        self.code_mem_flush()
+        self._code_word_cache.clear()
+    
+    #========================================================================
+    #  _code_mem_combine_byte
+    #------------------------------------------------------------------------
+    #  Remarks: buffer a byte into the pending partial word. The word goes
+    #           out as soon as all 4 bytes are known, or when a byte for
+    #           another word comes in.
+    #========================================================================
+    def _code_mem_combine_byte (self, addr, data):
+        word_index = addr // 4
+        
+        if ((self._code_pending_word is not None) and (self._code_pending_word[0] != word_index)):
+            self.code_mem_flush()
+        
+        if (self._code_pending_word is None):
+            self._code_pending_word = [word_index, [0, 0, 0, 0], 0]
+        
+        self._code_pending_word[1][addr % 4] = data & 0xFF
+        self._code_pending_word[2] = self._code_pending_word[2] | (1 << (addr % 4))
+        
+        if (self._code_pending_word[2] == 0xF):
+            self.code_mem_flush()
+    
+    #========================================================================
+    #  code_mem_flush
+    #------------------------------------------------------------------------
+    #  Remarks: write out the pending partial word, filling the bytes that
+    #           were not written from the word cache
+    #========================================================================
+    def code_mem_flush (self):
+        if (self._code_pending_word is None):
+            return
+        
+        (word_index, data_list, mask) = self._code_pending_word
+        self._code_pending_word = None
+        
+        if (mask != 0xF):
+            data_tmp = self._code_word_get (word_index)
+            for i in range (4):
+                if (mask & (1 << i)):
+                    data_tmp [i] = data_list [i]
+            data_list = data_tmp
+        
+        data_word = (data_list[0] << 24) + (data_list[1] << 16) + (data_list[2] << 8) + (data_list[3])
+        self.code_mem_write_32bit (word_index * 4, data_word)
+    
     #========================================================================
     #  code_mem_write_byte
     #========================================================================
     def code_mem_write_byte (self, addr, data, ack=1):
         addr_word = addr // 4
         
-        data_tmp = self.code_mem_read_32bit (addr_word * 4)
+        self.code_mem_flush()
+        
+        data_tmp = self._code_word_get (addr_word)
         data_tmp [addr % 4] = data
         data_word_tmp = (data_tmp[0] << 24) + (data_tmp[1] << 16) + (data_tmp[2] << 8) + (data_tmp[3])
-        self.code_mem_write_32bit(addr, data_word_tmp, ack)
+        self.code_mem_write_32bit(addr_word * 4, data_word_tmp, ack)
 
     #========================================================================
     #  code_mem_read_byte
@@ -622,6 +866,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("addr=", addr, "read data byte reply CRC fail")
                     
@@ -656,6 +901,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("addr=", addr, "write data byte reply CRC fail")
                     
@@ -669,6 +915,8 @@ class OCD_8051:
     #========================================================================
     def cpu_reset (self, show_crc_error=0):
     
+        self.code_word_cache_invalidate()
+        
         condition = True
         while (condition):
             frame_type_byte = OCD_8051._OCD_DEBUG_TYPE_CPU_RESET_WITH_ACK * 2 + OCD_8051._toggle;
@@ -685,6 +933,7 @@ class OCD_8051:
     
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("cpu reset reply CRC fail")
     
@@ -696,6 +945,11 @@ class OCD_8051:
     #========================================================================
     def cpu_pause (self, on_off, no_reply=0, show_crc_error=0):
     
+        if (on_off):
+            self.code_mem_flush()
+        else:
+            self.code_word_cache_invalidate()
+        
         condition = True
         while (condition):
         
@@ -721,6 +975,7 @@ class OCD_8051:
                 condition = not self._verify_crc (ret)
             
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("cpu pause reply CRC fail");
             
@@ -749,6 +1004,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("cpu read status reply CRC fail")
             
@@ -770,6 +1026,72 @@ class OCD_8051:
         self.debug_counter = debug_counter
         self.timer_counter = timer_counter
 
+    #========================================================================
+    #  ping
+    #------------------------------------------------------------------------
+    #  Remarks: one status frame with a short timeout. Returns True if a
+    #           reply with good CRC came back
+    #========================================================================
+    def ping (self, time_out=_OCD_PROBE_TIME_OUT):
+        frame_type_byte = OCD_8051._OCD_DEBUG_TYPE_READ_CPU_STATUS * 2 + OCD_8051._toggle;
+        OCD_8051._toggle = 1 - OCD_8051._toggle
+        
+        frame = OCD_8051._OCD_DEBUG_SYNC + [frame_type_byte] + [0x12, 0x34, 0xab, 0xcd, 0xab, 0xcd]
+        frame = frame + OCD_8051._crc16_ccitt.get_crc (frame)
+        
+        timeout_save = self._serial.timeout
+        self._serial.timeout = time_out
+        
+        try:
+            self._serial.write (frame)
+            ret = self._serial.read (OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN)
+        finally:
+            self._serial.timeout = timeout_save
+        
+        if ((len (ret) == OCD_8051._OCD_DEBUG_FRAME_REPLY_LEN) and self._verify_crc (ret)):
+            return True
+        
+        self._serial.reset_input_buffer()
+        return False
+        
+    #========================================================================
+    #  wait_ready
+    #------------------------------------------------------------------------
+    #  Remarks: ping until the OCD answers, instead of sleeping for a fixed
+    #           time after pause / reset
+    #========================================================================
+    def wait_ready (self, time_out=_OCD_READY_TIME_OUT):
+        deadline = time.time() + time_out
+        
+        while (not self.ping()):
+            if (time.time() > deadline):
+                return False
+        
+        return True
+        
+    #========================================================================
+    #  drain_input
+    #------------------------------------------------------------------------
+    #  Remarks: read whatever comes in until the line has been quiet for
+    #           quiet_time, or time_out is reached
+    #========================================================================
+    def drain_input (self, quiet_time=_OCD_QUIET_TIME, time_out=0.5):
+        timeout_save = self._serial.timeout
+        self._serial.timeout = quiet_time
+        deadline = time.time() + time_out
+        data = b""
+        
+        try:
+            while (time.time() < deadline):
+                r = self._serial.read (max ([1, self._serial.in_waiting]))
+                if (len (r) == 0):
+                    break
+                data = data + r
+        finally:
+            self._serial.timeout = timeout_save
+        
+        return data
+        
     #========================================================================
     #  counter_config
     #========================================================================
@@ -798,6 +1120,7 @@ class OCD_8051:
             condition = not self._verify_crc (ret)
             
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("counter config reply CRC fail")
             
@@ -832,6 +1155,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("set breakpoint reply CRC fail")
             
@@ -860,6 +1184,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("breakpoint off reply CRC fail")
             
@@ -871,6 +1196,8 @@ class OCD_8051:
     #========================================================================
     def run_pulse (self, show_crc_error=0):
     
+        self.code_word_cache_invalidate()
+        
         condition = True
         while (condition):
 
@@ -888,6 +1215,7 @@ class OCD_8051:
             
             condition = not self._verify_crc (ret)
             if (condition):
+                self._crc_retry()
                 if (show_crc_error):
                     print ("run pulse reply CRC fail")
             
@@ -899,6 +1227,8 @@ class OCD_8051:
     #========================================================================
     def uart_select (self, ocd0_cpu1):
     
+        self.code_mem_flush()
+        
         frame_type_byte = OCD_8051._OCD_DEBUG_TYPE_UART_SEL * 2 + OCD_8051._toggle;
         OCD_8051._toggle = 1 - OCD_8051._toggle
             
@@ -0,0 +1,442 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, os, io, json, time, getopt, random, shutil, tempfile, contextlib
+import subprocess, importlib.util
+
+from CRC16_CCITT import CRC16_CCITT
+from ROM_Hex_Format import Intel_Hex, Motorola_SREC
+from OCD_8051 import OCD_8051
+from Link_Bench import Link_Bench
+from Frame_Replay import Frame_Replay
+from M10_Board_Simulator import M10_Board_Simulator
+from M10_high_speed_config_console import dummy_console, M10_high_speed_config_console, Mustang_Console
+
+#############################################################################
+# Perf_Bench : offline benchmarks of the host side hot paths
+#
+# Remarks:
+#    Everything runs without a board. The parsers, transforms and frame
+#  codecs are timed on synthetic data; the full UFM / CFM loads, FP51
+#  upload and flash dump run the same console code as the command line
+#  against M10_Board_Simulator on a pty, with time_scale 0 by default so
+#  only host time is measured.
+#    Cold start of the engine import and of the GUI window are timed in
+#  fresh interpreters, the GUI one only where Tk has a display.
+#    Each metric is a rate (higher is better). The results can be saved
+#  as the baseline file, and later runs fail when a metric drops more
+#  than the tolerance below its baseline.
+#    The rates are host timings, so the baseline is machine local and is
+#  not kept in the repository: save one with -S on the machine that runs
+#  the comparison. Comparing without a baseline file is an error.
+#############################################################################
+
+class Perf_Bench:
+
+    UFM_IMAGE_SIZE = 32768
+    CFM_IMAGE_SIZE = 143360
+
+    # run to run noise of the host timings is up to 20% on a busy machine
+    DEFAULT_TOLERANCE = 0.3
+    DEFAULT_BASELINE  = "perf_baseline.json"
+
+    # least time spent on each micro benchmark, in seconds
+    MIN_TIME = 1.0
+    ROUNDS   = 5
+
+    BAUD_RATE = 921600
+
+    # fresh interpreters per startup benchmark, the fastest one counts
+    STARTUP_ROUNDS = 3
+
+    _crc16_ccitt = CRC16_CCITT()
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    time_scale : time_scale of the stand-in board, 0 for host time only
+    #    board      : 0 to skip the runs against the stand-in board
+    #========================================================================
+    def __init__ (self, time_scale=0, board=1):
+        self.time_scale = time_scale
+        self.board = board
+        self.results = {}
+
+        self._random = random.Random (2017)
+        self._work_dir = None
+
+    #========================================================================
+    #  _record
+    #========================================================================
+    def _record (self, name, value, unit):
+        self.results [name] = {'value' : value, 'unit' : unit}
+        print ("{0:<28}: {1:14.1f} {2}".format (name, value, unit))
+
+    #========================================================================
+    #  _repeat
+    #------------------------------------------------------------------------
+    # Return:
+    #    (number of calls, seconds) of the fastest of ROUNDS rounds, each
+    #    calling func until MIN_TIME / ROUNDS is spent. The best round is
+    #    the least disturbed by the rest of the machine
+    #========================================================================
+    def _repeat (self, func):
+        best = None
+
+        for i in range (Perf_Bench.ROUNDS):
+            count = 0
+            start_time = time.perf_counter ()
+
+            while (True):
+                func ()
+                count = count + 1
+                delta_time = time.perf_counter () - start_time
+                if (delta_time >= (Perf_Bench.MIN_TIME / Perf_Bench.ROUNDS)):
+                    break
+
+            if ((best is None) or ((count / delta_time) > (best[0] / best[1]))):
+                best = (count, delta_time)
+
+        return best
+
+    #========================================================================
+    #  synthetic images
+    #========================================================================
+    def _random_data (self, length):
+        return [self._random.randrange (256) for i in range (length)]
+
+    def intel_hex_lines (self, data_list, record_size=16):
+        lines = []
+
+        for addr in range (0, len (data_list), record_size):
+            record = data_list [addr : addr + record_size]
+            fields = [len (record), (addr >> 8) & 0xFF, addr & 0xFF, 0] + record
+            lines.append (":" + "".join (["{0:02X}".format (i) for i in fields + [(256 - sum (fields) % 256) % 256]]))
+
+        lines.append (":00000001FF")
+        return lines
+
+    def srec_lines (self, data_list, record_size=16):
+        lines = []
+
+        for addr in range (0, len (data_list), record_size):
+            record = data_list [addr : addr + record_size]
+            fields = [len (record) + 5, (addr >> 24) & 0xFF, (addr >> 16) & 0xFF, (addr >> 8) & 0xFF, addr & 0xFF] + record
+            lines.append ("S3" + "".join (["{0:02X}".format (i) for i in fields + [255 - sum (fields) % 256]]))
+
+        lines.append ("S70500000000FA")
+        return lines
+
+    def _write_file (self, name, content):
+        file_name = os.path.join (self._work_dir, name)
+
+        if (isinstance (content, list)):
+            with open (file_name, 'w') as f:
+                f.write ("\n".join (content) + "\n")
+        else:
+            with open (file_name, 'wb') as f:
+                f.write (content)
+
+        return file_name
+
+    #========================================================================
+    #  micro benchmarks
+    #========================================================================
+    def bench_crc (self):
+        frame = self._random_data (1034)
+        (count, delta_time) = self._repeat (lambda : Perf_Bench._crc16_ccitt.get_crc (frame))
+        self._record ("crc16", count * len (frame) / delta_time, "bytes/s")
+
+    def bench_hex_parse (self):
+        for (size, name) in ((Perf_Bench.UFM_IMAGE_SIZE, "32k"), (Perf_Bench.CFM_IMAGE_SIZE, "143k")):
+            lines = self.intel_hex_lines (self._random_data (size))
+            (count, delta_time) = self._repeat (lambda : Intel_Hex ("", 0, lines))
+            self._record ("intel_hex_parse_" + name, count * size / delta_time, "bytes/s")
+
+    def bench_srec_parse (self):
+        # Motorola_SREC reads files only, and prints each record
+        for (size, name) in ((Perf_Bench.UFM_IMAGE_SIZE, "32k"), (Perf_Bench.CFM_IMAGE_SIZE, "143k")):
+            file_name = self._write_file ("image_" + name + ".srec", self.srec_lines (self._random_data (size)))
+            with contextlib.redirect_stdout (io.StringIO ()):
+                (count, delta_time) = self._repeat (lambda : Motorola_SREC (file_name, 4))
+            self._record ("srec_parse_" + name, count * size / delta_time, "bytes/s")
+
+    def bench_transforms (self):
+        console = Mustang_Console.__new__ (Mustang_Console)
+        data_list = self._random_data (Perf_Bench.CFM_IMAGE_SIZE)
+
+        (count, delta_time) = self._repeat (lambda : [console._bit_reverse_8bit (i) for i in data_list])
+        self._record ("bit_reverse", count * len (data_list) / delta_time, "bytes/s")
+
+        (count, delta_time) = self._repeat (lambda : console._endian_data_list (data_list))
+        self._record ("endian_swap", count * len (data_list) / delta_time, "bytes/s")
+
+    def bench_frames (self):
+        link_bench = Link_Bench (None)
+        replay = Frame_Replay ()
+        segment = self._random_data (1024)
+
+        frames = [link_bench.ocd_write_frame (addr, segment) for addr in range (0, 65536, 1024)]
+        (count, delta_time) = self._repeat (lambda : [link_bench.ocd_write_frame (addr, segment) for addr in range (0, 65536, 1024)])
+        self._record ("frame_encode_1k", count * len (frames) / delta_time, "frames/s")
+
+        stream = bytes (sum (frames, []))
+        (count, delta_time) = self._repeat (lambda : replay.decode_tx (stream))
+        self._record ("frame_decode_1k", count * len (frames) / delta_time, "frames/s")
+
+        short_frames = [link_bench.ocd_status_frame () for i in range (256)]
+        stream = bytes (sum (short_frames, []))
+        (count, delta_time) = self._repeat (lambda : replay.decode_tx (stream))
+        self._record ("frame_decode_12", count * len (short_frames) / delta_time, "frames/s")
+
+    #========================================================================
+    #  _on_board
+    #------------------------------------------------------------------------
+    # Remarks: runs func (ocd, config) against a fresh stand-in board, with
+    #          the console output thrown away. Records bytes/s and frames/s
+    #========================================================================
+    def _on_board (self, name, length, func, firmware_running=1):
+        simulator = M10_Board_Simulator (latency=0, time_scale=self.time_scale, firmware_running=firmware_running)
+        port_name = simulator.start ()
+
+        try:
+            with contextlib.redirect_stdout (io.StringIO ()):
+                ocd = OCD_8051 (port_name, Perf_Bench.BAUD_RATE, verbose=0)
+                config = M10_high_speed_config_console (port_name, Perf_Bench.BAUD_RATE, verbose=0, serial_link=ocd._serial)
+                ocd.uart_select (1 - firmware_running)
+
+                frames_before = simulator.stats['frames']
+                start_time = time.perf_counter ()
+                func (ocd, config)
+                delta_time = time.perf_counter () - start_time
+
+            ocd._serial.close ()
+        finally:
+            simulator.stop ()
+
+        self._record (name, length / delta_time, "bytes/s")
+        self._record (name + "_frames", (simulator.stats['frames'] - frames_before) / delta_time, "frames/s")
+
+        return simulator
+
+    def _console (self, config, args):
+        console = Mustang_Console (config)
+        console._args = args
+        return console
+
+    def bench_ufm_load (self):
+        file_name = self._write_file ("ufm.hex", self.intel_hex_lines (self._random_data (Perf_Bench.UFM_IMAGE_SIZE)))
+        self._on_board ("ufm_load", Perf_Bench.UFM_IMAGE_SIZE, \
+            lambda ocd, config : self._console (config, ["load", "ufm", file_name])._do_load_hex_file ())
+
+    def bench_cfm_load (self):
+        file_name = self._write_file ("cfm.bin", bytes (self._random_data (Perf_Bench.CFM_IMAGE_SIZE)))
+        self._on_board ("cfm_load", Perf_Bench.CFM_IMAGE_SIZE, \
+            lambda ocd, config : self._console (config, ["load", "cfm", file_name])._do_load_bin_file ())
+
+    def bench_flash_dump (self):
+        file_name = os.path.join (self._work_dir, "dump.bin")
+        self._on_board ("flash_dump", Perf_Bench.CFM_IMAGE_SIZE, \
+            lambda ocd, config : self._console (config, ["read", "cfm", "0", file_name])._do_read_flash ())
+
+    def bench_fp51_upload (self):
+        intel_hex = Intel_Hex ("", 0, dummy_console._FP51_CONFIG_FIRMWARE)
+        length = sum ([len (record.data_list) for record in intel_hex.data_record_list])
+
+        def upload (ocd, config):
+            console = dummy_console (ocd)
+            console._args = ["load_hex_and_switch"]
+            console._do_load_hex_and_switch ()
+
+        self._on_board ("fp51_upload", length, upload, firmware_running=0)
+
+    #========================================================================
+    #  _cold_start
+    #------------------------------------------------------------------------
+    # Return:
+    #    (seconds, output) of the fastest of STARTUP_ROUNDS runs of a new
+    #    interpreter with args, in the directory of this script
+    #========================================================================
+    def _cold_start (self, args):
+        best = None
+
+        for i in range (Perf_Bench.STARTUP_ROUNDS):
+            start_time = time.perf_counter ()
+            output = subprocess.run ([sys.executable] + args, cwd=os.path.dirname (os.path.abspath (__file__)), \
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True).stdout.decode ()
+            delta_time = time.perf_counter () - start_time
+
+            if ((best is None) or (delta_time < best[0])):
+                best = (delta_time, output)
+
+        return best
+
+    def bench_engine_import (self):
+        (delta_time, output) = self._cold_start (["-c", \
+            "import sys, M10_Program_Session; print ('tkinter' in sys.modules or 'Pmw' in sys.modules)"])
+
+        if (output.split ()[-1] == "True"):
+            print ("M10_Program_Session pulls in Tk / Pmw")
+
+        self._record ("engine_import", 1 / delta_time, "starts/s")
+
+    def bench_gui_startup (self):
+        if (importlib.util.find_spec ("Pmw") is None):
+            print ("Pmw not installed, GUI startup skipped")
+            return
+
+        if ((os.name != 'nt') and (sys.platform != 'darwin') and ("DISPLAY" not in os.environ)):
+            print ("No display, GUI startup skipped")
+            return
+
+        (delta_time, output) = self._cold_start (["M10_config_gui.py", "--startup-bench"])
+        self._record ("gui_startup", 1 / delta_time, "starts/s")
+
+    #========================================================================
+    #  run
+    #========================================================================
+    def run (self):
+        self._work_dir = tempfile.mkdtemp (prefix="perf_bench_")
+
+        try:
+            self.bench_crc ()
+            self.bench_hex_parse ()
+            self.bench_srec_parse ()
+            self.bench_transforms ()
+            self.bench_frames ()
+            self.bench_engine_import ()
+            self.bench_gui_startup ()
+
+            if (self.board):
+                if (not sys.platform.startswith ('linux')):
+                    print ("The stand-in board needs a Linux pty, board runs skipped")
+                else:
+                    self.bench_fp51_upload ()
+                    self.bench_ufm_load ()
+                    self.bench_cfm_load ()
+                    self.bench_flash_dump ()
+        finally:
+            shutil.rmtree (self._work_dir, ignore_errors=True)
+
+        return self.results
+
+    #========================================================================
+    #  save_baseline / compare
+    #========================================================================
+    def save_baseline (self, file_name):
+        baseline = {
+            'time'       : time.strftime ("%Y-%m-%d %H:%M:%S"),
+            'host'       : sys.platform + " / python " + sys.version.split ()[0],
+            'time_scale' : self.time_scale,
+            'metrics'    : {name : result['value'] for (name, result) in self.results.items ()}
+        }
+
+        with open (file_name, 'w') as f:
+            json.dump (baseline, f, indent=2, sort_keys=True)
+
+    #------------------------------------------------------------------------
+    # Return:
+    #    list of (name, value, baseline value) for the metrics that dropped
+    #    by more than tolerance. Metrics missing on either side are skipped
+    #------------------------------------------------------------------------
+    def compare (self, file_name, tolerance=DEFAULT_TOLERANCE):
+        with open (file_name) as f:
+            baseline = json.load (f)
+
+        regressions = []
+
+        for (name, base_value) in sorted (baseline['metrics'].items ()):
+            if (name not in self.results):
+                continue
+
+            value = self.results [name]['value']
+            change = (value - base_value) / base_value if base_value else 0
+
+            if (value < base_value * (1 - tolerance)):
+                mark = "REGRESSION"
+                regressions.append ((name, value, base_value))
+            else:
+                mark = ""
+
+            print ("{0:<28}: {1:+7.1f}% {2}".format (name, change * 100, mark))
+
+        return regressions
+
+
+#============================================================================
+#  main
+#============================================================================
+
+def main():
+
+    baseline_file = Perf_Bench.DEFAULT_BASELINE
+    tolerance = Perf_Bench.DEFAULT_TOLERANCE
+    save = 0
+    board = 1
+    time_scale = 0
+
+    try:
+        opts, args = getopt.getopt (sys.argv[1:], "hB:t:Sns:", [])
+    except getopt.GetoptError as err:
+        print (str(err))
+        sys.exit(1)
+
+    for opt, arg in opts:
+        if opt in ('-B'):
+            baseline_file = arg
+        elif opt in ('-t'):
+            tolerance = float (arg)
+        elif opt in ('-S'):
+            save = 1
+        elif opt in ('-n'):
+            board = 0
+        elif opt in ('-s'):
+            time_scale = float (arg)
+        else:
+            print ("Usage:\n  py Perf_Bench.py [-B baseline_file] [-t tolerance] [-S] [-n] [-s time_scale]")
+            print ("  Options: \n    -B: baseline file (default " + Perf_Bench.DEFAULT_BASELINE + ")")
+            print ("    -t: allowed drop below the baseline, as a fraction (default " + str (Perf_Bench.DEFAULT_TOLERANCE) + ")")
+            print ("    -S: save the results as the new baseline")
+            print ("    -n: skip the runs against the stand-in board")
+            print ("    -s: time scale of the stand-in board, 0 for host time only (default)")
+            print ("    -h print usage")
+            print ("\n  Exits with 1 when a metric regressed or the baseline file is missing")
+            sys.exit(1)
+
+    if ((not save) and (not os.path.exists (baseline_file))):
+        print ("No baseline at ", baseline_file, ", run with -S to save one")
+        sys.exit(1)
+
+    bench = Perf_Bench (time_scale, board)
+
+    print ("=================================================================")
+    bench.run ()
+    print ("=================================================================")
+
+    if (save):
+        bench.save_baseline (baseline_file)
+        print ("Baseline saved to ", baseline_file)
+    else:
+        regressions = bench.compare (baseline_file, tolerance)
+        if (len (regressions)):
+            print (len (regressions), " metric(s) regressed by more than {0:0.0f}%".format (tolerance * 100))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import os, json, time, datetime
+from collections import OrderedDict
+
+#############################################################################
+# Program_Telemetry : per phase numbers of one programming run
+#
+# Remarks:
+#    Phases are port_open, fp51_upload, chip_id, erase, buffer_fill,
+#  protect and verify; erase and buffer_fill are recorded once per flash
+#  sector. Each phase keeps the difference of the link counters
+#  (Low_Latency_Serial.counters) between its start and its end.
+#    A run can be written as one JSON line (appended to a log file) and as
+#  a Prometheus textfile for node_exporter's textfile collector.
+#############################################################################
+
+class Program_Telemetry:
+
+    PROMETHEUS_PREFIX = "m10_program"
+
+    _COUNTER_NAMES = ('bytes_sent', 'bytes_received', 'frames', 'crc_retries', 'device_wait')
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    link    : Low_Latency_Serial to take counters from, can be given
+    #              later through attach() once the port is open
+    #    station : label for the Prometheus metrics
+    #========================================================================
+    def __init__ (self, link=None, station=""):
+        self.link = link
+        self.station = station
+        self.phases = []
+        self.start_time = time.time()
+        self._current = None
+
+    #========================================================================
+    #  attach
+    #========================================================================
+    def attach (self, link):
+        self.link = link
+
+    #========================================================================
+    #  _counters
+    #========================================================================
+    def _counters (self):
+        if ((self.link is None) or (not hasattr (self.link, 'counters'))):
+            return dict ([(name, 0) for name in Program_Telemetry._COUNTER_NAMES])
+
+        return self.link.counters()
+
+    #========================================================================
+    #  start_phase
+    #------------------------------------------------------------------------
+    # Remarks: a phase still open is ended first
+    #========================================================================
+    def start_phase (self, name, sector=None):
+        if (self._current is not None):
+            self.end_phase()
+
+        self._current = {
+            'phase'    : name,
+            'sector'   : sector,
+            'start'    : time.perf_counter(),
+            'counters' : self._counters(),
+            'wait'     : 0
+        }
+
+    #========================================================================
+    #  add_device_wait
+    #------------------------------------------------------------------------
+    # Remarks: time spent waiting on the device outside of serial reads,
+    #          such as the sleep between erase status polls
+    #========================================================================
+    def add_device_wait (self, seconds):
+        if (self._current is not None):
+            self._current['wait'] = self._current['wait'] + seconds
+
+    #========================================================================
+    #  end_phase
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    payload : data bytes moved by the phase, for the throughput. If
+    #              not given, bytes sent are used
+    #========================================================================
+    def end_phase (self, payload=None):
+        if (self._current is None):
+            return None
+
+        seconds = time.perf_counter() - self._current['start']
+        counters = self._counters()
+
+        record = {
+            'phase'   : self._current['phase'],
+            'sector'  : self._current['sector'],
+            'seconds' : seconds
+        }
+
+        for name in Program_Telemetry._COUNTER_NAMES:
+            # the link may have been attached during the phase
+            record[name] = counters[name] - min ([self._current['counters'][name], counters[name]])
+
+        record['device_wait'] = record['device_wait'] + self._current['wait']
+
+        if (payload is None):
+            payload = record['bytes_sent']
+
+        record['payload'] = payload
+
+        if (seconds > 0):
+            record['throughput'] = payload / seconds
+        else:
+            record['throughput'] = 0
+
+        self.phases.append (record)
+        self._current = None
+
+        return record
+
+    #========================================================================
+    #  summary
+    #========================================================================
+    def summary (self):
+        if (self._current is not None):
+            self.end_phase()
+
+        record = {
+            'time'    : datetime.datetime.fromtimestamp (self.start_time).isoformat(),
+            'station' : self.station,
+            'seconds' : sum ([phase['seconds'] for phase in self.phases]),
+            'phases'  : self.phases
+        }
+
+        if (self.link is not None):
+            record['port'] = self.link.port
+            record['baud_rate'] = self.link.baudrate
+
+        return record
+
+    #========================================================================
+    #  print_summary
+    #========================================================================
+    def print_summary (self):
+        record = self.summary()
+
+        print ("{0:<14}{1:>7}{2:>9}{3:>10}{4:>10}{5:>8}{6:>8}{7:>9}{8:>10}".format ( \
+            "phase", "sector", "time s", "sent", "received", "frames", "retries", "wait s", "KB/s"))
+
+        for phase in record['phases']:
+            if (phase['sector'] is None):
+                sector = "-"
+            else:
+                sector = str (phase['sector'])
+
+            print ("{0:<14}{1:>7}{2:>9.2f}{3:>10d}{4:>10d}{5:>8d}{6:>8d}{7:>9.2f}{8:>10.1f}".format ( \
+                phase['phase'], sector, phase['seconds'], phase['bytes_sent'], phase['bytes_received'], \
+                phase['frames'], phase['crc_retries'], phase['device_wait'], phase['throughput'] / 1024))
+
+        print ("total {0:0.2f}s".format (record['seconds']))
+
+    #========================================================================
+    #  write_json_line
+    #------------------------------------------------------------------------
+    # Remarks: one line per run, appended
+    #========================================================================
+    def write_json_line (self, file_name):
+        try:
+            with open (file_name, 'a') as f:
+                f.write (json.dumps (self.summary()) + "\n")
+        except IOError:
+            print ("Fail to open: ", file_name)
+
+    #========================================================================
+    #  _merged_phases
+    #------------------------------------------------------------------------
+    # Remarks: phases with the same name and sector added up (a sector can
+    #          be erased more than once in a run), one series per label set
+    #========================================================================
+    def _merged_phases (self):
+        merged = OrderedDict()
+
+        for phase in self.phases:
+            key = (phase['phase'], phase['sector'])
+
+            if (key not in merged):
+                merged[key] = dict (phase)
+            else:
+                for name in ('seconds', 'payload') + Program_Telemetry._COUNTER_NAMES:
+                    merged[key][name] = merged[key][name] + phase[name]
+
+                if (merged[key]['seconds'] > 0):
+                    merged[key]['throughput'] = merged[key]['payload'] / merged[key]['seconds']
+
+        return list (merged.values())
+
+    #========================================================================
+    #  write_prometheus
+    #------------------------------------------------------------------------
+    # Remarks: written to a temp file and renamed, so the collector never
+    #          sees half a file
+    #========================================================================
+    def write_prometheus (self, file_name):
+        record = self.summary()
+        prefix = Program_Telemetry.PROMETHEUS_PREFIX
+
+        metrics = [
+            ('seconds',        'gauge',   'time spent in the phase'),
+            ('bytes_sent',     'gauge',   'bytes written to the port'),
+            ('bytes_received', 'gauge',   'bytes read from the port'),
+            ('frames',         'gauge',   'frames written to the port'),
+            ('crc_retries',    'gauge',   'frames sent again after a bad reply'),
+            ('device_wait',    'gauge',   'seconds spent waiting on the device'),
+            ('throughput',     'gauge',   'payload bytes per second')
+        ]
+
+        lines = []
+        for (name, metric_type, help_text) in metrics:
+            lines.append ("# HELP {0}_phase_{1} {2}".format (prefix, name, help_text))
+            lines.append ("# TYPE {0}_phase_{1} {2}".format (prefix, name, metric_type))
+
+            for phase in self._merged_phases():
+                labels = 'station="{0}",phase="{1}"'.format (self.station, phase['phase'])
+                if (phase['sector'] is not None):
+                    labels = labels + ',sector="{0}"'.format (phase['sector'])
+
+                lines.append ("{0}_phase_{1}{{{2}}} {3}".format (prefix, name, labels, phase[name]))
+
+        lines.append ("# HELP {0}_run_seconds time of the last run".format (prefix))
+        lines.append ("# TYPE {0}_run_seconds gauge".format (prefix))
+        lines.append ('{0}_run_seconds{{station="{1}"}} {2}'.format (prefix, self.station, record['seconds']))
+
+        lines.append ("# HELP {0}_run_timestamp_seconds start of the last run".format (prefix))
+        lines.append ("# TYPE {0}_run_timestamp_seconds gauge".format (prefix))
+        lines.append ('{0}_run_timestamp_seconds{{station="{1}"}} {2}'.format (prefix, self.station, self.start_time))
+
+        try:
+            with open (file_name + ".tmp", 'w') as f:
+                f.write ("\n".join (lines) + "\n")
+            os.replace (file_name + ".tmp", file_name)
+        except (IOError, OSError):
+            print ("Fail to write: ", file_name)
@@ -0,0 +1,236 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, json, time
+
+#############################################################################
+# Progress_Bus : progress of the phase being run, rate limited
+#
+# Remarks:
+#    The flash code calls begin() / update() / end() as often as it likes;
+#  the bus hands at most RATE events per second to its renderer, plus the
+#  first and the last one of a phase. An event is a dict of
+#       phase   : name of the phase, such as "erase" or "buffer_fill"
+#       done    : bytes done so far
+#       total   : bytes of the phase, 0 if not known (erase)
+#       rate    : bytes per second since begin()
+#       elapsed : seconds since begin()
+#    A renderer has show (event) and end (event). Terminal_Progress,
+#  Json_Progress and Null_Progress are here, the GUI has its own.
+#    cancel() may be called from another thread; the next begin() or
+#  update() of the run raises Progress_Cancelled.
+#############################################################################
+
+class Progress_Cancelled (Exception):
+    pass
+
+class Progress_Bus:
+
+    RATE = 10
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    renderer : where the events go, Terminal_Progress if None
+    #    rate     : events per second at most
+    #========================================================================
+    def __init__ (self, renderer=None, rate=RATE):
+        if (renderer is None):
+            renderer = Terminal_Progress()
+
+        self.renderer = renderer
+        self._interval = 1.0 / rate
+
+        self._phase = None
+        self._total = 0
+        self._done = 0
+        self._start_time = 0
+        self._last_show = 0
+
+        self.cancelled = False
+
+    #========================================================================
+    #  _event
+    #========================================================================
+    def _event (self, now):
+        elapsed = now - self._start_time
+
+        if (elapsed > 0):
+            rate = self._done / elapsed
+        else:
+            rate = 0
+
+        return {
+            'phase'   : self._phase,
+            'done'    : self._done,
+            'total'   : self._total,
+            'rate'    : rate,
+            'elapsed' : elapsed
+        }
+
+    #========================================================================
+    #  cancel / rearm
+    #------------------------------------------------------------------------
+    # Remarks: rearm() before starting the next run
+    #========================================================================
+    def cancel (self):
+        self.cancelled = True
+
+    def rearm (self):
+        self.cancelled = False
+
+    #========================================================================
+    #  _check_cancel
+    #========================================================================
+    def _check_cancel (self):
+        if (self.cancelled):
+            phase = self._phase
+            self._phase = None
+            raise Progress_Cancelled (phase)
+
+    #========================================================================
+    #  begin
+    #------------------------------------------------------------------------
+    # Remarks: a phase still open is ended first
+    #========================================================================
+    def begin (self, phase, total=0):
+        self._check_cancel()
+
+        if (self._phase is not None):
+            self.end()
+
+        self._phase = phase
+        self._total = total
+        self._done = 0
+        self._start_time = time.perf_counter()
+        self._last_show = self._start_time
+
+        self.renderer.show (self._event (self._start_time))
+
+    #========================================================================
+    #  update
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    done : bytes done so far, None to just mark the phase alive
+    #========================================================================
+    def update (self, done=None):
+        self._check_cancel()
+
+        if (self._phase is None):
+            return
+
+        if (done is not None):
+            self._done = done
+
+        now = time.perf_counter()
+        if ((now - self._last_show) >= self._interval):
+            self._last_show = now
+            self.renderer.show (self._event (now))
+
+    #========================================================================
+    #  advance
+    #========================================================================
+    def advance (self, count):
+        self.update (self._done + count)
+
+    #========================================================================
+    #  end
+    #========================================================================
+    def end (self):
+        if (self._phase is None):
+            return
+
+        event = self._event (time.perf_counter())
+        self._phase = None
+
+        self.renderer.end (event)
+
+
+#############################################################################
+# Terminal_Progress : one line per phase, redrawn in place with '\r'
+#############################################################################
+
+class Terminal_Progress:
+
+    _SPIN = "|/-\\"
+
+    def __init__ (self, stream=None):
+        self._stream = stream
+        self._count = 0
+
+    def _line (self, event):
+        if (event['total']):
+            percent = min ([100, event['done'] * 100 // event['total']])
+            return "{0:<12} {1:3d}%  {2:>7d} / {3:<7d} bytes  {4:7.1f} KB/s".format (event['phase'], \
+                percent, event['done'], event['total'], event['rate'] / 1024)
+        else:
+            self._count = self._count + 1
+            return "{0:<12} {1}  {2:0.1f}s".format (event['phase'], \
+                Terminal_Progress._SPIN [self._count % 4], event['elapsed'])
+
+    def _write (self, text):
+        # sys.stdout looked up late, callers redirect it
+        stream = self._stream
+        if (stream is None):
+            stream = sys.stdout
+
+        stream.write (text)
+        stream.flush()
+
+    def show (self, event):
+        self._write ("\r" + self._line (event))
+
+    def end (self, event):
+        self._write ("\r" + self._line (event) + "\n")
+
+
+#############################################################################
+# Json_Progress : one JSON line per event, for logs and other tools
+#############################################################################
+
+class Json_Progress:
+
+    def __init__ (self, file_name):
+        self._file = open (file_name, 'a')
+
+    def show (self, event):
+        self._file.write (json.dumps (event) + "\n")
+
+    def end (self, event):
+        event = dict (event)
+        event['end'] = True
+
+        self._file.write (json.dumps (event) + "\n")
+        self._file.flush()
+
+    def close (self):
+        self._file.close()
+
+
+#############################################################################
+# Null_Progress : no output, for benchmarks and scripted runs
+#############################################################################
+
+class Null_Progress:
+
+    def show (self, event):
+        pass
+
+    def end (self, event):
+        pass
@@ -0,0 +1,277 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, os, threading
+
+try:
+    import selectors, tty, termios, pty
+except ImportError:
+    # Windows, the thread bridge is used
+    pty = None
+
+#############################################################################
+# Raw_UART_Bridge : terminal <-> target UART, for the UART raw mode
+#
+# Remarks:
+#    run() moves bytes between stdin, the serial port and, if asked for, a
+#  local pty until ctrl-d is typed. On POSIX it sleeps in selectors until
+#  one of them has data, and moves whatever is there in one read, so it
+#  costs no CPU while the line is idle and keeps up with the baud rate.
+#    The pty (open_pty) is there for the whole console session: minicom
+#  or a test harness can stay attached to it while the console is back in
+#  debug mode, and gets the UART again on the next switch to raw mode.
+#  The far side of the pty is kept open here, so a tool that detaches does
+#  not end the bridge. Bytes the pty can not take yet wait in a buffer of
+#  PTY_BUFFER_SIZE, and are sent as the tool reads; with nothing attached
+#  the oldest are dropped once it is full.
+#    Windows has no select() on the console or serial handles; there a
+#  thread does blocking reads of the port while the keyboard is read on
+#  the calling thread.
+#############################################################################
+
+class Raw_UART_Bridge:
+
+    CTRL_D = 4
+
+    READ_SIZE = 4096
+
+    PTY_BUFFER_SIZE = 1 << 20
+
+    # seconds, only how soon the Windows port thread sees the end of run()
+    _THREAD_READ_TIME_OUT = 0.1
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    serial_link : port of the target, Low_Latency_Serial
+    #    echo        : print what is typed, the target may not echo it
+    #========================================================================
+    def __init__ (self, serial_link, echo=1):
+        self._serial = serial_link
+        self._echo = echo
+
+        self._pty_master = None
+        self._pty_slave = None
+        self._pty_link = None
+        self._pty_pending = bytearray()
+        self.pty_name = None
+
+    #========================================================================
+    #  open_pty
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    link : path of a symlink to the pty, such as /tmp/m10_uart, or None
+    # Return: name of the pty, None where there are no ptys
+    #========================================================================
+    def open_pty (self, link=None):
+        if (pty is None):
+            print ("No pty on this platform")
+            return None
+
+        (self._pty_master, self._pty_slave) = pty.openpty()
+        tty.setraw (self._pty_slave)
+        os.set_blocking (self._pty_master, False)
+        self.pty_name = os.ttyname (self._pty_slave)
+
+        if (link):
+            try:
+                if (os.path.islink (link)):
+                    os.remove (link)
+                os.symlink (self.pty_name, link)
+                self._pty_link = link
+            except OSError:
+                print ("Fail to open: ", link)
+
+        return self.pty_name
+
+    #========================================================================
+    #  close
+    #========================================================================
+    def close (self):
+        for fd in (self._pty_master, self._pty_slave):
+            if (fd is not None):
+                os.close (fd)
+
+        if (self._pty_link):
+            try:
+                os.remove (self._pty_link)
+            except OSError:
+                pass
+
+        self._pty_master = None
+        self._pty_slave = None
+        self._pty_link = None
+        self.pty_name = None
+
+    #========================================================================
+    #  _to_terminal
+    #========================================================================
+    def _to_terminal (self, data):
+        sys.stdout.buffer.write (data)
+        sys.stdout.flush()
+
+    #========================================================================
+    #  _to_pty
+    #------------------------------------------------------------------------
+    # Remarks: what does not fit stays in _pty_pending, the oldest bytes
+    #          dropped beyond PTY_BUFFER_SIZE
+    #========================================================================
+    def _to_pty (self, data):
+        if (self._pty_master is None):
+            return
+
+        self._pty_pending += data
+        if (len (self._pty_pending) > Raw_UART_Bridge.PTY_BUFFER_SIZE):
+            del self._pty_pending [: len (self._pty_pending) - Raw_UART_Bridge.PTY_BUFFER_SIZE]
+
+        self._flush_pty()
+
+    #========================================================================
+    #  _flush_pty
+    #========================================================================
+    def _flush_pty (self):
+        try:
+            count = os.write (self._pty_master, self._pty_pending)
+            del self._pty_pending [: count]
+        except (BlockingIOError, OSError):
+            pass
+
+    #========================================================================
+    #  _from_serial
+    #========================================================================
+    def _from_serial (self):
+        data = self._serial.read (max ([self._serial.in_waiting, 1]))
+
+        if (len (data)):
+            self._to_terminal (data)
+            self._to_pty (data)
+
+    #========================================================================
+    #  _from_keyboard
+    #------------------------------------------------------------------------
+    # Return: False at ctrl-d, what came before it is still sent
+    #========================================================================
+    def _from_keyboard (self, data):
+        stop = Raw_UART_Bridge.CTRL_D in data
+        if (stop):
+            data = data [: data.index (Raw_UART_Bridge.CTRL_D)]
+
+        if (len (data)):
+            if (self._echo):
+                self._to_terminal (data)
+            self._serial.write (data)
+
+        return not stop
+
+    #========================================================================
+    #  run
+    #------------------------------------------------------------------------
+    # Remarks: returns at ctrl-d (or the end of stdin)
+    #========================================================================
+    def run (self):
+        if (pty is None):
+            self._run_threads()
+        else:
+            self._run_selectors()
+
+    #========================================================================
+    #  _run_selectors
+    #========================================================================
+    def _run_selectors (self):
+        stdin_fd = sys.stdin.fileno()
+        sys.stdout.flush()
+
+        selector = selectors.DefaultSelector()
+        selector.register (self._serial.fileno(), selectors.EVENT_READ, 'serial')
+        selector.register (stdin_fd, selectors.EVENT_READ, 'stdin')
+        if (self._pty_master is not None):
+            selector.register (self._pty_master, selectors.EVENT_READ, 'pty')
+
+        old_settings = None
+        if (os.isatty (stdin_fd)):
+            # keys as they are typed, ctrl-d included. Output keeps its
+            # post processing (OPOST / ONLCR), so a bare \n from the board
+            # or from the prints below still starts a new line
+            old_settings = termios.tcgetattr (stdin_fd)
+            tty.setraw (stdin_fd)
+            settings = termios.tcgetattr (stdin_fd)
+            settings [1] = old_settings [1]
+            termios.tcsetattr (stdin_fd, termios.TCSANOW, settings)
+
+        try:
+            running = True
+            while running:
+                for (key, mask) in selector.select():
+                    if (key.data == 'serial'):
+                        self._from_serial()
+                    elif (key.data == 'stdin'):
+                        data = os.read (stdin_fd, Raw_UART_Bridge.READ_SIZE)
+                        if (len (data) == 0):
+                            running = False
+                        else:
+                            running = self._from_keyboard (data)
+                    else:
+                        if (mask & selectors.EVENT_WRITE):
+                            self._flush_pty()
+
+                        if (mask & selectors.EVENT_READ):
+                            try:
+                                data = os.read (self._pty_master, Raw_UART_Bridge.READ_SIZE)
+                            except (BlockingIOError, OSError):
+                                data = b''
+                            if (len (data)):
+                                self._serial.write (data)
+
+                if (self._pty_master is not None):
+                    # woken up when the pty takes more, only while bytes wait
+                    if (len (self._pty_pending)):
+                        events = selectors.EVENT_READ | selectors.EVENT_WRITE
+                    else:
+                        events = selectors.EVENT_READ
+                    if (selector.get_key (self._pty_master).events != events):
+                        selector.modify (self._pty_master, events, 'pty')
+        finally:
+            selector.close()
+            if (old_settings is not None):
+                termios.tcsetattr (stdin_fd, termios.TCSADRAIN, old_settings)
+
+    #========================================================================
+    #  _run_threads
+    #========================================================================
+    def _run_threads (self):
+        import msvcrt
+
+        stop = threading.Event()
+        timeout_save = self._serial.timeout
+        self._serial.timeout = Raw_UART_Bridge._THREAD_READ_TIME_OUT
+
+        def serial_thread ():
+            while (not stop.is_set()):
+                self._from_serial()
+
+        reader = threading.Thread (target=serial_thread, daemon=True)
+        reader.start()
+
+        try:
+            while (self._from_keyboard (msvcrt.getch())):
+                pass
+        finally:
+            stop.set()
+            reader.join()
+            self._serial.timeout = timeout_save
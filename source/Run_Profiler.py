@@ -0,0 +1,261 @@
+#! python3
+###############################################################################
+# Copyright (c) 2016, PulseRain Technology LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+###############################################################################
+
+import sys, os, time, threading
+from collections import Counter
+
+#############################################################################
+# Run_Profiler : where the time of a load / dump run goes
+#
+# Remarks:
+#    A sampling profiler: a thread takes the stack of the profiled thread
+#  every SAMPLE_INTERVAL and counts it. cProfile is not used, its cost on
+#  every call would inflate the host side against the wire side, which is
+#  the split this is meant to show.
+#    Stacks are written in the collapsed format of flamegraph.pl /
+#  speedscope ("outer;...;inner count" per line). Samples taken inside
+#  the read / write of the serial port count as wire time, the others as
+#  host time. The exact time blocked in serial.read comes from the
+#  device_wait counter of Low_Latency_Serial when a link is attached.
+#############################################################################
+
+class Run_Profiler:
+
+    SAMPLE_INTERVAL = 0.001
+
+    TOP_FUNCTIONS = 8
+
+    # (function, file) of the frames that wait on the port
+    _WIRE_FRAMES = (
+        ("read", "serialposix.py"),
+        ("read", "serialwin32.py"),
+        ("write", "serialposix.py"),
+        ("write", "serialwin32.py"),
+        ("flush", "serialposix.py"),
+        ("flush", "serialwin32.py")
+    )
+
+    #========================================================================
+    #  __init__
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    link     : Low_Latency_Serial to take the read wait time from, can
+    #               be given later through attach()
+    #    interval : seconds between samples
+    #========================================================================
+    def __init__ (self, link=None, interval=SAMPLE_INTERVAL):
+        self.link = link
+        self.interval = interval
+
+        self.stacks = Counter()
+        self.start_time = None
+        self.end_time = None
+
+        self._counters_start = None
+        self._counters_end = None
+        self._thread_id = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    #========================================================================
+    #  attach
+    #------------------------------------------------------------------------
+    # Remarks: a link attached after start() is counted from here on
+    #========================================================================
+    def attach (self, link):
+        self.link = link
+
+        if (self._thread is not None):
+            self._counters_start = self._counters()
+
+    #========================================================================
+    #  _counters
+    #========================================================================
+    def _counters (self):
+        if ((self.link is None) or (not hasattr (self.link, 'counters'))):
+            return None
+
+        return self.link.counters()
+
+    #========================================================================
+    #  start / stop
+    #------------------------------------------------------------------------
+    # Remarks: the thread calling start() is the one profiled
+    #========================================================================
+    def start (self):
+        self.stacks.clear()
+        self._counters_start = self._counters()
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+        self._thread = threading.Thread (target=self._sample_loop, daemon=True)
+        self._thread.start()
+
+    def stop (self):
+        if (self._thread is None):
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+        self.end_time = time.perf_counter()
+        self._counters_end = self._counters()
+
+    #========================================================================
+    #  _sample_loop
+    #========================================================================
+    def _sample_loop (self):
+        while (not self._stop.wait (self.interval)):
+            frame = sys._current_frames().get (self._thread_id)
+
+            stack = []
+            while (frame is not None):
+                code = frame.f_code
+                stack.append ("{0} ({1}:{2})".format (code.co_name, os.path.basename (code.co_filename), code.co_firstlineno))
+                frame = frame.f_back
+
+            if (len (stack)):
+                stack.reverse()
+                self.stacks [";".join (stack)] += 1
+
+    #========================================================================
+    #  _is_wire
+    #========================================================================
+    def _is_wire (self, stack):
+        for (function, file_name) in Run_Profiler._WIRE_FRAMES:
+            if ((function + " (" + file_name + ":") in stack):
+                return True
+
+        return False
+
+    #========================================================================
+    #  summary
+    #------------------------------------------------------------------------
+    # Return:
+    #    dict of wall time, time blocked in serial.read (None without a
+    #    link), host time, sample counts and the functions with the most
+    #    host samples of their own
+    #========================================================================
+    def summary (self):
+        end_time = self.end_time
+        if (end_time is None):
+            end_time = time.perf_counter()
+
+        wall_time = end_time - self.start_time
+
+        total_samples = sum (self.stacks.values())
+        wire_samples = 0
+        host_functions = Counter()
+
+        for (stack, count) in self.stacks.items():
+            if (self._is_wire (stack)):
+                wire_samples = wire_samples + count
+            else:
+                host_functions [stack.split (";")[-1]] += count
+
+        read_wait = None
+        bytes_sent = None
+        bytes_received = None
+
+        counters_end = self._counters_end
+        if (counters_end is None):
+            counters_end = self._counters()
+
+        if ((self._counters_start is not None) and (counters_end is not None)):
+            read_wait = counters_end['device_wait'] - self._counters_start['device_wait']
+            bytes_sent = counters_end['bytes_sent'] - self._counters_start['bytes_sent']
+            bytes_received = counters_end['bytes_received'] - self._counters_start['bytes_received']
+
+        if (read_wait is not None):
+            host_time = wall_time - read_wait
+        elif (total_samples):
+            host_time = wall_time * (total_samples - wire_samples) / total_samples
+        else:
+            host_time = wall_time
+
+        return {
+            'wall_time'      : wall_time,
+            'read_wait'      : read_wait,
+            'host_time'      : host_time,
+            'bytes_sent'     : bytes_sent,
+            'bytes_received' : bytes_received,
+            'samples'        : total_samples,
+            'wire_samples'   : wire_samples,
+            'top_host'       : host_functions.most_common (Run_Profiler.TOP_FUNCTIONS)
+        }
+
+    #========================================================================
+    #  print_summary
+    #------------------------------------------------------------------------
+    # Parameters:
+    #    print_func : where the lines go, such as the console_print of the GUI
+    #========================================================================
+    def print_summary (self, print_func=print):
+        summary = self.summary()
+        wall_time = summary['wall_time']
+
+        print_func ("Profile         : {0:0.2f}s wall, {1} samples".format (wall_time, summary['samples']))
+
+        if (summary['read_wait'] is not None):
+            print_func ("  serial.read   : {0:0.2f}s ({1:0.0f}%)".format (summary['read_wait'], 100 * summary['read_wait'] / max ([wall_time, 1e-9])))
+            print_func ("  bytes         : {0} sent, {1} received".format (summary['bytes_sent'], summary['bytes_received']))
+
+        if (summary['samples']):
+            print_func ("  wire samples  : {0:0.0f}%".format (100 * summary['wire_samples'] / summary['samples']))
+
+        print_func ("  host          : {0:0.2f}s ({1:0.0f}%)".format (summary['host_time'], 100 * summary['host_time'] / max ([wall_time, 1e-9])))
+
+        for (function, count) in summary['top_host']:
+            print_func ("    {0:5d}  {1}".format (count, function))
+
+    #========================================================================
+    #  write_collapsed
+    #------------------------------------------------------------------------
+    # Return: number of stacks written, or -1 if the file can not be opened
+    #========================================================================
+    def write_collapsed (self, file_name):
+        try:
+            with open (file_name, 'w') as f:
+                for (stack, count) in sorted (self.stacks.items()):
+                    f.write (stack + " " + str (count) + "\n")
+        except IOError:
+            print ("Fail to open: ", file_name)
+            return -1
+
+        return len (self.stacks)
+
+    #========================================================================
+    #  finish
+    #------------------------------------------------------------------------
+    # Remarks: stop, save the stacks and print the summary. Meant for
+    #          atexit, so sys.exit() on failures still leaves a profile
+    #========================================================================
+    def finish (self, file_name, print_func=print):
+        if (self.start_time is None):
+            return
+
+        self.stop()
+
+        if (self.write_collapsed (file_name) >= 0):
+            print_func ("Collapsed stacks saved to " + file_name)
+
+        self.print_summary (print_func)